@@ -16,6 +16,8 @@
 
 """Functionality for doing annotations in the 'optimal' way"""
 
+from collections import deque
+
 from .lazy_import import lazy_import
 lazy_import(globals(), """
 
@@ -23,22 +25,75 @@ import patiencediff
 
 from breezy import (
     annotate, # Must be lazy to avoid circular importing
+    config,
     graph as _mod_graph,
     )
 """)
 from . import (
     errors,
     osutils,
+    trace,
     ui,
     )
 
 
+def _get_matching_blocks(text_pairs):
+    """Return the blocks of lines matching between texts and their parents.
+
+    This is run in the worker processes of Annotator._diff_ahead. The texts
+    are passed as bytes, which are much cheaper to send to another process
+    than lists of lines.
+
+    :param text_pairs: A list of (parent_text, text) tuples.
+    :return: A list with the matching blocks of each pair.
+    """
+    result = []
+    for parent_text, text in text_pairs:
+        matcher = patiencediff.PatienceSequenceMatcher(
+            None, osutils.split_lines(parent_text),
+            osutils.split_lines(text))
+        result.append(matcher.get_matching_blocks())
+    return result
+
+
 class Annotator(object):
     """Class that drives performing annotations."""
 
-    def __init__(self, vf):
-        """Create a new Annotator from a VersionedFile."""
+    # Texts with fewer lines (together with their parent) are diffed in this
+    # process even if there are worker processes, as sending them to a
+    # worker costs more than the diff.
+    _min_lines_to_diff_ahead = 500
+    # How many pairs of texts are sent to a worker process at once
+    _diff_ahead_batch_size = 16
+    # How many texts are read ahead of the annotation for each worker process
+    _texts_read_ahead_per_process = 32
+
+    def __init__(self, vf, cache=None):
+        """Create a new Annotator from a VersionedFile.
+
+        :param cache: An optional AnnotationCache. Annotations found in it
+            are used instead of annotating the ancestry of their text, and
+            the annotations of the texts asked for are added to it.
+        """
         self._vf = vf
+        self._cache = cache
+        # Keys whose annotations were read from the cache, whose parents are
+        # not in self._parent_map yet
+        self._unwalked_keys = set()
+        # Annotations read from the cache, waiting for their text
+        self._cached_annotations = {}
+        self._keys_to_cache = set()
+        # Whether a parent of a text was missing from the vf. Annotations
+        # computed with ghosts in the ancestry are not cached, as they would
+        # be wrong once the ghosts are filled in.
+        self._found_ghosts = False
+        self._special_keys = set()
+        # The number of processes diffing texts against their parents, None
+        # to read it from the configuration
+        self._diff_processes = None
+        # Map from (key, parent_key) => (future, index) of the matching
+        # blocks being computed by a worker process
+        self._pending_matches = {}
         self._parent_map = {}
         self._text_cache = {}
         # Map from key => number of nexts that will be built from this key
@@ -88,11 +143,25 @@ class Annotator(object):
                     parent_lookup.append(key)
                     vf_keys_needed.add(key)
             needed_keys = set()
-            next_parent_map.update(self._vf.get_parent_map(parent_lookup))
+            found_parent_map = self._vf.get_parent_map(parent_lookup)
+            if len(found_parent_map) < len(parent_lookup):
+                self._found_ghosts = True
+            next_parent_map.update(found_parent_map)
+            if self._cache is not None and parent_lookup:
+                cached = self._cache.get_annotations(
+                    [key for key in parent_lookup if key in next_parent_map])
+                self._cached_annotations.update(cached)
+            else:
+                cached = ()
             for key, parent_keys in next_parent_map.items():
                 if parent_keys is None:  # No graph versionedfile
                     parent_keys = ()
                     next_parent_map[key] = ()
+                if key in cached:
+                    # The text is still needed to annotate its children, but
+                    # not its ancestry
+                    self._unwalked_keys.add(key)
+                    continue
                 self._update_needed_children(key, parent_keys)
                 needed_keys.update([key for key in parent_keys
                                     if key not in parent_map])
@@ -124,6 +193,10 @@ class Annotator(object):
             lines = record.get_bytes_as('lines')
             num_lines = len(lines)
             self._text_cache[this_key] = lines
+            annotations = self._cached_annotations.pop(this_key, None)
+            if annotations is not None:
+                self._annotations_cache[this_key] = annotations
+                continue
             yield this_key, lines, num_lines
         for key in ann_keys:
             lines = self._text_cache[key]
@@ -143,6 +216,10 @@ class Annotator(object):
         """
         parent_lines = self._text_cache[parent_key]
         parent_annotations = self._annotations_cache[parent_key]
+        pending = self._pending_matches.pop((key, parent_key), None)
+        if pending is not None:
+            future, index = pending
+            return parent_annotations, future.result()[index]
         # PatienceSequenceMatcher should probably be part of Policy
         matcher = patiencediff.PatienceSequenceMatcher(
             None, parent_lines, text)
@@ -231,6 +308,8 @@ class Annotator(object):
             for parent in parent_keys[1:]:
                 self._update_from_other_parents(key, annotations, text,
                                                 this_annotation, parent)
+        if key in self._keys_to_cache and not self._found_ghosts:
+            self._cache.add_annotations(key, annotations)
         self._record_annotation(key, parent_keys, annotations)
 
     def add_special_text(self, key, parent_keys, text):
@@ -246,6 +325,7 @@ class Annotator(object):
         """
         self._parent_map[key] = parent_keys
         self._text_cache[key] = osutils.split_lines(text)
+        self._special_keys.add(key)
         self._heads_provider = None
 
     def annotate(self, key):
@@ -257,9 +337,20 @@ class Annotator(object):
                         each key is a possible source for the given line.
             lines the text of "key" as a list of lines
         """
+        if self._cache is not None:
+            if key in self._special_keys:
+                # Cache the parents instead, so that the next annotation of
+                # the same special text does not need to annotate them.
+                self._keys_to_cache = set(
+                    self._parent_map[key]).difference(self._special_keys)
+            else:
+                self._keys_to_cache = {key}
         with ui.ui_factory.nested_progress_bar() as pb:
-            for text_key, text, num_lines in self._get_needed_texts(
-                    key, pb=pb):
+            texts = self._get_needed_texts(key, pb=pb)
+            num_processes = self._get_diff_processes()
+            if num_processes > 0:
+                texts = self._diff_ahead(texts, num_processes)
+            for text_key, text, num_lines in texts:
                 self._annotate_one(text_key, text, num_lines)
         try:
             annotations = self._annotations_cache[key]
@@ -267,11 +358,107 @@ class Annotator(object):
             raise errors.RevisionNotPresent(key, self._vf)
         return annotations, self._text_cache[key]
 
+    def _get_diff_processes(self):
+        if self._diff_processes is None:
+            self._diff_processes = config.GlobalStack().get(
+                'annotate.diff_processes')
+        return self._diff_processes
+
+    def _diff_ahead(self, texts, num_processes):
+        """Diff texts against their parents in worker processes.
+
+        The diffs of the texts needed are independent, so they are sent to
+        the workers in batches as the texts are read, ahead of the annotation
+        pass that takes their matching blocks. Only a few texts per worker
+        are read ahead of the annotation rather than all of them, so that
+        they do not all need to be held in memory.
+
+        :param texts: An iterator over (key, text, num_lines) in topological
+            order, as returned by _get_needed_texts.
+        :return: An iterator over the same tuples.
+        """
+        import concurrent.futures
+        try:
+            executor = concurrent.futures.ProcessPoolExecutor(num_processes)
+        except (OSError, NotImplementedError) as e:
+            trace.mutter('not diffing texts in worker processes: %s', e)
+            for text in texts:
+                yield text
+            return
+        batch_size = self._diff_ahead_batch_size
+        max_read_ahead = num_processes * self._texts_read_ahead_per_process
+        read_ahead = deque()
+        batch_keys = []
+        batch = []
+
+        def submit_batch():
+            nonlocal batch_keys, batch
+            future = executor.submit(_get_matching_blocks, batch)
+            for index, pair_key in enumerate(batch_keys):
+                self._pending_matches[pair_key] = (future, index)
+            batch_keys = []
+            batch = []
+        try:
+            for text_key, text, num_lines in texts:
+                joined_text = None
+                for parent_key in self._parent_map[text_key]:
+                    parent_lines = self._text_cache[parent_key]
+                    if (len(parent_lines) + num_lines
+                            < self._min_lines_to_diff_ahead):
+                        continue
+                    if joined_text is None:
+                        joined_text = b''.join(text)
+                    batch_keys.append((text_key, parent_key))
+                    batch.append((b''.join(parent_lines), joined_text))
+                if len(batch) >= batch_size:
+                    submit_batch()
+                read_ahead.append((text_key, text, num_lines))
+                if len(read_ahead) > max_read_ahead:
+                    if batch_keys and batch_keys[0][0] == read_ahead[0][0]:
+                        # The text is about to be annotated
+                        submit_batch()
+                    yield read_ahead.popleft()
+            if batch:
+                submit_batch()
+            while read_ahead:
+                yield read_ahead.popleft()
+        finally:
+            for future, index in self._pending_matches.values():
+                future.cancel()
+            self._pending_matches.clear()
+            executor.shutdown(wait=True)
+
     def _get_heads_provider(self):
         if self._heads_provider is None:
-            self._heads_provider = _mod_graph.KnownGraph(self._parent_map)
+            parent_map = self._parent_map
+            if self._unwalked_keys:
+                parent_map = dict(parent_map)
+                parent_map.update(self._get_unwalked_ancestry(parent_map))
+            self._heads_provider = _mod_graph.KnownGraph(parent_map)
         return self._heads_provider
 
+    def _get_unwalked_ancestry(self, parent_map):
+        """Get the ancestry of the keys whose annotations were cached.
+
+        It is not needed to annotate texts, but annotations can refer to any
+        text in the ancestry and the heads of those need the whole graph.
+        """
+        ancestry = {}
+        pending = set()
+        for key in self._unwalked_keys:
+            pending.update(parent_map[key])
+        while pending:
+            pending.difference_update(parent_map)
+            pending.difference_update(ancestry)
+            next_parent_map = self._vf.get_parent_map(pending)
+            pending = set()
+            for key, parent_keys in next_parent_map.items():
+                if parent_keys is None:
+                    parent_keys = ()
+                ancestry[key] = parent_keys
+                pending.update(parent_keys)
+        return ancestry
+
     def _resolve_annotation_tie(self, the_heads, line, tiebreaker):
         if tiebreaker is None:
             head = sorted(the_heads)[0]
@@ -295,12 +482,16 @@ class Annotator(object):
         custom_tiebreaker = annotate._break_annotation_tie
         annotations, lines = self.annotate(key)
         out = []
-        heads = self._get_heads_provider().heads
+        heads = None
         append = out.append
         for annotation, line in zip(annotations, lines):
             if len(annotation) == 1:
                 head = annotation[0]
             else:
+                if heads is None:
+                    # Only build the graph if needed, it may need to be read
+                    # beyond the cached annotations
+                    heads = self._get_heads_provider().heads
                 the_heads = heads(annotation)
                 if len(the_heads) == 1:
                     for head in the_heads:
@@ -489,14 +489,8 @@ class Branch(controldir.ControlComponent):
             # Note: depth and revno values are in the context of the branch so
             # we need the full graph to get stable numbers, regardless of the
             # start_revision_id.
-            if self._merge_sorted_revisions_cache is None:
-                last_revision = self.last_revision()
-                known_graph = self.repository.get_known_graph_ancestry(
-                    [last_revision])
-                self._merge_sorted_revisions_cache = known_graph.merge_sort(
-                    last_revision)
             filtered = self._filter_merge_sorted_revisions(
-                self._merge_sorted_revisions_cache, start_revision_id,
+                self._iter_merge_sort_ancestry(), start_revision_id,
                 stop_revision_id, stop_rule)
             # Make sure we don't return revisions that are not part of the
             # start_revision_id ancestry.
@@ -508,6 +502,35 @@ class Branch(controldir.ControlComponent):
             else:
                 raise ValueError('invalid direction %r' % direction)
 
+    def _iter_merge_sort_ancestry(self):
+        """Iterate over the merge sorted ancestry of the branch tip.
+
+        By default the result of _merge_sort_ancestry is cached in memory.
+        Subclasses that can produce the nodes incrementally may override
+        this, so that callers that stop early don't pay for the whole
+        history.
+
+        :return: An iterator over nodes as returned by _merge_sort_ancestry.
+        """
+        if self._merge_sorted_revisions_cache is None:
+            self._merge_sorted_revisions_cache = self._merge_sort_ancestry()
+        return iter(self._merge_sorted_revisions_cache)
+
+    def _merge_sort_ancestry(self):
+        """Merge sort the ancestry of the branch tip.
+
+        This is the worker function for iter_merge_sorted_revisions, which
+        caches the return value. Subclasses may override this to use a more
+        efficient implementation.
+
+        :return: A list of nodes with key, merge_depth, revno and
+            end_of_merge attributes, tip first.
+        """
+        last_revision = self.last_revision()
+        known_graph = self.repository.get_known_graph_ancestry(
+            [last_revision])
+        return known_graph.merge_sort(last_revision)
+
     def _filter_merge_sorted_revisions(self, merge_sorted_revisions,
                                        start_revision_id, stop_revision_id,
                                        stop_rule):
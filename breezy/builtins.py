@@ -3408,7 +3408,8 @@ class cmd_export(Command):
         if filters:
             from breezy.filter_tree import ContentFilterTree
             export_tree = ContentFilterTree(
-                export_tree, export_tree._content_filter_stack)
+                export_tree, export_tree._content_filter_stack,
+                export_tree._iter_content_filter_stacks)
 
         try:
             export(export_tree, dest, format, root, subdir,
@@ -3485,7 +3486,8 @@ class cmd_cat(Command):
         if filtered:
             from .filter_tree import ContentFilterTree
             filter_tree = ContentFilterTree(
-                rev_tree, rev_tree._content_filter_stack)
+                rev_tree, rev_tree._content_filter_stack,
+                rev_tree._iter_content_filter_stacks)
             fileobj = filter_tree.get_file(rev_tree_path)
         else:
             fileobj = rev_tree.get_file(rev_tree_path)
@@ -352,6 +352,17 @@ register_metadir(
     experimental=True,
     hidden=True,
     )
+register_metadir(
+    controldir.format_registry, 'development-raw-index',
+    'breezy.bzr.groupcompress_repo.RepositoryFormat2aRawIndex',
+    help='2a variant with uncompressed index leaves, trading disk space '
+         'for faster index lookups. Repositories in this format can only be '
+         'read by bzr.dev.',
+    branch_format='breezy.bzr.branch.BzrBranchFormat7',
+    tree_format='breezy.bzr.workingtree_4.WorkingTreeFormat6',
+    experimental=True,
+    hidden=True,
+    )
 
 register_metadir(
     controldir.format_registry, 'development-colo',
@@ -0,0 +1,8997 @@
+/* Generated by Cython 0.29.37 */
+
+#ifndef PY_SSIZE_T_CLEAN
+#define PY_SSIZE_T_CLEAN
+#endif /* PY_SSIZE_T_CLEAN */
+#include "Python.h"
+#ifndef Py_PYTHON_H
+    #error Python headers needed to compile C extensions, please install development version of Python.
+#elif PY_VERSION_HEX < 0x02060000 || (0x03000000 <= PY_VERSION_HEX && PY_VERSION_HEX < 0x03030000)
+    #error Cython requires Python 2.6+ or Python 3.3+.
+#else
+#define CYTHON_ABI "0_29_37"
+#define CYTHON_HEX_VERSION 0x001D25F0
+#define CYTHON_FUTURE_DIVISION 1
+#include <stddef.h>
+#ifndef offsetof
+  #define offsetof(type, member) ( (size_t) & ((type*)0) -> member )
+#endif
+#if !defined(WIN32) && !defined(MS_WINDOWS)
+  #ifndef __stdcall
+    #define __stdcall
+  #endif
+  #ifndef __cdecl
+    #define __cdecl
+  #endif
+  #ifndef __fastcall
+    #define __fastcall
+  #endif
+#endif
+#ifndef DL_IMPORT
+  #define DL_IMPORT(t) t
+#endif
+#ifndef DL_EXPORT
+  #define DL_EXPORT(t) t
+#endif
+#define __PYX_COMMA ,
+#ifndef HAVE_LONG_LONG
+  #if PY_VERSION_HEX >= 0x02070000
+    #define HAVE_LONG_LONG
+  #endif
+#endif
+#ifndef PY_LONG_LONG
+  #define PY_LONG_LONG LONG_LONG
+#endif
+#ifndef Py_HUGE_VAL
+  #define Py_HUGE_VAL HUGE_VAL
+#endif
+#ifdef PYPY_VERSION
+  #define CYTHON_COMPILING_IN_PYPY 1
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #undef CYTHON_USE_TYPE_SLOTS
+  #define CYTHON_USE_TYPE_SLOTS 0
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #if PY_VERSION_HEX < 0x03050000
+    #undef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 0
+  #elif !defined(CYTHON_USE_ASYNC_SLOTS)
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_INTERNALS
+  #define CYTHON_USE_UNICODE_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #undef CYTHON_AVOID_BORROWED_REFS
+  #define CYTHON_AVOID_BORROWED_REFS 1
+  #undef CYTHON_ASSUME_SAFE_MACROS
+  #define CYTHON_ASSUME_SAFE_MACROS 0
+  #undef CYTHON_UNPACK_METHODS
+  #define CYTHON_UNPACK_METHODS 0
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #if PY_VERSION_HEX < 0x03090000
+    #undef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #elif !defined(CYTHON_PEP489_MULTI_PHASE_INIT)
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #undef CYTHON_USE_TP_FINALIZE
+  #define CYTHON_USE_TP_FINALIZE (PY_VERSION_HEX >= 0x030400a1 && PYPY_VERSION_NUM >= 0x07030C00)
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+#elif defined(PYSTON_VERSION)
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 1
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #undef CYTHON_USE_ASYNC_SLOTS
+  #define CYTHON_USE_ASYNC_SLOTS 0
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #undef CYTHON_PEP489_MULTI_PHASE_INIT
+  #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #undef CYTHON_USE_TP_FINALIZE
+  #define CYTHON_USE_TP_FINALIZE 0
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+#elif defined(PY_NOGIL)
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 1
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #ifndef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE 1
+  #endif
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+#else
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 1
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #if PY_VERSION_HEX < 0x02070000
+    #undef CYTHON_USE_PYTYPE_LOOKUP
+    #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #elif !defined(CYTHON_USE_PYTYPE_LOOKUP)
+    #define CYTHON_USE_PYTYPE_LOOKUP 1
+  #endif
+  #if PY_MAJOR_VERSION < 3
+    #undef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 0
+  #elif !defined(CYTHON_USE_ASYNC_SLOTS)
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #if PY_VERSION_HEX < 0x02070000
+    #undef CYTHON_USE_PYLONG_INTERNALS
+    #define CYTHON_USE_PYLONG_INTERNALS 0
+  #elif !defined(CYTHON_USE_PYLONG_INTERNALS)
+    #define CYTHON_USE_PYLONG_INTERNALS (PY_VERSION_HEX < 0x030C00A5)
+  #endif
+  #ifndef CYTHON_USE_PYLIST_INTERNALS
+    #define CYTHON_USE_PYLIST_INTERNALS 1
+  #endif
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #if PY_VERSION_HEX < 0x030300F0 || PY_VERSION_HEX >= 0x030B00A2
+    #undef CYTHON_USE_UNICODE_WRITER
+    #define CYTHON_USE_UNICODE_WRITER 0
+  #elif !defined(CYTHON_USE_UNICODE_WRITER)
+    #define CYTHON_USE_UNICODE_WRITER 1
+  #endif
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #if PY_VERSION_HEX >= 0x030B00A4
+    #undef CYTHON_FAST_THREAD_STATE
+    #define CYTHON_FAST_THREAD_STATE 0
+  #elif !defined(CYTHON_FAST_THREAD_STATE)
+    #define CYTHON_FAST_THREAD_STATE 1
+  #endif
+  #ifndef CYTHON_FAST_PYCALL
+    #define CYTHON_FAST_PYCALL (PY_VERSION_HEX < 0x030A0000)
+  #endif
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT (PY_VERSION_HEX >= 0x03050000)
+  #endif
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE (PY_VERSION_HEX >= 0x030400a1)
+  #endif
+  #ifndef CYTHON_USE_DICT_VERSIONS
+    #define CYTHON_USE_DICT_VERSIONS ((PY_VERSION_HEX >= 0x030600B1) && (PY_VERSION_HEX < 0x030C00A5))
+  #endif
+  #if PY_VERSION_HEX >= 0x030B00A4
+    #undef CYTHON_USE_EXC_INFO_STACK
+    #define CYTHON_USE_EXC_INFO_STACK 0
+  #elif !defined(CYTHON_USE_EXC_INFO_STACK)
+    #define CYTHON_USE_EXC_INFO_STACK (PY_VERSION_HEX >= 0x030700A3)
+  #endif
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 1
+  #endif
+#endif
+#if !defined(CYTHON_FAST_PYCCALL)
+#define CYTHON_FAST_PYCCALL  (CYTHON_FAST_PYCALL && PY_VERSION_HEX >= 0x030600B1)
+#endif
+#if CYTHON_USE_PYLONG_INTERNALS
+  #if PY_MAJOR_VERSION < 3
+    #include "longintrepr.h"
+  #endif
+  #undef SHIFT
+  #undef BASE
+  #undef MASK
+  #ifdef SIZEOF_VOID_P
+    enum { __pyx_check_sizeof_voidp = 1 / (int)(SIZEOF_VOID_P == sizeof(void*)) };
+  #endif
+#endif
+#ifndef __has_attribute
+  #define __has_attribute(x) 0
+#endif
+#ifndef __has_cpp_attribute
+  #define __has_cpp_attribute(x) 0
+#endif
+#ifndef CYTHON_RESTRICT
+  #if defined(__GNUC__)
+    #define CYTHON_RESTRICT __restrict__
+  #elif defined(_MSC_VER) && _MSC_VER >= 1400
+    #define CYTHON_RESTRICT __restrict
+  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define CYTHON_RESTRICT restrict
+  #else
+    #define CYTHON_RESTRICT
+  #endif
+#endif
+#ifndef CYTHON_UNUSED
+# if defined(__GNUC__)
+#   if !(defined(__cplusplus)) || (__GNUC__ > 3 || (__GNUC__ == 3 && __GNUC_MINOR__ >= 4))
+#     define CYTHON_UNUSED __attribute__ ((__unused__))
+#   else
+#     define CYTHON_UNUSED
+#   endif
+# elif defined(__ICC) || (defined(__INTEL_COMPILER) && !defined(_MSC_VER))
+#   define CYTHON_UNUSED __attribute__ ((__unused__))
+# else
+#   define CYTHON_UNUSED
+# endif
+#endif
+#ifndef CYTHON_MAYBE_UNUSED_VAR
+#  if defined(__cplusplus)
+     template<class T> void CYTHON_MAYBE_UNUSED_VAR( const T& ) { }
+#  else
+#    define CYTHON_MAYBE_UNUSED_VAR(x) (void)(x)
+#  endif
+#endif
+#ifndef CYTHON_NCP_UNUSED
+# if CYTHON_COMPILING_IN_CPYTHON
+#  define CYTHON_NCP_UNUSED
+# else
+#  define CYTHON_NCP_UNUSED CYTHON_UNUSED
+# endif
+#endif
+#define __Pyx_void_to_None(void_result) ((void)(void_result), Py_INCREF(Py_None), Py_None)
+#ifdef _MSC_VER
+    #ifndef _MSC_STDINT_H_
+        #if _MSC_VER < 1300
+           typedef unsigned char     uint8_t;
+           typedef unsigned int      uint32_t;
+        #else
+           typedef unsigned __int8   uint8_t;
+           typedef unsigned __int32  uint32_t;
+        #endif
+    #endif
+#else
+   #include <stdint.h>
+#endif
+#ifndef CYTHON_FALLTHROUGH
+  #if defined(__cplusplus) && __cplusplus >= 201103L
+    #if __has_cpp_attribute(fallthrough)
+      #define CYTHON_FALLTHROUGH [[fallthrough]]
+    #elif __has_cpp_attribute(clang::fallthrough)
+      #define CYTHON_FALLTHROUGH [[clang::fallthrough]]
+    #elif __has_cpp_attribute(gnu::fallthrough)
+      #define CYTHON_FALLTHROUGH [[gnu::fallthrough]]
+    #endif
+  #endif
+  #ifndef CYTHON_FALLTHROUGH
+    #if __has_attribute(fallthrough)
+      #define CYTHON_FALLTHROUGH __attribute__((fallthrough))
+    #else
+      #define CYTHON_FALLTHROUGH
+    #endif
+  #endif
+  #if defined(__clang__ ) && defined(__apple_build_version__)
+    #if __apple_build_version__ < 7000000
+      #undef  CYTHON_FALLTHROUGH
+      #define CYTHON_FALLTHROUGH
+    #endif
+  #endif
+#endif
+
+#ifndef CYTHON_INLINE
+  #if defined(__clang__)
+    #define CYTHON_INLINE __inline__ __attribute__ ((__unused__))
+  #elif defined(__GNUC__)
+    #define CYTHON_INLINE __inline__
+  #elif defined(_MSC_VER)
+    #define CYTHON_INLINE __inline
+  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define CYTHON_INLINE inline
+  #else
+    #define CYTHON_INLINE
+  #endif
+#endif
+
+#define __PYX_BUILD_PY_SSIZE_T "n"
+#define CYTHON_FORMAT_SSIZE_T "z"
+#if PY_MAJOR_VERSION < 3
+  #define __Pyx_BUILTIN_MODULE_NAME "__builtin__"
+  #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
+          PyCode_New(a+k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+  #define __Pyx_DefaultClassType PyClass_Type
+#else
+  #define __Pyx_BUILTIN_MODULE_NAME "builtins"
+  #define __Pyx_DefaultClassType PyType_Type
+#if PY_VERSION_HEX >= 0x030B00A1
+    static CYTHON_INLINE PyCodeObject* __Pyx_PyCode_New(int a, int k, int l, int s, int f,
+                                                    PyObject *code, PyObject *c, PyObject* n, PyObject *v,
+                                                    PyObject *fv, PyObject *cell, PyObject* fn,
+                                                    PyObject *name, int fline, PyObject *lnos) {
+        PyObject *kwds=NULL, *argcount=NULL, *posonlyargcount=NULL, *kwonlyargcount=NULL;
+        PyObject *nlocals=NULL, *stacksize=NULL, *flags=NULL, *replace=NULL, *call_result=NULL, *empty=NULL;
+        const char *fn_cstr=NULL;
+        const char *name_cstr=NULL;
+        PyCodeObject* co=NULL;
+        PyObject *type, *value, *traceback;
+        PyErr_Fetch(&type, &value, &traceback);
+        if (!(kwds=PyDict_New())) goto end;
+        if (!(argcount=PyLong_FromLong(a))) goto end;
+        if (PyDict_SetItemString(kwds, "co_argcount", argcount) != 0) goto end;
+        if (!(posonlyargcount=PyLong_FromLong(0))) goto end;
+        if (PyDict_SetItemString(kwds, "co_posonlyargcount", posonlyargcount) != 0) goto end;
+        if (!(kwonlyargcount=PyLong_FromLong(k))) goto end;
+        if (PyDict_SetItemString(kwds, "co_kwonlyargcount", kwonlyargcount) != 0) goto end;
+        if (!(nlocals=PyLong_FromLong(l))) goto end;
+        if (PyDict_SetItemString(kwds, "co_nlocals", nlocals) != 0) goto end;
+        if (!(stacksize=PyLong_FromLong(s))) goto end;
+        if (PyDict_SetItemString(kwds, "co_stacksize", stacksize) != 0) goto end;
+        if (!(flags=PyLong_FromLong(f))) goto end;
+        if (PyDict_SetItemString(kwds, "co_flags", flags) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_code", code) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_consts", c) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_names", n) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_varnames", v) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_freevars", fv) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_cellvars", cell) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_linetable", lnos) != 0) goto end;
+        if (!(fn_cstr=PyUnicode_AsUTF8AndSize(fn, NULL))) goto end;
+        if (!(name_cstr=PyUnicode_AsUTF8AndSize(name, NULL))) goto end;
+        if (!(co = PyCode_NewEmpty(fn_cstr, name_cstr, fline))) goto end;
+        if (!(replace = PyObject_GetAttrString((PyObject*)co, "replace"))) goto cleanup_code_too;
+        if (!(empty = PyTuple_New(0))) goto cleanup_code_too; // unfortunately __pyx_empty_tuple isn't available here
+        if (!(call_result = PyObject_Call(replace, empty, kwds))) goto cleanup_code_too;
+        Py_XDECREF((PyObject*)co);
+        co = (PyCodeObject*)call_result;
+        call_result = NULL;
+        if (0) {
+            cleanup_code_too:
+            Py_XDECREF((PyObject*)co);
+            co = NULL;
+        }
+        end:
+        Py_XDECREF(kwds);
+        Py_XDECREF(argcount);
+        Py_XDECREF(posonlyargcount);
+        Py_XDECREF(kwonlyargcount);
+        Py_XDECREF(nlocals);
+        Py_XDECREF(stacksize);
+        Py_XDECREF(replace);
+        Py_XDECREF(call_result);
+        Py_XDECREF(empty);
+        if (type) {
+            PyErr_Restore(type, value, traceback);
+        }
+        return co;
+    }
+#else
+  #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
+          PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+#endif
+  #define __Pyx_DefaultClassType PyType_Type
+#endif
+#if PY_VERSION_HEX >= 0x030900F0 && !CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyObject_GC_IsFinalized(o) PyObject_GC_IsFinalized(o)
+#else
+  #define __Pyx_PyObject_GC_IsFinalized(o) _PyGC_FINALIZED(o)
+#endif
+#ifndef Py_TPFLAGS_CHECKTYPES
+  #define Py_TPFLAGS_CHECKTYPES 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_INDEX
+  #define Py_TPFLAGS_HAVE_INDEX 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_NEWBUFFER
+  #define Py_TPFLAGS_HAVE_NEWBUFFER 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_FINALIZE
+  #define Py_TPFLAGS_HAVE_FINALIZE 0
+#endif
+#ifndef METH_STACKLESS
+  #define METH_STACKLESS 0
+#endif
+#if PY_VERSION_HEX <= 0x030700A3 || !defined(METH_FASTCALL)
+  #ifndef METH_FASTCALL
+     #define METH_FASTCALL 0x80
+  #endif
+  typedef PyObject *(*__Pyx_PyCFunctionFast) (PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+  typedef PyObject *(*__Pyx_PyCFunctionFastWithKeywords) (PyObject *self, PyObject *const *args,
+                                                          Py_ssize_t nargs, PyObject *kwnames);
+#else
+  #define __Pyx_PyCFunctionFast _PyCFunctionFast
+  #define __Pyx_PyCFunctionFastWithKeywords _PyCFunctionFastWithKeywords
+#endif
+#if CYTHON_FAST_PYCCALL
+#define __Pyx_PyFastCFunction_Check(func)\
+    ((PyCFunction_Check(func) && (METH_FASTCALL == (PyCFunction_GET_FLAGS(func) & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS | METH_STACKLESS)))))
+#else
+#define __Pyx_PyFastCFunction_Check(func) 0
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyObject_Malloc)
+  #define PyObject_Malloc(s)   PyMem_Malloc(s)
+  #define PyObject_Free(p)     PyMem_Free(p)
+  #define PyObject_Realloc(p)  PyMem_Realloc(p)
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030400A1
+  #define PyMem_RawMalloc(n)           PyMem_Malloc(n)
+  #define PyMem_RawRealloc(p, n)       PyMem_Realloc(p, n)
+  #define PyMem_RawFree(p)             PyMem_Free(p)
+#endif
+#if CYTHON_COMPILING_IN_PYSTON
+  #define __Pyx_PyCode_HasFreeVars(co)  PyCode_HasFreeVars(co)
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno) PyFrame_SetLineNumber(frame, lineno)
+#else
+  #define __Pyx_PyCode_HasFreeVars(co)  (PyCode_GetNumFree(co) > 0)
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno)  (frame)->f_lineno = (lineno)
+#endif
+#if !CYTHON_FAST_THREAD_STATE || PY_VERSION_HEX < 0x02070000
+  #define __Pyx_PyThreadState_Current PyThreadState_GET()
+#elif PY_VERSION_HEX >= 0x03060000
+  #define __Pyx_PyThreadState_Current _PyThreadState_UncheckedGet()
+#elif PY_VERSION_HEX >= 0x03000000
+  #define __Pyx_PyThreadState_Current PyThreadState_GET()
+#else
+  #define __Pyx_PyThreadState_Current _PyThreadState_Current
+#endif
+#if PY_VERSION_HEX < 0x030700A2 && !defined(PyThread_tss_create) && !defined(Py_tss_NEEDS_INIT)
+#include "pythread.h"
+#define Py_tss_NEEDS_INIT 0
+typedef int Py_tss_t;
+static CYTHON_INLINE int PyThread_tss_create(Py_tss_t *key) {
+  *key = PyThread_create_key();
+  return 0;
+}
+static CYTHON_INLINE Py_tss_t * PyThread_tss_alloc(void) {
+  Py_tss_t *key = (Py_tss_t *)PyObject_Malloc(sizeof(Py_tss_t));
+  *key = Py_tss_NEEDS_INIT;
+  return key;
+}
+static CYTHON_INLINE void PyThread_tss_free(Py_tss_t *key) {
+  PyObject_Free(key);
+}
+static CYTHON_INLINE int PyThread_tss_is_created(Py_tss_t *key) {
+  return *key != Py_tss_NEEDS_INIT;
+}
+static CYTHON_INLINE void PyThread_tss_delete(Py_tss_t *key) {
+  PyThread_delete_key(*key);
+  *key = Py_tss_NEEDS_INIT;
+}
+static CYTHON_INLINE int PyThread_tss_set(Py_tss_t *key, void *value) {
+  return PyThread_set_key_value(*key, value);
+}
+static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
+  return PyThread_get_key_value(*key);
+}
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON || defined(_PyDict_NewPresized)
+#define __Pyx_PyDict_NewPresized(n)  ((n <= 8) ? PyDict_New() : _PyDict_NewPresized(n))
+#else
+#define __Pyx_PyDict_NewPresized(n)  PyDict_New()
+#endif
+#if PY_MAJOR_VERSION >= 3 || CYTHON_FUTURE_DIVISION
+  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_TrueDivide(x,y)
+  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceTrueDivide(x,y)
+#else
+  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_Divide(x,y)
+  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceDivide(x,y)
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1 && CYTHON_USE_UNICODE_INTERNALS
+#define __Pyx_PyDict_GetItemStr(dict, name)  _PyDict_GetItem_KnownHash(dict, name, ((PyASCIIObject *) name)->hash)
+#else
+#define __Pyx_PyDict_GetItemStr(dict, name)  PyDict_GetItem(dict, name)
+#endif
+#if PY_VERSION_HEX > 0x03030000 && defined(PyUnicode_KIND)
+  #define CYTHON_PEP393_ENABLED 1
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_READY(op)       (0)
+  #else
+    #define __Pyx_PyUnicode_READY(op)       (likely(PyUnicode_IS_READY(op)) ?\
+                                                0 : _PyUnicode_Ready((PyObject *)(op)))
+  #endif
+  #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GET_LENGTH(u)
+  #define __Pyx_PyUnicode_READ_CHAR(u, i) PyUnicode_READ_CHAR(u, i)
+  #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   PyUnicode_MAX_CHAR_VALUE(u)
+  #define __Pyx_PyUnicode_KIND(u)         PyUnicode_KIND(u)
+  #define __Pyx_PyUnicode_DATA(u)         PyUnicode_DATA(u)
+  #define __Pyx_PyUnicode_READ(k, d, i)   PyUnicode_READ(k, d, i)
+  #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  PyUnicode_WRITE(k, d, i, ch)
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_LENGTH(u))
+  #else
+    #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x03090000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : ((PyCompactUnicodeObject *)(u))->wstr_length))
+    #else
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : PyUnicode_GET_SIZE(u)))
+    #endif
+  #endif
+#else
+  #define CYTHON_PEP393_ENABLED 0
+  #define PyUnicode_1BYTE_KIND  1
+  #define PyUnicode_2BYTE_KIND  2
+  #define PyUnicode_4BYTE_KIND  4
+  #define __Pyx_PyUnicode_READY(op)       (0)
+  #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GET_SIZE(u)
+  #define __Pyx_PyUnicode_READ_CHAR(u, i) ((Py_UCS4)(PyUnicode_AS_UNICODE(u)[i]))
+  #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   ((sizeof(Py_UNICODE) == 2) ? 65535 : 1114111)
+  #define __Pyx_PyUnicode_KIND(u)         (sizeof(Py_UNICODE))
+  #define __Pyx_PyUnicode_DATA(u)         ((void*)PyUnicode_AS_UNICODE(u))
+  #define __Pyx_PyUnicode_READ(k, d, i)   ((void)(k), (Py_UCS4)(((Py_UNICODE*)d)[i]))
+  #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  (((void)(k)), ((Py_UNICODE*)d)[i] = ch)
+  #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_SIZE(u))
+#endif
+#if CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyUnicode_Concat(a, b)      PyNumber_Add(a, b)
+  #define __Pyx_PyUnicode_ConcatSafe(a, b)  PyNumber_Add(a, b)
+#else
+  #define __Pyx_PyUnicode_Concat(a, b)      PyUnicode_Concat(a, b)
+  #define __Pyx_PyUnicode_ConcatSafe(a, b)  ((unlikely((a) == Py_None) || unlikely((b) == Py_None)) ?\
+      PyNumber_Add(a, b) : __Pyx_PyUnicode_Concat(a, b))
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyUnicode_Contains)
+  #define PyUnicode_Contains(u, s)  PySequence_Contains(u, s)
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyByteArray_Check)
+  #define PyByteArray_Check(obj)  PyObject_TypeCheck(obj, &PyByteArray_Type)
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyObject_Format)
+  #define PyObject_Format(obj, fmt)  PyObject_CallMethod(obj, "__format__", "O", fmt)
+#endif
+#define __Pyx_PyString_FormatSafe(a, b)   ((unlikely((a) == Py_None || (PyString_Check(b) && !PyString_CheckExact(b)))) ? PyNumber_Remainder(a, b) : __Pyx_PyString_Format(a, b))
+#define __Pyx_PyUnicode_FormatSafe(a, b)  ((unlikely((a) == Py_None || (PyUnicode_Check(b) && !PyUnicode_CheckExact(b)))) ? PyNumber_Remainder(a, b) : PyUnicode_Format(a, b))
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyString_Format(a, b)  PyUnicode_Format(a, b)
+#else
+  #define __Pyx_PyString_Format(a, b)  PyString_Format(a, b)
+#endif
+#if PY_MAJOR_VERSION < 3 && !defined(PyObject_ASCII)
+  #define PyObject_ASCII(o)            PyObject_Repr(o)
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyBaseString_Type            PyUnicode_Type
+  #define PyStringObject               PyUnicodeObject
+  #define PyString_Type                PyUnicode_Type
+  #define PyString_Check               PyUnicode_Check
+  #define PyString_CheckExact          PyUnicode_CheckExact
+#ifndef PyObject_Unicode
+  #define PyObject_Unicode             PyObject_Str
+#endif
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyBaseString_Check(obj) PyUnicode_Check(obj)
+  #define __Pyx_PyBaseString_CheckExact(obj) PyUnicode_CheckExact(obj)
+#else
+  #define __Pyx_PyBaseString_Check(obj) (PyString_Check(obj) || PyUnicode_Check(obj))
+  #define __Pyx_PyBaseString_CheckExact(obj) (PyString_CheckExact(obj) || PyUnicode_CheckExact(obj))
+#endif
+#ifndef PySet_CheckExact
+  #define PySet_CheckExact(obj)        (Py_TYPE(obj) == &PySet_Type)
+#endif
+#if PY_VERSION_HEX >= 0x030900A4
+  #define __Pyx_SET_REFCNT(obj, refcnt) Py_SET_REFCNT(obj, refcnt)
+  #define __Pyx_SET_SIZE(obj, size) Py_SET_SIZE(obj, size)
+#else
+  #define __Pyx_SET_REFCNT(obj, refcnt) Py_REFCNT(obj) = (refcnt)
+  #define __Pyx_SET_SIZE(obj, size) Py_SIZE(obj) = (size)
+#endif
+#if CYTHON_ASSUME_SAFE_MACROS
+  #define __Pyx_PySequence_SIZE(seq)  Py_SIZE(seq)
+#else
+  #define __Pyx_PySequence_SIZE(seq)  PySequence_Size(seq)
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyIntObject                  PyLongObject
+  #define PyInt_Type                   PyLong_Type
+  #define PyInt_Check(op)              PyLong_Check(op)
+  #define PyInt_CheckExact(op)         PyLong_CheckExact(op)
+  #define PyInt_FromString             PyLong_FromString
+  #define PyInt_FromUnicode            PyLong_FromUnicode
+  #define PyInt_FromLong               PyLong_FromLong
+  #define PyInt_FromSize_t             PyLong_FromSize_t
+  #define PyInt_FromSsize_t            PyLong_FromSsize_t
+  #define PyInt_AsLong                 PyLong_AsLong
+  #define PyInt_AS_LONG                PyLong_AS_LONG
+  #define PyInt_AsSsize_t              PyLong_AsSsize_t
+  #define PyInt_AsUnsignedLongMask     PyLong_AsUnsignedLongMask
+  #define PyInt_AsUnsignedLongLongMask PyLong_AsUnsignedLongLongMask
+  #define PyNumber_Int                 PyNumber_Long
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyBoolObject                 PyLongObject
+#endif
+#if PY_MAJOR_VERSION >= 3 && CYTHON_COMPILING_IN_PYPY
+  #ifndef PyUnicode_InternFromString
+    #define PyUnicode_InternFromString(s) PyUnicode_FromString(s)
+  #endif
+#endif
+#if PY_VERSION_HEX < 0x030200A4
+  typedef long Py_hash_t;
+  #define __Pyx_PyInt_FromHash_t PyInt_FromLong
+  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsHash_t
+#else
+  #define __Pyx_PyInt_FromHash_t PyInt_FromSsize_t
+  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsSsize_t
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyMethod_New(func, self, klass) ((self) ? ((void)(klass), PyMethod_New(func, self)) : __Pyx_NewRef(func))
+#else
+  #define __Pyx_PyMethod_New(func, self, klass) PyMethod_New(func, self, klass)
+#endif
+#if CYTHON_USE_ASYNC_SLOTS
+  #if PY_VERSION_HEX >= 0x030500B1
+    #define __Pyx_PyAsyncMethodsStruct PyAsyncMethods
+    #define __Pyx_PyType_AsAsync(obj) (Py_TYPE(obj)->tp_as_async)
+  #else
+    #define __Pyx_PyType_AsAsync(obj) ((__Pyx_PyAsyncMethodsStruct*) (Py_TYPE(obj)->tp_reserved))
+  #endif
+#else
+  #define __Pyx_PyType_AsAsync(obj) NULL
+#endif
+#ifndef __Pyx_PyAsyncMethodsStruct
+    typedef struct {
+        unaryfunc am_await;
+        unaryfunc am_aiter;
+        unaryfunc am_anext;
+    } __Pyx_PyAsyncMethodsStruct;
+#endif
+
+#if defined(_WIN32) || defined(WIN32) || defined(MS_WINDOWS)
+  #if !defined(_USE_MATH_DEFINES)
+    #define _USE_MATH_DEFINES
+  #endif
+#endif
+#include <math.h>
+#ifdef NAN
+#define __PYX_NAN() ((float) NAN)
+#else
+static CYTHON_INLINE float __PYX_NAN() {
+  float value;
+  memset(&value, 0xFF, sizeof(value));
+  return value;
+}
+#endif
+#if defined(__CYGWIN__) && defined(_LDBL_EQ_DBL)
+#define __Pyx_truncl trunc
+#else
+#define __Pyx_truncl truncl
+#endif
+
+#define __PYX_MARK_ERR_POS(f_index, lineno) \
+    { __pyx_filename = __pyx_f[f_index]; (void)__pyx_filename; __pyx_lineno = lineno; (void)__pyx_lineno; __pyx_clineno = __LINE__; (void)__pyx_clineno; }
+#define __PYX_ERR(f_index, lineno, Ln_error) \
+    { __PYX_MARK_ERR_POS(f_index, lineno) goto Ln_error; }
+
+#ifndef __PYX_EXTERN_C
+  #ifdef __cplusplus
+    #define __PYX_EXTERN_C extern "C"
+  #else
+    #define __PYX_EXTERN_C extern
+  #endif
+#endif
+
+#define __PYX_HAVE__breezy__bzr___chk_map_pyx
+#define __PYX_HAVE_API__breezy__bzr___chk_map_pyx
+/* Early includes */
+#include "python-compat.h"
+#include <string.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include "_static_tuple_c.h"
+#ifdef _OPENMP
+#include <omp.h>
+#endif /* _OPENMP */
+
+#if defined(PYREX_WITHOUT_ASSERTIONS) && !defined(CYTHON_WITHOUT_ASSERTIONS)
+#define CYTHON_WITHOUT_ASSERTIONS
+#endif
+
+typedef struct {PyObject **p; const char *s; const Py_ssize_t n; const char* encoding;
+                const char is_unicode; const char is_str; const char intern; } __Pyx_StringTabEntry;
+
+#define __PYX_DEFAULT_STRING_ENCODING_IS_ASCII 0
+#define __PYX_DEFAULT_STRING_ENCODING_IS_UTF8 0
+#define __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT (PY_MAJOR_VERSION >= 3 && __PYX_DEFAULT_STRING_ENCODING_IS_UTF8)
+#define __PYX_DEFAULT_STRING_ENCODING ""
+#define __Pyx_PyObject_FromString __Pyx_PyBytes_FromString
+#define __Pyx_PyObject_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
+#define __Pyx_uchar_cast(c) ((unsigned char)c)
+#define __Pyx_long_cast(x) ((long)x)
+#define __Pyx_fits_Py_ssize_t(v, type, is_signed)  (\
+    (sizeof(type) < sizeof(Py_ssize_t))  ||\
+    (sizeof(type) > sizeof(Py_ssize_t) &&\
+          likely(v < (type)PY_SSIZE_T_MAX ||\
+                 v == (type)PY_SSIZE_T_MAX)  &&\
+          (!is_signed || likely(v > (type)PY_SSIZE_T_MIN ||\
+                                v == (type)PY_SSIZE_T_MIN)))  ||\
+    (sizeof(type) == sizeof(Py_ssize_t) &&\
+          (is_signed || likely(v < (type)PY_SSIZE_T_MAX ||\
+                               v == (type)PY_SSIZE_T_MAX)))  )
+static CYTHON_INLINE int __Pyx_is_valid_index(Py_ssize_t i, Py_ssize_t limit) {
+    return (size_t) i < (size_t) limit;
+}
+#if defined (__cplusplus) && __cplusplus >= 201103L
+    #include <cstdlib>
+    #define __Pyx_sst_abs(value) std::abs(value)
+#elif SIZEOF_INT >= SIZEOF_SIZE_T
+    #define __Pyx_sst_abs(value) abs(value)
+#elif SIZEOF_LONG >= SIZEOF_SIZE_T
+    #define __Pyx_sst_abs(value) labs(value)
+#elif defined (_MSC_VER)
+    #define __Pyx_sst_abs(value) ((Py_ssize_t)_abs64(value))
+#elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define __Pyx_sst_abs(value) llabs(value)
+#elif defined (__GNUC__)
+    #define __Pyx_sst_abs(value) __builtin_llabs(value)
+#else
+    #define __Pyx_sst_abs(value) ((value<0) ? -value : value)
+#endif
+static CYTHON_INLINE const char* __Pyx_PyObject_AsString(PyObject*);
+static CYTHON_INLINE const char* __Pyx_PyObject_AsStringAndSize(PyObject*, Py_ssize_t* length);
+#define __Pyx_PyByteArray_FromString(s) PyByteArray_FromStringAndSize((const char*)s, strlen((const char*)s))
+#define __Pyx_PyByteArray_FromStringAndSize(s, l) PyByteArray_FromStringAndSize((const char*)s, l)
+#define __Pyx_PyBytes_FromString        PyBytes_FromString
+#define __Pyx_PyBytes_FromStringAndSize PyBytes_FromStringAndSize
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char*);
+#if PY_MAJOR_VERSION < 3
+    #define __Pyx_PyStr_FromString        __Pyx_PyBytes_FromString
+    #define __Pyx_PyStr_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
+#else
+    #define __Pyx_PyStr_FromString        __Pyx_PyUnicode_FromString
+    #define __Pyx_PyStr_FromStringAndSize __Pyx_PyUnicode_FromStringAndSize
+#endif
+#define __Pyx_PyBytes_AsWritableString(s)     ((char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsWritableSString(s)    ((signed char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsWritableUString(s)    ((unsigned char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsString(s)     ((const char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsSString(s)    ((const signed char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsUString(s)    ((const unsigned char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyObject_AsWritableString(s)    ((char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsWritableSString(s)    ((signed char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsWritableUString(s)    ((unsigned char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsSString(s)    ((const signed char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsUString(s)    ((const unsigned char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_FromCString(s)  __Pyx_PyObject_FromString((const char*)s)
+#define __Pyx_PyBytes_FromCString(s)   __Pyx_PyBytes_FromString((const char*)s)
+#define __Pyx_PyByteArray_FromCString(s)   __Pyx_PyByteArray_FromString((const char*)s)
+#define __Pyx_PyStr_FromCString(s)     __Pyx_PyStr_FromString((const char*)s)
+#define __Pyx_PyUnicode_FromCString(s) __Pyx_PyUnicode_FromString((const char*)s)
+static CYTHON_INLINE size_t __Pyx_Py_UNICODE_strlen(const Py_UNICODE *u) {
+    const Py_UNICODE *u_end = u;
+    while (*u_end++) ;
+    return (size_t)(u_end - u - 1);
+}
+#define __Pyx_PyUnicode_FromUnicode(u)       PyUnicode_FromUnicode(u, __Pyx_Py_UNICODE_strlen(u))
+#define __Pyx_PyUnicode_FromUnicodeAndLength PyUnicode_FromUnicode
+#define __Pyx_PyUnicode_AsUnicode            PyUnicode_AsUnicode
+#define __Pyx_NewRef(obj) (Py_INCREF(obj), obj)
+#define __Pyx_Owned_Py_None(b) __Pyx_NewRef(Py_None)
+static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b);
+static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject*);
+static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject*);
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_IntOrLong(PyObject* x);
+#define __Pyx_PySequence_Tuple(obj)\
+    (likely(PyTuple_CheckExact(obj)) ? __Pyx_NewRef(obj) : PySequence_Tuple(obj))
+static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject*);
+static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t);
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject*);
+#if CYTHON_ASSUME_SAFE_MACROS
+#define __pyx_PyFloat_AsDouble(x) (PyFloat_CheckExact(x) ? PyFloat_AS_DOUBLE(x) : PyFloat_AsDouble(x))
+#else
+#define __pyx_PyFloat_AsDouble(x) PyFloat_AsDouble(x)
+#endif
+#define __pyx_PyFloat_AsFloat(x) ((float) __pyx_PyFloat_AsDouble(x))
+#if PY_MAJOR_VERSION >= 3
+#define __Pyx_PyNumber_Int(x) (PyLong_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Long(x))
+#else
+#define __Pyx_PyNumber_Int(x) (PyInt_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Int(x))
+#endif
+#define __Pyx_PyNumber_Float(x) (PyFloat_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Float(x))
+#if PY_MAJOR_VERSION < 3 && __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+static int __Pyx_sys_getdefaultencoding_not_ascii;
+static int __Pyx_init_sys_getdefaultencoding_params(void) {
+    PyObject* sys;
+    PyObject* default_encoding = NULL;
+    PyObject* ascii_chars_u = NULL;
+    PyObject* ascii_chars_b = NULL;
+    const char* default_encoding_c;
+    sys = PyImport_ImportModule("sys");
+    if (!sys) goto bad;
+    default_encoding = PyObject_CallMethod(sys, (char*) "getdefaultencoding", NULL);
+    Py_DECREF(sys);
+    if (!default_encoding) goto bad;
+    default_encoding_c = PyBytes_AsString(default_encoding);
+    if (!default_encoding_c) goto bad;
+    if (strcmp(default_encoding_c, "ascii") == 0) {
+        __Pyx_sys_getdefaultencoding_not_ascii = 0;
+    } else {
+        char ascii_chars[128];
+        int c;
+        for (c = 0; c < 128; c++) {
+            ascii_chars[c] = c;
+        }
+        __Pyx_sys_getdefaultencoding_not_ascii = 1;
+        ascii_chars_u = PyUnicode_DecodeASCII(ascii_chars, 128, NULL);
+        if (!ascii_chars_u) goto bad;
+        ascii_chars_b = PyUnicode_AsEncodedString(ascii_chars_u, default_encoding_c, NULL);
+        if (!ascii_chars_b || !PyBytes_Check(ascii_chars_b) || memcmp(ascii_chars, PyBytes_AS_STRING(ascii_chars_b), 128) != 0) {
+            PyErr_Format(
+                PyExc_ValueError,
+                "This module compiled with c_string_encoding=ascii, but default encoding '%.200s' is not a superset of ascii.",
+                default_encoding_c);
+            goto bad;
+        }
+        Py_DECREF(ascii_chars_u);
+        Py_DECREF(ascii_chars_b);
+    }
+    Py_DECREF(default_encoding);
+    return 0;
+bad:
+    Py_XDECREF(default_encoding);
+    Py_XDECREF(ascii_chars_u);
+    Py_XDECREF(ascii_chars_b);
+    return -1;
+}
+#endif
+#if __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT && PY_MAJOR_VERSION >= 3
+#define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_DecodeUTF8(c_str, size, NULL)
+#else
+#define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_Decode(c_str, size, __PYX_DEFAULT_STRING_ENCODING, NULL)
+#if __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+static char* __PYX_DEFAULT_STRING_ENCODING;
+static int __Pyx_init_sys_getdefaultencoding_params(void) {
+    PyObject* sys;
+    PyObject* default_encoding = NULL;
+    char* default_encoding_c;
+    sys = PyImport_ImportModule("sys");
+    if (!sys) goto bad;
+    default_encoding = PyObject_CallMethod(sys, (char*) (const char*) "getdefaultencoding", NULL);
+    Py_DECREF(sys);
+    if (!default_encoding) goto bad;
+    default_encoding_c = PyBytes_AsString(default_encoding);
+    if (!default_encoding_c) goto bad;
+    __PYX_DEFAULT_STRING_ENCODING = (char*) malloc(strlen(default_encoding_c) + 1);
+    if (!__PYX_DEFAULT_STRING_ENCODING) goto bad;
+    strcpy(__PYX_DEFAULT_STRING_ENCODING, default_encoding_c);
+    Py_DECREF(default_encoding);
+    return 0;
+bad:
+    Py_XDECREF(default_encoding);
+    return -1;
+}
+#endif
+#endif
+
+
+/* Test for GCC > 2.95 */
+#if defined(__GNUC__)     && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))
+  #define likely(x)   __builtin_expect(!!(x), 1)
+  #define unlikely(x) __builtin_expect(!!(x), 0)
+#else /* !__GNUC__ or GCC < 2.95 */
+  #define likely(x)   (x)
+  #define unlikely(x) (x)
+#endif /* __GNUC__ */
+static CYTHON_INLINE void __Pyx_pretend_to_initialize(void* ptr) { (void)ptr; }
+
+static PyObject *__pyx_m = NULL;
+static PyObject *__pyx_d;
+static PyObject *__pyx_b;
+static PyObject *__pyx_cython_runtime = NULL;
+static PyObject *__pyx_empty_tuple;
+static PyObject *__pyx_empty_bytes;
+static PyObject *__pyx_empty_unicode;
+static int __pyx_lineno;
+static int __pyx_clineno = 0;
+static const char * __pyx_cfilenm= __FILE__;
+static const char *__pyx_filename;
+
+
+static const char *__pyx_f[] = {
+  "breezy/bzr/_chk_map_pyx.pyx",
+  "breezy/bzr/_str_helpers.pxd",
+  "type.pxd",
+  "breezy/_static_tuple_c.pxd",
+};
+
+/*--- Type declarations ---*/
+
+/* --- Runtime support code (head) --- */
+/* Refnanny.proto */
+#ifndef CYTHON_REFNANNY
+  #define CYTHON_REFNANNY 0
+#endif
+#if CYTHON_REFNANNY
+  typedef struct {
+    void (*INCREF)(void*, PyObject*, int);
+    void (*DECREF)(void*, PyObject*, int);
+    void (*GOTREF)(void*, PyObject*, int);
+    void (*GIVEREF)(void*, PyObject*, int);
+    void* (*SetupContext)(const char*, int, const char*);
+    void (*FinishContext)(void**);
+  } __Pyx_RefNannyAPIStruct;
+  static __Pyx_RefNannyAPIStruct *__Pyx_RefNanny = NULL;
+  static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname);
+  #define __Pyx_RefNannyDeclarations void *__pyx_refnanny = NULL;
+#ifdef WITH_THREAD
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)\
+          if (acquire_gil) {\
+              PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();\
+              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__);\
+              PyGILState_Release(__pyx_gilstate_save);\
+          } else {\
+              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__);\
+          }
+#else
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)\
+          __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__)
+#endif
+  #define __Pyx_RefNannyFinishContext()\
+          __Pyx_RefNanny->FinishContext(&__pyx_refnanny)
+  #define __Pyx_INCREF(r)  __Pyx_RefNanny->INCREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_DECREF(r)  __Pyx_RefNanny->DECREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_GOTREF(r)  __Pyx_RefNanny->GOTREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_GIVEREF(r) __Pyx_RefNanny->GIVEREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_XINCREF(r)  do { if((r) != NULL) {__Pyx_INCREF(r); }} while(0)
+  #define __Pyx_XDECREF(r)  do { if((r) != NULL) {__Pyx_DECREF(r); }} while(0)
+  #define __Pyx_XGOTREF(r)  do { if((r) != NULL) {__Pyx_GOTREF(r); }} while(0)
+  #define __Pyx_XGIVEREF(r) do { if((r) != NULL) {__Pyx_GIVEREF(r);}} while(0)
+#else
+  #define __Pyx_RefNannyDeclarations
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)
+  #define __Pyx_RefNannyFinishContext()
+  #define __Pyx_INCREF(r) Py_INCREF(r)
+  #define __Pyx_DECREF(r) Py_DECREF(r)
+  #define __Pyx_GOTREF(r)
+  #define __Pyx_GIVEREF(r)
+  #define __Pyx_XINCREF(r) Py_XINCREF(r)
+  #define __Pyx_XDECREF(r) Py_XDECREF(r)
+  #define __Pyx_XGOTREF(r)
+  #define __Pyx_XGIVEREF(r)
+#endif
+#define __Pyx_XDECREF_SET(r, v) do {\
+        PyObject *tmp = (PyObject *) r;\
+        r = v; __Pyx_XDECREF(tmp);\
+    } while (0)
+#define __Pyx_DECREF_SET(r, v) do {\
+        PyObject *tmp = (PyObject *) r;\
+        r = v; __Pyx_DECREF(tmp);\
+    } while (0)
+#define __Pyx_CLEAR(r)    do { PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);} while(0)
+#define __Pyx_XCLEAR(r)   do { if((r) != NULL) {PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);}} while(0)
+
+/* PyObjectGetAttrStr.proto */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GetAttrStr(o,n) PyObject_GetAttr(o,n)
+#endif
+
+/* GetBuiltinName.proto */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name);
+
+/* GetItemInt.proto */
+#define __Pyx_GetItemInt(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_Fast(o, (Py_ssize_t)i, is_list, wraparound, boundscheck) :\
+    (is_list ? (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL) :\
+               __Pyx_GetItemInt_Generic(o, to_py_func(i))))
+#define __Pyx_GetItemInt_List(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_List_Fast(o, (Py_ssize_t)i, wraparound, boundscheck) :\
+    (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL))
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
+                                                              int wraparound, int boundscheck);
+#define __Pyx_GetItemInt_Tuple(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_Tuple_Fast(o, (Py_ssize_t)i, wraparound, boundscheck) :\
+    (PyErr_SetString(PyExc_IndexError, "tuple index out of range"), (PyObject*)NULL))
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
+                                                              int wraparound, int boundscheck);
+static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j);
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i,
+                                                     int is_list, int wraparound, int boundscheck);
+
+/* PyCFunctionFastCall.proto */
+#if CYTHON_FAST_PYCCALL
+static CYTHON_INLINE PyObject *__Pyx_PyCFunction_FastCall(PyObject *func, PyObject **args, Py_ssize_t nargs);
+#else
+#define __Pyx_PyCFunction_FastCall(func, args, nargs)  (assert(0), NULL)
+#endif
+
+/* PyFunctionFastCall.proto */
+#if CYTHON_FAST_PYCALL
+#define __Pyx_PyFunction_FastCall(func, args, nargs)\
+    __Pyx_PyFunction_FastCallDict((func), (args), (nargs), NULL)
+#if 1 || PY_VERSION_HEX < 0x030600B1
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, Py_ssize_t nargs, PyObject *kwargs);
+#else
+#define __Pyx_PyFunction_FastCallDict(func, args, nargs, kwargs) _PyFunction_FastCallDict(func, args, nargs, kwargs)
+#endif
+#define __Pyx_BUILD_ASSERT_EXPR(cond)\
+    (sizeof(char [1 - 2*!(cond)]) - 1)
+#ifndef Py_MEMBER_SIZE
+#define Py_MEMBER_SIZE(type, member) sizeof(((type *)0)->member)
+#endif
+#if CYTHON_FAST_PYCALL
+  static size_t __pyx_pyframe_localsplus_offset = 0;
+  #include "frameobject.h"
+#if PY_VERSION_HEX >= 0x030b00a6
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
+  #define __Pxy_PyFrame_Initialize_Offsets()\
+    ((void)__Pyx_BUILD_ASSERT_EXPR(sizeof(PyFrameObject) == offsetof(PyFrameObject, f_localsplus) + Py_MEMBER_SIZE(PyFrameObject, f_localsplus)),\
+     (void)(__pyx_pyframe_localsplus_offset = ((size_t)PyFrame_Type.tp_basicsize) - Py_MEMBER_SIZE(PyFrameObject, f_localsplus)))
+  #define __Pyx_PyFrame_GetLocalsplus(frame)\
+    (assert(__pyx_pyframe_localsplus_offset), (PyObject **)(((char *)(frame)) + __pyx_pyframe_localsplus_offset))
+#endif // CYTHON_FAST_PYCALL
+#endif
+
+/* PyObjectCall.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw);
+#else
+#define __Pyx_PyObject_Call(func, arg, kw) PyObject_Call(func, arg, kw)
+#endif
+
+/* PyObjectCall2Args.proto */
+static CYTHON_UNUSED PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2);
+
+/* PyObjectCallMethO.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg);
+#endif
+
+/* PyObjectCallOneArg.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg);
+
+/* PyThreadStateGet.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyThreadState_declare  PyThreadState *__pyx_tstate;
+#define __Pyx_PyThreadState_assign  __pyx_tstate = __Pyx_PyThreadState_Current;
+#define __Pyx_PyErr_Occurred()  __pyx_tstate->curexc_type
+#else
+#define __Pyx_PyThreadState_declare
+#define __Pyx_PyThreadState_assign
+#define __Pyx_PyErr_Occurred()  PyErr_Occurred()
+#endif
+
+/* PyErrFetchRestore.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_Clear() __Pyx_ErrRestore(NULL, NULL, NULL)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  __Pyx_ErrRestoreInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)    __Pyx_ErrFetchInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  __Pyx_ErrRestoreInState(__pyx_tstate, type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)    __Pyx_ErrFetchInState(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_PyErr_SetNone(exc) (Py_INCREF(exc), __Pyx_ErrRestore((exc), NULL, NULL))
+#else
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#endif
+#else
+#define __Pyx_PyErr_Clear() PyErr_Clear()
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestoreInState(tstate, type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchInState(tstate, type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)  PyErr_Fetch(type, value, tb)
+#endif
+
+/* RaiseException.proto */
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause);
+
+/* Import.proto */
+static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level);
+
+/* ImportFrom.proto */
+static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name);
+
+/* RaiseArgTupleInvalid.proto */
+static void __Pyx_RaiseArgtupleInvalid(const char* func_name, int exact,
+    Py_ssize_t num_min, Py_ssize_t num_max, Py_ssize_t num_found);
+
+/* RaiseDoubleKeywords.proto */
+static void __Pyx_RaiseDoubleKeywordsError(const char* func_name, PyObject* kw_name);
+
+/* ParseKeywords.proto */
+static int __Pyx_ParseOptionalKeywords(PyObject *kwds, PyObject **argnames[],\
+    PyObject *kwds2, PyObject *values[], Py_ssize_t num_pos_args,\
+    const char* function_name);
+
+/* PyObjectFormatAndDecref.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_FormatSimpleAndDecref(PyObject* s, PyObject* f);
+static CYTHON_INLINE PyObject* __Pyx_PyObject_FormatAndDecref(PyObject* s, PyObject* f);
+
+/* ListAppend.proto */
+#if CYTHON_USE_PYLIST_INTERNALS && CYTHON_ASSUME_SAFE_MACROS
+static CYTHON_INLINE int __Pyx_PyList_Append(PyObject* list, PyObject* x) {
+    PyListObject* L = (PyListObject*) list;
+    Py_ssize_t len = Py_SIZE(list);
+    if (likely(L->allocated > len) & likely(len > (L->allocated >> 1))) {
+        Py_INCREF(x);
+        PyList_SET_ITEM(list, len, x);
+        __Pyx_SET_SIZE(list, len + 1);
+        return 0;
+    }
+    return PyList_Append(list, x);
+}
+#else
+#define __Pyx_PyList_Append(L,x) PyList_Append(L,x)
+#endif
+
+/* GCCDiagnostics.proto */
+#if defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 6))
+#define __Pyx_HAS_GCC_DIAGNOSTIC
+#endif
+
+/* BuildPyUnicode.proto */
+static PyObject* __Pyx_PyUnicode_BuildFromAscii(Py_ssize_t ulength, char* chars, int clength,
+                                                int prepend_sign, char padding_char);
+
+/* IncludeStringH.proto */
+#include <string.h>
+
+/* CIntToPyUnicode.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_From_Py_ssize_t(Py_ssize_t value, Py_ssize_t width, char padding_char, char format_char);
+
+/* CIntToPyUnicode.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_From_long(long value, Py_ssize_t width, char padding_char, char format_char);
+
+/* JoinPyUnicode.proto */
+static PyObject* __Pyx_PyUnicode_Join(PyObject* value_tuple, Py_ssize_t value_count, Py_ssize_t result_ulength,
+                                      Py_UCS4 max_char);
+
+/* CIntToPyUnicode.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_From_int(int value, Py_ssize_t width, char padding_char, char format_char);
+
+/* None.proto */
+static CYTHON_INLINE void __Pyx_RaiseUnboundLocalError(const char *varname);
+
+/* PyObjectSetAttrStr.proto */
+#if CYTHON_USE_TYPE_SLOTS
+#define __Pyx_PyObject_DelAttrStr(o,n) __Pyx_PyObject_SetAttrStr(o, n, NULL)
+static CYTHON_INLINE int __Pyx_PyObject_SetAttrStr(PyObject* obj, PyObject* attr_name, PyObject* value);
+#else
+#define __Pyx_PyObject_DelAttrStr(o,n)   PyObject_DelAttr(o,n)
+#define __Pyx_PyObject_SetAttrStr(o,n,v) PyObject_SetAttr(o,n,v)
+#endif
+
+/* PyObjectCallNoArg.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func);
+#else
+#define __Pyx_PyObject_CallNoArg(func) __Pyx_PyObject_Call(func, __pyx_empty_tuple, NULL)
+#endif
+
+/* AssertionsEnabled.proto */
+#define __Pyx_init_assertions_enabled()
+#if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX < 0x02070600 && !defined(Py_OptimizeFlag)
+  #define __pyx_assertions_enabled() (1)
+#elif PY_VERSION_HEX < 0x03080000  ||  CYTHON_COMPILING_IN_PYPY  ||  defined(Py_LIMITED_API)
+  #define __pyx_assertions_enabled() (!Py_OptimizeFlag)
+#elif CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030900A6
+  static int __pyx_assertions_enabled_flag;
+  #define __pyx_assertions_enabled() (__pyx_assertions_enabled_flag)
+  #undef __Pyx_init_assertions_enabled
+  static void __Pyx_init_assertions_enabled(void) {
+    __pyx_assertions_enabled_flag = ! _PyInterpreterState_GetConfig(__Pyx_PyThreadState_Current->interp)->optimization_level;
+  }
+#else
+  #define __pyx_assertions_enabled() (!Py_OptimizeFlag)
+#endif
+
+/* TypeImport.proto */
+#ifndef __PYX_HAVE_RT_ImportType_proto_0_29_37
+#define __PYX_HAVE_RT_ImportType_proto_0_29_37
+#if __STDC_VERSION__ >= 201112L
+#include <stdalign.h>
+#endif
+#if __STDC_VERSION__ >= 201112L || __cplusplus >= 201103L
+#define __PYX_GET_STRUCT_ALIGNMENT_0_29_37(s) alignof(s)
+#else
+#define __PYX_GET_STRUCT_ALIGNMENT_0_29_37(s) sizeof(void*)
+#endif
+enum __Pyx_ImportType_CheckSize_0_29_37 {
+   __Pyx_ImportType_CheckSize_Error_0_29_37 = 0,
+   __Pyx_ImportType_CheckSize_Warn_0_29_37 = 1,
+   __Pyx_ImportType_CheckSize_Ignore_0_29_37 = 2
+};
+static PyTypeObject *__Pyx_ImportType_0_29_37(PyObject* module, const char *module_name, const char *class_name, size_t size, size_t alignment, enum __Pyx_ImportType_CheckSize_0_29_37 check_size);
+#endif
+
+/* PyDictVersioning.proto */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+#define __PYX_DICT_VERSION_INIT  ((PY_UINT64_T) -1)
+#define __PYX_GET_DICT_VERSION(dict)  (((PyDictObject*)(dict))->ma_version_tag)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)\
+    (version_var) = __PYX_GET_DICT_VERSION(dict);\
+    (cache_var) = (value);
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP) {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    if (likely(__PYX_GET_DICT_VERSION(DICT) == __pyx_dict_version)) {\
+        (VAR) = __pyx_dict_cached_value;\
+    } else {\
+        (VAR) = __pyx_dict_cached_value = (LOOKUP);\
+        __pyx_dict_version = __PYX_GET_DICT_VERSION(DICT);\
+    }\
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj);
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj);
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version);
+#else
+#define __PYX_GET_DICT_VERSION(dict)  (0)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP)  (VAR) = (LOOKUP);
+#endif
+
+/* CLineInTraceback.proto */
+#ifdef CYTHON_CLINE_IN_TRACEBACK
+#define __Pyx_CLineForTraceback(tstate, c_line)  (((CYTHON_CLINE_IN_TRACEBACK)) ? c_line : 0)
+#else
+static int __Pyx_CLineForTraceback(PyThreadState *tstate, int c_line);
+#endif
+
+/* CodeObjectCache.proto */
+typedef struct {
+    PyCodeObject* code_object;
+    int code_line;
+} __Pyx_CodeObjectCacheEntry;
+struct __Pyx_CodeObjectCache {
+    int count;
+    int max_count;
+    __Pyx_CodeObjectCacheEntry* entries;
+};
+static struct __Pyx_CodeObjectCache __pyx_code_cache = {0,0,NULL};
+static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line);
+static PyCodeObject *__pyx_find_code_object(int code_line);
+static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object);
+
+/* AddTraceback.proto */
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *);
+
+/* FastTypeChecks.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_TypeCheck(obj, type) __Pyx_IsSubtype(Py_TYPE(obj), (PyTypeObject *)type)
+static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b);
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject *type);
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *type1, PyObject *type2);
+#else
+#define __Pyx_TypeCheck(obj, type) PyObject_TypeCheck(obj, (PyTypeObject *)type)
+#define __Pyx_PyErr_GivenExceptionMatches(err, type) PyErr_GivenExceptionMatches(err, type)
+#define __Pyx_PyErr_GivenExceptionMatches2(err, type1, type2) (PyErr_GivenExceptionMatches(err, type1) || PyErr_GivenExceptionMatches(err, type2))
+#endif
+#define __Pyx_PyException_Check(obj) __Pyx_TypeCheck(obj, PyExc_Exception)
+
+/* CheckBinaryVersion.proto */
+static int __Pyx_check_binary_version(void);
+
+/* InitStrings.proto */
+static int __Pyx_InitStrings(__Pyx_StringTabEntry *t);
+
+
+/* Module declarations from 'libc.string' */
+
+/* Module declarations from 'libc.stdio' */
+
+/* Module declarations from 'libc.stdlib' */
+
+/* Module declarations from '__builtin__' */
+
+/* Module declarations from 'cpython.type' */
+static PyTypeObject *__pyx_ptype_7cpython_4type_type = 0;
+
+/* Module declarations from 'cpython' */
+
+/* Module declarations from 'cpython.object' */
+
+/* Module declarations from 'cpython.bytes' */
+
+/* Module declarations from 'cpython.dict' */
+
+/* Module declarations from 'cpython.int' */
+
+/* Module declarations from 'cpython.ref' */
+
+/* Module declarations from 'cpython.tuple' */
+
+/* Module declarations from 'breezy.bzr._str_helpers' */
+static CYTHON_INLINE void *__pyx_f_6breezy_3bzr_12_str_helpers__my_memrchr(void *, int, size_t); /*proto*/
+static CYTHON_INLINE PyObject *__pyx_f_6breezy_3bzr_12_str_helpers_safe_interned_string_from_size(char *, Py_ssize_t); /*proto*/
+
+/* Module declarations from 'breezy._static_tuple_c' */
+
+/* Module declarations from 'breezy._static_tuple_c' */
+static PyTypeObject *__pyx_ptype_6breezy_15_static_tuple_c_StaticTuple = 0;
+
+/* Module declarations from 'breezy.bzr._chk_map_pyx' */
+static PyObject *__pyx_v_6breezy_3bzr_12_chk_map_pyx_crc32 = 0;
+static PyObject *__pyx_v_6breezy_3bzr_12_chk_map_pyx__LeafNode = 0;
+static PyObject *__pyx_v_6breezy_3bzr_12_chk_map_pyx__InternalNode = 0;
+static PyObject *__pyx_v_6breezy_3bzr_12_chk_map_pyx__unknown = 0;
+static int __pyx_f_6breezy_3bzr_12_chk_map_pyx__get_int_from_line(char **, char *, char *); /*proto*/
+static PyObject *__pyx_f_6breezy_3bzr_12_chk_map_pyx__import_globals(void); /*proto*/
+#define __Pyx_MODULE_NAME "breezy.bzr._chk_map_pyx"
+extern int __pyx_module_is_main_breezy__bzr___chk_map_pyx;
+int __pyx_module_is_main_breezy__bzr___chk_map_pyx = 0;
+
+/* Implementation of 'breezy.bzr._chk_map_pyx' */
+static PyObject *__pyx_builtin_ValueError;
+static PyObject *__pyx_builtin_TypeError;
+static PyObject *__pyx_builtin_AssertionError;
+static const char __pyx_k_[] = "";
+static const char __pyx_k_d[] = "d";
+static const char __pyx_k_i[] = "i";
+static const char __pyx_k_j[] = "j";
+static const char __pyx_k_vs[] = " vs ";
+static const char __pyx_k__11[] = ")";
+static const char __pyx_k_cur[] = "cur";
+static const char __pyx_k_end[] = "end";
+static const char __pyx_k_key[] = "key";
+static const char __pyx_k_len[] = "_len";
+static const char __pyx_k_out[] = "out";
+static const char __pyx_k_pos[] = "pos";
+static const char __pyx_k_data[] = "data";
+static const char __pyx_k_main[] = "__main__";
+static const char __pyx_k_name[] = "__name__";
+static const char __pyx_k_next[] = "next";
+static const char __pyx_k_test[] = "__test__";
+static const char __pyx_k_zlib[] = "zlib";
+static const char __pyx_k_bytes[] = ", bytes ";
+static const char __pyx_k_c_out[] = "c_out";
+static const char __pyx_k_crc32[] = "crc32";
+static const char __pyx_k_entry[] = "entry";
+static const char __pyx_k_items[] = "_items";
+static const char __pyx_k_key_2[] = "_key";
+static const char __pyx_k_key_3[] = "key ";
+static const char __pyx_k_value[] = "value";
+static const char __pyx_k_width[] = "width";
+static const char __pyx_k_import[] = "__import__";
+static const char __pyx_k_intern[] = "intern";
+static const char __pyx_k_length[] = "length";
+static const char __pyx_k_prefix[] = "prefix";
+static const char __pyx_k_result[] = "result";
+static const char __pyx_k_c_bytes[] = "c_bytes";
+static const char __pyx_k_c_entry[] = "c_entry";
+static const char __pyx_k_chk_map[] = "chk_map";
+static const char __pyx_k_crc_val[] = "crc_val";
+static const char __pyx_k_cur_end[] = "cur_end";
+static const char __pyx_k_file_id[] = "file_id";
+static const char __pyx_k_items_2[] = "items";
+static const char __pyx_k_out_off[] = "out_off";
+static const char __pyx_k_unknown[] = "_unknown";
+static const char __pyx_k_LeafNode[] = "LeafNode";
+static const char __pyx_k_byte_end[] = "byte_end";
+static const char __pyx_k_byte_str[] = "byte_str";
+static const char __pyx_k_flat_key[] = "flat_key";
+static const char __pyx_k_num_bits[] = "num_bits";
+static const char __pyx_k_raw_size[] = "_raw_size";
+static const char __pyx_k_revision[] = "revision";
+static const char __pyx_k_TypeError[] = "TypeError";
+static const char __pyx_k_byte_size[] = "byte_size";
+static const char __pyx_k_key_width[] = "_key_width";
+static const char __pyx_k_last_null[] = "last_null";
+static const char __pyx_k_next_line[] = "next_line";
+static const char __pyx_k_next_null[] = "next_null";
+static const char __pyx_k_null_line[] = "null line\n";
+static const char __pyx_k_ValueError[] = "ValueError";
+static const char __pyx_k_entry_bits[] = "entry_bits";
+static const char __pyx_k_item_count[] = "item count (";
+static const char __pyx_k_line_start[] = "line_start";
+static const char __pyx_k_node_width[] = "_node_width";
+static const char __pyx_k_bad_no_null[] = "bad no null";
+static const char __pyx_k_c_bytes_len[] = "c_bytes_len";
+static const char __pyx_k_entry_start[] = "entry_start";
+static const char __pyx_k_file_id_len[] = "file_id_len";
+static const char __pyx_k_file_id_str[] = "file_id_str";
+static const char __pyx_k_item_prefix[] = "item_prefix";
+static const char __pyx_k_line_prefix[] = "line_prefix";
+static const char __pyx_k_prefix_bits[] = "prefix_bits";
+static const char __pyx_k_prefix_tail[] = "prefix_tail";
+static const char __pyx_k_value_start[] = "value_start";
+static const char __pyx_k_InternalNode[] = "InternalNode";
+static const char __pyx_k_current_size[] = "_current_size";
+static const char __pyx_k_items_length[] = "items_length";
+static const char __pyx_k_maximum_size[] = "_maximum_size";
+static const char __pyx_k_revision_str[] = "revision_str";
+static const char __pyx_k_c_item_prefix[] = "c_item_prefix";
+static const char __pyx_k_num_out_bytes[] = "num_out_bytes";
+static const char __pyx_k_prefix_length[] = "prefix_length";
+static const char __pyx_k_search_key_16[] = "_search_key_16";
+static const char __pyx_k_search_prefix[] = "_search_prefix";
+static const char __pyx_k_AssertionError[] = "AssertionError";
+static const char __pyx_k_Missing_s_line[] = "Missing %s line\n";
+static const char __pyx_k_maximum_size_2[] = "maximum_size";
+static const char __pyx_k_search_key_255[] = "_search_key_255";
+static const char __pyx_k_bad_no_null_bad[] = "bad no null, bad";
+static const char __pyx_k_num_prefix_bits[] = "num_prefix_bits";
+static const char __pyx_k_num_value_lines[] = "num_value_lines";
+static const char __pyx_k_prefix_tail_len[] = "prefix_tail_len";
+static const char __pyx_k_search_key_func[] = "search_key_func";
+static const char __pyx_k_mismatch_for_key[] = ") mismatch for key ";
+static const char __pyx_k_bytes_to_text_key[] = "_bytes_to_text_key";
+static const char __pyx_k_cline_in_traceback[] = "cline_in_traceback";
+static const char __pyx_k_expected_bytes_not[] = "expected bytes not ";
+static const char __pyx_k_is_not_a_StaticTuple[] = " is not a StaticTuple";
+static const char __pyx_k_No_kind_section_found[] = "No kind section found.";
+static const char __pyx_k_deserialise_leaf_node[] = "_deserialise_leaf_node";
+static const char __pyx_k_Missing_the_prefix_line[] = "Missing the prefix line\n";
+static const char __pyx_k_Too_many_bits_for_entry[] = "Too many bits for entry";
+static const char __pyx_k_breezy_bzr__chk_map_pyx[] = "breezy.bzr._chk_map_pyx";
+static const char __pyx_k_s_line_not_a_proper_int[] = "%s line not a proper int\n";
+static const char __pyx_k_common_serialised_prefix[] = "_common_serialised_prefix";
+static const char __pyx_k_missing_trailing_newline[] = "missing trailing newline";
+static const char __pyx_k_no_newline_after_file_id[] = "no newline after file-id";
+static const char __pyx_k_deserialise_internal_node[] = "_deserialise_internal_node";
+static const char __pyx_k_no_newline_after_name_str[] = "no newline after name str";
+static const char __pyx_k_breezy_bzr__chk_map_pyx_pyx[] = "breezy/bzr/_chk_map_pyx.pyx";
+static const char __pyx_k_no_newline_after_parent_str[] = "no newline after parent_str";
+static const char __pyx_k_Incorrect_number_of_elements[] = "Incorrect number of elements (";
+static const char __pyx_k_not_a_serialised_leaf_node_r[] = "not a serialised leaf node: %r";
+static const char __pyx_k_bytes_does_not_end_in_a_newline[] = "bytes does not end in a newline";
+static const char __pyx_k_current_size_computed_incorrect[] = "_current_size computed incorrectly %d != %d";
+static const char __pyx_k_Kind_section_should_end_with_got[] = "Kind section should end with \": \", got %r";
+static const char __pyx_k_Prefix_has_too_many_nulls_versus[] = "Prefix has too many nulls versus width";
+static const char __pyx_k_fail_to_find_the_num_value_lines[] = "fail to find the num value lines null";
+static const char __pyx_k_not_a_serialised_internal_node_r[] = "not a serialised internal node: %r";
+static const char __pyx_k_tried_to_create_a_string_with_an[] = "tried to create a string with an invalid size: %d";
+static PyObject *__pyx_n_s_;
+static PyObject *__pyx_n_s_AssertionError;
+static PyObject *__pyx_kp_u_Incorrect_number_of_elements;
+static PyObject *__pyx_n_s_InternalNode;
+static PyObject *__pyx_kp_u_Kind_section_should_end_with_got;
+static PyObject *__pyx_n_s_LeafNode;
+static PyObject *__pyx_kp_u_Missing_s_line;
+static PyObject *__pyx_kp_u_Missing_the_prefix_line;
+static PyObject *__pyx_kp_u_No_kind_section_found;
+static PyObject *__pyx_kp_u_Prefix_has_too_many_nulls_versus;
+static PyObject *__pyx_kp_u_Too_many_bits_for_entry;
+static PyObject *__pyx_n_s_TypeError;
+static PyObject *__pyx_n_s_ValueError;
+static PyObject *__pyx_kp_u__11;
+static PyObject *__pyx_kp_u_bad_no_null;
+static PyObject *__pyx_kp_u_bad_no_null_bad;
+static PyObject *__pyx_n_s_breezy_bzr__chk_map_pyx;
+static PyObject *__pyx_kp_s_breezy_bzr__chk_map_pyx_pyx;
+static PyObject *__pyx_n_s_byte_end;
+static PyObject *__pyx_n_s_byte_size;
+static PyObject *__pyx_n_s_byte_str;
+static PyObject *__pyx_kp_u_bytes;
+static PyObject *__pyx_kp_u_bytes_does_not_end_in_a_newline;
+static PyObject *__pyx_n_s_bytes_to_text_key;
+static PyObject *__pyx_n_s_c_bytes;
+static PyObject *__pyx_n_s_c_bytes_len;
+static PyObject *__pyx_n_s_c_entry;
+static PyObject *__pyx_n_s_c_item_prefix;
+static PyObject *__pyx_n_s_c_out;
+static PyObject *__pyx_n_s_chk_map;
+static PyObject *__pyx_n_s_cline_in_traceback;
+static PyObject *__pyx_n_s_common_serialised_prefix;
+static PyObject *__pyx_n_s_crc32;
+static PyObject *__pyx_n_s_crc_val;
+static PyObject *__pyx_n_s_cur;
+static PyObject *__pyx_n_s_cur_end;
+static PyObject *__pyx_n_s_current_size;
+static PyObject *__pyx_kp_u_current_size_computed_incorrect;
+static PyObject *__pyx_n_u_d;
+static PyObject *__pyx_n_s_data;
+static PyObject *__pyx_n_s_deserialise_internal_node;
+static PyObject *__pyx_n_s_deserialise_leaf_node;
+static PyObject *__pyx_n_s_end;
+static PyObject *__pyx_n_s_entry;
+static PyObject *__pyx_n_s_entry_bits;
+static PyObject *__pyx_n_s_entry_start;
+static PyObject *__pyx_kp_u_expected_bytes_not;
+static PyObject *__pyx_kp_u_fail_to_find_the_num_value_lines;
+static PyObject *__pyx_n_s_file_id;
+static PyObject *__pyx_n_s_file_id_len;
+static PyObject *__pyx_n_s_file_id_str;
+static PyObject *__pyx_n_s_flat_key;
+static PyObject *__pyx_n_s_i;
+static PyObject *__pyx_n_s_import;
+static PyObject *__pyx_n_s_intern;
+static PyObject *__pyx_kp_u_is_not_a_StaticTuple;
+static PyObject *__pyx_kp_u_item_count;
+static PyObject *__pyx_n_s_item_prefix;
+static PyObject *__pyx_n_s_items;
+static PyObject *__pyx_n_s_items_2;
+static PyObject *__pyx_n_s_items_length;
+static PyObject *__pyx_n_s_j;
+static PyObject *__pyx_n_s_key;
+static PyObject *__pyx_n_s_key_2;
+static PyObject *__pyx_kp_u_key_3;
+static PyObject *__pyx_n_s_key_width;
+static PyObject *__pyx_n_s_last_null;
+static PyObject *__pyx_n_s_len;
+static PyObject *__pyx_n_s_length;
+static PyObject *__pyx_n_s_line_prefix;
+static PyObject *__pyx_n_s_line_start;
+static PyObject *__pyx_n_s_main;
+static PyObject *__pyx_n_s_maximum_size;
+static PyObject *__pyx_n_s_maximum_size_2;
+static PyObject *__pyx_kp_u_mismatch_for_key;
+static PyObject *__pyx_kp_u_missing_trailing_newline;
+static PyObject *__pyx_n_s_name;
+static PyObject *__pyx_n_s_next;
+static PyObject *__pyx_n_s_next_line;
+static PyObject *__pyx_n_s_next_null;
+static PyObject *__pyx_kp_u_no_newline_after_file_id;
+static PyObject *__pyx_kp_u_no_newline_after_name_str;
+static PyObject *__pyx_kp_u_no_newline_after_parent_str;
+static PyObject *__pyx_n_s_node_width;
+static PyObject *__pyx_kp_u_not_a_serialised_internal_node_r;
+static PyObject *__pyx_kp_u_not_a_serialised_leaf_node_r;
+static PyObject *__pyx_kp_u_null_line;
+static PyObject *__pyx_n_s_num_bits;
+static PyObject *__pyx_n_s_num_out_bytes;
+static PyObject *__pyx_n_s_num_prefix_bits;
+static PyObject *__pyx_n_s_num_value_lines;
+static PyObject *__pyx_n_s_out;
+static PyObject *__pyx_n_s_out_off;
+static PyObject *__pyx_n_s_pos;
+static PyObject *__pyx_n_s_prefix;
+static PyObject *__pyx_n_s_prefix_bits;
+static PyObject *__pyx_n_s_prefix_length;
+static PyObject *__pyx_n_s_prefix_tail;
+static PyObject *__pyx_n_s_prefix_tail_len;
+static PyObject *__pyx_n_s_raw_size;
+static PyObject *__pyx_n_s_result;
+static PyObject *__pyx_n_s_revision;
+static PyObject *__pyx_n_s_revision_str;
+static PyObject *__pyx_kp_u_s_line_not_a_proper_int;
+static PyObject *__pyx_n_s_search_key_16;
+static PyObject *__pyx_n_s_search_key_255;
+static PyObject *__pyx_n_s_search_key_func;
+static PyObject *__pyx_n_s_search_prefix;
+static PyObject *__pyx_n_s_test;
+static PyObject *__pyx_kp_u_tried_to_create_a_string_with_an;
+static PyObject *__pyx_n_s_unknown;
+static PyObject *__pyx_n_s_value;
+static PyObject *__pyx_n_s_value_start;
+static PyObject *__pyx_kp_u_vs;
+static PyObject *__pyx_n_s_width;
+static PyObject *__pyx_n_s_zlib;
+static PyObject *__pyx_pf_6breezy_3bzr_12_chk_map_pyx__search_key_16(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_key); /* proto */
+static PyObject *__pyx_pf_6breezy_3bzr_12_chk_map_pyx_2_search_key_255(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_key); /* proto */
+static PyObject *__pyx_pf_6breezy_3bzr_12_chk_map_pyx_4_deserialise_leaf_node(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_data, PyObject *__pyx_v_key, PyObject *__pyx_v_search_key_func); /* proto */
+static PyObject *__pyx_pf_6breezy_3bzr_12_chk_map_pyx_6_deserialise_internal_node(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_data, PyObject *__pyx_v_key, PyObject *__pyx_v_search_key_func); /* proto */
+static PyObject *__pyx_pf_6breezy_3bzr_12_chk_map_pyx_8_bytes_to_text_key(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_data); /* proto */
+static PyObject *__pyx_tuple__2;
+static PyObject *__pyx_tuple__3;
+static PyObject *__pyx_tuple__4;
+static PyObject *__pyx_tuple__5;
+static PyObject *__pyx_tuple__6;
+static PyObject *__pyx_tuple__7;
+static PyObject *__pyx_tuple__8;
+static PyObject *__pyx_tuple__9;
+static PyObject *__pyx_tuple__10;
+static PyObject *__pyx_tuple__12;
+static PyObject *__pyx_tuple__13;
+static PyObject *__pyx_tuple__14;
+static PyObject *__pyx_tuple__15;
+static PyObject *__pyx_tuple__16;
+static PyObject *__pyx_tuple__18;
+static PyObject *__pyx_tuple__20;
+static PyObject *__pyx_tuple__22;
+static PyObject *__pyx_tuple__24;
+static PyObject *__pyx_codeobj__17;
+static PyObject *__pyx_codeobj__19;
+static PyObject *__pyx_codeobj__21;
+static PyObject *__pyx_codeobj__23;
+static PyObject *__pyx_codeobj__25;
+/* Late includes */
+
+/* "breezy/bzr/_chk_map_pyx.pyx":87
+ * 
+ * 
+ * def _search_key_16(key):             # <<<<<<<<<<<<<<
+ *     """See chk_map._search_key_16."""
+ *     cdef Py_ssize_t num_bits
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_6breezy_3bzr_12_chk_map_pyx_1_search_key_16(PyObject *__pyx_self, PyObject *__pyx_v_key); /*proto*/
+static char __pyx_doc_6breezy_3bzr_12_chk_map_pyx__search_key_16[] = "See chk_map._search_key_16.";
+static PyMethodDef __pyx_mdef_6breezy_3bzr_12_chk_map_pyx_1_search_key_16 = {"_search_key_16", (PyCFunction)__pyx_pw_6breezy_3bzr_12_chk_map_pyx_1_search_key_16, METH_O, __pyx_doc_6breezy_3bzr_12_chk_map_pyx__search_key_16};
+static PyObject *__pyx_pw_6breezy_3bzr_12_chk_map_pyx_1_search_key_16(PyObject *__pyx_self, PyObject *__pyx_v_key) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("_search_key_16 (wrapper)", 0);
+  __pyx_r = __pyx_pf_6breezy_3bzr_12_chk_map_pyx__search_key_16(__pyx_self, ((PyObject *)__pyx_v_key));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_6breezy_3bzr_12_chk_map_pyx__search_key_16(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_key) {
+  Py_ssize_t __pyx_v_num_bits;
+  Py_ssize_t __pyx_v_i;
+  Py_ssize_t __pyx_v_num_out_bytes;
+  unsigned long __pyx_v_crc_val;
+  char *__pyx_v_c_out;
+  PyObject *__pyx_v_out = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  Py_ssize_t __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  unsigned long __pyx_t_7;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("_search_key_16", 0);
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":96
+ *     cdef char *c_out
+ * 
+ *     num_bits = len(key)             # <<<<<<<<<<<<<<
+ *     # 4 bytes per crc32, and another 1 byte between bits
+ *     num_out_bytes = (9 * num_bits) - 1
+ */
+  __pyx_t_1 = PyObject_Length(__pyx_v_key); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 96, __pyx_L1_error)
+  __pyx_v_num_bits = __pyx_t_1;
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":98
+ *     num_bits = len(key)
+ *     # 4 bytes per crc32, and another 1 byte between bits
+ *     num_out_bytes = (9 * num_bits) - 1             # <<<<<<<<<<<<<<
+ *     out = PyBytes_FromStringAndSize(NULL, num_out_bytes)
+ *     c_out = PyBytes_AS_STRING(out)
+ */
+  __pyx_v_num_out_bytes = ((9 * __pyx_v_num_bits) - 1);
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":99
+ *     # 4 bytes per crc32, and another 1 byte between bits
+ *     num_out_bytes = (9 * num_bits) - 1
+ *     out = PyBytes_FromStringAndSize(NULL, num_out_bytes)             # <<<<<<<<<<<<<<
+ *     c_out = PyBytes_AS_STRING(out)
+ *     for i from 0 <= i < num_bits:
+ */
+  __pyx_t_2 = PyBytes_FromStringAndSize(NULL, __pyx_v_num_out_bytes); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 99, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_v_out = ((PyObject*)__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":100
+ *     num_out_bytes = (9 * num_bits) - 1
+ *     out = PyBytes_FromStringAndSize(NULL, num_out_bytes)
+ *     c_out = PyBytes_AS_STRING(out)             # <<<<<<<<<<<<<<
+ *     for i from 0 <= i < num_bits:
+ *         if i > 0:
+ */
+  __pyx_v_c_out = PyBytes_AS_STRING(__pyx_v_out);
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":101
+ *     out = PyBytes_FromStringAndSize(NULL, num_out_bytes)
+ *     c_out = PyBytes_AS_STRING(out)
+ *     for i from 0 <= i < num_bits:             # <<<<<<<<<<<<<<
+ *         if i > 0:
+ *             c_out[0] = c'\x00'
+ */
+  __pyx_t_1 = __pyx_v_num_bits;
+  for (__pyx_v_i = 0; __pyx_v_i < __pyx_t_1; __pyx_v_i++) {
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":102
+ *     c_out = PyBytes_AS_STRING(out)
+ *     for i from 0 <= i < num_bits:
+ *         if i > 0:             # <<<<<<<<<<<<<<
+ *             c_out[0] = c'\x00'
+ *             c_out = c_out + 1
+ */
+    __pyx_t_3 = ((__pyx_v_i > 0) != 0);
+    if (__pyx_t_3) {
+
+      /* "breezy/bzr/_chk_map_pyx.pyx":103
+ *     for i from 0 <= i < num_bits:
+ *         if i > 0:
+ *             c_out[0] = c'\x00'             # <<<<<<<<<<<<<<
+ *             c_out = c_out + 1
+ *         crc_val = PyInt_AsUnsignedLongMask(crc32(key[i])) & 0xFFFFFFFFUL
+ */
+      (__pyx_v_c_out[0]) = '\x00';
+
+      /* "breezy/bzr/_chk_map_pyx.pyx":104
+ *         if i > 0:
+ *             c_out[0] = c'\x00'
+ *             c_out = c_out + 1             # <<<<<<<<<<<<<<
+ *         crc_val = PyInt_AsUnsignedLongMask(crc32(key[i])) & 0xFFFFFFFFUL
+ *         # Hex(val) order
+ */
+      __pyx_v_c_out = (__pyx_v_c_out + 1);
+
+      /* "breezy/bzr/_chk_map_pyx.pyx":102
+ *     c_out = PyBytes_AS_STRING(out)
+ *     for i from 0 <= i < num_bits:
+ *         if i > 0:             # <<<<<<<<<<<<<<
+ *             c_out[0] = c'\x00'
+ *             c_out = c_out + 1
+ */
+    }
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":105
+ *             c_out[0] = c'\x00'
+ *             c_out = c_out + 1
+ *         crc_val = PyInt_AsUnsignedLongMask(crc32(key[i])) & 0xFFFFFFFFUL             # <<<<<<<<<<<<<<
+ *         # Hex(val) order
+ *         sprintf(c_out, '%08lX', crc_val)
+ */
+    __pyx_t_4 = __Pyx_GetItemInt(__pyx_v_key, __pyx_v_i, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 1, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 105, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_INCREF(__pyx_v_6breezy_3bzr_12_chk_map_pyx_crc32);
+    __pyx_t_5 = __pyx_v_6breezy_3bzr_12_chk_map_pyx_crc32; __pyx_t_6 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_5))) {
+      __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_5);
+      if (likely(__pyx_t_6)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+        __Pyx_INCREF(__pyx_t_6);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_5, function);
+      }
+    }
+    __pyx_t_2 = (__pyx_t_6) ? __Pyx_PyObject_Call2Args(__pyx_t_5, __pyx_t_6, __pyx_t_4) : __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_4);
+    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 105, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_t_7 = PyInt_AsUnsignedLongMask(__pyx_t_2); if (unlikely(__pyx_t_7 == ((unsigned long)-1L) && PyErr_Occurred())) __PYX_ERR(0, 105, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_v_crc_val = (__pyx_t_7 & 0xFFFFFFFFUL);
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":107
+ *         crc_val = PyInt_AsUnsignedLongMask(crc32(key[i])) & 0xFFFFFFFFUL
+ *         # Hex(val) order
+ *         sprintf(c_out, '%08lX', crc_val)             # <<<<<<<<<<<<<<
+ *         c_out = c_out + 8
+ *     return out
+ */
+    (void)(sprintf(__pyx_v_c_out, ((char const *)"%08lX"), __pyx_v_crc_val));
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":108
+ *         # Hex(val) order
+ *         sprintf(c_out, '%08lX', crc_val)
+ *         c_out = c_out + 8             # <<<<<<<<<<<<<<
+ *     return out
+ * 
+ */
+    __pyx_v_c_out = (__pyx_v_c_out + 8);
+  }
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":109
+ *         sprintf(c_out, '%08lX', crc_val)
+ *         c_out = c_out + 8
+ *     return out             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_out);
+  __pyx_r = __pyx_v_out;
+  goto __pyx_L0;
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":87
+ * 
+ * 
+ * def _search_key_16(key):             # <<<<<<<<<<<<<<
+ *     """See chk_map._search_key_16."""
+ *     cdef Py_ssize_t num_bits
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("breezy.bzr._chk_map_pyx._search_key_16", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_out);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "breezy/bzr/_chk_map_pyx.pyx":112
+ * 
+ * 
+ * def _search_key_255(key):             # <<<<<<<<<<<<<<
+ *     """See chk_map._search_key_255."""
+ *     cdef Py_ssize_t num_bits
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_6breezy_3bzr_12_chk_map_pyx_3_search_key_255(PyObject *__pyx_self, PyObject *__pyx_v_key); /*proto*/
+static char __pyx_doc_6breezy_3bzr_12_chk_map_pyx_2_search_key_255[] = "See chk_map._search_key_255.";
+static PyMethodDef __pyx_mdef_6breezy_3bzr_12_chk_map_pyx_3_search_key_255 = {"_search_key_255", (PyCFunction)__pyx_pw_6breezy_3bzr_12_chk_map_pyx_3_search_key_255, METH_O, __pyx_doc_6breezy_3bzr_12_chk_map_pyx_2_search_key_255};
+static PyObject *__pyx_pw_6breezy_3bzr_12_chk_map_pyx_3_search_key_255(PyObject *__pyx_self, PyObject *__pyx_v_key) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("_search_key_255 (wrapper)", 0);
+  __pyx_r = __pyx_pf_6breezy_3bzr_12_chk_map_pyx_2_search_key_255(__pyx_self, ((PyObject *)__pyx_v_key));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_6breezy_3bzr_12_chk_map_pyx_2_search_key_255(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_key) {
+  Py_ssize_t __pyx_v_num_bits;
+  Py_ssize_t __pyx_v_i;
+  Py_ssize_t __pyx_v_j;
+  Py_ssize_t __pyx_v_num_out_bytes;
+  unsigned long __pyx_v_crc_val;
+  char *__pyx_v_c_out;
+  PyObject *__pyx_v_out = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  Py_ssize_t __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  unsigned long __pyx_t_7;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("_search_key_255", 0);
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":121
+ *     cdef char *c_out
+ * 
+ *     num_bits = len(key)             # <<<<<<<<<<<<<<
+ *     # 4 bytes per crc32, and another 1 byte between bits
+ *     num_out_bytes = (5 * num_bits) - 1
+ */
+  __pyx_t_1 = PyObject_Length(__pyx_v_key); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 121, __pyx_L1_error)
+  __pyx_v_num_bits = __pyx_t_1;
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":123
+ *     num_bits = len(key)
+ *     # 4 bytes per crc32, and another 1 byte between bits
+ *     num_out_bytes = (5 * num_bits) - 1             # <<<<<<<<<<<<<<
+ *     out = PyBytes_FromStringAndSize(NULL, num_out_bytes)
+ *     c_out = PyBytes_AS_STRING(out)
+ */
+  __pyx_v_num_out_bytes = ((5 * __pyx_v_num_bits) - 1);
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":124
+ *     # 4 bytes per crc32, and another 1 byte between bits
+ *     num_out_bytes = (5 * num_bits) - 1
+ *     out = PyBytes_FromStringAndSize(NULL, num_out_bytes)             # <<<<<<<<<<<<<<
+ *     c_out = PyBytes_AS_STRING(out)
+ *     for i from 0 <= i < num_bits:
+ */
+  __pyx_t_2 = PyBytes_FromStringAndSize(NULL, __pyx_v_num_out_bytes); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 124, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_v_out = ((PyObject*)__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":125
+ *     num_out_bytes = (5 * num_bits) - 1
+ *     out = PyBytes_FromStringAndSize(NULL, num_out_bytes)
+ *     c_out = PyBytes_AS_STRING(out)             # <<<<<<<<<<<<<<
+ *     for i from 0 <= i < num_bits:
+ *         if i > 0:
+ */
+  __pyx_v_c_out = PyBytes_AS_STRING(__pyx_v_out);
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":126
+ *     out = PyBytes_FromStringAndSize(NULL, num_out_bytes)
+ *     c_out = PyBytes_AS_STRING(out)
+ *     for i from 0 <= i < num_bits:             # <<<<<<<<<<<<<<
+ *         if i > 0:
+ *             c_out[0] = c'\x00'
+ */
+  __pyx_t_1 = __pyx_v_num_bits;
+  for (__pyx_v_i = 0; __pyx_v_i < __pyx_t_1; __pyx_v_i++) {
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":127
+ *     c_out = PyBytes_AS_STRING(out)
+ *     for i from 0 <= i < num_bits:
+ *         if i > 0:             # <<<<<<<<<<<<<<
+ *             c_out[0] = c'\x00'
+ *             c_out = c_out + 1
+ */
+    __pyx_t_3 = ((__pyx_v_i > 0) != 0);
+    if (__pyx_t_3) {
+
+      /* "breezy/bzr/_chk_map_pyx.pyx":128
+ *     for i from 0 <= i < num_bits:
+ *         if i > 0:
+ *             c_out[0] = c'\x00'             # <<<<<<<<<<<<<<
+ *             c_out = c_out + 1
+ *         crc_val = PyInt_AsUnsignedLongMask(crc32(key[i]))
+ */
+      (__pyx_v_c_out[0]) = '\x00';
+
+      /* "breezy/bzr/_chk_map_pyx.pyx":129
+ *         if i > 0:
+ *             c_out[0] = c'\x00'
+ *             c_out = c_out + 1             # <<<<<<<<<<<<<<
+ *         crc_val = PyInt_AsUnsignedLongMask(crc32(key[i]))
+ *         # MSB order
+ */
+      __pyx_v_c_out = (__pyx_v_c_out + 1);
+
+      /* "breezy/bzr/_chk_map_pyx.pyx":127
+ *     c_out = PyBytes_AS_STRING(out)
+ *     for i from 0 <= i < num_bits:
+ *         if i > 0:             # <<<<<<<<<<<<<<
+ *             c_out[0] = c'\x00'
+ *             c_out = c_out + 1
+ */
+    }
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":130
+ *             c_out[0] = c'\x00'
+ *             c_out = c_out + 1
+ *         crc_val = PyInt_AsUnsignedLongMask(crc32(key[i]))             # <<<<<<<<<<<<<<
+ *         # MSB order
+ *         c_out[0] = (crc_val >> 24) & 0xFF
+ */
+    __pyx_t_4 = __Pyx_GetItemInt(__pyx_v_key, __pyx_v_i, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 1, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 130, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_INCREF(__pyx_v_6breezy_3bzr_12_chk_map_pyx_crc32);
+    __pyx_t_5 = __pyx_v_6breezy_3bzr_12_chk_map_pyx_crc32; __pyx_t_6 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_5))) {
+      __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_5);
+      if (likely(__pyx_t_6)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+        __Pyx_INCREF(__pyx_t_6);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_5, function);
+      }
+    }
+    __pyx_t_2 = (__pyx_t_6) ? __Pyx_PyObject_Call2Args(__pyx_t_5, __pyx_t_6, __pyx_t_4) : __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_4);
+    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 130, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_t_7 = PyInt_AsUnsignedLongMask(__pyx_t_2); if (unlikely(__pyx_t_7 == ((unsigned long)-1L) && PyErr_Occurred())) __PYX_ERR(0, 130, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_v_crc_val = __pyx_t_7;
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":132
+ *         crc_val = PyInt_AsUnsignedLongMask(crc32(key[i]))
+ *         # MSB order
+ *         c_out[0] = (crc_val >> 24) & 0xFF             # <<<<<<<<<<<<<<
+ *         c_out[1] = (crc_val >> 16) & 0xFF
+ *         c_out[2] = (crc_val >> 8) & 0xFF
+ */
+    (__pyx_v_c_out[0]) = ((__pyx_v_crc_val >> 24) & 0xFF);
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":133
+ *         # MSB order
+ *         c_out[0] = (crc_val >> 24) & 0xFF
+ *         c_out[1] = (crc_val >> 16) & 0xFF             # <<<<<<<<<<<<<<
+ *         c_out[2] = (crc_val >> 8) & 0xFF
+ *         c_out[3] = (crc_val >> 0) & 0xFF
+ */
+    (__pyx_v_c_out[1]) = ((__pyx_v_crc_val >> 16) & 0xFF);
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":134
+ *         c_out[0] = (crc_val >> 24) & 0xFF
+ *         c_out[1] = (crc_val >> 16) & 0xFF
+ *         c_out[2] = (crc_val >> 8) & 0xFF             # <<<<<<<<<<<<<<
+ *         c_out[3] = (crc_val >> 0) & 0xFF
+ *         for j from 0 <= j < 4:
+ */
+    (__pyx_v_c_out[2]) = ((__pyx_v_crc_val >> 8) & 0xFF);
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":135
+ *         c_out[1] = (crc_val >> 16) & 0xFF
+ *         c_out[2] = (crc_val >> 8) & 0xFF
+ *         c_out[3] = (crc_val >> 0) & 0xFF             # <<<<<<<<<<<<<<
+ *         for j from 0 <= j < 4:
+ *             if c_out[j] == c'\n':
+ */
+    (__pyx_v_c_out[3]) = ((__pyx_v_crc_val >> 0) & 0xFF);
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":136
+ *         c_out[2] = (crc_val >> 8) & 0xFF
+ *         c_out[3] = (crc_val >> 0) & 0xFF
+ *         for j from 0 <= j < 4:             # <<<<<<<<<<<<<<
+ *             if c_out[j] == c'\n':
+ *                 c_out[j] = c'_'
+ */
+    for (__pyx_v_j = 0; __pyx_v_j < 4; __pyx_v_j++) {
+
+      /* "breezy/bzr/_chk_map_pyx.pyx":137
+ *         c_out[3] = (crc_val >> 0) & 0xFF
+ *         for j from 0 <= j < 4:
+ *             if c_out[j] == c'\n':             # <<<<<<<<<<<<<<
+ *                 c_out[j] = c'_'
+ *         c_out = c_out + 4
+ */
+      __pyx_t_3 = (((__pyx_v_c_out[__pyx_v_j]) == '\n') != 0);
+      if (__pyx_t_3) {
+
+        /* "breezy/bzr/_chk_map_pyx.pyx":138
+ *         for j from 0 <= j < 4:
+ *             if c_out[j] == c'\n':
+ *                 c_out[j] = c'_'             # <<<<<<<<<<<<<<
+ *         c_out = c_out + 4
+ *     return out
+ */
+        (__pyx_v_c_out[__pyx_v_j]) = '_';
+
+        /* "breezy/bzr/_chk_map_pyx.pyx":137
+ *         c_out[3] = (crc_val >> 0) & 0xFF
+ *         for j from 0 <= j < 4:
+ *             if c_out[j] == c'\n':             # <<<<<<<<<<<<<<
+ *                 c_out[j] = c'_'
+ *         c_out = c_out + 4
+ */
+      }
+    }
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":139
+ *             if c_out[j] == c'\n':
+ *                 c_out[j] = c'_'
+ *         c_out = c_out + 4             # <<<<<<<<<<<<<<
+ *     return out
+ * 
+ */
+    __pyx_v_c_out = (__pyx_v_c_out + 4);
+  }
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":140
+ *                 c_out[j] = c'_'
+ *         c_out = c_out + 4
+ *     return out             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_out);
+  __pyx_r = __pyx_v_out;
+  goto __pyx_L0;
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":112
+ * 
+ * 
+ * def _search_key_255(key):             # <<<<<<<<<<<<<<
+ *     """See chk_map._search_key_255."""
+ *     cdef Py_ssize_t num_bits
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("breezy.bzr._chk_map_pyx._search_key_255", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_out);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "breezy/bzr/_chk_map_pyx.pyx":143
+ * 
+ * 
+ * cdef int _get_int_from_line(char **cur, char *end, char *message) except -1:             # <<<<<<<<<<<<<<
+ *     """Read a positive integer from the data stream.
+ * 
+ */
+
+static int __pyx_f_6breezy_3bzr_12_chk_map_pyx__get_int_from_line(char **__pyx_v_cur, char *__pyx_v_end, char *__pyx_v_message) {
+  int __pyx_v_value;
+  char *__pyx_v_next_line;
+  char *__pyx_v_next_int;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("_get_int_from_line", 0);
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":155
+ *     cdef char *next_int
+ * 
+ *     next_line = <char *>memchr(cur[0], c'\n', end - cur[0])             # <<<<<<<<<<<<<<
+ *     if next_line == NULL:
+ *         raise ValueError("Missing %s line\n" % message)
+ */
+  __pyx_v_next_line = ((char *)memchr((__pyx_v_cur[0]), '\n', (__pyx_v_end - (__pyx_v_cur[0]))));
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":156
+ * 
+ *     next_line = <char *>memchr(cur[0], c'\n', end - cur[0])
+ *     if next_line == NULL:             # <<<<<<<<<<<<<<
+ *         raise ValueError("Missing %s line\n" % message)
+ * 
+ */
+  __pyx_t_1 = ((__pyx_v_next_line == NULL) != 0);
+  if (unlikely(__pyx_t_1)) {
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":157
+ *     next_line = <char *>memchr(cur[0], c'\n', end - cur[0])
+ *     if next_line == NULL:
+ *         raise ValueError("Missing %s line\n" % message)             # <<<<<<<<<<<<<<
+ * 
+ *     value = strtol(cur[0], &next_int, 10)
+ */
+    __pyx_t_2 = __Pyx_PyBytes_FromString(__pyx_v_message); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 157, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = PyUnicode_Format(__pyx_kp_u_Missing_s_line, __pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 157, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_builtin_ValueError, __pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 157, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __PYX_ERR(0, 157, __pyx_L1_error)
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":156
+ * 
+ *     next_line = <char *>memchr(cur[0], c'\n', end - cur[0])
+ *     if next_line == NULL:             # <<<<<<<<<<<<<<
+ *         raise ValueError("Missing %s line\n" % message)
+ * 
+ */
+  }
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":159
+ *         raise ValueError("Missing %s line\n" % message)
+ * 
+ *     value = strtol(cur[0], &next_int, 10)             # <<<<<<<<<<<<<<
+ *     if next_int != next_line:
+ *         raise ValueError("%s line not a proper int\n" % message)
+ */
+  __pyx_v_value = strtol((__pyx_v_cur[0]), (&__pyx_v_next_int), 10);
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":160
+ * 
+ *     value = strtol(cur[0], &next_int, 10)
+ *     if next_int != next_line:             # <<<<<<<<<<<<<<
+ *         raise ValueError("%s line not a proper int\n" % message)
+ *     cur[0] = next_line + 1
+ */
+  __pyx_t_1 = ((__pyx_v_next_int != __pyx_v_next_line) != 0);
+  if (unlikely(__pyx_t_1)) {
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":161
+ *     value = strtol(cur[0], &next_int, 10)
+ *     if next_int != next_line:
+ *         raise ValueError("%s line not a proper int\n" % message)             # <<<<<<<<<<<<<<
+ *     cur[0] = next_line + 1
+ *     return value
+ */
+    __pyx_t_2 = __Pyx_PyBytes_FromString(__pyx_v_message); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 161, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = PyUnicode_Format(__pyx_kp_u_s_line_not_a_proper_int, __pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 161, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_builtin_ValueError, __pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 161, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __PYX_ERR(0, 161, __pyx_L1_error)
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":160
+ * 
+ *     value = strtol(cur[0], &next_int, 10)
+ *     if next_int != next_line:             # <<<<<<<<<<<<<<
+ *         raise ValueError("%s line not a proper int\n" % message)
+ *     cur[0] = next_line + 1
+ */
+  }
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":162
+ *     if next_int != next_line:
+ *         raise ValueError("%s line not a proper int\n" % message)
+ *     cur[0] = next_line + 1             # <<<<<<<<<<<<<<
+ *     return value
+ * 
+ */
+  (__pyx_v_cur[0]) = (__pyx_v_next_line + 1);
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":163
+ *         raise ValueError("%s line not a proper int\n" % message)
+ *     cur[0] = next_line + 1
+ *     return value             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = __pyx_v_value;
+  goto __pyx_L0;
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":143
+ * 
+ * 
+ * cdef int _get_int_from_line(char **cur, char *end, char *message) except -1:             # <<<<<<<<<<<<<<
+ *     """Read a positive integer from the data stream.
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("breezy.bzr._chk_map_pyx._get_int_from_line", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "breezy/bzr/_chk_map_pyx.pyx":166
+ * 
+ * 
+ * cdef _import_globals():             # <<<<<<<<<<<<<<
+ *     """Set the global attributes. Done lazy to avoid recursive import loops."""
+ *     global _LeafNode, _InternalNode, _unknown
+ */
+
+static PyObject *__pyx_f_6breezy_3bzr_12_chk_map_pyx__import_globals(void) {
+  PyObject *__pyx_v_chk_map = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("_import_globals", 0);
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":170
+ *     global _LeafNode, _InternalNode, _unknown
+ * 
+ *     from . import chk_map             # <<<<<<<<<<<<<<
+ *     _LeafNode = chk_map.LeafNode
+ *     _InternalNode = chk_map.InternalNode
+ */
+  __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 170, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_n_s_chk_map);
+  __Pyx_GIVEREF(__pyx_n_s_chk_map);
+  PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_chk_map);
+  __pyx_t_2 = __Pyx_Import(__pyx_n_s_, __pyx_t_1, 1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 170, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_chk_map); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 170, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_t_1);
+  __pyx_v_chk_map = __pyx_t_1;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":171
+ * 
+ *     from . import chk_map
+ *     _LeafNode = chk_map.LeafNode             # <<<<<<<<<<<<<<
+ *     _InternalNode = chk_map.InternalNode
+ *     _unknown = chk_map._unknown
+ */
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_chk_map, __pyx_n_s_LeafNode); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 171, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_XGOTREF(__pyx_v_6breezy_3bzr_12_chk_map_pyx__LeafNode);
+  __Pyx_DECREF_SET(__pyx_v_6breezy_3bzr_12_chk_map_pyx__LeafNode, __pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":172
+ *     from . import chk_map
+ *     _LeafNode = chk_map.LeafNode
+ *     _InternalNode = chk_map.InternalNode             # <<<<<<<<<<<<<<
+ *     _unknown = chk_map._unknown
+ * 
+ */
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_chk_map, __pyx_n_s_InternalNode); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 172, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_XGOTREF(__pyx_v_6breezy_3bzr_12_chk_map_pyx__InternalNode);
+  __Pyx_DECREF_SET(__pyx_v_6breezy_3bzr_12_chk_map_pyx__InternalNode, __pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":173
+ *     _LeafNode = chk_map.LeafNode
+ *     _InternalNode = chk_map.InternalNode
+ *     _unknown = chk_map._unknown             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_chk_map, __pyx_n_s_unknown); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 173, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_XGOTREF(__pyx_v_6breezy_3bzr_12_chk_map_pyx__unknown);
+  __Pyx_DECREF_SET(__pyx_v_6breezy_3bzr_12_chk_map_pyx__unknown, __pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":166
+ * 
+ * 
+ * cdef _import_globals():             # <<<<<<<<<<<<<<
+ *     """Set the global attributes. Done lazy to avoid recursive import loops."""
+ *     global _LeafNode, _InternalNode, _unknown
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("breezy.bzr._chk_map_pyx._import_globals", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_chk_map);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "breezy/bzr/_chk_map_pyx.pyx":176
+ * 
+ * 
+ * def _deserialise_leaf_node(data, key, search_key_func=None):             # <<<<<<<<<<<<<<
+ *     """Deserialise bytes, with key key, into a LeafNode.
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_6breezy_3bzr_12_chk_map_pyx_5_deserialise_leaf_node(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_6breezy_3bzr_12_chk_map_pyx_4_deserialise_leaf_node[] = "Deserialise bytes, with key key, into a LeafNode.\n\n    :param bytes: The bytes of the node.\n    :param key: The key that the serialised node has.\n    ";
+static PyMethodDef __pyx_mdef_6breezy_3bzr_12_chk_map_pyx_5_deserialise_leaf_node = {"_deserialise_leaf_node", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_6breezy_3bzr_12_chk_map_pyx_5_deserialise_leaf_node, METH_VARARGS|METH_KEYWORDS, __pyx_doc_6breezy_3bzr_12_chk_map_pyx_4_deserialise_leaf_node};
+static PyObject *__pyx_pw_6breezy_3bzr_12_chk_map_pyx_5_deserialise_leaf_node(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_data = 0;
+  PyObject *__pyx_v_key = 0;
+  PyObject *__pyx_v_search_key_func = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("_deserialise_leaf_node (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_data,&__pyx_n_s_key,&__pyx_n_s_search_key_func,0};
+    PyObject* values[3] = {0,0,0};
+    values[2] = ((PyObject *)Py_None);
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_data)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_key)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("_deserialise_leaf_node", 0, 2, 3, 1); __PYX_ERR(0, 176, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_search_key_func);
+          if (value) { values[2] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "_deserialise_leaf_node") < 0)) __PYX_ERR(0, 176, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_data = values[0];
+    __pyx_v_key = values[1];
+    __pyx_v_search_key_func = values[2];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("_deserialise_leaf_node", 0, 2, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 176, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("breezy.bzr._chk_map_pyx._deserialise_leaf_node", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_6breezy_3bzr_12_chk_map_pyx_4_deserialise_leaf_node(__pyx_self, __pyx_v_data, __pyx_v_key, __pyx_v_search_key_func);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_6breezy_3bzr_12_chk_map_pyx_4_deserialise_leaf_node(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_data, PyObject *__pyx_v_key, PyObject *__pyx_v_search_key_func) {
+  char *__pyx_v_c_bytes;
+  char *__pyx_v_cur;
+  char *__pyx_v_end;
+  char *__pyx_v_next_line;
+  Py_ssize_t __pyx_v_c_bytes_len;
+  Py_ssize_t __pyx_v_prefix_length;
+  Py_ssize_t __pyx_v_items_length;
+  int __pyx_v_maximum_size;
+  int __pyx_v_width;
+  int __pyx_v_length;
+  int __pyx_v_i;
+  int __pyx_v_prefix_tail_len;
+  int __pyx_v_num_value_lines;
+  int __pyx_v_num_prefix_bits;
+  char *__pyx_v_prefix;
+  char *__pyx_v_value_start;
+  char *__pyx_v_prefix_tail;
+  char *__pyx_v_next_null;
+  char *__pyx_v_last_null;
+  char *__pyx_v_line_start;
+  char *__pyx_v_c_entry;
+  char *__pyx_v_entry_start;
+  StaticTuple *__pyx_v_entry_bits = 0;
+  PyObject *__pyx_v_result = NULL;
+  PyObject *__pyx_v_prefix_bits = NULL;
+  PyObject *__pyx_v_items = NULL;
+  PyObject *__pyx_v_entry = NULL;
+  PyObject *__pyx_v_value = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  Py_ssize_t __pyx_t_7;
+  Py_UCS4 __pyx_t_8;
+  Py_ssize_t __pyx_t_9;
+  PyObject *__pyx_t_10 = NULL;
+  PyObject *__pyx_t_11 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("_deserialise_leaf_node", 0);
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":200
+ *     cdef StaticTuple entry_bits
+ * 
+ *     if _LeafNode is None:             # <<<<<<<<<<<<<<
+ *         _import_globals()
+ * 
+ */
+  __pyx_t_1 = (__pyx_v_6breezy_3bzr_12_chk_map_pyx__LeafNode == Py_None);
+  __pyx_t_2 = (__pyx_t_1 != 0);
+  if (__pyx_t_2) {
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":201
+ * 
+ *     if _LeafNode is None:
+ *         _import_globals()             # <<<<<<<<<<<<<<
+ * 
+ *     result = _LeafNode(search_key_func=search_key_func)
+ */
+    __pyx_t_3 = __pyx_f_6breezy_3bzr_12_chk_map_pyx__import_globals(); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 201, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":200
+ *     cdef StaticTuple entry_bits
+ * 
+ *     if _LeafNode is None:             # <<<<<<<<<<<<<<
+ *         _import_globals()
+ * 
+ */
+  }
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":203
+ *         _import_globals()
+ * 
+ *     result = _LeafNode(search_key_func=search_key_func)             # <<<<<<<<<<<<<<
+ *     # Splitlines can split on '\r' so don't use it, split('\n') adds an
+ *     # extra '' if the bytes ends in a final newline.
+ */
+  __pyx_t_3 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 203, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_search_key_func, __pyx_v_search_key_func) < 0) __PYX_ERR(0, 203, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_Call(__pyx_v_6breezy_3bzr_12_chk_map_pyx__LeafNode, __pyx_empty_tuple, __pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 203, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_v_result = __pyx_t_4;
+  __pyx_t_4 = 0;
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":206
+ *     # Splitlines can split on '\r' so don't use it, split('\n') adds an
+ *     # extra '' if the bytes ends in a final newline.
+ *     if not PyBytes_CheckExact(data):             # <<<<<<<<<<<<<<
+ *         raise TypeError('expected bytes not %s' % (type(data),))
+ * 
+ */
+  __pyx_t_2 = ((!(PyBytes_CheckExact(__pyx_v_data) != 0)) != 0);
+  if (unlikely(__pyx_t_2)) {
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":207
+ *     # extra '' if the bytes ends in a final newline.
+ *     if not PyBytes_CheckExact(data):
+ *         raise TypeError('expected bytes not %s' % (type(data),))             # <<<<<<<<<<<<<<
+ * 
+ *     c_bytes = PyBytes_AS_STRING(data)
+ */
+    __pyx_t_4 = __Pyx_PyObject_FormatSimpleAndDecref(PyObject_Unicode(((PyObject *)Py_TYPE(__pyx_v_data))), __pyx_empty_unicode); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 207, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_3 = __Pyx_PyUnicode_Concat(__pyx_kp_u_expected_bytes_not, __pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 207, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = __Pyx_PyObject_CallOneArg(__pyx_builtin_TypeError, __pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 207, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_Raise(__pyx_t_4, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __PYX_ERR(0, 207, __pyx_L1_error)
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":206
+ *     # Splitlines can split on '\r' so don't use it, split('\n') adds an
+ *     # extra '' if the bytes ends in a final newline.
+ *     if not PyBytes_CheckExact(data):             # <<<<<<<<<<<<<<
+ *         raise TypeError('expected bytes not %s' % (type(data),))
+ * 
+ */
+  }
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":209
+ *         raise TypeError('expected bytes not %s' % (type(data),))
+ * 
+ *     c_bytes = PyBytes_AS_STRING(data)             # <<<<<<<<<<<<<<
+ *     c_bytes_len = PyBytes_GET_SIZE(data)
+ * 
+ */
+  __pyx_v_c_bytes = PyBytes_AS_STRING(__pyx_v_data);
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":210
+ * 
+ *     c_bytes = PyBytes_AS_STRING(data)
+ *     c_bytes_len = PyBytes_GET_SIZE(data)             # <<<<<<<<<<<<<<
+ * 
+ *     if c_bytes_len < 9 or memcmp(c_bytes, b"chkleaf:\n", 9) != 0:
+ */
+  __pyx_v_c_bytes_len = PyBytes_GET_SIZE(__pyx_v_data);
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":212
+ *     c_bytes_len = PyBytes_GET_SIZE(data)
+ * 
+ *     if c_bytes_len < 9 or memcmp(c_bytes, b"chkleaf:\n", 9) != 0:             # <<<<<<<<<<<<<<
+ *         raise ValueError("not a serialised leaf node: %r" % data)
+ *     if c_bytes[c_bytes_len - 1] != c'\n':
+ */
+  __pyx_t_1 = ((__pyx_v_c_bytes_len < 9) != 0);
+  if (!__pyx_t_1) {
+  } else {
+    __pyx_t_2 = __pyx_t_1;
+    goto __pyx_L6_bool_binop_done;
+  }
+  __pyx_t_1 = ((memcmp(__pyx_v_c_bytes, ((char *)"chkleaf:\n"), 9) != 0) != 0);
+  __pyx_t_2 = __pyx_t_1;
+  __pyx_L6_bool_binop_done:;
+  if (unlikely(__pyx_t_2)) {
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":213
+ * 
+ *     if c_bytes_len < 9 or memcmp(c_bytes, b"chkleaf:\n", 9) != 0:
+ *         raise ValueError("not a serialised leaf node: %r" % data)             # <<<<<<<<<<<<<<
+ *     if c_bytes[c_bytes_len - 1] != c'\n':
+ *         raise ValueError("bytes does not end in a newline")
+ */
+    __pyx_t_4 = __Pyx_PyUnicode_FormatSafe(__pyx_kp_u_not_a_serialised_leaf_node_r, __pyx_v_data); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 213, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_builtin_ValueError, __pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 213, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __PYX_ERR(0, 213, __pyx_L1_error)
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":212
+ *     c_bytes_len = PyBytes_GET_SIZE(data)
+ * 
+ *     if c_bytes_len < 9 or memcmp(c_bytes, b"chkleaf:\n", 9) != 0:             # <<<<<<<<<<<<<<
+ *         raise ValueError("not a serialised leaf node: %r" % data)
+ *     if c_bytes[c_bytes_len - 1] != c'\n':
+ */
+  }
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":214
+ *     if c_bytes_len < 9 or memcmp(c_bytes, b"chkleaf:\n", 9) != 0:
+ *         raise ValueError("not a serialised leaf node: %r" % data)
+ *     if c_bytes[c_bytes_len - 1] != c'\n':             # <<<<<<<<<<<<<<
+ *         raise ValueError("bytes does not end in a newline")
+ * 
+ */
+  __pyx_t_2 = (((__pyx_v_c_bytes[(__pyx_v_c_bytes_len - 1)]) != '\n') != 0);
+  if (unlikely(__pyx_t_2)) {
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":215
+ *         raise ValueError("not a serialised leaf node: %r" % data)
+ *     if c_bytes[c_bytes_len - 1] != c'\n':
+ *         raise ValueError("bytes does not end in a newline")             # <<<<<<<<<<<<<<
+ * 
+ *     end = c_bytes + c_bytes_len
+ */
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__2, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 215, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __PYX_ERR(0, 215, __pyx_L1_error)
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":214
+ *     if c_bytes_len < 9 or memcmp(c_bytes, b"chkleaf:\n", 9) != 0:
+ *         raise ValueError("not a serialised leaf node: %r" % data)
+ *     if c_bytes[c_bytes_len - 1] != c'\n':             # <<<<<<<<<<<<<<
+ *         raise ValueError("bytes does not end in a newline")
+ * 
+ */
+  }
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":217
+ *         raise ValueError("bytes does not end in a newline")
+ * 
+ *     end = c_bytes + c_bytes_len             # <<<<<<<<<<<<<<
+ *     cur = c_bytes + 9
+ *     maximum_size = _get_int_from_line(&cur, end, "maximum_size")
+ */
+  __pyx_v_end = (__pyx_v_c_bytes + __pyx_v_c_bytes_len);
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":218
+ * 
+ *     end = c_bytes + c_bytes_len
+ *     cur = c_bytes + 9             # <<<<<<<<<<<<<<
+ *     maximum_size = _get_int_from_line(&cur, end, "maximum_size")
+ *     width = _get_int_from_line(&cur, end, "width")
+ */
+  __pyx_v_cur = (__pyx_v_c_bytes + 9);
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":219
+ *     end = c_bytes + c_bytes_len
+ *     cur = c_bytes + 9
+ *     maximum_size = _get_int_from_line(&cur, end, "maximum_size")             # <<<<<<<<<<<<<<
+ *     width = _get_int_from_line(&cur, end, "width")
+ *     length = _get_int_from_line(&cur, end, "length")
+ */
+  __pyx_t_5 = __pyx_f_6breezy_3bzr_12_chk_map_pyx__get_int_from_line((&__pyx_v_cur), __pyx_v_end, ((char *)"maximum_size")); if (unlikely(__pyx_t_5 == ((int)-1))) __PYX_ERR(0, 219, __pyx_L1_error)
+  __pyx_v_maximum_size = __pyx_t_5;
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":220
+ *     cur = c_bytes + 9
+ *     maximum_size = _get_int_from_line(&cur, end, "maximum_size")
+ *     width = _get_int_from_line(&cur, end, "width")             # <<<<<<<<<<<<<<
+ *     length = _get_int_from_line(&cur, end, "length")
+ * 
+ */
+  __pyx_t_5 = __pyx_f_6breezy_3bzr_12_chk_map_pyx__get_int_from_line((&__pyx_v_cur), __pyx_v_end, ((char *)"width")); if (unlikely(__pyx_t_5 == ((int)-1))) __PYX_ERR(0, 220, __pyx_L1_error)
+  __pyx_v_width = __pyx_t_5;
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":221
+ *     maximum_size = _get_int_from_line(&cur, end, "maximum_size")
+ *     width = _get_int_from_line(&cur, end, "width")
+ *     length = _get_int_from_line(&cur, end, "length")             # <<<<<<<<<<<<<<
+ * 
+ *     next_line = <char *>memchr(cur, c'\n', end - cur)
+ */
+  __pyx_t_5 = __pyx_f_6breezy_3bzr_12_chk_map_pyx__get_int_from_line((&__pyx_v_cur), __pyx_v_end, ((char *)"length")); if (unlikely(__pyx_t_5 == ((int)-1))) __PYX_ERR(0, 221, __pyx_L1_error)
+  __pyx_v_length = __pyx_t_5;
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":223
+ *     length = _get_int_from_line(&cur, end, "length")
+ * 
+ *     next_line = <char *>memchr(cur, c'\n', end - cur)             # <<<<<<<<<<<<<<
+ *     if next_line == NULL:
+ *         raise ValueError('Missing the prefix line\n')
+ */
+  __pyx_v_next_line = ((char *)memchr(__pyx_v_cur, '\n', (__pyx_v_end - __pyx_v_cur)));
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":224
+ * 
+ *     next_line = <char *>memchr(cur, c'\n', end - cur)
+ *     if next_line == NULL:             # <<<<<<<<<<<<<<
+ *         raise ValueError('Missing the prefix line\n')
+ *     prefix = cur
+ */
+  __pyx_t_2 = ((__pyx_v_next_line == NULL) != 0);
+  if (unlikely(__pyx_t_2)) {
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":225
+ *     next_line = <char *>memchr(cur, c'\n', end - cur)
+ *     if next_line == NULL:
+ *         raise ValueError('Missing the prefix line\n')             # <<<<<<<<<<<<<<
+ *     prefix = cur
+ *     prefix_length = next_line - cur
+ */
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__3, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 225, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __PYX_ERR(0, 225, __pyx_L1_error)
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":224
+ * 
+ *     next_line = <char *>memchr(cur, c'\n', end - cur)
+ *     if next_line == NULL:             # <<<<<<<<<<<<<<
+ *         raise ValueError('Missing the prefix line\n')
+ *     prefix = cur
+ */
+  }
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":226
+ *     if next_line == NULL:
+ *         raise ValueError('Missing the prefix line\n')
+ *     prefix = cur             # <<<<<<<<<<<<<<
+ *     prefix_length = next_line - cur
+ *     cur = next_line + 1
+ */
+  __pyx_v_prefix = __pyx_v_cur;
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":227
+ *         raise ValueError('Missing the prefix line\n')
+ *     prefix = cur
+ *     prefix_length = next_line - cur             # <<<<<<<<<<<<<<
+ *     cur = next_line + 1
+ * 
+ */
+  __pyx_v_prefix_length = (__pyx_v_next_line - __pyx_v_cur);
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":228
+ *     prefix = cur
+ *     prefix_length = next_line - cur
+ *     cur = next_line + 1             # <<<<<<<<<<<<<<
+ * 
+ *     prefix_bits = []
+ */
+  __pyx_v_cur = (__pyx_v_next_line + 1);
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":230
+ *     cur = next_line + 1
+ * 
+ *     prefix_bits = []             # <<<<<<<<<<<<<<
+ *     prefix_tail = prefix
+ *     num_prefix_bits = 0
+ */
+  __pyx_t_3 = PyList_New(0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 230, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_v_prefix_bits = ((PyObject*)__pyx_t_3);
+  __pyx_t_3 = 0;
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":231
+ * 
+ *     prefix_bits = []
+ *     prefix_tail = prefix             # <<<<<<<<<<<<<<
+ *     num_prefix_bits = 0
+ *     next_null = <char *>memchr(prefix, c'\0', prefix_length)
+ */
+  __pyx_v_prefix_tail = __pyx_v_prefix;
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":232
+ *     prefix_bits = []
+ *     prefix_tail = prefix
+ *     num_prefix_bits = 0             # <<<<<<<<<<<<<<
+ *     next_null = <char *>memchr(prefix, c'\0', prefix_length)
+ *     while next_null != NULL:
+ */
+  __pyx_v_num_prefix_bits = 0;
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":233
+ *     prefix_tail = prefix
+ *     num_prefix_bits = 0
+ *     next_null = <char *>memchr(prefix, c'\0', prefix_length)             # <<<<<<<<<<<<<<
+ *     while next_null != NULL:
+ *         num_prefix_bits = num_prefix_bits + 1
+ */
+  __pyx_v_next_null = ((char *)memchr(__pyx_v_prefix, '\x00', __pyx_v_prefix_length));
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":234
+ *     num_prefix_bits = 0
+ *     next_null = <char *>memchr(prefix, c'\0', prefix_length)
+ *     while next_null != NULL:             # <<<<<<<<<<<<<<
+ *         num_prefix_bits = num_prefix_bits + 1
+ *         prefix_bits.append(
+ */
+  while (1) {
+    __pyx_t_2 = ((__pyx_v_next_null != NULL) != 0);
+    if (!__pyx_t_2) break;
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":235
+ *     next_null = <char *>memchr(prefix, c'\0', prefix_length)
+ *     while next_null != NULL:
+ *         num_prefix_bits = num_prefix_bits + 1             # <<<<<<<<<<<<<<
+ *         prefix_bits.append(
+ *             PyBytes_FromStringAndSize(prefix_tail, next_null - prefix_tail))
+ */
+    __pyx_v_num_prefix_bits = (__pyx_v_num_prefix_bits + 1);
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":237
+ *         num_prefix_bits = num_prefix_bits + 1
+ *         prefix_bits.append(
+ *             PyBytes_FromStringAndSize(prefix_tail, next_null - prefix_tail))             # <<<<<<<<<<<<<<
+ *         prefix_tail = next_null + 1
+ *         next_null = <char *>memchr(prefix_tail, c'\0', next_line - prefix_tail)
+ */
+    __pyx_t_3 = PyBytes_FromStringAndSize(__pyx_v_prefix_tail, (__pyx_v_next_null - __pyx_v_prefix_tail)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 237, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":236
+ *     while next_null != NULL:
+ *         num_prefix_bits = num_prefix_bits + 1
+ *         prefix_bits.append(             # <<<<<<<<<<<<<<
+ *             PyBytes_FromStringAndSize(prefix_tail, next_null - prefix_tail))
+ *         prefix_tail = next_null + 1
+ */
+    __pyx_t_6 = __Pyx_PyList_Append(__pyx_v_prefix_bits, __pyx_t_3); if (unlikely(__pyx_t_6 == ((int)-1))) __PYX_ERR(0, 236, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":238
+ *         prefix_bits.append(
+ *             PyBytes_FromStringAndSize(prefix_tail, next_null - prefix_tail))
+ *         prefix_tail = next_null + 1             # <<<<<<<<<<<<<<
+ *         next_null = <char *>memchr(prefix_tail, c'\0', next_line - prefix_tail)
+ *     prefix_tail_len = next_line - prefix_tail
+ */
+    __pyx_v_prefix_tail = (__pyx_v_next_null + 1);
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":239
+ *             PyBytes_FromStringAndSize(prefix_tail, next_null - prefix_tail))
+ *         prefix_tail = next_null + 1
+ *         next_null = <char *>memchr(prefix_tail, c'\0', next_line - prefix_tail)             # <<<<<<<<<<<<<<
+ *     prefix_tail_len = next_line - prefix_tail
+ * 
+ */
+    __pyx_v_next_null = ((char *)memchr(__pyx_v_prefix_tail, '\x00', (__pyx_v_next_line - __pyx_v_prefix_tail)));
+  }
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":240
+ *         prefix_tail = next_null + 1
+ *         next_null = <char *>memchr(prefix_tail, c'\0', next_line - prefix_tail)
+ *     prefix_tail_len = next_line - prefix_tail             # <<<<<<<<<<<<<<
+ * 
+ *     if num_prefix_bits >= width:
+ */
+  __pyx_v_prefix_tail_len = (__pyx_v_next_line - __pyx_v_prefix_tail);
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":242
+ *     prefix_tail_len = next_line - prefix_tail
+ * 
+ *     if num_prefix_bits >= width:             # <<<<<<<<<<<<<<
+ *         raise ValueError('Prefix has too many nulls versus width')
+ * 
+ */
+  __pyx_t_2 = ((__pyx_v_num_prefix_bits >= __pyx_v_width) != 0);
+  if (unlikely(__pyx_t_2)) {
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":243
+ * 
+ *     if num_prefix_bits >= width:
+ *         raise ValueError('Prefix has too many nulls versus width')             # <<<<<<<<<<<<<<
+ * 
+ *     items_length = end - cur
+ */
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__4, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 243, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __PYX_ERR(0, 243, __pyx_L1_error)
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":242
+ *     prefix_tail_len = next_line - prefix_tail
+ * 
+ *     if num_prefix_bits >= width:             # <<<<<<<<<<<<<<
+ *         raise ValueError('Prefix has too many nulls versus width')
+ * 
+ */
+  }
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":245
+ *         raise ValueError('Prefix has too many nulls versus width')
+ * 
+ *     items_length = end - cur             # <<<<<<<<<<<<<<
+ *     items = {}
+ *     while cur < end:
+ */
+  __pyx_v_items_length = (__pyx_v_end - __pyx_v_cur);
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":246
+ * 
+ *     items_length = end - cur
+ *     items = {}             # <<<<<<<<<<<<<<
+ *     while cur < end:
+ *         line_start = cur
+ */
+  __pyx_t_3 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 246, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_v_items = ((PyObject*)__pyx_t_3);
+  __pyx_t_3 = 0;
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":247
+ *     items_length = end - cur
+ *     items = {}
+ *     while cur < end:             # <<<<<<<<<<<<<<
+ *         line_start = cur
+ *         next_line = <char *>memchr(cur, c'\n', end - cur)
+ */
+  while (1) {
+    __pyx_t_2 = ((__pyx_v_cur < __pyx_v_end) != 0);
+    if (!__pyx_t_2) break;
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":248
+ *     items = {}
+ *     while cur < end:
+ *         line_start = cur             # <<<<<<<<<<<<<<
+ *         next_line = <char *>memchr(cur, c'\n', end - cur)
+ *         if next_line == NULL:
+ */
+    __pyx_v_line_start = __pyx_v_cur;
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":249
+ *     while cur < end:
+ *         line_start = cur
+ *         next_line = <char *>memchr(cur, c'\n', end - cur)             # <<<<<<<<<<<<<<
+ *         if next_line == NULL:
+ *             raise ValueError('null line\n')
+ */
+    __pyx_v_next_line = ((char *)memchr(__pyx_v_cur, '\n', (__pyx_v_end - __pyx_v_cur)));
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":250
+ *         line_start = cur
+ *         next_line = <char *>memchr(cur, c'\n', end - cur)
+ *         if next_line == NULL:             # <<<<<<<<<<<<<<
+ *             raise ValueError('null line\n')
+ *         last_null = <char *>_my_memrchr(cur, c'\0', next_line - cur)
+ */
+    __pyx_t_2 = ((__pyx_v_next_line == NULL) != 0);
+    if (unlikely(__pyx_t_2)) {
+
+      /* "breezy/bzr/_chk_map_pyx.pyx":251
+ *         next_line = <char *>memchr(cur, c'\n', end - cur)
+ *         if next_line == NULL:
+ *             raise ValueError('null line\n')             # <<<<<<<<<<<<<<
+ *         last_null = <char *>_my_memrchr(cur, c'\0', next_line - cur)
+ *         if last_null == NULL:
+ */
+      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__5, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 251, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __PYX_ERR(0, 251, __pyx_L1_error)
+
+      /* "breezy/bzr/_chk_map_pyx.pyx":250
+ *         line_start = cur
+ *         next_line = <char *>memchr(cur, c'\n', end - cur)
+ *         if next_line == NULL:             # <<<<<<<<<<<<<<
+ *             raise ValueError('null line\n')
+ *         last_null = <char *>_my_memrchr(cur, c'\0', next_line - cur)
+ */
+    }
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":252
+ *         if next_line == NULL:
+ *             raise ValueError('null line\n')
+ *         last_null = <char *>_my_memrchr(cur, c'\0', next_line - cur)             # <<<<<<<<<<<<<<
+ *         if last_null == NULL:
+ *             raise ValueError('fail to find the num value lines null')
+ */
+    __pyx_v_last_null = ((char *)__pyx_f_6breezy_3bzr_12_str_helpers__my_memrchr(__pyx_v_cur, '\x00', (__pyx_v_next_line - __pyx_v_cur)));
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":253
+ *             raise ValueError('null line\n')
+ *         last_null = <char *>_my_memrchr(cur, c'\0', next_line - cur)
+ *         if last_null == NULL:             # <<<<<<<<<<<<<<
+ *             raise ValueError('fail to find the num value lines null')
+ *         next_null = last_null + 1 # move past NULL
+ */
+    __pyx_t_2 = ((__pyx_v_last_null == NULL) != 0);
+    if (unlikely(__pyx_t_2)) {
+
+      /* "breezy/bzr/_chk_map_pyx.pyx":254
+ *         last_null = <char *>_my_memrchr(cur, c'\0', next_line - cur)
+ *         if last_null == NULL:
+ *             raise ValueError('fail to find the num value lines null')             # <<<<<<<<<<<<<<
+ *         next_null = last_null + 1 # move past NULL
+ *         num_value_lines = _get_int_from_line(&next_null, next_line + 1,
+ */
+      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__6, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 254, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __PYX_ERR(0, 254, __pyx_L1_error)
+
+      /* "breezy/bzr/_chk_map_pyx.pyx":253
+ *             raise ValueError('null line\n')
+ *         last_null = <char *>_my_memrchr(cur, c'\0', next_line - cur)
+ *         if last_null == NULL:             # <<<<<<<<<<<<<<
+ *             raise ValueError('fail to find the num value lines null')
+ *         next_null = last_null + 1 # move past NULL
+ */
+    }
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":255
+ *         if last_null == NULL:
+ *             raise ValueError('fail to find the num value lines null')
+ *         next_null = last_null + 1 # move past NULL             # <<<<<<<<<<<<<<
+ *         num_value_lines = _get_int_from_line(&next_null, next_line + 1,
+ *                                              "num value lines")
+ */
+    __pyx_v_next_null = (__pyx_v_last_null + 1);
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":256
+ *             raise ValueError('fail to find the num value lines null')
+ *         next_null = last_null + 1 # move past NULL
+ *         num_value_lines = _get_int_from_line(&next_null, next_line + 1,             # <<<<<<<<<<<<<<
+ *                                              "num value lines")
+ *         cur = next_line + 1
+ */
+    __pyx_t_5 = __pyx_f_6breezy_3bzr_12_chk_map_pyx__get_int_from_line((&__pyx_v_next_null), (__pyx_v_next_line + 1), ((char *)"num value lines")); if (unlikely(__pyx_t_5 == ((int)-1))) __PYX_ERR(0, 256, __pyx_L1_error)
+    __pyx_v_num_value_lines = __pyx_t_5;
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":258
+ *         num_value_lines = _get_int_from_line(&next_null, next_line + 1,
+ *                                              "num value lines")
+ *         cur = next_line + 1             # <<<<<<<<<<<<<<
+ *         value_start = cur
+ *         # Walk num_value_lines forward
+ */
+    __pyx_v_cur = (__pyx_v_next_line + 1);
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":259
+ *                                              "num value lines")
+ *         cur = next_line + 1
+ *         value_start = cur             # <<<<<<<<<<<<<<
+ *         # Walk num_value_lines forward
+ *         for i from 0 <= i < num_value_lines:
+ */
+    __pyx_v_value_start = __pyx_v_cur;
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":261
+ *         value_start = cur
+ *         # Walk num_value_lines forward
+ *         for i from 0 <= i < num_value_lines:             # <<<<<<<<<<<<<<
+ *             next_line = <char *>memchr(cur, c'\n', end - cur)
+ *             if next_line == NULL:
+ */
+    __pyx_t_5 = __pyx_v_num_value_lines;
+    for (__pyx_v_i = 0; __pyx_v_i < __pyx_t_5; __pyx_v_i++) {
+
+      /* "breezy/bzr/_chk_map_pyx.pyx":262
+ *         # Walk num_value_lines forward
+ *         for i from 0 <= i < num_value_lines:
+ *             next_line = <char *>memchr(cur, c'\n', end - cur)             # <<<<<<<<<<<<<<
+ *             if next_line == NULL:
+ *                 raise ValueError('missing trailing newline')
+ */
+      __pyx_v_next_line = ((char *)memchr(__pyx_v_cur, '\n', (__pyx_v_end - __pyx_v_cur)));
+
+      /* "breezy/bzr/_chk_map_pyx.pyx":263
+ *         for i from 0 <= i < num_value_lines:
+ *             next_line = <char *>memchr(cur, c'\n', end - cur)
+ *             if next_line == NULL:             # <<<<<<<<<<<<<<
+ *                 raise ValueError('missing trailing newline')
+ *             cur = next_line + 1
+ */
+      __pyx_t_2 = ((__pyx_v_next_line == NULL) != 0);
+      if (unlikely(__pyx_t_2)) {
+
+        /* "breezy/bzr/_chk_map_pyx.pyx":264
+ *             next_line = <char *>memchr(cur, c'\n', end - cur)
+ *             if next_line == NULL:
+ *                 raise ValueError('missing trailing newline')             # <<<<<<<<<<<<<<
+ *             cur = next_line + 1
+ *         entry_bits = StaticTuple_New(width)
+ */
+        __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__7, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 264, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __PYX_ERR(0, 264, __pyx_L1_error)
+
+        /* "breezy/bzr/_chk_map_pyx.pyx":263
+ *         for i from 0 <= i < num_value_lines:
+ *             next_line = <char *>memchr(cur, c'\n', end - cur)
+ *             if next_line == NULL:             # <<<<<<<<<<<<<<
+ *                 raise ValueError('missing trailing newline')
+ *             cur = next_line + 1
+ */
+      }
+
+      /* "breezy/bzr/_chk_map_pyx.pyx":265
+ *             if next_line == NULL:
+ *                 raise ValueError('missing trailing newline')
+ *             cur = next_line + 1             # <<<<<<<<<<<<<<
+ *         entry_bits = StaticTuple_New(width)
+ *         for i from 0 <= i < num_prefix_bits:
+ */
+      __pyx_v_cur = (__pyx_v_next_line + 1);
+    }
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":266
+ *                 raise ValueError('missing trailing newline')
+ *             cur = next_line + 1
+ *         entry_bits = StaticTuple_New(width)             # <<<<<<<<<<<<<<
+ *         for i from 0 <= i < num_prefix_bits:
+ *             # TODO: Use PyList_GetItem, or turn prefix_bits into a
+ */
+    __pyx_t_3 = ((PyObject *)StaticTuple_New(__pyx_v_width)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 266, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_XDECREF_SET(__pyx_v_entry_bits, ((StaticTuple *)__pyx_t_3));
+    __pyx_t_3 = 0;
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":267
+ *             cur = next_line + 1
+ *         entry_bits = StaticTuple_New(width)
+ *         for i from 0 <= i < num_prefix_bits:             # <<<<<<<<<<<<<<
+ *             # TODO: Use PyList_GetItem, or turn prefix_bits into a
+ *             #       tuple/StaticTuple
+ */
+    __pyx_t_5 = __pyx_v_num_prefix_bits;
+    for (__pyx_v_i = 0; __pyx_v_i < __pyx_t_5; __pyx_v_i++) {
+
+      /* "breezy/bzr/_chk_map_pyx.pyx":270
+ *             # TODO: Use PyList_GetItem, or turn prefix_bits into a
+ *             #       tuple/StaticTuple
+ *             entry = prefix_bits[i]             # <<<<<<<<<<<<<<
+ *             # SET_ITEM 'steals' a reference
+ *             Py_INCREF(entry)
+ */
+      __pyx_t_3 = __Pyx_GetItemInt_List(__pyx_v_prefix_bits, __pyx_v_i, int, 1, __Pyx_PyInt_From_int, 1, 1, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 270, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_XDECREF_SET(__pyx_v_entry, __pyx_t_3);
+      __pyx_t_3 = 0;
+
+      /* "breezy/bzr/_chk_map_pyx.pyx":272
+ *             entry = prefix_bits[i]
+ *             # SET_ITEM 'steals' a reference
+ *             Py_INCREF(entry)             # <<<<<<<<<<<<<<
+ *             StaticTuple_SET_ITEM(entry_bits, i, entry)
+ *         value = PyBytes_FromStringAndSize(value_start, next_line - value_start)
+ */
+      Py_INCREF(__pyx_v_entry);
+
+      /* "breezy/bzr/_chk_map_pyx.pyx":273
+ *             # SET_ITEM 'steals' a reference
+ *             Py_INCREF(entry)
+ *             StaticTuple_SET_ITEM(entry_bits, i, entry)             # <<<<<<<<<<<<<<
+ *         value = PyBytes_FromStringAndSize(value_start, next_line - value_start)
+ *         # The next entry bit needs the 'tail' from the prefix, and first part
+ */
+      StaticTuple_SET_ITEM(__pyx_v_entry_bits, __pyx_v_i, __pyx_v_entry);
+    }
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":274
+ *             Py_INCREF(entry)
+ *             StaticTuple_SET_ITEM(entry_bits, i, entry)
+ *         value = PyBytes_FromStringAndSize(value_start, next_line - value_start)             # <<<<<<<<<<<<<<
+ *         # The next entry bit needs the 'tail' from the prefix, and first part
+ *         # of the line
+ */
+    __pyx_t_3 = PyBytes_FromStringAndSize(__pyx_v_value_start, (__pyx_v_next_line - __pyx_v_value_start)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 274, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_XDECREF_SET(__pyx_v_value, ((PyObject*)__pyx_t_3));
+    __pyx_t_3 = 0;
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":277
+ *         # The next entry bit needs the 'tail' from the prefix, and first part
+ *         # of the line
+ *         entry_start = line_start             # <<<<<<<<<<<<<<
+ *         next_null = <char *>memchr(entry_start, c'\0',
+ *                                    last_null - entry_start + 1)
+ */
+    __pyx_v_entry_start = __pyx_v_line_start;
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":278
+ *         # of the line
+ *         entry_start = line_start
+ *         next_null = <char *>memchr(entry_start, c'\0',             # <<<<<<<<<<<<<<
+ *                                    last_null - entry_start + 1)
+ *         if next_null == NULL:
+ */
+    __pyx_v_next_null = ((char *)memchr(__pyx_v_entry_start, '\x00', ((__pyx_v_last_null - __pyx_v_entry_start) + 1)));
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":280
+ *         next_null = <char *>memchr(entry_start, c'\0',
+ *                                    last_null - entry_start + 1)
+ *         if next_null == NULL:             # <<<<<<<<<<<<<<
+ *             raise ValueError('bad no null, bad')
+ *         entry = PyBytes_FromStringAndSize(
+ */
+    __pyx_t_2 = ((__pyx_v_next_null == NULL) != 0);
+    if (unlikely(__pyx_t_2)) {
+
+      /* "breezy/bzr/_chk_map_pyx.pyx":281
+ *                                    last_null - entry_start + 1)
+ *         if next_null == NULL:
+ *             raise ValueError('bad no null, bad')             # <<<<<<<<<<<<<<
+ *         entry = PyBytes_FromStringAndSize(
+ *             NULL, prefix_tail_len + next_null - line_start)
+ */
+      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__8, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 281, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __PYX_ERR(0, 281, __pyx_L1_error)
+
+      /* "breezy/bzr/_chk_map_pyx.pyx":280
+ *         next_null = <char *>memchr(entry_start, c'\0',
+ *                                    last_null - entry_start + 1)
+ *         if next_null == NULL:             # <<<<<<<<<<<<<<
+ *             raise ValueError('bad no null, bad')
+ *         entry = PyBytes_FromStringAndSize(
+ */
+    }
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":282
+ *         if next_null == NULL:
+ *             raise ValueError('bad no null, bad')
+ *         entry = PyBytes_FromStringAndSize(             # <<<<<<<<<<<<<<
+ *             NULL, prefix_tail_len + next_null - line_start)
+ *         c_entry = PyBytes_AS_STRING(entry)
+ */
+    __pyx_t_3 = PyBytes_FromStringAndSize(NULL, ((__pyx_v_prefix_tail_len + __pyx_v_next_null) - __pyx_v_line_start)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 282, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_XDECREF_SET(__pyx_v_entry, __pyx_t_3);
+    __pyx_t_3 = 0;
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":284
+ *         entry = PyBytes_FromStringAndSize(
+ *             NULL, prefix_tail_len + next_null - line_start)
+ *         c_entry = PyBytes_AS_STRING(entry)             # <<<<<<<<<<<<<<
+ *         if prefix_tail_len > 0:
+ *             memcpy(c_entry, prefix_tail, prefix_tail_len)
+ */
+    __pyx_v_c_entry = PyBytes_AS_STRING(__pyx_v_entry);
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":285
+ *             NULL, prefix_tail_len + next_null - line_start)
+ *         c_entry = PyBytes_AS_STRING(entry)
+ *         if prefix_tail_len > 0:             # <<<<<<<<<<<<<<
+ *             memcpy(c_entry, prefix_tail, prefix_tail_len)
+ *         if next_null - line_start > 0:
+ */
+    __pyx_t_2 = ((__pyx_v_prefix_tail_len > 0) != 0);
+    if (__pyx_t_2) {
+
+      /* "breezy/bzr/_chk_map_pyx.pyx":286
+ *         c_entry = PyBytes_AS_STRING(entry)
+ *         if prefix_tail_len > 0:
+ *             memcpy(c_entry, prefix_tail, prefix_tail_len)             # <<<<<<<<<<<<<<
+ *         if next_null - line_start > 0:
+ *             memcpy(c_entry + prefix_tail_len, line_start, next_null - line_start)
+ */
+      (void)(memcpy(__pyx_v_c_entry, __pyx_v_prefix_tail, __pyx_v_prefix_tail_len));
+
+      /* "breezy/bzr/_chk_map_pyx.pyx":285
+ *             NULL, prefix_tail_len + next_null - line_start)
+ *         c_entry = PyBytes_AS_STRING(entry)
+ *         if prefix_tail_len > 0:             # <<<<<<<<<<<<<<
+ *             memcpy(c_entry, prefix_tail, prefix_tail_len)
+ *         if next_null - line_start > 0:
+ */
+    }
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":287
+ *         if prefix_tail_len > 0:
+ *             memcpy(c_entry, prefix_tail, prefix_tail_len)
+ *         if next_null - line_start > 0:             # <<<<<<<<<<<<<<
+ *             memcpy(c_entry + prefix_tail_len, line_start, next_null - line_start)
+ *         Py_INCREF(entry)
+ */
+    __pyx_t_2 = (((__pyx_v_next_null - __pyx_v_line_start) > 0) != 0);
+    if (__pyx_t_2) {
+
+      /* "breezy/bzr/_chk_map_pyx.pyx":288
+ *             memcpy(c_entry, prefix_tail, prefix_tail_len)
+ *         if next_null - line_start > 0:
+ *             memcpy(c_entry + prefix_tail_len, line_start, next_null - line_start)             # <<<<<<<<<<<<<<
+ *         Py_INCREF(entry)
+ *         i = num_prefix_bits
+ */
+      (void)(memcpy((__pyx_v_c_entry + __pyx_v_prefix_tail_len), __pyx_v_line_start, (__pyx_v_next_null - __pyx_v_line_start)));
+
+      /* "breezy/bzr/_chk_map_pyx.pyx":287
+ *         if prefix_tail_len > 0:
+ *             memcpy(c_entry, prefix_tail, prefix_tail_len)
+ *         if next_null - line_start > 0:             # <<<<<<<<<<<<<<
+ *             memcpy(c_entry + prefix_tail_len, line_start, next_null - line_start)
+ *         Py_INCREF(entry)
+ */
+    }
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":289
+ *         if next_null - line_start > 0:
+ *             memcpy(c_entry + prefix_tail_len, line_start, next_null - line_start)
+ *         Py_INCREF(entry)             # <<<<<<<<<<<<<<
+ *         i = num_prefix_bits
+ *         StaticTuple_SET_ITEM(entry_bits, i, entry)
+ */
+    Py_INCREF(__pyx_v_entry);
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":290
+ *             memcpy(c_entry + prefix_tail_len, line_start, next_null - line_start)
+ *         Py_INCREF(entry)
+ *         i = num_prefix_bits             # <<<<<<<<<<<<<<
+ *         StaticTuple_SET_ITEM(entry_bits, i, entry)
+ *         while next_null != last_null: # We have remaining bits
+ */
+    __pyx_v_i = __pyx_v_num_prefix_bits;
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":291
+ *         Py_INCREF(entry)
+ *         i = num_prefix_bits
+ *         StaticTuple_SET_ITEM(entry_bits, i, entry)             # <<<<<<<<<<<<<<
+ *         while next_null != last_null: # We have remaining bits
+ *             i = i + 1
+ */
+    StaticTuple_SET_ITEM(__pyx_v_entry_bits, __pyx_v_i, __pyx_v_entry);
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":292
+ *         i = num_prefix_bits
+ *         StaticTuple_SET_ITEM(entry_bits, i, entry)
+ *         while next_null != last_null: # We have remaining bits             # <<<<<<<<<<<<<<
+ *             i = i + 1
+ *             if i > width:
+ */
+    while (1) {
+      __pyx_t_2 = ((__pyx_v_next_null != __pyx_v_last_null) != 0);
+      if (!__pyx_t_2) break;
+
+      /* "breezy/bzr/_chk_map_pyx.pyx":293
+ *         StaticTuple_SET_ITEM(entry_bits, i, entry)
+ *         while next_null != last_null: # We have remaining bits
+ *             i = i + 1             # <<<<<<<<<<<<<<
+ *             if i > width:
+ *                 raise ValueError("Too many bits for entry")
+ */
+      __pyx_v_i = (__pyx_v_i + 1);
+
+      /* "breezy/bzr/_chk_map_pyx.pyx":294
+ *         while next_null != last_null: # We have remaining bits
+ *             i = i + 1
+ *             if i > width:             # <<<<<<<<<<<<<<
+ *                 raise ValueError("Too many bits for entry")
+ *             entry_start = next_null + 1
+ */
+      __pyx_t_2 = ((__pyx_v_i > __pyx_v_width) != 0);
+      if (unlikely(__pyx_t_2)) {
+
+        /* "breezy/bzr/_chk_map_pyx.pyx":295
+ *             i = i + 1
+ *             if i > width:
+ *                 raise ValueError("Too many bits for entry")             # <<<<<<<<<<<<<<
+ *             entry_start = next_null + 1
+ *             next_null = <char *>memchr(entry_start, c'\0',
+ */
+        __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__9, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 295, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __PYX_ERR(0, 295, __pyx_L1_error)
+
+        /* "breezy/bzr/_chk_map_pyx.pyx":294
+ *         while next_null != last_null: # We have remaining bits
+ *             i = i + 1
+ *             if i > width:             # <<<<<<<<<<<<<<
+ *                 raise ValueError("Too many bits for entry")
+ *             entry_start = next_null + 1
+ */
+      }
+
+      /* "breezy/bzr/_chk_map_pyx.pyx":296
+ *             if i > width:
+ *                 raise ValueError("Too many bits for entry")
+ *             entry_start = next_null + 1             # <<<<<<<<<<<<<<
+ *             next_null = <char *>memchr(entry_start, c'\0',
+ *                                        last_null - entry_start + 1)
+ */
+      __pyx_v_entry_start = (__pyx_v_next_null + 1);
+
+      /* "breezy/bzr/_chk_map_pyx.pyx":297
+ *                 raise ValueError("Too many bits for entry")
+ *             entry_start = next_null + 1
+ *             next_null = <char *>memchr(entry_start, c'\0',             # <<<<<<<<<<<<<<
+ *                                        last_null - entry_start + 1)
+ *             if next_null == NULL:
+ */
+      __pyx_v_next_null = ((char *)memchr(__pyx_v_entry_start, '\x00', ((__pyx_v_last_null - __pyx_v_entry_start) + 1)));
+
+      /* "breezy/bzr/_chk_map_pyx.pyx":299
+ *             next_null = <char *>memchr(entry_start, c'\0',
+ *                                        last_null - entry_start + 1)
+ *             if next_null == NULL:             # <<<<<<<<<<<<<<
+ *                 raise ValueError('bad no null')
+ *             entry = PyBytes_FromStringAndSize(
+ */
+      __pyx_t_2 = ((__pyx_v_next_null == NULL) != 0);
+      if (unlikely(__pyx_t_2)) {
+
+        /* "breezy/bzr/_chk_map_pyx.pyx":300
+ *                                        last_null - entry_start + 1)
+ *             if next_null == NULL:
+ *                 raise ValueError('bad no null')             # <<<<<<<<<<<<<<
+ *             entry = PyBytes_FromStringAndSize(
+ *                 entry_start, next_null - entry_start)
+ */
+        __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__10, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 300, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __PYX_ERR(0, 300, __pyx_L1_error)
+
+        /* "breezy/bzr/_chk_map_pyx.pyx":299
+ *             next_null = <char *>memchr(entry_start, c'\0',
+ *                                        last_null - entry_start + 1)
+ *             if next_null == NULL:             # <<<<<<<<<<<<<<
+ *                 raise ValueError('bad no null')
+ *             entry = PyBytes_FromStringAndSize(
+ */
+      }
+
+      /* "breezy/bzr/_chk_map_pyx.pyx":301
+ *             if next_null == NULL:
+ *                 raise ValueError('bad no null')
+ *             entry = PyBytes_FromStringAndSize(             # <<<<<<<<<<<<<<
+ *                 entry_start, next_null - entry_start)
+ *             Py_INCREF(entry)
+ */
+      __pyx_t_3 = PyBytes_FromStringAndSize(__pyx_v_entry_start, (__pyx_v_next_null - __pyx_v_entry_start)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 301, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_DECREF_SET(__pyx_v_entry, __pyx_t_3);
+      __pyx_t_3 = 0;
+
+      /* "breezy/bzr/_chk_map_pyx.pyx":303
+ *             entry = PyBytes_FromStringAndSize(
+ *                 entry_start, next_null - entry_start)
+ *             Py_INCREF(entry)             # <<<<<<<<<<<<<<
+ *             StaticTuple_SET_ITEM(entry_bits, i, entry)
+ *         if StaticTuple_GET_SIZE(entry_bits) != width:
+ */
+      Py_INCREF(__pyx_v_entry);
+
+      /* "breezy/bzr/_chk_map_pyx.pyx":304
+ *                 entry_start, next_null - entry_start)
+ *             Py_INCREF(entry)
+ *             StaticTuple_SET_ITEM(entry_bits, i, entry)             # <<<<<<<<<<<<<<
+ *         if StaticTuple_GET_SIZE(entry_bits) != width:
+ *             raise AssertionError(
+ */
+      StaticTuple_SET_ITEM(__pyx_v_entry_bits, __pyx_v_i, __pyx_v_entry);
+    }
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":305
+ *             Py_INCREF(entry)
+ *             StaticTuple_SET_ITEM(entry_bits, i, entry)
+ *         if StaticTuple_GET_SIZE(entry_bits) != width:             # <<<<<<<<<<<<<<
+ *             raise AssertionError(
+ *                 'Incorrect number of elements (%d vs %d)'
+ */
+    __pyx_t_2 = ((StaticTuple_GET_SIZE(__pyx_v_entry_bits) != __pyx_v_width) != 0);
+    if (unlikely(__pyx_t_2)) {
+
+      /* "breezy/bzr/_chk_map_pyx.pyx":307
+ *         if StaticTuple_GET_SIZE(entry_bits) != width:
+ *             raise AssertionError(
+ *                 'Incorrect number of elements (%d vs %d)'             # <<<<<<<<<<<<<<
+ *                 % (len(entry_bits)+1, width + 1))
+ *         entry_bits = StaticTuple_Intern(entry_bits)
+ */
+      __pyx_t_3 = PyTuple_New(5); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 307, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_7 = 0;
+      __pyx_t_8 = 127;
+      __Pyx_INCREF(__pyx_kp_u_Incorrect_number_of_elements);
+      __pyx_t_7 += 30;
+      __Pyx_GIVEREF(__pyx_kp_u_Incorrect_number_of_elements);
+      PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_kp_u_Incorrect_number_of_elements);
+
+      /* "breezy/bzr/_chk_map_pyx.pyx":308
+ *             raise AssertionError(
+ *                 'Incorrect number of elements (%d vs %d)'
+ *                 % (len(entry_bits)+1, width + 1))             # <<<<<<<<<<<<<<
+ *         entry_bits = StaticTuple_Intern(entry_bits)
+ *         PyDict_SetItem(items, entry_bits, value)
+ */
+      __pyx_t_9 = PyObject_Length(((PyObject *)__pyx_v_entry_bits)); if (unlikely(__pyx_t_9 == ((Py_ssize_t)-1))) __PYX_ERR(0, 308, __pyx_L1_error)
+      __pyx_t_4 = __Pyx_PyUnicode_From_Py_ssize_t((__pyx_t_9 + 1), 0, ' ', 'd'); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 308, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_7 += __Pyx_PyUnicode_GET_LENGTH(__pyx_t_4);
+      __Pyx_GIVEREF(__pyx_t_4);
+      PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_t_4);
+      __pyx_t_4 = 0;
+      __Pyx_INCREF(__pyx_kp_u_vs);
+      __pyx_t_7 += 4;
+      __Pyx_GIVEREF(__pyx_kp_u_vs);
+      PyTuple_SET_ITEM(__pyx_t_3, 2, __pyx_kp_u_vs);
+      __pyx_t_4 = __Pyx_PyUnicode_From_long((__pyx_v_width + 1), 0, ' ', 'd'); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 308, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_7 += __Pyx_PyUnicode_GET_LENGTH(__pyx_t_4);
+      __Pyx_GIVEREF(__pyx_t_4);
+      PyTuple_SET_ITEM(__pyx_t_3, 3, __pyx_t_4);
+      __pyx_t_4 = 0;
+      __Pyx_INCREF(__pyx_kp_u__11);
+      __pyx_t_7 += 1;
+      __Pyx_GIVEREF(__pyx_kp_u__11);
+      PyTuple_SET_ITEM(__pyx_t_3, 4, __pyx_kp_u__11);
+
+      /* "breezy/bzr/_chk_map_pyx.pyx":307
+ *         if StaticTuple_GET_SIZE(entry_bits) != width:
+ *             raise AssertionError(
+ *                 'Incorrect number of elements (%d vs %d)'             # <<<<<<<<<<<<<<
+ *                 % (len(entry_bits)+1, width + 1))
+ *         entry_bits = StaticTuple_Intern(entry_bits)
+ */
+      __pyx_t_4 = __Pyx_PyUnicode_Join(__pyx_t_3, 5, __pyx_t_7, __pyx_t_8); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 307, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+      /* "breezy/bzr/_chk_map_pyx.pyx":306
+ *             StaticTuple_SET_ITEM(entry_bits, i, entry)
+ *         if StaticTuple_GET_SIZE(entry_bits) != width:
+ *             raise AssertionError(             # <<<<<<<<<<<<<<
+ *                 'Incorrect number of elements (%d vs %d)'
+ *                 % (len(entry_bits)+1, width + 1))
+ */
+      __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_builtin_AssertionError, __pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 306, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __PYX_ERR(0, 306, __pyx_L1_error)
+
+      /* "breezy/bzr/_chk_map_pyx.pyx":305
+ *             Py_INCREF(entry)
+ *             StaticTuple_SET_ITEM(entry_bits, i, entry)
+ *         if StaticTuple_GET_SIZE(entry_bits) != width:             # <<<<<<<<<<<<<<
+ *             raise AssertionError(
+ *                 'Incorrect number of elements (%d vs %d)'
+ */
+    }
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":309
+ *                 'Incorrect number of elements (%d vs %d)'
+ *                 % (len(entry_bits)+1, width + 1))
+ *         entry_bits = StaticTuple_Intern(entry_bits)             # <<<<<<<<<<<<<<
+ *         PyDict_SetItem(items, entry_bits, value)
+ *     if len(items) != length:
+ */
+    __pyx_t_3 = ((PyObject *)StaticTuple_Intern(__pyx_v_entry_bits)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 309, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF_SET(__pyx_v_entry_bits, ((StaticTuple *)__pyx_t_3));
+    __pyx_t_3 = 0;
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":310
+ *                 % (len(entry_bits)+1, width + 1))
+ *         entry_bits = StaticTuple_Intern(entry_bits)
+ *         PyDict_SetItem(items, entry_bits, value)             # <<<<<<<<<<<<<<
+ *     if len(items) != length:
+ *         raise ValueError("item count (%d) mismatch for key %s,"
+ */
+    __pyx_t_5 = PyDict_SetItem(__pyx_v_items, ((PyObject *)__pyx_v_entry_bits), __pyx_v_value); if (unlikely(__pyx_t_5 == ((int)-1))) __PYX_ERR(0, 310, __pyx_L1_error)
+  }
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":311
+ *         entry_bits = StaticTuple_Intern(entry_bits)
+ *         PyDict_SetItem(items, entry_bits, value)
+ *     if len(items) != length:             # <<<<<<<<<<<<<<
+ *         raise ValueError("item count (%d) mismatch for key %s,"
+ *                          " bytes %r" % (length, entry_bits, bytes))
+ */
+  __pyx_t_7 = PyDict_Size(__pyx_v_items); if (unlikely(__pyx_t_7 == ((Py_ssize_t)-1))) __PYX_ERR(0, 311, __pyx_L1_error)
+  __pyx_t_2 = ((__pyx_t_7 != __pyx_v_length) != 0);
+  if (unlikely(__pyx_t_2)) {
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":312
+ *         PyDict_SetItem(items, entry_bits, value)
+ *     if len(items) != length:
+ *         raise ValueError("item count (%d) mismatch for key %s,"             # <<<<<<<<<<<<<<
+ *                          " bytes %r" % (length, entry_bits, bytes))
+ *     result._items = items
+ */
+    __pyx_t_3 = PyTuple_New(6); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 312, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_7 = 0;
+    __pyx_t_8 = 127;
+    __Pyx_INCREF(__pyx_kp_u_item_count);
+    __pyx_t_7 += 12;
+    __Pyx_GIVEREF(__pyx_kp_u_item_count);
+    PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_kp_u_item_count);
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":313
+ *     if len(items) != length:
+ *         raise ValueError("item count (%d) mismatch for key %s,"
+ *                          " bytes %r" % (length, entry_bits, bytes))             # <<<<<<<<<<<<<<
+ *     result._items = items
+ *     result._len = length
+ */
+    __pyx_t_4 = __Pyx_PyUnicode_From_int(__pyx_v_length, 0, ' ', 'd'); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 313, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_7 += __Pyx_PyUnicode_GET_LENGTH(__pyx_t_4);
+    __Pyx_GIVEREF(__pyx_t_4);
+    PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_t_4);
+    __pyx_t_4 = 0;
+    __Pyx_INCREF(__pyx_kp_u_mismatch_for_key);
+    __pyx_t_7 += 19;
+    __Pyx_GIVEREF(__pyx_kp_u_mismatch_for_key);
+    PyTuple_SET_ITEM(__pyx_t_3, 2, __pyx_kp_u_mismatch_for_key);
+    if (unlikely(!__pyx_v_entry_bits)) { __Pyx_RaiseUnboundLocalError("entry_bits"); __PYX_ERR(0, 313, __pyx_L1_error) }
+    __pyx_t_4 = __Pyx_PyObject_FormatSimpleAndDecref(PyObject_Unicode(((PyObject *)__pyx_v_entry_bits)), __pyx_empty_unicode); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 313, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_8 = (__Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_4) > __pyx_t_8) ? __Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_4) : __pyx_t_8;
+    __pyx_t_7 += __Pyx_PyUnicode_GET_LENGTH(__pyx_t_4);
+    __Pyx_GIVEREF(__pyx_t_4);
+    PyTuple_SET_ITEM(__pyx_t_3, 3, __pyx_t_4);
+    __pyx_t_4 = 0;
+    __Pyx_INCREF(__pyx_kp_u_bytes);
+    __pyx_t_7 += 8;
+    __Pyx_GIVEREF(__pyx_kp_u_bytes);
+    PyTuple_SET_ITEM(__pyx_t_3, 4, __pyx_kp_u_bytes);
+    __pyx_t_4 = __Pyx_PyObject_FormatSimpleAndDecref(PyObject_Repr(((PyObject *)(&PyBytes_Type))), __pyx_empty_unicode); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 313, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_8 = (__Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_4) > __pyx_t_8) ? __Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_4) : __pyx_t_8;
+    __pyx_t_7 += __Pyx_PyUnicode_GET_LENGTH(__pyx_t_4);
+    __Pyx_GIVEREF(__pyx_t_4);
+    PyTuple_SET_ITEM(__pyx_t_3, 5, __pyx_t_4);
+    __pyx_t_4 = 0;
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":312
+ *         PyDict_SetItem(items, entry_bits, value)
+ *     if len(items) != length:
+ *         raise ValueError("item count (%d) mismatch for key %s,"             # <<<<<<<<<<<<<<
+ *                          " bytes %r" % (length, entry_bits, bytes))
+ *     result._items = items
+ */
+    __pyx_t_4 = __Pyx_PyUnicode_Join(__pyx_t_3, 6, __pyx_t_7, __pyx_t_8); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 312, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_builtin_ValueError, __pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 312, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __PYX_ERR(0, 312, __pyx_L1_error)
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":311
+ *         entry_bits = StaticTuple_Intern(entry_bits)
+ *         PyDict_SetItem(items, entry_bits, value)
+ *     if len(items) != length:             # <<<<<<<<<<<<<<
+ *         raise ValueError("item count (%d) mismatch for key %s,"
+ *                          " bytes %r" % (length, entry_bits, bytes))
+ */
+  }
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":314
+ *         raise ValueError("item count (%d) mismatch for key %s,"
+ *                          " bytes %r" % (length, entry_bits, bytes))
+ *     result._items = items             # <<<<<<<<<<<<<<
+ *     result._len = length
+ *     result._maximum_size = maximum_size
+ */
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_result, __pyx_n_s_items, __pyx_v_items) < 0) __PYX_ERR(0, 314, __pyx_L1_error)
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":315
+ *                          " bytes %r" % (length, entry_bits, bytes))
+ *     result._items = items
+ *     result._len = length             # <<<<<<<<<<<<<<
+ *     result._maximum_size = maximum_size
+ *     result._key = key
+ */
+  __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_length); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 315, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_result, __pyx_n_s_len, __pyx_t_3) < 0) __PYX_ERR(0, 315, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":316
+ *     result._items = items
+ *     result._len = length
+ *     result._maximum_size = maximum_size             # <<<<<<<<<<<<<<
+ *     result._key = key
+ *     result._key_width = width
+ */
+  __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_maximum_size); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 316, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_result, __pyx_n_s_maximum_size, __pyx_t_3) < 0) __PYX_ERR(0, 316, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":317
+ *     result._len = length
+ *     result._maximum_size = maximum_size
+ *     result._key = key             # <<<<<<<<<<<<<<
+ *     result._key_width = width
+ *     result._raw_size = items_length + length * prefix_length
+ */
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_result, __pyx_n_s_key_2, __pyx_v_key) < 0) __PYX_ERR(0, 317, __pyx_L1_error)
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":318
+ *     result._maximum_size = maximum_size
+ *     result._key = key
+ *     result._key_width = width             # <<<<<<<<<<<<<<
+ *     result._raw_size = items_length + length * prefix_length
+ *     if length == 0:
+ */
+  __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_width); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 318, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_result, __pyx_n_s_key_width, __pyx_t_3) < 0) __PYX_ERR(0, 318, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":319
+ *     result._key = key
+ *     result._key_width = width
+ *     result._raw_size = items_length + length * prefix_length             # <<<<<<<<<<<<<<
+ *     if length == 0:
+ *         result._search_prefix = None
+ */
+  __pyx_t_3 = PyInt_FromSsize_t((__pyx_v_items_length + (__pyx_v_length * __pyx_v_prefix_length))); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 319, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_result, __pyx_n_s_raw_size, __pyx_t_3) < 0) __PYX_ERR(0, 319, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":320
+ *     result._key_width = width
+ *     result._raw_size = items_length + length * prefix_length
+ *     if length == 0:             # <<<<<<<<<<<<<<
+ *         result._search_prefix = None
+ *         result._common_serialised_prefix = None
+ */
+  __pyx_t_2 = ((__pyx_v_length == 0) != 0);
+  if (__pyx_t_2) {
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":321
+ *     result._raw_size = items_length + length * prefix_length
+ *     if length == 0:
+ *         result._search_prefix = None             # <<<<<<<<<<<<<<
+ *         result._common_serialised_prefix = None
+ *     else:
+ */
+    if (__Pyx_PyObject_SetAttrStr(__pyx_v_result, __pyx_n_s_search_prefix, Py_None) < 0) __PYX_ERR(0, 321, __pyx_L1_error)
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":322
+ *     if length == 0:
+ *         result._search_prefix = None
+ *         result._common_serialised_prefix = None             # <<<<<<<<<<<<<<
+ *     else:
+ *         result._search_prefix = _unknown
+ */
+    if (__Pyx_PyObject_SetAttrStr(__pyx_v_result, __pyx_n_s_common_serialised_prefix, Py_None) < 0) __PYX_ERR(0, 322, __pyx_L1_error)
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":320
+ *     result._key_width = width
+ *     result._raw_size = items_length + length * prefix_length
+ *     if length == 0:             # <<<<<<<<<<<<<<
+ *         result._search_prefix = None
+ *         result._common_serialised_prefix = None
+ */
+    goto __pyx_L31;
+  }
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":324
+ *         result._common_serialised_prefix = None
+ *     else:
+ *         result._search_prefix = _unknown             # <<<<<<<<<<<<<<
+ *         result._common_serialised_prefix = PyBytes_FromStringAndSize(
+ *             prefix, prefix_length)
+ */
+  /*else*/ {
+    if (__Pyx_PyObject_SetAttrStr(__pyx_v_result, __pyx_n_s_search_prefix, __pyx_v_6breezy_3bzr_12_chk_map_pyx__unknown) < 0) __PYX_ERR(0, 324, __pyx_L1_error)
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":325
+ *     else:
+ *         result._search_prefix = _unknown
+ *         result._common_serialised_prefix = PyBytes_FromStringAndSize(             # <<<<<<<<<<<<<<
+ *             prefix, prefix_length)
+ *     if c_bytes_len != result._current_size():
+ */
+    __pyx_t_3 = PyBytes_FromStringAndSize(__pyx_v_prefix, __pyx_v_prefix_length); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 325, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    if (__Pyx_PyObject_SetAttrStr(__pyx_v_result, __pyx_n_s_common_serialised_prefix, __pyx_t_3) < 0) __PYX_ERR(0, 325, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  }
+  __pyx_L31:;
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":327
+ *         result._common_serialised_prefix = PyBytes_FromStringAndSize(
+ *             prefix, prefix_length)
+ *     if c_bytes_len != result._current_size():             # <<<<<<<<<<<<<<
+ *         raise AssertionError('_current_size computed incorrectly %d != %d',
+ *             c_bytes_len, result._current_size())
+ */
+  __pyx_t_3 = PyInt_FromSsize_t(__pyx_v_c_bytes_len); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 327, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_10 = __Pyx_PyObject_GetAttrStr(__pyx_v_result, __pyx_n_s_current_size); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 327, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_10);
+  __pyx_t_11 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_10))) {
+    __pyx_t_11 = PyMethod_GET_SELF(__pyx_t_10);
+    if (likely(__pyx_t_11)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_10);
+      __Pyx_INCREF(__pyx_t_11);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_10, function);
+    }
+  }
+  __pyx_t_4 = (__pyx_t_11) ? __Pyx_PyObject_CallOneArg(__pyx_t_10, __pyx_t_11) : __Pyx_PyObject_CallNoArg(__pyx_t_10);
+  __Pyx_XDECREF(__pyx_t_11); __pyx_t_11 = 0;
+  if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 327, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+  __pyx_t_10 = PyObject_RichCompare(__pyx_t_3, __pyx_t_4, Py_NE); __Pyx_XGOTREF(__pyx_t_10); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 327, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_10); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 327, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+  if (unlikely(__pyx_t_2)) {
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":329
+ *     if c_bytes_len != result._current_size():
+ *         raise AssertionError('_current_size computed incorrectly %d != %d',
+ *             c_bytes_len, result._current_size())             # <<<<<<<<<<<<<<
+ *     return result
+ * 
+ */
+    __pyx_t_10 = PyInt_FromSsize_t(__pyx_v_c_bytes_len); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 329, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_10);
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_result, __pyx_n_s_current_size); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 329, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_11 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_11 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_11)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_11);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_4 = (__pyx_t_11) ? __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_11) : __Pyx_PyObject_CallNoArg(__pyx_t_3);
+    __Pyx_XDECREF(__pyx_t_11); __pyx_t_11 = 0;
+    if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 329, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":328
+ *             prefix, prefix_length)
+ *     if c_bytes_len != result._current_size():
+ *         raise AssertionError('_current_size computed incorrectly %d != %d',             # <<<<<<<<<<<<<<
+ *             c_bytes_len, result._current_size())
+ *     return result
+ */
+    __pyx_t_3 = PyTuple_New(3); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 328, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_INCREF(__pyx_kp_u_current_size_computed_incorrect);
+    __Pyx_GIVEREF(__pyx_kp_u_current_size_computed_incorrect);
+    PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_kp_u_current_size_computed_incorrect);
+    __Pyx_GIVEREF(__pyx_t_10);
+    PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_t_10);
+    __Pyx_GIVEREF(__pyx_t_4);
+    PyTuple_SET_ITEM(__pyx_t_3, 2, __pyx_t_4);
+    __pyx_t_10 = 0;
+    __pyx_t_4 = 0;
+    __pyx_t_4 = __Pyx_PyObject_Call(__pyx_builtin_AssertionError, __pyx_t_3, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 328, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_Raise(__pyx_t_4, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __PYX_ERR(0, 328, __pyx_L1_error)
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":327
+ *         result._common_serialised_prefix = PyBytes_FromStringAndSize(
+ *             prefix, prefix_length)
+ *     if c_bytes_len != result._current_size():             # <<<<<<<<<<<<<<
+ *         raise AssertionError('_current_size computed incorrectly %d != %d',
+ *             c_bytes_len, result._current_size())
+ */
+  }
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":330
+ *         raise AssertionError('_current_size computed incorrectly %d != %d',
+ *             c_bytes_len, result._current_size())
+ *     return result             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_result);
+  __pyx_r = __pyx_v_result;
+  goto __pyx_L0;
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":176
+ * 
+ * 
+ * def _deserialise_leaf_node(data, key, search_key_func=None):             # <<<<<<<<<<<<<<
+ *     """Deserialise bytes, with key key, into a LeafNode.
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_10);
+  __Pyx_XDECREF(__pyx_t_11);
+  __Pyx_AddTraceback("breezy.bzr._chk_map_pyx._deserialise_leaf_node", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_entry_bits);
+  __Pyx_XDECREF(__pyx_v_result);
+  __Pyx_XDECREF(__pyx_v_prefix_bits);
+  __Pyx_XDECREF(__pyx_v_items);
+  __Pyx_XDECREF(__pyx_v_entry);
+  __Pyx_XDECREF(__pyx_v_value);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "breezy/bzr/_chk_map_pyx.pyx":333
+ * 
+ * 
+ * def _deserialise_internal_node(data, key, search_key_func=None):             # <<<<<<<<<<<<<<
+ *     cdef char *c_bytes
+ *     cdef char *cur
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_6breezy_3bzr_12_chk_map_pyx_7_deserialise_internal_node(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_6breezy_3bzr_12_chk_map_pyx_7_deserialise_internal_node = {"_deserialise_internal_node", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_6breezy_3bzr_12_chk_map_pyx_7_deserialise_internal_node, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_6breezy_3bzr_12_chk_map_pyx_7_deserialise_internal_node(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_data = 0;
+  PyObject *__pyx_v_key = 0;
+  PyObject *__pyx_v_search_key_func = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("_deserialise_internal_node (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_data,&__pyx_n_s_key,&__pyx_n_s_search_key_func,0};
+    PyObject* values[3] = {0,0,0};
+    values[2] = ((PyObject *)Py_None);
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_data)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_key)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("_deserialise_internal_node", 0, 2, 3, 1); __PYX_ERR(0, 333, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_search_key_func);
+          if (value) { values[2] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "_deserialise_internal_node") < 0)) __PYX_ERR(0, 333, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_data = values[0];
+    __pyx_v_key = values[1];
+    __pyx_v_search_key_func = values[2];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("_deserialise_internal_node", 0, 2, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 333, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("breezy.bzr._chk_map_pyx._deserialise_internal_node", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_6breezy_3bzr_12_chk_map_pyx_6_deserialise_internal_node(__pyx_self, __pyx_v_data, __pyx_v_key, __pyx_v_search_key_func);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_6breezy_3bzr_12_chk_map_pyx_6_deserialise_internal_node(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_data, PyObject *__pyx_v_key, PyObject *__pyx_v_search_key_func) {
+  char *__pyx_v_c_bytes;
+  char *__pyx_v_cur;
+  char *__pyx_v_end;
+  char *__pyx_v_next_line;
+  Py_ssize_t __pyx_v_c_bytes_len;
+  Py_ssize_t __pyx_v_prefix_length;
+  int __pyx_v_maximum_size;
+  int __pyx_v_width;
+  int __pyx_v_length;
+  char *__pyx_v_prefix;
+  char *__pyx_v_next_null;
+  char *__pyx_v_c_item_prefix;
+  PyObject *__pyx_v_result = NULL;
+  PyObject *__pyx_v_items = NULL;
+  PyObject *__pyx_v_item_prefix = NULL;
+  PyObject *__pyx_v_flat_key = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  Py_ssize_t __pyx_t_5;
+  Py_UCS4 __pyx_t_6;
+  int __pyx_t_7;
+  PyObject *__pyx_t_8 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("_deserialise_internal_node", 0);
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":345
+ *     cdef char *c_item_prefix
+ * 
+ *     if _InternalNode is None:             # <<<<<<<<<<<<<<
+ *         _import_globals()
+ *     result = _InternalNode(search_key_func=search_key_func)
+ */
+  __pyx_t_1 = (__pyx_v_6breezy_3bzr_12_chk_map_pyx__InternalNode == Py_None);
+  __pyx_t_2 = (__pyx_t_1 != 0);
+  if (__pyx_t_2) {
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":346
+ * 
+ *     if _InternalNode is None:
+ *         _import_globals()             # <<<<<<<<<<<<<<
+ *     result = _InternalNode(search_key_func=search_key_func)
+ * 
+ */
+    __pyx_t_3 = __pyx_f_6breezy_3bzr_12_chk_map_pyx__import_globals(); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 346, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":345
+ *     cdef char *c_item_prefix
+ * 
+ *     if _InternalNode is None:             # <<<<<<<<<<<<<<
+ *         _import_globals()
+ *     result = _InternalNode(search_key_func=search_key_func)
+ */
+  }
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":347
+ *     if _InternalNode is None:
+ *         _import_globals()
+ *     result = _InternalNode(search_key_func=search_key_func)             # <<<<<<<<<<<<<<
+ * 
+ *     if not StaticTuple_CheckExact(key):
+ */
+  __pyx_t_3 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 347, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_search_key_func, __pyx_v_search_key_func) < 0) __PYX_ERR(0, 347, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_Call(__pyx_v_6breezy_3bzr_12_chk_map_pyx__InternalNode, __pyx_empty_tuple, __pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 347, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_v_result = __pyx_t_4;
+  __pyx_t_4 = 0;
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":349
+ *     result = _InternalNode(search_key_func=search_key_func)
+ * 
+ *     if not StaticTuple_CheckExact(key):             # <<<<<<<<<<<<<<
+ *         raise TypeError('key %r is not a StaticTuple' % (key,))
+ *     if not PyBytes_CheckExact(data):
+ */
+  __pyx_t_2 = ((!(StaticTuple_CheckExact(__pyx_v_key) != 0)) != 0);
+  if (unlikely(__pyx_t_2)) {
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":350
+ * 
+ *     if not StaticTuple_CheckExact(key):
+ *         raise TypeError('key %r is not a StaticTuple' % (key,))             # <<<<<<<<<<<<<<
+ *     if not PyBytes_CheckExact(data):
+ *         raise TypeError('expected bytes not %s' % (type(data),))
+ */
+    __pyx_t_4 = PyTuple_New(3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 350, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = 0;
+    __pyx_t_6 = 127;
+    __Pyx_INCREF(__pyx_kp_u_key_3);
+    __pyx_t_5 += 4;
+    __Pyx_GIVEREF(__pyx_kp_u_key_3);
+    PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_kp_u_key_3);
+    __pyx_t_3 = __Pyx_PyObject_FormatSimpleAndDecref(PyObject_Repr(__pyx_v_key), __pyx_empty_unicode); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 350, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_6 = (__Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_3) > __pyx_t_6) ? __Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_3) : __pyx_t_6;
+    __pyx_t_5 += __Pyx_PyUnicode_GET_LENGTH(__pyx_t_3);
+    __Pyx_GIVEREF(__pyx_t_3);
+    PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_t_3);
+    __pyx_t_3 = 0;
+    __Pyx_INCREF(__pyx_kp_u_is_not_a_StaticTuple);
+    __pyx_t_5 += 21;
+    __Pyx_GIVEREF(__pyx_kp_u_is_not_a_StaticTuple);
+    PyTuple_SET_ITEM(__pyx_t_4, 2, __pyx_kp_u_is_not_a_StaticTuple);
+    __pyx_t_3 = __Pyx_PyUnicode_Join(__pyx_t_4, 3, __pyx_t_5, __pyx_t_6); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 350, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = __Pyx_PyObject_CallOneArg(__pyx_builtin_TypeError, __pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 350, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_Raise(__pyx_t_4, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __PYX_ERR(0, 350, __pyx_L1_error)
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":349
+ *     result = _InternalNode(search_key_func=search_key_func)
+ * 
+ *     if not StaticTuple_CheckExact(key):             # <<<<<<<<<<<<<<
+ *         raise TypeError('key %r is not a StaticTuple' % (key,))
+ *     if not PyBytes_CheckExact(data):
+ */
+  }
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":351
+ *     if not StaticTuple_CheckExact(key):
+ *         raise TypeError('key %r is not a StaticTuple' % (key,))
+ *     if not PyBytes_CheckExact(data):             # <<<<<<<<<<<<<<
+ *         raise TypeError('expected bytes not %s' % (type(data),))
+ * 
+ */
+  __pyx_t_2 = ((!(PyBytes_CheckExact(__pyx_v_data) != 0)) != 0);
+  if (unlikely(__pyx_t_2)) {
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":352
+ *         raise TypeError('key %r is not a StaticTuple' % (key,))
+ *     if not PyBytes_CheckExact(data):
+ *         raise TypeError('expected bytes not %s' % (type(data),))             # <<<<<<<<<<<<<<
+ * 
+ *     c_bytes = PyBytes_AS_STRING(data)
+ */
+    __pyx_t_4 = __Pyx_PyObject_FormatSimpleAndDecref(PyObject_Unicode(((PyObject *)Py_TYPE(__pyx_v_data))), __pyx_empty_unicode); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 352, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_3 = __Pyx_PyUnicode_Concat(__pyx_kp_u_expected_bytes_not, __pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 352, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = __Pyx_PyObject_CallOneArg(__pyx_builtin_TypeError, __pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 352, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_Raise(__pyx_t_4, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __PYX_ERR(0, 352, __pyx_L1_error)
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":351
+ *     if not StaticTuple_CheckExact(key):
+ *         raise TypeError('key %r is not a StaticTuple' % (key,))
+ *     if not PyBytes_CheckExact(data):             # <<<<<<<<<<<<<<
+ *         raise TypeError('expected bytes not %s' % (type(data),))
+ * 
+ */
+  }
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":354
+ *         raise TypeError('expected bytes not %s' % (type(data),))
+ * 
+ *     c_bytes = PyBytes_AS_STRING(data)             # <<<<<<<<<<<<<<
+ *     c_bytes_len = PyBytes_GET_SIZE(data)
+ * 
+ */
+  __pyx_v_c_bytes = PyBytes_AS_STRING(__pyx_v_data);
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":355
+ * 
+ *     c_bytes = PyBytes_AS_STRING(data)
+ *     c_bytes_len = PyBytes_GET_SIZE(data)             # <<<<<<<<<<<<<<
+ * 
+ *     if c_bytes_len < 9 or memcmp(c_bytes, b"chknode:\n", 9) != 0:
+ */
+  __pyx_v_c_bytes_len = PyBytes_GET_SIZE(__pyx_v_data);
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":357
+ *     c_bytes_len = PyBytes_GET_SIZE(data)
+ * 
+ *     if c_bytes_len < 9 or memcmp(c_bytes, b"chknode:\n", 9) != 0:             # <<<<<<<<<<<<<<
+ *         raise ValueError("not a serialised internal node: %r" % data)
+ *     if c_bytes[c_bytes_len - 1] != c'\n':
+ */
+  __pyx_t_1 = ((__pyx_v_c_bytes_len < 9) != 0);
+  if (!__pyx_t_1) {
+  } else {
+    __pyx_t_2 = __pyx_t_1;
+    goto __pyx_L7_bool_binop_done;
+  }
+  __pyx_t_1 = ((memcmp(__pyx_v_c_bytes, ((char *)"chknode:\n"), 9) != 0) != 0);
+  __pyx_t_2 = __pyx_t_1;
+  __pyx_L7_bool_binop_done:;
+  if (unlikely(__pyx_t_2)) {
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":358
+ * 
+ *     if c_bytes_len < 9 or memcmp(c_bytes, b"chknode:\n", 9) != 0:
+ *         raise ValueError("not a serialised internal node: %r" % data)             # <<<<<<<<<<<<<<
+ *     if c_bytes[c_bytes_len - 1] != c'\n':
+ *         raise ValueError("bytes does not end in a newline")
+ */
+    __pyx_t_4 = __Pyx_PyUnicode_FormatSafe(__pyx_kp_u_not_a_serialised_internal_node_r, __pyx_v_data); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 358, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_builtin_ValueError, __pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 358, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __PYX_ERR(0, 358, __pyx_L1_error)
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":357
+ *     c_bytes_len = PyBytes_GET_SIZE(data)
+ * 
+ *     if c_bytes_len < 9 or memcmp(c_bytes, b"chknode:\n", 9) != 0:             # <<<<<<<<<<<<<<
+ *         raise ValueError("not a serialised internal node: %r" % data)
+ *     if c_bytes[c_bytes_len - 1] != c'\n':
+ */
+  }
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":359
+ *     if c_bytes_len < 9 or memcmp(c_bytes, b"chknode:\n", 9) != 0:
+ *         raise ValueError("not a serialised internal node: %r" % data)
+ *     if c_bytes[c_bytes_len - 1] != c'\n':             # <<<<<<<<<<<<<<
+ *         raise ValueError("bytes does not end in a newline")
+ * 
+ */
+  __pyx_t_2 = (((__pyx_v_c_bytes[(__pyx_v_c_bytes_len - 1)]) != '\n') != 0);
+  if (unlikely(__pyx_t_2)) {
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":360
+ *         raise ValueError("not a serialised internal node: %r" % data)
+ *     if c_bytes[c_bytes_len - 1] != c'\n':
+ *         raise ValueError("bytes does not end in a newline")             # <<<<<<<<<<<<<<
+ * 
+ *     items = {}
+ */
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__2, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 360, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __PYX_ERR(0, 360, __pyx_L1_error)
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":359
+ *     if c_bytes_len < 9 or memcmp(c_bytes, b"chknode:\n", 9) != 0:
+ *         raise ValueError("not a serialised internal node: %r" % data)
+ *     if c_bytes[c_bytes_len - 1] != c'\n':             # <<<<<<<<<<<<<<
+ *         raise ValueError("bytes does not end in a newline")
+ * 
+ */
+  }
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":362
+ *         raise ValueError("bytes does not end in a newline")
+ * 
+ *     items = {}             # <<<<<<<<<<<<<<
+ *     cur = c_bytes + 9
+ *     end = c_bytes + c_bytes_len
+ */
+  __pyx_t_3 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 362, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_v_items = ((PyObject*)__pyx_t_3);
+  __pyx_t_3 = 0;
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":363
+ * 
+ *     items = {}
+ *     cur = c_bytes + 9             # <<<<<<<<<<<<<<
+ *     end = c_bytes + c_bytes_len
+ *     maximum_size = _get_int_from_line(&cur, end, "maximum_size")
+ */
+  __pyx_v_cur = (__pyx_v_c_bytes + 9);
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":364
+ *     items = {}
+ *     cur = c_bytes + 9
+ *     end = c_bytes + c_bytes_len             # <<<<<<<<<<<<<<
+ *     maximum_size = _get_int_from_line(&cur, end, "maximum_size")
+ *     width = _get_int_from_line(&cur, end, "width")
+ */
+  __pyx_v_end = (__pyx_v_c_bytes + __pyx_v_c_bytes_len);
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":365
+ *     cur = c_bytes + 9
+ *     end = c_bytes + c_bytes_len
+ *     maximum_size = _get_int_from_line(&cur, end, "maximum_size")             # <<<<<<<<<<<<<<
+ *     width = _get_int_from_line(&cur, end, "width")
+ *     length = _get_int_from_line(&cur, end, "length")
+ */
+  __pyx_t_7 = __pyx_f_6breezy_3bzr_12_chk_map_pyx__get_int_from_line((&__pyx_v_cur), __pyx_v_end, ((char *)"maximum_size")); if (unlikely(__pyx_t_7 == ((int)-1))) __PYX_ERR(0, 365, __pyx_L1_error)
+  __pyx_v_maximum_size = __pyx_t_7;
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":366
+ *     end = c_bytes + c_bytes_len
+ *     maximum_size = _get_int_from_line(&cur, end, "maximum_size")
+ *     width = _get_int_from_line(&cur, end, "width")             # <<<<<<<<<<<<<<
+ *     length = _get_int_from_line(&cur, end, "length")
+ * 
+ */
+  __pyx_t_7 = __pyx_f_6breezy_3bzr_12_chk_map_pyx__get_int_from_line((&__pyx_v_cur), __pyx_v_end, ((char *)"width")); if (unlikely(__pyx_t_7 == ((int)-1))) __PYX_ERR(0, 366, __pyx_L1_error)
+  __pyx_v_width = __pyx_t_7;
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":367
+ *     maximum_size = _get_int_from_line(&cur, end, "maximum_size")
+ *     width = _get_int_from_line(&cur, end, "width")
+ *     length = _get_int_from_line(&cur, end, "length")             # <<<<<<<<<<<<<<
+ * 
+ *     next_line = <char *>memchr(cur, c'\n', end - cur)
+ */
+  __pyx_t_7 = __pyx_f_6breezy_3bzr_12_chk_map_pyx__get_int_from_line((&__pyx_v_cur), __pyx_v_end, ((char *)"length")); if (unlikely(__pyx_t_7 == ((int)-1))) __PYX_ERR(0, 367, __pyx_L1_error)
+  __pyx_v_length = __pyx_t_7;
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":369
+ *     length = _get_int_from_line(&cur, end, "length")
+ * 
+ *     next_line = <char *>memchr(cur, c'\n', end - cur)             # <<<<<<<<<<<<<<
+ *     if next_line == NULL:
+ *         raise ValueError('Missing the prefix line\n')
+ */
+  __pyx_v_next_line = ((char *)memchr(__pyx_v_cur, '\n', (__pyx_v_end - __pyx_v_cur)));
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":370
+ * 
+ *     next_line = <char *>memchr(cur, c'\n', end - cur)
+ *     if next_line == NULL:             # <<<<<<<<<<<<<<
+ *         raise ValueError('Missing the prefix line\n')
+ *     prefix = cur
+ */
+  __pyx_t_2 = ((__pyx_v_next_line == NULL) != 0);
+  if (unlikely(__pyx_t_2)) {
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":371
+ *     next_line = <char *>memchr(cur, c'\n', end - cur)
+ *     if next_line == NULL:
+ *         raise ValueError('Missing the prefix line\n')             # <<<<<<<<<<<<<<
+ *     prefix = cur
+ *     prefix_length = next_line - cur
+ */
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__3, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 371, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __PYX_ERR(0, 371, __pyx_L1_error)
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":370
+ * 
+ *     next_line = <char *>memchr(cur, c'\n', end - cur)
+ *     if next_line == NULL:             # <<<<<<<<<<<<<<
+ *         raise ValueError('Missing the prefix line\n')
+ *     prefix = cur
+ */
+  }
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":372
+ *     if next_line == NULL:
+ *         raise ValueError('Missing the prefix line\n')
+ *     prefix = cur             # <<<<<<<<<<<<<<
+ *     prefix_length = next_line - cur
+ *     cur = next_line + 1
+ */
+  __pyx_v_prefix = __pyx_v_cur;
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":373
+ *         raise ValueError('Missing the prefix line\n')
+ *     prefix = cur
+ *     prefix_length = next_line - cur             # <<<<<<<<<<<<<<
+ *     cur = next_line + 1
+ * 
+ */
+  __pyx_v_prefix_length = (__pyx_v_next_line - __pyx_v_cur);
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":374
+ *     prefix = cur
+ *     prefix_length = next_line - cur
+ *     cur = next_line + 1             # <<<<<<<<<<<<<<
+ * 
+ *     while cur < end:
+ */
+  __pyx_v_cur = (__pyx_v_next_line + 1);
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":376
+ *     cur = next_line + 1
+ * 
+ *     while cur < end:             # <<<<<<<<<<<<<<
+ *         # Find the null separator
+ *         next_line = <char *>memchr(cur, c'\n', end - cur)
+ */
+  while (1) {
+    __pyx_t_2 = ((__pyx_v_cur < __pyx_v_end) != 0);
+    if (!__pyx_t_2) break;
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":378
+ *     while cur < end:
+ *         # Find the null separator
+ *         next_line = <char *>memchr(cur, c'\n', end - cur)             # <<<<<<<<<<<<<<
+ *         if next_line == NULL:
+ *             raise ValueError('missing trailing newline')
+ */
+    __pyx_v_next_line = ((char *)memchr(__pyx_v_cur, '\n', (__pyx_v_end - __pyx_v_cur)));
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":379
+ *         # Find the null separator
+ *         next_line = <char *>memchr(cur, c'\n', end - cur)
+ *         if next_line == NULL:             # <<<<<<<<<<<<<<
+ *             raise ValueError('missing trailing newline')
+ *         next_null = <char *>_my_memrchr(cur, c'\0', next_line - cur)
+ */
+    __pyx_t_2 = ((__pyx_v_next_line == NULL) != 0);
+    if (unlikely(__pyx_t_2)) {
+
+      /* "breezy/bzr/_chk_map_pyx.pyx":380
+ *         next_line = <char *>memchr(cur, c'\n', end - cur)
+ *         if next_line == NULL:
+ *             raise ValueError('missing trailing newline')             # <<<<<<<<<<<<<<
+ *         next_null = <char *>_my_memrchr(cur, c'\0', next_line - cur)
+ *         if next_null == NULL:
+ */
+      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__7, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 380, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __PYX_ERR(0, 380, __pyx_L1_error)
+
+      /* "breezy/bzr/_chk_map_pyx.pyx":379
+ *         # Find the null separator
+ *         next_line = <char *>memchr(cur, c'\n', end - cur)
+ *         if next_line == NULL:             # <<<<<<<<<<<<<<
+ *             raise ValueError('missing trailing newline')
+ *         next_null = <char *>_my_memrchr(cur, c'\0', next_line - cur)
+ */
+    }
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":381
+ *         if next_line == NULL:
+ *             raise ValueError('missing trailing newline')
+ *         next_null = <char *>_my_memrchr(cur, c'\0', next_line - cur)             # <<<<<<<<<<<<<<
+ *         if next_null == NULL:
+ *             raise ValueError('bad no null')
+ */
+    __pyx_v_next_null = ((char *)__pyx_f_6breezy_3bzr_12_str_helpers__my_memrchr(__pyx_v_cur, '\x00', (__pyx_v_next_line - __pyx_v_cur)));
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":382
+ *             raise ValueError('missing trailing newline')
+ *         next_null = <char *>_my_memrchr(cur, c'\0', next_line - cur)
+ *         if next_null == NULL:             # <<<<<<<<<<<<<<
+ *             raise ValueError('bad no null')
+ *         item_prefix = PyBytes_FromStringAndSize(
+ */
+    __pyx_t_2 = ((__pyx_v_next_null == NULL) != 0);
+    if (unlikely(__pyx_t_2)) {
+
+      /* "breezy/bzr/_chk_map_pyx.pyx":383
+ *         next_null = <char *>_my_memrchr(cur, c'\0', next_line - cur)
+ *         if next_null == NULL:
+ *             raise ValueError('bad no null')             # <<<<<<<<<<<<<<
+ *         item_prefix = PyBytes_FromStringAndSize(
+ *             NULL, prefix_length + next_null - cur)
+ */
+      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__10, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 383, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __PYX_ERR(0, 383, __pyx_L1_error)
+
+      /* "breezy/bzr/_chk_map_pyx.pyx":382
+ *             raise ValueError('missing trailing newline')
+ *         next_null = <char *>_my_memrchr(cur, c'\0', next_line - cur)
+ *         if next_null == NULL:             # <<<<<<<<<<<<<<
+ *             raise ValueError('bad no null')
+ *         item_prefix = PyBytes_FromStringAndSize(
+ */
+    }
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":384
+ *         if next_null == NULL:
+ *             raise ValueError('bad no null')
+ *         item_prefix = PyBytes_FromStringAndSize(             # <<<<<<<<<<<<<<
+ *             NULL, prefix_length + next_null - cur)
+ *         c_item_prefix = PyBytes_AS_STRING(item_prefix)
+ */
+    __pyx_t_3 = PyBytes_FromStringAndSize(NULL, ((__pyx_v_prefix_length + __pyx_v_next_null) - __pyx_v_cur)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 384, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_XDECREF_SET(__pyx_v_item_prefix, ((PyObject*)__pyx_t_3));
+    __pyx_t_3 = 0;
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":386
+ *         item_prefix = PyBytes_FromStringAndSize(
+ *             NULL, prefix_length + next_null - cur)
+ *         c_item_prefix = PyBytes_AS_STRING(item_prefix)             # <<<<<<<<<<<<<<
+ *         if prefix_length:
+ *             memcpy(c_item_prefix, prefix, prefix_length)
+ */
+    __pyx_v_c_item_prefix = PyBytes_AS_STRING(__pyx_v_item_prefix);
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":387
+ *             NULL, prefix_length + next_null - cur)
+ *         c_item_prefix = PyBytes_AS_STRING(item_prefix)
+ *         if prefix_length:             # <<<<<<<<<<<<<<
+ *             memcpy(c_item_prefix, prefix, prefix_length)
+ *         memcpy(c_item_prefix + prefix_length, cur, next_null - cur)
+ */
+    __pyx_t_2 = (__pyx_v_prefix_length != 0);
+    if (__pyx_t_2) {
+
+      /* "breezy/bzr/_chk_map_pyx.pyx":388
+ *         c_item_prefix = PyBytes_AS_STRING(item_prefix)
+ *         if prefix_length:
+ *             memcpy(c_item_prefix, prefix, prefix_length)             # <<<<<<<<<<<<<<
+ *         memcpy(c_item_prefix + prefix_length, cur, next_null - cur)
+ *         flat_key = PyBytes_FromStringAndSize(
+ */
+      (void)(memcpy(__pyx_v_c_item_prefix, __pyx_v_prefix, __pyx_v_prefix_length));
+
+      /* "breezy/bzr/_chk_map_pyx.pyx":387
+ *             NULL, prefix_length + next_null - cur)
+ *         c_item_prefix = PyBytes_AS_STRING(item_prefix)
+ *         if prefix_length:             # <<<<<<<<<<<<<<
+ *             memcpy(c_item_prefix, prefix, prefix_length)
+ *         memcpy(c_item_prefix + prefix_length, cur, next_null - cur)
+ */
+    }
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":389
+ *         if prefix_length:
+ *             memcpy(c_item_prefix, prefix, prefix_length)
+ *         memcpy(c_item_prefix + prefix_length, cur, next_null - cur)             # <<<<<<<<<<<<<<
+ *         flat_key = PyBytes_FromStringAndSize(
+ *             next_null + 1, next_line - next_null - 1)
+ */
+    (void)(memcpy((__pyx_v_c_item_prefix + __pyx_v_prefix_length), __pyx_v_cur, (__pyx_v_next_null - __pyx_v_cur)));
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":390
+ *             memcpy(c_item_prefix, prefix, prefix_length)
+ *         memcpy(c_item_prefix + prefix_length, cur, next_null - cur)
+ *         flat_key = PyBytes_FromStringAndSize(             # <<<<<<<<<<<<<<
+ *             next_null + 1, next_line - next_null - 1)
+ *         flat_key = StaticTuple(flat_key).intern()
+ */
+    __pyx_t_3 = PyBytes_FromStringAndSize((__pyx_v_next_null + 1), ((__pyx_v_next_line - __pyx_v_next_null) - 1)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 390, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_XDECREF_SET(__pyx_v_flat_key, __pyx_t_3);
+    __pyx_t_3 = 0;
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":392
+ *         flat_key = PyBytes_FromStringAndSize(
+ *             next_null + 1, next_line - next_null - 1)
+ *         flat_key = StaticTuple(flat_key).intern()             # <<<<<<<<<<<<<<
+ *         PyDict_SetItem(items, item_prefix, flat_key)
+ *         cur = next_line + 1
+ */
+    __pyx_t_4 = __Pyx_PyObject_CallOneArg(((PyObject *)__pyx_ptype_6breezy_15_static_tuple_c_StaticTuple), __pyx_v_flat_key); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 392, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_intern); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 392, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_8))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_8);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_8);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_8, function);
+      }
+    }
+    __pyx_t_3 = (__pyx_t_4) ? __Pyx_PyObject_CallOneArg(__pyx_t_8, __pyx_t_4) : __Pyx_PyObject_CallNoArg(__pyx_t_8);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 392, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __Pyx_DECREF_SET(__pyx_v_flat_key, __pyx_t_3);
+    __pyx_t_3 = 0;
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":393
+ *             next_null + 1, next_line - next_null - 1)
+ *         flat_key = StaticTuple(flat_key).intern()
+ *         PyDict_SetItem(items, item_prefix, flat_key)             # <<<<<<<<<<<<<<
+ *         cur = next_line + 1
+ *     assert len(items) > 0
+ */
+    __pyx_t_7 = PyDict_SetItem(__pyx_v_items, __pyx_v_item_prefix, __pyx_v_flat_key); if (unlikely(__pyx_t_7 == ((int)-1))) __PYX_ERR(0, 393, __pyx_L1_error)
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":394
+ *         flat_key = StaticTuple(flat_key).intern()
+ *         PyDict_SetItem(items, item_prefix, flat_key)
+ *         cur = next_line + 1             # <<<<<<<<<<<<<<
+ *     assert len(items) > 0
+ *     result._items = items
+ */
+    __pyx_v_cur = (__pyx_v_next_line + 1);
+  }
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":395
+ *         PyDict_SetItem(items, item_prefix, flat_key)
+ *         cur = next_line + 1
+ *     assert len(items) > 0             # <<<<<<<<<<<<<<
+ *     result._items = items
+ *     result._len = length
+ */
+  #ifndef CYTHON_WITHOUT_ASSERTIONS
+  if (unlikely(__pyx_assertions_enabled())) {
+    __pyx_t_5 = PyDict_Size(__pyx_v_items); if (unlikely(__pyx_t_5 == ((Py_ssize_t)-1))) __PYX_ERR(0, 395, __pyx_L1_error)
+    if (unlikely(!((__pyx_t_5 > 0) != 0))) {
+      PyErr_SetNone(PyExc_AssertionError);
+      __PYX_ERR(0, 395, __pyx_L1_error)
+    }
+  }
+  #endif
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":396
+ *         cur = next_line + 1
+ *     assert len(items) > 0
+ *     result._items = items             # <<<<<<<<<<<<<<
+ *     result._len = length
+ *     result._maximum_size = maximum_size
+ */
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_result, __pyx_n_s_items, __pyx_v_items) < 0) __PYX_ERR(0, 396, __pyx_L1_error)
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":397
+ *     assert len(items) > 0
+ *     result._items = items
+ *     result._len = length             # <<<<<<<<<<<<<<
+ *     result._maximum_size = maximum_size
+ *     result._key = key
+ */
+  __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_length); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 397, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_result, __pyx_n_s_len, __pyx_t_3) < 0) __PYX_ERR(0, 397, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":398
+ *     result._items = items
+ *     result._len = length
+ *     result._maximum_size = maximum_size             # <<<<<<<<<<<<<<
+ *     result._key = key
+ *     result._key_width = width
+ */
+  __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_maximum_size); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 398, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_result, __pyx_n_s_maximum_size, __pyx_t_3) < 0) __PYX_ERR(0, 398, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":399
+ *     result._len = length
+ *     result._maximum_size = maximum_size
+ *     result._key = key             # <<<<<<<<<<<<<<
+ *     result._key_width = width
+ *     # XXX: InternalNodes don't really care about their size, and this will
+ */
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_result, __pyx_n_s_key_2, __pyx_v_key) < 0) __PYX_ERR(0, 399, __pyx_L1_error)
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":400
+ *     result._maximum_size = maximum_size
+ *     result._key = key
+ *     result._key_width = width             # <<<<<<<<<<<<<<
+ *     # XXX: InternalNodes don't really care about their size, and this will
+ *     #      change if we add prefix compression
+ */
+  __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_width); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 400, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_result, __pyx_n_s_key_width, __pyx_t_3) < 0) __PYX_ERR(0, 400, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":403
+ *     # XXX: InternalNodes don't really care about their size, and this will
+ *     #      change if we add prefix compression
+ *     result._raw_size = None             # <<<<<<<<<<<<<<
+ *     result._node_width = len(item_prefix)
+ *     result._search_prefix = PyBytes_FromStringAndSize(prefix, prefix_length)
+ */
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_result, __pyx_n_s_raw_size, Py_None) < 0) __PYX_ERR(0, 403, __pyx_L1_error)
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":404
+ *     #      change if we add prefix compression
+ *     result._raw_size = None
+ *     result._node_width = len(item_prefix)             # <<<<<<<<<<<<<<
+ *     result._search_prefix = PyBytes_FromStringAndSize(prefix, prefix_length)
+ *     return result
+ */
+  if (unlikely(!__pyx_v_item_prefix)) { __Pyx_RaiseUnboundLocalError("item_prefix"); __PYX_ERR(0, 404, __pyx_L1_error) }
+  if (unlikely(__pyx_v_item_prefix == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 404, __pyx_L1_error)
+  }
+  __pyx_t_5 = PyBytes_GET_SIZE(__pyx_v_item_prefix); if (unlikely(__pyx_t_5 == ((Py_ssize_t)-1))) __PYX_ERR(0, 404, __pyx_L1_error)
+  __pyx_t_3 = PyInt_FromSsize_t(__pyx_t_5); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 404, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_result, __pyx_n_s_node_width, __pyx_t_3) < 0) __PYX_ERR(0, 404, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":405
+ *     result._raw_size = None
+ *     result._node_width = len(item_prefix)
+ *     result._search_prefix = PyBytes_FromStringAndSize(prefix, prefix_length)             # <<<<<<<<<<<<<<
+ *     return result
+ * 
+ */
+  __pyx_t_3 = PyBytes_FromStringAndSize(__pyx_v_prefix, __pyx_v_prefix_length); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 405, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_result, __pyx_n_s_search_prefix, __pyx_t_3) < 0) __PYX_ERR(0, 405, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":406
+ *     result._node_width = len(item_prefix)
+ *     result._search_prefix = PyBytes_FromStringAndSize(prefix, prefix_length)
+ *     return result             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_result);
+  __pyx_r = __pyx_v_result;
+  goto __pyx_L0;
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":333
+ * 
+ * 
+ * def _deserialise_internal_node(data, key, search_key_func=None):             # <<<<<<<<<<<<<<
+ *     cdef char *c_bytes
+ *     cdef char *cur
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_AddTraceback("breezy.bzr._chk_map_pyx._deserialise_internal_node", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_result);
+  __Pyx_XDECREF(__pyx_v_items);
+  __Pyx_XDECREF(__pyx_v_item_prefix);
+  __Pyx_XDECREF(__pyx_v_flat_key);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "breezy/bzr/_chk_map_pyx.pyx":409
+ * 
+ * 
+ * def _bytes_to_text_key(data):             # <<<<<<<<<<<<<<
+ *     """Take a CHKInventory value string and return a (file_id, rev_id) tuple"""
+ *     cdef StaticTuple key
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_6breezy_3bzr_12_chk_map_pyx_9_bytes_to_text_key(PyObject *__pyx_self, PyObject *__pyx_v_data); /*proto*/
+static char __pyx_doc_6breezy_3bzr_12_chk_map_pyx_8_bytes_to_text_key[] = "Take a CHKInventory value string and return a (file_id, rev_id) tuple";
+static PyMethodDef __pyx_mdef_6breezy_3bzr_12_chk_map_pyx_9_bytes_to_text_key = {"_bytes_to_text_key", (PyCFunction)__pyx_pw_6breezy_3bzr_12_chk_map_pyx_9_bytes_to_text_key, METH_O, __pyx_doc_6breezy_3bzr_12_chk_map_pyx_8_bytes_to_text_key};
+static PyObject *__pyx_pw_6breezy_3bzr_12_chk_map_pyx_9_bytes_to_text_key(PyObject *__pyx_self, PyObject *__pyx_v_data) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("_bytes_to_text_key (wrapper)", 0);
+  __pyx_r = __pyx_pf_6breezy_3bzr_12_chk_map_pyx_8_bytes_to_text_key(__pyx_self, ((PyObject *)__pyx_v_data));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_6breezy_3bzr_12_chk_map_pyx_8_bytes_to_text_key(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_data) {
+  StaticTuple *__pyx_v_key = 0;
+  char *__pyx_v_byte_str;
+  char *__pyx_v_cur_end;
+  char *__pyx_v_file_id_str;
+  char *__pyx_v_byte_end;
+  char *__pyx_v_revision_str;
+  Py_ssize_t __pyx_v_byte_size;
+  PyObject *__pyx_v_file_id = NULL;
+  PyObject *__pyx_v_revision = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("_bytes_to_text_key", 0);
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":419
+ *     cdef Py_ssize_t byte_size, pos, file_id_len
+ * 
+ *     if not PyBytes_CheckExact(data):             # <<<<<<<<<<<<<<
+ *         raise TypeError('expected bytes not %s' % (type(data),))
+ *     byte_str = PyBytes_AS_STRING(data)
+ */
+  __pyx_t_1 = ((!(PyBytes_CheckExact(__pyx_v_data) != 0)) != 0);
+  if (unlikely(__pyx_t_1)) {
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":420
+ * 
+ *     if not PyBytes_CheckExact(data):
+ *         raise TypeError('expected bytes not %s' % (type(data),))             # <<<<<<<<<<<<<<
+ *     byte_str = PyBytes_AS_STRING(data)
+ *     byte_size = PyBytes_GET_SIZE(data)
+ */
+    __pyx_t_2 = __Pyx_PyObject_FormatSimpleAndDecref(PyObject_Unicode(((PyObject *)Py_TYPE(__pyx_v_data))), __pyx_empty_unicode); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 420, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = __Pyx_PyUnicode_Concat(__pyx_kp_u_expected_bytes_not, __pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 420, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_builtin_TypeError, __pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 420, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __PYX_ERR(0, 420, __pyx_L1_error)
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":419
+ *     cdef Py_ssize_t byte_size, pos, file_id_len
+ * 
+ *     if not PyBytes_CheckExact(data):             # <<<<<<<<<<<<<<
+ *         raise TypeError('expected bytes not %s' % (type(data),))
+ *     byte_str = PyBytes_AS_STRING(data)
+ */
+  }
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":421
+ *     if not PyBytes_CheckExact(data):
+ *         raise TypeError('expected bytes not %s' % (type(data),))
+ *     byte_str = PyBytes_AS_STRING(data)             # <<<<<<<<<<<<<<
+ *     byte_size = PyBytes_GET_SIZE(data)
+ *     byte_end = byte_str + byte_size
+ */
+  __pyx_v_byte_str = PyBytes_AS_STRING(__pyx_v_data);
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":422
+ *         raise TypeError('expected bytes not %s' % (type(data),))
+ *     byte_str = PyBytes_AS_STRING(data)
+ *     byte_size = PyBytes_GET_SIZE(data)             # <<<<<<<<<<<<<<
+ *     byte_end = byte_str + byte_size
+ *     cur_end = <char*>memchr(byte_str, c':', byte_size)
+ */
+  __pyx_v_byte_size = PyBytes_GET_SIZE(__pyx_v_data);
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":423
+ *     byte_str = PyBytes_AS_STRING(data)
+ *     byte_size = PyBytes_GET_SIZE(data)
+ *     byte_end = byte_str + byte_size             # <<<<<<<<<<<<<<
+ *     cur_end = <char*>memchr(byte_str, c':', byte_size)
+ *     if cur_end == NULL:
+ */
+  __pyx_v_byte_end = (__pyx_v_byte_str + __pyx_v_byte_size);
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":424
+ *     byte_size = PyBytes_GET_SIZE(data)
+ *     byte_end = byte_str + byte_size
+ *     cur_end = <char*>memchr(byte_str, c':', byte_size)             # <<<<<<<<<<<<<<
+ *     if cur_end == NULL:
+ *         raise ValueError('No kind section found.')
+ */
+  __pyx_v_cur_end = ((char *)memchr(__pyx_v_byte_str, ':', __pyx_v_byte_size));
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":425
+ *     byte_end = byte_str + byte_size
+ *     cur_end = <char*>memchr(byte_str, c':', byte_size)
+ *     if cur_end == NULL:             # <<<<<<<<<<<<<<
+ *         raise ValueError('No kind section found.')
+ *     if cur_end[1] != c' ':
+ */
+  __pyx_t_1 = ((__pyx_v_cur_end == NULL) != 0);
+  if (unlikely(__pyx_t_1)) {
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":426
+ *     cur_end = <char*>memchr(byte_str, c':', byte_size)
+ *     if cur_end == NULL:
+ *         raise ValueError('No kind section found.')             # <<<<<<<<<<<<<<
+ *     if cur_end[1] != c' ':
+ *         raise ValueError(
+ */
+    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__12, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 426, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __PYX_ERR(0, 426, __pyx_L1_error)
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":425
+ *     byte_end = byte_str + byte_size
+ *     cur_end = <char*>memchr(byte_str, c':', byte_size)
+ *     if cur_end == NULL:             # <<<<<<<<<<<<<<
+ *         raise ValueError('No kind section found.')
+ *     if cur_end[1] != c' ':
+ */
+  }
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":427
+ *     if cur_end == NULL:
+ *         raise ValueError('No kind section found.')
+ *     if cur_end[1] != c' ':             # <<<<<<<<<<<<<<
+ *         raise ValueError(
+ *             'Kind section should end with ": ", got %r' % str(cur_end[:2],))
+ */
+  __pyx_t_1 = (((__pyx_v_cur_end[1]) != ' ') != 0);
+  if (unlikely(__pyx_t_1)) {
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":429
+ *     if cur_end[1] != c' ':
+ *         raise ValueError(
+ *             'Kind section should end with ": ", got %r' % str(cur_end[:2],))             # <<<<<<<<<<<<<<
+ *     file_id_str = cur_end + 2
+ *     # file_id is now the data up until the next newline
+ */
+    __pyx_t_2 = __Pyx_PyBytes_FromStringAndSize(__pyx_v_cur_end + 0, 2 - 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 429, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = __Pyx_PyObject_CallOneArg(((PyObject *)(&PyUnicode_Type)), __pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 429, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_2 = PyUnicode_Format(__pyx_kp_u_Kind_section_should_end_with_got, __pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 429, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":428
+ *         raise ValueError('No kind section found.')
+ *     if cur_end[1] != c' ':
+ *         raise ValueError(             # <<<<<<<<<<<<<<
+ *             'Kind section should end with ": ", got %r' % str(cur_end[:2],))
+ *     file_id_str = cur_end + 2
+ */
+    __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_builtin_ValueError, __pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 428, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __PYX_ERR(0, 428, __pyx_L1_error)
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":427
+ *     if cur_end == NULL:
+ *         raise ValueError('No kind section found.')
+ *     if cur_end[1] != c' ':             # <<<<<<<<<<<<<<
+ *         raise ValueError(
+ *             'Kind section should end with ": ", got %r' % str(cur_end[:2],))
+ */
+  }
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":430
+ *         raise ValueError(
+ *             'Kind section should end with ": ", got %r' % str(cur_end[:2],))
+ *     file_id_str = cur_end + 2             # <<<<<<<<<<<<<<
+ *     # file_id is now the data up until the next newline
+ *     cur_end = <char*>memchr(file_id_str, c'\n', byte_end - file_id_str)
+ */
+  __pyx_v_file_id_str = (__pyx_v_cur_end + 2);
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":432
+ *     file_id_str = cur_end + 2
+ *     # file_id is now the data up until the next newline
+ *     cur_end = <char*>memchr(file_id_str, c'\n', byte_end - file_id_str)             # <<<<<<<<<<<<<<
+ *     if cur_end == NULL:
+ *         raise ValueError('no newline after file-id')
+ */
+  __pyx_v_cur_end = ((char *)memchr(__pyx_v_file_id_str, '\n', (__pyx_v_byte_end - __pyx_v_file_id_str)));
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":433
+ *     # file_id is now the data up until the next newline
+ *     cur_end = <char*>memchr(file_id_str, c'\n', byte_end - file_id_str)
+ *     if cur_end == NULL:             # <<<<<<<<<<<<<<
+ *         raise ValueError('no newline after file-id')
+ *     file_id = safe_interned_string_from_size(file_id_str,
+ */
+  __pyx_t_1 = ((__pyx_v_cur_end == NULL) != 0);
+  if (unlikely(__pyx_t_1)) {
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":434
+ *     cur_end = <char*>memchr(file_id_str, c'\n', byte_end - file_id_str)
+ *     if cur_end == NULL:
+ *         raise ValueError('no newline after file-id')             # <<<<<<<<<<<<<<
+ *     file_id = safe_interned_string_from_size(file_id_str,
+ *                                              cur_end - file_id_str)
+ */
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__13, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 434, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __PYX_ERR(0, 434, __pyx_L1_error)
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":433
+ *     # file_id is now the data up until the next newline
+ *     cur_end = <char*>memchr(file_id_str, c'\n', byte_end - file_id_str)
+ *     if cur_end == NULL:             # <<<<<<<<<<<<<<
+ *         raise ValueError('no newline after file-id')
+ *     file_id = safe_interned_string_from_size(file_id_str,
+ */
+  }
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":435
+ *     if cur_end == NULL:
+ *         raise ValueError('no newline after file-id')
+ *     file_id = safe_interned_string_from_size(file_id_str,             # <<<<<<<<<<<<<<
+ *                                              cur_end - file_id_str)
+ *     # this is the end of the parent_str
+ */
+  __pyx_t_3 = __pyx_f_6breezy_3bzr_12_str_helpers_safe_interned_string_from_size(__pyx_v_file_id_str, (__pyx_v_cur_end - __pyx_v_file_id_str)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 435, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_v_file_id = __pyx_t_3;
+  __pyx_t_3 = 0;
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":438
+ *                                              cur_end - file_id_str)
+ *     # this is the end of the parent_str
+ *     cur_end = <char*>memchr(cur_end + 1, c'\n', byte_end - cur_end - 1)             # <<<<<<<<<<<<<<
+ *     if cur_end == NULL:
+ *         raise ValueError('no newline after parent_str')
+ */
+  __pyx_v_cur_end = ((char *)memchr((__pyx_v_cur_end + 1), '\n', ((__pyx_v_byte_end - __pyx_v_cur_end) - 1)));
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":439
+ *     # this is the end of the parent_str
+ *     cur_end = <char*>memchr(cur_end + 1, c'\n', byte_end - cur_end - 1)
+ *     if cur_end == NULL:             # <<<<<<<<<<<<<<
+ *         raise ValueError('no newline after parent_str')
+ *     # end of the name str
+ */
+  __pyx_t_1 = ((__pyx_v_cur_end == NULL) != 0);
+  if (unlikely(__pyx_t_1)) {
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":440
+ *     cur_end = <char*>memchr(cur_end + 1, c'\n', byte_end - cur_end - 1)
+ *     if cur_end == NULL:
+ *         raise ValueError('no newline after parent_str')             # <<<<<<<<<<<<<<
+ *     # end of the name str
+ *     cur_end = <char*>memchr(cur_end + 1, c'\n', byte_end - cur_end - 1)
+ */
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__14, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 440, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __PYX_ERR(0, 440, __pyx_L1_error)
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":439
+ *     # this is the end of the parent_str
+ *     cur_end = <char*>memchr(cur_end + 1, c'\n', byte_end - cur_end - 1)
+ *     if cur_end == NULL:             # <<<<<<<<<<<<<<
+ *         raise ValueError('no newline after parent_str')
+ *     # end of the name str
+ */
+  }
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":442
+ *         raise ValueError('no newline after parent_str')
+ *     # end of the name str
+ *     cur_end = <char*>memchr(cur_end + 1, c'\n', byte_end - cur_end - 1)             # <<<<<<<<<<<<<<
+ *     if cur_end == NULL:
+ *         raise ValueError('no newline after name str')
+ */
+  __pyx_v_cur_end = ((char *)memchr((__pyx_v_cur_end + 1), '\n', ((__pyx_v_byte_end - __pyx_v_cur_end) - 1)));
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":443
+ *     # end of the name str
+ *     cur_end = <char*>memchr(cur_end + 1, c'\n', byte_end - cur_end - 1)
+ *     if cur_end == NULL:             # <<<<<<<<<<<<<<
+ *         raise ValueError('no newline after name str')
+ *     # the next section is the revision info
+ */
+  __pyx_t_1 = ((__pyx_v_cur_end == NULL) != 0);
+  if (unlikely(__pyx_t_1)) {
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":444
+ *     cur_end = <char*>memchr(cur_end + 1, c'\n', byte_end - cur_end - 1)
+ *     if cur_end == NULL:
+ *         raise ValueError('no newline after name str')             # <<<<<<<<<<<<<<
+ *     # the next section is the revision info
+ *     revision_str = cur_end + 1
+ */
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__15, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 444, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __PYX_ERR(0, 444, __pyx_L1_error)
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":443
+ *     # end of the name str
+ *     cur_end = <char*>memchr(cur_end + 1, c'\n', byte_end - cur_end - 1)
+ *     if cur_end == NULL:             # <<<<<<<<<<<<<<
+ *         raise ValueError('no newline after name str')
+ *     # the next section is the revision info
+ */
+  }
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":446
+ *         raise ValueError('no newline after name str')
+ *     # the next section is the revision info
+ *     revision_str = cur_end + 1             # <<<<<<<<<<<<<<
+ *     cur_end = <char*>memchr(cur_end + 1, c'\n', byte_end - cur_end - 1)
+ *     if cur_end == NULL:
+ */
+  __pyx_v_revision_str = (__pyx_v_cur_end + 1);
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":447
+ *     # the next section is the revision info
+ *     revision_str = cur_end + 1
+ *     cur_end = <char*>memchr(cur_end + 1, c'\n', byte_end - cur_end - 1)             # <<<<<<<<<<<<<<
+ *     if cur_end == NULL:
+ *         # This is probably a dir: entry, which has revision as the last item
+ */
+  __pyx_v_cur_end = ((char *)memchr((__pyx_v_cur_end + 1), '\n', ((__pyx_v_byte_end - __pyx_v_cur_end) - 1)));
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":448
+ *     revision_str = cur_end + 1
+ *     cur_end = <char*>memchr(cur_end + 1, c'\n', byte_end - cur_end - 1)
+ *     if cur_end == NULL:             # <<<<<<<<<<<<<<
+ *         # This is probably a dir: entry, which has revision as the last item
+ *         cur_end = byte_end
+ */
+  __pyx_t_1 = ((__pyx_v_cur_end == NULL) != 0);
+  if (__pyx_t_1) {
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":450
+ *     if cur_end == NULL:
+ *         # This is probably a dir: entry, which has revision as the last item
+ *         cur_end = byte_end             # <<<<<<<<<<<<<<
+ *     revision = safe_interned_string_from_size(revision_str,
+ *         cur_end - revision_str)
+ */
+    __pyx_v_cur_end = __pyx_v_byte_end;
+
+    /* "breezy/bzr/_chk_map_pyx.pyx":448
+ *     revision_str = cur_end + 1
+ *     cur_end = <char*>memchr(cur_end + 1, c'\n', byte_end - cur_end - 1)
+ *     if cur_end == NULL:             # <<<<<<<<<<<<<<
+ *         # This is probably a dir: entry, which has revision as the last item
+ *         cur_end = byte_end
+ */
+  }
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":451
+ *         # This is probably a dir: entry, which has revision as the last item
+ *         cur_end = byte_end
+ *     revision = safe_interned_string_from_size(revision_str,             # <<<<<<<<<<<<<<
+ *         cur_end - revision_str)
+ *     key = StaticTuple_New(2)
+ */
+  __pyx_t_3 = __pyx_f_6breezy_3bzr_12_str_helpers_safe_interned_string_from_size(__pyx_v_revision_str, (__pyx_v_cur_end - __pyx_v_revision_str)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 451, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_v_revision = __pyx_t_3;
+  __pyx_t_3 = 0;
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":453
+ *     revision = safe_interned_string_from_size(revision_str,
+ *         cur_end - revision_str)
+ *     key = StaticTuple_New(2)             # <<<<<<<<<<<<<<
+ *     Py_INCREF(file_id)
+ *     StaticTuple_SET_ITEM(key, 0, file_id)
+ */
+  __pyx_t_3 = ((PyObject *)StaticTuple_New(2)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 453, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_v_key = ((StaticTuple *)__pyx_t_3);
+  __pyx_t_3 = 0;
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":454
+ *         cur_end - revision_str)
+ *     key = StaticTuple_New(2)
+ *     Py_INCREF(file_id)             # <<<<<<<<<<<<<<
+ *     StaticTuple_SET_ITEM(key, 0, file_id)
+ *     Py_INCREF(revision)
+ */
+  Py_INCREF(__pyx_v_file_id);
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":455
+ *     key = StaticTuple_New(2)
+ *     Py_INCREF(file_id)
+ *     StaticTuple_SET_ITEM(key, 0, file_id)             # <<<<<<<<<<<<<<
+ *     Py_INCREF(revision)
+ *     StaticTuple_SET_ITEM(key, 1, revision)
+ */
+  StaticTuple_SET_ITEM(__pyx_v_key, 0, __pyx_v_file_id);
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":456
+ *     Py_INCREF(file_id)
+ *     StaticTuple_SET_ITEM(key, 0, file_id)
+ *     Py_INCREF(revision)             # <<<<<<<<<<<<<<
+ *     StaticTuple_SET_ITEM(key, 1, revision)
+ *     return StaticTuple_Intern(key)
+ */
+  Py_INCREF(__pyx_v_revision);
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":457
+ *     StaticTuple_SET_ITEM(key, 0, file_id)
+ *     Py_INCREF(revision)
+ *     StaticTuple_SET_ITEM(key, 1, revision)             # <<<<<<<<<<<<<<
+ *     return StaticTuple_Intern(key)
+ */
+  StaticTuple_SET_ITEM(__pyx_v_key, 1, __pyx_v_revision);
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":458
+ *     Py_INCREF(revision)
+ *     StaticTuple_SET_ITEM(key, 1, revision)
+ *     return StaticTuple_Intern(key)             # <<<<<<<<<<<<<<
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_3 = ((PyObject *)StaticTuple_Intern(__pyx_v_key)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 458, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_r = __pyx_t_3;
+  __pyx_t_3 = 0;
+  goto __pyx_L0;
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":409
+ * 
+ * 
+ * def _bytes_to_text_key(data):             # <<<<<<<<<<<<<<
+ *     """Take a CHKInventory value string and return a (file_id, rev_id) tuple"""
+ *     cdef StaticTuple key
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("breezy.bzr._chk_map_pyx._bytes_to_text_key", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_key);
+  __Pyx_XDECREF(__pyx_v_file_id);
+  __Pyx_XDECREF(__pyx_v_revision);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "_str_helpers.pxd":27
+ * 
+ * 
+ * cdef inline void* _my_memrchr(void *s, int c, size_t n): # cannot_raise             # <<<<<<<<<<<<<<
+ *     # memrchr seems to be a GNU extension, so we have to implement it ourselves
+ *     cdef char *pos
+ */
+
+static CYTHON_INLINE void *__pyx_f_6breezy_3bzr_12_str_helpers__my_memrchr(void *__pyx_v_s, int __pyx_v_c, size_t __pyx_v_n) {
+  char *__pyx_v_pos;
+  char *__pyx_v_start;
+  void *__pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  __Pyx_RefNannySetupContext("_my_memrchr", 0);
+
+  /* "_str_helpers.pxd":32
+ *     cdef char *start
+ * 
+ *     start = <char*>s             # <<<<<<<<<<<<<<
+ *     pos = start + n - 1
+ *     while pos >= start:
+ */
+  __pyx_v_start = ((char *)__pyx_v_s);
+
+  /* "_str_helpers.pxd":33
+ * 
+ *     start = <char*>s
+ *     pos = start + n - 1             # <<<<<<<<<<<<<<
+ *     while pos >= start:
+ *         if pos[0] == c:
+ */
+  __pyx_v_pos = ((__pyx_v_start + __pyx_v_n) - 1);
+
+  /* "_str_helpers.pxd":34
+ *     start = <char*>s
+ *     pos = start + n - 1
+ *     while pos >= start:             # <<<<<<<<<<<<<<
+ *         if pos[0] == c:
+ *             return <void*>pos
+ */
+  while (1) {
+    __pyx_t_1 = ((__pyx_v_pos >= __pyx_v_start) != 0);
+    if (!__pyx_t_1) break;
+
+    /* "_str_helpers.pxd":35
+ *     pos = start + n - 1
+ *     while pos >= start:
+ *         if pos[0] == c:             # <<<<<<<<<<<<<<
+ *             return <void*>pos
+ *         pos = pos - 1
+ */
+    __pyx_t_1 = (((__pyx_v_pos[0]) == __pyx_v_c) != 0);
+    if (__pyx_t_1) {
+
+      /* "_str_helpers.pxd":36
+ *     while pos >= start:
+ *         if pos[0] == c:
+ *             return <void*>pos             # <<<<<<<<<<<<<<
+ *         pos = pos - 1
+ *     return NULL
+ */
+      __pyx_r = ((void *)__pyx_v_pos);
+      goto __pyx_L0;
+
+      /* "_str_helpers.pxd":35
+ *     pos = start + n - 1
+ *     while pos >= start:
+ *         if pos[0] == c:             # <<<<<<<<<<<<<<
+ *             return <void*>pos
+ *         pos = pos - 1
+ */
+    }
+
+    /* "_str_helpers.pxd":37
+ *         if pos[0] == c:
+ *             return <void*>pos
+ *         pos = pos - 1             # <<<<<<<<<<<<<<
+ *     return NULL
+ * 
+ */
+    __pyx_v_pos = (__pyx_v_pos - 1);
+  }
+
+  /* "_str_helpers.pxd":38
+ *             return <void*>pos
+ *         pos = pos - 1
+ *     return NULL             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = NULL;
+  goto __pyx_L0;
+
+  /* "_str_helpers.pxd":27
+ * 
+ * 
+ * cdef inline void* _my_memrchr(void *s, int c, size_t n): # cannot_raise             # <<<<<<<<<<<<<<
+ *     # memrchr seems to be a GNU extension, so we have to implement it ourselves
+ *     cdef char *pos
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "_str_helpers.pxd":41
+ * 
+ * 
+ * cdef inline object safe_string_from_size(char *s, Py_ssize_t size):             # <<<<<<<<<<<<<<
+ *     if size < 0:
+ *         raise AssertionError(
+ */
+
+static CYTHON_INLINE PyObject *__pyx_f_6breezy_3bzr_12_str_helpers_safe_string_from_size(char *__pyx_v_s, Py_ssize_t __pyx_v_size) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("safe_string_from_size", 0);
+
+  /* "_str_helpers.pxd":42
+ * 
+ * cdef inline object safe_string_from_size(char *s, Py_ssize_t size):
+ *     if size < 0:             # <<<<<<<<<<<<<<
+ *         raise AssertionError(
+ *             'tried to create a string with an invalid size: %d' % size)
+ */
+  __pyx_t_1 = ((__pyx_v_size < 0) != 0);
+  if (unlikely(__pyx_t_1)) {
+
+    /* "_str_helpers.pxd":44
+ *     if size < 0:
+ *         raise AssertionError(
+ *             'tried to create a string with an invalid size: %d' % size)             # <<<<<<<<<<<<<<
+ *     return PyBytes_FromStringAndSize(s, size)
+ * 
+ */
+    __pyx_t_2 = PyInt_FromSsize_t(__pyx_v_size); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 44, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = PyUnicode_Format(__pyx_kp_u_tried_to_create_a_string_with_an, __pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 44, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+    /* "_str_helpers.pxd":43
+ * cdef inline object safe_string_from_size(char *s, Py_ssize_t size):
+ *     if size < 0:
+ *         raise AssertionError(             # <<<<<<<<<<<<<<
+ *             'tried to create a string with an invalid size: %d' % size)
+ *     return PyBytes_FromStringAndSize(s, size)
+ */
+    __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_builtin_AssertionError, __pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 43, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __PYX_ERR(1, 43, __pyx_L1_error)
+
+    /* "_str_helpers.pxd":42
+ * 
+ * cdef inline object safe_string_from_size(char *s, Py_ssize_t size):
+ *     if size < 0:             # <<<<<<<<<<<<<<
+ *         raise AssertionError(
+ *             'tried to create a string with an invalid size: %d' % size)
+ */
+  }
+
+  /* "_str_helpers.pxd":45
+ *         raise AssertionError(
+ *             'tried to create a string with an invalid size: %d' % size)
+ *     return PyBytes_FromStringAndSize(s, size)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2 = PyBytes_FromStringAndSize(__pyx_v_s, __pyx_v_size); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 45, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* "_str_helpers.pxd":41
+ * 
+ * 
+ * cdef inline object safe_string_from_size(char *s, Py_ssize_t size):             # <<<<<<<<<<<<<<
+ *     if size < 0:
+ *         raise AssertionError(
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("breezy.bzr._str_helpers.safe_string_from_size", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "_str_helpers.pxd":48
+ * 
+ * 
+ * cdef inline object safe_interned_string_from_size(char *s, Py_ssize_t size):             # <<<<<<<<<<<<<<
+ *     if size < 0:
+ *         raise AssertionError(
+ */
+
+static CYTHON_INLINE PyObject *__pyx_f_6breezy_3bzr_12_str_helpers_safe_interned_string_from_size(char *__pyx_v_s, Py_ssize_t __pyx_v_size) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("safe_interned_string_from_size", 0);
+
+  /* "_str_helpers.pxd":49
+ * 
+ * cdef inline object safe_interned_string_from_size(char *s, Py_ssize_t size):
+ *     if size < 0:             # <<<<<<<<<<<<<<
+ *         raise AssertionError(
+ *             'tried to create a string with an invalid size: %d' % size)
+ */
+  __pyx_t_1 = ((__pyx_v_size < 0) != 0);
+  if (unlikely(__pyx_t_1)) {
+
+    /* "_str_helpers.pxd":51
+ *     if size < 0:
+ *         raise AssertionError(
+ *             'tried to create a string with an invalid size: %d' % size)             # <<<<<<<<<<<<<<
+ *     return PyBytes_InternFromStringAndSize(s, size)
+ */
+    __pyx_t_2 = PyInt_FromSsize_t(__pyx_v_size); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 51, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = PyUnicode_Format(__pyx_kp_u_tried_to_create_a_string_with_an, __pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 51, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+    /* "_str_helpers.pxd":50
+ * cdef inline object safe_interned_string_from_size(char *s, Py_ssize_t size):
+ *     if size < 0:
+ *         raise AssertionError(             # <<<<<<<<<<<<<<
+ *             'tried to create a string with an invalid size: %d' % size)
+ *     return PyBytes_InternFromStringAndSize(s, size)
+ */
+    __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_builtin_AssertionError, __pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 50, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __PYX_ERR(1, 50, __pyx_L1_error)
+
+    /* "_str_helpers.pxd":49
+ * 
+ * cdef inline object safe_interned_string_from_size(char *s, Py_ssize_t size):
+ *     if size < 0:             # <<<<<<<<<<<<<<
+ *         raise AssertionError(
+ *             'tried to create a string with an invalid size: %d' % size)
+ */
+  }
+
+  /* "_str_helpers.pxd":52
+ *         raise AssertionError(
+ *             'tried to create a string with an invalid size: %d' % size)
+ *     return PyBytes_InternFromStringAndSize(s, size)             # <<<<<<<<<<<<<<
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2 = PyBytes_InternFromStringAndSize(__pyx_v_s, __pyx_v_size); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 52, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* "_str_helpers.pxd":48
+ * 
+ * 
+ * cdef inline object safe_interned_string_from_size(char *s, Py_ssize_t size):             # <<<<<<<<<<<<<<
+ *     if size < 0:
+ *         raise AssertionError(
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("breezy.bzr._str_helpers.safe_interned_string_from_size", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyMethodDef __pyx_methods[] = {
+  {0, 0, 0, 0}
+};
+
+#if PY_MAJOR_VERSION >= 3
+#if CYTHON_PEP489_MULTI_PHASE_INIT
+static PyObject* __pyx_pymod_create(PyObject *spec, PyModuleDef *def); /*proto*/
+static int __pyx_pymod_exec__chk_map_pyx(PyObject* module); /*proto*/
+static PyModuleDef_Slot __pyx_moduledef_slots[] = {
+  {Py_mod_create, (void*)__pyx_pymod_create},
+  {Py_mod_exec, (void*)__pyx_pymod_exec__chk_map_pyx},
+  {0, NULL}
+};
+#endif
+
+static struct PyModuleDef __pyx_moduledef = {
+    PyModuleDef_HEAD_INIT,
+    "_chk_map_pyx",
+    0, /* m_doc */
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+    0, /* m_size */
+  #else
+    -1, /* m_size */
+  #endif
+    __pyx_methods /* m_methods */,
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+    __pyx_moduledef_slots, /* m_slots */
+  #else
+    NULL, /* m_reload */
+  #endif
+    NULL, /* m_traverse */
+    NULL, /* m_clear */
+    NULL /* m_free */
+};
+#endif
+#ifndef CYTHON_SMALL_CODE
+#if defined(__clang__)
+    #define CYTHON_SMALL_CODE
+#elif defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 3))
+    #define CYTHON_SMALL_CODE __attribute__((cold))
+#else
+    #define CYTHON_SMALL_CODE
+#endif
+#endif
+
+static __Pyx_StringTabEntry __pyx_string_tab[] = {
+  {&__pyx_n_s_, __pyx_k_, sizeof(__pyx_k_), 0, 0, 1, 1},
+  {&__pyx_n_s_AssertionError, __pyx_k_AssertionError, sizeof(__pyx_k_AssertionError), 0, 0, 1, 1},
+  {&__pyx_kp_u_Incorrect_number_of_elements, __pyx_k_Incorrect_number_of_elements, sizeof(__pyx_k_Incorrect_number_of_elements), 0, 1, 0, 0},
+  {&__pyx_n_s_InternalNode, __pyx_k_InternalNode, sizeof(__pyx_k_InternalNode), 0, 0, 1, 1},
+  {&__pyx_kp_u_Kind_section_should_end_with_got, __pyx_k_Kind_section_should_end_with_got, sizeof(__pyx_k_Kind_section_should_end_with_got), 0, 1, 0, 0},
+  {&__pyx_n_s_LeafNode, __pyx_k_LeafNode, sizeof(__pyx_k_LeafNode), 0, 0, 1, 1},
+  {&__pyx_kp_u_Missing_s_line, __pyx_k_Missing_s_line, sizeof(__pyx_k_Missing_s_line), 0, 1, 0, 0},
+  {&__pyx_kp_u_Missing_the_prefix_line, __pyx_k_Missing_the_prefix_line, sizeof(__pyx_k_Missing_the_prefix_line), 0, 1, 0, 0},
+  {&__pyx_kp_u_No_kind_section_found, __pyx_k_No_kind_section_found, sizeof(__pyx_k_No_kind_section_found), 0, 1, 0, 0},
+  {&__pyx_kp_u_Prefix_has_too_many_nulls_versus, __pyx_k_Prefix_has_too_many_nulls_versus, sizeof(__pyx_k_Prefix_has_too_many_nulls_versus), 0, 1, 0, 0},
+  {&__pyx_kp_u_Too_many_bits_for_entry, __pyx_k_Too_many_bits_for_entry, sizeof(__pyx_k_Too_many_bits_for_entry), 0, 1, 0, 0},
+  {&__pyx_n_s_TypeError, __pyx_k_TypeError, sizeof(__pyx_k_TypeError), 0, 0, 1, 1},
+  {&__pyx_n_s_ValueError, __pyx_k_ValueError, sizeof(__pyx_k_ValueError), 0, 0, 1, 1},
+  {&__pyx_kp_u__11, __pyx_k__11, sizeof(__pyx_k__11), 0, 1, 0, 0},
+  {&__pyx_kp_u_bad_no_null, __pyx_k_bad_no_null, sizeof(__pyx_k_bad_no_null), 0, 1, 0, 0},
+  {&__pyx_kp_u_bad_no_null_bad, __pyx_k_bad_no_null_bad, sizeof(__pyx_k_bad_no_null_bad), 0, 1, 0, 0},
+  {&__pyx_n_s_breezy_bzr__chk_map_pyx, __pyx_k_breezy_bzr__chk_map_pyx, sizeof(__pyx_k_breezy_bzr__chk_map_pyx), 0, 0, 1, 1},
+  {&__pyx_kp_s_breezy_bzr__chk_map_pyx_pyx, __pyx_k_breezy_bzr__chk_map_pyx_pyx, sizeof(__pyx_k_breezy_bzr__chk_map_pyx_pyx), 0, 0, 1, 0},
+  {&__pyx_n_s_byte_end, __pyx_k_byte_end, sizeof(__pyx_k_byte_end), 0, 0, 1, 1},
+  {&__pyx_n_s_byte_size, __pyx_k_byte_size, sizeof(__pyx_k_byte_size), 0, 0, 1, 1},
+  {&__pyx_n_s_byte_str, __pyx_k_byte_str, sizeof(__pyx_k_byte_str), 0, 0, 1, 1},
+  {&__pyx_kp_u_bytes, __pyx_k_bytes, sizeof(__pyx_k_bytes), 0, 1, 0, 0},
+  {&__pyx_kp_u_bytes_does_not_end_in_a_newline, __pyx_k_bytes_does_not_end_in_a_newline, sizeof(__pyx_k_bytes_does_not_end_in_a_newline), 0, 1, 0, 0},
+  {&__pyx_n_s_bytes_to_text_key, __pyx_k_bytes_to_text_key, sizeof(__pyx_k_bytes_to_text_key), 0, 0, 1, 1},
+  {&__pyx_n_s_c_bytes, __pyx_k_c_bytes, sizeof(__pyx_k_c_bytes), 0, 0, 1, 1},
+  {&__pyx_n_s_c_bytes_len, __pyx_k_c_bytes_len, sizeof(__pyx_k_c_bytes_len), 0, 0, 1, 1},
+  {&__pyx_n_s_c_entry, __pyx_k_c_entry, sizeof(__pyx_k_c_entry), 0, 0, 1, 1},
+  {&__pyx_n_s_c_item_prefix, __pyx_k_c_item_prefix, sizeof(__pyx_k_c_item_prefix), 0, 0, 1, 1},
+  {&__pyx_n_s_c_out, __pyx_k_c_out, sizeof(__pyx_k_c_out), 0, 0, 1, 1},
+  {&__pyx_n_s_chk_map, __pyx_k_chk_map, sizeof(__pyx_k_chk_map), 0, 0, 1, 1},
+  {&__pyx_n_s_cline_in_traceback, __pyx_k_cline_in_traceback, sizeof(__pyx_k_cline_in_traceback), 0, 0, 1, 1},
+  {&__pyx_n_s_common_serialised_prefix, __pyx_k_common_serialised_prefix, sizeof(__pyx_k_common_serialised_prefix), 0, 0, 1, 1},
+  {&__pyx_n_s_crc32, __pyx_k_crc32, sizeof(__pyx_k_crc32), 0, 0, 1, 1},
+  {&__pyx_n_s_crc_val, __pyx_k_crc_val, sizeof(__pyx_k_crc_val), 0, 0, 1, 1},
+  {&__pyx_n_s_cur, __pyx_k_cur, sizeof(__pyx_k_cur), 0, 0, 1, 1},
+  {&__pyx_n_s_cur_end, __pyx_k_cur_end, sizeof(__pyx_k_cur_end), 0, 0, 1, 1},
+  {&__pyx_n_s_current_size, __pyx_k_current_size, sizeof(__pyx_k_current_size), 0, 0, 1, 1},
+  {&__pyx_kp_u_current_size_computed_incorrect, __pyx_k_current_size_computed_incorrect, sizeof(__pyx_k_current_size_computed_incorrect), 0, 1, 0, 0},
+  {&__pyx_n_u_d, __pyx_k_d, sizeof(__pyx_k_d), 0, 1, 0, 1},
+  {&__pyx_n_s_data, __pyx_k_data, sizeof(__pyx_k_data), 0, 0, 1, 1},
+  {&__pyx_n_s_deserialise_internal_node, __pyx_k_deserialise_internal_node, sizeof(__pyx_k_deserialise_internal_node), 0, 0, 1, 1},
+  {&__pyx_n_s_deserialise_leaf_node, __pyx_k_deserialise_leaf_node, sizeof(__pyx_k_deserialise_leaf_node), 0, 0, 1, 1},
+  {&__pyx_n_s_end, __pyx_k_end, sizeof(__pyx_k_end), 0, 0, 1, 1},
+  {&__pyx_n_s_entry, __pyx_k_entry, sizeof(__pyx_k_entry), 0, 0, 1, 1},
+  {&__pyx_n_s_entry_bits, __pyx_k_entry_bits, sizeof(__pyx_k_entry_bits), 0, 0, 1, 1},
+  {&__pyx_n_s_entry_start, __pyx_k_entry_start, sizeof(__pyx_k_entry_start), 0, 0, 1, 1},
+  {&__pyx_kp_u_expected_bytes_not, __pyx_k_expected_bytes_not, sizeof(__pyx_k_expected_bytes_not), 0, 1, 0, 0},
+  {&__pyx_kp_u_fail_to_find_the_num_value_lines, __pyx_k_fail_to_find_the_num_value_lines, sizeof(__pyx_k_fail_to_find_the_num_value_lines), 0, 1, 0, 0},
+  {&__pyx_n_s_file_id, __pyx_k_file_id, sizeof(__pyx_k_file_id), 0, 0, 1, 1},
+  {&__pyx_n_s_file_id_len, __pyx_k_file_id_len, sizeof(__pyx_k_file_id_len), 0, 0, 1, 1},
+  {&__pyx_n_s_file_id_str, __pyx_k_file_id_str, sizeof(__pyx_k_file_id_str), 0, 0, 1, 1},
+  {&__pyx_n_s_flat_key, __pyx_k_flat_key, sizeof(__pyx_k_flat_key), 0, 0, 1, 1},
+  {&__pyx_n_s_i, __pyx_k_i, sizeof(__pyx_k_i), 0, 0, 1, 1},
+  {&__pyx_n_s_import, __pyx_k_import, sizeof(__pyx_k_import), 0, 0, 1, 1},
+  {&__pyx_n_s_intern, __pyx_k_intern, sizeof(__pyx_k_intern), 0, 0, 1, 1},
+  {&__pyx_kp_u_is_not_a_StaticTuple, __pyx_k_is_not_a_StaticTuple, sizeof(__pyx_k_is_not_a_StaticTuple), 0, 1, 0, 0},
+  {&__pyx_kp_u_item_count, __pyx_k_item_count, sizeof(__pyx_k_item_count), 0, 1, 0, 0},
+  {&__pyx_n_s_item_prefix, __pyx_k_item_prefix, sizeof(__pyx_k_item_prefix), 0, 0, 1, 1},
+  {&__pyx_n_s_items, __pyx_k_items, sizeof(__pyx_k_items), 0, 0, 1, 1},
+  {&__pyx_n_s_items_2, __pyx_k_items_2, sizeof(__pyx_k_items_2), 0, 0, 1, 1},
+  {&__pyx_n_s_items_length, __pyx_k_items_length, sizeof(__pyx_k_items_length), 0, 0, 1, 1},
+  {&__pyx_n_s_j, __pyx_k_j, sizeof(__pyx_k_j), 0, 0, 1, 1},
+  {&__pyx_n_s_key, __pyx_k_key, sizeof(__pyx_k_key), 0, 0, 1, 1},
+  {&__pyx_n_s_key_2, __pyx_k_key_2, sizeof(__pyx_k_key_2), 0, 0, 1, 1},
+  {&__pyx_kp_u_key_3, __pyx_k_key_3, sizeof(__pyx_k_key_3), 0, 1, 0, 0},
+  {&__pyx_n_s_key_width, __pyx_k_key_width, sizeof(__pyx_k_key_width), 0, 0, 1, 1},
+  {&__pyx_n_s_last_null, __pyx_k_last_null, sizeof(__pyx_k_last_null), 0, 0, 1, 1},
+  {&__pyx_n_s_len, __pyx_k_len, sizeof(__pyx_k_len), 0, 0, 1, 1},
+  {&__pyx_n_s_length, __pyx_k_length, sizeof(__pyx_k_length), 0, 0, 1, 1},
+  {&__pyx_n_s_line_prefix, __pyx_k_line_prefix, sizeof(__pyx_k_line_prefix), 0, 0, 1, 1},
+  {&__pyx_n_s_line_start, __pyx_k_line_start, sizeof(__pyx_k_line_start), 0, 0, 1, 1},
+  {&__pyx_n_s_main, __pyx_k_main, sizeof(__pyx_k_main), 0, 0, 1, 1},
+  {&__pyx_n_s_maximum_size, __pyx_k_maximum_size, sizeof(__pyx_k_maximum_size), 0, 0, 1, 1},
+  {&__pyx_n_s_maximum_size_2, __pyx_k_maximum_size_2, sizeof(__pyx_k_maximum_size_2), 0, 0, 1, 1},
+  {&__pyx_kp_u_mismatch_for_key, __pyx_k_mismatch_for_key, sizeof(__pyx_k_mismatch_for_key), 0, 1, 0, 0},
+  {&__pyx_kp_u_missing_trailing_newline, __pyx_k_missing_trailing_newline, sizeof(__pyx_k_missing_trailing_newline), 0, 1, 0, 0},
+  {&__pyx_n_s_name, __pyx_k_name, sizeof(__pyx_k_name), 0, 0, 1, 1},
+  {&__pyx_n_s_next, __pyx_k_next, sizeof(__pyx_k_next), 0, 0, 1, 1},
+  {&__pyx_n_s_next_line, __pyx_k_next_line, sizeof(__pyx_k_next_line), 0, 0, 1, 1},
+  {&__pyx_n_s_next_null, __pyx_k_next_null, sizeof(__pyx_k_next_null), 0, 0, 1, 1},
+  {&__pyx_kp_u_no_newline_after_file_id, __pyx_k_no_newline_after_file_id, sizeof(__pyx_k_no_newline_after_file_id), 0, 1, 0, 0},
+  {&__pyx_kp_u_no_newline_after_name_str, __pyx_k_no_newline_after_name_str, sizeof(__pyx_k_no_newline_after_name_str), 0, 1, 0, 0},
+  {&__pyx_kp_u_no_newline_after_parent_str, __pyx_k_no_newline_after_parent_str, sizeof(__pyx_k_no_newline_after_parent_str), 0, 1, 0, 0},
+  {&__pyx_n_s_node_width, __pyx_k_node_width, sizeof(__pyx_k_node_width), 0, 0, 1, 1},
+  {&__pyx_kp_u_not_a_serialised_internal_node_r, __pyx_k_not_a_serialised_internal_node_r, sizeof(__pyx_k_not_a_serialised_internal_node_r), 0, 1, 0, 0},
+  {&__pyx_kp_u_not_a_serialised_leaf_node_r, __pyx_k_not_a_serialised_leaf_node_r, sizeof(__pyx_k_not_a_serialised_leaf_node_r), 0, 1, 0, 0},
+  {&__pyx_kp_u_null_line, __pyx_k_null_line, sizeof(__pyx_k_null_line), 0, 1, 0, 0},
+  {&__pyx_n_s_num_bits, __pyx_k_num_bits, sizeof(__pyx_k_num_bits), 0, 0, 1, 1},
+  {&__pyx_n_s_num_out_bytes, __pyx_k_num_out_bytes, sizeof(__pyx_k_num_out_bytes), 0, 0, 1, 1},
+  {&__pyx_n_s_num_prefix_bits, __pyx_k_num_prefix_bits, sizeof(__pyx_k_num_prefix_bits), 0, 0, 1, 1},
+  {&__pyx_n_s_num_value_lines, __pyx_k_num_value_lines, sizeof(__pyx_k_num_value_lines), 0, 0, 1, 1},
+  {&__pyx_n_s_out, __pyx_k_out, sizeof(__pyx_k_out), 0, 0, 1, 1},
+  {&__pyx_n_s_out_off, __pyx_k_out_off, sizeof(__pyx_k_out_off), 0, 0, 1, 1},
+  {&__pyx_n_s_pos, __pyx_k_pos, sizeof(__pyx_k_pos), 0, 0, 1, 1},
+  {&__pyx_n_s_prefix, __pyx_k_prefix, sizeof(__pyx_k_prefix), 0, 0, 1, 1},
+  {&__pyx_n_s_prefix_bits, __pyx_k_prefix_bits, sizeof(__pyx_k_prefix_bits), 0, 0, 1, 1},
+  {&__pyx_n_s_prefix_length, __pyx_k_prefix_length, sizeof(__pyx_k_prefix_length), 0, 0, 1, 1},
+  {&__pyx_n_s_prefix_tail, __pyx_k_prefix_tail, sizeof(__pyx_k_prefix_tail), 0, 0, 1, 1},
+  {&__pyx_n_s_prefix_tail_len, __pyx_k_prefix_tail_len, sizeof(__pyx_k_prefix_tail_len), 0, 0, 1, 1},
+  {&__pyx_n_s_raw_size, __pyx_k_raw_size, sizeof(__pyx_k_raw_size), 0, 0, 1, 1},
+  {&__pyx_n_s_result, __pyx_k_result, sizeof(__pyx_k_result), 0, 0, 1, 1},
+  {&__pyx_n_s_revision, __pyx_k_revision, sizeof(__pyx_k_revision), 0, 0, 1, 1},
+  {&__pyx_n_s_revision_str, __pyx_k_revision_str, sizeof(__pyx_k_revision_str), 0, 0, 1, 1},
+  {&__pyx_kp_u_s_line_not_a_proper_int, __pyx_k_s_line_not_a_proper_int, sizeof(__pyx_k_s_line_not_a_proper_int), 0, 1, 0, 0},
+  {&__pyx_n_s_search_key_16, __pyx_k_search_key_16, sizeof(__pyx_k_search_key_16), 0, 0, 1, 1},
+  {&__pyx_n_s_search_key_255, __pyx_k_search_key_255, sizeof(__pyx_k_search_key_255), 0, 0, 1, 1},
+  {&__pyx_n_s_search_key_func, __pyx_k_search_key_func, sizeof(__pyx_k_search_key_func), 0, 0, 1, 1},
+  {&__pyx_n_s_search_prefix, __pyx_k_search_prefix, sizeof(__pyx_k_search_prefix), 0, 0, 1, 1},
+  {&__pyx_n_s_test, __pyx_k_test, sizeof(__pyx_k_test), 0, 0, 1, 1},
+  {&__pyx_kp_u_tried_to_create_a_string_with_an, __pyx_k_tried_to_create_a_string_with_an, sizeof(__pyx_k_tried_to_create_a_string_with_an), 0, 1, 0, 0},
+  {&__pyx_n_s_unknown, __pyx_k_unknown, sizeof(__pyx_k_unknown), 0, 0, 1, 1},
+  {&__pyx_n_s_value, __pyx_k_value, sizeof(__pyx_k_value), 0, 0, 1, 1},
+  {&__pyx_n_s_value_start, __pyx_k_value_start, sizeof(__pyx_k_value_start), 0, 0, 1, 1},
+  {&__pyx_kp_u_vs, __pyx_k_vs, sizeof(__pyx_k_vs), 0, 1, 0, 0},
+  {&__pyx_n_s_width, __pyx_k_width, sizeof(__pyx_k_width), 0, 0, 1, 1},
+  {&__pyx_n_s_zlib, __pyx_k_zlib, sizeof(__pyx_k_zlib), 0, 0, 1, 1},
+  {0, 0, 0, 0, 0, 0, 0}
+};
+static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(void) {
+  __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_n_s_ValueError); if (!__pyx_builtin_ValueError) __PYX_ERR(0, 157, __pyx_L1_error)
+  __pyx_builtin_TypeError = __Pyx_GetBuiltinName(__pyx_n_s_TypeError); if (!__pyx_builtin_TypeError) __PYX_ERR(0, 207, __pyx_L1_error)
+  __pyx_builtin_AssertionError = __Pyx_GetBuiltinName(__pyx_n_s_AssertionError); if (!__pyx_builtin_AssertionError) __PYX_ERR(0, 306, __pyx_L1_error)
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+
+static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":215
+ *         raise ValueError("not a serialised leaf node: %r" % data)
+ *     if c_bytes[c_bytes_len - 1] != c'\n':
+ *         raise ValueError("bytes does not end in a newline")             # <<<<<<<<<<<<<<
+ * 
+ *     end = c_bytes + c_bytes_len
+ */
+  __pyx_tuple__2 = PyTuple_Pack(1, __pyx_kp_u_bytes_does_not_end_in_a_newline); if (unlikely(!__pyx_tuple__2)) __PYX_ERR(0, 215, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__2);
+  __Pyx_GIVEREF(__pyx_tuple__2);
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":225
+ *     next_line = <char *>memchr(cur, c'\n', end - cur)
+ *     if next_line == NULL:
+ *         raise ValueError('Missing the prefix line\n')             # <<<<<<<<<<<<<<
+ *     prefix = cur
+ *     prefix_length = next_line - cur
+ */
+  __pyx_tuple__3 = PyTuple_Pack(1, __pyx_kp_u_Missing_the_prefix_line); if (unlikely(!__pyx_tuple__3)) __PYX_ERR(0, 225, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__3);
+  __Pyx_GIVEREF(__pyx_tuple__3);
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":243
+ * 
+ *     if num_prefix_bits >= width:
+ *         raise ValueError('Prefix has too many nulls versus width')             # <<<<<<<<<<<<<<
+ * 
+ *     items_length = end - cur
+ */
+  __pyx_tuple__4 = PyTuple_Pack(1, __pyx_kp_u_Prefix_has_too_many_nulls_versus); if (unlikely(!__pyx_tuple__4)) __PYX_ERR(0, 243, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__4);
+  __Pyx_GIVEREF(__pyx_tuple__4);
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":251
+ *         next_line = <char *>memchr(cur, c'\n', end - cur)
+ *         if next_line == NULL:
+ *             raise ValueError('null line\n')             # <<<<<<<<<<<<<<
+ *         last_null = <char *>_my_memrchr(cur, c'\0', next_line - cur)
+ *         if last_null == NULL:
+ */
+  __pyx_tuple__5 = PyTuple_Pack(1, __pyx_kp_u_null_line); if (unlikely(!__pyx_tuple__5)) __PYX_ERR(0, 251, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__5);
+  __Pyx_GIVEREF(__pyx_tuple__5);
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":254
+ *         last_null = <char *>_my_memrchr(cur, c'\0', next_line - cur)
+ *         if last_null == NULL:
+ *             raise ValueError('fail to find the num value lines null')             # <<<<<<<<<<<<<<
+ *         next_null = last_null + 1 # move past NULL
+ *         num_value_lines = _get_int_from_line(&next_null, next_line + 1,
+ */
+  __pyx_tuple__6 = PyTuple_Pack(1, __pyx_kp_u_fail_to_find_the_num_value_lines); if (unlikely(!__pyx_tuple__6)) __PYX_ERR(0, 254, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__6);
+  __Pyx_GIVEREF(__pyx_tuple__6);
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":264
+ *             next_line = <char *>memchr(cur, c'\n', end - cur)
+ *             if next_line == NULL:
+ *                 raise ValueError('missing trailing newline')             # <<<<<<<<<<<<<<
+ *             cur = next_line + 1
+ *         entry_bits = StaticTuple_New(width)
+ */
+  __pyx_tuple__7 = PyTuple_Pack(1, __pyx_kp_u_missing_trailing_newline); if (unlikely(!__pyx_tuple__7)) __PYX_ERR(0, 264, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__7);
+  __Pyx_GIVEREF(__pyx_tuple__7);
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":281
+ *                                    last_null - entry_start + 1)
+ *         if next_null == NULL:
+ *             raise ValueError('bad no null, bad')             # <<<<<<<<<<<<<<
+ *         entry = PyBytes_FromStringAndSize(
+ *             NULL, prefix_tail_len + next_null - line_start)
+ */
+  __pyx_tuple__8 = PyTuple_Pack(1, __pyx_kp_u_bad_no_null_bad); if (unlikely(!__pyx_tuple__8)) __PYX_ERR(0, 281, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__8);
+  __Pyx_GIVEREF(__pyx_tuple__8);
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":295
+ *             i = i + 1
+ *             if i > width:
+ *                 raise ValueError("Too many bits for entry")             # <<<<<<<<<<<<<<
+ *             entry_start = next_null + 1
+ *             next_null = <char *>memchr(entry_start, c'\0',
+ */
+  __pyx_tuple__9 = PyTuple_Pack(1, __pyx_kp_u_Too_many_bits_for_entry); if (unlikely(!__pyx_tuple__9)) __PYX_ERR(0, 295, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__9);
+  __Pyx_GIVEREF(__pyx_tuple__9);
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":300
+ *                                        last_null - entry_start + 1)
+ *             if next_null == NULL:
+ *                 raise ValueError('bad no null')             # <<<<<<<<<<<<<<
+ *             entry = PyBytes_FromStringAndSize(
+ *                 entry_start, next_null - entry_start)
+ */
+  __pyx_tuple__10 = PyTuple_Pack(1, __pyx_kp_u_bad_no_null); if (unlikely(!__pyx_tuple__10)) __PYX_ERR(0, 300, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__10);
+  __Pyx_GIVEREF(__pyx_tuple__10);
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":426
+ *     cur_end = <char*>memchr(byte_str, c':', byte_size)
+ *     if cur_end == NULL:
+ *         raise ValueError('No kind section found.')             # <<<<<<<<<<<<<<
+ *     if cur_end[1] != c' ':
+ *         raise ValueError(
+ */
+  __pyx_tuple__12 = PyTuple_Pack(1, __pyx_kp_u_No_kind_section_found); if (unlikely(!__pyx_tuple__12)) __PYX_ERR(0, 426, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__12);
+  __Pyx_GIVEREF(__pyx_tuple__12);
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":434
+ *     cur_end = <char*>memchr(file_id_str, c'\n', byte_end - file_id_str)
+ *     if cur_end == NULL:
+ *         raise ValueError('no newline after file-id')             # <<<<<<<<<<<<<<
+ *     file_id = safe_interned_string_from_size(file_id_str,
+ *                                              cur_end - file_id_str)
+ */
+  __pyx_tuple__13 = PyTuple_Pack(1, __pyx_kp_u_no_newline_after_file_id); if (unlikely(!__pyx_tuple__13)) __PYX_ERR(0, 434, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__13);
+  __Pyx_GIVEREF(__pyx_tuple__13);
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":440
+ *     cur_end = <char*>memchr(cur_end + 1, c'\n', byte_end - cur_end - 1)
+ *     if cur_end == NULL:
+ *         raise ValueError('no newline after parent_str')             # <<<<<<<<<<<<<<
+ *     # end of the name str
+ *     cur_end = <char*>memchr(cur_end + 1, c'\n', byte_end - cur_end - 1)
+ */
+  __pyx_tuple__14 = PyTuple_Pack(1, __pyx_kp_u_no_newline_after_parent_str); if (unlikely(!__pyx_tuple__14)) __PYX_ERR(0, 440, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__14);
+  __Pyx_GIVEREF(__pyx_tuple__14);
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":444
+ *     cur_end = <char*>memchr(cur_end + 1, c'\n', byte_end - cur_end - 1)
+ *     if cur_end == NULL:
+ *         raise ValueError('no newline after name str')             # <<<<<<<<<<<<<<
+ *     # the next section is the revision info
+ *     revision_str = cur_end + 1
+ */
+  __pyx_tuple__15 = PyTuple_Pack(1, __pyx_kp_u_no_newline_after_name_str); if (unlikely(!__pyx_tuple__15)) __PYX_ERR(0, 444, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__15);
+  __Pyx_GIVEREF(__pyx_tuple__15);
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":87
+ * 
+ * 
+ * def _search_key_16(key):             # <<<<<<<<<<<<<<
+ *     """See chk_map._search_key_16."""
+ *     cdef Py_ssize_t num_bits
+ */
+  __pyx_tuple__16 = PyTuple_Pack(9, __pyx_n_s_key, __pyx_n_s_num_bits, __pyx_n_s_i, __pyx_n_s_j, __pyx_n_s_num_out_bytes, __pyx_n_s_crc_val, __pyx_n_s_out_off, __pyx_n_s_c_out, __pyx_n_s_out); if (unlikely(!__pyx_tuple__16)) __PYX_ERR(0, 87, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__16);
+  __Pyx_GIVEREF(__pyx_tuple__16);
+  __pyx_codeobj__17 = (PyObject*)__Pyx_PyCode_New(1, 0, 9, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__16, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_breezy_bzr__chk_map_pyx_pyx, __pyx_n_s_search_key_16, 87, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__17)) __PYX_ERR(0, 87, __pyx_L1_error)
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":112
+ * 
+ * 
+ * def _search_key_255(key):             # <<<<<<<<<<<<<<
+ *     """See chk_map._search_key_255."""
+ *     cdef Py_ssize_t num_bits
+ */
+  __pyx_tuple__18 = PyTuple_Pack(9, __pyx_n_s_key, __pyx_n_s_num_bits, __pyx_n_s_i, __pyx_n_s_j, __pyx_n_s_num_out_bytes, __pyx_n_s_crc_val, __pyx_n_s_out_off, __pyx_n_s_c_out, __pyx_n_s_out); if (unlikely(!__pyx_tuple__18)) __PYX_ERR(0, 112, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__18);
+  __Pyx_GIVEREF(__pyx_tuple__18);
+  __pyx_codeobj__19 = (PyObject*)__Pyx_PyCode_New(1, 0, 9, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__18, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_breezy_bzr__chk_map_pyx_pyx, __pyx_n_s_search_key_255, 112, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__19)) __PYX_ERR(0, 112, __pyx_L1_error)
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":176
+ * 
+ * 
+ * def _deserialise_leaf_node(data, key, search_key_func=None):             # <<<<<<<<<<<<<<
+ *     """Deserialise bytes, with key key, into a LeafNode.
+ * 
+ */
+  __pyx_tuple__20 = PyTuple_Pack(32, __pyx_n_s_data, __pyx_n_s_key, __pyx_n_s_search_key_func, __pyx_n_s_c_bytes, __pyx_n_s_cur, __pyx_n_s_next, __pyx_n_s_end, __pyx_n_s_next_line, __pyx_n_s_c_bytes_len, __pyx_n_s_prefix_length, __pyx_n_s_items_length, __pyx_n_s_maximum_size_2, __pyx_n_s_width, __pyx_n_s_length, __pyx_n_s_i, __pyx_n_s_prefix_tail_len, __pyx_n_s_num_value_lines, __pyx_n_s_num_prefix_bits, __pyx_n_s_prefix, __pyx_n_s_value_start, __pyx_n_s_prefix_tail, __pyx_n_s_next_null, __pyx_n_s_last_null, __pyx_n_s_line_start, __pyx_n_s_c_entry, __pyx_n_s_entry_start, __pyx_n_s_entry_bits, __pyx_n_s_result, __pyx_n_s_prefix_bits, __pyx_n_s_items_2, __pyx_n_s_entry, __pyx_n_s_value); if (unlikely(!__pyx_tuple__20)) __PYX_ERR(0, 176, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__20);
+  __Pyx_GIVEREF(__pyx_tuple__20);
+  __pyx_codeobj__21 = (PyObject*)__Pyx_PyCode_New(3, 0, 32, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__20, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_breezy_bzr__chk_map_pyx_pyx, __pyx_n_s_deserialise_leaf_node, 176, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__21)) __PYX_ERR(0, 176, __pyx_L1_error)
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":333
+ * 
+ * 
+ * def _deserialise_internal_node(data, key, search_key_func=None):             # <<<<<<<<<<<<<<
+ *     cdef char *c_bytes
+ *     cdef char *cur
+ */
+  __pyx_tuple__22 = PyTuple_Pack(22, __pyx_n_s_data, __pyx_n_s_key, __pyx_n_s_search_key_func, __pyx_n_s_c_bytes, __pyx_n_s_cur, __pyx_n_s_end, __pyx_n_s_next_line, __pyx_n_s_c_bytes_len, __pyx_n_s_prefix_length, __pyx_n_s_maximum_size_2, __pyx_n_s_width, __pyx_n_s_length, __pyx_n_s_i, __pyx_n_s_prefix_tail_len, __pyx_n_s_prefix, __pyx_n_s_line_prefix, __pyx_n_s_next_null, __pyx_n_s_c_item_prefix, __pyx_n_s_result, __pyx_n_s_items_2, __pyx_n_s_item_prefix, __pyx_n_s_flat_key); if (unlikely(!__pyx_tuple__22)) __PYX_ERR(0, 333, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__22);
+  __Pyx_GIVEREF(__pyx_tuple__22);
+  __pyx_codeobj__23 = (PyObject*)__Pyx_PyCode_New(3, 0, 22, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__22, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_breezy_bzr__chk_map_pyx_pyx, __pyx_n_s_deserialise_internal_node, 333, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__23)) __PYX_ERR(0, 333, __pyx_L1_error)
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":409
+ * 
+ * 
+ * def _bytes_to_text_key(data):             # <<<<<<<<<<<<<<
+ *     """Take a CHKInventory value string and return a (file_id, rev_id) tuple"""
+ *     cdef StaticTuple key
+ */
+  __pyx_tuple__24 = PyTuple_Pack(12, __pyx_n_s_data, __pyx_n_s_key, __pyx_n_s_byte_str, __pyx_n_s_cur_end, __pyx_n_s_file_id_str, __pyx_n_s_byte_end, __pyx_n_s_revision_str, __pyx_n_s_byte_size, __pyx_n_s_pos, __pyx_n_s_file_id_len, __pyx_n_s_file_id, __pyx_n_s_revision); if (unlikely(!__pyx_tuple__24)) __PYX_ERR(0, 409, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__24);
+  __Pyx_GIVEREF(__pyx_tuple__24);
+  __pyx_codeobj__25 = (PyObject*)__Pyx_PyCode_New(1, 0, 12, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__24, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_breezy_bzr__chk_map_pyx_pyx, __pyx_n_s_bytes_to_text_key, 409, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__25)) __PYX_ERR(0, 409, __pyx_L1_error)
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static CYTHON_SMALL_CODE int __Pyx_InitGlobals(void) {
+  /* AssertionsEnabled.init */
+  __Pyx_init_assertions_enabled();
+
+if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 1, __pyx_L1_error)
+
+  if (__Pyx_InitStrings(__pyx_string_tab) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+
+static CYTHON_SMALL_CODE int __Pyx_modinit_global_init_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_variable_export_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_function_export_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_type_init_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_type_import_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_variable_import_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_function_import_code(void); /*proto*/
+
+static int __Pyx_modinit_global_init_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_global_init_code", 0);
+  /*--- Global init code ---*/
+  __pyx_v_6breezy_3bzr_12_chk_map_pyx_crc32 = Py_None; Py_INCREF(Py_None);
+  __pyx_v_6breezy_3bzr_12_chk_map_pyx__LeafNode = Py_None; Py_INCREF(Py_None);
+  __pyx_v_6breezy_3bzr_12_chk_map_pyx__InternalNode = Py_None; Py_INCREF(Py_None);
+  __pyx_v_6breezy_3bzr_12_chk_map_pyx__unknown = Py_None; Py_INCREF(Py_None);
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_variable_export_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_export_code", 0);
+  /*--- Variable export code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_function_export_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_function_export_code", 0);
+  /*--- Function export code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_type_init_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_type_init_code", 0);
+  /*--- Type init code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_type_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__Pyx_modinit_type_import_code", 0);
+  /*--- Type import code ---*/
+  __pyx_t_1 = PyImport_ImportModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 9, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_7cpython_4type_type = __Pyx_ImportType_0_29_37(__pyx_t_1, __Pyx_BUILTIN_MODULE_NAME, "type", 
+  #if defined(PYPY_VERSION_NUM) && PYPY_VERSION_NUM < 0x050B0000
+  sizeof(PyTypeObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyTypeObject),
+  #else
+  sizeof(PyHeapTypeObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyHeapTypeObject),
+  #endif
+  __Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_7cpython_4type_type) __PYX_ERR(2, 9, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule("breezy._static_tuple_c"); if (unlikely(!__pyx_t_1)) __PYX_ERR(3, 27, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_6breezy_15_static_tuple_c_StaticTuple = __Pyx_ImportType_0_29_37(__pyx_t_1, "breezy._static_tuple_c", "StaticTuple", sizeof(StaticTuple), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(StaticTuple),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_6breezy_15_static_tuple_c_StaticTuple) __PYX_ERR(3, 27, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static int __Pyx_modinit_variable_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_import_code", 0);
+  /*--- Variable import code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_function_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_function_import_code", 0);
+  /*--- Function import code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+
+#ifndef CYTHON_NO_PYINIT_EXPORT
+#define __Pyx_PyMODINIT_FUNC PyMODINIT_FUNC
+#elif PY_MAJOR_VERSION < 3
+#ifdef __cplusplus
+#define __Pyx_PyMODINIT_FUNC extern "C" void
+#else
+#define __Pyx_PyMODINIT_FUNC void
+#endif
+#else
+#ifdef __cplusplus
+#define __Pyx_PyMODINIT_FUNC extern "C" PyObject *
+#else
+#define __Pyx_PyMODINIT_FUNC PyObject *
+#endif
+#endif
+
+
+#if PY_MAJOR_VERSION < 3
+__Pyx_PyMODINIT_FUNC init_chk_map_pyx(void) CYTHON_SMALL_CODE; /*proto*/
+__Pyx_PyMODINIT_FUNC init_chk_map_pyx(void)
+#else
+__Pyx_PyMODINIT_FUNC PyInit__chk_map_pyx(void) CYTHON_SMALL_CODE; /*proto*/
+__Pyx_PyMODINIT_FUNC PyInit__chk_map_pyx(void)
+#if CYTHON_PEP489_MULTI_PHASE_INIT
+{
+  return PyModuleDef_Init(&__pyx_moduledef);
+}
+static CYTHON_SMALL_CODE int __Pyx_check_single_interpreter(void) {
+    #if PY_VERSION_HEX >= 0x030700A1
+    static PY_INT64_T main_interpreter_id = -1;
+    PY_INT64_T current_id = PyInterpreterState_GetID(PyThreadState_Get()->interp);
+    if (main_interpreter_id == -1) {
+        main_interpreter_id = current_id;
+        return (unlikely(current_id == -1)) ? -1 : 0;
+    } else if (unlikely(main_interpreter_id != current_id))
+    #else
+    static PyInterpreterState *main_interpreter = NULL;
+    PyInterpreterState *current_interpreter = PyThreadState_Get()->interp;
+    if (!main_interpreter) {
+        main_interpreter = current_interpreter;
+    } else if (unlikely(main_interpreter != current_interpreter))
+    #endif
+    {
+        PyErr_SetString(
+            PyExc_ImportError,
+            "Interpreter change detected - this module can only be loaded into one interpreter per process.");
+        return -1;
+    }
+    return 0;
+}
+static CYTHON_SMALL_CODE int __Pyx_copy_spec_to_module(PyObject *spec, PyObject *moddict, const char* from_name, const char* to_name, int allow_none) {
+    PyObject *value = PyObject_GetAttrString(spec, from_name);
+    int result = 0;
+    if (likely(value)) {
+        if (allow_none || value != Py_None) {
+            result = PyDict_SetItemString(moddict, to_name, value);
+        }
+        Py_DECREF(value);
+    } else if (PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        PyErr_Clear();
+    } else {
+        result = -1;
+    }
+    return result;
+}
+static CYTHON_SMALL_CODE PyObject* __pyx_pymod_create(PyObject *spec, CYTHON_UNUSED PyModuleDef *def) {
+    PyObject *module = NULL, *moddict, *modname;
+    if (__Pyx_check_single_interpreter())
+        return NULL;
+    if (__pyx_m)
+        return __Pyx_NewRef(__pyx_m);
+    modname = PyObject_GetAttrString(spec, "name");
+    if (unlikely(!modname)) goto bad;
+    module = PyModule_NewObject(modname);
+    Py_DECREF(modname);
+    if (unlikely(!module)) goto bad;
+    moddict = PyModule_GetDict(module);
+    if (unlikely(!moddict)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "loader", "__loader__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "origin", "__file__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "parent", "__package__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "submodule_search_locations", "__path__", 0) < 0)) goto bad;
+    return module;
+bad:
+    Py_XDECREF(module);
+    return NULL;
+}
+
+
+static CYTHON_SMALL_CODE int __pyx_pymod_exec__chk_map_pyx(PyObject *__pyx_pyinit_module)
+#endif
+#endif
+{
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannyDeclarations
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  if (__pyx_m) {
+    if (__pyx_m == __pyx_pyinit_module) return 0;
+    PyErr_SetString(PyExc_RuntimeError, "Module '_chk_map_pyx' has already been imported. Re-initialisation is not supported.");
+    return -1;
+  }
+  #elif PY_MAJOR_VERSION >= 3
+  if (__pyx_m) return __Pyx_NewRef(__pyx_m);
+  #endif
+  #if CYTHON_REFNANNY
+__Pyx_RefNanny = __Pyx_RefNannyImportAPI("refnanny");
+if (!__Pyx_RefNanny) {
+  PyErr_Clear();
+  __Pyx_RefNanny = __Pyx_RefNannyImportAPI("Cython.Runtime.refnanny");
+  if (!__Pyx_RefNanny)
+      Py_FatalError("failed to import 'refnanny' module");
+}
+#endif
+  __Pyx_RefNannySetupContext("__Pyx_PyMODINIT_FUNC PyInit__chk_map_pyx(void)", 0);
+  if (__Pyx_check_binary_version() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #ifdef __Pxy_PyFrame_Initialize_Offsets
+  __Pxy_PyFrame_Initialize_Offsets();
+  #endif
+  __pyx_empty_tuple = PyTuple_New(0); if (unlikely(!__pyx_empty_tuple)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_empty_bytes = PyBytes_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_bytes)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_empty_unicode = PyUnicode_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_unicode)) __PYX_ERR(0, 1, __pyx_L1_error)
+  #ifdef __Pyx_CyFunction_USED
+  if (__pyx_CyFunction_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_FusedFunction_USED
+  if (__pyx_FusedFunction_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_Coroutine_USED
+  if (__pyx_Coroutine_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_Generator_USED
+  if (__pyx_Generator_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_AsyncGen_USED
+  if (__pyx_AsyncGen_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_StopAsyncIteration_USED
+  if (__pyx_StopAsyncIteration_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  /*--- Library function declarations ---*/
+  /*--- Threads initialization code ---*/
+  #if defined(WITH_THREAD) && PY_VERSION_HEX < 0x030700F0 && defined(__PYX_FORCE_INIT_THREADS) && __PYX_FORCE_INIT_THREADS
+  PyEval_InitThreads();
+  #endif
+  /*--- Module creation code ---*/
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  __pyx_m = __pyx_pyinit_module;
+  Py_INCREF(__pyx_m);
+  #else
+  #if PY_MAJOR_VERSION < 3
+  __pyx_m = Py_InitModule4("_chk_map_pyx", __pyx_methods, 0, 0, PYTHON_API_VERSION); Py_XINCREF(__pyx_m);
+  #else
+  __pyx_m = PyModule_Create(&__pyx_moduledef);
+  #endif
+  if (unlikely(!__pyx_m)) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  __pyx_d = PyModule_GetDict(__pyx_m); if (unlikely(!__pyx_d)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_d);
+  __pyx_b = PyImport_AddModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_b)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_b);
+  __pyx_cython_runtime = PyImport_AddModule((char *) "cython_runtime"); if (unlikely(!__pyx_cython_runtime)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_cython_runtime);
+  if (PyObject_SetAttrString(__pyx_m, "__builtins__", __pyx_b) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Initialize various global constants etc. ---*/
+  if (__Pyx_InitGlobals() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #if PY_MAJOR_VERSION < 3 && (__PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT)
+  if (__Pyx_init_sys_getdefaultencoding_params() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  if (__pyx_module_is_main_breezy__bzr___chk_map_pyx) {
+    if (PyObject_SetAttr(__pyx_m, __pyx_n_s_name, __pyx_n_s_main) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  }
+  #if PY_MAJOR_VERSION >= 3
+  {
+    PyObject *modules = PyImport_GetModuleDict(); if (unlikely(!modules)) __PYX_ERR(0, 1, __pyx_L1_error)
+    if (!PyDict_GetItemString(modules, "breezy.bzr._chk_map_pyx")) {
+      if (unlikely(PyDict_SetItemString(modules, "breezy.bzr._chk_map_pyx", __pyx_m) < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+    }
+  }
+  #endif
+  /*--- Builtin init code ---*/
+  if (__Pyx_InitCachedBuiltins() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Constants init code ---*/
+  if (__Pyx_InitCachedConstants() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Global type/function init code ---*/
+  (void)__Pyx_modinit_global_init_code();
+  (void)__Pyx_modinit_variable_export_code();
+  (void)__Pyx_modinit_function_export_code();
+  (void)__Pyx_modinit_type_init_code();
+  if (unlikely(__Pyx_modinit_type_import_code() < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  (void)__Pyx_modinit_variable_import_code();
+  (void)__Pyx_modinit_function_import_code();
+  /*--- Execution code ---*/
+  #if defined(__Pyx_Generator_USED) || defined(__Pyx_Coroutine_USED)
+  if (__Pyx_patch_abc() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":74
+ * 
+ * # Set up the StaticTuple C_API functionality
+ * import_static_tuple_c()             # <<<<<<<<<<<<<<
+ * 
+ * cdef object crc32
+ */
+  __pyx_t_1 = import_static_tuple_c(); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 74, __pyx_L1_error)
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":77
+ * 
+ * cdef object crc32
+ * from zlib import crc32             # <<<<<<<<<<<<<<
+ * 
+ * cdef object _LeafNode
+ */
+  __pyx_t_2 = PyList_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 77, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(__pyx_n_s_crc32);
+  __Pyx_GIVEREF(__pyx_n_s_crc32);
+  PyList_SET_ITEM(__pyx_t_2, 0, __pyx_n_s_crc32);
+  __pyx_t_3 = __Pyx_Import(__pyx_n_s_zlib, __pyx_t_2, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 77, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_ImportFrom(__pyx_t_3, __pyx_n_s_crc32); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 77, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(__pyx_t_2);
+  __Pyx_XGOTREF(__pyx_v_6breezy_3bzr_12_chk_map_pyx_crc32);
+  __Pyx_DECREF_SET(__pyx_v_6breezy_3bzr_12_chk_map_pyx_crc32, __pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":80
+ * 
+ * cdef object _LeafNode
+ * _LeafNode = None             # <<<<<<<<<<<<<<
+ * cdef object _InternalNode
+ * _InternalNode = None
+ */
+  __Pyx_INCREF(Py_None);
+  __Pyx_XGOTREF(__pyx_v_6breezy_3bzr_12_chk_map_pyx__LeafNode);
+  __Pyx_DECREF_SET(__pyx_v_6breezy_3bzr_12_chk_map_pyx__LeafNode, Py_None);
+  __Pyx_GIVEREF(Py_None);
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":82
+ * _LeafNode = None
+ * cdef object _InternalNode
+ * _InternalNode = None             # <<<<<<<<<<<<<<
+ * cdef object _unknown
+ * _unknown = None
+ */
+  __Pyx_INCREF(Py_None);
+  __Pyx_XGOTREF(__pyx_v_6breezy_3bzr_12_chk_map_pyx__InternalNode);
+  __Pyx_DECREF_SET(__pyx_v_6breezy_3bzr_12_chk_map_pyx__InternalNode, Py_None);
+  __Pyx_GIVEREF(Py_None);
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":84
+ * _InternalNode = None
+ * cdef object _unknown
+ * _unknown = None             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_INCREF(Py_None);
+  __Pyx_XGOTREF(__pyx_v_6breezy_3bzr_12_chk_map_pyx__unknown);
+  __Pyx_DECREF_SET(__pyx_v_6breezy_3bzr_12_chk_map_pyx__unknown, Py_None);
+  __Pyx_GIVEREF(Py_None);
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":87
+ * 
+ * 
+ * def _search_key_16(key):             # <<<<<<<<<<<<<<
+ *     """See chk_map._search_key_16."""
+ *     cdef Py_ssize_t num_bits
+ */
+  __pyx_t_3 = PyCFunction_NewEx(&__pyx_mdef_6breezy_3bzr_12_chk_map_pyx_1_search_key_16, NULL, __pyx_n_s_breezy_bzr__chk_map_pyx); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 87, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_search_key_16, __pyx_t_3) < 0) __PYX_ERR(0, 87, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":112
+ * 
+ * 
+ * def _search_key_255(key):             # <<<<<<<<<<<<<<
+ *     """See chk_map._search_key_255."""
+ *     cdef Py_ssize_t num_bits
+ */
+  __pyx_t_3 = PyCFunction_NewEx(&__pyx_mdef_6breezy_3bzr_12_chk_map_pyx_3_search_key_255, NULL, __pyx_n_s_breezy_bzr__chk_map_pyx); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 112, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_search_key_255, __pyx_t_3) < 0) __PYX_ERR(0, 112, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":176
+ * 
+ * 
+ * def _deserialise_leaf_node(data, key, search_key_func=None):             # <<<<<<<<<<<<<<
+ *     """Deserialise bytes, with key key, into a LeafNode.
+ * 
+ */
+  __pyx_t_3 = PyCFunction_NewEx(&__pyx_mdef_6breezy_3bzr_12_chk_map_pyx_5_deserialise_leaf_node, NULL, __pyx_n_s_breezy_bzr__chk_map_pyx); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 176, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_deserialise_leaf_node, __pyx_t_3) < 0) __PYX_ERR(0, 176, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":333
+ * 
+ * 
+ * def _deserialise_internal_node(data, key, search_key_func=None):             # <<<<<<<<<<<<<<
+ *     cdef char *c_bytes
+ *     cdef char *cur
+ */
+  __pyx_t_3 = PyCFunction_NewEx(&__pyx_mdef_6breezy_3bzr_12_chk_map_pyx_7_deserialise_internal_node, NULL, __pyx_n_s_breezy_bzr__chk_map_pyx); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 333, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_deserialise_internal_node, __pyx_t_3) < 0) __PYX_ERR(0, 333, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":409
+ * 
+ * 
+ * def _bytes_to_text_key(data):             # <<<<<<<<<<<<<<
+ *     """Take a CHKInventory value string and return a (file_id, rev_id) tuple"""
+ *     cdef StaticTuple key
+ */
+  __pyx_t_3 = PyCFunction_NewEx(&__pyx_mdef_6breezy_3bzr_12_chk_map_pyx_9_bytes_to_text_key, NULL, __pyx_n_s_breezy_bzr__chk_map_pyx); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 409, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_bytes_to_text_key, __pyx_t_3) < 0) __PYX_ERR(0, 409, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "breezy/bzr/_chk_map_pyx.pyx":1
+ * # Copyright (C) 2009, 2010 Canonical Ltd             # <<<<<<<<<<<<<<
+ * #
+ * # This program is free software; you can redistribute it and/or modify
+ */
+  __pyx_t_3 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_3) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "_str_helpers.pxd":48
+ * 
+ * 
+ * cdef inline object safe_interned_string_from_size(char *s, Py_ssize_t size):             # <<<<<<<<<<<<<<
+ *     if size < 0:
+ *         raise AssertionError(
+ */
+
+  /*--- Wrapped vars code ---*/
+
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  if (__pyx_m) {
+    if (__pyx_d) {
+      __Pyx_AddTraceback("init breezy.bzr._chk_map_pyx", __pyx_clineno, __pyx_lineno, __pyx_filename);
+    }
+    Py_CLEAR(__pyx_m);
+  } else if (!PyErr_Occurred()) {
+    PyErr_SetString(PyExc_ImportError, "init breezy.bzr._chk_map_pyx");
+  }
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  return (__pyx_m != NULL) ? 0 : -1;
+  #elif PY_MAJOR_VERSION >= 3
+  return __pyx_m;
+  #else
+  return;
+  #endif
+}
+
+/* --- Runtime support code --- */
+/* Refnanny */
+#if CYTHON_REFNANNY
+static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname) {
+    PyObject *m = NULL, *p = NULL;
+    void *r = NULL;
+    m = PyImport_ImportModule(modname);
+    if (!m) goto end;
+    p = PyObject_GetAttrString(m, "RefNannyAPI");
+    if (!p) goto end;
+    r = PyLong_AsVoidPtr(p);
+end:
+    Py_XDECREF(p);
+    Py_XDECREF(m);
+    return (__Pyx_RefNannyAPIStruct *)r;
+}
+#endif
+
+/* PyObjectGetAttrStr */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name) {
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro))
+        return tp->tp_getattro(obj, attr_name);
+#if PY_MAJOR_VERSION < 3
+    if (likely(tp->tp_getattr))
+        return tp->tp_getattr(obj, PyString_AS_STRING(attr_name));
+#endif
+    return PyObject_GetAttr(obj, attr_name);
+}
+#endif
+
+/* GetBuiltinName */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name) {
+    PyObject* result = __Pyx_PyObject_GetAttrStr(__pyx_b, name);
+    if (unlikely(!result)) {
+        PyErr_Format(PyExc_NameError,
+#if PY_MAJOR_VERSION >= 3
+            "name '%U' is not defined", name);
+#else
+            "name '%.200s' is not defined", PyString_AS_STRING(name));
+#endif
+    }
+    return result;
+}
+
+/* GetItemInt */
+static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j) {
+    PyObject *r;
+    if (!j) return NULL;
+    r = PyObject_GetItem(o, j);
+    Py_DECREF(j);
+    return r;
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
+                                                              CYTHON_NCP_UNUSED int wraparound,
+                                                              CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    Py_ssize_t wrapped_i = i;
+    if (wraparound & unlikely(i < 0)) {
+        wrapped_i += PyList_GET_SIZE(o);
+    }
+    if ((!boundscheck) || likely(__Pyx_is_valid_index(wrapped_i, PyList_GET_SIZE(o)))) {
+        PyObject *r = PyList_GET_ITEM(o, wrapped_i);
+        Py_INCREF(r);
+        return r;
+    }
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+#else
+    return PySequence_GetItem(o, i);
+#endif
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
+                                                              CYTHON_NCP_UNUSED int wraparound,
+                                                              CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    Py_ssize_t wrapped_i = i;
+    if (wraparound & unlikely(i < 0)) {
+        wrapped_i += PyTuple_GET_SIZE(o);
+    }
+    if ((!boundscheck) || likely(__Pyx_is_valid_index(wrapped_i, PyTuple_GET_SIZE(o)))) {
+        PyObject *r = PyTuple_GET_ITEM(o, wrapped_i);
+        Py_INCREF(r);
+        return r;
+    }
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+#else
+    return PySequence_GetItem(o, i);
+#endif
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i, int is_list,
+                                                     CYTHON_NCP_UNUSED int wraparound,
+                                                     CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS && CYTHON_USE_TYPE_SLOTS
+    if (is_list || PyList_CheckExact(o)) {
+        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyList_GET_SIZE(o);
+        if ((!boundscheck) || (likely(__Pyx_is_valid_index(n, PyList_GET_SIZE(o))))) {
+            PyObject *r = PyList_GET_ITEM(o, n);
+            Py_INCREF(r);
+            return r;
+        }
+    }
+    else if (PyTuple_CheckExact(o)) {
+        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyTuple_GET_SIZE(o);
+        if ((!boundscheck) || likely(__Pyx_is_valid_index(n, PyTuple_GET_SIZE(o)))) {
+            PyObject *r = PyTuple_GET_ITEM(o, n);
+            Py_INCREF(r);
+            return r;
+        }
+    } else {
+        PySequenceMethods *m = Py_TYPE(o)->tp_as_sequence;
+        if (likely(m && m->sq_item)) {
+            if (wraparound && unlikely(i < 0) && likely(m->sq_length)) {
+                Py_ssize_t l = m->sq_length(o);
+                if (likely(l >= 0)) {
+                    i += l;
+                } else {
+                    if (!PyErr_ExceptionMatches(PyExc_OverflowError))
+                        return NULL;
+                    PyErr_Clear();
+                }
+            }
+            return m->sq_item(o, i);
+        }
+    }
+#else
+    if (is_list || PySequence_Check(o)) {
+        return PySequence_GetItem(o, i);
+    }
+#endif
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+}
+
+/* PyCFunctionFastCall */
+#if CYTHON_FAST_PYCCALL
+static CYTHON_INLINE PyObject * __Pyx_PyCFunction_FastCall(PyObject *func_obj, PyObject **args, Py_ssize_t nargs) {
+    PyCFunctionObject *func = (PyCFunctionObject*)func_obj;
+    PyCFunction meth = PyCFunction_GET_FUNCTION(func);
+    PyObject *self = PyCFunction_GET_SELF(func);
+    int flags = PyCFunction_GET_FLAGS(func);
+    assert(PyCFunction_Check(func));
+    assert(METH_FASTCALL == (flags & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS | METH_STACKLESS)));
+    assert(nargs >= 0);
+    assert(nargs == 0 || args != NULL);
+    /* _PyCFunction_FastCallDict() must not be called with an exception set,
+       because it may clear it (directly or indirectly) and so the
+       caller loses its exception */
+    assert(!PyErr_Occurred());
+    if ((PY_VERSION_HEX < 0x030700A0) || unlikely(flags & METH_KEYWORDS)) {
+        return (*((__Pyx_PyCFunctionFastWithKeywords)(void*)meth)) (self, args, nargs, NULL);
+    } else {
+        return (*((__Pyx_PyCFunctionFast)(void*)meth)) (self, args, nargs);
+    }
+}
+#endif
+
+/* PyFunctionFastCall */
+#if CYTHON_FAST_PYCALL
+static PyObject* __Pyx_PyFunction_FastCallNoKw(PyCodeObject *co, PyObject **args, Py_ssize_t na,
+                                               PyObject *globals) {
+    PyFrameObject *f;
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject **fastlocals;
+    Py_ssize_t i;
+    PyObject *result;
+    assert(globals != NULL);
+    /* XXX Perhaps we should create a specialized
+       PyFrame_New() that doesn't take locals, but does
+       take builtins without sanity checking them.
+       */
+    assert(tstate != NULL);
+    f = PyFrame_New(tstate, co, globals, NULL);
+    if (f == NULL) {
+        return NULL;
+    }
+    fastlocals = __Pyx_PyFrame_GetLocalsplus(f);
+    for (i = 0; i < na; i++) {
+        Py_INCREF(*args);
+        fastlocals[i] = *args++;
+    }
+    result = PyEval_EvalFrameEx(f,0);
+    ++tstate->recursion_depth;
+    Py_DECREF(f);
+    --tstate->recursion_depth;
+    return result;
+}
+#if 1 || PY_VERSION_HEX < 0x030600B1
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, Py_ssize_t nargs, PyObject *kwargs) {
+    PyCodeObject *co = (PyCodeObject *)PyFunction_GET_CODE(func);
+    PyObject *globals = PyFunction_GET_GLOBALS(func);
+    PyObject *argdefs = PyFunction_GET_DEFAULTS(func);
+    PyObject *closure;
+#if PY_MAJOR_VERSION >= 3
+    PyObject *kwdefs;
+#endif
+    PyObject *kwtuple, **k;
+    PyObject **d;
+    Py_ssize_t nd;
+    Py_ssize_t nk;
+    PyObject *result;
+    assert(kwargs == NULL || PyDict_Check(kwargs));
+    nk = kwargs ? PyDict_Size(kwargs) : 0;
+    if (Py_EnterRecursiveCall((char*)" while calling a Python object")) {
+        return NULL;
+    }
+    if (
+#if PY_MAJOR_VERSION >= 3
+            co->co_kwonlyargcount == 0 &&
+#endif
+            likely(kwargs == NULL || nk == 0) &&
+            co->co_flags == (CO_OPTIMIZED | CO_NEWLOCALS | CO_NOFREE)) {
+        if (argdefs == NULL && co->co_argcount == nargs) {
+            result = __Pyx_PyFunction_FastCallNoKw(co, args, nargs, globals);
+            goto done;
+        }
+        else if (nargs == 0 && argdefs != NULL
+                 && co->co_argcount == Py_SIZE(argdefs)) {
+            /* function called with no arguments, but all parameters have
+               a default value: use default values as arguments .*/
+            args = &PyTuple_GET_ITEM(argdefs, 0);
+            result =__Pyx_PyFunction_FastCallNoKw(co, args, Py_SIZE(argdefs), globals);
+            goto done;
+        }
+    }
+    if (kwargs != NULL) {
+        Py_ssize_t pos, i;
+        kwtuple = PyTuple_New(2 * nk);
+        if (kwtuple == NULL) {
+            result = NULL;
+            goto done;
+        }
+        k = &PyTuple_GET_ITEM(kwtuple, 0);
+        pos = i = 0;
+        while (PyDict_Next(kwargs, &pos, &k[i], &k[i+1])) {
+            Py_INCREF(k[i]);
+            Py_INCREF(k[i+1]);
+            i += 2;
+        }
+        nk = i / 2;
+    }
+    else {
+        kwtuple = NULL;
+        k = NULL;
+    }
+    closure = PyFunction_GET_CLOSURE(func);
+#if PY_MAJOR_VERSION >= 3
+    kwdefs = PyFunction_GET_KW_DEFAULTS(func);
+#endif
+    if (argdefs != NULL) {
+        d = &PyTuple_GET_ITEM(argdefs, 0);
+        nd = Py_SIZE(argdefs);
+    }
+    else {
+        d = NULL;
+        nd = 0;
+    }
+#if PY_MAJOR_VERSION >= 3
+    result = PyEval_EvalCodeEx((PyObject*)co, globals, (PyObject *)NULL,
+                               args, (int)nargs,
+                               k, (int)nk,
+                               d, (int)nd, kwdefs, closure);
+#else
+    result = PyEval_EvalCodeEx(co, globals, (PyObject *)NULL,
+                               args, (int)nargs,
+                               k, (int)nk,
+                               d, (int)nd, closure);
+#endif
+    Py_XDECREF(kwtuple);
+done:
+    Py_LeaveRecursiveCall();
+    return result;
+}
+#endif
+#endif
+
+/* PyObjectCall */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw) {
+    PyObject *result;
+    ternaryfunc call = Py_TYPE(func)->tp_call;
+    if (unlikely(!call))
+        return PyObject_Call(func, arg, kw);
+    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
+        return NULL;
+    result = (*call)(func, arg, kw);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
+}
+#endif
+
+/* PyObjectCall2Args */
+static CYTHON_UNUSED PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2) {
+    PyObject *args, *result = NULL;
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(function)) {
+        PyObject *args[2] = {arg1, arg2};
+        return __Pyx_PyFunction_FastCall(function, args, 2);
+    }
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(function)) {
+        PyObject *args[2] = {arg1, arg2};
+        return __Pyx_PyCFunction_FastCall(function, args, 2);
+    }
+    #endif
+    args = PyTuple_New(2);
+    if (unlikely(!args)) goto done;
+    Py_INCREF(arg1);
+    PyTuple_SET_ITEM(args, 0, arg1);
+    Py_INCREF(arg2);
+    PyTuple_SET_ITEM(args, 1, arg2);
+    Py_INCREF(function);
+    result = __Pyx_PyObject_Call(function, args, NULL);
+    Py_DECREF(args);
+    Py_DECREF(function);
+done:
+    return result;
+}
+
+/* PyObjectCallMethO */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg) {
+    PyObject *self, *result;
+    PyCFunction cfunc;
+    cfunc = PyCFunction_GET_FUNCTION(func);
+    self = PyCFunction_GET_SELF(func);
+    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
+        return NULL;
+    result = cfunc(self, arg);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
+}
+#endif
+
+/* PyObjectCallOneArg */
+#if CYTHON_COMPILING_IN_CPYTHON
+static PyObject* __Pyx__PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+    PyObject *result;
+    PyObject *args = PyTuple_New(1);
+    if (unlikely(!args)) return NULL;
+    Py_INCREF(arg);
+    PyTuple_SET_ITEM(args, 0, arg);
+    result = __Pyx_PyObject_Call(func, args, NULL);
+    Py_DECREF(args);
+    return result;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+#if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(func)) {
+        return __Pyx_PyFunction_FastCall(func, &arg, 1);
+    }
+#endif
+    if (likely(PyCFunction_Check(func))) {
+        if (likely(PyCFunction_GET_FLAGS(func) & METH_O)) {
+            return __Pyx_PyObject_CallMethO(func, arg);
+#if CYTHON_FAST_PYCCALL
+        } else if (__Pyx_PyFastCFunction_Check(func)) {
+            return __Pyx_PyCFunction_FastCall(func, &arg, 1);
+#endif
+        }
+    }
+    return __Pyx__PyObject_CallOneArg(func, arg);
+}
+#else
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+    PyObject *result;
+    PyObject *args = PyTuple_Pack(1, arg);
+    if (unlikely(!args)) return NULL;
+    result = __Pyx_PyObject_Call(func, args, NULL);
+    Py_DECREF(args);
+    return result;
+}
+#endif
+
+/* PyErrFetchRestore */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    tmp_type = tstate->curexc_type;
+    tmp_value = tstate->curexc_value;
+    tmp_tb = tstate->curexc_traceback;
+    tstate->curexc_type = type;
+    tstate->curexc_value = value;
+    tstate->curexc_traceback = tb;
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+}
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+    *type = tstate->curexc_type;
+    *value = tstate->curexc_value;
+    *tb = tstate->curexc_traceback;
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+}
+#endif
+
+/* RaiseException */
+#if PY_MAJOR_VERSION < 3
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb,
+                        CYTHON_UNUSED PyObject *cause) {
+    __Pyx_PyThreadState_declare
+    Py_XINCREF(type);
+    if (!value || value == Py_None)
+        value = NULL;
+    else
+        Py_INCREF(value);
+    if (!tb || tb == Py_None)
+        tb = NULL;
+    else {
+        Py_INCREF(tb);
+        if (!PyTraceBack_Check(tb)) {
+            PyErr_SetString(PyExc_TypeError,
+                "raise: arg 3 must be a traceback or None");
+            goto raise_error;
+        }
+    }
+    if (PyType_Check(type)) {
+#if CYTHON_COMPILING_IN_PYPY
+        if (!value) {
+            Py_INCREF(Py_None);
+            value = Py_None;
+        }
+#endif
+        PyErr_NormalizeException(&type, &value, &tb);
+    } else {
+        if (value) {
+            PyErr_SetString(PyExc_TypeError,
+                "instance exception may not have a separate value");
+            goto raise_error;
+        }
+        value = type;
+        type = (PyObject*) Py_TYPE(type);
+        Py_INCREF(type);
+        if (!PyType_IsSubtype((PyTypeObject *)type, (PyTypeObject *)PyExc_BaseException)) {
+            PyErr_SetString(PyExc_TypeError,
+                "raise: exception class must be a subclass of BaseException");
+            goto raise_error;
+        }
+    }
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrRestore(type, value, tb);
+    return;
+raise_error:
+    Py_XDECREF(value);
+    Py_XDECREF(type);
+    Py_XDECREF(tb);
+    return;
+}
+#else
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause) {
+    PyObject* owned_instance = NULL;
+    if (tb == Py_None) {
+        tb = 0;
+    } else if (tb && !PyTraceBack_Check(tb)) {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: arg 3 must be a traceback or None");
+        goto bad;
+    }
+    if (value == Py_None)
+        value = 0;
+    if (PyExceptionInstance_Check(type)) {
+        if (value) {
+            PyErr_SetString(PyExc_TypeError,
+                "instance exception may not have a separate value");
+            goto bad;
+        }
+        value = type;
+        type = (PyObject*) Py_TYPE(value);
+    } else if (PyExceptionClass_Check(type)) {
+        PyObject *instance_class = NULL;
+        if (value && PyExceptionInstance_Check(value)) {
+            instance_class = (PyObject*) Py_TYPE(value);
+            if (instance_class != type) {
+                int is_subclass = PyObject_IsSubclass(instance_class, type);
+                if (!is_subclass) {
+                    instance_class = NULL;
+                } else if (unlikely(is_subclass == -1)) {
+                    goto bad;
+                } else {
+                    type = instance_class;
+                }
+            }
+        }
+        if (!instance_class) {
+            PyObject *args;
+            if (!value)
+                args = PyTuple_New(0);
+            else if (PyTuple_Check(value)) {
+                Py_INCREF(value);
+                args = value;
+            } else
+                args = PyTuple_Pack(1, value);
+            if (!args)
+                goto bad;
+            owned_instance = PyObject_Call(type, args, NULL);
+            Py_DECREF(args);
+            if (!owned_instance)
+                goto bad;
+            value = owned_instance;
+            if (!PyExceptionInstance_Check(value)) {
+                PyErr_Format(PyExc_TypeError,
+                             "calling %R should have returned an instance of "
+                             "BaseException, not %R",
+                             type, Py_TYPE(value));
+                goto bad;
+            }
+        }
+    } else {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: exception class must be a subclass of BaseException");
+        goto bad;
+    }
+    if (cause) {
+        PyObject *fixed_cause;
+        if (cause == Py_None) {
+            fixed_cause = NULL;
+        } else if (PyExceptionClass_Check(cause)) {
+            fixed_cause = PyObject_CallObject(cause, NULL);
+            if (fixed_cause == NULL)
+                goto bad;
+        } else if (PyExceptionInstance_Check(cause)) {
+            fixed_cause = cause;
+            Py_INCREF(fixed_cause);
+        } else {
+            PyErr_SetString(PyExc_TypeError,
+                            "exception causes must derive from "
+                            "BaseException");
+            goto bad;
+        }
+        PyException_SetCause(value, fixed_cause);
+    }
+    PyErr_SetObject(type, value);
+    if (tb) {
+#if CYTHON_FAST_THREAD_STATE
+        PyThreadState *tstate = __Pyx_PyThreadState_Current;
+        PyObject* tmp_tb = tstate->curexc_traceback;
+        if (tb != tmp_tb) {
+            Py_INCREF(tb);
+            tstate->curexc_traceback = tb;
+            Py_XDECREF(tmp_tb);
+        }
+#else
+        PyObject *tmp_type, *tmp_value, *tmp_tb;
+        PyErr_Fetch(&tmp_type, &tmp_value, &tmp_tb);
+        Py_INCREF(tb);
+        PyErr_Restore(tmp_type, tmp_value, tb);
+        Py_XDECREF(tmp_tb);
+#endif
+    }
+bad:
+    Py_XDECREF(owned_instance);
+    return;
+}
+#endif
+
+/* Import */
+static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level) {
+    PyObject *empty_list = 0;
+    PyObject *module = 0;
+    PyObject *global_dict = 0;
+    PyObject *empty_dict = 0;
+    PyObject *list;
+    #if PY_MAJOR_VERSION < 3
+    PyObject *py_import;
+    py_import = __Pyx_PyObject_GetAttrStr(__pyx_b, __pyx_n_s_import);
+    if (!py_import)
+        goto bad;
+    #endif
+    if (from_list)
+        list = from_list;
+    else {
+        empty_list = PyList_New(0);
+        if (!empty_list)
+            goto bad;
+        list = empty_list;
+    }
+    global_dict = PyModule_GetDict(__pyx_m);
+    if (!global_dict)
+        goto bad;
+    empty_dict = PyDict_New();
+    if (!empty_dict)
+        goto bad;
+    {
+        #if PY_MAJOR_VERSION >= 3
+        if (level == -1) {
+            if ((1) && (strchr(__Pyx_MODULE_NAME, '.'))) {
+                module = PyImport_ImportModuleLevelObject(
+                    name, global_dict, empty_dict, list, 1);
+                if (!module) {
+                    if (!PyErr_ExceptionMatches(PyExc_ImportError))
+                        goto bad;
+                    PyErr_Clear();
+                }
+            }
+            level = 0;
+        }
+        #endif
+        if (!module) {
+            #if PY_MAJOR_VERSION < 3
+            PyObject *py_level = PyInt_FromLong(level);
+            if (!py_level)
+                goto bad;
+            module = PyObject_CallFunctionObjArgs(py_import,
+                name, global_dict, empty_dict, list, py_level, (PyObject *)NULL);
+            Py_DECREF(py_level);
+            #else
+            module = PyImport_ImportModuleLevelObject(
+                name, global_dict, empty_dict, list, level);
+            #endif
+        }
+    }
+bad:
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(py_import);
+    #endif
+    Py_XDECREF(empty_list);
+    Py_XDECREF(empty_dict);
+    return module;
+}
+
+/* ImportFrom */
+static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name) {
+    PyObject* value = __Pyx_PyObject_GetAttrStr(module, name);
+    if (unlikely(!value) && PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        PyErr_Format(PyExc_ImportError,
+        #if PY_MAJOR_VERSION < 3
+            "cannot import name %.230s", PyString_AS_STRING(name));
+        #else
+            "cannot import name %S", name);
+        #endif
+    }
+    return value;
+}
+
+/* RaiseArgTupleInvalid */
+static void __Pyx_RaiseArgtupleInvalid(
+    const char* func_name,
+    int exact,
+    Py_ssize_t num_min,
+    Py_ssize_t num_max,
+    Py_ssize_t num_found)
+{
+    Py_ssize_t num_expected;
+    const char *more_or_less;
+    if (num_found < num_min) {
+        num_expected = num_min;
+        more_or_less = "at least";
+    } else {
+        num_expected = num_max;
+        more_or_less = "at most";
+    }
+    if (exact) {
+        more_or_less = "exactly";
+    }
+    PyErr_Format(PyExc_TypeError,
+                 "%.200s() takes %.8s %" CYTHON_FORMAT_SSIZE_T "d positional argument%.1s (%" CYTHON_FORMAT_SSIZE_T "d given)",
+                 func_name, more_or_less, num_expected,
+                 (num_expected == 1) ? "" : "s", num_found);
+}
+
+/* RaiseDoubleKeywords */
+static void __Pyx_RaiseDoubleKeywordsError(
+    const char* func_name,
+    PyObject* kw_name)
+{
+    PyErr_Format(PyExc_TypeError,
+        #if PY_MAJOR_VERSION >= 3
+        "%s() got multiple values for keyword argument '%U'", func_name, kw_name);
+        #else
+        "%s() got multiple values for keyword argument '%s'", func_name,
+        PyString_AsString(kw_name));
+        #endif
+}
+
+/* ParseKeywords */
+static int __Pyx_ParseOptionalKeywords(
+    PyObject *kwds,
+    PyObject **argnames[],
+    PyObject *kwds2,
+    PyObject *values[],
+    Py_ssize_t num_pos_args,
+    const char* function_name)
+{
+    PyObject *key = 0, *value = 0;
+    Py_ssize_t pos = 0;
+    PyObject*** name;
+    PyObject*** first_kw_arg = argnames + num_pos_args;
+    while (PyDict_Next(kwds, &pos, &key, &value)) {
+        name = first_kw_arg;
+        while (*name && (**name != key)) name++;
+        if (*name) {
+            values[name-argnames] = value;
+            continue;
+        }
+        name = first_kw_arg;
+        #if PY_MAJOR_VERSION < 3
+        if (likely(PyString_Check(key))) {
+            while (*name) {
+                if ((CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**name) == PyString_GET_SIZE(key))
+                        && _PyString_Eq(**name, key)) {
+                    values[name-argnames] = value;
+                    break;
+                }
+                name++;
+            }
+            if (*name) continue;
+            else {
+                PyObject*** argname = argnames;
+                while (argname != first_kw_arg) {
+                    if ((**argname == key) || (
+                            (CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**argname) == PyString_GET_SIZE(key))
+                             && _PyString_Eq(**argname, key))) {
+                        goto arg_passed_twice;
+                    }
+                    argname++;
+                }
+            }
+        } else
+        #endif
+        if (likely(PyUnicode_Check(key))) {
+            while (*name) {
+                int cmp = (**name == key) ? 0 :
+                #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
+                    (__Pyx_PyUnicode_GET_LENGTH(**name) != __Pyx_PyUnicode_GET_LENGTH(key)) ? 1 :
+                #endif
+                    PyUnicode_Compare(**name, key);
+                if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
+                if (cmp == 0) {
+                    values[name-argnames] = value;
+                    break;
+                }
+                name++;
+            }
+            if (*name) continue;
+            else {
+                PyObject*** argname = argnames;
+                while (argname != first_kw_arg) {
+                    int cmp = (**argname == key) ? 0 :
+                    #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
+                        (__Pyx_PyUnicode_GET_LENGTH(**argname) != __Pyx_PyUnicode_GET_LENGTH(key)) ? 1 :
+                    #endif
+                        PyUnicode_Compare(**argname, key);
+                    if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
+                    if (cmp == 0) goto arg_passed_twice;
+                    argname++;
+                }
+            }
+        } else
+            goto invalid_keyword_type;
+        if (kwds2) {
+            if (unlikely(PyDict_SetItem(kwds2, key, value))) goto bad;
+        } else {
+            goto invalid_keyword;
+        }
+    }
+    return 0;
+arg_passed_twice:
+    __Pyx_RaiseDoubleKeywordsError(function_name, key);
+    goto bad;
+invalid_keyword_type:
+    PyErr_Format(PyExc_TypeError,
+        "%.200s() keywords must be strings", function_name);
+    goto bad;
+invalid_keyword:
+    PyErr_Format(PyExc_TypeError,
+    #if PY_MAJOR_VERSION < 3
+        "%.200s() got an unexpected keyword argument '%.200s'",
+        function_name, PyString_AsString(key));
+    #else
+        "%s() got an unexpected keyword argument '%U'",
+        function_name, key);
+    #endif
+bad:
+    return -1;
+}
+
+/* PyObjectFormatAndDecref */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_FormatSimpleAndDecref(PyObject* s, PyObject* f) {
+    if (unlikely(!s)) return NULL;
+    if (likely(PyUnicode_CheckExact(s))) return s;
+    #if PY_MAJOR_VERSION < 3
+    if (likely(PyString_CheckExact(s))) {
+        PyObject *result = PyUnicode_FromEncodedObject(s, NULL, "strict");
+        Py_DECREF(s);
+        return result;
+    }
+    #endif
+    return __Pyx_PyObject_FormatAndDecref(s, f);
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_FormatAndDecref(PyObject* s, PyObject* f) {
+    PyObject *result = PyObject_Format(s, f);
+    Py_DECREF(s);
+    return result;
+}
+
+/* CIntToDigits */
+static const char DIGIT_PAIRS_10[2*10*10+1] = {
+    "00010203040506070809"
+    "10111213141516171819"
+    "20212223242526272829"
+    "30313233343536373839"
+    "40414243444546474849"
+    "50515253545556575859"
+    "60616263646566676869"
+    "70717273747576777879"
+    "80818283848586878889"
+    "90919293949596979899"
+};
+static const char DIGIT_PAIRS_8[2*8*8+1] = {
+    "0001020304050607"
+    "1011121314151617"
+    "2021222324252627"
+    "3031323334353637"
+    "4041424344454647"
+    "5051525354555657"
+    "6061626364656667"
+    "7071727374757677"
+};
+static const char DIGITS_HEX[2*16+1] = {
+    "0123456789abcdef"
+    "0123456789ABCDEF"
+};
+
+/* BuildPyUnicode */
+static PyObject* __Pyx_PyUnicode_BuildFromAscii(Py_ssize_t ulength, char* chars, int clength,
+                                                int prepend_sign, char padding_char) {
+    PyObject *uval;
+    Py_ssize_t uoffset = ulength - clength;
+#if CYTHON_USE_UNICODE_INTERNALS
+    Py_ssize_t i;
+#if CYTHON_PEP393_ENABLED
+    void *udata;
+    uval = PyUnicode_New(ulength, 127);
+    if (unlikely(!uval)) return NULL;
+    udata = PyUnicode_DATA(uval);
+#else
+    Py_UNICODE *udata;
+    uval = PyUnicode_FromUnicode(NULL, ulength);
+    if (unlikely(!uval)) return NULL;
+    udata = PyUnicode_AS_UNICODE(uval);
+#endif
+    if (uoffset > 0) {
+        i = 0;
+        if (prepend_sign) {
+            __Pyx_PyUnicode_WRITE(PyUnicode_1BYTE_KIND, udata, 0, '-');
+            i++;
+        }
+        for (; i < uoffset; i++) {
+            __Pyx_PyUnicode_WRITE(PyUnicode_1BYTE_KIND, udata, i, padding_char);
+        }
+    }
+    for (i=0; i < clength; i++) {
+        __Pyx_PyUnicode_WRITE(PyUnicode_1BYTE_KIND, udata, uoffset+i, chars[i]);
+    }
+#else
+    {
+        PyObject *sign = NULL, *padding = NULL;
+        uval = NULL;
+        if (uoffset > 0) {
+            prepend_sign = !!prepend_sign;
+            if (uoffset > prepend_sign) {
+                padding = PyUnicode_FromOrdinal(padding_char);
+                if (likely(padding) && uoffset > prepend_sign + 1) {
+                    PyObject *tmp;
+                    PyObject *repeat = PyInt_FromSsize_t(uoffset - prepend_sign);
+                    if (unlikely(!repeat)) goto done_or_error;
+                    tmp = PyNumber_Multiply(padding, repeat);
+                    Py_DECREF(repeat);
+                    Py_DECREF(padding);
+                    padding = tmp;
+                }
+                if (unlikely(!padding)) goto done_or_error;
+            }
+            if (prepend_sign) {
+                sign = PyUnicode_FromOrdinal('-');
+                if (unlikely(!sign)) goto done_or_error;
+            }
+        }
+        uval = PyUnicode_DecodeASCII(chars, clength, NULL);
+        if (likely(uval) && padding) {
+            PyObject *tmp = PyNumber_Add(padding, uval);
+            Py_DECREF(uval);
+            uval = tmp;
+        }
+        if (likely(uval) && sign) {
+            PyObject *tmp = PyNumber_Add(sign, uval);
+            Py_DECREF(uval);
+            uval = tmp;
+        }
+done_or_error:
+        Py_XDECREF(padding);
+        Py_XDECREF(sign);
+    }
+#endif
+    return uval;
+}
+
+/* CIntToPyUnicode */
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_From_Py_ssize_t(Py_ssize_t value, Py_ssize_t width, char padding_char, char format_char) {
+    char digits[sizeof(Py_ssize_t)*3+2];
+    char *dpos, *end = digits + sizeof(Py_ssize_t)*3+2;
+    const char *hex_digits = DIGITS_HEX;
+    Py_ssize_t length, ulength;
+    int prepend_sign, last_one_off;
+    Py_ssize_t remaining;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const Py_ssize_t neg_one = (Py_ssize_t) -1, const_zero = (Py_ssize_t) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (format_char == 'X') {
+        hex_digits += 16;
+        format_char = 'x';
+    }
+    remaining = value;
+    last_one_off = 0;
+    dpos = end;
+    do {
+        int digit_pos;
+        switch (format_char) {
+        case 'o':
+            digit_pos = abs((int)(remaining % (8*8)));
+            remaining = (Py_ssize_t) (remaining / (8*8));
+            dpos -= 2;
+            memcpy(dpos, DIGIT_PAIRS_8 + digit_pos * 2, 2);
+            last_one_off = (digit_pos < 8);
+            break;
+        case 'd':
+            digit_pos = abs((int)(remaining % (10*10)));
+            remaining = (Py_ssize_t) (remaining / (10*10));
+            dpos -= 2;
+            memcpy(dpos, DIGIT_PAIRS_10 + digit_pos * 2, 2);
+            last_one_off = (digit_pos < 10);
+            break;
+        case 'x':
+            *(--dpos) = hex_digits[abs((int)(remaining % 16))];
+            remaining = (Py_ssize_t) (remaining / 16);
+            break;
+        default:
+            assert(0);
+            break;
+        }
+    } while (unlikely(remaining != 0));
+    if (last_one_off) {
+        assert(*dpos == '0');
+        dpos++;
+    }
+    length = end - dpos;
+    ulength = length;
+    prepend_sign = 0;
+    if (!is_unsigned && value <= neg_one) {
+        if (padding_char == ' ' || width <= length + 1) {
+            *(--dpos) = '-';
+            ++length;
+        } else {
+            prepend_sign = 1;
+        }
+        ++ulength;
+    }
+    if (width > ulength) {
+        ulength = width;
+    }
+    if (ulength == 1) {
+        return PyUnicode_FromOrdinal(*dpos);
+    }
+    return __Pyx_PyUnicode_BuildFromAscii(ulength, dpos, (int) length, prepend_sign, padding_char);
+}
+
+/* CIntToPyUnicode */
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_From_long(long value, Py_ssize_t width, char padding_char, char format_char) {
+    char digits[sizeof(long)*3+2];
+    char *dpos, *end = digits + sizeof(long)*3+2;
+    const char *hex_digits = DIGITS_HEX;
+    Py_ssize_t length, ulength;
+    int prepend_sign, last_one_off;
+    long remaining;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (format_char == 'X') {
+        hex_digits += 16;
+        format_char = 'x';
+    }
+    remaining = value;
+    last_one_off = 0;
+    dpos = end;
+    do {
+        int digit_pos;
+        switch (format_char) {
+        case 'o':
+            digit_pos = abs((int)(remaining % (8*8)));
+            remaining = (long) (remaining / (8*8));
+            dpos -= 2;
+            memcpy(dpos, DIGIT_PAIRS_8 + digit_pos * 2, 2);
+            last_one_off = (digit_pos < 8);
+            break;
+        case 'd':
+            digit_pos = abs((int)(remaining % (10*10)));
+            remaining = (long) (remaining / (10*10));
+            dpos -= 2;
+            memcpy(dpos, DIGIT_PAIRS_10 + digit_pos * 2, 2);
+            last_one_off = (digit_pos < 10);
+            break;
+        case 'x':
+            *(--dpos) = hex_digits[abs((int)(remaining % 16))];
+            remaining = (long) (remaining / 16);
+            break;
+        default:
+            assert(0);
+            break;
+        }
+    } while (unlikely(remaining != 0));
+    if (last_one_off) {
+        assert(*dpos == '0');
+        dpos++;
+    }
+    length = end - dpos;
+    ulength = length;
+    prepend_sign = 0;
+    if (!is_unsigned && value <= neg_one) {
+        if (padding_char == ' ' || width <= length + 1) {
+            *(--dpos) = '-';
+            ++length;
+        } else {
+            prepend_sign = 1;
+        }
+        ++ulength;
+    }
+    if (width > ulength) {
+        ulength = width;
+    }
+    if (ulength == 1) {
+        return PyUnicode_FromOrdinal(*dpos);
+    }
+    return __Pyx_PyUnicode_BuildFromAscii(ulength, dpos, (int) length, prepend_sign, padding_char);
+}
+
+/* JoinPyUnicode */
+static PyObject* __Pyx_PyUnicode_Join(PyObject* value_tuple, Py_ssize_t value_count, Py_ssize_t result_ulength,
+                                      CYTHON_UNUSED Py_UCS4 max_char) {
+#if CYTHON_USE_UNICODE_INTERNALS && CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    PyObject *result_uval;
+    int result_ukind;
+    Py_ssize_t i, char_pos;
+    void *result_udata;
+#if CYTHON_PEP393_ENABLED
+    result_uval = PyUnicode_New(result_ulength, max_char);
+    if (unlikely(!result_uval)) return NULL;
+    result_ukind = (max_char <= 255) ? PyUnicode_1BYTE_KIND : (max_char <= 65535) ? PyUnicode_2BYTE_KIND : PyUnicode_4BYTE_KIND;
+    result_udata = PyUnicode_DATA(result_uval);
+#else
+    result_uval = PyUnicode_FromUnicode(NULL, result_ulength);
+    if (unlikely(!result_uval)) return NULL;
+    result_ukind = sizeof(Py_UNICODE);
+    result_udata = PyUnicode_AS_UNICODE(result_uval);
+#endif
+    char_pos = 0;
+    for (i=0; i < value_count; i++) {
+        int ukind;
+        Py_ssize_t ulength;
+        void *udata;
+        PyObject *uval = PyTuple_GET_ITEM(value_tuple, i);
+        if (unlikely(__Pyx_PyUnicode_READY(uval)))
+            goto bad;
+        ulength = __Pyx_PyUnicode_GET_LENGTH(uval);
+        if (unlikely(!ulength))
+            continue;
+        if (unlikely(char_pos + ulength < 0))
+            goto overflow;
+        ukind = __Pyx_PyUnicode_KIND(uval);
+        udata = __Pyx_PyUnicode_DATA(uval);
+        if (!CYTHON_PEP393_ENABLED || ukind == result_ukind) {
+            memcpy((char *)result_udata + char_pos * result_ukind, udata, (size_t) (ulength * result_ukind));
+        } else {
+            #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030300F0 || defined(_PyUnicode_FastCopyCharacters)
+            _PyUnicode_FastCopyCharacters(result_uval, char_pos, uval, 0, ulength);
+            #else
+            Py_ssize_t j;
+            for (j=0; j < ulength; j++) {
+                Py_UCS4 uchar = __Pyx_PyUnicode_READ(ukind, udata, j);
+                __Pyx_PyUnicode_WRITE(result_ukind, result_udata, char_pos+j, uchar);
+            }
+            #endif
+        }
+        char_pos += ulength;
+    }
+    return result_uval;
+overflow:
+    PyErr_SetString(PyExc_OverflowError, "join() result is too long for a Python string");
+bad:
+    Py_DECREF(result_uval);
+    return NULL;
+#else
+    result_ulength++;
+    value_count++;
+    return PyUnicode_Join(__pyx_empty_unicode, value_tuple);
+#endif
+}
+
+/* CIntToPyUnicode */
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_From_int(int value, Py_ssize_t width, char padding_char, char format_char) {
+    char digits[sizeof(int)*3+2];
+    char *dpos, *end = digits + sizeof(int)*3+2;
+    const char *hex_digits = DIGITS_HEX;
+    Py_ssize_t length, ulength;
+    int prepend_sign, last_one_off;
+    int remaining;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (format_char == 'X') {
+        hex_digits += 16;
+        format_char = 'x';
+    }
+    remaining = value;
+    last_one_off = 0;
+    dpos = end;
+    do {
+        int digit_pos;
+        switch (format_char) {
+        case 'o':
+            digit_pos = abs((int)(remaining % (8*8)));
+            remaining = (int) (remaining / (8*8));
+            dpos -= 2;
+            memcpy(dpos, DIGIT_PAIRS_8 + digit_pos * 2, 2);
+            last_one_off = (digit_pos < 8);
+            break;
+        case 'd':
+            digit_pos = abs((int)(remaining % (10*10)));
+            remaining = (int) (remaining / (10*10));
+            dpos -= 2;
+            memcpy(dpos, DIGIT_PAIRS_10 + digit_pos * 2, 2);
+            last_one_off = (digit_pos < 10);
+            break;
+        case 'x':
+            *(--dpos) = hex_digits[abs((int)(remaining % 16))];
+            remaining = (int) (remaining / 16);
+            break;
+        default:
+            assert(0);
+            break;
+        }
+    } while (unlikely(remaining != 0));
+    if (last_one_off) {
+        assert(*dpos == '0');
+        dpos++;
+    }
+    length = end - dpos;
+    ulength = length;
+    prepend_sign = 0;
+    if (!is_unsigned && value <= neg_one) {
+        if (padding_char == ' ' || width <= length + 1) {
+            *(--dpos) = '-';
+            ++length;
+        } else {
+            prepend_sign = 1;
+        }
+        ++ulength;
+    }
+    if (width > ulength) {
+        ulength = width;
+    }
+    if (ulength == 1) {
+        return PyUnicode_FromOrdinal(*dpos);
+    }
+    return __Pyx_PyUnicode_BuildFromAscii(ulength, dpos, (int) length, prepend_sign, padding_char);
+}
+
+/* None */
+static CYTHON_INLINE void __Pyx_RaiseUnboundLocalError(const char *varname) {
+    PyErr_Format(PyExc_UnboundLocalError, "local variable '%s' referenced before assignment", varname);
+}
+
+/* PyObjectSetAttrStr */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE int __Pyx_PyObject_SetAttrStr(PyObject* obj, PyObject* attr_name, PyObject* value) {
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_setattro))
+        return tp->tp_setattro(obj, attr_name, value);
+#if PY_MAJOR_VERSION < 3
+    if (likely(tp->tp_setattr))
+        return tp->tp_setattr(obj, PyString_AS_STRING(attr_name), value);
+#endif
+    return PyObject_SetAttr(obj, attr_name, value);
+}
+#endif
+
+/* PyObjectCallNoArg */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func) {
+#if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(func)) {
+        return __Pyx_PyFunction_FastCall(func, NULL, 0);
+    }
+#endif
+#if defined(__Pyx_CyFunction_USED) && defined(NDEBUG)
+    if (likely(PyCFunction_Check(func) || __Pyx_CyFunction_Check(func)))
+#else
+    if (likely(PyCFunction_Check(func)))
+#endif
+    {
+        if (likely(PyCFunction_GET_FLAGS(func) & METH_NOARGS)) {
+            return __Pyx_PyObject_CallMethO(func, NULL);
+        }
+    }
+    return __Pyx_PyObject_Call(func, __pyx_empty_tuple, NULL);
+}
+#endif
+
+/* TypeImport */
+#ifndef __PYX_HAVE_RT_ImportType_0_29_37
+#define __PYX_HAVE_RT_ImportType_0_29_37
+static PyTypeObject *__Pyx_ImportType_0_29_37(PyObject *module, const char *module_name, const char *class_name,
+    size_t size, size_t alignment, enum __Pyx_ImportType_CheckSize_0_29_37 check_size)
+{
+    PyObject *result = 0;
+    char warning[200];
+    Py_ssize_t basicsize;
+    Py_ssize_t itemsize;
+#ifdef Py_LIMITED_API
+    PyObject *py_basicsize;
+    PyObject *py_itemsize;
+#endif
+    result = PyObject_GetAttrString(module, class_name);
+    if (!result)
+        goto bad;
+    if (!PyType_Check(result)) {
+        PyErr_Format(PyExc_TypeError,
+            "%.200s.%.200s is not a type object",
+            module_name, class_name);
+        goto bad;
+    }
+#ifndef Py_LIMITED_API
+    basicsize = ((PyTypeObject *)result)->tp_basicsize;
+    itemsize = ((PyTypeObject *)result)->tp_itemsize;
+#else
+    py_basicsize = PyObject_GetAttrString(result, "__basicsize__");
+    if (!py_basicsize)
+        goto bad;
+    basicsize = PyLong_AsSsize_t(py_basicsize);
+    Py_DECREF(py_basicsize);
+    py_basicsize = 0;
+    if (basicsize == (Py_ssize_t)-1 && PyErr_Occurred())
+        goto bad;
+    py_itemsize = PyObject_GetAttrString(result, "__itemsize__");
+    if (!py_itemsize)
+        goto bad;
+    itemsize = PyLong_AsSsize_t(py_itemsize);
+    Py_DECREF(py_itemsize);
+    py_itemsize = 0;
+    if (itemsize == (Py_ssize_t)-1 && PyErr_Occurred())
+        goto bad;
+#endif
+    if (itemsize) {
+        if (size % alignment) {
+            alignment = size % alignment;
+        }
+        if (itemsize < (Py_ssize_t)alignment)
+            itemsize = (Py_ssize_t)alignment;
+    }
+    if ((size_t)(basicsize + itemsize) < size) {
+        PyErr_Format(PyExc_ValueError,
+            "%.200s.%.200s size changed, may indicate binary incompatibility. "
+            "Expected %zd from C header, got %zd from PyObject",
+            module_name, class_name, size, basicsize);
+        goto bad;
+    }
+    if (check_size == __Pyx_ImportType_CheckSize_Error_0_29_37 && (size_t)basicsize != size) {
+        PyErr_Format(PyExc_ValueError,
+            "%.200s.%.200s size changed, may indicate binary incompatibility. "
+            "Expected %zd from C header, got %zd from PyObject",
+            module_name, class_name, size, basicsize);
+        goto bad;
+    }
+    else if (check_size == __Pyx_ImportType_CheckSize_Warn_0_29_37 && (size_t)basicsize > size) {
+        PyOS_snprintf(warning, sizeof(warning),
+            "%s.%s size changed, may indicate binary incompatibility. "
+            "Expected %zd from C header, got %zd from PyObject",
+            module_name, class_name, size, basicsize);
+        if (PyErr_WarnEx(NULL, warning, 0) < 0) goto bad;
+    }
+    return (PyTypeObject *)result;
+bad:
+    Py_XDECREF(result);
+    return NULL;
+}
+#endif
+
+/* PyDictVersioning */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    return likely(dict) ? __PYX_GET_DICT_VERSION(dict) : 0;
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj) {
+    PyObject **dictptr = NULL;
+    Py_ssize_t offset = Py_TYPE(obj)->tp_dictoffset;
+    if (offset) {
+#if CYTHON_COMPILING_IN_CPYTHON
+        dictptr = (likely(offset > 0)) ? (PyObject **) ((char *)obj + offset) : _PyObject_GetDictPtr(obj);
+#else
+        dictptr = _PyObject_GetDictPtr(obj);
+#endif
+    }
+    return (dictptr && *dictptr) ? __PYX_GET_DICT_VERSION(*dictptr) : 0;
+}
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    if (unlikely(!dict) || unlikely(tp_dict_version != __PYX_GET_DICT_VERSION(dict)))
+        return 0;
+    return obj_dict_version == __Pyx_get_object_dict_version(obj);
+}
+#endif
+
+/* CLineInTraceback */
+#ifndef CYTHON_CLINE_IN_TRACEBACK
+static int __Pyx_CLineForTraceback(CYTHON_UNUSED PyThreadState *tstate, int c_line) {
+    PyObject *use_cline;
+    PyObject *ptype, *pvalue, *ptraceback;
+#if CYTHON_COMPILING_IN_CPYTHON
+    PyObject **cython_runtime_dict;
+#endif
+    if (unlikely(!__pyx_cython_runtime)) {
+        return c_line;
+    }
+    __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
+#if CYTHON_COMPILING_IN_CPYTHON
+    cython_runtime_dict = _PyObject_GetDictPtr(__pyx_cython_runtime);
+    if (likely(cython_runtime_dict)) {
+        __PYX_PY_DICT_LOOKUP_IF_MODIFIED(
+            use_cline, *cython_runtime_dict,
+            __Pyx_PyDict_GetItemStr(*cython_runtime_dict, __pyx_n_s_cline_in_traceback))
+    } else
+#endif
+    {
+      PyObject *use_cline_obj = __Pyx_PyObject_GetAttrStr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback);
+      if (use_cline_obj) {
+        use_cline = PyObject_Not(use_cline_obj) ? Py_False : Py_True;
+        Py_DECREF(use_cline_obj);
+      } else {
+        PyErr_Clear();
+        use_cline = NULL;
+      }
+    }
+    if (!use_cline) {
+        c_line = 0;
+        (void) PyObject_SetAttr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback, Py_False);
+    }
+    else if (use_cline == Py_False || (use_cline != Py_True && PyObject_Not(use_cline) != 0)) {
+        c_line = 0;
+    }
+    __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
+    return c_line;
+}
+#endif
+
+/* CodeObjectCache */
+static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line) {
+    int start = 0, mid = 0, end = count - 1;
+    if (end >= 0 && code_line > entries[end].code_line) {
+        return count;
+    }
+    while (start < end) {
+        mid = start + (end - start) / 2;
+        if (code_line < entries[mid].code_line) {
+            end = mid;
+        } else if (code_line > entries[mid].code_line) {
+             start = mid + 1;
+        } else {
+            return mid;
+        }
+    }
+    if (code_line <= entries[mid].code_line) {
+        return mid;
+    } else {
+        return mid + 1;
+    }
+}
+static PyCodeObject *__pyx_find_code_object(int code_line) {
+    PyCodeObject* code_object;
+    int pos;
+    if (unlikely(!code_line) || unlikely(!__pyx_code_cache.entries)) {
+        return NULL;
+    }
+    pos = __pyx_bisect_code_objects(__pyx_code_cache.entries, __pyx_code_cache.count, code_line);
+    if (unlikely(pos >= __pyx_code_cache.count) || unlikely(__pyx_code_cache.entries[pos].code_line != code_line)) {
+        return NULL;
+    }
+    code_object = __pyx_code_cache.entries[pos].code_object;
+    Py_INCREF(code_object);
+    return code_object;
+}
+static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object) {
+    int pos, i;
+    __Pyx_CodeObjectCacheEntry* entries = __pyx_code_cache.entries;
+    if (unlikely(!code_line)) {
+        return;
+    }
+    if (unlikely(!entries)) {
+        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Malloc(64*sizeof(__Pyx_CodeObjectCacheEntry));
+        if (likely(entries)) {
+            __pyx_code_cache.entries = entries;
+            __pyx_code_cache.max_count = 64;
+            __pyx_code_cache.count = 1;
+            entries[0].code_line = code_line;
+            entries[0].code_object = code_object;
+            Py_INCREF(code_object);
+        }
+        return;
+    }
+    pos = __pyx_bisect_code_objects(__pyx_code_cache.entries, __pyx_code_cache.count, code_line);
+    if ((pos < __pyx_code_cache.count) && unlikely(__pyx_code_cache.entries[pos].code_line == code_line)) {
+        PyCodeObject* tmp = entries[pos].code_object;
+        entries[pos].code_object = code_object;
+        Py_DECREF(tmp);
+        return;
+    }
+    if (__pyx_code_cache.count == __pyx_code_cache.max_count) {
+        int new_max = __pyx_code_cache.max_count + 64;
+        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Realloc(
+            __pyx_code_cache.entries, ((size_t)new_max) * sizeof(__Pyx_CodeObjectCacheEntry));
+        if (unlikely(!entries)) {
+            return;
+        }
+        __pyx_code_cache.entries = entries;
+        __pyx_code_cache.max_count = new_max;
+    }
+    for (i=__pyx_code_cache.count; i>pos; i--) {
+        entries[i] = entries[i-1];
+    }
+    entries[pos].code_line = code_line;
+    entries[pos].code_object = code_object;
+    __pyx_code_cache.count++;
+    Py_INCREF(code_object);
+}
+
+/* AddTraceback */
+#include "compile.h"
+#include "frameobject.h"
+#include "traceback.h"
+#if PY_VERSION_HEX >= 0x030b00a6
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
+static PyCodeObject* __Pyx_CreateCodeObjectForTraceback(
+            const char *funcname, int c_line,
+            int py_line, const char *filename) {
+    PyCodeObject *py_code = NULL;
+    PyObject *py_funcname = NULL;
+    #if PY_MAJOR_VERSION < 3
+    PyObject *py_srcfile = NULL;
+    py_srcfile = PyString_FromString(filename);
+    if (!py_srcfile) goto bad;
+    #endif
+    if (c_line) {
+        #if PY_MAJOR_VERSION < 3
+        py_funcname = PyString_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
+        #else
+        py_funcname = PyUnicode_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
+        funcname = PyUnicode_AsUTF8(py_funcname);
+        if (!funcname) goto bad;
+        #endif
+    }
+    else {
+        #if PY_MAJOR_VERSION < 3
+        py_funcname = PyString_FromString(funcname);
+        if (!py_funcname) goto bad;
+        #endif
+    }
+    #if PY_MAJOR_VERSION < 3
+    py_code = __Pyx_PyCode_New(
+        0,
+        0,
+        0,
+        0,
+        0,
+        __pyx_empty_bytes, /*PyObject *code,*/
+        __pyx_empty_tuple, /*PyObject *consts,*/
+        __pyx_empty_tuple, /*PyObject *names,*/
+        __pyx_empty_tuple, /*PyObject *varnames,*/
+        __pyx_empty_tuple, /*PyObject *freevars,*/
+        __pyx_empty_tuple, /*PyObject *cellvars,*/
+        py_srcfile,   /*PyObject *filename,*/
+        py_funcname,  /*PyObject *name,*/
+        py_line,
+        __pyx_empty_bytes  /*PyObject *lnotab*/
+    );
+    Py_DECREF(py_srcfile);
+    #else
+    py_code = PyCode_NewEmpty(filename, funcname, py_line);
+    #endif
+    Py_XDECREF(py_funcname);  // XDECREF since it's only set on Py3 if cline
+    return py_code;
+bad:
+    Py_XDECREF(py_funcname);
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(py_srcfile);
+    #endif
+    return NULL;
+}
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename) {
+    PyCodeObject *py_code = 0;
+    PyFrameObject *py_frame = 0;
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject *ptype, *pvalue, *ptraceback;
+    if (c_line) {
+        c_line = __Pyx_CLineForTraceback(tstate, c_line);
+    }
+    py_code = __pyx_find_code_object(c_line ? -c_line : py_line);
+    if (!py_code) {
+        __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
+        py_code = __Pyx_CreateCodeObjectForTraceback(
+            funcname, c_line, py_line, filename);
+        if (!py_code) {
+            /* If the code object creation fails, then we should clear the
+               fetched exception references and propagate the new exception */
+            Py_XDECREF(ptype);
+            Py_XDECREF(pvalue);
+            Py_XDECREF(ptraceback);
+            goto bad;
+        }
+        __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
+        __pyx_insert_code_object(c_line ? -c_line : py_line, py_code);
+    }
+    py_frame = PyFrame_New(
+        tstate,            /*PyThreadState *tstate,*/
+        py_code,           /*PyCodeObject *code,*/
+        __pyx_d,    /*PyObject *globals,*/
+        0                  /*PyObject *locals*/
+    );
+    if (!py_frame) goto bad;
+    __Pyx_PyFrame_SetLineNumber(py_frame, py_line);
+    PyTraceBack_Here(py_frame);
+bad:
+    Py_XDECREF(py_code);
+    Py_XDECREF(py_frame);
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(int) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(int) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(int) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(int),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(long) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(long) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(long) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(long),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntFromPyVerify */
+#define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 0)
+#define __PYX_VERIFY_RETURN_INT_EXC(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 1)
+#define __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, exc)\
+    {\
+        func_type value = func_value;\
+        if (sizeof(target_type) < sizeof(func_type)) {\
+            if (unlikely(value != (func_type) (target_type) value)) {\
+                func_type zero = 0;\
+                if (exc && unlikely(value == (func_type)-1 && PyErr_Occurred()))\
+                    return (target_type) -1;\
+                if (is_unsigned && unlikely(value < zero))\
+                    goto raise_neg_overflow;\
+                else\
+                    goto raise_overflow;\
+            }\
+        }\
+        return (target_type) value;\
+    }
+
+/* CIntFromPy */
+static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(long) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(long, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (long) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (long) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(long, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(long) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 2 * PyLong_SHIFT) {
+                            return (long) (((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(long) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 3 * PyLong_SHIFT) {
+                            return (long) (((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(long) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 4 * PyLong_SHIFT) {
+                            return (long) (((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (long) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(long) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (long) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(long, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(long,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(long) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(long) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                            return (long) ((((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(long) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                            return (long) ((((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(long) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                            return (long) ((((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(long) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            long val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (long) -1;
+        }
+    } else {
+        long val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (long) -1;
+        val = __Pyx_PyInt_As_long(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to long");
+    return (long) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to long");
+    return (long) -1;
+}
+
+/* CIntFromPy */
+static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(int) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(int, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (int) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(int, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 2 * PyLong_SHIFT) {
+                            return (int) (((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 3 * PyLong_SHIFT) {
+                            return (int) (((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 4 * PyLong_SHIFT) {
+                            return (int) (((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (int) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(int) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(int, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(int,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(int) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                            return (int) ((((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                            return (int) ((((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
+                            return (int) ((((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(int) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            int val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (int) -1;
+        }
+    } else {
+        int val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (int) -1;
+        val = __Pyx_PyInt_As_int(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to int");
+    return (int) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to int");
+    return (int) -1;
+}
+
+/* FastTypeChecks */
+#if CYTHON_COMPILING_IN_CPYTHON
+static int __Pyx_InBases(PyTypeObject *a, PyTypeObject *b) {
+    while (a) {
+        a = a->tp_base;
+        if (a == b)
+            return 1;
+    }
+    return b == &PyBaseObject_Type;
+}
+static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b) {
+    PyObject *mro;
+    if (a == b) return 1;
+    mro = a->tp_mro;
+    if (likely(mro)) {
+        Py_ssize_t i, n;
+        n = PyTuple_GET_SIZE(mro);
+        for (i = 0; i < n; i++) {
+            if (PyTuple_GET_ITEM(mro, i) == (PyObject *)b)
+                return 1;
+        }
+        return 0;
+    }
+    return __Pyx_InBases(a, b);
+}
+#if PY_MAJOR_VERSION == 2
+static int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject* exc_type2) {
+    PyObject *exception, *value, *tb;
+    int res;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&exception, &value, &tb);
+    res = exc_type1 ? PyObject_IsSubclass(err, exc_type1) : 0;
+    if (unlikely(res == -1)) {
+        PyErr_WriteUnraisable(err);
+        res = 0;
+    }
+    if (!res) {
+        res = PyObject_IsSubclass(err, exc_type2);
+        if (unlikely(res == -1)) {
+            PyErr_WriteUnraisable(err);
+            res = 0;
+        }
+    }
+    __Pyx_ErrRestore(exception, value, tb);
+    return res;
+}
+#else
+static CYTHON_INLINE int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject *exc_type2) {
+    int res = exc_type1 ? __Pyx_IsSubtype((PyTypeObject*)err, (PyTypeObject*)exc_type1) : 0;
+    if (!res) {
+        res = __Pyx_IsSubtype((PyTypeObject*)err, (PyTypeObject*)exc_type2);
+    }
+    return res;
+}
+#endif
+static int __Pyx_PyErr_GivenExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    assert(PyExceptionClass_Check(exc_type));
+    n = PyTuple_GET_SIZE(tuple);
+#if PY_MAJOR_VERSION >= 3
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+#endif
+    for (i=0; i<n; i++) {
+        PyObject *t = PyTuple_GET_ITEM(tuple, i);
+        #if PY_MAJOR_VERSION < 3
+        if (likely(exc_type == t)) return 1;
+        #endif
+        if (likely(PyExceptionClass_Check(t))) {
+            if (__Pyx_inner_PyErr_GivenExceptionMatches2(exc_type, NULL, t)) return 1;
+        } else {
+        }
+    }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject* exc_type) {
+    if (likely(err == exc_type)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        if (likely(PyExceptionClass_Check(exc_type))) {
+            return __Pyx_inner_PyErr_GivenExceptionMatches2(err, NULL, exc_type);
+        } else if (likely(PyTuple_Check(exc_type))) {
+            return __Pyx_PyErr_GivenExceptionMatchesTuple(err, exc_type);
+        } else {
+        }
+    }
+    return PyErr_GivenExceptionMatches(err, exc_type);
+}
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *exc_type1, PyObject *exc_type2) {
+    assert(PyExceptionClass_Check(exc_type1));
+    assert(PyExceptionClass_Check(exc_type2));
+    if (likely(err == exc_type1 || err == exc_type2)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        return __Pyx_inner_PyErr_GivenExceptionMatches2(err, exc_type1, exc_type2);
+    }
+    return (PyErr_GivenExceptionMatches(err, exc_type1) || PyErr_GivenExceptionMatches(err, exc_type2));
+}
+#endif
+
+/* CheckBinaryVersion */
+static int __Pyx_check_binary_version(void) {
+    char ctversion[5];
+    int same=1, i, found_dot;
+    const char* rt_from_call = Py_GetVersion();
+    PyOS_snprintf(ctversion, 5, "%d.%d", PY_MAJOR_VERSION, PY_MINOR_VERSION);
+    found_dot = 0;
+    for (i = 0; i < 4; i++) {
+        if (!ctversion[i]) {
+            same = (rt_from_call[i] < '0' || rt_from_call[i] > '9');
+            break;
+        }
+        if (rt_from_call[i] != ctversion[i]) {
+            same = 0;
+            break;
+        }
+    }
+    if (!same) {
+        char rtversion[5] = {'\0'};
+        char message[200];
+        for (i=0; i<4; ++i) {
+            if (rt_from_call[i] == '.') {
+                if (found_dot) break;
+                found_dot = 1;
+            } else if (rt_from_call[i] < '0' || rt_from_call[i] > '9') {
+                break;
+            }
+            rtversion[i] = rt_from_call[i];
+        }
+        PyOS_snprintf(message, sizeof(message),
+                      "compiletime version %s of module '%.100s' "
+                      "does not match runtime version %s",
+                      ctversion, __Pyx_MODULE_NAME, rtversion);
+        return PyErr_WarnEx(NULL, message, 1);
+    }
+    return 0;
+}
+
+/* InitStrings */
+static int __Pyx_InitStrings(__Pyx_StringTabEntry *t) {
+    while (t->p) {
+        #if PY_MAJOR_VERSION < 3
+        if (t->is_unicode) {
+            *t->p = PyUnicode_DecodeUTF8(t->s, t->n - 1, NULL);
+        } else if (t->intern) {
+            *t->p = PyString_InternFromString(t->s);
+        } else {
+            *t->p = PyString_FromStringAndSize(t->s, t->n - 1);
+        }
+        #else
+        if (t->is_unicode | t->is_str) {
+            if (t->intern) {
+                *t->p = PyUnicode_InternFromString(t->s);
+            } else if (t->encoding) {
+                *t->p = PyUnicode_Decode(t->s, t->n - 1, t->encoding, NULL);
+            } else {
+                *t->p = PyUnicode_FromStringAndSize(t->s, t->n - 1);
+            }
+        } else {
+            *t->p = PyBytes_FromStringAndSize(t->s, t->n - 1);
+        }
+        #endif
+        if (!*t->p)
+            return -1;
+        if (PyObject_Hash(*t->p) == -1)
+            return -1;
+        ++t;
+    }
+    return 0;
+}
+
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char* c_str) {
+    return __Pyx_PyUnicode_FromStringAndSize(c_str, (Py_ssize_t)strlen(c_str));
+}
+static CYTHON_INLINE const char* __Pyx_PyObject_AsString(PyObject* o) {
+    Py_ssize_t ignore;
+    return __Pyx_PyObject_AsStringAndSize(o, &ignore);
+}
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+#if !CYTHON_PEP393_ENABLED
+static const char* __Pyx_PyUnicode_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+    char* defenc_c;
+    PyObject* defenc = _PyUnicode_AsDefaultEncodedString(o, NULL);
+    if (!defenc) return NULL;
+    defenc_c = PyBytes_AS_STRING(defenc);
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+    {
+        char* end = defenc_c + PyBytes_GET_SIZE(defenc);
+        char* c;
+        for (c = defenc_c; c < end; c++) {
+            if ((unsigned char) (*c) >= 128) {
+                PyUnicode_AsASCIIString(o);
+                return NULL;
+            }
+        }
+    }
+#endif
+    *length = PyBytes_GET_SIZE(defenc);
+    return defenc_c;
+}
+#else
+static CYTHON_INLINE const char* __Pyx_PyUnicode_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+    if (unlikely(__Pyx_PyUnicode_READY(o) == -1)) return NULL;
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+    if (likely(PyUnicode_IS_ASCII(o))) {
+        *length = PyUnicode_GET_LENGTH(o);
+        return PyUnicode_AsUTF8(o);
+    } else {
+        PyUnicode_AsASCIIString(o);
+        return NULL;
+    }
+#else
+    return PyUnicode_AsUTF8AndSize(o, length);
+#endif
+}
+#endif
+#endif
+static CYTHON_INLINE const char* __Pyx_PyObject_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+    if (
+#if PY_MAJOR_VERSION < 3 && __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+            __Pyx_sys_getdefaultencoding_not_ascii &&
+#endif
+            PyUnicode_Check(o)) {
+        return __Pyx_PyUnicode_AsStringAndSize(o, length);
+    } else
+#endif
+#if (!CYTHON_COMPILING_IN_PYPY) || (defined(PyByteArray_AS_STRING) && defined(PyByteArray_GET_SIZE))
+    if (PyByteArray_Check(o)) {
+        *length = PyByteArray_GET_SIZE(o);
+        return PyByteArray_AS_STRING(o);
+    } else
+#endif
+    {
+        char* result;
+        int r = PyBytes_AsStringAndSize(o, &result, length);
+        if (unlikely(r < 0)) {
+            return NULL;
+        } else {
+            return result;
+        }
+    }
+}
+static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject* x) {
+   int is_true = x == Py_True;
+   if (is_true | (x == Py_False) | (x == Py_None)) return is_true;
+   else return PyObject_IsTrue(x);
+}
+static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject* x) {
+    int retval;
+    if (unlikely(!x)) return -1;
+    retval = __Pyx_PyObject_IsTrue(x);
+    Py_DECREF(x);
+    return retval;
+}
+static PyObject* __Pyx_PyNumber_IntOrLongWrongResultType(PyObject* result, const char* type_name) {
+#if PY_MAJOR_VERSION >= 3
+    if (PyLong_Check(result)) {
+        if (PyErr_WarnFormat(PyExc_DeprecationWarning, 1,
+                "__int__ returned non-int (type %.200s).  "
+                "The ability to return an instance of a strict subclass of int "
+                "is deprecated, and may be removed in a future version of Python.",
+                Py_TYPE(result)->tp_name)) {
+            Py_DECREF(result);
+            return NULL;
+        }
+        return result;
+    }
+#endif
+    PyErr_Format(PyExc_TypeError,
+                 "__%.4s__ returned non-%.4s (type %.200s)",
+                 type_name, type_name, Py_TYPE(result)->tp_name);
+    Py_DECREF(result);
+    return NULL;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_IntOrLong(PyObject* x) {
+#if CYTHON_USE_TYPE_SLOTS
+  PyNumberMethods *m;
+#endif
+  const char *name = NULL;
+  PyObject *res = NULL;
+#if PY_MAJOR_VERSION < 3
+  if (likely(PyInt_Check(x) || PyLong_Check(x)))
+#else
+  if (likely(PyLong_Check(x)))
+#endif
+    return __Pyx_NewRef(x);
+#if CYTHON_USE_TYPE_SLOTS
+  m = Py_TYPE(x)->tp_as_number;
+  #if PY_MAJOR_VERSION < 3
+  if (m && m->nb_int) {
+    name = "int";
+    res = m->nb_int(x);
+  }
+  else if (m && m->nb_long) {
+    name = "long";
+    res = m->nb_long(x);
+  }
+  #else
+  if (likely(m && m->nb_int)) {
+    name = "int";
+    res = m->nb_int(x);
+  }
+  #endif
+#else
+  if (!PyBytes_CheckExact(x) && !PyUnicode_CheckExact(x)) {
+    res = PyNumber_Int(x);
+  }
+#endif
+  if (likely(res)) {
+#if PY_MAJOR_VERSION < 3
+    if (unlikely(!PyInt_Check(res) && !PyLong_Check(res))) {
+#else
+    if (unlikely(!PyLong_CheckExact(res))) {
+#endif
+        return __Pyx_PyNumber_IntOrLongWrongResultType(res, name);
+    }
+  }
+  else if (!PyErr_Occurred()) {
+    PyErr_SetString(PyExc_TypeError,
+                    "an integer is required");
+  }
+  return res;
+}
+static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject* b) {
+  Py_ssize_t ival;
+  PyObject *x;
+#if PY_MAJOR_VERSION < 3
+  if (likely(PyInt_CheckExact(b))) {
+    if (sizeof(Py_ssize_t) >= sizeof(long))
+        return PyInt_AS_LONG(b);
+    else
+        return PyInt_AsSsize_t(b);
+  }
+#endif
+  if (likely(PyLong_CheckExact(b))) {
+    #if CYTHON_USE_PYLONG_INTERNALS
+    const digit* digits = ((PyLongObject*)b)->ob_digit;
+    const Py_ssize_t size = Py_SIZE(b);
+    if (likely(__Pyx_sst_abs(size) <= 1)) {
+        ival = likely(size) ? digits[0] : 0;
+        if (size == -1) ival = -ival;
+        return ival;
+    } else {
+      switch (size) {
+         case 2:
+           if (8 * sizeof(Py_ssize_t) > 2 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -2:
+           if (8 * sizeof(Py_ssize_t) > 2 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case 3:
+           if (8 * sizeof(Py_ssize_t) > 3 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -3:
+           if (8 * sizeof(Py_ssize_t) > 3 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case 4:
+           if (8 * sizeof(Py_ssize_t) > 4 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -4:
+           if (8 * sizeof(Py_ssize_t) > 4 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+      }
+    }
+    #endif
+    return PyLong_AsSsize_t(b);
+  }
+  x = PyNumber_Index(b);
+  if (!x) return -1;
+  ival = PyInt_AsSsize_t(x);
+  Py_DECREF(x);
+  return ival;
+}
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject* o) {
+  if (sizeof(Py_hash_t) == sizeof(Py_ssize_t)) {
+    return (Py_hash_t) __Pyx_PyIndex_AsSsize_t(o);
+#if PY_MAJOR_VERSION < 3
+  } else if (likely(PyInt_CheckExact(o))) {
+    return PyInt_AS_LONG(o);
+#endif
+  } else {
+    Py_ssize_t ival;
+    PyObject *x;
+    x = PyNumber_Index(o);
+    if (!x) return -1;
+    ival = PyInt_AsLong(x);
+    Py_DECREF(x);
+    return ival;
+  }
+}
+static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b) {
+  return b ? __Pyx_NewRef(Py_True) : __Pyx_NewRef(Py_False);
+}
+static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t ival) {
+    return PyInt_FromSize_t(ival);
+}
+
+
+#endif /* Py_PYTHON_H */
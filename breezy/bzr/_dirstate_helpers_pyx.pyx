@@ -29,7 +29,7 @@ import stat
 import sys
 
 from .. import cache_utf8, errors, osutils
-from .dirstate import DirState, DirstateCorrupt
+from .dirstate import DirState, DirstateCorrupt, _make_sha1_prefetcher
 from ..osutils import parent_directories, pathjoin, splitpath, is_inside_any, is_inside
 from .inventorytree import InventoryTreeChange
 
@@ -894,7 +894,12 @@ cpdef update_entry(self, entry, abspath, stat_value):
                 # Could check for size changes for further optimised
                 # avoidance of sha1's. However the most prominent case of
                 # over-shaing is during initial add, which this catches.
-            link_or_sha1 = self._sha1_file(abspath)
+            link_or_sha1 = None
+            if self._sha1_prefetcher is not None:
+                link_or_sha1 = self._sha1_prefetcher.sha1(
+                    entry[0], packed_stat)
+            if link_or_sha1 is None:
+                link_or_sha1 = self._sha1_file(abspath)
             entry[1][0] = (b'f', link_or_sha1, stat_value.st_size,
                            executable, packed_stat)
         else:
@@ -1206,9 +1211,17 @@ cdef class ProcessEntryC:
                         # map to the same content
                         if link_or_sha1 is None:
                             # Stat cache miss:
-                            statvalue, link_or_sha1 = \
-                                self.state._sha1_provider.stat_and_sha1(
-                                path_info[4])
+                            prefetched = None
+                            if self.state._sha1_prefetcher is not None:
+                                prefetched = (
+                                    self.state._sha1_prefetcher.stat_and_sha1(
+                                        entry[0], _pack_stat(path_info[3])))
+                            if prefetched is not None:
+                                statvalue, link_or_sha1 = prefetched
+                            else:
+                                statvalue, link_or_sha1 = \
+                                    self.state._sha1_provider.stat_and_sha1(
+                                    path_info[4])
                             self.state._observed_sha1(entry, link_or_sha1,
                                 statvalue)
                         content_change = (link_or_sha1 != source_details[1])
@@ -1315,17 +1328,23 @@ cdef class ProcessEntryC:
             # looks like a new file
             path = self.pathjoin(entry[0][0], entry[0][1])
             # parent id is the entry for the path in the target tree
-            # TODO: these are the same for an entire directory: cache em.
-            parent_entry = self.state._get_entry(self.target_index,
-                                                 path_utf8=entry[0][0])
-            if parent_entry is None:
-                raise DirstateCorrupt(self.state,
-                    "We could not find the parent entry in index %d"
-                    " for the entry: %s"
-                    % (self.target_index, entry[0]))
-            parent_id = parent_entry[0][2]
-            if parent_id == entry[0][2]:
-                parent_id = None
+            if entry[0][1] and entry[0][0] == self.last_target_parent[0]:
+                # use a cached hit for non-root target entries.
+                parent_id = self.last_target_parent[1]
+            else:
+                parent_entry = self.state._get_entry(self.target_index,
+                                                     path_utf8=entry[0][0])
+                if parent_entry is None:
+                    raise DirstateCorrupt(self.state,
+                        "We could not find the parent entry in index %d"
+                        " for the entry: %s"
+                        % (self.target_index, entry[0]))
+                parent_id = parent_entry[0][2]
+                if parent_id == entry[0][2]:
+                    parent_id = None
+                else:
+                    self.last_target_parent[0] = entry[0][0]
+                    self.last_target_parent[1] = parent_id
             if path_info is not None:
                 # Present on disk:
                 if self.use_filesystem_for_exec:
@@ -1402,7 +1421,23 @@ cdef class ProcessEntryC:
         return self
 
     def iter_changes(self):
-        return self
+        if self.source_index == -1:
+            source_index = None
+        else:
+            source_index = self.source_index
+        prefetcher = _make_sha1_prefetcher(
+            self.state, self.tree, source_index, self.search_specific_files)
+        if prefetcher is None:
+            return self
+        return self._iter_changes_with_prefetcher(prefetcher)
+
+    def _iter_changes_with_prefetcher(self, prefetcher):
+        prefetcher.start()
+        try:
+            for result in self:
+                yield result
+        finally:
+            prefetcher.stop()
 
     cdef int _gather_result_for_consistency(self, result) except -1:
         """Check a result we will yield to make sure we are consistent later.
@@ -1582,7 +1617,8 @@ cdef class ProcessEntryC:
                 self.current_dir_info = None
             else:
                 self.dir_iterator = osutils._walkdirs_utf8(self.root_abspath,
-                    prefix=self.current_root)
+                    prefix=self.current_root,
+                    threads=self.state._config_stack.get('walkdirs.threads'))
                 self.path_index = 0
                 try:
                     self.current_dir_info = next(self.dir_iterator)
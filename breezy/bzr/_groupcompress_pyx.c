@@ -0,0 +1,11487 @@
+/* Generated by Cython 0.29.37 */
+
+#ifndef PY_SSIZE_T_CLEAN
+#define PY_SSIZE_T_CLEAN
+#endif /* PY_SSIZE_T_CLEAN */
+#include "Python.h"
+#ifndef Py_PYTHON_H
+    #error Python headers needed to compile C extensions, please install development version of Python.
+#elif PY_VERSION_HEX < 0x02060000 || (0x03000000 <= PY_VERSION_HEX && PY_VERSION_HEX < 0x03030000)
+    #error Cython requires Python 2.6+ or Python 3.3+.
+#else
+#define CYTHON_ABI "0_29_37"
+#define CYTHON_HEX_VERSION 0x001D25F0
+#define CYTHON_FUTURE_DIVISION 1
+#include <stddef.h>
+#ifndef offsetof
+  #define offsetof(type, member) ( (size_t) & ((type*)0) -> member )
+#endif
+#if !defined(WIN32) && !defined(MS_WINDOWS)
+  #ifndef __stdcall
+    #define __stdcall
+  #endif
+  #ifndef __cdecl
+    #define __cdecl
+  #endif
+  #ifndef __fastcall
+    #define __fastcall
+  #endif
+#endif
+#ifndef DL_IMPORT
+  #define DL_IMPORT(t) t
+#endif
+#ifndef DL_EXPORT
+  #define DL_EXPORT(t) t
+#endif
+#define __PYX_COMMA ,
+#ifndef HAVE_LONG_LONG
+  #if PY_VERSION_HEX >= 0x02070000
+    #define HAVE_LONG_LONG
+  #endif
+#endif
+#ifndef PY_LONG_LONG
+  #define PY_LONG_LONG LONG_LONG
+#endif
+#ifndef Py_HUGE_VAL
+  #define Py_HUGE_VAL HUGE_VAL
+#endif
+#ifdef PYPY_VERSION
+  #define CYTHON_COMPILING_IN_PYPY 1
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #undef CYTHON_USE_TYPE_SLOTS
+  #define CYTHON_USE_TYPE_SLOTS 0
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #if PY_VERSION_HEX < 0x03050000
+    #undef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 0
+  #elif !defined(CYTHON_USE_ASYNC_SLOTS)
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_INTERNALS
+  #define CYTHON_USE_UNICODE_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #undef CYTHON_AVOID_BORROWED_REFS
+  #define CYTHON_AVOID_BORROWED_REFS 1
+  #undef CYTHON_ASSUME_SAFE_MACROS
+  #define CYTHON_ASSUME_SAFE_MACROS 0
+  #undef CYTHON_UNPACK_METHODS
+  #define CYTHON_UNPACK_METHODS 0
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #if PY_VERSION_HEX < 0x03090000
+    #undef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #elif !defined(CYTHON_PEP489_MULTI_PHASE_INIT)
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #undef CYTHON_USE_TP_FINALIZE
+  #define CYTHON_USE_TP_FINALIZE (PY_VERSION_HEX >= 0x030400a1 && PYPY_VERSION_NUM >= 0x07030C00)
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+#elif defined(PYSTON_VERSION)
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 1
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #undef CYTHON_USE_ASYNC_SLOTS
+  #define CYTHON_USE_ASYNC_SLOTS 0
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #undef CYTHON_PEP489_MULTI_PHASE_INIT
+  #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #undef CYTHON_USE_TP_FINALIZE
+  #define CYTHON_USE_TP_FINALIZE 0
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+#elif defined(PY_NOGIL)
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 1
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #ifndef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE 1
+  #endif
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+#else
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 1
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #if PY_VERSION_HEX < 0x02070000
+    #undef CYTHON_USE_PYTYPE_LOOKUP
+    #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #elif !defined(CYTHON_USE_PYTYPE_LOOKUP)
+    #define CYTHON_USE_PYTYPE_LOOKUP 1
+  #endif
+  #if PY_MAJOR_VERSION < 3
+    #undef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 0
+  #elif !defined(CYTHON_USE_ASYNC_SLOTS)
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #if PY_VERSION_HEX < 0x02070000
+    #undef CYTHON_USE_PYLONG_INTERNALS
+    #define CYTHON_USE_PYLONG_INTERNALS 0
+  #elif !defined(CYTHON_USE_PYLONG_INTERNALS)
+    #define CYTHON_USE_PYLONG_INTERNALS (PY_VERSION_HEX < 0x030C00A5)
+  #endif
+  #ifndef CYTHON_USE_PYLIST_INTERNALS
+    #define CYTHON_USE_PYLIST_INTERNALS 1
+  #endif
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #if PY_VERSION_HEX < 0x030300F0 || PY_VERSION_HEX >= 0x030B00A2
+    #undef CYTHON_USE_UNICODE_WRITER
+    #define CYTHON_USE_UNICODE_WRITER 0
+  #elif !defined(CYTHON_USE_UNICODE_WRITER)
+    #define CYTHON_USE_UNICODE_WRITER 1
+  #endif
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #if PY_VERSION_HEX >= 0x030B00A4
+    #undef CYTHON_FAST_THREAD_STATE
+    #define CYTHON_FAST_THREAD_STATE 0
+  #elif !defined(CYTHON_FAST_THREAD_STATE)
+    #define CYTHON_FAST_THREAD_STATE 1
+  #endif
+  #ifndef CYTHON_FAST_PYCALL
+    #define CYTHON_FAST_PYCALL (PY_VERSION_HEX < 0x030A0000)
+  #endif
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT (PY_VERSION_HEX >= 0x03050000)
+  #endif
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE (PY_VERSION_HEX >= 0x030400a1)
+  #endif
+  #ifndef CYTHON_USE_DICT_VERSIONS
+    #define CYTHON_USE_DICT_VERSIONS ((PY_VERSION_HEX >= 0x030600B1) && (PY_VERSION_HEX < 0x030C00A5))
+  #endif
+  #if PY_VERSION_HEX >= 0x030B00A4
+    #undef CYTHON_USE_EXC_INFO_STACK
+    #define CYTHON_USE_EXC_INFO_STACK 0
+  #elif !defined(CYTHON_USE_EXC_INFO_STACK)
+    #define CYTHON_USE_EXC_INFO_STACK (PY_VERSION_HEX >= 0x030700A3)
+  #endif
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 1
+  #endif
+#endif
+#if !defined(CYTHON_FAST_PYCCALL)
+#define CYTHON_FAST_PYCCALL  (CYTHON_FAST_PYCALL && PY_VERSION_HEX >= 0x030600B1)
+#endif
+#if CYTHON_USE_PYLONG_INTERNALS
+  #if PY_MAJOR_VERSION < 3
+    #include "longintrepr.h"
+  #endif
+  #undef SHIFT
+  #undef BASE
+  #undef MASK
+  #ifdef SIZEOF_VOID_P
+    enum { __pyx_check_sizeof_voidp = 1 / (int)(SIZEOF_VOID_P == sizeof(void*)) };
+  #endif
+#endif
+#ifndef __has_attribute
+  #define __has_attribute(x) 0
+#endif
+#ifndef __has_cpp_attribute
+  #define __has_cpp_attribute(x) 0
+#endif
+#ifndef CYTHON_RESTRICT
+  #if defined(__GNUC__)
+    #define CYTHON_RESTRICT __restrict__
+  #elif defined(_MSC_VER) && _MSC_VER >= 1400
+    #define CYTHON_RESTRICT __restrict
+  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define CYTHON_RESTRICT restrict
+  #else
+    #define CYTHON_RESTRICT
+  #endif
+#endif
+#ifndef CYTHON_UNUSED
+# if defined(__GNUC__)
+#   if !(defined(__cplusplus)) || (__GNUC__ > 3 || (__GNUC__ == 3 && __GNUC_MINOR__ >= 4))
+#     define CYTHON_UNUSED __attribute__ ((__unused__))
+#   else
+#     define CYTHON_UNUSED
+#   endif
+# elif defined(__ICC) || (defined(__INTEL_COMPILER) && !defined(_MSC_VER))
+#   define CYTHON_UNUSED __attribute__ ((__unused__))
+# else
+#   define CYTHON_UNUSED
+# endif
+#endif
+#ifndef CYTHON_MAYBE_UNUSED_VAR
+#  if defined(__cplusplus)
+     template<class T> void CYTHON_MAYBE_UNUSED_VAR( const T& ) { }
+#  else
+#    define CYTHON_MAYBE_UNUSED_VAR(x) (void)(x)
+#  endif
+#endif
+#ifndef CYTHON_NCP_UNUSED
+# if CYTHON_COMPILING_IN_CPYTHON
+#  define CYTHON_NCP_UNUSED
+# else
+#  define CYTHON_NCP_UNUSED CYTHON_UNUSED
+# endif
+#endif
+#define __Pyx_void_to_None(void_result) ((void)(void_result), Py_INCREF(Py_None), Py_None)
+#ifdef _MSC_VER
+    #ifndef _MSC_STDINT_H_
+        #if _MSC_VER < 1300
+           typedef unsigned char     uint8_t;
+           typedef unsigned int      uint32_t;
+        #else
+           typedef unsigned __int8   uint8_t;
+           typedef unsigned __int32  uint32_t;
+        #endif
+    #endif
+#else
+   #include <stdint.h>
+#endif
+#ifndef CYTHON_FALLTHROUGH
+  #if defined(__cplusplus) && __cplusplus >= 201103L
+    #if __has_cpp_attribute(fallthrough)
+      #define CYTHON_FALLTHROUGH [[fallthrough]]
+    #elif __has_cpp_attribute(clang::fallthrough)
+      #define CYTHON_FALLTHROUGH [[clang::fallthrough]]
+    #elif __has_cpp_attribute(gnu::fallthrough)
+      #define CYTHON_FALLTHROUGH [[gnu::fallthrough]]
+    #endif
+  #endif
+  #ifndef CYTHON_FALLTHROUGH
+    #if __has_attribute(fallthrough)
+      #define CYTHON_FALLTHROUGH __attribute__((fallthrough))
+    #else
+      #define CYTHON_FALLTHROUGH
+    #endif
+  #endif
+  #if defined(__clang__ ) && defined(__apple_build_version__)
+    #if __apple_build_version__ < 7000000
+      #undef  CYTHON_FALLTHROUGH
+      #define CYTHON_FALLTHROUGH
+    #endif
+  #endif
+#endif
+
+#ifndef CYTHON_INLINE
+  #if defined(__clang__)
+    #define CYTHON_INLINE __inline__ __attribute__ ((__unused__))
+  #elif defined(__GNUC__)
+    #define CYTHON_INLINE __inline__
+  #elif defined(_MSC_VER)
+    #define CYTHON_INLINE __inline
+  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define CYTHON_INLINE inline
+  #else
+    #define CYTHON_INLINE
+  #endif
+#endif
+
+#define __PYX_BUILD_PY_SSIZE_T "n"
+#define CYTHON_FORMAT_SSIZE_T "z"
+#if PY_MAJOR_VERSION < 3
+  #define __Pyx_BUILTIN_MODULE_NAME "__builtin__"
+  #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
+          PyCode_New(a+k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+  #define __Pyx_DefaultClassType PyClass_Type
+#else
+  #define __Pyx_BUILTIN_MODULE_NAME "builtins"
+  #define __Pyx_DefaultClassType PyType_Type
+#if PY_VERSION_HEX >= 0x030B00A1
+    static CYTHON_INLINE PyCodeObject* __Pyx_PyCode_New(int a, int k, int l, int s, int f,
+                                                    PyObject *code, PyObject *c, PyObject* n, PyObject *v,
+                                                    PyObject *fv, PyObject *cell, PyObject* fn,
+                                                    PyObject *name, int fline, PyObject *lnos) {
+        PyObject *kwds=NULL, *argcount=NULL, *posonlyargcount=NULL, *kwonlyargcount=NULL;
+        PyObject *nlocals=NULL, *stacksize=NULL, *flags=NULL, *replace=NULL, *call_result=NULL, *empty=NULL;
+        const char *fn_cstr=NULL;
+        const char *name_cstr=NULL;
+        PyCodeObject* co=NULL;
+        PyObject *type, *value, *traceback;
+        PyErr_Fetch(&type, &value, &traceback);
+        if (!(kwds=PyDict_New())) goto end;
+        if (!(argcount=PyLong_FromLong(a))) goto end;
+        if (PyDict_SetItemString(kwds, "co_argcount", argcount) != 0) goto end;
+        if (!(posonlyargcount=PyLong_FromLong(0))) goto end;
+        if (PyDict_SetItemString(kwds, "co_posonlyargcount", posonlyargcount) != 0) goto end;
+        if (!(kwonlyargcount=PyLong_FromLong(k))) goto end;
+        if (PyDict_SetItemString(kwds, "co_kwonlyargcount", kwonlyargcount) != 0) goto end;
+        if (!(nlocals=PyLong_FromLong(l))) goto end;
+        if (PyDict_SetItemString(kwds, "co_nlocals", nlocals) != 0) goto end;
+        if (!(stacksize=PyLong_FromLong(s))) goto end;
+        if (PyDict_SetItemString(kwds, "co_stacksize", stacksize) != 0) goto end;
+        if (!(flags=PyLong_FromLong(f))) goto end;
+        if (PyDict_SetItemString(kwds, "co_flags", flags) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_code", code) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_consts", c) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_names", n) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_varnames", v) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_freevars", fv) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_cellvars", cell) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_linetable", lnos) != 0) goto end;
+        if (!(fn_cstr=PyUnicode_AsUTF8AndSize(fn, NULL))) goto end;
+        if (!(name_cstr=PyUnicode_AsUTF8AndSize(name, NULL))) goto end;
+        if (!(co = PyCode_NewEmpty(fn_cstr, name_cstr, fline))) goto end;
+        if (!(replace = PyObject_GetAttrString((PyObject*)co, "replace"))) goto cleanup_code_too;
+        if (!(empty = PyTuple_New(0))) goto cleanup_code_too; // unfortunately __pyx_empty_tuple isn't available here
+        if (!(call_result = PyObject_Call(replace, empty, kwds))) goto cleanup_code_too;
+        Py_XDECREF((PyObject*)co);
+        co = (PyCodeObject*)call_result;
+        call_result = NULL;
+        if (0) {
+            cleanup_code_too:
+            Py_XDECREF((PyObject*)co);
+            co = NULL;
+        }
+        end:
+        Py_XDECREF(kwds);
+        Py_XDECREF(argcount);
+        Py_XDECREF(posonlyargcount);
+        Py_XDECREF(kwonlyargcount);
+        Py_XDECREF(nlocals);
+        Py_XDECREF(stacksize);
+        Py_XDECREF(replace);
+        Py_XDECREF(call_result);
+        Py_XDECREF(empty);
+        if (type) {
+            PyErr_Restore(type, value, traceback);
+        }
+        return co;
+    }
+#else
+  #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
+          PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+#endif
+  #define __Pyx_DefaultClassType PyType_Type
+#endif
+#if PY_VERSION_HEX >= 0x030900F0 && !CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyObject_GC_IsFinalized(o) PyObject_GC_IsFinalized(o)
+#else
+  #define __Pyx_PyObject_GC_IsFinalized(o) _PyGC_FINALIZED(o)
+#endif
+#ifndef Py_TPFLAGS_CHECKTYPES
+  #define Py_TPFLAGS_CHECKTYPES 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_INDEX
+  #define Py_TPFLAGS_HAVE_INDEX 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_NEWBUFFER
+  #define Py_TPFLAGS_HAVE_NEWBUFFER 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_FINALIZE
+  #define Py_TPFLAGS_HAVE_FINALIZE 0
+#endif
+#ifndef METH_STACKLESS
+  #define METH_STACKLESS 0
+#endif
+#if PY_VERSION_HEX <= 0x030700A3 || !defined(METH_FASTCALL)
+  #ifndef METH_FASTCALL
+     #define METH_FASTCALL 0x80
+  #endif
+  typedef PyObject *(*__Pyx_PyCFunctionFast) (PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+  typedef PyObject *(*__Pyx_PyCFunctionFastWithKeywords) (PyObject *self, PyObject *const *args,
+                                                          Py_ssize_t nargs, PyObject *kwnames);
+#else
+  #define __Pyx_PyCFunctionFast _PyCFunctionFast
+  #define __Pyx_PyCFunctionFastWithKeywords _PyCFunctionFastWithKeywords
+#endif
+#if CYTHON_FAST_PYCCALL
+#define __Pyx_PyFastCFunction_Check(func)\
+    ((PyCFunction_Check(func) && (METH_FASTCALL == (PyCFunction_GET_FLAGS(func) & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS | METH_STACKLESS)))))
+#else
+#define __Pyx_PyFastCFunction_Check(func) 0
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyObject_Malloc)
+  #define PyObject_Malloc(s)   PyMem_Malloc(s)
+  #define PyObject_Free(p)     PyMem_Free(p)
+  #define PyObject_Realloc(p)  PyMem_Realloc(p)
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030400A1
+  #define PyMem_RawMalloc(n)           PyMem_Malloc(n)
+  #define PyMem_RawRealloc(p, n)       PyMem_Realloc(p, n)
+  #define PyMem_RawFree(p)             PyMem_Free(p)
+#endif
+#if CYTHON_COMPILING_IN_PYSTON
+  #define __Pyx_PyCode_HasFreeVars(co)  PyCode_HasFreeVars(co)
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno) PyFrame_SetLineNumber(frame, lineno)
+#else
+  #define __Pyx_PyCode_HasFreeVars(co)  (PyCode_GetNumFree(co) > 0)
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno)  (frame)->f_lineno = (lineno)
+#endif
+#if !CYTHON_FAST_THREAD_STATE || PY_VERSION_HEX < 0x02070000
+  #define __Pyx_PyThreadState_Current PyThreadState_GET()
+#elif PY_VERSION_HEX >= 0x03060000
+  #define __Pyx_PyThreadState_Current _PyThreadState_UncheckedGet()
+#elif PY_VERSION_HEX >= 0x03000000
+  #define __Pyx_PyThreadState_Current PyThreadState_GET()
+#else
+  #define __Pyx_PyThreadState_Current _PyThreadState_Current
+#endif
+#if PY_VERSION_HEX < 0x030700A2 && !defined(PyThread_tss_create) && !defined(Py_tss_NEEDS_INIT)
+#include "pythread.h"
+#define Py_tss_NEEDS_INIT 0
+typedef int Py_tss_t;
+static CYTHON_INLINE int PyThread_tss_create(Py_tss_t *key) {
+  *key = PyThread_create_key();
+  return 0;
+}
+static CYTHON_INLINE Py_tss_t * PyThread_tss_alloc(void) {
+  Py_tss_t *key = (Py_tss_t *)PyObject_Malloc(sizeof(Py_tss_t));
+  *key = Py_tss_NEEDS_INIT;
+  return key;
+}
+static CYTHON_INLINE void PyThread_tss_free(Py_tss_t *key) {
+  PyObject_Free(key);
+}
+static CYTHON_INLINE int PyThread_tss_is_created(Py_tss_t *key) {
+  return *key != Py_tss_NEEDS_INIT;
+}
+static CYTHON_INLINE void PyThread_tss_delete(Py_tss_t *key) {
+  PyThread_delete_key(*key);
+  *key = Py_tss_NEEDS_INIT;
+}
+static CYTHON_INLINE int PyThread_tss_set(Py_tss_t *key, void *value) {
+  return PyThread_set_key_value(*key, value);
+}
+static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
+  return PyThread_get_key_value(*key);
+}
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON || defined(_PyDict_NewPresized)
+#define __Pyx_PyDict_NewPresized(n)  ((n <= 8) ? PyDict_New() : _PyDict_NewPresized(n))
+#else
+#define __Pyx_PyDict_NewPresized(n)  PyDict_New()
+#endif
+#if PY_MAJOR_VERSION >= 3 || CYTHON_FUTURE_DIVISION
+  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_TrueDivide(x,y)
+  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceTrueDivide(x,y)
+#else
+  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_Divide(x,y)
+  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceDivide(x,y)
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1 && CYTHON_USE_UNICODE_INTERNALS
+#define __Pyx_PyDict_GetItemStr(dict, name)  _PyDict_GetItem_KnownHash(dict, name, ((PyASCIIObject *) name)->hash)
+#else
+#define __Pyx_PyDict_GetItemStr(dict, name)  PyDict_GetItem(dict, name)
+#endif
+#if PY_VERSION_HEX > 0x03030000 && defined(PyUnicode_KIND)
+  #define CYTHON_PEP393_ENABLED 1
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_READY(op)       (0)
+  #else
+    #define __Pyx_PyUnicode_READY(op)       (likely(PyUnicode_IS_READY(op)) ?\
+                                                0 : _PyUnicode_Ready((PyObject *)(op)))
+  #endif
+  #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GET_LENGTH(u)
+  #define __Pyx_PyUnicode_READ_CHAR(u, i) PyUnicode_READ_CHAR(u, i)
+  #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   PyUnicode_MAX_CHAR_VALUE(u)
+  #define __Pyx_PyUnicode_KIND(u)         PyUnicode_KIND(u)
+  #define __Pyx_PyUnicode_DATA(u)         PyUnicode_DATA(u)
+  #define __Pyx_PyUnicode_READ(k, d, i)   PyUnicode_READ(k, d, i)
+  #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  PyUnicode_WRITE(k, d, i, ch)
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_LENGTH(u))
+  #else
+    #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x03090000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : ((PyCompactUnicodeObject *)(u))->wstr_length))
+    #else
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : PyUnicode_GET_SIZE(u)))
+    #endif
+  #endif
+#else
+  #define CYTHON_PEP393_ENABLED 0
+  #define PyUnicode_1BYTE_KIND  1
+  #define PyUnicode_2BYTE_KIND  2
+  #define PyUnicode_4BYTE_KIND  4
+  #define __Pyx_PyUnicode_READY(op)       (0)
+  #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GET_SIZE(u)
+  #define __Pyx_PyUnicode_READ_CHAR(u, i) ((Py_UCS4)(PyUnicode_AS_UNICODE(u)[i]))
+  #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   ((sizeof(Py_UNICODE) == 2) ? 65535 : 1114111)
+  #define __Pyx_PyUnicode_KIND(u)         (sizeof(Py_UNICODE))
+  #define __Pyx_PyUnicode_DATA(u)         ((void*)PyUnicode_AS_UNICODE(u))
+  #define __Pyx_PyUnicode_READ(k, d, i)   ((void)(k), (Py_UCS4)(((Py_UNICODE*)d)[i]))
+  #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  (((void)(k)), ((Py_UNICODE*)d)[i] = ch)
+  #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_SIZE(u))
+#endif
+#if CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyUnicode_Concat(a, b)      PyNumber_Add(a, b)
+  #define __Pyx_PyUnicode_ConcatSafe(a, b)  PyNumber_Add(a, b)
+#else
+  #define __Pyx_PyUnicode_Concat(a, b)      PyUnicode_Concat(a, b)
+  #define __Pyx_PyUnicode_ConcatSafe(a, b)  ((unlikely((a) == Py_None) || unlikely((b) == Py_None)) ?\
+      PyNumber_Add(a, b) : __Pyx_PyUnicode_Concat(a, b))
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyUnicode_Contains)
+  #define PyUnicode_Contains(u, s)  PySequence_Contains(u, s)
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyByteArray_Check)
+  #define PyByteArray_Check(obj)  PyObject_TypeCheck(obj, &PyByteArray_Type)
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyObject_Format)
+  #define PyObject_Format(obj, fmt)  PyObject_CallMethod(obj, "__format__", "O", fmt)
+#endif
+#define __Pyx_PyString_FormatSafe(a, b)   ((unlikely((a) == Py_None || (PyString_Check(b) && !PyString_CheckExact(b)))) ? PyNumber_Remainder(a, b) : __Pyx_PyString_Format(a, b))
+#define __Pyx_PyUnicode_FormatSafe(a, b)  ((unlikely((a) == Py_None || (PyUnicode_Check(b) && !PyUnicode_CheckExact(b)))) ? PyNumber_Remainder(a, b) : PyUnicode_Format(a, b))
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyString_Format(a, b)  PyUnicode_Format(a, b)
+#else
+  #define __Pyx_PyString_Format(a, b)  PyString_Format(a, b)
+#endif
+#if PY_MAJOR_VERSION < 3 && !defined(PyObject_ASCII)
+  #define PyObject_ASCII(o)            PyObject_Repr(o)
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyBaseString_Type            PyUnicode_Type
+  #define PyStringObject               PyUnicodeObject
+  #define PyString_Type                PyUnicode_Type
+  #define PyString_Check               PyUnicode_Check
+  #define PyString_CheckExact          PyUnicode_CheckExact
+#ifndef PyObject_Unicode
+  #define PyObject_Unicode             PyObject_Str
+#endif
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyBaseString_Check(obj) PyUnicode_Check(obj)
+  #define __Pyx_PyBaseString_CheckExact(obj) PyUnicode_CheckExact(obj)
+#else
+  #define __Pyx_PyBaseString_Check(obj) (PyString_Check(obj) || PyUnicode_Check(obj))
+  #define __Pyx_PyBaseString_CheckExact(obj) (PyString_CheckExact(obj) || PyUnicode_CheckExact(obj))
+#endif
+#ifndef PySet_CheckExact
+  #define PySet_CheckExact(obj)        (Py_TYPE(obj) == &PySet_Type)
+#endif
+#if PY_VERSION_HEX >= 0x030900A4
+  #define __Pyx_SET_REFCNT(obj, refcnt) Py_SET_REFCNT(obj, refcnt)
+  #define __Pyx_SET_SIZE(obj, size) Py_SET_SIZE(obj, size)
+#else
+  #define __Pyx_SET_REFCNT(obj, refcnt) Py_REFCNT(obj) = (refcnt)
+  #define __Pyx_SET_SIZE(obj, size) Py_SIZE(obj) = (size)
+#endif
+#if CYTHON_ASSUME_SAFE_MACROS
+  #define __Pyx_PySequence_SIZE(seq)  Py_SIZE(seq)
+#else
+  #define __Pyx_PySequence_SIZE(seq)  PySequence_Size(seq)
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyIntObject                  PyLongObject
+  #define PyInt_Type                   PyLong_Type
+  #define PyInt_Check(op)              PyLong_Check(op)
+  #define PyInt_CheckExact(op)         PyLong_CheckExact(op)
+  #define PyInt_FromString             PyLong_FromString
+  #define PyInt_FromUnicode            PyLong_FromUnicode
+  #define PyInt_FromLong               PyLong_FromLong
+  #define PyInt_FromSize_t             PyLong_FromSize_t
+  #define PyInt_FromSsize_t            PyLong_FromSsize_t
+  #define PyInt_AsLong                 PyLong_AsLong
+  #define PyInt_AS_LONG                PyLong_AS_LONG
+  #define PyInt_AsSsize_t              PyLong_AsSsize_t
+  #define PyInt_AsUnsignedLongMask     PyLong_AsUnsignedLongMask
+  #define PyInt_AsUnsignedLongLongMask PyLong_AsUnsignedLongLongMask
+  #define PyNumber_Int                 PyNumber_Long
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyBoolObject                 PyLongObject
+#endif
+#if PY_MAJOR_VERSION >= 3 && CYTHON_COMPILING_IN_PYPY
+  #ifndef PyUnicode_InternFromString
+    #define PyUnicode_InternFromString(s) PyUnicode_FromString(s)
+  #endif
+#endif
+#if PY_VERSION_HEX < 0x030200A4
+  typedef long Py_hash_t;
+  #define __Pyx_PyInt_FromHash_t PyInt_FromLong
+  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsHash_t
+#else
+  #define __Pyx_PyInt_FromHash_t PyInt_FromSsize_t
+  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsSsize_t
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyMethod_New(func, self, klass) ((self) ? ((void)(klass), PyMethod_New(func, self)) : __Pyx_NewRef(func))
+#else
+  #define __Pyx_PyMethod_New(func, self, klass) PyMethod_New(func, self, klass)
+#endif
+#if CYTHON_USE_ASYNC_SLOTS
+  #if PY_VERSION_HEX >= 0x030500B1
+    #define __Pyx_PyAsyncMethodsStruct PyAsyncMethods
+    #define __Pyx_PyType_AsAsync(obj) (Py_TYPE(obj)->tp_as_async)
+  #else
+    #define __Pyx_PyType_AsAsync(obj) ((__Pyx_PyAsyncMethodsStruct*) (Py_TYPE(obj)->tp_reserved))
+  #endif
+#else
+  #define __Pyx_PyType_AsAsync(obj) NULL
+#endif
+#ifndef __Pyx_PyAsyncMethodsStruct
+    typedef struct {
+        unaryfunc am_await;
+        unaryfunc am_aiter;
+        unaryfunc am_anext;
+    } __Pyx_PyAsyncMethodsStruct;
+#endif
+
+#if defined(_WIN32) || defined(WIN32) || defined(MS_WINDOWS)
+  #if !defined(_USE_MATH_DEFINES)
+    #define _USE_MATH_DEFINES
+  #endif
+#endif
+#include <math.h>
+#ifdef NAN
+#define __PYX_NAN() ((float) NAN)
+#else
+static CYTHON_INLINE float __PYX_NAN() {
+  float value;
+  memset(&value, 0xFF, sizeof(value));
+  return value;
+}
+#endif
+#if defined(__CYGWIN__) && defined(_LDBL_EQ_DBL)
+#define __Pyx_truncl trunc
+#else
+#define __Pyx_truncl truncl
+#endif
+
+#define __PYX_MARK_ERR_POS(f_index, lineno) \
+    { __pyx_filename = __pyx_f[f_index]; (void)__pyx_filename; __pyx_lineno = lineno; (void)__pyx_lineno; __pyx_clineno = __LINE__; (void)__pyx_clineno; }
+#define __PYX_ERR(f_index, lineno, Ln_error) \
+    { __PYX_MARK_ERR_POS(f_index, lineno) goto Ln_error; }
+
+#ifndef __PYX_EXTERN_C
+  #ifdef __cplusplus
+    #define __PYX_EXTERN_C extern "C"
+  #else
+    #define __PYX_EXTERN_C extern
+  #endif
+#endif
+
+#define __PYX_HAVE__breezy__bzr___groupcompress_pyx
+#define __PYX_HAVE_API__breezy__bzr___groupcompress_pyx
+/* Early includes */
+#include "python-compat.h"
+#include <string.h>
+#include <stdlib.h>
+#include <stdio.h>
+#include "delta.h"
+#ifdef _OPENMP
+#include <omp.h>
+#endif /* _OPENMP */
+
+#if defined(PYREX_WITHOUT_ASSERTIONS) && !defined(CYTHON_WITHOUT_ASSERTIONS)
+#define CYTHON_WITHOUT_ASSERTIONS
+#endif
+
+typedef struct {PyObject **p; const char *s; const Py_ssize_t n; const char* encoding;
+                const char is_unicode; const char is_str; const char intern; } __Pyx_StringTabEntry;
+
+#define __PYX_DEFAULT_STRING_ENCODING_IS_ASCII 0
+#define __PYX_DEFAULT_STRING_ENCODING_IS_UTF8 0
+#define __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT (PY_MAJOR_VERSION >= 3 && __PYX_DEFAULT_STRING_ENCODING_IS_UTF8)
+#define __PYX_DEFAULT_STRING_ENCODING ""
+#define __Pyx_PyObject_FromString __Pyx_PyBytes_FromString
+#define __Pyx_PyObject_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
+#define __Pyx_uchar_cast(c) ((unsigned char)c)
+#define __Pyx_long_cast(x) ((long)x)
+#define __Pyx_fits_Py_ssize_t(v, type, is_signed)  (\
+    (sizeof(type) < sizeof(Py_ssize_t))  ||\
+    (sizeof(type) > sizeof(Py_ssize_t) &&\
+          likely(v < (type)PY_SSIZE_T_MAX ||\
+                 v == (type)PY_SSIZE_T_MAX)  &&\
+          (!is_signed || likely(v > (type)PY_SSIZE_T_MIN ||\
+                                v == (type)PY_SSIZE_T_MIN)))  ||\
+    (sizeof(type) == sizeof(Py_ssize_t) &&\
+          (is_signed || likely(v < (type)PY_SSIZE_T_MAX ||\
+                               v == (type)PY_SSIZE_T_MAX)))  )
+static CYTHON_INLINE int __Pyx_is_valid_index(Py_ssize_t i, Py_ssize_t limit) {
+    return (size_t) i < (size_t) limit;
+}
+#if defined (__cplusplus) && __cplusplus >= 201103L
+    #include <cstdlib>
+    #define __Pyx_sst_abs(value) std::abs(value)
+#elif SIZEOF_INT >= SIZEOF_SIZE_T
+    #define __Pyx_sst_abs(value) abs(value)
+#elif SIZEOF_LONG >= SIZEOF_SIZE_T
+    #define __Pyx_sst_abs(value) labs(value)
+#elif defined (_MSC_VER)
+    #define __Pyx_sst_abs(value) ((Py_ssize_t)_abs64(value))
+#elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define __Pyx_sst_abs(value) llabs(value)
+#elif defined (__GNUC__)
+    #define __Pyx_sst_abs(value) __builtin_llabs(value)
+#else
+    #define __Pyx_sst_abs(value) ((value<0) ? -value : value)
+#endif
+static CYTHON_INLINE const char* __Pyx_PyObject_AsString(PyObject*);
+static CYTHON_INLINE const char* __Pyx_PyObject_AsStringAndSize(PyObject*, Py_ssize_t* length);
+#define __Pyx_PyByteArray_FromString(s) PyByteArray_FromStringAndSize((const char*)s, strlen((const char*)s))
+#define __Pyx_PyByteArray_FromStringAndSize(s, l) PyByteArray_FromStringAndSize((const char*)s, l)
+#define __Pyx_PyBytes_FromString        PyBytes_FromString
+#define __Pyx_PyBytes_FromStringAndSize PyBytes_FromStringAndSize
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char*);
+#if PY_MAJOR_VERSION < 3
+    #define __Pyx_PyStr_FromString        __Pyx_PyBytes_FromString
+    #define __Pyx_PyStr_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
+#else
+    #define __Pyx_PyStr_FromString        __Pyx_PyUnicode_FromString
+    #define __Pyx_PyStr_FromStringAndSize __Pyx_PyUnicode_FromStringAndSize
+#endif
+#define __Pyx_PyBytes_AsWritableString(s)     ((char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsWritableSString(s)    ((signed char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsWritableUString(s)    ((unsigned char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsString(s)     ((const char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsSString(s)    ((const signed char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsUString(s)    ((const unsigned char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyObject_AsWritableString(s)    ((char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsWritableSString(s)    ((signed char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsWritableUString(s)    ((unsigned char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsSString(s)    ((const signed char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsUString(s)    ((const unsigned char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_FromCString(s)  __Pyx_PyObject_FromString((const char*)s)
+#define __Pyx_PyBytes_FromCString(s)   __Pyx_PyBytes_FromString((const char*)s)
+#define __Pyx_PyByteArray_FromCString(s)   __Pyx_PyByteArray_FromString((const char*)s)
+#define __Pyx_PyStr_FromCString(s)     __Pyx_PyStr_FromString((const char*)s)
+#define __Pyx_PyUnicode_FromCString(s) __Pyx_PyUnicode_FromString((const char*)s)
+static CYTHON_INLINE size_t __Pyx_Py_UNICODE_strlen(const Py_UNICODE *u) {
+    const Py_UNICODE *u_end = u;
+    while (*u_end++) ;
+    return (size_t)(u_end - u - 1);
+}
+#define __Pyx_PyUnicode_FromUnicode(u)       PyUnicode_FromUnicode(u, __Pyx_Py_UNICODE_strlen(u))
+#define __Pyx_PyUnicode_FromUnicodeAndLength PyUnicode_FromUnicode
+#define __Pyx_PyUnicode_AsUnicode            PyUnicode_AsUnicode
+#define __Pyx_NewRef(obj) (Py_INCREF(obj), obj)
+#define __Pyx_Owned_Py_None(b) __Pyx_NewRef(Py_None)
+static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b);
+static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject*);
+static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject*);
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_IntOrLong(PyObject* x);
+#define __Pyx_PySequence_Tuple(obj)\
+    (likely(PyTuple_CheckExact(obj)) ? __Pyx_NewRef(obj) : PySequence_Tuple(obj))
+static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject*);
+static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t);
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject*);
+#if CYTHON_ASSUME_SAFE_MACROS
+#define __pyx_PyFloat_AsDouble(x) (PyFloat_CheckExact(x) ? PyFloat_AS_DOUBLE(x) : PyFloat_AsDouble(x))
+#else
+#define __pyx_PyFloat_AsDouble(x) PyFloat_AsDouble(x)
+#endif
+#define __pyx_PyFloat_AsFloat(x) ((float) __pyx_PyFloat_AsDouble(x))
+#if PY_MAJOR_VERSION >= 3
+#define __Pyx_PyNumber_Int(x) (PyLong_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Long(x))
+#else
+#define __Pyx_PyNumber_Int(x) (PyInt_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Int(x))
+#endif
+#define __Pyx_PyNumber_Float(x) (PyFloat_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Float(x))
+#if PY_MAJOR_VERSION < 3 && __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+static int __Pyx_sys_getdefaultencoding_not_ascii;
+static int __Pyx_init_sys_getdefaultencoding_params(void) {
+    PyObject* sys;
+    PyObject* default_encoding = NULL;
+    PyObject* ascii_chars_u = NULL;
+    PyObject* ascii_chars_b = NULL;
+    const char* default_encoding_c;
+    sys = PyImport_ImportModule("sys");
+    if (!sys) goto bad;
+    default_encoding = PyObject_CallMethod(sys, (char*) "getdefaultencoding", NULL);
+    Py_DECREF(sys);
+    if (!default_encoding) goto bad;
+    default_encoding_c = PyBytes_AsString(default_encoding);
+    if (!default_encoding_c) goto bad;
+    if (strcmp(default_encoding_c, "ascii") == 0) {
+        __Pyx_sys_getdefaultencoding_not_ascii = 0;
+    } else {
+        char ascii_chars[128];
+        int c;
+        for (c = 0; c < 128; c++) {
+            ascii_chars[c] = c;
+        }
+        __Pyx_sys_getdefaultencoding_not_ascii = 1;
+        ascii_chars_u = PyUnicode_DecodeASCII(ascii_chars, 128, NULL);
+        if (!ascii_chars_u) goto bad;
+        ascii_chars_b = PyUnicode_AsEncodedString(ascii_chars_u, default_encoding_c, NULL);
+        if (!ascii_chars_b || !PyBytes_Check(ascii_chars_b) || memcmp(ascii_chars, PyBytes_AS_STRING(ascii_chars_b), 128) != 0) {
+            PyErr_Format(
+                PyExc_ValueError,
+                "This module compiled with c_string_encoding=ascii, but default encoding '%.200s' is not a superset of ascii.",
+                default_encoding_c);
+            goto bad;
+        }
+        Py_DECREF(ascii_chars_u);
+        Py_DECREF(ascii_chars_b);
+    }
+    Py_DECREF(default_encoding);
+    return 0;
+bad:
+    Py_XDECREF(default_encoding);
+    Py_XDECREF(ascii_chars_u);
+    Py_XDECREF(ascii_chars_b);
+    return -1;
+}
+#endif
+#if __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT && PY_MAJOR_VERSION >= 3
+#define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_DecodeUTF8(c_str, size, NULL)
+#else
+#define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_Decode(c_str, size, __PYX_DEFAULT_STRING_ENCODING, NULL)
+#if __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+static char* __PYX_DEFAULT_STRING_ENCODING;
+static int __Pyx_init_sys_getdefaultencoding_params(void) {
+    PyObject* sys;
+    PyObject* default_encoding = NULL;
+    char* default_encoding_c;
+    sys = PyImport_ImportModule("sys");
+    if (!sys) goto bad;
+    default_encoding = PyObject_CallMethod(sys, (char*) (const char*) "getdefaultencoding", NULL);
+    Py_DECREF(sys);
+    if (!default_encoding) goto bad;
+    default_encoding_c = PyBytes_AsString(default_encoding);
+    if (!default_encoding_c) goto bad;
+    __PYX_DEFAULT_STRING_ENCODING = (char*) malloc(strlen(default_encoding_c) + 1);
+    if (!__PYX_DEFAULT_STRING_ENCODING) goto bad;
+    strcpy(__PYX_DEFAULT_STRING_ENCODING, default_encoding_c);
+    Py_DECREF(default_encoding);
+    return 0;
+bad:
+    Py_XDECREF(default_encoding);
+    return -1;
+}
+#endif
+#endif
+
+
+/* Test for GCC > 2.95 */
+#if defined(__GNUC__)     && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))
+  #define likely(x)   __builtin_expect(!!(x), 1)
+  #define unlikely(x) __builtin_expect(!!(x), 0)
+#else /* !__GNUC__ or GCC < 2.95 */
+  #define likely(x)   (x)
+  #define unlikely(x) (x)
+#endif /* __GNUC__ */
+static CYTHON_INLINE void __Pyx_pretend_to_initialize(void* ptr) { (void)ptr; }
+
+static PyObject *__pyx_m = NULL;
+static PyObject *__pyx_d;
+static PyObject *__pyx_b;
+static PyObject *__pyx_cython_runtime = NULL;
+static PyObject *__pyx_empty_tuple;
+static PyObject *__pyx_empty_bytes;
+static PyObject *__pyx_empty_unicode;
+static int __pyx_lineno;
+static int __pyx_clineno = 0;
+static const char * __pyx_cfilenm= __FILE__;
+static const char *__pyx_filename;
+
+
+static const char *__pyx_f[] = {
+  "breezy/bzr/_groupcompress_pyx.pyx",
+  "stringsource",
+  "type.pxd",
+};
+/* NoFastGil.proto */
+#define __Pyx_PyGILState_Ensure PyGILState_Ensure
+#define __Pyx_PyGILState_Release PyGILState_Release
+#define __Pyx_FastGIL_Remember()
+#define __Pyx_FastGIL_Forget()
+#define __Pyx_FastGilFuncInit()
+
+/* ForceInitThreads.proto */
+#ifndef __PYX_FORCE_INIT_THREADS
+  #define __PYX_FORCE_INIT_THREADS 0
+#endif
+
+
+/*--- Type declarations ---*/
+struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex;
+
+/* "breezy/bzr/_groupcompress_pyx.pyx":112
+ * 
+ * 
+ * cdef class DeltaIndex:             # <<<<<<<<<<<<<<
+ * 
+ *     cdef readonly list _sources
+ */
+struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *__pyx_vtab;
+  PyObject *_sources;
+  struct source_info *_source_infos;
+  struct delta_index *_index;
+  unsigned long _source_offset;
+  unsigned int _max_num_sources;
+  int _max_bytes_to_index;
+};
+
+
+
+struct __pyx_vtabstruct_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex {
+  PyObject *(*_populate_first_index)(struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *);
+  PyObject *(*_expand_sources)(struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *);
+};
+static struct __pyx_vtabstruct_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *__pyx_vtabptr_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex;
+
+/* --- Runtime support code (head) --- */
+/* Refnanny.proto */
+#ifndef CYTHON_REFNANNY
+  #define CYTHON_REFNANNY 0
+#endif
+#if CYTHON_REFNANNY
+  typedef struct {
+    void (*INCREF)(void*, PyObject*, int);
+    void (*DECREF)(void*, PyObject*, int);
+    void (*GOTREF)(void*, PyObject*, int);
+    void (*GIVEREF)(void*, PyObject*, int);
+    void* (*SetupContext)(const char*, int, const char*);
+    void (*FinishContext)(void**);
+  } __Pyx_RefNannyAPIStruct;
+  static __Pyx_RefNannyAPIStruct *__Pyx_RefNanny = NULL;
+  static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname);
+  #define __Pyx_RefNannyDeclarations void *__pyx_refnanny = NULL;
+#ifdef WITH_THREAD
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)\
+          if (acquire_gil) {\
+              PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();\
+              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__);\
+              PyGILState_Release(__pyx_gilstate_save);\
+          } else {\
+              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__);\
+          }
+#else
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)\
+          __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__)
+#endif
+  #define __Pyx_RefNannyFinishContext()\
+          __Pyx_RefNanny->FinishContext(&__pyx_refnanny)
+  #define __Pyx_INCREF(r)  __Pyx_RefNanny->INCREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_DECREF(r)  __Pyx_RefNanny->DECREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_GOTREF(r)  __Pyx_RefNanny->GOTREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_GIVEREF(r) __Pyx_RefNanny->GIVEREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_XINCREF(r)  do { if((r) != NULL) {__Pyx_INCREF(r); }} while(0)
+  #define __Pyx_XDECREF(r)  do { if((r) != NULL) {__Pyx_DECREF(r); }} while(0)
+  #define __Pyx_XGOTREF(r)  do { if((r) != NULL) {__Pyx_GOTREF(r); }} while(0)
+  #define __Pyx_XGIVEREF(r) do { if((r) != NULL) {__Pyx_GIVEREF(r);}} while(0)
+#else
+  #define __Pyx_RefNannyDeclarations
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)
+  #define __Pyx_RefNannyFinishContext()
+  #define __Pyx_INCREF(r) Py_INCREF(r)
+  #define __Pyx_DECREF(r) Py_DECREF(r)
+  #define __Pyx_GOTREF(r)
+  #define __Pyx_GIVEREF(r)
+  #define __Pyx_XINCREF(r) Py_XINCREF(r)
+  #define __Pyx_XDECREF(r) Py_XDECREF(r)
+  #define __Pyx_XGOTREF(r)
+  #define __Pyx_XGIVEREF(r)
+#endif
+#define __Pyx_XDECREF_SET(r, v) do {\
+        PyObject *tmp = (PyObject *) r;\
+        r = v; __Pyx_XDECREF(tmp);\
+    } while (0)
+#define __Pyx_DECREF_SET(r, v) do {\
+        PyObject *tmp = (PyObject *) r;\
+        r = v; __Pyx_DECREF(tmp);\
+    } while (0)
+#define __Pyx_CLEAR(r)    do { PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);} while(0)
+#define __Pyx_XCLEAR(r)   do { if((r) != NULL) {PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);}} while(0)
+
+/* PyObjectGetAttrStr.proto */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GetAttrStr(o,n) PyObject_GetAttr(o,n)
+#endif
+
+/* GetBuiltinName.proto */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name);
+
+/* PyCFunctionFastCall.proto */
+#if CYTHON_FAST_PYCCALL
+static CYTHON_INLINE PyObject *__Pyx_PyCFunction_FastCall(PyObject *func, PyObject **args, Py_ssize_t nargs);
+#else
+#define __Pyx_PyCFunction_FastCall(func, args, nargs)  (assert(0), NULL)
+#endif
+
+/* PyFunctionFastCall.proto */
+#if CYTHON_FAST_PYCALL
+#define __Pyx_PyFunction_FastCall(func, args, nargs)\
+    __Pyx_PyFunction_FastCallDict((func), (args), (nargs), NULL)
+#if 1 || PY_VERSION_HEX < 0x030600B1
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, Py_ssize_t nargs, PyObject *kwargs);
+#else
+#define __Pyx_PyFunction_FastCallDict(func, args, nargs, kwargs) _PyFunction_FastCallDict(func, args, nargs, kwargs)
+#endif
+#define __Pyx_BUILD_ASSERT_EXPR(cond)\
+    (sizeof(char [1 - 2*!(cond)]) - 1)
+#ifndef Py_MEMBER_SIZE
+#define Py_MEMBER_SIZE(type, member) sizeof(((type *)0)->member)
+#endif
+#if CYTHON_FAST_PYCALL
+  static size_t __pyx_pyframe_localsplus_offset = 0;
+  #include "frameobject.h"
+#if PY_VERSION_HEX >= 0x030b00a6
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
+  #define __Pxy_PyFrame_Initialize_Offsets()\
+    ((void)__Pyx_BUILD_ASSERT_EXPR(sizeof(PyFrameObject) == offsetof(PyFrameObject, f_localsplus) + Py_MEMBER_SIZE(PyFrameObject, f_localsplus)),\
+     (void)(__pyx_pyframe_localsplus_offset = ((size_t)PyFrame_Type.tp_basicsize) - Py_MEMBER_SIZE(PyFrameObject, f_localsplus)))
+  #define __Pyx_PyFrame_GetLocalsplus(frame)\
+    (assert(__pyx_pyframe_localsplus_offset), (PyObject **)(((char *)(frame)) + __pyx_pyframe_localsplus_offset))
+#endif // CYTHON_FAST_PYCALL
+#endif
+
+/* PyObjectCall.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw);
+#else
+#define __Pyx_PyObject_Call(func, arg, kw) PyObject_Call(func, arg, kw)
+#endif
+
+/* PyObjectCallMethO.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg);
+#endif
+
+/* PyObjectCallOneArg.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg);
+
+/* PyThreadStateGet.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyThreadState_declare  PyThreadState *__pyx_tstate;
+#define __Pyx_PyThreadState_assign  __pyx_tstate = __Pyx_PyThreadState_Current;
+#define __Pyx_PyErr_Occurred()  __pyx_tstate->curexc_type
+#else
+#define __Pyx_PyThreadState_declare
+#define __Pyx_PyThreadState_assign
+#define __Pyx_PyErr_Occurred()  PyErr_Occurred()
+#endif
+
+/* PyErrFetchRestore.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_Clear() __Pyx_ErrRestore(NULL, NULL, NULL)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  __Pyx_ErrRestoreInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)    __Pyx_ErrFetchInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  __Pyx_ErrRestoreInState(__pyx_tstate, type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)    __Pyx_ErrFetchInState(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_PyErr_SetNone(exc) (Py_INCREF(exc), __Pyx_ErrRestore((exc), NULL, NULL))
+#else
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#endif
+#else
+#define __Pyx_PyErr_Clear() PyErr_Clear()
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestoreInState(tstate, type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchInState(tstate, type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)  PyErr_Fetch(type, value, tb)
+#endif
+
+/* RaiseException.proto */
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause);
+
+/* RaiseDoubleKeywords.proto */
+static void __Pyx_RaiseDoubleKeywordsError(const char* func_name, PyObject* kw_name);
+
+/* ParseKeywords.proto */
+static int __Pyx_ParseOptionalKeywords(PyObject *kwds, PyObject **argnames[],\
+    PyObject *kwds2, PyObject *values[], Py_ssize_t num_pos_args,\
+    const char* function_name);
+
+/* RaiseArgTupleInvalid.proto */
+static void __Pyx_RaiseArgtupleInvalid(const char* func_name, int exact,
+    Py_ssize_t num_min, Py_ssize_t num_max, Py_ssize_t num_found);
+
+/* PyObjectFormatAndDecref.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_FormatSimpleAndDecref(PyObject* s, PyObject* f);
+static CYTHON_INLINE PyObject* __Pyx_PyObject_FormatAndDecref(PyObject* s, PyObject* f);
+
+/* GCCDiagnostics.proto */
+#if defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 6))
+#define __Pyx_HAS_GCC_DIAGNOSTIC
+#endif
+
+/* BuildPyUnicode.proto */
+static PyObject* __Pyx_PyUnicode_BuildFromAscii(Py_ssize_t ulength, char* chars, int clength,
+                                                int prepend_sign, char padding_char);
+
+/* IncludeStringH.proto */
+#include <string.h>
+
+/* CIntToPyUnicode.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_From_Py_ssize_t(Py_ssize_t value, Py_ssize_t width, char padding_char, char format_char);
+
+/* CIntToPyUnicode.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_From_unsigned_long(unsigned long value, Py_ssize_t width, char padding_char, char format_char);
+
+/* JoinPyUnicode.proto */
+static PyObject* __Pyx_PyUnicode_Join(PyObject* value_tuple, Py_ssize_t value_count, Py_ssize_t result_ulength,
+                                      Py_UCS4 max_char);
+
+/* ListAppend.proto */
+#if CYTHON_USE_PYLIST_INTERNALS && CYTHON_ASSUME_SAFE_MACROS
+static CYTHON_INLINE int __Pyx_PyList_Append(PyObject* list, PyObject* x) {
+    PyListObject* L = (PyListObject*) list;
+    Py_ssize_t len = Py_SIZE(list);
+    if (likely(L->allocated > len) & likely(len > (L->allocated >> 1))) {
+        Py_INCREF(x);
+        PyList_SET_ITEM(list, len, x);
+        __Pyx_SET_SIZE(list, len + 1);
+        return 0;
+    }
+    return PyList_Append(list, x);
+}
+#else
+#define __Pyx_PyList_Append(L,x) PyList_Append(L,x)
+#endif
+
+/* PyObjectCall2Args.proto */
+static CYTHON_UNUSED PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2);
+
+/* CIntToPyUnicode.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_From_unsigned_int(unsigned int value, Py_ssize_t width, char padding_char, char format_char);
+
+/* CIntToPyUnicode.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_From_unsigned_char(unsigned char value, Py_ssize_t width, char padding_char, char format_char);
+
+/* CIntToPyUnicode.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_From_int(int value, Py_ssize_t width, char padding_char, char format_char);
+
+/* PyObject_GenericGetAttrNoDict.proto */
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GenericGetAttrNoDict(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GenericGetAttrNoDict PyObject_GenericGetAttr
+#endif
+
+/* PyObject_GenericGetAttr.proto */
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static PyObject* __Pyx_PyObject_GenericGetAttr(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GenericGetAttr PyObject_GenericGetAttr
+#endif
+
+/* SetVTable.proto */
+static int __Pyx_SetVtable(PyObject *dict, void *vtable);
+
+/* PyErrExceptionMatches.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_ExceptionMatches(err) __Pyx_PyErr_ExceptionMatchesInState(__pyx_tstate, err)
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err);
+#else
+#define __Pyx_PyErr_ExceptionMatches(err)  PyErr_ExceptionMatches(err)
+#endif
+
+/* PyObjectGetAttrStrNoError.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name);
+
+/* SetupReduce.proto */
+static int __Pyx_setup_reduce(PyObject* type_obj);
+
+/* TypeImport.proto */
+#ifndef __PYX_HAVE_RT_ImportType_proto_0_29_37
+#define __PYX_HAVE_RT_ImportType_proto_0_29_37
+#if __STDC_VERSION__ >= 201112L
+#include <stdalign.h>
+#endif
+#if __STDC_VERSION__ >= 201112L || __cplusplus >= 201103L
+#define __PYX_GET_STRUCT_ALIGNMENT_0_29_37(s) alignof(s)
+#else
+#define __PYX_GET_STRUCT_ALIGNMENT_0_29_37(s) sizeof(void*)
+#endif
+enum __Pyx_ImportType_CheckSize_0_29_37 {
+   __Pyx_ImportType_CheckSize_Error_0_29_37 = 0,
+   __Pyx_ImportType_CheckSize_Warn_0_29_37 = 1,
+   __Pyx_ImportType_CheckSize_Ignore_0_29_37 = 2
+};
+static PyTypeObject *__Pyx_ImportType_0_29_37(PyObject* module, const char *module_name, const char *class_name, size_t size, size_t alignment, enum __Pyx_ImportType_CheckSize_0_29_37 check_size);
+#endif
+
+/* PyDictVersioning.proto */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+#define __PYX_DICT_VERSION_INIT  ((PY_UINT64_T) -1)
+#define __PYX_GET_DICT_VERSION(dict)  (((PyDictObject*)(dict))->ma_version_tag)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)\
+    (version_var) = __PYX_GET_DICT_VERSION(dict);\
+    (cache_var) = (value);
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP) {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    if (likely(__PYX_GET_DICT_VERSION(DICT) == __pyx_dict_version)) {\
+        (VAR) = __pyx_dict_cached_value;\
+    } else {\
+        (VAR) = __pyx_dict_cached_value = (LOOKUP);\
+        __pyx_dict_version = __PYX_GET_DICT_VERSION(DICT);\
+    }\
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj);
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj);
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version);
+#else
+#define __PYX_GET_DICT_VERSION(dict)  (0)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP)  (VAR) = (LOOKUP);
+#endif
+
+/* CLineInTraceback.proto */
+#ifdef CYTHON_CLINE_IN_TRACEBACK
+#define __Pyx_CLineForTraceback(tstate, c_line)  (((CYTHON_CLINE_IN_TRACEBACK)) ? c_line : 0)
+#else
+static int __Pyx_CLineForTraceback(PyThreadState *tstate, int c_line);
+#endif
+
+/* CodeObjectCache.proto */
+typedef struct {
+    PyCodeObject* code_object;
+    int code_line;
+} __Pyx_CodeObjectCacheEntry;
+struct __Pyx_CodeObjectCache {
+    int count;
+    int max_count;
+    __Pyx_CodeObjectCacheEntry* entries;
+};
+static struct __Pyx_CodeObjectCache __pyx_code_cache = {0,0,NULL};
+static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line);
+static PyCodeObject *__pyx_find_code_object(int code_line);
+static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object);
+
+/* AddTraceback.proto */
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_delta_result(delta_result value);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_unsigned_int(unsigned int value);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_unsigned_long(unsigned long value);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE unsigned long __Pyx_PyInt_As_unsigned_long(PyObject *);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE unsigned int __Pyx_PyInt_As_unsigned_int(PyObject *);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *);
+
+/* FastTypeChecks.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_TypeCheck(obj, type) __Pyx_IsSubtype(Py_TYPE(obj), (PyTypeObject *)type)
+static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b);
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject *type);
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *type1, PyObject *type2);
+#else
+#define __Pyx_TypeCheck(obj, type) PyObject_TypeCheck(obj, (PyTypeObject *)type)
+#define __Pyx_PyErr_GivenExceptionMatches(err, type) PyErr_GivenExceptionMatches(err, type)
+#define __Pyx_PyErr_GivenExceptionMatches2(err, type1, type2) (PyErr_GivenExceptionMatches(err, type1) || PyErr_GivenExceptionMatches(err, type2))
+#endif
+#define __Pyx_PyException_Check(obj) __Pyx_TypeCheck(obj, PyExc_Exception)
+
+/* CheckBinaryVersion.proto */
+static int __Pyx_check_binary_version(void);
+
+/* InitStrings.proto */
+static int __Pyx_InitStrings(__Pyx_StringTabEntry *t);
+
+static PyObject *__pyx_f_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex__populate_first_index(struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *__pyx_v_self); /* proto*/
+static PyObject *__pyx_f_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex__expand_sources(CYTHON_UNUSED struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *__pyx_v_self); /* proto*/
+
+/* Module declarations from 'libc.string' */
+
+/* Module declarations from 'libc.stdlib' */
+
+/* Module declarations from 'libc.stdio' */
+
+/* Module declarations from '__builtin__' */
+
+/* Module declarations from 'cpython.type' */
+static PyTypeObject *__pyx_ptype_7cpython_4type_type = 0;
+
+/* Module declarations from 'cpython' */
+
+/* Module declarations from 'cpython.object' */
+
+/* Module declarations from 'cpython.bytes' */
+
+/* Module declarations from 'cpython.mem' */
+
+/* Module declarations from 'breezy.bzr._groupcompress_pyx' */
+static PyTypeObject *__pyx_ptype_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex = 0;
+static PyObject *__pyx_f_6breezy_3bzr_18_groupcompress_pyx__translate_delta_failure(delta_result); /*proto*/
+static unsigned char *__pyx_f_6breezy_3bzr_18_groupcompress_pyx__decode_copy_instruction(unsigned char *, unsigned char, unsigned int *, unsigned int *); /*proto*/
+static PyObject *__pyx_f_6breezy_3bzr_18_groupcompress_pyx__apply_delta(char *, Py_ssize_t, char *, Py_ssize_t); /*proto*/
+#define __Pyx_MODULE_NAME "breezy.bzr._groupcompress_pyx"
+extern int __pyx_module_is_main_breezy__bzr___groupcompress_pyx;
+int __pyx_module_is_main_breezy__bzr___groupcompress_pyx = 0;
+
+/* Implementation of 'breezy.bzr._groupcompress_pyx' */
+static PyObject *__pyx_builtin_MemoryError;
+static PyObject *__pyx_builtin_ValueError;
+static PyObject *__pyx_builtin_RuntimeError;
+static PyObject *__pyx_builtin_AssertionError;
+static PyObject *__pyx_builtin_map;
+static PyObject *__pyx_builtin_TypeError;
+static const char __pyx_k_d[] = "d";
+static const char __pyx_k__9[] = "(";
+static const char __pyx_k_di[] = "di";
+static const char __pyx_k__10[] = ", ";
+static const char __pyx_k__11[] = ")";
+static const char __pyx_k__20[] = " > ";
+static const char __pyx_k_map[] = "map";
+static const char __pyx_k_val[] = "val";
+static const char __pyx_k_data[] = "data";
+static const char __pyx_k_main[] = "__main__";
+static const char __pyx_k_name[] = "__name__";
+static const char __pyx_k_size[] = ", size = ";
+static const char __pyx_k_test[] = "__test__";
+static const char __pyx_k_uval[] = "uval";
+static const char __pyx_k_c_val[] = "c_val";
+static const char __pyx_k_class[] = "__class__";
+static const char __pyx_k_count[] = "count";
+static const char __pyx_k_delta[] = "delta";
+static const char __pyx_k_shift[] = "shift";
+static const char __pyx_k_offset[] = "offset";
+static const char __pyx_k_reduce[] = "__reduce__";
+static const char __pyx_k_source[] = "source";
+static const char __pyx_k_c_bytes[] = "c_bytes";
+static const char __pyx_k_c_delta[] = "c_delta";
+static const char __pyx_k_content[] = "content";
+static const char __pyx_k_cp_size[] = ", cp_size = ";
+static const char __pyx_k_c_source[] = "c_source";
+static const char __pyx_k_getstate[] = "__getstate__";
+static const char __pyx_k_setstate[] = "__setstate__";
+static const char __pyx_k_TypeError[] = "TypeError";
+static const char __pyx_k_delta_end[] = "delta_end";
+static const char __pyx_k_num_bytes[] = "num_bytes";
+static const char __pyx_k_reduce_ex[] = "__reduce_ex__";
+static const char __pyx_k_DeltaIndex[] = "DeltaIndex";
+static const char __pyx_k_ValueError[] = "ValueError";
+static const char __pyx_k_add_source[] = "add_source";
+static const char __pyx_k_delta_size[] = "delta_size ";
+static const char __pyx_k_make_delta[] = "make_delta";
+static const char __pyx_k_pyx_vtable[] = "__pyx_vtable__";
+static const char __pyx_k_rabin_hash[] = "_rabin_hash";
+static const char __pyx_k_MemoryError[] = "MemoryError";
+static const char __pyx_k_apply_delta[] = "apply_delta";
+static const char __pyx_k_c_delta_end[] = "c_delta_end";
+static const char __pyx_k_delta_bytes[] = "delta_bytes";
+static const char __pyx_k_delta_start[] = "delta_start";
+static const char __pyx_k_source_size[] = " source_size = ";
+static const char __pyx_k_RuntimeError[] = "RuntimeError";
+static const char __pyx_k_c_delta_size[] = "c_delta_size";
+static const char __pyx_k_delta_size_2[] = "delta_size";
+static const char __pyx_k_source_bytes[] = "source_bytes";
+static const char __pyx_k_target_bytes[] = "target_bytes";
+static const char __pyx_k_c_delta_start[] = "c_delta_start";
+static const char __pyx_k_c_source_size[] = "c_source_size";
+static const char __pyx_k_num_low_bytes[] = "num_low_bytes";
+static const char __pyx_k_reduce_cython[] = "__reduce_cython__";
+static const char __pyx_k_source_size_2[] = "source_size";
+static const char __pyx_k_unadded_bytes[] = "unadded_bytes";
+static const char __pyx_k_AssertionError[] = "AssertionError";
+static const char __pyx_k_max_delta_size[] = "max_delta_size";
+static const char __pyx_k_setstate_cython[] = "__setstate_cython__";
+static const char __pyx_k_make_delta_index[] = "make_delta_index";
+static const char __pyx_k_cline_in_traceback[] = "cline_in_traceback";
+static const char __pyx_k_decode_base128_int[] = "decode_base128_int";
+static const char __pyx_k_encode_base128_int[] = "encode_base128_int";
+static const char __pyx_k_max_bytes_to_index[] = "max_bytes_to_index";
+static const char __pyx_k_source_is_not_a_str[] = "source is not a str";
+static const char __pyx_k_apply_delta_to_source[] = "apply_delta_to_source";
+static const char __pyx_k_bytes_is_not_a_string[] = "bytes is not a string";
+static const char __pyx_k_delta_ends_after_source[] = "delta ends after source";
+static const char __pyx_k_content_must_be_a_string[] = "content must be a string";
+static const char __pyx_k_delta_is_not_a_bytestring[] = "delta is not a bytestring";
+static const char __pyx_k_delta_starts_after_source[] = "delta starts after source";
+static const char __pyx_k_bytes_in_size_and_top_data[] = " bytes in \"size\", and top - data = ";
+static const char __pyx_k_delta_starts_after_it_ends[] = "delta starts after it ends";
+static const char __pyx_k_source_is_not_a_bytestring[] = "source is not a bytestring";
+static const char __pyx_k_target_is_not_a_bytestring[] = "target is not a bytestring";
+static const char __pyx_k_Something_wrong_with_cp_off[] = "Something wrong with: cp_off = ";
+static const char __pyx_k_smaller_than_min_delta_size[] = " smaller than min delta size ";
+static const char __pyx_k_breezy_bzr__groupcompress_pyx[] = "breezy.bzr._groupcompress_pyx";
+static const char __pyx_k_populate_first_index_should_onl[] = "_populate_first_index should only be called when we have a single source and no index yet";
+static const char __pyx_k_Compiled_extensions_for_doing_co[] = "Compiled extensions for doing compression.";
+static const char __pyx_k_Data_not_properly_formatted_we_r[] = "Data not properly formatted, we ran out of bytes before 0x80 stopped being set.";
+static const char __pyx_k_Delta_function_failed_to_allocat[] = "Delta function failed to allocate memory";
+static const char __pyx_k_Delta_function_given_empty_buffe[] = "Delta function given empty buffer params";
+static const char __pyx_k_Delta_function_given_empty_sourc[] = "Delta function given empty source_info param";
+static const char __pyx_k_Delta_function_given_invalid_sou[] = "Delta function given invalid source_info param";
+static const char __pyx_k_Delta_function_requires_delta_in[] = "Delta function requires delta_index param";
+static const char __pyx_k_Did_not_extract_the_number_of_by[] = "Did not extract the number of bytes we expected we were left with ";
+static const char __pyx_k_Got_delta_opcode_0_not_supported[] = "Got delta opcode: 0, not supported";
+static const char __pyx_k_Insert_instruction_longer_than_r[] = "Insert instruction longer than remaining bytes: ";
+static const char __pyx_k_Number_of_bytes_extracted_did_no[] = "Number of bytes extracted did not match the size encoded in the delta header.";
+static const char __pyx_k_Unrecognised_delta_result_code_d[] = "Unrecognised delta result code: %d";
+static const char __pyx_k_breezy_bzr__groupcompress_pyx_py[] = "breezy/bzr/_groupcompress_pyx.pyx";
+static const char __pyx_k_content_must_be_at_least_16_byte[] = "content must be at least 16 bytes long";
+static const char __pyx_k_encode_base128_int_overflowed_th[] = "encode_base128_int overflowed the buffer";
+static const char __pyx_k_failed_to_allocate_memory_for_De[] = "failed to allocate memory for DeltaIndex";
+static const char __pyx_k_if_we_move_self__source_infos_th[] = "if we move self._source_infos, then we need to change all of the index pointers as well.";
+static const char __pyx_k_self__index_self__source_infos_c[] = "self._index,self._source_infos cannot be converted to a Python object for pickling";
+static PyObject *__pyx_n_s_AssertionError;
+static PyObject *__pyx_kp_u_Data_not_properly_formatted_we_r;
+static PyObject *__pyx_n_s_DeltaIndex;
+static PyObject *__pyx_kp_u_Delta_function_failed_to_allocat;
+static PyObject *__pyx_kp_u_Delta_function_given_empty_buffe;
+static PyObject *__pyx_kp_u_Delta_function_given_empty_sourc;
+static PyObject *__pyx_kp_u_Delta_function_given_invalid_sou;
+static PyObject *__pyx_kp_u_Delta_function_requires_delta_in;
+static PyObject *__pyx_kp_u_Did_not_extract_the_number_of_by;
+static PyObject *__pyx_kp_u_Got_delta_opcode_0_not_supported;
+static PyObject *__pyx_kp_u_Insert_instruction_longer_than_r;
+static PyObject *__pyx_n_s_MemoryError;
+static PyObject *__pyx_kp_u_Number_of_bytes_extracted_did_no;
+static PyObject *__pyx_n_s_RuntimeError;
+static PyObject *__pyx_kp_u_Something_wrong_with_cp_off;
+static PyObject *__pyx_n_s_TypeError;
+static PyObject *__pyx_kp_u_Unrecognised_delta_result_code_d;
+static PyObject *__pyx_n_s_ValueError;
+static PyObject *__pyx_kp_u__10;
+static PyObject *__pyx_kp_u__11;
+static PyObject *__pyx_kp_u__20;
+static PyObject *__pyx_kp_u__9;
+static PyObject *__pyx_n_s_add_source;
+static PyObject *__pyx_n_s_apply_delta;
+static PyObject *__pyx_n_s_apply_delta_to_source;
+static PyObject *__pyx_n_s_breezy_bzr__groupcompress_pyx;
+static PyObject *__pyx_kp_s_breezy_bzr__groupcompress_pyx_py;
+static PyObject *__pyx_kp_u_bytes_in_size_and_top_data;
+static PyObject *__pyx_kp_u_bytes_is_not_a_string;
+static PyObject *__pyx_n_s_c_bytes;
+static PyObject *__pyx_n_s_c_delta;
+static PyObject *__pyx_n_s_c_delta_end;
+static PyObject *__pyx_n_s_c_delta_size;
+static PyObject *__pyx_n_s_c_delta_start;
+static PyObject *__pyx_n_s_c_source;
+static PyObject *__pyx_n_s_c_source_size;
+static PyObject *__pyx_n_s_c_val;
+static PyObject *__pyx_n_s_class;
+static PyObject *__pyx_n_s_cline_in_traceback;
+static PyObject *__pyx_n_s_content;
+static PyObject *__pyx_kp_u_content_must_be_a_string;
+static PyObject *__pyx_kp_u_content_must_be_at_least_16_byte;
+static PyObject *__pyx_n_s_count;
+static PyObject *__pyx_kp_u_cp_size;
+static PyObject *__pyx_n_u_d;
+static PyObject *__pyx_n_s_data;
+static PyObject *__pyx_n_s_decode_base128_int;
+static PyObject *__pyx_n_s_delta;
+static PyObject *__pyx_n_s_delta_bytes;
+static PyObject *__pyx_n_s_delta_end;
+static PyObject *__pyx_kp_u_delta_ends_after_source;
+static PyObject *__pyx_kp_u_delta_is_not_a_bytestring;
+static PyObject *__pyx_kp_u_delta_size;
+static PyObject *__pyx_n_s_delta_size_2;
+static PyObject *__pyx_n_s_delta_start;
+static PyObject *__pyx_kp_u_delta_starts_after_it_ends;
+static PyObject *__pyx_kp_u_delta_starts_after_source;
+static PyObject *__pyx_n_s_di;
+static PyObject *__pyx_n_s_encode_base128_int;
+static PyObject *__pyx_kp_u_encode_base128_int_overflowed_th;
+static PyObject *__pyx_kp_u_failed_to_allocate_memory_for_De;
+static PyObject *__pyx_n_s_getstate;
+static PyObject *__pyx_kp_u_if_we_move_self__source_infos_th;
+static PyObject *__pyx_n_s_main;
+static PyObject *__pyx_n_s_make_delta;
+static PyObject *__pyx_n_s_make_delta_index;
+static PyObject *__pyx_n_s_map;
+static PyObject *__pyx_n_s_max_bytes_to_index;
+static PyObject *__pyx_n_s_max_delta_size;
+static PyObject *__pyx_n_s_name;
+static PyObject *__pyx_n_s_num_bytes;
+static PyObject *__pyx_n_s_num_low_bytes;
+static PyObject *__pyx_n_s_offset;
+static PyObject *__pyx_kp_u_populate_first_index_should_onl;
+static PyObject *__pyx_n_s_pyx_vtable;
+static PyObject *__pyx_n_s_rabin_hash;
+static PyObject *__pyx_n_s_reduce;
+static PyObject *__pyx_n_s_reduce_cython;
+static PyObject *__pyx_n_s_reduce_ex;
+static PyObject *__pyx_kp_s_self__index_self__source_infos_c;
+static PyObject *__pyx_n_s_setstate;
+static PyObject *__pyx_n_s_setstate_cython;
+static PyObject *__pyx_n_s_shift;
+static PyObject *__pyx_kp_u_size;
+static PyObject *__pyx_kp_u_smaller_than_min_delta_size;
+static PyObject *__pyx_n_s_source;
+static PyObject *__pyx_n_s_source_bytes;
+static PyObject *__pyx_kp_u_source_is_not_a_bytestring;
+static PyObject *__pyx_kp_u_source_is_not_a_str;
+static PyObject *__pyx_kp_u_source_size;
+static PyObject *__pyx_n_s_source_size_2;
+static PyObject *__pyx_n_s_target_bytes;
+static PyObject *__pyx_kp_u_target_is_not_a_bytestring;
+static PyObject *__pyx_n_s_test;
+static PyObject *__pyx_n_s_unadded_bytes;
+static PyObject *__pyx_n_s_uval;
+static PyObject *__pyx_n_s_val;
+static PyObject *__pyx_pf_6breezy_3bzr_18_groupcompress_pyx_make_delta_index(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_source); /* proto */
+static PyObject *__pyx_pf_6breezy_3bzr_18_groupcompress_pyx_2_rabin_hash(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_content); /* proto */
+static int __pyx_pf_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex___init__(struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *__pyx_v_self, PyObject *__pyx_v_source, PyObject *__pyx_v_max_bytes_to_index); /* proto */
+static PyObject *__pyx_pf_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_2__sizeof__(struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_4__repr__(struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *__pyx_v_self); /* proto */
+static void __pyx_pf_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_6__dealloc__(struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_8_has_index(struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_10_dump_index(struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_12add_delta_source(struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *__pyx_v_self, PyObject *__pyx_v_delta, PyObject *__pyx_v_unadded_bytes); /* proto */
+static PyObject *__pyx_pf_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_14add_source(struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *__pyx_v_self, PyObject *__pyx_v_source, PyObject *__pyx_v_unadded_bytes); /* proto */
+static PyObject *__pyx_pf_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_16make_delta(struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *__pyx_v_self, PyObject *__pyx_v_target_bytes, PyObject *__pyx_v_max_delta_size); /* proto */
+static PyObject *__pyx_pf_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_8_sources___get__(struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_14_source_offset___get__(struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *__pyx_v_self); /* proto */
+static int __pyx_pf_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_14_source_offset_2__set__(struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
+static PyObject *__pyx_pf_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_16_max_num_sources___get__(struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_19_max_bytes_to_index___get__(struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *__pyx_v_self); /* proto */
+static int __pyx_pf_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_19_max_bytes_to_index_2__set__(struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
+static PyObject *__pyx_pf_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_18__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_20__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
+static PyObject *__pyx_pf_6breezy_3bzr_18_groupcompress_pyx_4make_delta(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_source_bytes, PyObject *__pyx_v_target_bytes); /* proto */
+static PyObject *__pyx_pf_6breezy_3bzr_18_groupcompress_pyx_6apply_delta(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_source_bytes, PyObject *__pyx_v_delta_bytes); /* proto */
+static PyObject *__pyx_pf_6breezy_3bzr_18_groupcompress_pyx_8apply_delta_to_source(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_source, PyObject *__pyx_v_delta_start, PyObject *__pyx_v_delta_end); /* proto */
+static PyObject *__pyx_pf_6breezy_3bzr_18_groupcompress_pyx_10encode_base128_int(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_val); /* proto */
+static PyObject *__pyx_pf_6breezy_3bzr_18_groupcompress_pyx_12decode_base128_int(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_data); /* proto */
+static PyObject *__pyx_tp_new_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static PyObject *__pyx_int_0;
+static PyObject *__pyx_tuple_;
+static PyObject *__pyx_tuple__2;
+static PyObject *__pyx_tuple__3;
+static PyObject *__pyx_tuple__4;
+static PyObject *__pyx_tuple__5;
+static PyObject *__pyx_tuple__6;
+static PyObject *__pyx_tuple__7;
+static PyObject *__pyx_tuple__8;
+static PyObject *__pyx_tuple__12;
+static PyObject *__pyx_tuple__13;
+static PyObject *__pyx_tuple__14;
+static PyObject *__pyx_tuple__15;
+static PyObject *__pyx_tuple__16;
+static PyObject *__pyx_tuple__17;
+static PyObject *__pyx_tuple__18;
+static PyObject *__pyx_tuple__19;
+static PyObject *__pyx_tuple__21;
+static PyObject *__pyx_tuple__22;
+static PyObject *__pyx_tuple__23;
+static PyObject *__pyx_tuple__24;
+static PyObject *__pyx_tuple__25;
+static PyObject *__pyx_tuple__26;
+static PyObject *__pyx_tuple__27;
+static PyObject *__pyx_tuple__28;
+static PyObject *__pyx_tuple__29;
+static PyObject *__pyx_tuple__31;
+static PyObject *__pyx_tuple__33;
+static PyObject *__pyx_tuple__35;
+static PyObject *__pyx_tuple__37;
+static PyObject *__pyx_tuple__39;
+static PyObject *__pyx_tuple__41;
+static PyObject *__pyx_codeobj__30;
+static PyObject *__pyx_codeobj__32;
+static PyObject *__pyx_codeobj__34;
+static PyObject *__pyx_codeobj__36;
+static PyObject *__pyx_codeobj__38;
+static PyObject *__pyx_codeobj__40;
+static PyObject *__pyx_codeobj__42;
+/* Late includes */
+
+/* "breezy/bzr/_groupcompress_pyx.pyx":85
+ * 
+ * 
+ * def make_delta_index(source):             # <<<<<<<<<<<<<<
+ *     return DeltaIndex(source)
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_6breezy_3bzr_18_groupcompress_pyx_1make_delta_index(PyObject *__pyx_self, PyObject *__pyx_v_source); /*proto*/
+static PyMethodDef __pyx_mdef_6breezy_3bzr_18_groupcompress_pyx_1make_delta_index = {"make_delta_index", (PyCFunction)__pyx_pw_6breezy_3bzr_18_groupcompress_pyx_1make_delta_index, METH_O, 0};
+static PyObject *__pyx_pw_6breezy_3bzr_18_groupcompress_pyx_1make_delta_index(PyObject *__pyx_self, PyObject *__pyx_v_source) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("make_delta_index (wrapper)", 0);
+  __pyx_r = __pyx_pf_6breezy_3bzr_18_groupcompress_pyx_make_delta_index(__pyx_self, ((PyObject *)__pyx_v_source));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_6breezy_3bzr_18_groupcompress_pyx_make_delta_index(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_source) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("make_delta_index", 0);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":86
+ * 
+ * def make_delta_index(source):
+ *     return DeltaIndex(source)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyObject_CallOneArg(((PyObject *)__pyx_ptype_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex), __pyx_v_source); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 86, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":85
+ * 
+ * 
+ * def make_delta_index(source):             # <<<<<<<<<<<<<<
+ *     return DeltaIndex(source)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("breezy.bzr._groupcompress_pyx.make_delta_index", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "breezy/bzr/_groupcompress_pyx.pyx":89
+ * 
+ * 
+ * cdef object _translate_delta_failure(delta_result result):             # <<<<<<<<<<<<<<
+ *     if result == DELTA_OUT_OF_MEMORY:
+ *         return MemoryError("Delta function failed to allocate memory")
+ */
+
+static PyObject *__pyx_f_6breezy_3bzr_18_groupcompress_pyx__translate_delta_failure(delta_result __pyx_v_result) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("_translate_delta_failure", 0);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":90
+ * 
+ * cdef object _translate_delta_failure(delta_result result):
+ *     if result == DELTA_OUT_OF_MEMORY:             # <<<<<<<<<<<<<<
+ *         return MemoryError("Delta function failed to allocate memory")
+ *     elif result == DELTA_INDEX_NEEDED:
+ */
+  switch (__pyx_v_result) {
+    case DELTA_OUT_OF_MEMORY:
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":91
+ * cdef object _translate_delta_failure(delta_result result):
+ *     if result == DELTA_OUT_OF_MEMORY:
+ *         return MemoryError("Delta function failed to allocate memory")             # <<<<<<<<<<<<<<
+ *     elif result == DELTA_INDEX_NEEDED:
+ *         return ValueError("Delta function requires delta_index param")
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_MemoryError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 91, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_r = __pyx_t_1;
+    __pyx_t_1 = 0;
+    goto __pyx_L0;
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":90
+ * 
+ * cdef object _translate_delta_failure(delta_result result):
+ *     if result == DELTA_OUT_OF_MEMORY:             # <<<<<<<<<<<<<<
+ *         return MemoryError("Delta function failed to allocate memory")
+ *     elif result == DELTA_INDEX_NEEDED:
+ */
+    break;
+    case DELTA_INDEX_NEEDED:
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":93
+ *         return MemoryError("Delta function failed to allocate memory")
+ *     elif result == DELTA_INDEX_NEEDED:
+ *         return ValueError("Delta function requires delta_index param")             # <<<<<<<<<<<<<<
+ *     elif result == DELTA_SOURCE_EMPTY:
+ *         return ValueError("Delta function given empty source_info param")
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__2, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 93, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_r = __pyx_t_1;
+    __pyx_t_1 = 0;
+    goto __pyx_L0;
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":92
+ *     if result == DELTA_OUT_OF_MEMORY:
+ *         return MemoryError("Delta function failed to allocate memory")
+ *     elif result == DELTA_INDEX_NEEDED:             # <<<<<<<<<<<<<<
+ *         return ValueError("Delta function requires delta_index param")
+ *     elif result == DELTA_SOURCE_EMPTY:
+ */
+    break;
+    case DELTA_SOURCE_EMPTY:
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":95
+ *         return ValueError("Delta function requires delta_index param")
+ *     elif result == DELTA_SOURCE_EMPTY:
+ *         return ValueError("Delta function given empty source_info param")             # <<<<<<<<<<<<<<
+ *     elif result == DELTA_SOURCE_BAD:
+ *         return RuntimeError("Delta function given invalid source_info param")
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__3, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 95, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_r = __pyx_t_1;
+    __pyx_t_1 = 0;
+    goto __pyx_L0;
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":94
+ *     elif result == DELTA_INDEX_NEEDED:
+ *         return ValueError("Delta function requires delta_index param")
+ *     elif result == DELTA_SOURCE_EMPTY:             # <<<<<<<<<<<<<<
+ *         return ValueError("Delta function given empty source_info param")
+ *     elif result == DELTA_SOURCE_BAD:
+ */
+    break;
+    case DELTA_SOURCE_BAD:
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":97
+ *         return ValueError("Delta function given empty source_info param")
+ *     elif result == DELTA_SOURCE_BAD:
+ *         return RuntimeError("Delta function given invalid source_info param")             # <<<<<<<<<<<<<<
+ *     elif result == DELTA_BUFFER_EMPTY:
+ *         return ValueError("Delta function given empty buffer params")
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_RuntimeError, __pyx_tuple__4, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 97, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_r = __pyx_t_1;
+    __pyx_t_1 = 0;
+    goto __pyx_L0;
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":96
+ *     elif result == DELTA_SOURCE_EMPTY:
+ *         return ValueError("Delta function given empty source_info param")
+ *     elif result == DELTA_SOURCE_BAD:             # <<<<<<<<<<<<<<
+ *         return RuntimeError("Delta function given invalid source_info param")
+ *     elif result == DELTA_BUFFER_EMPTY:
+ */
+    break;
+    case DELTA_BUFFER_EMPTY:
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":99
+ *         return RuntimeError("Delta function given invalid source_info param")
+ *     elif result == DELTA_BUFFER_EMPTY:
+ *         return ValueError("Delta function given empty buffer params")             # <<<<<<<<<<<<<<
+ *     return AssertionError("Unrecognised delta result code: %d" % result)
+ * 
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__5, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 99, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_r = __pyx_t_1;
+    __pyx_t_1 = 0;
+    goto __pyx_L0;
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":98
+ *     elif result == DELTA_SOURCE_BAD:
+ *         return RuntimeError("Delta function given invalid source_info param")
+ *     elif result == DELTA_BUFFER_EMPTY:             # <<<<<<<<<<<<<<
+ *         return ValueError("Delta function given empty buffer params")
+ *     return AssertionError("Unrecognised delta result code: %d" % result)
+ */
+    break;
+    default: break;
+  }
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":100
+ *     elif result == DELTA_BUFFER_EMPTY:
+ *         return ValueError("Delta function given empty buffer params")
+ *     return AssertionError("Unrecognised delta result code: %d" % result)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyInt_From_delta_result(__pyx_v_result); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 100, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyUnicode_Format(__pyx_kp_u_Unrecognised_delta_result_code_d, __pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 100, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_builtin_AssertionError, __pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 100, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":89
+ * 
+ * 
+ * cdef object _translate_delta_failure(delta_result result):             # <<<<<<<<<<<<<<
+ *     if result == DELTA_OUT_OF_MEMORY:
+ *         return MemoryError("Delta function failed to allocate memory")
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("breezy.bzr._groupcompress_pyx._translate_delta_failure", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "breezy/bzr/_groupcompress_pyx.pyx":103
+ * 
+ * 
+ * def _rabin_hash(content):             # <<<<<<<<<<<<<<
+ *     if not PyBytes_CheckExact(content):
+ *         raise ValueError('content must be a string')
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_6breezy_3bzr_18_groupcompress_pyx_3_rabin_hash(PyObject *__pyx_self, PyObject *__pyx_v_content); /*proto*/
+static PyMethodDef __pyx_mdef_6breezy_3bzr_18_groupcompress_pyx_3_rabin_hash = {"_rabin_hash", (PyCFunction)__pyx_pw_6breezy_3bzr_18_groupcompress_pyx_3_rabin_hash, METH_O, 0};
+static PyObject *__pyx_pw_6breezy_3bzr_18_groupcompress_pyx_3_rabin_hash(PyObject *__pyx_self, PyObject *__pyx_v_content) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("_rabin_hash (wrapper)", 0);
+  __pyx_r = __pyx_pf_6breezy_3bzr_18_groupcompress_pyx_2_rabin_hash(__pyx_self, ((PyObject *)__pyx_v_content));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_6breezy_3bzr_18_groupcompress_pyx_2_rabin_hash(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_content) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  Py_ssize_t __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("_rabin_hash", 0);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":104
+ * 
+ * def _rabin_hash(content):
+ *     if not PyBytes_CheckExact(content):             # <<<<<<<<<<<<<<
+ *         raise ValueError('content must be a string')
+ *     if len(content) < 16:
+ */
+  __pyx_t_1 = ((!(PyBytes_CheckExact(__pyx_v_content) != 0)) != 0);
+  if (unlikely(__pyx_t_1)) {
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":105
+ * def _rabin_hash(content):
+ *     if not PyBytes_CheckExact(content):
+ *         raise ValueError('content must be a string')             # <<<<<<<<<<<<<<
+ *     if len(content) < 16:
+ *         raise ValueError('content must be at least 16 bytes long')
+ */
+    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__6, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 105, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __PYX_ERR(0, 105, __pyx_L1_error)
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":104
+ * 
+ * def _rabin_hash(content):
+ *     if not PyBytes_CheckExact(content):             # <<<<<<<<<<<<<<
+ *         raise ValueError('content must be a string')
+ *     if len(content) < 16:
+ */
+  }
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":106
+ *     if not PyBytes_CheckExact(content):
+ *         raise ValueError('content must be a string')
+ *     if len(content) < 16:             # <<<<<<<<<<<<<<
+ *         raise ValueError('content must be at least 16 bytes long')
+ *     # Try to cast it to an int, if it can fit
+ */
+  __pyx_t_3 = PyObject_Length(__pyx_v_content); if (unlikely(__pyx_t_3 == ((Py_ssize_t)-1))) __PYX_ERR(0, 106, __pyx_L1_error)
+  __pyx_t_1 = ((__pyx_t_3 < 16) != 0);
+  if (unlikely(__pyx_t_1)) {
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":107
+ *         raise ValueError('content must be a string')
+ *     if len(content) < 16:
+ *         raise ValueError('content must be at least 16 bytes long')             # <<<<<<<<<<<<<<
+ *     # Try to cast it to an int, if it can fit
+ *     return int(rabin_hash(<unsigned char*>(PyBytes_AS_STRING(content))))
+ */
+    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__7, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 107, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __PYX_ERR(0, 107, __pyx_L1_error)
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":106
+ *     if not PyBytes_CheckExact(content):
+ *         raise ValueError('content must be a string')
+ *     if len(content) < 16:             # <<<<<<<<<<<<<<
+ *         raise ValueError('content must be at least 16 bytes long')
+ *     # Try to cast it to an int, if it can fit
+ */
+  }
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":109
+ *         raise ValueError('content must be at least 16 bytes long')
+ *     # Try to cast it to an int, if it can fit
+ *     return int(rabin_hash(<unsigned char*>(PyBytes_AS_STRING(content))))             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2 = __Pyx_PyInt_From_unsigned_int(rabin_hash(((unsigned char *)PyBytes_AS_STRING(__pyx_v_content)))); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 109, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = __Pyx_PyObject_CallOneArg(((PyObject *)(&PyInt_Type)), __pyx_t_2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 109, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_r = __pyx_t_4;
+  __pyx_t_4 = 0;
+  goto __pyx_L0;
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":103
+ * 
+ * 
+ * def _rabin_hash(content):             # <<<<<<<<<<<<<<
+ *     if not PyBytes_CheckExact(content):
+ *         raise ValueError('content must be a string')
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("breezy.bzr._groupcompress_pyx._rabin_hash", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "breezy/bzr/_groupcompress_pyx.pyx":121
+ *     cdef public int _max_bytes_to_index
+ * 
+ *     def __init__(self, source=None, max_bytes_to_index=None):             # <<<<<<<<<<<<<<
+ *         self._sources = []
+ *         self._index = NULL
+ */
+
+/* Python wrapper */
+static int __pyx_pw_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static int __pyx_pw_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_source = 0;
+  PyObject *__pyx_v_max_bytes_to_index = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__init__ (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_source,&__pyx_n_s_max_bytes_to_index,0};
+    PyObject* values[2] = {0,0};
+    values[0] = ((PyObject *)Py_None);
+    values[1] = ((PyObject *)Py_None);
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_source);
+          if (value) { values[0] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_max_bytes_to_index);
+          if (value) { values[1] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(0, 121, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_source = values[0];
+    __pyx_v_max_bytes_to_index = values[1];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__init__", 0, 0, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 121, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("breezy.bzr._groupcompress_pyx.DeltaIndex.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return -1;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex___init__(((struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *)__pyx_v_self), __pyx_v_source, __pyx_v_max_bytes_to_index);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex___init__(struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *__pyx_v_self, PyObject *__pyx_v_source, PyObject *__pyx_v_max_bytes_to_index) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__init__", 0);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":122
+ * 
+ *     def __init__(self, source=None, max_bytes_to_index=None):
+ *         self._sources = []             # <<<<<<<<<<<<<<
+ *         self._index = NULL
+ *         self._max_num_sources = 65000
+ */
+  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 122, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF(__pyx_v_self->_sources);
+  __Pyx_DECREF(__pyx_v_self->_sources);
+  __pyx_v_self->_sources = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":123
+ *     def __init__(self, source=None, max_bytes_to_index=None):
+ *         self._sources = []
+ *         self._index = NULL             # <<<<<<<<<<<<<<
+ *         self._max_num_sources = 65000
+ *         self._source_infos = <source_info *>PyMem_Malloc(
+ */
+  __pyx_v_self->_index = NULL;
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":124
+ *         self._sources = []
+ *         self._index = NULL
+ *         self._max_num_sources = 65000             # <<<<<<<<<<<<<<
+ *         self._source_infos = <source_info *>PyMem_Malloc(
+ *             sizeof(source_info) * self._max_num_sources)
+ */
+  __pyx_v_self->_max_num_sources = 0xFDE8;
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":125
+ *         self._index = NULL
+ *         self._max_num_sources = 65000
+ *         self._source_infos = <source_info *>PyMem_Malloc(             # <<<<<<<<<<<<<<
+ *             sizeof(source_info) * self._max_num_sources)
+ *         if self._source_infos == NULL:
+ */
+  __pyx_v_self->_source_infos = ((struct source_info *)PyMem_Malloc(((sizeof(struct source_info)) * __pyx_v_self->_max_num_sources)));
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":127
+ *         self._source_infos = <source_info *>PyMem_Malloc(
+ *             sizeof(source_info) * self._max_num_sources)
+ *         if self._source_infos == NULL:             # <<<<<<<<<<<<<<
+ *             raise MemoryError('failed to allocate memory for DeltaIndex')
+ *         self._source_offset = 0
+ */
+  __pyx_t_2 = ((__pyx_v_self->_source_infos == NULL) != 0);
+  if (unlikely(__pyx_t_2)) {
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":128
+ *             sizeof(source_info) * self._max_num_sources)
+ *         if self._source_infos == NULL:
+ *             raise MemoryError('failed to allocate memory for DeltaIndex')             # <<<<<<<<<<<<<<
+ *         self._source_offset = 0
+ *         self._max_bytes_to_index = 0
+ */
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_MemoryError, __pyx_tuple__8, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 128, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __PYX_ERR(0, 128, __pyx_L1_error)
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":127
+ *         self._source_infos = <source_info *>PyMem_Malloc(
+ *             sizeof(source_info) * self._max_num_sources)
+ *         if self._source_infos == NULL:             # <<<<<<<<<<<<<<
+ *             raise MemoryError('failed to allocate memory for DeltaIndex')
+ *         self._source_offset = 0
+ */
+  }
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":129
+ *         if self._source_infos == NULL:
+ *             raise MemoryError('failed to allocate memory for DeltaIndex')
+ *         self._source_offset = 0             # <<<<<<<<<<<<<<
+ *         self._max_bytes_to_index = 0
+ *         if max_bytes_to_index is not None:
+ */
+  __pyx_v_self->_source_offset = 0;
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":130
+ *             raise MemoryError('failed to allocate memory for DeltaIndex')
+ *         self._source_offset = 0
+ *         self._max_bytes_to_index = 0             # <<<<<<<<<<<<<<
+ *         if max_bytes_to_index is not None:
+ *             self._max_bytes_to_index = max_bytes_to_index
+ */
+  __pyx_v_self->_max_bytes_to_index = 0;
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":131
+ *         self._source_offset = 0
+ *         self._max_bytes_to_index = 0
+ *         if max_bytes_to_index is not None:             # <<<<<<<<<<<<<<
+ *             self._max_bytes_to_index = max_bytes_to_index
+ * 
+ */
+  __pyx_t_2 = (__pyx_v_max_bytes_to_index != Py_None);
+  __pyx_t_3 = (__pyx_t_2 != 0);
+  if (__pyx_t_3) {
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":132
+ *         self._max_bytes_to_index = 0
+ *         if max_bytes_to_index is not None:
+ *             self._max_bytes_to_index = max_bytes_to_index             # <<<<<<<<<<<<<<
+ * 
+ *         if source is not None:
+ */
+    __pyx_t_4 = __Pyx_PyInt_As_int(__pyx_v_max_bytes_to_index); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 132, __pyx_L1_error)
+    __pyx_v_self->_max_bytes_to_index = __pyx_t_4;
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":131
+ *         self._source_offset = 0
+ *         self._max_bytes_to_index = 0
+ *         if max_bytes_to_index is not None:             # <<<<<<<<<<<<<<
+ *             self._max_bytes_to_index = max_bytes_to_index
+ * 
+ */
+  }
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":134
+ *             self._max_bytes_to_index = max_bytes_to_index
+ * 
+ *         if source is not None:             # <<<<<<<<<<<<<<
+ *             self.add_source(source, 0)
+ * 
+ */
+  __pyx_t_3 = (__pyx_v_source != Py_None);
+  __pyx_t_2 = (__pyx_t_3 != 0);
+  if (__pyx_t_2) {
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":135
+ * 
+ *         if source is not None:
+ *             self.add_source(source, 0)             # <<<<<<<<<<<<<<
+ * 
+ *     def __sizeof__(self):
+ */
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_add_source); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 135, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_6 = NULL;
+    __pyx_t_4 = 0;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_5))) {
+      __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_5);
+      if (likely(__pyx_t_6)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+        __Pyx_INCREF(__pyx_t_6);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_5, function);
+        __pyx_t_4 = 1;
+      }
+    }
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(__pyx_t_5)) {
+      PyObject *__pyx_temp[3] = {__pyx_t_6, __pyx_v_source, __pyx_int_0};
+      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_5, __pyx_temp+1-__pyx_t_4, 2+__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 135, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __Pyx_GOTREF(__pyx_t_1);
+    } else
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_5)) {
+      PyObject *__pyx_temp[3] = {__pyx_t_6, __pyx_v_source, __pyx_int_0};
+      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_5, __pyx_temp+1-__pyx_t_4, 2+__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 135, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __Pyx_GOTREF(__pyx_t_1);
+    } else
+    #endif
+    {
+      __pyx_t_7 = PyTuple_New(2+__pyx_t_4); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 135, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_7);
+      if (__pyx_t_6) {
+        __Pyx_GIVEREF(__pyx_t_6); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_6); __pyx_t_6 = NULL;
+      }
+      __Pyx_INCREF(__pyx_v_source);
+      __Pyx_GIVEREF(__pyx_v_source);
+      PyTuple_SET_ITEM(__pyx_t_7, 0+__pyx_t_4, __pyx_v_source);
+      __Pyx_INCREF(__pyx_int_0);
+      __Pyx_GIVEREF(__pyx_int_0);
+      PyTuple_SET_ITEM(__pyx_t_7, 1+__pyx_t_4, __pyx_int_0);
+      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_7, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 135, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":134
+ *             self._max_bytes_to_index = max_bytes_to_index
+ * 
+ *         if source is not None:             # <<<<<<<<<<<<<<
+ *             self.add_source(source, 0)
+ * 
+ */
+  }
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":121
+ *     cdef public int _max_bytes_to_index
+ * 
+ *     def __init__(self, source=None, max_bytes_to_index=None):             # <<<<<<<<<<<<<<
+ *         self._sources = []
+ *         self._index = NULL
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_AddTraceback("breezy.bzr._groupcompress_pyx.DeltaIndex.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "breezy/bzr/_groupcompress_pyx.pyx":137
+ *             self.add_source(source, 0)
+ * 
+ *     def __sizeof__(self):             # <<<<<<<<<<<<<<
+ *         # We want to track the _source_infos allocations, but the referenced
+ *         # void* are actually tracked in _sources itself.
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_3__sizeof__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_3__sizeof__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__sizeof__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_2__sizeof__(((struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_2__sizeof__(struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__sizeof__", 0);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":140
+ *         # We want to track the _source_infos allocations, but the referenced
+ *         # void* are actually tracked in _sources itself.
+ *         return (sizeof(DeltaIndex)             # <<<<<<<<<<<<<<
+ *                 + (sizeof(source_info) * self._max_num_sources)
+ *                 + sizeof_delta_index(self._index))
+ */
+  __Pyx_XDECREF(__pyx_r);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":142
+ *         return (sizeof(DeltaIndex)
+ *                 + (sizeof(source_info) * self._max_num_sources)
+ *                 + sizeof_delta_index(self._index))             # <<<<<<<<<<<<<<
+ * 
+ *     def __repr__(self):
+ */
+  __pyx_t_1 = __Pyx_PyInt_FromSize_t((((sizeof(struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex)) + ((sizeof(struct source_info)) * __pyx_v_self->_max_num_sources)) + sizeof_delta_index(__pyx_v_self->_index))); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 142, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":137
+ *             self.add_source(source, 0)
+ * 
+ *     def __sizeof__(self):             # <<<<<<<<<<<<<<
+ *         # We want to track the _source_infos allocations, but the referenced
+ *         # void* are actually tracked in _sources itself.
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("breezy.bzr._groupcompress_pyx.DeltaIndex.__sizeof__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "breezy/bzr/_groupcompress_pyx.pyx":144
+ *                 + sizeof_delta_index(self._index))
+ * 
+ *     def __repr__(self):             # <<<<<<<<<<<<<<
+ *         return '%s(%d, %d)' % (self.__class__.__name__,
+ *             len(self._sources), self._source_offset)
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_5__repr__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_5__repr__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__repr__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_4__repr__(((struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_4__repr__(struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  Py_ssize_t __pyx_t_2;
+  Py_UCS4 __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  Py_ssize_t __pyx_t_6;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__repr__", 0);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":145
+ * 
+ *     def __repr__(self):
+ *         return '%s(%d, %d)' % (self.__class__.__name__,             # <<<<<<<<<<<<<<
+ *             len(self._sources), self._source_offset)
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyTuple_New(6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 145, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = 0;
+  __pyx_t_3 = 127;
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_class); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 145, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_name); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 145, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = __Pyx_PyObject_FormatSimpleAndDecref(PyObject_Unicode(__pyx_t_5), __pyx_empty_unicode); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 145, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_3 = (__Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_4) > __pyx_t_3) ? __Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_4) : __pyx_t_3;
+  __pyx_t_2 += __Pyx_PyUnicode_GET_LENGTH(__pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_4);
+  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_4);
+  __pyx_t_4 = 0;
+  __Pyx_INCREF(__pyx_kp_u__9);
+  __pyx_t_2 += 1;
+  __Pyx_GIVEREF(__pyx_kp_u__9);
+  PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_kp_u__9);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":146
+ *     def __repr__(self):
+ *         return '%s(%d, %d)' % (self.__class__.__name__,
+ *             len(self._sources), self._source_offset)             # <<<<<<<<<<<<<<
+ * 
+ *     def __dealloc__(self):
+ */
+  __pyx_t_4 = __pyx_v_self->_sources;
+  __Pyx_INCREF(__pyx_t_4);
+  if (unlikely(__pyx_t_4 == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 146, __pyx_L1_error)
+  }
+  __pyx_t_6 = PyList_GET_SIZE(__pyx_t_4); if (unlikely(__pyx_t_6 == ((Py_ssize_t)-1))) __PYX_ERR(0, 146, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = __Pyx_PyUnicode_From_Py_ssize_t(__pyx_t_6, 0, ' ', 'd'); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 146, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_2 += __Pyx_PyUnicode_GET_LENGTH(__pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_4);
+  PyTuple_SET_ITEM(__pyx_t_1, 2, __pyx_t_4);
+  __pyx_t_4 = 0;
+  __Pyx_INCREF(__pyx_kp_u__10);
+  __pyx_t_2 += 2;
+  __Pyx_GIVEREF(__pyx_kp_u__10);
+  PyTuple_SET_ITEM(__pyx_t_1, 3, __pyx_kp_u__10);
+  __pyx_t_4 = __Pyx_PyUnicode_From_unsigned_long(__pyx_v_self->_source_offset, 0, ' ', 'd'); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 146, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_2 += __Pyx_PyUnicode_GET_LENGTH(__pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_4);
+  PyTuple_SET_ITEM(__pyx_t_1, 4, __pyx_t_4);
+  __pyx_t_4 = 0;
+  __Pyx_INCREF(__pyx_kp_u__11);
+  __pyx_t_2 += 1;
+  __Pyx_GIVEREF(__pyx_kp_u__11);
+  PyTuple_SET_ITEM(__pyx_t_1, 5, __pyx_kp_u__11);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":145
+ * 
+ *     def __repr__(self):
+ *         return '%s(%d, %d)' % (self.__class__.__name__,             # <<<<<<<<<<<<<<
+ *             len(self._sources), self._source_offset)
+ * 
+ */
+  __pyx_t_4 = __Pyx_PyUnicode_Join(__pyx_t_1, 6, __pyx_t_2, __pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 145, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_r = __pyx_t_4;
+  __pyx_t_4 = 0;
+  goto __pyx_L0;
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":144
+ *                 + sizeof_delta_index(self._index))
+ * 
+ *     def __repr__(self):             # <<<<<<<<<<<<<<
+ *         return '%s(%d, %d)' % (self.__class__.__name__,
+ *             len(self._sources), self._source_offset)
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("breezy.bzr._groupcompress_pyx.DeltaIndex.__repr__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "breezy/bzr/_groupcompress_pyx.pyx":148
+ *             len(self._sources), self._source_offset)
+ * 
+ *     def __dealloc__(self):             # <<<<<<<<<<<<<<
+ *         if self._index != NULL:
+ *             free_delta_index(self._index)
+ */
+
+/* Python wrapper */
+static void __pyx_pw_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_7__dealloc__(PyObject *__pyx_v_self); /*proto*/
+static void __pyx_pw_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_7__dealloc__(PyObject *__pyx_v_self) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__dealloc__ (wrapper)", 0);
+  __pyx_pf_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_6__dealloc__(((struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+}
+
+static void __pyx_pf_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_6__dealloc__(struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *__pyx_v_self) {
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  __Pyx_RefNannySetupContext("__dealloc__", 0);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":149
+ * 
+ *     def __dealloc__(self):
+ *         if self._index != NULL:             # <<<<<<<<<<<<<<
+ *             free_delta_index(self._index)
+ *             self._index = NULL
+ */
+  __pyx_t_1 = ((__pyx_v_self->_index != NULL) != 0);
+  if (__pyx_t_1) {
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":150
+ *     def __dealloc__(self):
+ *         if self._index != NULL:
+ *             free_delta_index(self._index)             # <<<<<<<<<<<<<<
+ *             self._index = NULL
+ *         PyMem_Free(self._source_infos)
+ */
+    free_delta_index(__pyx_v_self->_index);
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":151
+ *         if self._index != NULL:
+ *             free_delta_index(self._index)
+ *             self._index = NULL             # <<<<<<<<<<<<<<
+ *         PyMem_Free(self._source_infos)
+ * 
+ */
+    __pyx_v_self->_index = NULL;
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":149
+ * 
+ *     def __dealloc__(self):
+ *         if self._index != NULL:             # <<<<<<<<<<<<<<
+ *             free_delta_index(self._index)
+ *             self._index = NULL
+ */
+  }
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":152
+ *             free_delta_index(self._index)
+ *             self._index = NULL
+ *         PyMem_Free(self._source_infos)             # <<<<<<<<<<<<<<
+ * 
+ *     def _has_index(self):
+ */
+  PyMem_Free(__pyx_v_self->_source_infos);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":148
+ *             len(self._sources), self._source_offset)
+ * 
+ *     def __dealloc__(self):             # <<<<<<<<<<<<<<
+ *         if self._index != NULL:
+ *             free_delta_index(self._index)
+ */
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+}
+
+/* "breezy/bzr/_groupcompress_pyx.pyx":154
+ *         PyMem_Free(self._source_infos)
+ * 
+ *     def _has_index(self):             # <<<<<<<<<<<<<<
+ *         return (self._index != NULL)
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_9_has_index(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_9_has_index(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("_has_index (wrapper)", 0);
+  __pyx_r = __pyx_pf_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_8_has_index(((struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_8_has_index(struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("_has_index", 0);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":155
+ * 
+ *     def _has_index(self):
+ *         return (self._index != NULL)             # <<<<<<<<<<<<<<
+ * 
+ *     def _dump_index(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyBool_FromLong((__pyx_v_self->_index != NULL)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 155, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":154
+ *         PyMem_Free(self._source_infos)
+ * 
+ *     def _has_index(self):             # <<<<<<<<<<<<<<
+ *         return (self._index != NULL)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("breezy.bzr._groupcompress_pyx.DeltaIndex._has_index", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "breezy/bzr/_groupcompress_pyx.pyx":157
+ *         return (self._index != NULL)
+ * 
+ *     def _dump_index(self):             # <<<<<<<<<<<<<<
+ *         """Dump the pointers in the index.
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_11_dump_index(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static char __pyx_doc_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_10_dump_index[] = "Dump the pointers in the index.\n\n        This is an arbitrary layout, used for testing. It is not meant to be\n        used in production code.\n\n        :return: (hash_list, entry_list)\n            hash_list   A list of offsets, so hash[i] points to the 'hash\n                        bucket' starting at the given offset and going until\n                        hash[i+1]\n            entry_list  A list of (text_offset, hash_val). text_offset is the\n                        offset in the \"source\" texts, and hash_val is the RABIN\n                        hash for that offset.\n                        Note that the entry should be in the hash bucket\n                        defined by\n                        hash[(hash_val & mask)] && hash[(hash_val & mask) + 1]\n        ";
+static PyObject *__pyx_pw_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_11_dump_index(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("_dump_index (wrapper)", 0);
+  __pyx_r = __pyx_pf_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_10_dump_index(((struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_10_dump_index(struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *__pyx_v_self) {
+  int __pyx_v_pos;
+  unsigned int __pyx_v_text_offset;
+  unsigned int __pyx_v_hash_val;
+  unsigned int __pyx_v_hash_offset;
+  PyObject *__pyx_v_hash_list = NULL;
+  PyObject *__pyx_v_entry_list = NULL;
+  PyObject *__pyx_v_val = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("_dump_index", 0);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":178
+ *         cdef unsigned int hash_val
+ *         cdef unsigned int hash_offset
+ *         if self._index == NULL:             # <<<<<<<<<<<<<<
+ *             return None
+ *         hash_list = []
+ */
+  __pyx_t_1 = ((__pyx_v_self->_index == NULL) != 0);
+  if (__pyx_t_1) {
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":179
+ *         cdef unsigned int hash_offset
+ *         if self._index == NULL:
+ *             return None             # <<<<<<<<<<<<<<
+ *         hash_list = []
+ *         pos = 0
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":178
+ *         cdef unsigned int hash_val
+ *         cdef unsigned int hash_offset
+ *         if self._index == NULL:             # <<<<<<<<<<<<<<
+ *             return None
+ *         hash_list = []
+ */
+  }
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":180
+ *         if self._index == NULL:
+ *             return None
+ *         hash_list = []             # <<<<<<<<<<<<<<
+ *         pos = 0
+ *         while get_hash_offset(self._index, pos, &hash_offset):
+ */
+  __pyx_t_2 = PyList_New(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 180, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_v_hash_list = ((PyObject*)__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":181
+ *             return None
+ *         hash_list = []
+ *         pos = 0             # <<<<<<<<<<<<<<
+ *         while get_hash_offset(self._index, pos, &hash_offset):
+ *             hash_list.append(int(hash_offset))
+ */
+  __pyx_v_pos = 0;
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":182
+ *         hash_list = []
+ *         pos = 0
+ *         while get_hash_offset(self._index, pos, &hash_offset):             # <<<<<<<<<<<<<<
+ *             hash_list.append(int(hash_offset))
+ *             pos += 1
+ */
+  while (1) {
+    __pyx_t_1 = (get_hash_offset(__pyx_v_self->_index, __pyx_v_pos, (&__pyx_v_hash_offset)) != 0);
+    if (!__pyx_t_1) break;
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":183
+ *         pos = 0
+ *         while get_hash_offset(self._index, pos, &hash_offset):
+ *             hash_list.append(int(hash_offset))             # <<<<<<<<<<<<<<
+ *             pos += 1
+ *         entry_list = []
+ */
+    __pyx_t_2 = __Pyx_PyInt_From_unsigned_int(__pyx_v_hash_offset); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 183, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = __Pyx_PyObject_CallOneArg(((PyObject *)(&PyInt_Type)), __pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 183, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_4 = __Pyx_PyList_Append(__pyx_v_hash_list, __pyx_t_3); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(0, 183, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":184
+ *         while get_hash_offset(self._index, pos, &hash_offset):
+ *             hash_list.append(int(hash_offset))
+ *             pos += 1             # <<<<<<<<<<<<<<
+ *         entry_list = []
+ *         pos = 0
+ */
+    __pyx_v_pos = (__pyx_v_pos + 1);
+  }
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":185
+ *             hash_list.append(int(hash_offset))
+ *             pos += 1
+ *         entry_list = []             # <<<<<<<<<<<<<<
+ *         pos = 0
+ *         while get_entry_summary(self._index, pos, &text_offset, &hash_val):
+ */
+  __pyx_t_3 = PyList_New(0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 185, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_v_entry_list = ((PyObject*)__pyx_t_3);
+  __pyx_t_3 = 0;
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":186
+ *             pos += 1
+ *         entry_list = []
+ *         pos = 0             # <<<<<<<<<<<<<<
+ *         while get_entry_summary(self._index, pos, &text_offset, &hash_val):
+ *             # Map back using 'int' so that we don't get Long everywhere, when
+ */
+  __pyx_v_pos = 0;
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":187
+ *         entry_list = []
+ *         pos = 0
+ *         while get_entry_summary(self._index, pos, &text_offset, &hash_val):             # <<<<<<<<<<<<<<
+ *             # Map back using 'int' so that we don't get Long everywhere, when
+ *             # almost everything is <2**31.
+ */
+  while (1) {
+    __pyx_t_1 = (get_entry_summary(__pyx_v_self->_index, __pyx_v_pos, (&__pyx_v_text_offset), (&__pyx_v_hash_val)) != 0);
+    if (!__pyx_t_1) break;
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":190
+ *             # Map back using 'int' so that we don't get Long everywhere, when
+ *             # almost everything is <2**31.
+ *             val = tuple(map(int, [text_offset, hash_val]))             # <<<<<<<<<<<<<<
+ *             entry_list.append(val)
+ *             pos += 1
+ */
+    __pyx_t_3 = __Pyx_PyInt_From_unsigned_int(__pyx_v_text_offset); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 190, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_2 = __Pyx_PyInt_From_unsigned_int(__pyx_v_hash_val); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 190, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_5 = PyList_New(2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 190, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_GIVEREF(__pyx_t_3);
+    PyList_SET_ITEM(__pyx_t_5, 0, __pyx_t_3);
+    __Pyx_GIVEREF(__pyx_t_2);
+    PyList_SET_ITEM(__pyx_t_5, 1, __pyx_t_2);
+    __pyx_t_3 = 0;
+    __pyx_t_2 = 0;
+    __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 190, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_INCREF(((PyObject *)(&PyInt_Type)));
+    __Pyx_GIVEREF(((PyObject *)(&PyInt_Type)));
+    PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)(&PyInt_Type)));
+    __Pyx_GIVEREF(__pyx_t_5);
+    PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_t_5);
+    __pyx_t_5 = 0;
+    __pyx_t_5 = __Pyx_PyObject_Call(__pyx_builtin_map, __pyx_t_2, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 190, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_2 = __Pyx_PySequence_Tuple(__pyx_t_5); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 190, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_XDECREF_SET(__pyx_v_val, ((PyObject*)__pyx_t_2));
+    __pyx_t_2 = 0;
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":191
+ *             # almost everything is <2**31.
+ *             val = tuple(map(int, [text_offset, hash_val]))
+ *             entry_list.append(val)             # <<<<<<<<<<<<<<
+ *             pos += 1
+ *         return hash_list, entry_list
+ */
+    __pyx_t_4 = __Pyx_PyList_Append(__pyx_v_entry_list, __pyx_v_val); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(0, 191, __pyx_L1_error)
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":192
+ *             val = tuple(map(int, [text_offset, hash_val]))
+ *             entry_list.append(val)
+ *             pos += 1             # <<<<<<<<<<<<<<
+ *         return hash_list, entry_list
+ * 
+ */
+    __pyx_v_pos = (__pyx_v_pos + 1);
+  }
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":193
+ *             entry_list.append(val)
+ *             pos += 1
+ *         return hash_list, entry_list             # <<<<<<<<<<<<<<
+ * 
+ *     def add_delta_source(self, delta, unadded_bytes):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 193, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(__pyx_v_hash_list);
+  __Pyx_GIVEREF(__pyx_v_hash_list);
+  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_hash_list);
+  __Pyx_INCREF(__pyx_v_entry_list);
+  __Pyx_GIVEREF(__pyx_v_entry_list);
+  PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_v_entry_list);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":157
+ *         return (self._index != NULL)
+ * 
+ *     def _dump_index(self):             # <<<<<<<<<<<<<<
+ *         """Dump the pointers in the index.
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("breezy.bzr._groupcompress_pyx.DeltaIndex._dump_index", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_hash_list);
+  __Pyx_XDECREF(__pyx_v_entry_list);
+  __Pyx_XDECREF(__pyx_v_val);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "breezy/bzr/_groupcompress_pyx.pyx":195
+ *         return hash_list, entry_list
+ * 
+ *     def add_delta_source(self, delta, unadded_bytes):             # <<<<<<<<<<<<<<
+ *         """Add a new delta to the source texts.
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_13add_delta_source(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_12add_delta_source[] = "Add a new delta to the source texts.\n\n        :param delta: The text of the delta, this must be a byte string.\n        :param unadded_bytes: Number of bytes that were added to the source\n            that were not indexed.\n        ";
+static PyObject *__pyx_pw_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_13add_delta_source(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_delta = 0;
+  PyObject *__pyx_v_unadded_bytes = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("add_delta_source (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_delta,&__pyx_n_s_unadded_bytes,0};
+    PyObject* values[2] = {0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_delta)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_unadded_bytes)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("add_delta_source", 1, 2, 2, 1); __PYX_ERR(0, 195, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "add_delta_source") < 0)) __PYX_ERR(0, 195, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+    }
+    __pyx_v_delta = values[0];
+    __pyx_v_unadded_bytes = values[1];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("add_delta_source", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 195, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("breezy.bzr._groupcompress_pyx.DeltaIndex.add_delta_source", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_12add_delta_source(((struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *)__pyx_v_self), __pyx_v_delta, __pyx_v_unadded_bytes);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_12add_delta_source(struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *__pyx_v_self, PyObject *__pyx_v_delta, PyObject *__pyx_v_unadded_bytes) {
+  char *__pyx_v_c_delta;
+  Py_ssize_t __pyx_v_c_delta_size;
+  struct delta_index *__pyx_v_index;
+  delta_result __pyx_v_res;
+  unsigned int __pyx_v_source_location;
+  struct source_info *__pyx_v_src;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  Py_ssize_t __pyx_t_3;
+  int __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  unsigned long __pyx_t_6;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("add_delta_source", 0);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":210
+ *         cdef unsigned int num_indexes
+ * 
+ *         if not PyBytes_CheckExact(delta):             # <<<<<<<<<<<<<<
+ *             raise TypeError('delta is not a bytestring')
+ * 
+ */
+  __pyx_t_1 = ((!(PyBytes_CheckExact(__pyx_v_delta) != 0)) != 0);
+  if (unlikely(__pyx_t_1)) {
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":211
+ * 
+ *         if not PyBytes_CheckExact(delta):
+ *             raise TypeError('delta is not a bytestring')             # <<<<<<<<<<<<<<
+ * 
+ *         source_location = len(self._sources)
+ */
+    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__12, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 211, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __PYX_ERR(0, 211, __pyx_L1_error)
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":210
+ *         cdef unsigned int num_indexes
+ * 
+ *         if not PyBytes_CheckExact(delta):             # <<<<<<<<<<<<<<
+ *             raise TypeError('delta is not a bytestring')
+ * 
+ */
+  }
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":213
+ *             raise TypeError('delta is not a bytestring')
+ * 
+ *         source_location = len(self._sources)             # <<<<<<<<<<<<<<
+ *         if source_location >= self._max_num_sources:
+ *             self._expand_sources()
+ */
+  __pyx_t_2 = __pyx_v_self->_sources;
+  __Pyx_INCREF(__pyx_t_2);
+  if (unlikely(__pyx_t_2 == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 213, __pyx_L1_error)
+  }
+  __pyx_t_3 = PyList_GET_SIZE(__pyx_t_2); if (unlikely(__pyx_t_3 == ((Py_ssize_t)-1))) __PYX_ERR(0, 213, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_v_source_location = __pyx_t_3;
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":214
+ * 
+ *         source_location = len(self._sources)
+ *         if source_location >= self._max_num_sources:             # <<<<<<<<<<<<<<
+ *             self._expand_sources()
+ *         self._sources.append(delta)
+ */
+  __pyx_t_1 = ((__pyx_v_source_location >= __pyx_v_self->_max_num_sources) != 0);
+  if (__pyx_t_1) {
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":215
+ *         source_location = len(self._sources)
+ *         if source_location >= self._max_num_sources:
+ *             self._expand_sources()             # <<<<<<<<<<<<<<
+ *         self._sources.append(delta)
+ *         c_delta = PyBytes_AS_STRING(delta)
+ */
+    __pyx_t_2 = ((struct __pyx_vtabstruct_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *)__pyx_v_self->__pyx_vtab)->_expand_sources(__pyx_v_self); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 215, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":214
+ * 
+ *         source_location = len(self._sources)
+ *         if source_location >= self._max_num_sources:             # <<<<<<<<<<<<<<
+ *             self._expand_sources()
+ *         self._sources.append(delta)
+ */
+  }
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":216
+ *         if source_location >= self._max_num_sources:
+ *             self._expand_sources()
+ *         self._sources.append(delta)             # <<<<<<<<<<<<<<
+ *         c_delta = PyBytes_AS_STRING(delta)
+ *         c_delta_size = PyBytes_GET_SIZE(delta)
+ */
+  if (unlikely(__pyx_v_self->_sources == Py_None)) {
+    PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "append");
+    __PYX_ERR(0, 216, __pyx_L1_error)
+  }
+  __pyx_t_4 = __Pyx_PyList_Append(__pyx_v_self->_sources, __pyx_v_delta); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(0, 216, __pyx_L1_error)
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":217
+ *             self._expand_sources()
+ *         self._sources.append(delta)
+ *         c_delta = PyBytes_AS_STRING(delta)             # <<<<<<<<<<<<<<
+ *         c_delta_size = PyBytes_GET_SIZE(delta)
+ *         src = self._source_infos + source_location
+ */
+  __pyx_v_c_delta = PyBytes_AS_STRING(__pyx_v_delta);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":218
+ *         self._sources.append(delta)
+ *         c_delta = PyBytes_AS_STRING(delta)
+ *         c_delta_size = PyBytes_GET_SIZE(delta)             # <<<<<<<<<<<<<<
+ *         src = self._source_infos + source_location
+ *         src.buf = c_delta
+ */
+  __pyx_v_c_delta_size = PyBytes_GET_SIZE(__pyx_v_delta);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":219
+ *         c_delta = PyBytes_AS_STRING(delta)
+ *         c_delta_size = PyBytes_GET_SIZE(delta)
+ *         src = self._source_infos + source_location             # <<<<<<<<<<<<<<
+ *         src.buf = c_delta
+ *         src.size = c_delta_size
+ */
+  __pyx_v_src = (__pyx_v_self->_source_infos + __pyx_v_source_location);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":220
+ *         c_delta_size = PyBytes_GET_SIZE(delta)
+ *         src = self._source_infos + source_location
+ *         src.buf = c_delta             # <<<<<<<<<<<<<<
+ *         src.size = c_delta_size
+ *         src.agg_offset = self._source_offset + unadded_bytes
+ */
+  __pyx_v_src->buf = __pyx_v_c_delta;
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":221
+ *         src = self._source_infos + source_location
+ *         src.buf = c_delta
+ *         src.size = c_delta_size             # <<<<<<<<<<<<<<
+ *         src.agg_offset = self._source_offset + unadded_bytes
+ *         with nogil:
+ */
+  __pyx_v_src->size = __pyx_v_c_delta_size;
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":222
+ *         src.buf = c_delta
+ *         src.size = c_delta_size
+ *         src.agg_offset = self._source_offset + unadded_bytes             # <<<<<<<<<<<<<<
+ *         with nogil:
+ *             res = create_delta_index_from_delta(src, self._index, &index)
+ */
+  __pyx_t_2 = __Pyx_PyInt_From_unsigned_long(__pyx_v_self->_source_offset); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 222, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_5 = PyNumber_Add(__pyx_t_2, __pyx_v_unadded_bytes); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 222, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_6 = __Pyx_PyInt_As_unsigned_long(__pyx_t_5); if (unlikely((__pyx_t_6 == (unsigned long)-1) && PyErr_Occurred())) __PYX_ERR(0, 222, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_v_src->agg_offset = __pyx_t_6;
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":223
+ *         src.size = c_delta_size
+ *         src.agg_offset = self._source_offset + unadded_bytes
+ *         with nogil:             # <<<<<<<<<<<<<<
+ *             res = create_delta_index_from_delta(src, self._index, &index)
+ *         if res != DELTA_OK:
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      __Pyx_FastGIL_Remember();
+      #endif
+      /*try:*/ {
+
+        /* "breezy/bzr/_groupcompress_pyx.pyx":224
+ *         src.agg_offset = self._source_offset + unadded_bytes
+ *         with nogil:
+ *             res = create_delta_index_from_delta(src, self._index, &index)             # <<<<<<<<<<<<<<
+ *         if res != DELTA_OK:
+ *             raise _translate_delta_failure(res)
+ */
+        __pyx_v_res = create_delta_index_from_delta(__pyx_v_src, __pyx_v_self->_index, (&__pyx_v_index));
+      }
+
+      /* "breezy/bzr/_groupcompress_pyx.pyx":223
+ *         src.size = c_delta_size
+ *         src.agg_offset = self._source_offset + unadded_bytes
+ *         with nogil:             # <<<<<<<<<<<<<<
+ *             res = create_delta_index_from_delta(src, self._index, &index)
+ *         if res != DELTA_OK:
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          __Pyx_FastGIL_Forget();
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L7;
+        }
+        __pyx_L7:;
+      }
+  }
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":225
+ *         with nogil:
+ *             res = create_delta_index_from_delta(src, self._index, &index)
+ *         if res != DELTA_OK:             # <<<<<<<<<<<<<<
+ *             raise _translate_delta_failure(res)
+ *         self._source_offset = src.agg_offset + src.size
+ */
+  __pyx_t_1 = ((__pyx_v_res != DELTA_OK) != 0);
+  if (unlikely(__pyx_t_1)) {
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":226
+ *             res = create_delta_index_from_delta(src, self._index, &index)
+ *         if res != DELTA_OK:
+ *             raise _translate_delta_failure(res)             # <<<<<<<<<<<<<<
+ *         self._source_offset = src.agg_offset + src.size
+ *         if index != self._index:
+ */
+    __pyx_t_5 = __pyx_f_6breezy_3bzr_18_groupcompress_pyx__translate_delta_failure(__pyx_v_res); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 226, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_Raise(__pyx_t_5, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __PYX_ERR(0, 226, __pyx_L1_error)
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":225
+ *         with nogil:
+ *             res = create_delta_index_from_delta(src, self._index, &index)
+ *         if res != DELTA_OK:             # <<<<<<<<<<<<<<
+ *             raise _translate_delta_failure(res)
+ *         self._source_offset = src.agg_offset + src.size
+ */
+  }
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":227
+ *         if res != DELTA_OK:
+ *             raise _translate_delta_failure(res)
+ *         self._source_offset = src.agg_offset + src.size             # <<<<<<<<<<<<<<
+ *         if index != self._index:
+ *             free_delta_index(self._index)
+ */
+  __pyx_v_self->_source_offset = (__pyx_v_src->agg_offset + __pyx_v_src->size);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":228
+ *             raise _translate_delta_failure(res)
+ *         self._source_offset = src.agg_offset + src.size
+ *         if index != self._index:             # <<<<<<<<<<<<<<
+ *             free_delta_index(self._index)
+ *             self._index = index
+ */
+  __pyx_t_1 = ((__pyx_v_index != __pyx_v_self->_index) != 0);
+  if (__pyx_t_1) {
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":229
+ *         self._source_offset = src.agg_offset + src.size
+ *         if index != self._index:
+ *             free_delta_index(self._index)             # <<<<<<<<<<<<<<
+ *             self._index = index
+ * 
+ */
+    free_delta_index(__pyx_v_self->_index);
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":230
+ *         if index != self._index:
+ *             free_delta_index(self._index)
+ *             self._index = index             # <<<<<<<<<<<<<<
+ * 
+ *     def add_source(self, source, unadded_bytes):
+ */
+    __pyx_v_self->_index = __pyx_v_index;
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":228
+ *             raise _translate_delta_failure(res)
+ *         self._source_offset = src.agg_offset + src.size
+ *         if index != self._index:             # <<<<<<<<<<<<<<
+ *             free_delta_index(self._index)
+ *             self._index = index
+ */
+  }
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":195
+ *         return hash_list, entry_list
+ * 
+ *     def add_delta_source(self, delta, unadded_bytes):             # <<<<<<<<<<<<<<
+ *         """Add a new delta to the source texts.
+ * 
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("breezy.bzr._groupcompress_pyx.DeltaIndex.add_delta_source", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "breezy/bzr/_groupcompress_pyx.pyx":232
+ *             self._index = index
+ * 
+ *     def add_source(self, source, unadded_bytes):             # <<<<<<<<<<<<<<
+ *         """Add a new bit of source text to the delta indexes.
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_15add_source(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_14add_source[] = "Add a new bit of source text to the delta indexes.\n\n        :param source: The text in question, this must be a byte string\n        :param unadded_bytes: Assume there are this many bytes that didn't get\n            added between this source and the end of the previous source.\n        :param max_pointers: Add no more than this many entries to the index.\n            By default, we sample every 16 bytes, if that would require more\n            than max_entries, we will reduce the sampling rate.\n            A value of 0 means unlimited, None means use the default limit.\n        ";
+static PyObject *__pyx_pw_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_15add_source(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_source = 0;
+  PyObject *__pyx_v_unadded_bytes = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("add_source (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_source,&__pyx_n_s_unadded_bytes,0};
+    PyObject* values[2] = {0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_source)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_unadded_bytes)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("add_source", 1, 2, 2, 1); __PYX_ERR(0, 232, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "add_source") < 0)) __PYX_ERR(0, 232, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+    }
+    __pyx_v_source = values[0];
+    __pyx_v_unadded_bytes = values[1];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("add_source", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 232, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("breezy.bzr._groupcompress_pyx.DeltaIndex.add_source", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_14add_source(((struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *)__pyx_v_self), __pyx_v_source, __pyx_v_unadded_bytes);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_14add_source(struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *__pyx_v_self, PyObject *__pyx_v_source, PyObject *__pyx_v_unadded_bytes) {
+  char *__pyx_v_c_source;
+  Py_ssize_t __pyx_v_c_source_size;
+  struct delta_index *__pyx_v_index;
+  delta_result __pyx_v_res;
+  unsigned int __pyx_v_source_location;
+  struct source_info *__pyx_v_src;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  Py_ssize_t __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  PyObject *__pyx_t_6 = NULL;
+  unsigned long __pyx_t_7;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("add_source", 0);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":252
+ *         cdef int max_num_entries
+ * 
+ *         if not PyBytes_CheckExact(source):             # <<<<<<<<<<<<<<
+ *             raise TypeError('source is not a bytestring')
+ * 
+ */
+  __pyx_t_1 = ((!(PyBytes_CheckExact(__pyx_v_source) != 0)) != 0);
+  if (unlikely(__pyx_t_1)) {
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":253
+ * 
+ *         if not PyBytes_CheckExact(source):
+ *             raise TypeError('source is not a bytestring')             # <<<<<<<<<<<<<<
+ * 
+ *         source_location = len(self._sources)
+ */
+    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__13, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 253, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __PYX_ERR(0, 253, __pyx_L1_error)
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":252
+ *         cdef int max_num_entries
+ * 
+ *         if not PyBytes_CheckExact(source):             # <<<<<<<<<<<<<<
+ *             raise TypeError('source is not a bytestring')
+ * 
+ */
+  }
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":255
+ *             raise TypeError('source is not a bytestring')
+ * 
+ *         source_location = len(self._sources)             # <<<<<<<<<<<<<<
+ *         if source_location >= self._max_num_sources:
+ *             self._expand_sources()
+ */
+  __pyx_t_2 = __pyx_v_self->_sources;
+  __Pyx_INCREF(__pyx_t_2);
+  if (unlikely(__pyx_t_2 == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 255, __pyx_L1_error)
+  }
+  __pyx_t_3 = PyList_GET_SIZE(__pyx_t_2); if (unlikely(__pyx_t_3 == ((Py_ssize_t)-1))) __PYX_ERR(0, 255, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_v_source_location = __pyx_t_3;
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":256
+ * 
+ *         source_location = len(self._sources)
+ *         if source_location >= self._max_num_sources:             # <<<<<<<<<<<<<<
+ *             self._expand_sources()
+ *         if source_location != 0 and self._index == NULL:
+ */
+  __pyx_t_1 = ((__pyx_v_source_location >= __pyx_v_self->_max_num_sources) != 0);
+  if (__pyx_t_1) {
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":257
+ *         source_location = len(self._sources)
+ *         if source_location >= self._max_num_sources:
+ *             self._expand_sources()             # <<<<<<<<<<<<<<
+ *         if source_location != 0 and self._index == NULL:
+ *             # We were lazy about populating the index, create it now
+ */
+    __pyx_t_2 = ((struct __pyx_vtabstruct_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *)__pyx_v_self->__pyx_vtab)->_expand_sources(__pyx_v_self); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 257, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":256
+ * 
+ *         source_location = len(self._sources)
+ *         if source_location >= self._max_num_sources:             # <<<<<<<<<<<<<<
+ *             self._expand_sources()
+ *         if source_location != 0 and self._index == NULL:
+ */
+  }
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":258
+ *         if source_location >= self._max_num_sources:
+ *             self._expand_sources()
+ *         if source_location != 0 and self._index == NULL:             # <<<<<<<<<<<<<<
+ *             # We were lazy about populating the index, create it now
+ *             self._populate_first_index()
+ */
+  __pyx_t_4 = ((__pyx_v_source_location != 0) != 0);
+  if (__pyx_t_4) {
+  } else {
+    __pyx_t_1 = __pyx_t_4;
+    goto __pyx_L6_bool_binop_done;
+  }
+  __pyx_t_4 = ((__pyx_v_self->_index == NULL) != 0);
+  __pyx_t_1 = __pyx_t_4;
+  __pyx_L6_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":260
+ *         if source_location != 0 and self._index == NULL:
+ *             # We were lazy about populating the index, create it now
+ *             self._populate_first_index()             # <<<<<<<<<<<<<<
+ *         self._sources.append(source)
+ *         c_source = PyBytes_AS_STRING(source)
+ */
+    __pyx_t_2 = ((struct __pyx_vtabstruct_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *)__pyx_v_self->__pyx_vtab)->_populate_first_index(__pyx_v_self); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 260, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":258
+ *         if source_location >= self._max_num_sources:
+ *             self._expand_sources()
+ *         if source_location != 0 and self._index == NULL:             # <<<<<<<<<<<<<<
+ *             # We were lazy about populating the index, create it now
+ *             self._populate_first_index()
+ */
+  }
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":261
+ *             # We were lazy about populating the index, create it now
+ *             self._populate_first_index()
+ *         self._sources.append(source)             # <<<<<<<<<<<<<<
+ *         c_source = PyBytes_AS_STRING(source)
+ *         c_source_size = PyBytes_GET_SIZE(source)
+ */
+  if (unlikely(__pyx_v_self->_sources == Py_None)) {
+    PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "append");
+    __PYX_ERR(0, 261, __pyx_L1_error)
+  }
+  __pyx_t_5 = __Pyx_PyList_Append(__pyx_v_self->_sources, __pyx_v_source); if (unlikely(__pyx_t_5 == ((int)-1))) __PYX_ERR(0, 261, __pyx_L1_error)
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":262
+ *             self._populate_first_index()
+ *         self._sources.append(source)
+ *         c_source = PyBytes_AS_STRING(source)             # <<<<<<<<<<<<<<
+ *         c_source_size = PyBytes_GET_SIZE(source)
+ *         src = self._source_infos + source_location
+ */
+  __pyx_v_c_source = PyBytes_AS_STRING(__pyx_v_source);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":263
+ *         self._sources.append(source)
+ *         c_source = PyBytes_AS_STRING(source)
+ *         c_source_size = PyBytes_GET_SIZE(source)             # <<<<<<<<<<<<<<
+ *         src = self._source_infos + source_location
+ *         src.buf = c_source
+ */
+  __pyx_v_c_source_size = PyBytes_GET_SIZE(__pyx_v_source);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":264
+ *         c_source = PyBytes_AS_STRING(source)
+ *         c_source_size = PyBytes_GET_SIZE(source)
+ *         src = self._source_infos + source_location             # <<<<<<<<<<<<<<
+ *         src.buf = c_source
+ *         src.size = c_source_size
+ */
+  __pyx_v_src = (__pyx_v_self->_source_infos + __pyx_v_source_location);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":265
+ *         c_source_size = PyBytes_GET_SIZE(source)
+ *         src = self._source_infos + source_location
+ *         src.buf = c_source             # <<<<<<<<<<<<<<
+ *         src.size = c_source_size
+ * 
+ */
+  __pyx_v_src->buf = __pyx_v_c_source;
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":266
+ *         src = self._source_infos + source_location
+ *         src.buf = c_source
+ *         src.size = c_source_size             # <<<<<<<<<<<<<<
+ * 
+ *         src.agg_offset = self._source_offset + unadded_bytes
+ */
+  __pyx_v_src->size = __pyx_v_c_source_size;
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":268
+ *         src.size = c_source_size
+ * 
+ *         src.agg_offset = self._source_offset + unadded_bytes             # <<<<<<<<<<<<<<
+ *         self._source_offset = src.agg_offset + src.size
+ *         # We delay creating the index on the first insert
+ */
+  __pyx_t_2 = __Pyx_PyInt_From_unsigned_long(__pyx_v_self->_source_offset); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 268, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_6 = PyNumber_Add(__pyx_t_2, __pyx_v_unadded_bytes); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 268, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_7 = __Pyx_PyInt_As_unsigned_long(__pyx_t_6); if (unlikely((__pyx_t_7 == (unsigned long)-1) && PyErr_Occurred())) __PYX_ERR(0, 268, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_v_src->agg_offset = __pyx_t_7;
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":269
+ * 
+ *         src.agg_offset = self._source_offset + unadded_bytes
+ *         self._source_offset = src.agg_offset + src.size             # <<<<<<<<<<<<<<
+ *         # We delay creating the index on the first insert
+ *         if source_location != 0:
+ */
+  __pyx_v_self->_source_offset = (__pyx_v_src->agg_offset + __pyx_v_src->size);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":271
+ *         self._source_offset = src.agg_offset + src.size
+ *         # We delay creating the index on the first insert
+ *         if source_location != 0:             # <<<<<<<<<<<<<<
+ *             with nogil:
+ *                 res = create_delta_index(src, self._index, &index,
+ */
+  __pyx_t_1 = ((__pyx_v_source_location != 0) != 0);
+  if (__pyx_t_1) {
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":272
+ *         # We delay creating the index on the first insert
+ *         if source_location != 0:
+ *             with nogil:             # <<<<<<<<<<<<<<
+ *                 res = create_delta_index(src, self._index, &index,
+ *                                          self._max_bytes_to_index)
+ */
+    {
+        #ifdef WITH_THREAD
+        PyThreadState *_save;
+        Py_UNBLOCK_THREADS
+        __Pyx_FastGIL_Remember();
+        #endif
+        /*try:*/ {
+
+          /* "breezy/bzr/_groupcompress_pyx.pyx":273
+ *         if source_location != 0:
+ *             with nogil:
+ *                 res = create_delta_index(src, self._index, &index,             # <<<<<<<<<<<<<<
+ *                                          self._max_bytes_to_index)
+ *             if res != DELTA_OK:
+ */
+          __pyx_v_res = create_delta_index(__pyx_v_src, __pyx_v_self->_index, (&__pyx_v_index), __pyx_v_self->_max_bytes_to_index);
+        }
+
+        /* "breezy/bzr/_groupcompress_pyx.pyx":272
+ *         # We delay creating the index on the first insert
+ *         if source_location != 0:
+ *             with nogil:             # <<<<<<<<<<<<<<
+ *                 res = create_delta_index(src, self._index, &index,
+ *                                          self._max_bytes_to_index)
+ */
+        /*finally:*/ {
+          /*normal exit:*/{
+            #ifdef WITH_THREAD
+            __Pyx_FastGIL_Forget();
+            Py_BLOCK_THREADS
+            #endif
+            goto __pyx_L11;
+          }
+          __pyx_L11:;
+        }
+    }
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":275
+ *                 res = create_delta_index(src, self._index, &index,
+ *                                          self._max_bytes_to_index)
+ *             if res != DELTA_OK:             # <<<<<<<<<<<<<<
+ *                 raise _translate_delta_failure(res)
+ *             if index != self._index:
+ */
+    __pyx_t_1 = ((__pyx_v_res != DELTA_OK) != 0);
+    if (unlikely(__pyx_t_1)) {
+
+      /* "breezy/bzr/_groupcompress_pyx.pyx":276
+ *                                          self._max_bytes_to_index)
+ *             if res != DELTA_OK:
+ *                 raise _translate_delta_failure(res)             # <<<<<<<<<<<<<<
+ *             if index != self._index:
+ *                 free_delta_index(self._index)
+ */
+      __pyx_t_6 = __pyx_f_6breezy_3bzr_18_groupcompress_pyx__translate_delta_failure(__pyx_v_res); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 276, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __Pyx_Raise(__pyx_t_6, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __PYX_ERR(0, 276, __pyx_L1_error)
+
+      /* "breezy/bzr/_groupcompress_pyx.pyx":275
+ *                 res = create_delta_index(src, self._index, &index,
+ *                                          self._max_bytes_to_index)
+ *             if res != DELTA_OK:             # <<<<<<<<<<<<<<
+ *                 raise _translate_delta_failure(res)
+ *             if index != self._index:
+ */
+    }
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":277
+ *             if res != DELTA_OK:
+ *                 raise _translate_delta_failure(res)
+ *             if index != self._index:             # <<<<<<<<<<<<<<
+ *                 free_delta_index(self._index)
+ *                 self._index = index
+ */
+    __pyx_t_1 = ((__pyx_v_index != __pyx_v_self->_index) != 0);
+    if (__pyx_t_1) {
+
+      /* "breezy/bzr/_groupcompress_pyx.pyx":278
+ *                 raise _translate_delta_failure(res)
+ *             if index != self._index:
+ *                 free_delta_index(self._index)             # <<<<<<<<<<<<<<
+ *                 self._index = index
+ * 
+ */
+      free_delta_index(__pyx_v_self->_index);
+
+      /* "breezy/bzr/_groupcompress_pyx.pyx":279
+ *             if index != self._index:
+ *                 free_delta_index(self._index)
+ *                 self._index = index             # <<<<<<<<<<<<<<
+ * 
+ *     cdef _populate_first_index(self):
+ */
+      __pyx_v_self->_index = __pyx_v_index;
+
+      /* "breezy/bzr/_groupcompress_pyx.pyx":277
+ *             if res != DELTA_OK:
+ *                 raise _translate_delta_failure(res)
+ *             if index != self._index:             # <<<<<<<<<<<<<<
+ *                 free_delta_index(self._index)
+ *                 self._index = index
+ */
+    }
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":271
+ *         self._source_offset = src.agg_offset + src.size
+ *         # We delay creating the index on the first insert
+ *         if source_location != 0:             # <<<<<<<<<<<<<<
+ *             with nogil:
+ *                 res = create_delta_index(src, self._index, &index,
+ */
+  }
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":232
+ *             self._index = index
+ * 
+ *     def add_source(self, source, unadded_bytes):             # <<<<<<<<<<<<<<
+ *         """Add a new bit of source text to the delta indexes.
+ * 
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("breezy.bzr._groupcompress_pyx.DeltaIndex.add_source", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "breezy/bzr/_groupcompress_pyx.pyx":281
+ *                 self._index = index
+ * 
+ *     cdef _populate_first_index(self):             # <<<<<<<<<<<<<<
+ *         cdef delta_index *index
+ *         cdef delta_result res
+ */
+
+static PyObject *__pyx_f_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex__populate_first_index(struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *__pyx_v_self) {
+  struct delta_index *__pyx_v_index;
+  delta_result __pyx_v_res;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  Py_ssize_t __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("_populate_first_index", 0);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":284
+ *         cdef delta_index *index
+ *         cdef delta_result res
+ *         if len(self._sources) != 1 or self._index != NULL:             # <<<<<<<<<<<<<<
+ *             raise AssertionError('_populate_first_index should only be'
+ *                 ' called when we have a single source and no index yet')
+ */
+  __pyx_t_2 = __pyx_v_self->_sources;
+  __Pyx_INCREF(__pyx_t_2);
+  if (unlikely(__pyx_t_2 == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 284, __pyx_L1_error)
+  }
+  __pyx_t_3 = PyList_GET_SIZE(__pyx_t_2); if (unlikely(__pyx_t_3 == ((Py_ssize_t)-1))) __PYX_ERR(0, 284, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_4 = ((__pyx_t_3 != 1) != 0);
+  if (!__pyx_t_4) {
+  } else {
+    __pyx_t_1 = __pyx_t_4;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_4 = ((__pyx_v_self->_index != NULL) != 0);
+  __pyx_t_1 = __pyx_t_4;
+  __pyx_L4_bool_binop_done:;
+  if (unlikely(__pyx_t_1)) {
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":285
+ *         cdef delta_result res
+ *         if len(self._sources) != 1 or self._index != NULL:
+ *             raise AssertionError('_populate_first_index should only be'             # <<<<<<<<<<<<<<
+ *                 ' called when we have a single source and no index yet')
+ * 
+ */
+    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_AssertionError, __pyx_tuple__14, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 285, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __PYX_ERR(0, 285, __pyx_L1_error)
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":284
+ *         cdef delta_index *index
+ *         cdef delta_result res
+ *         if len(self._sources) != 1 or self._index != NULL:             # <<<<<<<<<<<<<<
+ *             raise AssertionError('_populate_first_index should only be'
+ *                 ' called when we have a single source and no index yet')
+ */
+  }
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":290
+ *         # We know that self._index is already NULL, so create_delta_index
+ *         # will always create a new index unless there's a malloc failure
+ *         with nogil:             # <<<<<<<<<<<<<<
+ *             res = create_delta_index(&self._source_infos[0], NULL, &index,
+ *                                      self._max_bytes_to_index)
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      __Pyx_FastGIL_Remember();
+      #endif
+      /*try:*/ {
+
+        /* "breezy/bzr/_groupcompress_pyx.pyx":291
+ *         # will always create a new index unless there's a malloc failure
+ *         with nogil:
+ *             res = create_delta_index(&self._source_infos[0], NULL, &index,             # <<<<<<<<<<<<<<
+ *                                      self._max_bytes_to_index)
+ *         if res != DELTA_OK:
+ */
+        __pyx_v_res = create_delta_index((&(__pyx_v_self->_source_infos[0])), NULL, (&__pyx_v_index), __pyx_v_self->_max_bytes_to_index);
+      }
+
+      /* "breezy/bzr/_groupcompress_pyx.pyx":290
+ *         # We know that self._index is already NULL, so create_delta_index
+ *         # will always create a new index unless there's a malloc failure
+ *         with nogil:             # <<<<<<<<<<<<<<
+ *             res = create_delta_index(&self._source_infos[0], NULL, &index,
+ *                                      self._max_bytes_to_index)
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          __Pyx_FastGIL_Forget();
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L8;
+        }
+        __pyx_L8:;
+      }
+  }
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":293
+ *             res = create_delta_index(&self._source_infos[0], NULL, &index,
+ *                                      self._max_bytes_to_index)
+ *         if res != DELTA_OK:             # <<<<<<<<<<<<<<
+ *             raise _translate_delta_failure(res)
+ *         self._index = index
+ */
+  __pyx_t_1 = ((__pyx_v_res != DELTA_OK) != 0);
+  if (unlikely(__pyx_t_1)) {
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":294
+ *                                      self._max_bytes_to_index)
+ *         if res != DELTA_OK:
+ *             raise _translate_delta_failure(res)             # <<<<<<<<<<<<<<
+ *         self._index = index
+ * 
+ */
+    __pyx_t_2 = __pyx_f_6breezy_3bzr_18_groupcompress_pyx__translate_delta_failure(__pyx_v_res); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 294, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __PYX_ERR(0, 294, __pyx_L1_error)
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":293
+ *             res = create_delta_index(&self._source_infos[0], NULL, &index,
+ *                                      self._max_bytes_to_index)
+ *         if res != DELTA_OK:             # <<<<<<<<<<<<<<
+ *             raise _translate_delta_failure(res)
+ *         self._index = index
+ */
+  }
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":295
+ *         if res != DELTA_OK:
+ *             raise _translate_delta_failure(res)
+ *         self._index = index             # <<<<<<<<<<<<<<
+ * 
+ *     cdef _expand_sources(self):
+ */
+  __pyx_v_self->_index = __pyx_v_index;
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":281
+ *                 self._index = index
+ * 
+ *     cdef _populate_first_index(self):             # <<<<<<<<<<<<<<
+ *         cdef delta_index *index
+ *         cdef delta_result res
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("breezy.bzr._groupcompress_pyx.DeltaIndex._populate_first_index", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "breezy/bzr/_groupcompress_pyx.pyx":297
+ *         self._index = index
+ * 
+ *     cdef _expand_sources(self):             # <<<<<<<<<<<<<<
+ *         raise RuntimeError('if we move self._source_infos, then we need to'
+ *                            ' change all of the index pointers as well.')
+ */
+
+static PyObject *__pyx_f_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex__expand_sources(CYTHON_UNUSED struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("_expand_sources", 0);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":298
+ * 
+ *     cdef _expand_sources(self):
+ *         raise RuntimeError('if we move self._source_infos, then we need to'             # <<<<<<<<<<<<<<
+ *                            ' change all of the index pointers as well.')
+ * 
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_RuntimeError, __pyx_tuple__15, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 298, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __PYX_ERR(0, 298, __pyx_L1_error)
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":297
+ *         self._index = index
+ * 
+ *     cdef _expand_sources(self):             # <<<<<<<<<<<<<<
+ *         raise RuntimeError('if we move self._source_infos, then we need to'
+ *                            ' change all of the index pointers as well.')
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("breezy.bzr._groupcompress_pyx.DeltaIndex._expand_sources", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "breezy/bzr/_groupcompress_pyx.pyx":301
+ *                            ' change all of the index pointers as well.')
+ * 
+ *     def make_delta(self, target_bytes, max_delta_size=0):             # <<<<<<<<<<<<<<
+ *         """Create a delta from the current source to the target bytes."""
+ *         cdef char *target
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_17make_delta(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_16make_delta[] = "Create a delta from the current source to the target bytes.";
+static PyObject *__pyx_pw_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_17make_delta(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_target_bytes = 0;
+  PyObject *__pyx_v_max_delta_size = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("make_delta (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_target_bytes,&__pyx_n_s_max_delta_size,0};
+    PyObject* values[2] = {0,0};
+    values[1] = ((PyObject *)__pyx_int_0);
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_target_bytes)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_max_delta_size);
+          if (value) { values[1] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "make_delta") < 0)) __PYX_ERR(0, 301, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_target_bytes = values[0];
+    __pyx_v_max_delta_size = values[1];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("make_delta", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 301, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("breezy.bzr._groupcompress_pyx.DeltaIndex.make_delta", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_16make_delta(((struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *)__pyx_v_self), __pyx_v_target_bytes, __pyx_v_max_delta_size);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_16make_delta(struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *__pyx_v_self, PyObject *__pyx_v_target_bytes, PyObject *__pyx_v_max_delta_size) {
+  char *__pyx_v_target;
+  Py_ssize_t __pyx_v_target_size;
+  void *__pyx_v_delta;
+  unsigned long __pyx_v_delta_size;
+  unsigned long __pyx_v_c_max_delta_size;
+  delta_result __pyx_v_res;
+  PyObject *__pyx_v_result = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  Py_ssize_t __pyx_t_3;
+  unsigned long __pyx_t_4;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("make_delta", 0);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":310
+ *         cdef delta_result res
+ * 
+ *         if self._index == NULL:             # <<<<<<<<<<<<<<
+ *             if len(self._sources) == 0:
+ *                 return None
+ */
+  __pyx_t_1 = ((__pyx_v_self->_index == NULL) != 0);
+  if (__pyx_t_1) {
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":311
+ * 
+ *         if self._index == NULL:
+ *             if len(self._sources) == 0:             # <<<<<<<<<<<<<<
+ *                 return None
+ *             # We were just lazy about generating the index
+ */
+    __pyx_t_2 = __pyx_v_self->_sources;
+    __Pyx_INCREF(__pyx_t_2);
+    if (unlikely(__pyx_t_2 == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+      __PYX_ERR(0, 311, __pyx_L1_error)
+    }
+    __pyx_t_3 = PyList_GET_SIZE(__pyx_t_2); if (unlikely(__pyx_t_3 == ((Py_ssize_t)-1))) __PYX_ERR(0, 311, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_1 = ((__pyx_t_3 == 0) != 0);
+    if (__pyx_t_1) {
+
+      /* "breezy/bzr/_groupcompress_pyx.pyx":312
+ *         if self._index == NULL:
+ *             if len(self._sources) == 0:
+ *                 return None             # <<<<<<<<<<<<<<
+ *             # We were just lazy about generating the index
+ *             self._populate_first_index()
+ */
+      __Pyx_XDECREF(__pyx_r);
+      __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+      goto __pyx_L0;
+
+      /* "breezy/bzr/_groupcompress_pyx.pyx":311
+ * 
+ *         if self._index == NULL:
+ *             if len(self._sources) == 0:             # <<<<<<<<<<<<<<
+ *                 return None
+ *             # We were just lazy about generating the index
+ */
+    }
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":314
+ *                 return None
+ *             # We were just lazy about generating the index
+ *             self._populate_first_index()             # <<<<<<<<<<<<<<
+ * 
+ *         if not PyBytes_CheckExact(target_bytes):
+ */
+    __pyx_t_2 = ((struct __pyx_vtabstruct_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *)__pyx_v_self->__pyx_vtab)->_populate_first_index(__pyx_v_self); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 314, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":310
+ *         cdef delta_result res
+ * 
+ *         if self._index == NULL:             # <<<<<<<<<<<<<<
+ *             if len(self._sources) == 0:
+ *                 return None
+ */
+  }
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":316
+ *             self._populate_first_index()
+ * 
+ *         if not PyBytes_CheckExact(target_bytes):             # <<<<<<<<<<<<<<
+ *             raise TypeError('target is not a bytestring')
+ * 
+ */
+  __pyx_t_1 = ((!(PyBytes_CheckExact(__pyx_v_target_bytes) != 0)) != 0);
+  if (unlikely(__pyx_t_1)) {
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":317
+ * 
+ *         if not PyBytes_CheckExact(target_bytes):
+ *             raise TypeError('target is not a bytestring')             # <<<<<<<<<<<<<<
+ * 
+ *         target = PyBytes_AS_STRING(target_bytes)
+ */
+    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__16, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 317, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __PYX_ERR(0, 317, __pyx_L1_error)
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":316
+ *             self._populate_first_index()
+ * 
+ *         if not PyBytes_CheckExact(target_bytes):             # <<<<<<<<<<<<<<
+ *             raise TypeError('target is not a bytestring')
+ * 
+ */
+  }
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":319
+ *             raise TypeError('target is not a bytestring')
+ * 
+ *         target = PyBytes_AS_STRING(target_bytes)             # <<<<<<<<<<<<<<
+ *         target_size = PyBytes_GET_SIZE(target_bytes)
+ * 
+ */
+  __pyx_v_target = PyBytes_AS_STRING(__pyx_v_target_bytes);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":320
+ * 
+ *         target = PyBytes_AS_STRING(target_bytes)
+ *         target_size = PyBytes_GET_SIZE(target_bytes)             # <<<<<<<<<<<<<<
+ * 
+ *         # TODO: inline some of create_delta so we at least don't have to double
+ */
+  __pyx_v_target_size = PyBytes_GET_SIZE(__pyx_v_target_bytes);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":325
+ *         #       malloc, and can instead use PyBytes_FromStringAndSize, to
+ *         #       allocate the bytes into the final string
+ *         c_max_delta_size = max_delta_size             # <<<<<<<<<<<<<<
+ *         with nogil:
+ *             res = create_delta(self._index, target, target_size,
+ */
+  __pyx_t_4 = __Pyx_PyInt_As_unsigned_long(__pyx_v_max_delta_size); if (unlikely((__pyx_t_4 == (unsigned long)-1) && PyErr_Occurred())) __PYX_ERR(0, 325, __pyx_L1_error)
+  __pyx_v_c_max_delta_size = __pyx_t_4;
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":326
+ *         #       allocate the bytes into the final string
+ *         c_max_delta_size = max_delta_size
+ *         with nogil:             # <<<<<<<<<<<<<<
+ *             res = create_delta(self._index, target, target_size,
+ *                                &delta_size, c_max_delta_size, &delta)
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      __Pyx_FastGIL_Remember();
+      #endif
+      /*try:*/ {
+
+        /* "breezy/bzr/_groupcompress_pyx.pyx":327
+ *         c_max_delta_size = max_delta_size
+ *         with nogil:
+ *             res = create_delta(self._index, target, target_size,             # <<<<<<<<<<<<<<
+ *                                &delta_size, c_max_delta_size, &delta)
+ *         result = None
+ */
+        __pyx_v_res = create_delta(__pyx_v_self->_index, __pyx_v_target, __pyx_v_target_size, (&__pyx_v_delta_size), __pyx_v_c_max_delta_size, (&__pyx_v_delta));
+      }
+
+      /* "breezy/bzr/_groupcompress_pyx.pyx":326
+ *         #       allocate the bytes into the final string
+ *         c_max_delta_size = max_delta_size
+ *         with nogil:             # <<<<<<<<<<<<<<
+ *             res = create_delta(self._index, target, target_size,
+ *                                &delta_size, c_max_delta_size, &delta)
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          __Pyx_FastGIL_Forget();
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L8;
+        }
+        __pyx_L8:;
+      }
+  }
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":329
+ *             res = create_delta(self._index, target, target_size,
+ *                                &delta_size, c_max_delta_size, &delta)
+ *         result = None             # <<<<<<<<<<<<<<
+ *         if res == DELTA_OK:
+ *             result = PyBytes_FromStringAndSize(<char *>delta, delta_size)
+ */
+  __Pyx_INCREF(Py_None);
+  __pyx_v_result = ((PyObject*)Py_None);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":330
+ *                                &delta_size, c_max_delta_size, &delta)
+ *         result = None
+ *         if res == DELTA_OK:             # <<<<<<<<<<<<<<
+ *             result = PyBytes_FromStringAndSize(<char *>delta, delta_size)
+ *             free(delta)
+ */
+  __pyx_t_1 = ((__pyx_v_res == DELTA_OK) != 0);
+  if (__pyx_t_1) {
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":331
+ *         result = None
+ *         if res == DELTA_OK:
+ *             result = PyBytes_FromStringAndSize(<char *>delta, delta_size)             # <<<<<<<<<<<<<<
+ *             free(delta)
+ *         elif res != DELTA_SIZE_TOO_BIG:
+ */
+    __pyx_t_2 = PyBytes_FromStringAndSize(((char *)__pyx_v_delta), __pyx_v_delta_size); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 331, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF_SET(__pyx_v_result, ((PyObject*)__pyx_t_2));
+    __pyx_t_2 = 0;
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":332
+ *         if res == DELTA_OK:
+ *             result = PyBytes_FromStringAndSize(<char *>delta, delta_size)
+ *             free(delta)             # <<<<<<<<<<<<<<
+ *         elif res != DELTA_SIZE_TOO_BIG:
+ *             raise _translate_delta_failure(res)
+ */
+    free(__pyx_v_delta);
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":330
+ *                                &delta_size, c_max_delta_size, &delta)
+ *         result = None
+ *         if res == DELTA_OK:             # <<<<<<<<<<<<<<
+ *             result = PyBytes_FromStringAndSize(<char *>delta, delta_size)
+ *             free(delta)
+ */
+    goto __pyx_L9;
+  }
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":333
+ *             result = PyBytes_FromStringAndSize(<char *>delta, delta_size)
+ *             free(delta)
+ *         elif res != DELTA_SIZE_TOO_BIG:             # <<<<<<<<<<<<<<
+ *             raise _translate_delta_failure(res)
+ *         return result
+ */
+  __pyx_t_1 = ((__pyx_v_res != DELTA_SIZE_TOO_BIG) != 0);
+  if (unlikely(__pyx_t_1)) {
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":334
+ *             free(delta)
+ *         elif res != DELTA_SIZE_TOO_BIG:
+ *             raise _translate_delta_failure(res)             # <<<<<<<<<<<<<<
+ *         return result
+ * 
+ */
+    __pyx_t_2 = __pyx_f_6breezy_3bzr_18_groupcompress_pyx__translate_delta_failure(__pyx_v_res); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 334, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __PYX_ERR(0, 334, __pyx_L1_error)
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":333
+ *             result = PyBytes_FromStringAndSize(<char *>delta, delta_size)
+ *             free(delta)
+ *         elif res != DELTA_SIZE_TOO_BIG:             # <<<<<<<<<<<<<<
+ *             raise _translate_delta_failure(res)
+ *         return result
+ */
+  }
+  __pyx_L9:;
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":335
+ *         elif res != DELTA_SIZE_TOO_BIG:
+ *             raise _translate_delta_failure(res)
+ *         return result             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_result);
+  __pyx_r = __pyx_v_result;
+  goto __pyx_L0;
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":301
+ *                            ' change all of the index pointers as well.')
+ * 
+ *     def make_delta(self, target_bytes, max_delta_size=0):             # <<<<<<<<<<<<<<
+ *         """Create a delta from the current source to the target bytes."""
+ *         cdef char *target
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("breezy.bzr._groupcompress_pyx.DeltaIndex.make_delta", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_result);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "breezy/bzr/_groupcompress_pyx.pyx":114
+ * cdef class DeltaIndex:
+ * 
+ *     cdef readonly list _sources             # <<<<<<<<<<<<<<
+ *     cdef source_info *_source_infos
+ *     cdef delta_index *_index
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_8_sources_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_8_sources_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_8_sources___get__(((struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_8_sources___get__(struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_self->_sources);
+  __pyx_r = __pyx_v_self->_sources;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "breezy/bzr/_groupcompress_pyx.pyx":117
+ *     cdef source_info *_source_infos
+ *     cdef delta_index *_index
+ *     cdef public unsigned long _source_offset             # <<<<<<<<<<<<<<
+ *     cdef readonly unsigned int _max_num_sources
+ *     cdef public int _max_bytes_to_index
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_14_source_offset_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_14_source_offset_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_14_source_offset___get__(((struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_14_source_offset___get__(struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyInt_From_unsigned_long(__pyx_v_self->_source_offset); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 117, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("breezy.bzr._groupcompress_pyx.DeltaIndex._source_offset.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_14_source_offset_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value); /*proto*/
+static int __pyx_pw_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_14_source_offset_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__set__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_14_source_offset_2__set__(((struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *)__pyx_v_self), ((PyObject *)__pyx_v_value));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_14_source_offset_2__set__(struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  unsigned long __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__set__", 0);
+  __pyx_t_1 = __Pyx_PyInt_As_unsigned_long(__pyx_v_value); if (unlikely((__pyx_t_1 == (unsigned long)-1) && PyErr_Occurred())) __PYX_ERR(0, 117, __pyx_L1_error)
+  __pyx_v_self->_source_offset = __pyx_t_1;
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("breezy.bzr._groupcompress_pyx.DeltaIndex._source_offset.__set__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "breezy/bzr/_groupcompress_pyx.pyx":118
+ *     cdef delta_index *_index
+ *     cdef public unsigned long _source_offset
+ *     cdef readonly unsigned int _max_num_sources             # <<<<<<<<<<<<<<
+ *     cdef public int _max_bytes_to_index
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_16_max_num_sources_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_16_max_num_sources_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_16_max_num_sources___get__(((struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_16_max_num_sources___get__(struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyInt_From_unsigned_int(__pyx_v_self->_max_num_sources); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 118, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("breezy.bzr._groupcompress_pyx.DeltaIndex._max_num_sources.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "breezy/bzr/_groupcompress_pyx.pyx":119
+ *     cdef public unsigned long _source_offset
+ *     cdef readonly unsigned int _max_num_sources
+ *     cdef public int _max_bytes_to_index             # <<<<<<<<<<<<<<
+ * 
+ *     def __init__(self, source=None, max_bytes_to_index=None):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_19_max_bytes_to_index_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_19_max_bytes_to_index_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_19_max_bytes_to_index___get__(((struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_19_max_bytes_to_index___get__(struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->_max_bytes_to_index); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 119, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("breezy.bzr._groupcompress_pyx.DeltaIndex._max_bytes_to_index.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_19_max_bytes_to_index_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value); /*proto*/
+static int __pyx_pw_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_19_max_bytes_to_index_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__set__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_19_max_bytes_to_index_2__set__(((struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *)__pyx_v_self), ((PyObject *)__pyx_v_value));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_19_max_bytes_to_index_2__set__(struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__set__", 0);
+  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 119, __pyx_L1_error)
+  __pyx_v_self->_max_bytes_to_index = __pyx_t_1;
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("breezy.bzr._groupcompress_pyx.DeltaIndex._max_bytes_to_index.__set__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError("self._index,self._source_infos cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_19__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_19__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_18__reduce_cython__(((struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_18__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__reduce_cython__", 0);
+
+  /* "(tree fragment)":2
+ * def __reduce_cython__(self):
+ *     raise TypeError("self._index,self._source_infos cannot be converted to a Python object for pickling")             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("self._index,self._source_infos cannot be converted to a Python object for pickling")
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__17, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __PYX_ERR(1, 2, __pyx_L1_error)
+
+  /* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError("self._index,self._source_infos cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("breezy.bzr._groupcompress_pyx.DeltaIndex.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError("self._index,self._source_infos cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError("self._index,self._source_infos cannot be converted to a Python object for pickling")
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_21__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
+static PyObject *__pyx_pw_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_21__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_20__setstate_cython__(((struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_20__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__setstate_cython__", 0);
+
+  /* "(tree fragment)":4
+ *     raise TypeError("self._index,self._source_infos cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("self._index,self._source_infos cannot be converted to a Python object for pickling")             # <<<<<<<<<<<<<<
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__18, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __PYX_ERR(1, 4, __pyx_L1_error)
+
+  /* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError("self._index,self._source_infos cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError("self._index,self._source_infos cannot be converted to a Python object for pickling")
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("breezy.bzr._groupcompress_pyx.DeltaIndex.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "breezy/bzr/_groupcompress_pyx.pyx":338
+ * 
+ * 
+ * def make_delta(source_bytes, target_bytes):             # <<<<<<<<<<<<<<
+ *     """Create a delta, this is a wrapper around DeltaIndex.make_delta."""
+ *     di = DeltaIndex(source_bytes)
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_6breezy_3bzr_18_groupcompress_pyx_5make_delta(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_6breezy_3bzr_18_groupcompress_pyx_4make_delta[] = "Create a delta, this is a wrapper around DeltaIndex.make_delta.";
+static PyMethodDef __pyx_mdef_6breezy_3bzr_18_groupcompress_pyx_5make_delta = {"make_delta", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_6breezy_3bzr_18_groupcompress_pyx_5make_delta, METH_VARARGS|METH_KEYWORDS, __pyx_doc_6breezy_3bzr_18_groupcompress_pyx_4make_delta};
+static PyObject *__pyx_pw_6breezy_3bzr_18_groupcompress_pyx_5make_delta(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_source_bytes = 0;
+  PyObject *__pyx_v_target_bytes = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("make_delta (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_source_bytes,&__pyx_n_s_target_bytes,0};
+    PyObject* values[2] = {0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_source_bytes)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_target_bytes)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("make_delta", 1, 2, 2, 1); __PYX_ERR(0, 338, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "make_delta") < 0)) __PYX_ERR(0, 338, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+    }
+    __pyx_v_source_bytes = values[0];
+    __pyx_v_target_bytes = values[1];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("make_delta", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 338, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("breezy.bzr._groupcompress_pyx.make_delta", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_6breezy_3bzr_18_groupcompress_pyx_4make_delta(__pyx_self, __pyx_v_source_bytes, __pyx_v_target_bytes);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_6breezy_3bzr_18_groupcompress_pyx_4make_delta(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_source_bytes, PyObject *__pyx_v_target_bytes) {
+  struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *__pyx_v_di = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("make_delta", 0);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":340
+ * def make_delta(source_bytes, target_bytes):
+ *     """Create a delta, this is a wrapper around DeltaIndex.make_delta."""
+ *     di = DeltaIndex(source_bytes)             # <<<<<<<<<<<<<<
+ *     return di.make_delta(target_bytes)
+ * 
+ */
+  __pyx_t_1 = __Pyx_PyObject_CallOneArg(((PyObject *)__pyx_ptype_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex), __pyx_v_source_bytes); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 340, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_di = ((struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":341
+ *     """Create a delta, this is a wrapper around DeltaIndex.make_delta."""
+ *     di = DeltaIndex(source_bytes)
+ *     return di.make_delta(target_bytes)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_di), __pyx_n_s_make_delta); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 341, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+    if (likely(__pyx_t_3)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+      __Pyx_INCREF(__pyx_t_3);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_2, function);
+    }
+  }
+  __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_3, __pyx_v_target_bytes) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_v_target_bytes);
+  __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 341, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":338
+ * 
+ * 
+ * def make_delta(source_bytes, target_bytes):             # <<<<<<<<<<<<<<
+ *     """Create a delta, this is a wrapper around DeltaIndex.make_delta."""
+ *     di = DeltaIndex(source_bytes)
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("breezy.bzr._groupcompress_pyx.make_delta", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_di);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "breezy/bzr/_groupcompress_pyx.pyx":344
+ * 
+ * 
+ * def apply_delta(source_bytes, delta_bytes):             # <<<<<<<<<<<<<<
+ *     """Apply a delta generated by make_delta to source_bytes."""
+ *     cdef char *source
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_6breezy_3bzr_18_groupcompress_pyx_7apply_delta(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_6breezy_3bzr_18_groupcompress_pyx_6apply_delta[] = "Apply a delta generated by make_delta to source_bytes.";
+static PyMethodDef __pyx_mdef_6breezy_3bzr_18_groupcompress_pyx_7apply_delta = {"apply_delta", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_6breezy_3bzr_18_groupcompress_pyx_7apply_delta, METH_VARARGS|METH_KEYWORDS, __pyx_doc_6breezy_3bzr_18_groupcompress_pyx_6apply_delta};
+static PyObject *__pyx_pw_6breezy_3bzr_18_groupcompress_pyx_7apply_delta(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_source_bytes = 0;
+  PyObject *__pyx_v_delta_bytes = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("apply_delta (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_source_bytes,&__pyx_n_s_delta_bytes,0};
+    PyObject* values[2] = {0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_source_bytes)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_delta_bytes)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("apply_delta", 1, 2, 2, 1); __PYX_ERR(0, 344, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "apply_delta") < 0)) __PYX_ERR(0, 344, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+    }
+    __pyx_v_source_bytes = values[0];
+    __pyx_v_delta_bytes = values[1];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("apply_delta", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 344, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("breezy.bzr._groupcompress_pyx.apply_delta", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_6breezy_3bzr_18_groupcompress_pyx_6apply_delta(__pyx_self, __pyx_v_source_bytes, __pyx_v_delta_bytes);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_6breezy_3bzr_18_groupcompress_pyx_6apply_delta(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_source_bytes, PyObject *__pyx_v_delta_bytes) {
+  char *__pyx_v_source;
+  Py_ssize_t __pyx_v_source_size;
+  char *__pyx_v_delta;
+  Py_ssize_t __pyx_v_delta_size;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  Py_ssize_t __pyx_t_3;
+  Py_UCS4 __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("apply_delta", 0);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":351
+ *     cdef Py_ssize_t delta_size
+ * 
+ *     if not PyBytes_CheckExact(source_bytes):             # <<<<<<<<<<<<<<
+ *         raise TypeError('source is not a bytestring')
+ *     if not PyBytes_CheckExact(delta_bytes):
+ */
+  __pyx_t_1 = ((!(PyBytes_CheckExact(__pyx_v_source_bytes) != 0)) != 0);
+  if (unlikely(__pyx_t_1)) {
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":352
+ * 
+ *     if not PyBytes_CheckExact(source_bytes):
+ *         raise TypeError('source is not a bytestring')             # <<<<<<<<<<<<<<
+ *     if not PyBytes_CheckExact(delta_bytes):
+ *         raise TypeError('delta is not a bytestring')
+ */
+    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__13, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 352, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __PYX_ERR(0, 352, __pyx_L1_error)
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":351
+ *     cdef Py_ssize_t delta_size
+ * 
+ *     if not PyBytes_CheckExact(source_bytes):             # <<<<<<<<<<<<<<
+ *         raise TypeError('source is not a bytestring')
+ *     if not PyBytes_CheckExact(delta_bytes):
+ */
+  }
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":353
+ *     if not PyBytes_CheckExact(source_bytes):
+ *         raise TypeError('source is not a bytestring')
+ *     if not PyBytes_CheckExact(delta_bytes):             # <<<<<<<<<<<<<<
+ *         raise TypeError('delta is not a bytestring')
+ *     source = PyBytes_AS_STRING(source_bytes)
+ */
+  __pyx_t_1 = ((!(PyBytes_CheckExact(__pyx_v_delta_bytes) != 0)) != 0);
+  if (unlikely(__pyx_t_1)) {
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":354
+ *         raise TypeError('source is not a bytestring')
+ *     if not PyBytes_CheckExact(delta_bytes):
+ *         raise TypeError('delta is not a bytestring')             # <<<<<<<<<<<<<<
+ *     source = PyBytes_AS_STRING(source_bytes)
+ *     source_size = PyBytes_GET_SIZE(source_bytes)
+ */
+    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__12, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 354, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __PYX_ERR(0, 354, __pyx_L1_error)
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":353
+ *     if not PyBytes_CheckExact(source_bytes):
+ *         raise TypeError('source is not a bytestring')
+ *     if not PyBytes_CheckExact(delta_bytes):             # <<<<<<<<<<<<<<
+ *         raise TypeError('delta is not a bytestring')
+ *     source = PyBytes_AS_STRING(source_bytes)
+ */
+  }
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":355
+ *     if not PyBytes_CheckExact(delta_bytes):
+ *         raise TypeError('delta is not a bytestring')
+ *     source = PyBytes_AS_STRING(source_bytes)             # <<<<<<<<<<<<<<
+ *     source_size = PyBytes_GET_SIZE(source_bytes)
+ *     delta = PyBytes_AS_STRING(delta_bytes)
+ */
+  __pyx_v_source = PyBytes_AS_STRING(__pyx_v_source_bytes);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":356
+ *         raise TypeError('delta is not a bytestring')
+ *     source = PyBytes_AS_STRING(source_bytes)
+ *     source_size = PyBytes_GET_SIZE(source_bytes)             # <<<<<<<<<<<<<<
+ *     delta = PyBytes_AS_STRING(delta_bytes)
+ *     delta_size = PyBytes_GET_SIZE(delta_bytes)
+ */
+  __pyx_v_source_size = PyBytes_GET_SIZE(__pyx_v_source_bytes);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":357
+ *     source = PyBytes_AS_STRING(source_bytes)
+ *     source_size = PyBytes_GET_SIZE(source_bytes)
+ *     delta = PyBytes_AS_STRING(delta_bytes)             # <<<<<<<<<<<<<<
+ *     delta_size = PyBytes_GET_SIZE(delta_bytes)
+ *     # Code taken from patch-delta.c, only brought here to give better error
+ */
+  __pyx_v_delta = PyBytes_AS_STRING(__pyx_v_delta_bytes);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":358
+ *     source_size = PyBytes_GET_SIZE(source_bytes)
+ *     delta = PyBytes_AS_STRING(delta_bytes)
+ *     delta_size = PyBytes_GET_SIZE(delta_bytes)             # <<<<<<<<<<<<<<
+ *     # Code taken from patch-delta.c, only brought here to give better error
+ *     # handling, and to avoid double allocating memory
+ */
+  __pyx_v_delta_size = PyBytes_GET_SIZE(__pyx_v_delta_bytes);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":361
+ *     # Code taken from patch-delta.c, only brought here to give better error
+ *     # handling, and to avoid double allocating memory
+ *     if (delta_size < DELTA_SIZE_MIN):             # <<<<<<<<<<<<<<
+ *         # XXX: Invalid delta block
+ *         raise RuntimeError('delta_size %d smaller than min delta size %d'
+ */
+  __pyx_t_1 = ((__pyx_v_delta_size < DELTA_SIZE_MIN) != 0);
+  if (unlikely(__pyx_t_1)) {
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":363
+ *     if (delta_size < DELTA_SIZE_MIN):
+ *         # XXX: Invalid delta block
+ *         raise RuntimeError('delta_size %d smaller than min delta size %d'             # <<<<<<<<<<<<<<
+ *                            % (delta_size, DELTA_SIZE_MIN))
+ * 
+ */
+    __pyx_t_2 = PyTuple_New(4); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 363, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = 0;
+    __pyx_t_4 = 127;
+    __Pyx_INCREF(__pyx_kp_u_delta_size);
+    __pyx_t_3 += 11;
+    __Pyx_GIVEREF(__pyx_kp_u_delta_size);
+    PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_kp_u_delta_size);
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":364
+ *         # XXX: Invalid delta block
+ *         raise RuntimeError('delta_size %d smaller than min delta size %d'
+ *                            % (delta_size, DELTA_SIZE_MIN))             # <<<<<<<<<<<<<<
+ * 
+ *     return _apply_delta(source, source_size, delta, delta_size)
+ */
+    __pyx_t_5 = __Pyx_PyUnicode_From_Py_ssize_t(__pyx_v_delta_size, 0, ' ', 'd'); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 364, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_3 += __Pyx_PyUnicode_GET_LENGTH(__pyx_t_5);
+    __Pyx_GIVEREF(__pyx_t_5);
+    PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_t_5);
+    __pyx_t_5 = 0;
+    __Pyx_INCREF(__pyx_kp_u_smaller_than_min_delta_size);
+    __pyx_t_3 += 29;
+    __Pyx_GIVEREF(__pyx_kp_u_smaller_than_min_delta_size);
+    PyTuple_SET_ITEM(__pyx_t_2, 2, __pyx_kp_u_smaller_than_min_delta_size);
+    __pyx_t_5 = __Pyx_PyUnicode_From_Py_ssize_t(DELTA_SIZE_MIN, 0, ' ', 'd'); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 364, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_3 += __Pyx_PyUnicode_GET_LENGTH(__pyx_t_5);
+    __Pyx_GIVEREF(__pyx_t_5);
+    PyTuple_SET_ITEM(__pyx_t_2, 3, __pyx_t_5);
+    __pyx_t_5 = 0;
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":363
+ *     if (delta_size < DELTA_SIZE_MIN):
+ *         # XXX: Invalid delta block
+ *         raise RuntimeError('delta_size %d smaller than min delta size %d'             # <<<<<<<<<<<<<<
+ *                            % (delta_size, DELTA_SIZE_MIN))
+ * 
+ */
+    __pyx_t_5 = __Pyx_PyUnicode_Join(__pyx_t_2, 4, __pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 363, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_builtin_RuntimeError, __pyx_t_5); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 363, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __PYX_ERR(0, 363, __pyx_L1_error)
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":361
+ *     # Code taken from patch-delta.c, only brought here to give better error
+ *     # handling, and to avoid double allocating memory
+ *     if (delta_size < DELTA_SIZE_MIN):             # <<<<<<<<<<<<<<
+ *         # XXX: Invalid delta block
+ *         raise RuntimeError('delta_size %d smaller than min delta size %d'
+ */
+  }
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":366
+ *                            % (delta_size, DELTA_SIZE_MIN))
+ * 
+ *     return _apply_delta(source, source_size, delta, delta_size)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2 = __pyx_f_6breezy_3bzr_18_groupcompress_pyx__apply_delta(__pyx_v_source, __pyx_v_source_size, __pyx_v_delta, __pyx_v_delta_size); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 366, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":344
+ * 
+ * 
+ * def apply_delta(source_bytes, delta_bytes):             # <<<<<<<<<<<<<<
+ *     """Apply a delta generated by make_delta to source_bytes."""
+ *     cdef char *source
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("breezy.bzr._groupcompress_pyx.apply_delta", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "breezy/bzr/_groupcompress_pyx.pyx":369
+ * 
+ * 
+ * cdef unsigned char *_decode_copy_instruction(unsigned char *data,             # <<<<<<<<<<<<<<
+ *     unsigned char cmd, unsigned int *offset,
+ *     unsigned int *length) nogil: # cannot_raise
+ */
+
+static unsigned char *__pyx_f_6breezy_3bzr_18_groupcompress_pyx__decode_copy_instruction(unsigned char *__pyx_v_data, unsigned char __pyx_v_cmd, unsigned int *__pyx_v_offset, unsigned int *__pyx_v_length) {
+  unsigned int __pyx_v_off;
+  unsigned int __pyx_v_size;
+  unsigned int __pyx_v_count;
+  unsigned char *__pyx_r;
+  int __pyx_t_1;
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":383
+ *     """
+ *     cdef unsigned int off, size, count
+ *     off = 0             # <<<<<<<<<<<<<<
+ *     size = 0
+ *     count = 0
+ */
+  __pyx_v_off = 0;
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":384
+ *     cdef unsigned int off, size, count
+ *     off = 0
+ *     size = 0             # <<<<<<<<<<<<<<
+ *     count = 0
+ *     if (cmd & 0x01):
+ */
+  __pyx_v_size = 0;
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":385
+ *     off = 0
+ *     size = 0
+ *     count = 0             # <<<<<<<<<<<<<<
+ *     if (cmd & 0x01):
+ *         off = data[count]
+ */
+  __pyx_v_count = 0;
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":386
+ *     size = 0
+ *     count = 0
+ *     if (cmd & 0x01):             # <<<<<<<<<<<<<<
+ *         off = data[count]
+ *         count = count + 1
+ */
+  __pyx_t_1 = ((__pyx_v_cmd & 0x01) != 0);
+  if (__pyx_t_1) {
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":387
+ *     count = 0
+ *     if (cmd & 0x01):
+ *         off = data[count]             # <<<<<<<<<<<<<<
+ *         count = count + 1
+ *     if (cmd & 0x02):
+ */
+    __pyx_v_off = (__pyx_v_data[__pyx_v_count]);
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":388
+ *     if (cmd & 0x01):
+ *         off = data[count]
+ *         count = count + 1             # <<<<<<<<<<<<<<
+ *     if (cmd & 0x02):
+ *         off = off | (data[count] << 8)
+ */
+    __pyx_v_count = (__pyx_v_count + 1);
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":386
+ *     size = 0
+ *     count = 0
+ *     if (cmd & 0x01):             # <<<<<<<<<<<<<<
+ *         off = data[count]
+ *         count = count + 1
+ */
+  }
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":389
+ *         off = data[count]
+ *         count = count + 1
+ *     if (cmd & 0x02):             # <<<<<<<<<<<<<<
+ *         off = off | (data[count] << 8)
+ *         count = count + 1
+ */
+  __pyx_t_1 = ((__pyx_v_cmd & 0x02) != 0);
+  if (__pyx_t_1) {
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":390
+ *         count = count + 1
+ *     if (cmd & 0x02):
+ *         off = off | (data[count] << 8)             # <<<<<<<<<<<<<<
+ *         count = count + 1
+ *     if (cmd & 0x04):
+ */
+    __pyx_v_off = (__pyx_v_off | ((__pyx_v_data[__pyx_v_count]) << 8));
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":391
+ *     if (cmd & 0x02):
+ *         off = off | (data[count] << 8)
+ *         count = count + 1             # <<<<<<<<<<<<<<
+ *     if (cmd & 0x04):
+ *         off = off | (data[count] << 16)
+ */
+    __pyx_v_count = (__pyx_v_count + 1);
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":389
+ *         off = data[count]
+ *         count = count + 1
+ *     if (cmd & 0x02):             # <<<<<<<<<<<<<<
+ *         off = off | (data[count] << 8)
+ *         count = count + 1
+ */
+  }
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":392
+ *         off = off | (data[count] << 8)
+ *         count = count + 1
+ *     if (cmd & 0x04):             # <<<<<<<<<<<<<<
+ *         off = off | (data[count] << 16)
+ *         count = count + 1
+ */
+  __pyx_t_1 = ((__pyx_v_cmd & 0x04) != 0);
+  if (__pyx_t_1) {
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":393
+ *         count = count + 1
+ *     if (cmd & 0x04):
+ *         off = off | (data[count] << 16)             # <<<<<<<<<<<<<<
+ *         count = count + 1
+ *     if (cmd & 0x08):
+ */
+    __pyx_v_off = (__pyx_v_off | ((__pyx_v_data[__pyx_v_count]) << 16));
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":394
+ *     if (cmd & 0x04):
+ *         off = off | (data[count] << 16)
+ *         count = count + 1             # <<<<<<<<<<<<<<
+ *     if (cmd & 0x08):
+ *         off = off | (data[count] << 24)
+ */
+    __pyx_v_count = (__pyx_v_count + 1);
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":392
+ *         off = off | (data[count] << 8)
+ *         count = count + 1
+ *     if (cmd & 0x04):             # <<<<<<<<<<<<<<
+ *         off = off | (data[count] << 16)
+ *         count = count + 1
+ */
+  }
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":395
+ *         off = off | (data[count] << 16)
+ *         count = count + 1
+ *     if (cmd & 0x08):             # <<<<<<<<<<<<<<
+ *         off = off | (data[count] << 24)
+ *         count = count + 1
+ */
+  __pyx_t_1 = ((__pyx_v_cmd & 0x08) != 0);
+  if (__pyx_t_1) {
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":396
+ *         count = count + 1
+ *     if (cmd & 0x08):
+ *         off = off | (data[count] << 24)             # <<<<<<<<<<<<<<
+ *         count = count + 1
+ *     if (cmd & 0x10):
+ */
+    __pyx_v_off = (__pyx_v_off | ((__pyx_v_data[__pyx_v_count]) << 24));
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":397
+ *     if (cmd & 0x08):
+ *         off = off | (data[count] << 24)
+ *         count = count + 1             # <<<<<<<<<<<<<<
+ *     if (cmd & 0x10):
+ *         size = data[count]
+ */
+    __pyx_v_count = (__pyx_v_count + 1);
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":395
+ *         off = off | (data[count] << 16)
+ *         count = count + 1
+ *     if (cmd & 0x08):             # <<<<<<<<<<<<<<
+ *         off = off | (data[count] << 24)
+ *         count = count + 1
+ */
+  }
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":398
+ *         off = off | (data[count] << 24)
+ *         count = count + 1
+ *     if (cmd & 0x10):             # <<<<<<<<<<<<<<
+ *         size = data[count]
+ *         count = count + 1
+ */
+  __pyx_t_1 = ((__pyx_v_cmd & 0x10) != 0);
+  if (__pyx_t_1) {
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":399
+ *         count = count + 1
+ *     if (cmd & 0x10):
+ *         size = data[count]             # <<<<<<<<<<<<<<
+ *         count = count + 1
+ *     if (cmd & 0x20):
+ */
+    __pyx_v_size = (__pyx_v_data[__pyx_v_count]);
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":400
+ *     if (cmd & 0x10):
+ *         size = data[count]
+ *         count = count + 1             # <<<<<<<<<<<<<<
+ *     if (cmd & 0x20):
+ *         size = size | (data[count] << 8)
+ */
+    __pyx_v_count = (__pyx_v_count + 1);
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":398
+ *         off = off | (data[count] << 24)
+ *         count = count + 1
+ *     if (cmd & 0x10):             # <<<<<<<<<<<<<<
+ *         size = data[count]
+ *         count = count + 1
+ */
+  }
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":401
+ *         size = data[count]
+ *         count = count + 1
+ *     if (cmd & 0x20):             # <<<<<<<<<<<<<<
+ *         size = size | (data[count] << 8)
+ *         count = count + 1
+ */
+  __pyx_t_1 = ((__pyx_v_cmd & 0x20) != 0);
+  if (__pyx_t_1) {
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":402
+ *         count = count + 1
+ *     if (cmd & 0x20):
+ *         size = size | (data[count] << 8)             # <<<<<<<<<<<<<<
+ *         count = count + 1
+ *     if (cmd & 0x40):
+ */
+    __pyx_v_size = (__pyx_v_size | ((__pyx_v_data[__pyx_v_count]) << 8));
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":403
+ *     if (cmd & 0x20):
+ *         size = size | (data[count] << 8)
+ *         count = count + 1             # <<<<<<<<<<<<<<
+ *     if (cmd & 0x40):
+ *         size = size | (data[count] << 16)
+ */
+    __pyx_v_count = (__pyx_v_count + 1);
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":401
+ *         size = data[count]
+ *         count = count + 1
+ *     if (cmd & 0x20):             # <<<<<<<<<<<<<<
+ *         size = size | (data[count] << 8)
+ *         count = count + 1
+ */
+  }
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":404
+ *         size = size | (data[count] << 8)
+ *         count = count + 1
+ *     if (cmd & 0x40):             # <<<<<<<<<<<<<<
+ *         size = size | (data[count] << 16)
+ *         count = count + 1
+ */
+  __pyx_t_1 = ((__pyx_v_cmd & 0x40) != 0);
+  if (__pyx_t_1) {
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":405
+ *         count = count + 1
+ *     if (cmd & 0x40):
+ *         size = size | (data[count] << 16)             # <<<<<<<<<<<<<<
+ *         count = count + 1
+ *     if (size == 0):
+ */
+    __pyx_v_size = (__pyx_v_size | ((__pyx_v_data[__pyx_v_count]) << 16));
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":406
+ *     if (cmd & 0x40):
+ *         size = size | (data[count] << 16)
+ *         count = count + 1             # <<<<<<<<<<<<<<
+ *     if (size == 0):
+ *         size = 0x10000
+ */
+    __pyx_v_count = (__pyx_v_count + 1);
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":404
+ *         size = size | (data[count] << 8)
+ *         count = count + 1
+ *     if (cmd & 0x40):             # <<<<<<<<<<<<<<
+ *         size = size | (data[count] << 16)
+ *         count = count + 1
+ */
+  }
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":407
+ *         size = size | (data[count] << 16)
+ *         count = count + 1
+ *     if (size == 0):             # <<<<<<<<<<<<<<
+ *         size = 0x10000
+ *     offset[0] = off
+ */
+  __pyx_t_1 = ((__pyx_v_size == 0) != 0);
+  if (__pyx_t_1) {
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":408
+ *         count = count + 1
+ *     if (size == 0):
+ *         size = 0x10000             # <<<<<<<<<<<<<<
+ *     offset[0] = off
+ *     length[0] = size
+ */
+    __pyx_v_size = 0x10000;
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":407
+ *         size = size | (data[count] << 16)
+ *         count = count + 1
+ *     if (size == 0):             # <<<<<<<<<<<<<<
+ *         size = 0x10000
+ *     offset[0] = off
+ */
+  }
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":409
+ *     if (size == 0):
+ *         size = 0x10000
+ *     offset[0] = off             # <<<<<<<<<<<<<<
+ *     length[0] = size
+ *     return data + count
+ */
+  (__pyx_v_offset[0]) = __pyx_v_off;
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":410
+ *         size = 0x10000
+ *     offset[0] = off
+ *     length[0] = size             # <<<<<<<<<<<<<<
+ *     return data + count
+ * 
+ */
+  (__pyx_v_length[0]) = __pyx_v_size;
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":411
+ *     offset[0] = off
+ *     length[0] = size
+ *     return data + count             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = (__pyx_v_data + __pyx_v_count);
+  goto __pyx_L0;
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":369
+ * 
+ * 
+ * cdef unsigned char *_decode_copy_instruction(unsigned char *data,             # <<<<<<<<<<<<<<
+ *     unsigned char cmd, unsigned int *offset,
+ *     unsigned int *length) nogil: # cannot_raise
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "breezy/bzr/_groupcompress_pyx.pyx":414
+ * 
+ * 
+ * cdef object _apply_delta(char *source, Py_ssize_t source_size,             # <<<<<<<<<<<<<<
+ *                          char *delta, Py_ssize_t delta_size):
+ *     """common functionality between apply_delta and apply_delta_to_source."""
+ */
+
+static PyObject *__pyx_f_6breezy_3bzr_18_groupcompress_pyx__apply_delta(char *__pyx_v_source, Py_ssize_t __pyx_v_source_size, char *__pyx_v_delta, Py_ssize_t __pyx_v_delta_size) {
+  unsigned char *__pyx_v_data;
+  unsigned char *__pyx_v_top;
+  unsigned char *__pyx_v_dst_buf;
+  unsigned char *__pyx_v_out;
+  unsigned char __pyx_v_cmd;
+  Py_ssize_t __pyx_v_size;
+  unsigned int __pyx_v_cp_off;
+  unsigned int __pyx_v_cp_size;
+  int __pyx_v_failed;
+  PyObject *__pyx_v_result = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  Py_ssize_t __pyx_t_4;
+  Py_UCS4 __pyx_t_5;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("_apply_delta", 0);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":426
+ *     cdef int failed
+ * 
+ *     data = <unsigned char *>delta             # <<<<<<<<<<<<<<
+ *     top = data + delta_size
+ * 
+ */
+  __pyx_v_data = ((unsigned char *)__pyx_v_delta);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":427
+ * 
+ *     data = <unsigned char *>delta
+ *     top = data + delta_size             # <<<<<<<<<<<<<<
+ * 
+ *     # now the result size
+ */
+  __pyx_v_top = (__pyx_v_data + __pyx_v_delta_size);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":430
+ * 
+ *     # now the result size
+ *     size = get_delta_hdr_size(&data, top)             # <<<<<<<<<<<<<<
+ *     result = PyBytes_FromStringAndSize(NULL, size)
+ *     dst_buf = <unsigned char*>PyBytes_AS_STRING(result)
+ */
+  __pyx_v_size = get_delta_hdr_size((&__pyx_v_data), __pyx_v_top);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":431
+ *     # now the result size
+ *     size = get_delta_hdr_size(&data, top)
+ *     result = PyBytes_FromStringAndSize(NULL, size)             # <<<<<<<<<<<<<<
+ *     dst_buf = <unsigned char*>PyBytes_AS_STRING(result)
+ * 
+ */
+  __pyx_t_1 = PyBytes_FromStringAndSize(NULL, __pyx_v_size); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 431, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_result = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":432
+ *     size = get_delta_hdr_size(&data, top)
+ *     result = PyBytes_FromStringAndSize(NULL, size)
+ *     dst_buf = <unsigned char*>PyBytes_AS_STRING(result)             # <<<<<<<<<<<<<<
+ * 
+ *     failed = 0
+ */
+  __pyx_v_dst_buf = ((unsigned char *)PyBytes_AS_STRING(__pyx_v_result));
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":434
+ *     dst_buf = <unsigned char*>PyBytes_AS_STRING(result)
+ * 
+ *     failed = 0             # <<<<<<<<<<<<<<
+ *     with nogil:
+ *         out = dst_buf
+ */
+  __pyx_v_failed = 0;
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":435
+ * 
+ *     failed = 0
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         out = dst_buf
+ *         while (data < top):
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      __Pyx_FastGIL_Remember();
+      #endif
+      /*try:*/ {
+
+        /* "breezy/bzr/_groupcompress_pyx.pyx":436
+ *     failed = 0
+ *     with nogil:
+ *         out = dst_buf             # <<<<<<<<<<<<<<
+ *         while (data < top):
+ *             cmd = data[0]
+ */
+        __pyx_v_out = __pyx_v_dst_buf;
+
+        /* "breezy/bzr/_groupcompress_pyx.pyx":437
+ *     with nogil:
+ *         out = dst_buf
+ *         while (data < top):             # <<<<<<<<<<<<<<
+ *             cmd = data[0]
+ *             data = data + 1
+ */
+        while (1) {
+          __pyx_t_2 = ((__pyx_v_data < __pyx_v_top) != 0);
+          if (!__pyx_t_2) break;
+
+          /* "breezy/bzr/_groupcompress_pyx.pyx":438
+ *         out = dst_buf
+ *         while (data < top):
+ *             cmd = data[0]             # <<<<<<<<<<<<<<
+ *             data = data + 1
+ *             if (cmd & 0x80):
+ */
+          __pyx_v_cmd = (__pyx_v_data[0]);
+
+          /* "breezy/bzr/_groupcompress_pyx.pyx":439
+ *         while (data < top):
+ *             cmd = data[0]
+ *             data = data + 1             # <<<<<<<<<<<<<<
+ *             if (cmd & 0x80):
+ *                 # Copy instruction
+ */
+          __pyx_v_data = (__pyx_v_data + 1);
+
+          /* "breezy/bzr/_groupcompress_pyx.pyx":440
+ *             cmd = data[0]
+ *             data = data + 1
+ *             if (cmd & 0x80):             # <<<<<<<<<<<<<<
+ *                 # Copy instruction
+ *                 data = _decode_copy_instruction(data, cmd, &cp_off, &cp_size)
+ */
+          __pyx_t_2 = ((__pyx_v_cmd & 0x80) != 0);
+          if (__pyx_t_2) {
+
+            /* "breezy/bzr/_groupcompress_pyx.pyx":442
+ *             if (cmd & 0x80):
+ *                 # Copy instruction
+ *                 data = _decode_copy_instruction(data, cmd, &cp_off, &cp_size)             # <<<<<<<<<<<<<<
+ *                 if (cp_off + cp_size < cp_size or
+ *                     cp_off + cp_size > <unsigned int>source_size or
+ */
+            __pyx_v_data = __pyx_f_6breezy_3bzr_18_groupcompress_pyx__decode_copy_instruction(__pyx_v_data, __pyx_v_cmd, (&__pyx_v_cp_off), (&__pyx_v_cp_size));
+
+            /* "breezy/bzr/_groupcompress_pyx.pyx":443
+ *                 # Copy instruction
+ *                 data = _decode_copy_instruction(data, cmd, &cp_off, &cp_size)
+ *                 if (cp_off + cp_size < cp_size or             # <<<<<<<<<<<<<<
+ *                     cp_off + cp_size > <unsigned int>source_size or
+ *                     cp_size > <unsigned int>size):
+ */
+            __pyx_t_3 = (((__pyx_v_cp_off + __pyx_v_cp_size) < __pyx_v_cp_size) != 0);
+            if (!__pyx_t_3) {
+            } else {
+              __pyx_t_2 = __pyx_t_3;
+              goto __pyx_L10_bool_binop_done;
+            }
+
+            /* "breezy/bzr/_groupcompress_pyx.pyx":444
+ *                 data = _decode_copy_instruction(data, cmd, &cp_off, &cp_size)
+ *                 if (cp_off + cp_size < cp_size or
+ *                     cp_off + cp_size > <unsigned int>source_size or             # <<<<<<<<<<<<<<
+ *                     cp_size > <unsigned int>size):
+ *                     failed = 1
+ */
+            __pyx_t_3 = (((__pyx_v_cp_off + __pyx_v_cp_size) > ((unsigned int)__pyx_v_source_size)) != 0);
+            if (!__pyx_t_3) {
+            } else {
+              __pyx_t_2 = __pyx_t_3;
+              goto __pyx_L10_bool_binop_done;
+            }
+
+            /* "breezy/bzr/_groupcompress_pyx.pyx":445
+ *                 if (cp_off + cp_size < cp_size or
+ *                     cp_off + cp_size > <unsigned int>source_size or
+ *                     cp_size > <unsigned int>size):             # <<<<<<<<<<<<<<
+ *                     failed = 1
+ *                     break
+ */
+            __pyx_t_3 = ((__pyx_v_cp_size > ((unsigned int)__pyx_v_size)) != 0);
+            __pyx_t_2 = __pyx_t_3;
+            __pyx_L10_bool_binop_done:;
+
+            /* "breezy/bzr/_groupcompress_pyx.pyx":443
+ *                 # Copy instruction
+ *                 data = _decode_copy_instruction(data, cmd, &cp_off, &cp_size)
+ *                 if (cp_off + cp_size < cp_size or             # <<<<<<<<<<<<<<
+ *                     cp_off + cp_size > <unsigned int>source_size or
+ *                     cp_size > <unsigned int>size):
+ */
+            if (__pyx_t_2) {
+
+              /* "breezy/bzr/_groupcompress_pyx.pyx":446
+ *                     cp_off + cp_size > <unsigned int>source_size or
+ *                     cp_size > <unsigned int>size):
+ *                     failed = 1             # <<<<<<<<<<<<<<
+ *                     break
+ *                 memcpy(out, source + cp_off, cp_size)
+ */
+              __pyx_v_failed = 1;
+
+              /* "breezy/bzr/_groupcompress_pyx.pyx":447
+ *                     cp_size > <unsigned int>size):
+ *                     failed = 1
+ *                     break             # <<<<<<<<<<<<<<
+ *                 memcpy(out, source + cp_off, cp_size)
+ *                 out = out + cp_size
+ */
+              goto __pyx_L7_break;
+
+              /* "breezy/bzr/_groupcompress_pyx.pyx":443
+ *                 # Copy instruction
+ *                 data = _decode_copy_instruction(data, cmd, &cp_off, &cp_size)
+ *                 if (cp_off + cp_size < cp_size or             # <<<<<<<<<<<<<<
+ *                     cp_off + cp_size > <unsigned int>source_size or
+ *                     cp_size > <unsigned int>size):
+ */
+            }
+
+            /* "breezy/bzr/_groupcompress_pyx.pyx":448
+ *                     failed = 1
+ *                     break
+ *                 memcpy(out, source + cp_off, cp_size)             # <<<<<<<<<<<<<<
+ *                 out = out + cp_size
+ *                 size = size - cp_size
+ */
+            (void)(memcpy(__pyx_v_out, (__pyx_v_source + __pyx_v_cp_off), __pyx_v_cp_size));
+
+            /* "breezy/bzr/_groupcompress_pyx.pyx":449
+ *                     break
+ *                 memcpy(out, source + cp_off, cp_size)
+ *                 out = out + cp_size             # <<<<<<<<<<<<<<
+ *                 size = size - cp_size
+ *             else:
+ */
+            __pyx_v_out = (__pyx_v_out + __pyx_v_cp_size);
+
+            /* "breezy/bzr/_groupcompress_pyx.pyx":450
+ *                 memcpy(out, source + cp_off, cp_size)
+ *                 out = out + cp_size
+ *                 size = size - cp_size             # <<<<<<<<<<<<<<
+ *             else:
+ *                 # Insert instruction
+ */
+            __pyx_v_size = (__pyx_v_size - __pyx_v_cp_size);
+
+            /* "breezy/bzr/_groupcompress_pyx.pyx":440
+ *             cmd = data[0]
+ *             data = data + 1
+ *             if (cmd & 0x80):             # <<<<<<<<<<<<<<
+ *                 # Copy instruction
+ *                 data = _decode_copy_instruction(data, cmd, &cp_off, &cp_size)
+ */
+            goto __pyx_L8;
+          }
+
+          /* "breezy/bzr/_groupcompress_pyx.pyx":453
+ *             else:
+ *                 # Insert instruction
+ *                 if cmd == 0:             # <<<<<<<<<<<<<<
+ *                     # cmd == 0 is reserved for future encoding
+ *                     # extensions. In the mean time we must fail when
+ */
+          /*else*/ {
+            __pyx_t_2 = ((__pyx_v_cmd == 0) != 0);
+            if (__pyx_t_2) {
+
+              /* "breezy/bzr/_groupcompress_pyx.pyx":457
+ *                     # extensions. In the mean time we must fail when
+ *                     # encountering them (might be data corruption).
+ *                     failed = 2             # <<<<<<<<<<<<<<
+ *                     break
+ *                 if cmd > size:
+ */
+              __pyx_v_failed = 2;
+
+              /* "breezy/bzr/_groupcompress_pyx.pyx":458
+ *                     # encountering them (might be data corruption).
+ *                     failed = 2
+ *                     break             # <<<<<<<<<<<<<<
+ *                 if cmd > size:
+ *                     failed = 3
+ */
+              goto __pyx_L7_break;
+
+              /* "breezy/bzr/_groupcompress_pyx.pyx":453
+ *             else:
+ *                 # Insert instruction
+ *                 if cmd == 0:             # <<<<<<<<<<<<<<
+ *                     # cmd == 0 is reserved for future encoding
+ *                     # extensions. In the mean time we must fail when
+ */
+            }
+
+            /* "breezy/bzr/_groupcompress_pyx.pyx":459
+ *                     failed = 2
+ *                     break
+ *                 if cmd > size:             # <<<<<<<<<<<<<<
+ *                     failed = 3
+ *                     break
+ */
+            __pyx_t_2 = ((__pyx_v_cmd > __pyx_v_size) != 0);
+            if (__pyx_t_2) {
+
+              /* "breezy/bzr/_groupcompress_pyx.pyx":460
+ *                     break
+ *                 if cmd > size:
+ *                     failed = 3             # <<<<<<<<<<<<<<
+ *                     break
+ *                 memcpy(out, data, cmd)
+ */
+              __pyx_v_failed = 3;
+
+              /* "breezy/bzr/_groupcompress_pyx.pyx":461
+ *                 if cmd > size:
+ *                     failed = 3
+ *                     break             # <<<<<<<<<<<<<<
+ *                 memcpy(out, data, cmd)
+ *                 out = out + cmd
+ */
+              goto __pyx_L7_break;
+
+              /* "breezy/bzr/_groupcompress_pyx.pyx":459
+ *                     failed = 2
+ *                     break
+ *                 if cmd > size:             # <<<<<<<<<<<<<<
+ *                     failed = 3
+ *                     break
+ */
+            }
+
+            /* "breezy/bzr/_groupcompress_pyx.pyx":462
+ *                     failed = 3
+ *                     break
+ *                 memcpy(out, data, cmd)             # <<<<<<<<<<<<<<
+ *                 out = out + cmd
+ *                 data = data + cmd
+ */
+            (void)(memcpy(__pyx_v_out, __pyx_v_data, __pyx_v_cmd));
+
+            /* "breezy/bzr/_groupcompress_pyx.pyx":463
+ *                     break
+ *                 memcpy(out, data, cmd)
+ *                 out = out + cmd             # <<<<<<<<<<<<<<
+ *                 data = data + cmd
+ *                 size = size - cmd
+ */
+            __pyx_v_out = (__pyx_v_out + __pyx_v_cmd);
+
+            /* "breezy/bzr/_groupcompress_pyx.pyx":464
+ *                 memcpy(out, data, cmd)
+ *                 out = out + cmd
+ *                 data = data + cmd             # <<<<<<<<<<<<<<
+ *                 size = size - cmd
+ *     if failed:
+ */
+            __pyx_v_data = (__pyx_v_data + __pyx_v_cmd);
+
+            /* "breezy/bzr/_groupcompress_pyx.pyx":465
+ *                 out = out + cmd
+ *                 data = data + cmd
+ *                 size = size - cmd             # <<<<<<<<<<<<<<
+ *     if failed:
+ *         if failed == 1:
+ */
+            __pyx_v_size = (__pyx_v_size - __pyx_v_cmd);
+          }
+          __pyx_L8:;
+        }
+        __pyx_L7_break:;
+      }
+
+      /* "breezy/bzr/_groupcompress_pyx.pyx":435
+ * 
+ *     failed = 0
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         out = dst_buf
+ *         while (data < top):
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          __Pyx_FastGIL_Forget();
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L5;
+        }
+        __pyx_L5:;
+      }
+  }
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":466
+ *                 data = data + cmd
+ *                 size = size - cmd
+ *     if failed:             # <<<<<<<<<<<<<<
+ *         if failed == 1:
+ *             raise ValueError('Something wrong with:'
+ */
+  __pyx_t_2 = (__pyx_v_failed != 0);
+  if (__pyx_t_2) {
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":467
+ *                 size = size - cmd
+ *     if failed:
+ *         if failed == 1:             # <<<<<<<<<<<<<<
+ *             raise ValueError('Something wrong with:'
+ *                 ' cp_off = %s, cp_size = %s'
+ */
+    switch (__pyx_v_failed) {
+      case 1:
+
+      /* "breezy/bzr/_groupcompress_pyx.pyx":468
+ *     if failed:
+ *         if failed == 1:
+ *             raise ValueError('Something wrong with:'             # <<<<<<<<<<<<<<
+ *                 ' cp_off = %s, cp_size = %s'
+ *                 ' source_size = %s, size = %s'
+ */
+      __pyx_t_1 = PyTuple_New(8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 468, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __pyx_t_4 = 0;
+      __pyx_t_5 = 127;
+      __Pyx_INCREF(__pyx_kp_u_Something_wrong_with_cp_off);
+      __pyx_t_4 += 31;
+      __Pyx_GIVEREF(__pyx_kp_u_Something_wrong_with_cp_off);
+      PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_kp_u_Something_wrong_with_cp_off);
+
+      /* "breezy/bzr/_groupcompress_pyx.pyx":471
+ *                 ' cp_off = %s, cp_size = %s'
+ *                 ' source_size = %s, size = %s'
+ *                 % (cp_off, cp_size, source_size, size))             # <<<<<<<<<<<<<<
+ *         elif failed == 2:
+ *             raise ValueError('Got delta opcode: 0, not supported')
+ */
+      __pyx_t_6 = __Pyx_PyUnicode_From_unsigned_int(__pyx_v_cp_off, 0, ' ', 'd'); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 471, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __pyx_t_4 += __Pyx_PyUnicode_GET_LENGTH(__pyx_t_6);
+      __Pyx_GIVEREF(__pyx_t_6);
+      PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_t_6);
+      __pyx_t_6 = 0;
+      __Pyx_INCREF(__pyx_kp_u_cp_size);
+      __pyx_t_4 += 12;
+      __Pyx_GIVEREF(__pyx_kp_u_cp_size);
+      PyTuple_SET_ITEM(__pyx_t_1, 2, __pyx_kp_u_cp_size);
+      __pyx_t_6 = __Pyx_PyUnicode_From_unsigned_int(__pyx_v_cp_size, 0, ' ', 'd'); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 471, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __pyx_t_4 += __Pyx_PyUnicode_GET_LENGTH(__pyx_t_6);
+      __Pyx_GIVEREF(__pyx_t_6);
+      PyTuple_SET_ITEM(__pyx_t_1, 3, __pyx_t_6);
+      __pyx_t_6 = 0;
+      __Pyx_INCREF(__pyx_kp_u_source_size);
+      __pyx_t_4 += 15;
+      __Pyx_GIVEREF(__pyx_kp_u_source_size);
+      PyTuple_SET_ITEM(__pyx_t_1, 4, __pyx_kp_u_source_size);
+      __pyx_t_6 = __Pyx_PyUnicode_From_Py_ssize_t(__pyx_v_source_size, 0, ' ', 'd'); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 471, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __pyx_t_4 += __Pyx_PyUnicode_GET_LENGTH(__pyx_t_6);
+      __Pyx_GIVEREF(__pyx_t_6);
+      PyTuple_SET_ITEM(__pyx_t_1, 5, __pyx_t_6);
+      __pyx_t_6 = 0;
+      __Pyx_INCREF(__pyx_kp_u_size);
+      __pyx_t_4 += 9;
+      __Pyx_GIVEREF(__pyx_kp_u_size);
+      PyTuple_SET_ITEM(__pyx_t_1, 6, __pyx_kp_u_size);
+      __pyx_t_6 = __Pyx_PyUnicode_From_Py_ssize_t(__pyx_v_size, 0, ' ', 'd'); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 471, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __pyx_t_4 += __Pyx_PyUnicode_GET_LENGTH(__pyx_t_6);
+      __Pyx_GIVEREF(__pyx_t_6);
+      PyTuple_SET_ITEM(__pyx_t_1, 7, __pyx_t_6);
+      __pyx_t_6 = 0;
+
+      /* "breezy/bzr/_groupcompress_pyx.pyx":468
+ *     if failed:
+ *         if failed == 1:
+ *             raise ValueError('Something wrong with:'             # <<<<<<<<<<<<<<
+ *                 ' cp_off = %s, cp_size = %s'
+ *                 ' source_size = %s, size = %s'
+ */
+      __pyx_t_6 = __Pyx_PyUnicode_Join(__pyx_t_1, 8, __pyx_t_4, __pyx_t_5); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 468, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_builtin_ValueError, __pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 468, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __PYX_ERR(0, 468, __pyx_L1_error)
+
+      /* "breezy/bzr/_groupcompress_pyx.pyx":467
+ *                 size = size - cmd
+ *     if failed:
+ *         if failed == 1:             # <<<<<<<<<<<<<<
+ *             raise ValueError('Something wrong with:'
+ *                 ' cp_off = %s, cp_size = %s'
+ */
+      break;
+      case 2:
+
+      /* "breezy/bzr/_groupcompress_pyx.pyx":473
+ *                 % (cp_off, cp_size, source_size, size))
+ *         elif failed == 2:
+ *             raise ValueError('Got delta opcode: 0, not supported')             # <<<<<<<<<<<<<<
+ *         elif failed == 3:
+ *             raise ValueError('Insert instruction longer than remaining'
+ */
+      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__19, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 473, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __PYX_ERR(0, 473, __pyx_L1_error)
+
+      /* "breezy/bzr/_groupcompress_pyx.pyx":472
+ *                 ' source_size = %s, size = %s'
+ *                 % (cp_off, cp_size, source_size, size))
+ *         elif failed == 2:             # <<<<<<<<<<<<<<
+ *             raise ValueError('Got delta opcode: 0, not supported')
+ *         elif failed == 3:
+ */
+      break;
+      case 3:
+
+      /* "breezy/bzr/_groupcompress_pyx.pyx":475
+ *             raise ValueError('Got delta opcode: 0, not supported')
+ *         elif failed == 3:
+ *             raise ValueError('Insert instruction longer than remaining'             # <<<<<<<<<<<<<<
+ *                 ' bytes: %d > %d' % (cmd, size))
+ * 
+ */
+      __pyx_t_1 = PyTuple_New(4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 475, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __pyx_t_4 = 0;
+      __pyx_t_5 = 127;
+      __Pyx_INCREF(__pyx_kp_u_Insert_instruction_longer_than_r);
+      __pyx_t_4 += 48;
+      __Pyx_GIVEREF(__pyx_kp_u_Insert_instruction_longer_than_r);
+      PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_kp_u_Insert_instruction_longer_than_r);
+
+      /* "breezy/bzr/_groupcompress_pyx.pyx":476
+ *         elif failed == 3:
+ *             raise ValueError('Insert instruction longer than remaining'
+ *                 ' bytes: %d > %d' % (cmd, size))             # <<<<<<<<<<<<<<
+ * 
+ *     # sanity check
+ */
+      __pyx_t_6 = __Pyx_PyUnicode_From_unsigned_char(__pyx_v_cmd, 0, ' ', 'd'); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 476, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __pyx_t_4 += __Pyx_PyUnicode_GET_LENGTH(__pyx_t_6);
+      __Pyx_GIVEREF(__pyx_t_6);
+      PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_t_6);
+      __pyx_t_6 = 0;
+      __Pyx_INCREF(__pyx_kp_u__20);
+      __pyx_t_4 += 3;
+      __Pyx_GIVEREF(__pyx_kp_u__20);
+      PyTuple_SET_ITEM(__pyx_t_1, 2, __pyx_kp_u__20);
+      __pyx_t_6 = __Pyx_PyUnicode_From_Py_ssize_t(__pyx_v_size, 0, ' ', 'd'); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 476, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __pyx_t_4 += __Pyx_PyUnicode_GET_LENGTH(__pyx_t_6);
+      __Pyx_GIVEREF(__pyx_t_6);
+      PyTuple_SET_ITEM(__pyx_t_1, 3, __pyx_t_6);
+      __pyx_t_6 = 0;
+
+      /* "breezy/bzr/_groupcompress_pyx.pyx":475
+ *             raise ValueError('Got delta opcode: 0, not supported')
+ *         elif failed == 3:
+ *             raise ValueError('Insert instruction longer than remaining'             # <<<<<<<<<<<<<<
+ *                 ' bytes: %d > %d' % (cmd, size))
+ * 
+ */
+      __pyx_t_6 = __Pyx_PyUnicode_Join(__pyx_t_1, 4, __pyx_t_4, __pyx_t_5); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 475, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_builtin_ValueError, __pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 475, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __PYX_ERR(0, 475, __pyx_L1_error)
+
+      /* "breezy/bzr/_groupcompress_pyx.pyx":474
+ *         elif failed == 2:
+ *             raise ValueError('Got delta opcode: 0, not supported')
+ *         elif failed == 3:             # <<<<<<<<<<<<<<
+ *             raise ValueError('Insert instruction longer than remaining'
+ *                 ' bytes: %d > %d' % (cmd, size))
+ */
+      break;
+      default: break;
+    }
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":466
+ *                 data = data + cmd
+ *                 size = size - cmd
+ *     if failed:             # <<<<<<<<<<<<<<
+ *         if failed == 1:
+ *             raise ValueError('Something wrong with:'
+ */
+  }
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":479
+ * 
+ *     # sanity check
+ *     if (data != top or size != 0):             # <<<<<<<<<<<<<<
+ *         raise RuntimeError('Did not extract the number of bytes we expected'
+ *             ' we were left with %d bytes in "size", and top - data = %d'
+ */
+  __pyx_t_3 = ((__pyx_v_data != __pyx_v_top) != 0);
+  if (!__pyx_t_3) {
+  } else {
+    __pyx_t_2 = __pyx_t_3;
+    goto __pyx_L17_bool_binop_done;
+  }
+  __pyx_t_3 = ((__pyx_v_size != 0) != 0);
+  __pyx_t_2 = __pyx_t_3;
+  __pyx_L17_bool_binop_done:;
+  if (unlikely(__pyx_t_2)) {
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":480
+ *     # sanity check
+ *     if (data != top or size != 0):
+ *         raise RuntimeError('Did not extract the number of bytes we expected'             # <<<<<<<<<<<<<<
+ *             ' we were left with %d bytes in "size", and top - data = %d'
+ *             % (size, <int>(top - data)))
+ */
+    __pyx_t_1 = PyTuple_New(4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 480, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_4 = 0;
+    __pyx_t_5 = 127;
+    __Pyx_INCREF(__pyx_kp_u_Did_not_extract_the_number_of_by);
+    __pyx_t_4 += 66;
+    __Pyx_GIVEREF(__pyx_kp_u_Did_not_extract_the_number_of_by);
+    PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_kp_u_Did_not_extract_the_number_of_by);
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":482
+ *         raise RuntimeError('Did not extract the number of bytes we expected'
+ *             ' we were left with %d bytes in "size", and top - data = %d'
+ *             % (size, <int>(top - data)))             # <<<<<<<<<<<<<<
+ * 
+ *     # *dst_size = out - dst_buf;
+ */
+    __pyx_t_6 = __Pyx_PyUnicode_From_Py_ssize_t(__pyx_v_size, 0, ' ', 'd'); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 482, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_4 += __Pyx_PyUnicode_GET_LENGTH(__pyx_t_6);
+    __Pyx_GIVEREF(__pyx_t_6);
+    PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_t_6);
+    __pyx_t_6 = 0;
+    __Pyx_INCREF(__pyx_kp_u_bytes_in_size_and_top_data);
+    __pyx_t_4 += 35;
+    __Pyx_GIVEREF(__pyx_kp_u_bytes_in_size_and_top_data);
+    PyTuple_SET_ITEM(__pyx_t_1, 2, __pyx_kp_u_bytes_in_size_and_top_data);
+    __pyx_t_6 = __Pyx_PyUnicode_From_int(((int)(__pyx_v_top - __pyx_v_data)), 0, ' ', 'd'); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 482, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_4 += __Pyx_PyUnicode_GET_LENGTH(__pyx_t_6);
+    __Pyx_GIVEREF(__pyx_t_6);
+    PyTuple_SET_ITEM(__pyx_t_1, 3, __pyx_t_6);
+    __pyx_t_6 = 0;
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":480
+ *     # sanity check
+ *     if (data != top or size != 0):
+ *         raise RuntimeError('Did not extract the number of bytes we expected'             # <<<<<<<<<<<<<<
+ *             ' we were left with %d bytes in "size", and top - data = %d'
+ *             % (size, <int>(top - data)))
+ */
+    __pyx_t_6 = __Pyx_PyUnicode_Join(__pyx_t_1, 4, __pyx_t_4, __pyx_t_5); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 480, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_builtin_RuntimeError, __pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 480, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __PYX_ERR(0, 480, __pyx_L1_error)
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":479
+ * 
+ *     # sanity check
+ *     if (data != top or size != 0):             # <<<<<<<<<<<<<<
+ *         raise RuntimeError('Did not extract the number of bytes we expected'
+ *             ' we were left with %d bytes in "size", and top - data = %d'
+ */
+  }
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":485
+ * 
+ *     # *dst_size = out - dst_buf;
+ *     if (out - dst_buf) != PyBytes_GET_SIZE(result):             # <<<<<<<<<<<<<<
+ *         raise RuntimeError('Number of bytes extracted did not match the'
+ *             ' size encoded in the delta header.')
+ */
+  __pyx_t_2 = (((__pyx_v_out - __pyx_v_dst_buf) != PyBytes_GET_SIZE(__pyx_v_result)) != 0);
+  if (unlikely(__pyx_t_2)) {
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":486
+ *     # *dst_size = out - dst_buf;
+ *     if (out - dst_buf) != PyBytes_GET_SIZE(result):
+ *         raise RuntimeError('Number of bytes extracted did not match the'             # <<<<<<<<<<<<<<
+ *             ' size encoded in the delta header.')
+ *     return result
+ */
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_RuntimeError, __pyx_tuple__21, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 486, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __PYX_ERR(0, 486, __pyx_L1_error)
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":485
+ * 
+ *     # *dst_size = out - dst_buf;
+ *     if (out - dst_buf) != PyBytes_GET_SIZE(result):             # <<<<<<<<<<<<<<
+ *         raise RuntimeError('Number of bytes extracted did not match the'
+ *             ' size encoded in the delta header.')
+ */
+  }
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":488
+ *         raise RuntimeError('Number of bytes extracted did not match the'
+ *             ' size encoded in the delta header.')
+ *     return result             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_result);
+  __pyx_r = __pyx_v_result;
+  goto __pyx_L0;
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":414
+ * 
+ * 
+ * cdef object _apply_delta(char *source, Py_ssize_t source_size,             # <<<<<<<<<<<<<<
+ *                          char *delta, Py_ssize_t delta_size):
+ *     """common functionality between apply_delta and apply_delta_to_source."""
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("breezy.bzr._groupcompress_pyx._apply_delta", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_result);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "breezy/bzr/_groupcompress_pyx.pyx":491
+ * 
+ * 
+ * def apply_delta_to_source(source, delta_start, delta_end):             # <<<<<<<<<<<<<<
+ *     """Extract a delta from source bytes, and apply it."""
+ *     cdef char *c_source
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_6breezy_3bzr_18_groupcompress_pyx_9apply_delta_to_source(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_6breezy_3bzr_18_groupcompress_pyx_8apply_delta_to_source[] = "Extract a delta from source bytes, and apply it.";
+static PyMethodDef __pyx_mdef_6breezy_3bzr_18_groupcompress_pyx_9apply_delta_to_source = {"apply_delta_to_source", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_6breezy_3bzr_18_groupcompress_pyx_9apply_delta_to_source, METH_VARARGS|METH_KEYWORDS, __pyx_doc_6breezy_3bzr_18_groupcompress_pyx_8apply_delta_to_source};
+static PyObject *__pyx_pw_6breezy_3bzr_18_groupcompress_pyx_9apply_delta_to_source(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_source = 0;
+  PyObject *__pyx_v_delta_start = 0;
+  PyObject *__pyx_v_delta_end = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("apply_delta_to_source (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_source,&__pyx_n_s_delta_start,&__pyx_n_s_delta_end,0};
+    PyObject* values[3] = {0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_source)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_delta_start)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("apply_delta_to_source", 1, 3, 3, 1); __PYX_ERR(0, 491, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_delta_end)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("apply_delta_to_source", 1, 3, 3, 2); __PYX_ERR(0, 491, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "apply_delta_to_source") < 0)) __PYX_ERR(0, 491, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+    }
+    __pyx_v_source = values[0];
+    __pyx_v_delta_start = values[1];
+    __pyx_v_delta_end = values[2];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("apply_delta_to_source", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 491, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("breezy.bzr._groupcompress_pyx.apply_delta_to_source", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_6breezy_3bzr_18_groupcompress_pyx_8apply_delta_to_source(__pyx_self, __pyx_v_source, __pyx_v_delta_start, __pyx_v_delta_end);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_6breezy_3bzr_18_groupcompress_pyx_8apply_delta_to_source(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_source, PyObject *__pyx_v_delta_start, PyObject *__pyx_v_delta_end) {
+  char *__pyx_v_c_source;
+  Py_ssize_t __pyx_v_c_source_size;
+  char *__pyx_v_c_delta;
+  Py_ssize_t __pyx_v_c_delta_size;
+  Py_ssize_t __pyx_v_c_delta_start;
+  Py_ssize_t __pyx_v_c_delta_end;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  Py_ssize_t __pyx_t_3;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("apply_delta_to_source", 0);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":499
+ *     cdef Py_ssize_t c_delta_start, c_delta_end
+ * 
+ *     if not PyBytes_CheckExact(source):             # <<<<<<<<<<<<<<
+ *         raise TypeError('source is not a str')
+ *     c_source_size = PyBytes_GET_SIZE(source)
+ */
+  __pyx_t_1 = ((!(PyBytes_CheckExact(__pyx_v_source) != 0)) != 0);
+  if (unlikely(__pyx_t_1)) {
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":500
+ * 
+ *     if not PyBytes_CheckExact(source):
+ *         raise TypeError('source is not a str')             # <<<<<<<<<<<<<<
+ *     c_source_size = PyBytes_GET_SIZE(source)
+ *     c_delta_start = delta_start
+ */
+    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__22, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 500, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __PYX_ERR(0, 500, __pyx_L1_error)
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":499
+ *     cdef Py_ssize_t c_delta_start, c_delta_end
+ * 
+ *     if not PyBytes_CheckExact(source):             # <<<<<<<<<<<<<<
+ *         raise TypeError('source is not a str')
+ *     c_source_size = PyBytes_GET_SIZE(source)
+ */
+  }
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":501
+ *     if not PyBytes_CheckExact(source):
+ *         raise TypeError('source is not a str')
+ *     c_source_size = PyBytes_GET_SIZE(source)             # <<<<<<<<<<<<<<
+ *     c_delta_start = delta_start
+ *     c_delta_end = delta_end
+ */
+  __pyx_v_c_source_size = PyBytes_GET_SIZE(__pyx_v_source);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":502
+ *         raise TypeError('source is not a str')
+ *     c_source_size = PyBytes_GET_SIZE(source)
+ *     c_delta_start = delta_start             # <<<<<<<<<<<<<<
+ *     c_delta_end = delta_end
+ *     if c_delta_start >= c_source_size:
+ */
+  __pyx_t_3 = __Pyx_PyIndex_AsSsize_t(__pyx_v_delta_start); if (unlikely((__pyx_t_3 == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 502, __pyx_L1_error)
+  __pyx_v_c_delta_start = __pyx_t_3;
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":503
+ *     c_source_size = PyBytes_GET_SIZE(source)
+ *     c_delta_start = delta_start
+ *     c_delta_end = delta_end             # <<<<<<<<<<<<<<
+ *     if c_delta_start >= c_source_size:
+ *         raise ValueError('delta starts after source')
+ */
+  __pyx_t_3 = __Pyx_PyIndex_AsSsize_t(__pyx_v_delta_end); if (unlikely((__pyx_t_3 == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 503, __pyx_L1_error)
+  __pyx_v_c_delta_end = __pyx_t_3;
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":504
+ *     c_delta_start = delta_start
+ *     c_delta_end = delta_end
+ *     if c_delta_start >= c_source_size:             # <<<<<<<<<<<<<<
+ *         raise ValueError('delta starts after source')
+ *     if c_delta_end > c_source_size:
+ */
+  __pyx_t_1 = ((__pyx_v_c_delta_start >= __pyx_v_c_source_size) != 0);
+  if (unlikely(__pyx_t_1)) {
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":505
+ *     c_delta_end = delta_end
+ *     if c_delta_start >= c_source_size:
+ *         raise ValueError('delta starts after source')             # <<<<<<<<<<<<<<
+ *     if c_delta_end > c_source_size:
+ *         raise ValueError('delta ends after source')
+ */
+    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__23, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 505, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __PYX_ERR(0, 505, __pyx_L1_error)
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":504
+ *     c_delta_start = delta_start
+ *     c_delta_end = delta_end
+ *     if c_delta_start >= c_source_size:             # <<<<<<<<<<<<<<
+ *         raise ValueError('delta starts after source')
+ *     if c_delta_end > c_source_size:
+ */
+  }
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":506
+ *     if c_delta_start >= c_source_size:
+ *         raise ValueError('delta starts after source')
+ *     if c_delta_end > c_source_size:             # <<<<<<<<<<<<<<
+ *         raise ValueError('delta ends after source')
+ *     if c_delta_start >= c_delta_end:
+ */
+  __pyx_t_1 = ((__pyx_v_c_delta_end > __pyx_v_c_source_size) != 0);
+  if (unlikely(__pyx_t_1)) {
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":507
+ *         raise ValueError('delta starts after source')
+ *     if c_delta_end > c_source_size:
+ *         raise ValueError('delta ends after source')             # <<<<<<<<<<<<<<
+ *     if c_delta_start >= c_delta_end:
+ *         raise ValueError('delta starts after it ends')
+ */
+    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__24, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 507, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __PYX_ERR(0, 507, __pyx_L1_error)
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":506
+ *     if c_delta_start >= c_source_size:
+ *         raise ValueError('delta starts after source')
+ *     if c_delta_end > c_source_size:             # <<<<<<<<<<<<<<
+ *         raise ValueError('delta ends after source')
+ *     if c_delta_start >= c_delta_end:
+ */
+  }
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":508
+ *     if c_delta_end > c_source_size:
+ *         raise ValueError('delta ends after source')
+ *     if c_delta_start >= c_delta_end:             # <<<<<<<<<<<<<<
+ *         raise ValueError('delta starts after it ends')
+ * 
+ */
+  __pyx_t_1 = ((__pyx_v_c_delta_start >= __pyx_v_c_delta_end) != 0);
+  if (unlikely(__pyx_t_1)) {
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":509
+ *         raise ValueError('delta ends after source')
+ *     if c_delta_start >= c_delta_end:
+ *         raise ValueError('delta starts after it ends')             # <<<<<<<<<<<<<<
+ * 
+ *     c_delta_size = c_delta_end - c_delta_start
+ */
+    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__25, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 509, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __PYX_ERR(0, 509, __pyx_L1_error)
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":508
+ *     if c_delta_end > c_source_size:
+ *         raise ValueError('delta ends after source')
+ *     if c_delta_start >= c_delta_end:             # <<<<<<<<<<<<<<
+ *         raise ValueError('delta starts after it ends')
+ * 
+ */
+  }
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":511
+ *         raise ValueError('delta starts after it ends')
+ * 
+ *     c_delta_size = c_delta_end - c_delta_start             # <<<<<<<<<<<<<<
+ *     c_source = PyBytes_AS_STRING(source)
+ *     c_delta = c_source + c_delta_start
+ */
+  __pyx_v_c_delta_size = (__pyx_v_c_delta_end - __pyx_v_c_delta_start);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":512
+ * 
+ *     c_delta_size = c_delta_end - c_delta_start
+ *     c_source = PyBytes_AS_STRING(source)             # <<<<<<<<<<<<<<
+ *     c_delta = c_source + c_delta_start
+ *     # We don't use source_size, because we know the delta should not refer to
+ */
+  __pyx_v_c_source = PyBytes_AS_STRING(__pyx_v_source);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":513
+ *     c_delta_size = c_delta_end - c_delta_start
+ *     c_source = PyBytes_AS_STRING(source)
+ *     c_delta = c_source + c_delta_start             # <<<<<<<<<<<<<<
+ *     # We don't use source_size, because we know the delta should not refer to
+ *     # any bytes after it starts
+ */
+  __pyx_v_c_delta = (__pyx_v_c_source + __pyx_v_c_delta_start);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":516
+ *     # We don't use source_size, because we know the delta should not refer to
+ *     # any bytes after it starts
+ *     return _apply_delta(c_source, c_delta_start, c_delta, c_delta_size)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2 = __pyx_f_6breezy_3bzr_18_groupcompress_pyx__apply_delta(__pyx_v_c_source, __pyx_v_c_delta_start, __pyx_v_c_delta, __pyx_v_c_delta_size); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 516, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":491
+ * 
+ * 
+ * def apply_delta_to_source(source, delta_start, delta_end):             # <<<<<<<<<<<<<<
+ *     """Extract a delta from source bytes, and apply it."""
+ *     cdef char *c_source
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("breezy.bzr._groupcompress_pyx.apply_delta_to_source", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "breezy/bzr/_groupcompress_pyx.pyx":519
+ * 
+ * 
+ * def encode_base128_int(val):             # <<<<<<<<<<<<<<
+ *     """Convert an integer into a 7-bit lsb encoding."""
+ *     cdef unsigned int c_val
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_6breezy_3bzr_18_groupcompress_pyx_11encode_base128_int(PyObject *__pyx_self, PyObject *__pyx_v_val); /*proto*/
+static char __pyx_doc_6breezy_3bzr_18_groupcompress_pyx_10encode_base128_int[] = "Convert an integer into a 7-bit lsb encoding.";
+static PyMethodDef __pyx_mdef_6breezy_3bzr_18_groupcompress_pyx_11encode_base128_int = {"encode_base128_int", (PyCFunction)__pyx_pw_6breezy_3bzr_18_groupcompress_pyx_11encode_base128_int, METH_O, __pyx_doc_6breezy_3bzr_18_groupcompress_pyx_10encode_base128_int};
+static PyObject *__pyx_pw_6breezy_3bzr_18_groupcompress_pyx_11encode_base128_int(PyObject *__pyx_self, PyObject *__pyx_v_val) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("encode_base128_int (wrapper)", 0);
+  __pyx_r = __pyx_pf_6breezy_3bzr_18_groupcompress_pyx_10encode_base128_int(__pyx_self, ((PyObject *)__pyx_v_val));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_6breezy_3bzr_18_groupcompress_pyx_10encode_base128_int(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_val) {
+  unsigned int __pyx_v_c_val;
+  Py_ssize_t __pyx_v_count;
+  unsigned char __pyx_v_c_bytes[8];
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  unsigned int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("encode_base128_int", 0);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":526
+ *     cdef unsigned char c_bytes[8] # max size for 32-bit int is 5 bytes
+ * 
+ *     c_val = val             # <<<<<<<<<<<<<<
+ *     count = 0
+ *     while c_val >= 0x80 and count < 8:
+ */
+  __pyx_t_1 = __Pyx_PyInt_As_unsigned_int(__pyx_v_val); if (unlikely((__pyx_t_1 == (unsigned int)-1) && PyErr_Occurred())) __PYX_ERR(0, 526, __pyx_L1_error)
+  __pyx_v_c_val = __pyx_t_1;
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":527
+ * 
+ *     c_val = val
+ *     count = 0             # <<<<<<<<<<<<<<
+ *     while c_val >= 0x80 and count < 8:
+ *         c_bytes[count] = <unsigned char>((c_val | 0x80) & 0xFF)
+ */
+  __pyx_v_count = 0;
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":528
+ *     c_val = val
+ *     count = 0
+ *     while c_val >= 0x80 and count < 8:             # <<<<<<<<<<<<<<
+ *         c_bytes[count] = <unsigned char>((c_val | 0x80) & 0xFF)
+ *         c_val = c_val >> 7
+ */
+  while (1) {
+    __pyx_t_3 = ((__pyx_v_c_val >= 0x80) != 0);
+    if (__pyx_t_3) {
+    } else {
+      __pyx_t_2 = __pyx_t_3;
+      goto __pyx_L5_bool_binop_done;
+    }
+    __pyx_t_3 = ((__pyx_v_count < 8) != 0);
+    __pyx_t_2 = __pyx_t_3;
+    __pyx_L5_bool_binop_done:;
+    if (!__pyx_t_2) break;
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":529
+ *     count = 0
+ *     while c_val >= 0x80 and count < 8:
+ *         c_bytes[count] = <unsigned char>((c_val | 0x80) & 0xFF)             # <<<<<<<<<<<<<<
+ *         c_val = c_val >> 7
+ *         count = count + 1
+ */
+    (__pyx_v_c_bytes[__pyx_v_count]) = ((unsigned char)((__pyx_v_c_val | 0x80) & 0xFF));
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":530
+ *     while c_val >= 0x80 and count < 8:
+ *         c_bytes[count] = <unsigned char>((c_val | 0x80) & 0xFF)
+ *         c_val = c_val >> 7             # <<<<<<<<<<<<<<
+ *         count = count + 1
+ *     if count >= 8 or c_val >= 0x80:
+ */
+    __pyx_v_c_val = (__pyx_v_c_val >> 7);
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":531
+ *         c_bytes[count] = <unsigned char>((c_val | 0x80) & 0xFF)
+ *         c_val = c_val >> 7
+ *         count = count + 1             # <<<<<<<<<<<<<<
+ *     if count >= 8 or c_val >= 0x80:
+ *         raise ValueError('encode_base128_int overflowed the buffer')
+ */
+    __pyx_v_count = (__pyx_v_count + 1);
+  }
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":532
+ *         c_val = c_val >> 7
+ *         count = count + 1
+ *     if count >= 8 or c_val >= 0x80:             # <<<<<<<<<<<<<<
+ *         raise ValueError('encode_base128_int overflowed the buffer')
+ *     c_bytes[count] = <unsigned char>(c_val & 0xFF)
+ */
+  __pyx_t_3 = ((__pyx_v_count >= 8) != 0);
+  if (!__pyx_t_3) {
+  } else {
+    __pyx_t_2 = __pyx_t_3;
+    goto __pyx_L8_bool_binop_done;
+  }
+  __pyx_t_3 = ((__pyx_v_c_val >= 0x80) != 0);
+  __pyx_t_2 = __pyx_t_3;
+  __pyx_L8_bool_binop_done:;
+  if (unlikely(__pyx_t_2)) {
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":533
+ *         count = count + 1
+ *     if count >= 8 or c_val >= 0x80:
+ *         raise ValueError('encode_base128_int overflowed the buffer')             # <<<<<<<<<<<<<<
+ *     c_bytes[count] = <unsigned char>(c_val & 0xFF)
+ *     count = count + 1
+ */
+    __pyx_t_4 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__26, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 533, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_Raise(__pyx_t_4, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __PYX_ERR(0, 533, __pyx_L1_error)
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":532
+ *         c_val = c_val >> 7
+ *         count = count + 1
+ *     if count >= 8 or c_val >= 0x80:             # <<<<<<<<<<<<<<
+ *         raise ValueError('encode_base128_int overflowed the buffer')
+ *     c_bytes[count] = <unsigned char>(c_val & 0xFF)
+ */
+  }
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":534
+ *     if count >= 8 or c_val >= 0x80:
+ *         raise ValueError('encode_base128_int overflowed the buffer')
+ *     c_bytes[count] = <unsigned char>(c_val & 0xFF)             # <<<<<<<<<<<<<<
+ *     count = count + 1
+ *     return PyBytes_FromStringAndSize(<char *>c_bytes, count)
+ */
+  (__pyx_v_c_bytes[__pyx_v_count]) = ((unsigned char)(__pyx_v_c_val & 0xFF));
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":535
+ *         raise ValueError('encode_base128_int overflowed the buffer')
+ *     c_bytes[count] = <unsigned char>(c_val & 0xFF)
+ *     count = count + 1             # <<<<<<<<<<<<<<
+ *     return PyBytes_FromStringAndSize(<char *>c_bytes, count)
+ * 
+ */
+  __pyx_v_count = (__pyx_v_count + 1);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":536
+ *     c_bytes[count] = <unsigned char>(c_val & 0xFF)
+ *     count = count + 1
+ *     return PyBytes_FromStringAndSize(<char *>c_bytes, count)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_4 = PyBytes_FromStringAndSize(((char *)__pyx_v_c_bytes), __pyx_v_count); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 536, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_r = __pyx_t_4;
+  __pyx_t_4 = 0;
+  goto __pyx_L0;
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":519
+ * 
+ * 
+ * def encode_base128_int(val):             # <<<<<<<<<<<<<<
+ *     """Convert an integer into a 7-bit lsb encoding."""
+ *     cdef unsigned int c_val
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("breezy.bzr._groupcompress_pyx.encode_base128_int", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "breezy/bzr/_groupcompress_pyx.pyx":539
+ * 
+ * 
+ * def decode_base128_int(data):             # <<<<<<<<<<<<<<
+ *     """Decode an integer from a 7-bit lsb encoding."""
+ *     cdef int offset
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_6breezy_3bzr_18_groupcompress_pyx_13decode_base128_int(PyObject *__pyx_self, PyObject *__pyx_v_data); /*proto*/
+static char __pyx_doc_6breezy_3bzr_18_groupcompress_pyx_12decode_base128_int[] = "Decode an integer from a 7-bit lsb encoding.";
+static PyMethodDef __pyx_mdef_6breezy_3bzr_18_groupcompress_pyx_13decode_base128_int = {"decode_base128_int", (PyCFunction)__pyx_pw_6breezy_3bzr_18_groupcompress_pyx_13decode_base128_int, METH_O, __pyx_doc_6breezy_3bzr_18_groupcompress_pyx_12decode_base128_int};
+static PyObject *__pyx_pw_6breezy_3bzr_18_groupcompress_pyx_13decode_base128_int(PyObject *__pyx_self, PyObject *__pyx_v_data) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("decode_base128_int (wrapper)", 0);
+  __pyx_r = __pyx_pf_6breezy_3bzr_18_groupcompress_pyx_12decode_base128_int(__pyx_self, ((PyObject *)__pyx_v_data));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_6breezy_3bzr_18_groupcompress_pyx_12decode_base128_int(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_data) {
+  int __pyx_v_offset;
+  int __pyx_v_val;
+  unsigned int __pyx_v_uval;
+  int __pyx_v_shift;
+  Py_ssize_t __pyx_v_num_low_bytes;
+  unsigned char *__pyx_v_c_bytes;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("decode_base128_int", 0);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":548
+ *     cdef unsigned char *c_bytes
+ * 
+ *     offset = 0             # <<<<<<<<<<<<<<
+ *     val = 0
+ *     shift = 0
+ */
+  __pyx_v_offset = 0;
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":549
+ * 
+ *     offset = 0
+ *     val = 0             # <<<<<<<<<<<<<<
+ *     shift = 0
+ *     if not PyBytes_CheckExact(data):
+ */
+  __pyx_v_val = 0;
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":550
+ *     offset = 0
+ *     val = 0
+ *     shift = 0             # <<<<<<<<<<<<<<
+ *     if not PyBytes_CheckExact(data):
+ *         raise TypeError('bytes is not a string')
+ */
+  __pyx_v_shift = 0;
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":551
+ *     val = 0
+ *     shift = 0
+ *     if not PyBytes_CheckExact(data):             # <<<<<<<<<<<<<<
+ *         raise TypeError('bytes is not a string')
+ *     c_bytes = <unsigned char*>PyBytes_AS_STRING(data)
+ */
+  __pyx_t_1 = ((!(PyBytes_CheckExact(__pyx_v_data) != 0)) != 0);
+  if (unlikely(__pyx_t_1)) {
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":552
+ *     shift = 0
+ *     if not PyBytes_CheckExact(data):
+ *         raise TypeError('bytes is not a string')             # <<<<<<<<<<<<<<
+ *     c_bytes = <unsigned char*>PyBytes_AS_STRING(data)
+ *     # We take off 1, because we have to be able to decode the non-expanded byte
+ */
+    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__27, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 552, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __PYX_ERR(0, 552, __pyx_L1_error)
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":551
+ *     val = 0
+ *     shift = 0
+ *     if not PyBytes_CheckExact(data):             # <<<<<<<<<<<<<<
+ *         raise TypeError('bytes is not a string')
+ *     c_bytes = <unsigned char*>PyBytes_AS_STRING(data)
+ */
+  }
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":553
+ *     if not PyBytes_CheckExact(data):
+ *         raise TypeError('bytes is not a string')
+ *     c_bytes = <unsigned char*>PyBytes_AS_STRING(data)             # <<<<<<<<<<<<<<
+ *     # We take off 1, because we have to be able to decode the non-expanded byte
+ *     num_low_bytes = PyBytes_GET_SIZE(data) - 1
+ */
+  __pyx_v_c_bytes = ((unsigned char *)PyBytes_AS_STRING(__pyx_v_data));
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":555
+ *     c_bytes = <unsigned char*>PyBytes_AS_STRING(data)
+ *     # We take off 1, because we have to be able to decode the non-expanded byte
+ *     num_low_bytes = PyBytes_GET_SIZE(data) - 1             # <<<<<<<<<<<<<<
+ *     while (c_bytes[offset] & 0x80) and offset < num_low_bytes:
+ *         val = val | ((c_bytes[offset] & 0x7F) << shift)
+ */
+  __pyx_v_num_low_bytes = (PyBytes_GET_SIZE(__pyx_v_data) - 1);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":556
+ *     # We take off 1, because we have to be able to decode the non-expanded byte
+ *     num_low_bytes = PyBytes_GET_SIZE(data) - 1
+ *     while (c_bytes[offset] & 0x80) and offset < num_low_bytes:             # <<<<<<<<<<<<<<
+ *         val = val | ((c_bytes[offset] & 0x7F) << shift)
+ *         shift = shift + 7
+ */
+  while (1) {
+    __pyx_t_3 = (((__pyx_v_c_bytes[__pyx_v_offset]) & 0x80) != 0);
+    if (__pyx_t_3) {
+    } else {
+      __pyx_t_1 = __pyx_t_3;
+      goto __pyx_L6_bool_binop_done;
+    }
+    __pyx_t_3 = ((__pyx_v_offset < __pyx_v_num_low_bytes) != 0);
+    __pyx_t_1 = __pyx_t_3;
+    __pyx_L6_bool_binop_done:;
+    if (!__pyx_t_1) break;
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":557
+ *     num_low_bytes = PyBytes_GET_SIZE(data) - 1
+ *     while (c_bytes[offset] & 0x80) and offset < num_low_bytes:
+ *         val = val | ((c_bytes[offset] & 0x7F) << shift)             # <<<<<<<<<<<<<<
+ *         shift = shift + 7
+ *         offset = offset + 1
+ */
+    __pyx_v_val = (__pyx_v_val | (((__pyx_v_c_bytes[__pyx_v_offset]) & 0x7F) << __pyx_v_shift));
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":558
+ *     while (c_bytes[offset] & 0x80) and offset < num_low_bytes:
+ *         val = val | ((c_bytes[offset] & 0x7F) << shift)
+ *         shift = shift + 7             # <<<<<<<<<<<<<<
+ *         offset = offset + 1
+ *     if c_bytes[offset] & 0x80:
+ */
+    __pyx_v_shift = (__pyx_v_shift + 7);
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":559
+ *         val = val | ((c_bytes[offset] & 0x7F) << shift)
+ *         shift = shift + 7
+ *         offset = offset + 1             # <<<<<<<<<<<<<<
+ *     if c_bytes[offset] & 0x80:
+ *         raise ValueError('Data not properly formatted, we ran out of'
+ */
+    __pyx_v_offset = (__pyx_v_offset + 1);
+  }
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":560
+ *         shift = shift + 7
+ *         offset = offset + 1
+ *     if c_bytes[offset] & 0x80:             # <<<<<<<<<<<<<<
+ *         raise ValueError('Data not properly formatted, we ran out of'
+ *                          ' bytes before 0x80 stopped being set.')
+ */
+  __pyx_t_1 = (((__pyx_v_c_bytes[__pyx_v_offset]) & 0x80) != 0);
+  if (unlikely(__pyx_t_1)) {
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":561
+ *         offset = offset + 1
+ *     if c_bytes[offset] & 0x80:
+ *         raise ValueError('Data not properly formatted, we ran out of'             # <<<<<<<<<<<<<<
+ *                          ' bytes before 0x80 stopped being set.')
+ *     val = val | (c_bytes[offset] << shift)
+ */
+    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__28, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 561, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __PYX_ERR(0, 561, __pyx_L1_error)
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":560
+ *         shift = shift + 7
+ *         offset = offset + 1
+ *     if c_bytes[offset] & 0x80:             # <<<<<<<<<<<<<<
+ *         raise ValueError('Data not properly formatted, we ran out of'
+ *                          ' bytes before 0x80 stopped being set.')
+ */
+  }
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":563
+ *         raise ValueError('Data not properly formatted, we ran out of'
+ *                          ' bytes before 0x80 stopped being set.')
+ *     val = val | (c_bytes[offset] << shift)             # <<<<<<<<<<<<<<
+ *     offset = offset + 1
+ *     if val < 0:
+ */
+  __pyx_v_val = (__pyx_v_val | ((__pyx_v_c_bytes[__pyx_v_offset]) << __pyx_v_shift));
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":564
+ *                          ' bytes before 0x80 stopped being set.')
+ *     val = val | (c_bytes[offset] << shift)
+ *     offset = offset + 1             # <<<<<<<<<<<<<<
+ *     if val < 0:
+ *         uval = <unsigned int> val
+ */
+  __pyx_v_offset = (__pyx_v_offset + 1);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":565
+ *     val = val | (c_bytes[offset] << shift)
+ *     offset = offset + 1
+ *     if val < 0:             # <<<<<<<<<<<<<<
+ *         uval = <unsigned int> val
+ *         return uval, offset
+ */
+  __pyx_t_1 = ((__pyx_v_val < 0) != 0);
+  if (__pyx_t_1) {
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":566
+ *     offset = offset + 1
+ *     if val < 0:
+ *         uval = <unsigned int> val             # <<<<<<<<<<<<<<
+ *         return uval, offset
+ *     return val, offset
+ */
+    __pyx_v_uval = ((unsigned int)__pyx_v_val);
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":567
+ *     if val < 0:
+ *         uval = <unsigned int> val
+ *         return uval, offset             # <<<<<<<<<<<<<<
+ *     return val, offset
+ * 
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_2 = __Pyx_PyInt_From_unsigned_int(__pyx_v_uval); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 567, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_offset); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 567, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = PyTuple_New(2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 567, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_GIVEREF(__pyx_t_2);
+    PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_2);
+    __Pyx_GIVEREF(__pyx_t_4);
+    PyTuple_SET_ITEM(__pyx_t_5, 1, __pyx_t_4);
+    __pyx_t_2 = 0;
+    __pyx_t_4 = 0;
+    __pyx_r = __pyx_t_5;
+    __pyx_t_5 = 0;
+    goto __pyx_L0;
+
+    /* "breezy/bzr/_groupcompress_pyx.pyx":565
+ *     val = val | (c_bytes[offset] << shift)
+ *     offset = offset + 1
+ *     if val < 0:             # <<<<<<<<<<<<<<
+ *         uval = <unsigned int> val
+ *         return uval, offset
+ */
+  }
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":568
+ *         uval = <unsigned int> val
+ *         return uval, offset
+ *     return val, offset             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_5 = __Pyx_PyInt_From_int(__pyx_v_val); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 568, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_offset); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 568, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 568, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_5);
+  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_5);
+  __Pyx_GIVEREF(__pyx_t_4);
+  PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_t_4);
+  __pyx_t_5 = 0;
+  __pyx_t_4 = 0;
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":539
+ * 
+ * 
+ * def decode_base128_int(data):             # <<<<<<<<<<<<<<
+ *     """Decode an integer from a 7-bit lsb encoding."""
+ *     cdef int offset
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("breezy.bzr._groupcompress_pyx.decode_base128_int", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+static struct __pyx_vtabstruct_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex __pyx_vtable_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex;
+
+static PyObject *__pyx_tp_new_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
+  struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *p;
+  PyObject *o;
+  if (likely((t->tp_flags & Py_TPFLAGS_IS_ABSTRACT) == 0)) {
+    o = (*t->tp_alloc)(t, 0);
+  } else {
+    o = (PyObject *) PyBaseObject_Type.tp_new(t, __pyx_empty_tuple, 0);
+  }
+  if (unlikely(!o)) return 0;
+  p = ((struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *)o);
+  p->__pyx_vtab = __pyx_vtabptr_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex;
+  p->_sources = ((PyObject*)Py_None); Py_INCREF(Py_None);
+  return o;
+}
+
+static void __pyx_tp_dealloc_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex(PyObject *o) {
+  struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *p = (struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *)o;
+  #if CYTHON_USE_TP_FINALIZE
+  if (unlikely(PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE) && Py_TYPE(o)->tp_finalize) && !__Pyx_PyObject_GC_IsFinalized(o)) {
+    if (PyObject_CallFinalizerFromDealloc(o)) return;
+  }
+  #endif
+  PyObject_GC_UnTrack(o);
+  {
+    PyObject *etype, *eval, *etb;
+    PyErr_Fetch(&etype, &eval, &etb);
+    __Pyx_SET_REFCNT(o, Py_REFCNT(o) + 1);
+    __pyx_pw_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_7__dealloc__(o);
+    __Pyx_SET_REFCNT(o, Py_REFCNT(o) - 1);
+    PyErr_Restore(etype, eval, etb);
+  }
+  Py_CLEAR(p->_sources);
+  (*Py_TYPE(o)->tp_free)(o);
+}
+
+static int __pyx_tp_traverse_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex(PyObject *o, visitproc v, void *a) {
+  int e;
+  struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *p = (struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *)o;
+  if (p->_sources) {
+    e = (*v)(p->_sources, a); if (e) return e;
+  }
+  return 0;
+}
+
+static int __pyx_tp_clear_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex(PyObject *o) {
+  PyObject* tmp;
+  struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *p = (struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *)o;
+  tmp = ((PyObject*)p->_sources);
+  p->_sources = ((PyObject*)Py_None); Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  return 0;
+}
+
+static PyObject *__pyx_getprop_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex__sources(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_8_sources_1__get__(o);
+}
+
+static PyObject *__pyx_getprop_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex__source_offset(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_14_source_offset_1__get__(o);
+}
+
+static int __pyx_setprop_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex__source_offset(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_14_source_offset_3__set__(o, v);
+  }
+  else {
+    PyErr_SetString(PyExc_NotImplementedError, "__del__");
+    return -1;
+  }
+}
+
+static PyObject *__pyx_getprop_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex__max_num_sources(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_16_max_num_sources_1__get__(o);
+}
+
+static PyObject *__pyx_getprop_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex__max_bytes_to_index(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_19_max_bytes_to_index_1__get__(o);
+}
+
+static int __pyx_setprop_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex__max_bytes_to_index(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_19_max_bytes_to_index_3__set__(o, v);
+  }
+  else {
+    PyErr_SetString(PyExc_NotImplementedError, "__del__");
+    return -1;
+  }
+}
+
+static PyMethodDef __pyx_methods_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex[] = {
+  {"__sizeof__", (PyCFunction)__pyx_pw_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_3__sizeof__, METH_NOARGS, 0},
+  {"_has_index", (PyCFunction)__pyx_pw_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_9_has_index, METH_NOARGS, 0},
+  {"_dump_index", (PyCFunction)__pyx_pw_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_11_dump_index, METH_NOARGS, __pyx_doc_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_10_dump_index},
+  {"add_delta_source", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_13add_delta_source, METH_VARARGS|METH_KEYWORDS, __pyx_doc_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_12add_delta_source},
+  {"add_source", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_15add_source, METH_VARARGS|METH_KEYWORDS, __pyx_doc_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_14add_source},
+  {"make_delta", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_17make_delta, METH_VARARGS|METH_KEYWORDS, __pyx_doc_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_16make_delta},
+  {"__reduce_cython__", (PyCFunction)__pyx_pw_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_19__reduce_cython__, METH_NOARGS, 0},
+  {"__setstate_cython__", (PyCFunction)__pyx_pw_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_21__setstate_cython__, METH_O, 0},
+  {0, 0, 0, 0}
+};
+
+static struct PyGetSetDef __pyx_getsets_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex[] = {
+  {(char *)"_sources", __pyx_getprop_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex__sources, 0, (char *)0, 0},
+  {(char *)"_source_offset", __pyx_getprop_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex__source_offset, __pyx_setprop_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex__source_offset, (char *)0, 0},
+  {(char *)"_max_num_sources", __pyx_getprop_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex__max_num_sources, 0, (char *)0, 0},
+  {(char *)"_max_bytes_to_index", __pyx_getprop_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex__max_bytes_to_index, __pyx_setprop_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex__max_bytes_to_index, (char *)0, 0},
+  {0, 0, 0, 0, 0}
+};
+
+static PyTypeObject __pyx_type_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex = {
+  PyVarObject_HEAD_INIT(0, 0)
+  "breezy.bzr._groupcompress_pyx.DeltaIndex", /*tp_name*/
+  sizeof(struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex, /*tp_dealloc*/
+  #if PY_VERSION_HEX < 0x030800b4
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4
+  0, /*tp_vectorcall_offset*/
+  #endif
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*tp_compare*/
+  #endif
+  #if PY_MAJOR_VERSION >= 3
+  0, /*tp_as_async*/
+  #endif
+  __pyx_pw_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_5__repr__, /*tp_repr*/
+  0, /*tp_as_number*/
+  0, /*tp_as_sequence*/
+  0, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  0, /*tp_call*/
+  0, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  0, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
+  0, /*tp_doc*/
+  __pyx_tp_traverse_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex, /*tp_traverse*/
+  __pyx_tp_clear_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex, /*tp_clear*/
+  0, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  0, /*tp_iter*/
+  0, /*tp_iternext*/
+  __pyx_methods_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex, /*tp_methods*/
+  0, /*tp_members*/
+  __pyx_getsets_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  0, /*tp_dictoffset*/
+  __pyx_pw_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex_1__init__, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  0, /*tp_version_tag*/
+  #if PY_VERSION_HEX >= 0x030400a1
+  0, /*tp_finalize*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+  0, /*tp_vectorcall*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
+  0, /*tp_print*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+  0, /*tp_pypy_flags*/
+  #endif
+};
+
+static PyMethodDef __pyx_methods[] = {
+  {0, 0, 0, 0}
+};
+
+#if PY_MAJOR_VERSION >= 3
+#if CYTHON_PEP489_MULTI_PHASE_INIT
+static PyObject* __pyx_pymod_create(PyObject *spec, PyModuleDef *def); /*proto*/
+static int __pyx_pymod_exec__groupcompress_pyx(PyObject* module); /*proto*/
+static PyModuleDef_Slot __pyx_moduledef_slots[] = {
+  {Py_mod_create, (void*)__pyx_pymod_create},
+  {Py_mod_exec, (void*)__pyx_pymod_exec__groupcompress_pyx},
+  {0, NULL}
+};
+#endif
+
+static struct PyModuleDef __pyx_moduledef = {
+    PyModuleDef_HEAD_INIT,
+    "_groupcompress_pyx",
+    __pyx_k_Compiled_extensions_for_doing_co, /* m_doc */
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+    0, /* m_size */
+  #else
+    -1, /* m_size */
+  #endif
+    __pyx_methods /* m_methods */,
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+    __pyx_moduledef_slots, /* m_slots */
+  #else
+    NULL, /* m_reload */
+  #endif
+    NULL, /* m_traverse */
+    NULL, /* m_clear */
+    NULL /* m_free */
+};
+#endif
+#ifndef CYTHON_SMALL_CODE
+#if defined(__clang__)
+    #define CYTHON_SMALL_CODE
+#elif defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 3))
+    #define CYTHON_SMALL_CODE __attribute__((cold))
+#else
+    #define CYTHON_SMALL_CODE
+#endif
+#endif
+
+static __Pyx_StringTabEntry __pyx_string_tab[] = {
+  {&__pyx_n_s_AssertionError, __pyx_k_AssertionError, sizeof(__pyx_k_AssertionError), 0, 0, 1, 1},
+  {&__pyx_kp_u_Data_not_properly_formatted_we_r, __pyx_k_Data_not_properly_formatted_we_r, sizeof(__pyx_k_Data_not_properly_formatted_we_r), 0, 1, 0, 0},
+  {&__pyx_n_s_DeltaIndex, __pyx_k_DeltaIndex, sizeof(__pyx_k_DeltaIndex), 0, 0, 1, 1},
+  {&__pyx_kp_u_Delta_function_failed_to_allocat, __pyx_k_Delta_function_failed_to_allocat, sizeof(__pyx_k_Delta_function_failed_to_allocat), 0, 1, 0, 0},
+  {&__pyx_kp_u_Delta_function_given_empty_buffe, __pyx_k_Delta_function_given_empty_buffe, sizeof(__pyx_k_Delta_function_given_empty_buffe), 0, 1, 0, 0},
+  {&__pyx_kp_u_Delta_function_given_empty_sourc, __pyx_k_Delta_function_given_empty_sourc, sizeof(__pyx_k_Delta_function_given_empty_sourc), 0, 1, 0, 0},
+  {&__pyx_kp_u_Delta_function_given_invalid_sou, __pyx_k_Delta_function_given_invalid_sou, sizeof(__pyx_k_Delta_function_given_invalid_sou), 0, 1, 0, 0},
+  {&__pyx_kp_u_Delta_function_requires_delta_in, __pyx_k_Delta_function_requires_delta_in, sizeof(__pyx_k_Delta_function_requires_delta_in), 0, 1, 0, 0},
+  {&__pyx_kp_u_Did_not_extract_the_number_of_by, __pyx_k_Did_not_extract_the_number_of_by, sizeof(__pyx_k_Did_not_extract_the_number_of_by), 0, 1, 0, 0},
+  {&__pyx_kp_u_Got_delta_opcode_0_not_supported, __pyx_k_Got_delta_opcode_0_not_supported, sizeof(__pyx_k_Got_delta_opcode_0_not_supported), 0, 1, 0, 0},
+  {&__pyx_kp_u_Insert_instruction_longer_than_r, __pyx_k_Insert_instruction_longer_than_r, sizeof(__pyx_k_Insert_instruction_longer_than_r), 0, 1, 0, 0},
+  {&__pyx_n_s_MemoryError, __pyx_k_MemoryError, sizeof(__pyx_k_MemoryError), 0, 0, 1, 1},
+  {&__pyx_kp_u_Number_of_bytes_extracted_did_no, __pyx_k_Number_of_bytes_extracted_did_no, sizeof(__pyx_k_Number_of_bytes_extracted_did_no), 0, 1, 0, 0},
+  {&__pyx_n_s_RuntimeError, __pyx_k_RuntimeError, sizeof(__pyx_k_RuntimeError), 0, 0, 1, 1},
+  {&__pyx_kp_u_Something_wrong_with_cp_off, __pyx_k_Something_wrong_with_cp_off, sizeof(__pyx_k_Something_wrong_with_cp_off), 0, 1, 0, 0},
+  {&__pyx_n_s_TypeError, __pyx_k_TypeError, sizeof(__pyx_k_TypeError), 0, 0, 1, 1},
+  {&__pyx_kp_u_Unrecognised_delta_result_code_d, __pyx_k_Unrecognised_delta_result_code_d, sizeof(__pyx_k_Unrecognised_delta_result_code_d), 0, 1, 0, 0},
+  {&__pyx_n_s_ValueError, __pyx_k_ValueError, sizeof(__pyx_k_ValueError), 0, 0, 1, 1},
+  {&__pyx_kp_u__10, __pyx_k__10, sizeof(__pyx_k__10), 0, 1, 0, 0},
+  {&__pyx_kp_u__11, __pyx_k__11, sizeof(__pyx_k__11), 0, 1, 0, 0},
+  {&__pyx_kp_u__20, __pyx_k__20, sizeof(__pyx_k__20), 0, 1, 0, 0},
+  {&__pyx_kp_u__9, __pyx_k__9, sizeof(__pyx_k__9), 0, 1, 0, 0},
+  {&__pyx_n_s_add_source, __pyx_k_add_source, sizeof(__pyx_k_add_source), 0, 0, 1, 1},
+  {&__pyx_n_s_apply_delta, __pyx_k_apply_delta, sizeof(__pyx_k_apply_delta), 0, 0, 1, 1},
+  {&__pyx_n_s_apply_delta_to_source, __pyx_k_apply_delta_to_source, sizeof(__pyx_k_apply_delta_to_source), 0, 0, 1, 1},
+  {&__pyx_n_s_breezy_bzr__groupcompress_pyx, __pyx_k_breezy_bzr__groupcompress_pyx, sizeof(__pyx_k_breezy_bzr__groupcompress_pyx), 0, 0, 1, 1},
+  {&__pyx_kp_s_breezy_bzr__groupcompress_pyx_py, __pyx_k_breezy_bzr__groupcompress_pyx_py, sizeof(__pyx_k_breezy_bzr__groupcompress_pyx_py), 0, 0, 1, 0},
+  {&__pyx_kp_u_bytes_in_size_and_top_data, __pyx_k_bytes_in_size_and_top_data, sizeof(__pyx_k_bytes_in_size_and_top_data), 0, 1, 0, 0},
+  {&__pyx_kp_u_bytes_is_not_a_string, __pyx_k_bytes_is_not_a_string, sizeof(__pyx_k_bytes_is_not_a_string), 0, 1, 0, 0},
+  {&__pyx_n_s_c_bytes, __pyx_k_c_bytes, sizeof(__pyx_k_c_bytes), 0, 0, 1, 1},
+  {&__pyx_n_s_c_delta, __pyx_k_c_delta, sizeof(__pyx_k_c_delta), 0, 0, 1, 1},
+  {&__pyx_n_s_c_delta_end, __pyx_k_c_delta_end, sizeof(__pyx_k_c_delta_end), 0, 0, 1, 1},
+  {&__pyx_n_s_c_delta_size, __pyx_k_c_delta_size, sizeof(__pyx_k_c_delta_size), 0, 0, 1, 1},
+  {&__pyx_n_s_c_delta_start, __pyx_k_c_delta_start, sizeof(__pyx_k_c_delta_start), 0, 0, 1, 1},
+  {&__pyx_n_s_c_source, __pyx_k_c_source, sizeof(__pyx_k_c_source), 0, 0, 1, 1},
+  {&__pyx_n_s_c_source_size, __pyx_k_c_source_size, sizeof(__pyx_k_c_source_size), 0, 0, 1, 1},
+  {&__pyx_n_s_c_val, __pyx_k_c_val, sizeof(__pyx_k_c_val), 0, 0, 1, 1},
+  {&__pyx_n_s_class, __pyx_k_class, sizeof(__pyx_k_class), 0, 0, 1, 1},
+  {&__pyx_n_s_cline_in_traceback, __pyx_k_cline_in_traceback, sizeof(__pyx_k_cline_in_traceback), 0, 0, 1, 1},
+  {&__pyx_n_s_content, __pyx_k_content, sizeof(__pyx_k_content), 0, 0, 1, 1},
+  {&__pyx_kp_u_content_must_be_a_string, __pyx_k_content_must_be_a_string, sizeof(__pyx_k_content_must_be_a_string), 0, 1, 0, 0},
+  {&__pyx_kp_u_content_must_be_at_least_16_byte, __pyx_k_content_must_be_at_least_16_byte, sizeof(__pyx_k_content_must_be_at_least_16_byte), 0, 1, 0, 0},
+  {&__pyx_n_s_count, __pyx_k_count, sizeof(__pyx_k_count), 0, 0, 1, 1},
+  {&__pyx_kp_u_cp_size, __pyx_k_cp_size, sizeof(__pyx_k_cp_size), 0, 1, 0, 0},
+  {&__pyx_n_u_d, __pyx_k_d, sizeof(__pyx_k_d), 0, 1, 0, 1},
+  {&__pyx_n_s_data, __pyx_k_data, sizeof(__pyx_k_data), 0, 0, 1, 1},
+  {&__pyx_n_s_decode_base128_int, __pyx_k_decode_base128_int, sizeof(__pyx_k_decode_base128_int), 0, 0, 1, 1},
+  {&__pyx_n_s_delta, __pyx_k_delta, sizeof(__pyx_k_delta), 0, 0, 1, 1},
+  {&__pyx_n_s_delta_bytes, __pyx_k_delta_bytes, sizeof(__pyx_k_delta_bytes), 0, 0, 1, 1},
+  {&__pyx_n_s_delta_end, __pyx_k_delta_end, sizeof(__pyx_k_delta_end), 0, 0, 1, 1},
+  {&__pyx_kp_u_delta_ends_after_source, __pyx_k_delta_ends_after_source, sizeof(__pyx_k_delta_ends_after_source), 0, 1, 0, 0},
+  {&__pyx_kp_u_delta_is_not_a_bytestring, __pyx_k_delta_is_not_a_bytestring, sizeof(__pyx_k_delta_is_not_a_bytestring), 0, 1, 0, 0},
+  {&__pyx_kp_u_delta_size, __pyx_k_delta_size, sizeof(__pyx_k_delta_size), 0, 1, 0, 0},
+  {&__pyx_n_s_delta_size_2, __pyx_k_delta_size_2, sizeof(__pyx_k_delta_size_2), 0, 0, 1, 1},
+  {&__pyx_n_s_delta_start, __pyx_k_delta_start, sizeof(__pyx_k_delta_start), 0, 0, 1, 1},
+  {&__pyx_kp_u_delta_starts_after_it_ends, __pyx_k_delta_starts_after_it_ends, sizeof(__pyx_k_delta_starts_after_it_ends), 0, 1, 0, 0},
+  {&__pyx_kp_u_delta_starts_after_source, __pyx_k_delta_starts_after_source, sizeof(__pyx_k_delta_starts_after_source), 0, 1, 0, 0},
+  {&__pyx_n_s_di, __pyx_k_di, sizeof(__pyx_k_di), 0, 0, 1, 1},
+  {&__pyx_n_s_encode_base128_int, __pyx_k_encode_base128_int, sizeof(__pyx_k_encode_base128_int), 0, 0, 1, 1},
+  {&__pyx_kp_u_encode_base128_int_overflowed_th, __pyx_k_encode_base128_int_overflowed_th, sizeof(__pyx_k_encode_base128_int_overflowed_th), 0, 1, 0, 0},
+  {&__pyx_kp_u_failed_to_allocate_memory_for_De, __pyx_k_failed_to_allocate_memory_for_De, sizeof(__pyx_k_failed_to_allocate_memory_for_De), 0, 1, 0, 0},
+  {&__pyx_n_s_getstate, __pyx_k_getstate, sizeof(__pyx_k_getstate), 0, 0, 1, 1},
+  {&__pyx_kp_u_if_we_move_self__source_infos_th, __pyx_k_if_we_move_self__source_infos_th, sizeof(__pyx_k_if_we_move_self__source_infos_th), 0, 1, 0, 0},
+  {&__pyx_n_s_main, __pyx_k_main, sizeof(__pyx_k_main), 0, 0, 1, 1},
+  {&__pyx_n_s_make_delta, __pyx_k_make_delta, sizeof(__pyx_k_make_delta), 0, 0, 1, 1},
+  {&__pyx_n_s_make_delta_index, __pyx_k_make_delta_index, sizeof(__pyx_k_make_delta_index), 0, 0, 1, 1},
+  {&__pyx_n_s_map, __pyx_k_map, sizeof(__pyx_k_map), 0, 0, 1, 1},
+  {&__pyx_n_s_max_bytes_to_index, __pyx_k_max_bytes_to_index, sizeof(__pyx_k_max_bytes_to_index), 0, 0, 1, 1},
+  {&__pyx_n_s_max_delta_size, __pyx_k_max_delta_size, sizeof(__pyx_k_max_delta_size), 0, 0, 1, 1},
+  {&__pyx_n_s_name, __pyx_k_name, sizeof(__pyx_k_name), 0, 0, 1, 1},
+  {&__pyx_n_s_num_bytes, __pyx_k_num_bytes, sizeof(__pyx_k_num_bytes), 0, 0, 1, 1},
+  {&__pyx_n_s_num_low_bytes, __pyx_k_num_low_bytes, sizeof(__pyx_k_num_low_bytes), 0, 0, 1, 1},
+  {&__pyx_n_s_offset, __pyx_k_offset, sizeof(__pyx_k_offset), 0, 0, 1, 1},
+  {&__pyx_kp_u_populate_first_index_should_onl, __pyx_k_populate_first_index_should_onl, sizeof(__pyx_k_populate_first_index_should_onl), 0, 1, 0, 0},
+  {&__pyx_n_s_pyx_vtable, __pyx_k_pyx_vtable, sizeof(__pyx_k_pyx_vtable), 0, 0, 1, 1},
+  {&__pyx_n_s_rabin_hash, __pyx_k_rabin_hash, sizeof(__pyx_k_rabin_hash), 0, 0, 1, 1},
+  {&__pyx_n_s_reduce, __pyx_k_reduce, sizeof(__pyx_k_reduce), 0, 0, 1, 1},
+  {&__pyx_n_s_reduce_cython, __pyx_k_reduce_cython, sizeof(__pyx_k_reduce_cython), 0, 0, 1, 1},
+  {&__pyx_n_s_reduce_ex, __pyx_k_reduce_ex, sizeof(__pyx_k_reduce_ex), 0, 0, 1, 1},
+  {&__pyx_kp_s_self__index_self__source_infos_c, __pyx_k_self__index_self__source_infos_c, sizeof(__pyx_k_self__index_self__source_infos_c), 0, 0, 1, 0},
+  {&__pyx_n_s_setstate, __pyx_k_setstate, sizeof(__pyx_k_setstate), 0, 0, 1, 1},
+  {&__pyx_n_s_setstate_cython, __pyx_k_setstate_cython, sizeof(__pyx_k_setstate_cython), 0, 0, 1, 1},
+  {&__pyx_n_s_shift, __pyx_k_shift, sizeof(__pyx_k_shift), 0, 0, 1, 1},
+  {&__pyx_kp_u_size, __pyx_k_size, sizeof(__pyx_k_size), 0, 1, 0, 0},
+  {&__pyx_kp_u_smaller_than_min_delta_size, __pyx_k_smaller_than_min_delta_size, sizeof(__pyx_k_smaller_than_min_delta_size), 0, 1, 0, 0},
+  {&__pyx_n_s_source, __pyx_k_source, sizeof(__pyx_k_source), 0, 0, 1, 1},
+  {&__pyx_n_s_source_bytes, __pyx_k_source_bytes, sizeof(__pyx_k_source_bytes), 0, 0, 1, 1},
+  {&__pyx_kp_u_source_is_not_a_bytestring, __pyx_k_source_is_not_a_bytestring, sizeof(__pyx_k_source_is_not_a_bytestring), 0, 1, 0, 0},
+  {&__pyx_kp_u_source_is_not_a_str, __pyx_k_source_is_not_a_str, sizeof(__pyx_k_source_is_not_a_str), 0, 1, 0, 0},
+  {&__pyx_kp_u_source_size, __pyx_k_source_size, sizeof(__pyx_k_source_size), 0, 1, 0, 0},
+  {&__pyx_n_s_source_size_2, __pyx_k_source_size_2, sizeof(__pyx_k_source_size_2), 0, 0, 1, 1},
+  {&__pyx_n_s_target_bytes, __pyx_k_target_bytes, sizeof(__pyx_k_target_bytes), 0, 0, 1, 1},
+  {&__pyx_kp_u_target_is_not_a_bytestring, __pyx_k_target_is_not_a_bytestring, sizeof(__pyx_k_target_is_not_a_bytestring), 0, 1, 0, 0},
+  {&__pyx_n_s_test, __pyx_k_test, sizeof(__pyx_k_test), 0, 0, 1, 1},
+  {&__pyx_n_s_unadded_bytes, __pyx_k_unadded_bytes, sizeof(__pyx_k_unadded_bytes), 0, 0, 1, 1},
+  {&__pyx_n_s_uval, __pyx_k_uval, sizeof(__pyx_k_uval), 0, 0, 1, 1},
+  {&__pyx_n_s_val, __pyx_k_val, sizeof(__pyx_k_val), 0, 0, 1, 1},
+  {0, 0, 0, 0, 0, 0, 0}
+};
+static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(void) {
+  __pyx_builtin_MemoryError = __Pyx_GetBuiltinName(__pyx_n_s_MemoryError); if (!__pyx_builtin_MemoryError) __PYX_ERR(0, 91, __pyx_L1_error)
+  __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_n_s_ValueError); if (!__pyx_builtin_ValueError) __PYX_ERR(0, 93, __pyx_L1_error)
+  __pyx_builtin_RuntimeError = __Pyx_GetBuiltinName(__pyx_n_s_RuntimeError); if (!__pyx_builtin_RuntimeError) __PYX_ERR(0, 97, __pyx_L1_error)
+  __pyx_builtin_AssertionError = __Pyx_GetBuiltinName(__pyx_n_s_AssertionError); if (!__pyx_builtin_AssertionError) __PYX_ERR(0, 100, __pyx_L1_error)
+  __pyx_builtin_map = __Pyx_GetBuiltinName(__pyx_n_s_map); if (!__pyx_builtin_map) __PYX_ERR(0, 190, __pyx_L1_error)
+  __pyx_builtin_TypeError = __Pyx_GetBuiltinName(__pyx_n_s_TypeError); if (!__pyx_builtin_TypeError) __PYX_ERR(0, 211, __pyx_L1_error)
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+
+static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":91
+ * cdef object _translate_delta_failure(delta_result result):
+ *     if result == DELTA_OUT_OF_MEMORY:
+ *         return MemoryError("Delta function failed to allocate memory")             # <<<<<<<<<<<<<<
+ *     elif result == DELTA_INDEX_NEEDED:
+ *         return ValueError("Delta function requires delta_index param")
+ */
+  __pyx_tuple_ = PyTuple_Pack(1, __pyx_kp_u_Delta_function_failed_to_allocat); if (unlikely(!__pyx_tuple_)) __PYX_ERR(0, 91, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple_);
+  __Pyx_GIVEREF(__pyx_tuple_);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":93
+ *         return MemoryError("Delta function failed to allocate memory")
+ *     elif result == DELTA_INDEX_NEEDED:
+ *         return ValueError("Delta function requires delta_index param")             # <<<<<<<<<<<<<<
+ *     elif result == DELTA_SOURCE_EMPTY:
+ *         return ValueError("Delta function given empty source_info param")
+ */
+  __pyx_tuple__2 = PyTuple_Pack(1, __pyx_kp_u_Delta_function_requires_delta_in); if (unlikely(!__pyx_tuple__2)) __PYX_ERR(0, 93, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__2);
+  __Pyx_GIVEREF(__pyx_tuple__2);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":95
+ *         return ValueError("Delta function requires delta_index param")
+ *     elif result == DELTA_SOURCE_EMPTY:
+ *         return ValueError("Delta function given empty source_info param")             # <<<<<<<<<<<<<<
+ *     elif result == DELTA_SOURCE_BAD:
+ *         return RuntimeError("Delta function given invalid source_info param")
+ */
+  __pyx_tuple__3 = PyTuple_Pack(1, __pyx_kp_u_Delta_function_given_empty_sourc); if (unlikely(!__pyx_tuple__3)) __PYX_ERR(0, 95, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__3);
+  __Pyx_GIVEREF(__pyx_tuple__3);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":97
+ *         return ValueError("Delta function given empty source_info param")
+ *     elif result == DELTA_SOURCE_BAD:
+ *         return RuntimeError("Delta function given invalid source_info param")             # <<<<<<<<<<<<<<
+ *     elif result == DELTA_BUFFER_EMPTY:
+ *         return ValueError("Delta function given empty buffer params")
+ */
+  __pyx_tuple__4 = PyTuple_Pack(1, __pyx_kp_u_Delta_function_given_invalid_sou); if (unlikely(!__pyx_tuple__4)) __PYX_ERR(0, 97, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__4);
+  __Pyx_GIVEREF(__pyx_tuple__4);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":99
+ *         return RuntimeError("Delta function given invalid source_info param")
+ *     elif result == DELTA_BUFFER_EMPTY:
+ *         return ValueError("Delta function given empty buffer params")             # <<<<<<<<<<<<<<
+ *     return AssertionError("Unrecognised delta result code: %d" % result)
+ * 
+ */
+  __pyx_tuple__5 = PyTuple_Pack(1, __pyx_kp_u_Delta_function_given_empty_buffe); if (unlikely(!__pyx_tuple__5)) __PYX_ERR(0, 99, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__5);
+  __Pyx_GIVEREF(__pyx_tuple__5);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":105
+ * def _rabin_hash(content):
+ *     if not PyBytes_CheckExact(content):
+ *         raise ValueError('content must be a string')             # <<<<<<<<<<<<<<
+ *     if len(content) < 16:
+ *         raise ValueError('content must be at least 16 bytes long')
+ */
+  __pyx_tuple__6 = PyTuple_Pack(1, __pyx_kp_u_content_must_be_a_string); if (unlikely(!__pyx_tuple__6)) __PYX_ERR(0, 105, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__6);
+  __Pyx_GIVEREF(__pyx_tuple__6);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":107
+ *         raise ValueError('content must be a string')
+ *     if len(content) < 16:
+ *         raise ValueError('content must be at least 16 bytes long')             # <<<<<<<<<<<<<<
+ *     # Try to cast it to an int, if it can fit
+ *     return int(rabin_hash(<unsigned char*>(PyBytes_AS_STRING(content))))
+ */
+  __pyx_tuple__7 = PyTuple_Pack(1, __pyx_kp_u_content_must_be_at_least_16_byte); if (unlikely(!__pyx_tuple__7)) __PYX_ERR(0, 107, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__7);
+  __Pyx_GIVEREF(__pyx_tuple__7);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":128
+ *             sizeof(source_info) * self._max_num_sources)
+ *         if self._source_infos == NULL:
+ *             raise MemoryError('failed to allocate memory for DeltaIndex')             # <<<<<<<<<<<<<<
+ *         self._source_offset = 0
+ *         self._max_bytes_to_index = 0
+ */
+  __pyx_tuple__8 = PyTuple_Pack(1, __pyx_kp_u_failed_to_allocate_memory_for_De); if (unlikely(!__pyx_tuple__8)) __PYX_ERR(0, 128, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__8);
+  __Pyx_GIVEREF(__pyx_tuple__8);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":211
+ * 
+ *         if not PyBytes_CheckExact(delta):
+ *             raise TypeError('delta is not a bytestring')             # <<<<<<<<<<<<<<
+ * 
+ *         source_location = len(self._sources)
+ */
+  __pyx_tuple__12 = PyTuple_Pack(1, __pyx_kp_u_delta_is_not_a_bytestring); if (unlikely(!__pyx_tuple__12)) __PYX_ERR(0, 211, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__12);
+  __Pyx_GIVEREF(__pyx_tuple__12);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":253
+ * 
+ *         if not PyBytes_CheckExact(source):
+ *             raise TypeError('source is not a bytestring')             # <<<<<<<<<<<<<<
+ * 
+ *         source_location = len(self._sources)
+ */
+  __pyx_tuple__13 = PyTuple_Pack(1, __pyx_kp_u_source_is_not_a_bytestring); if (unlikely(!__pyx_tuple__13)) __PYX_ERR(0, 253, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__13);
+  __Pyx_GIVEREF(__pyx_tuple__13);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":285
+ *         cdef delta_result res
+ *         if len(self._sources) != 1 or self._index != NULL:
+ *             raise AssertionError('_populate_first_index should only be'             # <<<<<<<<<<<<<<
+ *                 ' called when we have a single source and no index yet')
+ * 
+ */
+  __pyx_tuple__14 = PyTuple_Pack(1, __pyx_kp_u_populate_first_index_should_onl); if (unlikely(!__pyx_tuple__14)) __PYX_ERR(0, 285, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__14);
+  __Pyx_GIVEREF(__pyx_tuple__14);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":298
+ * 
+ *     cdef _expand_sources(self):
+ *         raise RuntimeError('if we move self._source_infos, then we need to'             # <<<<<<<<<<<<<<
+ *                            ' change all of the index pointers as well.')
+ * 
+ */
+  __pyx_tuple__15 = PyTuple_Pack(1, __pyx_kp_u_if_we_move_self__source_infos_th); if (unlikely(!__pyx_tuple__15)) __PYX_ERR(0, 298, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__15);
+  __Pyx_GIVEREF(__pyx_tuple__15);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":317
+ * 
+ *         if not PyBytes_CheckExact(target_bytes):
+ *             raise TypeError('target is not a bytestring')             # <<<<<<<<<<<<<<
+ * 
+ *         target = PyBytes_AS_STRING(target_bytes)
+ */
+  __pyx_tuple__16 = PyTuple_Pack(1, __pyx_kp_u_target_is_not_a_bytestring); if (unlikely(!__pyx_tuple__16)) __PYX_ERR(0, 317, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__16);
+  __Pyx_GIVEREF(__pyx_tuple__16);
+
+  /* "(tree fragment)":2
+ * def __reduce_cython__(self):
+ *     raise TypeError("self._index,self._source_infos cannot be converted to a Python object for pickling")             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("self._index,self._source_infos cannot be converted to a Python object for pickling")
+ */
+  __pyx_tuple__17 = PyTuple_Pack(1, __pyx_kp_s_self__index_self__source_infos_c); if (unlikely(!__pyx_tuple__17)) __PYX_ERR(1, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__17);
+  __Pyx_GIVEREF(__pyx_tuple__17);
+
+  /* "(tree fragment)":4
+ *     raise TypeError("self._index,self._source_infos cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("self._index,self._source_infos cannot be converted to a Python object for pickling")             # <<<<<<<<<<<<<<
+ */
+  __pyx_tuple__18 = PyTuple_Pack(1, __pyx_kp_s_self__index_self__source_infos_c); if (unlikely(!__pyx_tuple__18)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__18);
+  __Pyx_GIVEREF(__pyx_tuple__18);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":473
+ *                 % (cp_off, cp_size, source_size, size))
+ *         elif failed == 2:
+ *             raise ValueError('Got delta opcode: 0, not supported')             # <<<<<<<<<<<<<<
+ *         elif failed == 3:
+ *             raise ValueError('Insert instruction longer than remaining'
+ */
+  __pyx_tuple__19 = PyTuple_Pack(1, __pyx_kp_u_Got_delta_opcode_0_not_supported); if (unlikely(!__pyx_tuple__19)) __PYX_ERR(0, 473, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__19);
+  __Pyx_GIVEREF(__pyx_tuple__19);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":486
+ *     # *dst_size = out - dst_buf;
+ *     if (out - dst_buf) != PyBytes_GET_SIZE(result):
+ *         raise RuntimeError('Number of bytes extracted did not match the'             # <<<<<<<<<<<<<<
+ *             ' size encoded in the delta header.')
+ *     return result
+ */
+  __pyx_tuple__21 = PyTuple_Pack(1, __pyx_kp_u_Number_of_bytes_extracted_did_no); if (unlikely(!__pyx_tuple__21)) __PYX_ERR(0, 486, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__21);
+  __Pyx_GIVEREF(__pyx_tuple__21);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":500
+ * 
+ *     if not PyBytes_CheckExact(source):
+ *         raise TypeError('source is not a str')             # <<<<<<<<<<<<<<
+ *     c_source_size = PyBytes_GET_SIZE(source)
+ *     c_delta_start = delta_start
+ */
+  __pyx_tuple__22 = PyTuple_Pack(1, __pyx_kp_u_source_is_not_a_str); if (unlikely(!__pyx_tuple__22)) __PYX_ERR(0, 500, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__22);
+  __Pyx_GIVEREF(__pyx_tuple__22);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":505
+ *     c_delta_end = delta_end
+ *     if c_delta_start >= c_source_size:
+ *         raise ValueError('delta starts after source')             # <<<<<<<<<<<<<<
+ *     if c_delta_end > c_source_size:
+ *         raise ValueError('delta ends after source')
+ */
+  __pyx_tuple__23 = PyTuple_Pack(1, __pyx_kp_u_delta_starts_after_source); if (unlikely(!__pyx_tuple__23)) __PYX_ERR(0, 505, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__23);
+  __Pyx_GIVEREF(__pyx_tuple__23);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":507
+ *         raise ValueError('delta starts after source')
+ *     if c_delta_end > c_source_size:
+ *         raise ValueError('delta ends after source')             # <<<<<<<<<<<<<<
+ *     if c_delta_start >= c_delta_end:
+ *         raise ValueError('delta starts after it ends')
+ */
+  __pyx_tuple__24 = PyTuple_Pack(1, __pyx_kp_u_delta_ends_after_source); if (unlikely(!__pyx_tuple__24)) __PYX_ERR(0, 507, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__24);
+  __Pyx_GIVEREF(__pyx_tuple__24);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":509
+ *         raise ValueError('delta ends after source')
+ *     if c_delta_start >= c_delta_end:
+ *         raise ValueError('delta starts after it ends')             # <<<<<<<<<<<<<<
+ * 
+ *     c_delta_size = c_delta_end - c_delta_start
+ */
+  __pyx_tuple__25 = PyTuple_Pack(1, __pyx_kp_u_delta_starts_after_it_ends); if (unlikely(!__pyx_tuple__25)) __PYX_ERR(0, 509, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__25);
+  __Pyx_GIVEREF(__pyx_tuple__25);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":533
+ *         count = count + 1
+ *     if count >= 8 or c_val >= 0x80:
+ *         raise ValueError('encode_base128_int overflowed the buffer')             # <<<<<<<<<<<<<<
+ *     c_bytes[count] = <unsigned char>(c_val & 0xFF)
+ *     count = count + 1
+ */
+  __pyx_tuple__26 = PyTuple_Pack(1, __pyx_kp_u_encode_base128_int_overflowed_th); if (unlikely(!__pyx_tuple__26)) __PYX_ERR(0, 533, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__26);
+  __Pyx_GIVEREF(__pyx_tuple__26);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":552
+ *     shift = 0
+ *     if not PyBytes_CheckExact(data):
+ *         raise TypeError('bytes is not a string')             # <<<<<<<<<<<<<<
+ *     c_bytes = <unsigned char*>PyBytes_AS_STRING(data)
+ *     # We take off 1, because we have to be able to decode the non-expanded byte
+ */
+  __pyx_tuple__27 = PyTuple_Pack(1, __pyx_kp_u_bytes_is_not_a_string); if (unlikely(!__pyx_tuple__27)) __PYX_ERR(0, 552, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__27);
+  __Pyx_GIVEREF(__pyx_tuple__27);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":561
+ *         offset = offset + 1
+ *     if c_bytes[offset] & 0x80:
+ *         raise ValueError('Data not properly formatted, we ran out of'             # <<<<<<<<<<<<<<
+ *                          ' bytes before 0x80 stopped being set.')
+ *     val = val | (c_bytes[offset] << shift)
+ */
+  __pyx_tuple__28 = PyTuple_Pack(1, __pyx_kp_u_Data_not_properly_formatted_we_r); if (unlikely(!__pyx_tuple__28)) __PYX_ERR(0, 561, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__28);
+  __Pyx_GIVEREF(__pyx_tuple__28);
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":85
+ * 
+ * 
+ * def make_delta_index(source):             # <<<<<<<<<<<<<<
+ *     return DeltaIndex(source)
+ * 
+ */
+  __pyx_tuple__29 = PyTuple_Pack(1, __pyx_n_s_source); if (unlikely(!__pyx_tuple__29)) __PYX_ERR(0, 85, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__29);
+  __Pyx_GIVEREF(__pyx_tuple__29);
+  __pyx_codeobj__30 = (PyObject*)__Pyx_PyCode_New(1, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__29, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_breezy_bzr__groupcompress_pyx_py, __pyx_n_s_make_delta_index, 85, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__30)) __PYX_ERR(0, 85, __pyx_L1_error)
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":103
+ * 
+ * 
+ * def _rabin_hash(content):             # <<<<<<<<<<<<<<
+ *     if not PyBytes_CheckExact(content):
+ *         raise ValueError('content must be a string')
+ */
+  __pyx_tuple__31 = PyTuple_Pack(1, __pyx_n_s_content); if (unlikely(!__pyx_tuple__31)) __PYX_ERR(0, 103, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__31);
+  __Pyx_GIVEREF(__pyx_tuple__31);
+  __pyx_codeobj__32 = (PyObject*)__Pyx_PyCode_New(1, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__31, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_breezy_bzr__groupcompress_pyx_py, __pyx_n_s_rabin_hash, 103, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__32)) __PYX_ERR(0, 103, __pyx_L1_error)
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":338
+ * 
+ * 
+ * def make_delta(source_bytes, target_bytes):             # <<<<<<<<<<<<<<
+ *     """Create a delta, this is a wrapper around DeltaIndex.make_delta."""
+ *     di = DeltaIndex(source_bytes)
+ */
+  __pyx_tuple__33 = PyTuple_Pack(3, __pyx_n_s_source_bytes, __pyx_n_s_target_bytes, __pyx_n_s_di); if (unlikely(!__pyx_tuple__33)) __PYX_ERR(0, 338, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__33);
+  __Pyx_GIVEREF(__pyx_tuple__33);
+  __pyx_codeobj__34 = (PyObject*)__Pyx_PyCode_New(2, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__33, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_breezy_bzr__groupcompress_pyx_py, __pyx_n_s_make_delta, 338, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__34)) __PYX_ERR(0, 338, __pyx_L1_error)
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":344
+ * 
+ * 
+ * def apply_delta(source_bytes, delta_bytes):             # <<<<<<<<<<<<<<
+ *     """Apply a delta generated by make_delta to source_bytes."""
+ *     cdef char *source
+ */
+  __pyx_tuple__35 = PyTuple_Pack(6, __pyx_n_s_source_bytes, __pyx_n_s_delta_bytes, __pyx_n_s_source, __pyx_n_s_source_size_2, __pyx_n_s_delta, __pyx_n_s_delta_size_2); if (unlikely(!__pyx_tuple__35)) __PYX_ERR(0, 344, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__35);
+  __Pyx_GIVEREF(__pyx_tuple__35);
+  __pyx_codeobj__36 = (PyObject*)__Pyx_PyCode_New(2, 0, 6, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__35, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_breezy_bzr__groupcompress_pyx_py, __pyx_n_s_apply_delta, 344, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__36)) __PYX_ERR(0, 344, __pyx_L1_error)
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":491
+ * 
+ * 
+ * def apply_delta_to_source(source, delta_start, delta_end):             # <<<<<<<<<<<<<<
+ *     """Extract a delta from source bytes, and apply it."""
+ *     cdef char *c_source
+ */
+  __pyx_tuple__37 = PyTuple_Pack(9, __pyx_n_s_source, __pyx_n_s_delta_start, __pyx_n_s_delta_end, __pyx_n_s_c_source, __pyx_n_s_c_source_size, __pyx_n_s_c_delta, __pyx_n_s_c_delta_size, __pyx_n_s_c_delta_start, __pyx_n_s_c_delta_end); if (unlikely(!__pyx_tuple__37)) __PYX_ERR(0, 491, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__37);
+  __Pyx_GIVEREF(__pyx_tuple__37);
+  __pyx_codeobj__38 = (PyObject*)__Pyx_PyCode_New(3, 0, 9, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__37, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_breezy_bzr__groupcompress_pyx_py, __pyx_n_s_apply_delta_to_source, 491, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__38)) __PYX_ERR(0, 491, __pyx_L1_error)
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":519
+ * 
+ * 
+ * def encode_base128_int(val):             # <<<<<<<<<<<<<<
+ *     """Convert an integer into a 7-bit lsb encoding."""
+ *     cdef unsigned int c_val
+ */
+  __pyx_tuple__39 = PyTuple_Pack(5, __pyx_n_s_val, __pyx_n_s_c_val, __pyx_n_s_count, __pyx_n_s_num_bytes, __pyx_n_s_c_bytes); if (unlikely(!__pyx_tuple__39)) __PYX_ERR(0, 519, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__39);
+  __Pyx_GIVEREF(__pyx_tuple__39);
+  __pyx_codeobj__40 = (PyObject*)__Pyx_PyCode_New(1, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__39, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_breezy_bzr__groupcompress_pyx_py, __pyx_n_s_encode_base128_int, 519, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__40)) __PYX_ERR(0, 519, __pyx_L1_error)
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":539
+ * 
+ * 
+ * def decode_base128_int(data):             # <<<<<<<<<<<<<<
+ *     """Decode an integer from a 7-bit lsb encoding."""
+ *     cdef int offset
+ */
+  __pyx_tuple__41 = PyTuple_Pack(7, __pyx_n_s_data, __pyx_n_s_offset, __pyx_n_s_val, __pyx_n_s_uval, __pyx_n_s_shift, __pyx_n_s_num_low_bytes, __pyx_n_s_c_bytes); if (unlikely(!__pyx_tuple__41)) __PYX_ERR(0, 539, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__41);
+  __Pyx_GIVEREF(__pyx_tuple__41);
+  __pyx_codeobj__42 = (PyObject*)__Pyx_PyCode_New(1, 0, 7, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__41, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_breezy_bzr__groupcompress_pyx_py, __pyx_n_s_decode_base128_int, 539, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__42)) __PYX_ERR(0, 539, __pyx_L1_error)
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static CYTHON_SMALL_CODE int __Pyx_InitGlobals(void) {
+  if (__Pyx_InitStrings(__pyx_string_tab) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_0 = PyInt_FromLong(0); if (unlikely(!__pyx_int_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+
+static CYTHON_SMALL_CODE int __Pyx_modinit_global_init_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_variable_export_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_function_export_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_type_init_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_type_import_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_variable_import_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_function_import_code(void); /*proto*/
+
+static int __Pyx_modinit_global_init_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_global_init_code", 0);
+  /*--- Global init code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_variable_export_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_export_code", 0);
+  /*--- Variable export code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_function_export_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_function_export_code", 0);
+  /*--- Function export code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_type_init_code(void) {
+  __Pyx_RefNannyDeclarations
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__Pyx_modinit_type_init_code", 0);
+  /*--- Type init code ---*/
+  __pyx_vtabptr_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex = &__pyx_vtable_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex;
+  __pyx_vtable_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex._populate_first_index = (PyObject *(*)(struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *))__pyx_f_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex__populate_first_index;
+  __pyx_vtable_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex._expand_sources = (PyObject *(*)(struct __pyx_obj_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex *))__pyx_f_6breezy_3bzr_18_groupcompress_pyx_10DeltaIndex__expand_sources;
+  if (PyType_Ready(&__pyx_type_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex) < 0) __PYX_ERR(0, 112, __pyx_L1_error)
+  #if PY_VERSION_HEX < 0x030800B1
+  __pyx_type_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex.tp_print = 0;
+  #endif
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex.tp_dictoffset && __pyx_type_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex.tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_type_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex.tp_getattro = __Pyx_PyObject_GenericGetAttr;
+  }
+  if (__Pyx_SetVtable(__pyx_type_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex.tp_dict, __pyx_vtabptr_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex) < 0) __PYX_ERR(0, 112, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_DeltaIndex, (PyObject *)&__pyx_type_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex) < 0) __PYX_ERR(0, 112, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex) < 0) __PYX_ERR(0, 112, __pyx_L1_error)
+  __pyx_ptype_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex = &__pyx_type_6breezy_3bzr_18_groupcompress_pyx_DeltaIndex;
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static int __Pyx_modinit_type_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__Pyx_modinit_type_import_code", 0);
+  /*--- Type import code ---*/
+  __pyx_t_1 = PyImport_ImportModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 9, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_7cpython_4type_type = __Pyx_ImportType_0_29_37(__pyx_t_1, __Pyx_BUILTIN_MODULE_NAME, "type", 
+  #if defined(PYPY_VERSION_NUM) && PYPY_VERSION_NUM < 0x050B0000
+  sizeof(PyTypeObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyTypeObject),
+  #else
+  sizeof(PyHeapTypeObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyHeapTypeObject),
+  #endif
+  __Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_7cpython_4type_type) __PYX_ERR(2, 9, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static int __Pyx_modinit_variable_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_import_code", 0);
+  /*--- Variable import code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_function_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_function_import_code", 0);
+  /*--- Function import code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+
+#ifndef CYTHON_NO_PYINIT_EXPORT
+#define __Pyx_PyMODINIT_FUNC PyMODINIT_FUNC
+#elif PY_MAJOR_VERSION < 3
+#ifdef __cplusplus
+#define __Pyx_PyMODINIT_FUNC extern "C" void
+#else
+#define __Pyx_PyMODINIT_FUNC void
+#endif
+#else
+#ifdef __cplusplus
+#define __Pyx_PyMODINIT_FUNC extern "C" PyObject *
+#else
+#define __Pyx_PyMODINIT_FUNC PyObject *
+#endif
+#endif
+
+
+#if PY_MAJOR_VERSION < 3
+__Pyx_PyMODINIT_FUNC init_groupcompress_pyx(void) CYTHON_SMALL_CODE; /*proto*/
+__Pyx_PyMODINIT_FUNC init_groupcompress_pyx(void)
+#else
+__Pyx_PyMODINIT_FUNC PyInit__groupcompress_pyx(void) CYTHON_SMALL_CODE; /*proto*/
+__Pyx_PyMODINIT_FUNC PyInit__groupcompress_pyx(void)
+#if CYTHON_PEP489_MULTI_PHASE_INIT
+{
+  return PyModuleDef_Init(&__pyx_moduledef);
+}
+static CYTHON_SMALL_CODE int __Pyx_check_single_interpreter(void) {
+    #if PY_VERSION_HEX >= 0x030700A1
+    static PY_INT64_T main_interpreter_id = -1;
+    PY_INT64_T current_id = PyInterpreterState_GetID(PyThreadState_Get()->interp);
+    if (main_interpreter_id == -1) {
+        main_interpreter_id = current_id;
+        return (unlikely(current_id == -1)) ? -1 : 0;
+    } else if (unlikely(main_interpreter_id != current_id))
+    #else
+    static PyInterpreterState *main_interpreter = NULL;
+    PyInterpreterState *current_interpreter = PyThreadState_Get()->interp;
+    if (!main_interpreter) {
+        main_interpreter = current_interpreter;
+    } else if (unlikely(main_interpreter != current_interpreter))
+    #endif
+    {
+        PyErr_SetString(
+            PyExc_ImportError,
+            "Interpreter change detected - this module can only be loaded into one interpreter per process.");
+        return -1;
+    }
+    return 0;
+}
+static CYTHON_SMALL_CODE int __Pyx_copy_spec_to_module(PyObject *spec, PyObject *moddict, const char* from_name, const char* to_name, int allow_none) {
+    PyObject *value = PyObject_GetAttrString(spec, from_name);
+    int result = 0;
+    if (likely(value)) {
+        if (allow_none || value != Py_None) {
+            result = PyDict_SetItemString(moddict, to_name, value);
+        }
+        Py_DECREF(value);
+    } else if (PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        PyErr_Clear();
+    } else {
+        result = -1;
+    }
+    return result;
+}
+static CYTHON_SMALL_CODE PyObject* __pyx_pymod_create(PyObject *spec, CYTHON_UNUSED PyModuleDef *def) {
+    PyObject *module = NULL, *moddict, *modname;
+    if (__Pyx_check_single_interpreter())
+        return NULL;
+    if (__pyx_m)
+        return __Pyx_NewRef(__pyx_m);
+    modname = PyObject_GetAttrString(spec, "name");
+    if (unlikely(!modname)) goto bad;
+    module = PyModule_NewObject(modname);
+    Py_DECREF(modname);
+    if (unlikely(!module)) goto bad;
+    moddict = PyModule_GetDict(module);
+    if (unlikely(!moddict)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "loader", "__loader__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "origin", "__file__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "parent", "__package__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "submodule_search_locations", "__path__", 0) < 0)) goto bad;
+    return module;
+bad:
+    Py_XDECREF(module);
+    return NULL;
+}
+
+
+static CYTHON_SMALL_CODE int __pyx_pymod_exec__groupcompress_pyx(PyObject *__pyx_pyinit_module)
+#endif
+#endif
+{
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannyDeclarations
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  if (__pyx_m) {
+    if (__pyx_m == __pyx_pyinit_module) return 0;
+    PyErr_SetString(PyExc_RuntimeError, "Module '_groupcompress_pyx' has already been imported. Re-initialisation is not supported.");
+    return -1;
+  }
+  #elif PY_MAJOR_VERSION >= 3
+  if (__pyx_m) return __Pyx_NewRef(__pyx_m);
+  #endif
+  #if CYTHON_REFNANNY
+__Pyx_RefNanny = __Pyx_RefNannyImportAPI("refnanny");
+if (!__Pyx_RefNanny) {
+  PyErr_Clear();
+  __Pyx_RefNanny = __Pyx_RefNannyImportAPI("Cython.Runtime.refnanny");
+  if (!__Pyx_RefNanny)
+      Py_FatalError("failed to import 'refnanny' module");
+}
+#endif
+  __Pyx_RefNannySetupContext("__Pyx_PyMODINIT_FUNC PyInit__groupcompress_pyx(void)", 0);
+  if (__Pyx_check_binary_version() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #ifdef __Pxy_PyFrame_Initialize_Offsets
+  __Pxy_PyFrame_Initialize_Offsets();
+  #endif
+  __pyx_empty_tuple = PyTuple_New(0); if (unlikely(!__pyx_empty_tuple)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_empty_bytes = PyBytes_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_bytes)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_empty_unicode = PyUnicode_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_unicode)) __PYX_ERR(0, 1, __pyx_L1_error)
+  #ifdef __Pyx_CyFunction_USED
+  if (__pyx_CyFunction_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_FusedFunction_USED
+  if (__pyx_FusedFunction_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_Coroutine_USED
+  if (__pyx_Coroutine_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_Generator_USED
+  if (__pyx_Generator_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_AsyncGen_USED
+  if (__pyx_AsyncGen_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_StopAsyncIteration_USED
+  if (__pyx_StopAsyncIteration_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  /*--- Library function declarations ---*/
+  /*--- Threads initialization code ---*/
+  #if defined(WITH_THREAD) && PY_VERSION_HEX < 0x030700F0 && defined(__PYX_FORCE_INIT_THREADS) && __PYX_FORCE_INIT_THREADS
+  PyEval_InitThreads();
+  #endif
+  /*--- Module creation code ---*/
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  __pyx_m = __pyx_pyinit_module;
+  Py_INCREF(__pyx_m);
+  #else
+  #if PY_MAJOR_VERSION < 3
+  __pyx_m = Py_InitModule4("_groupcompress_pyx", __pyx_methods, __pyx_k_Compiled_extensions_for_doing_co, 0, PYTHON_API_VERSION); Py_XINCREF(__pyx_m);
+  #else
+  __pyx_m = PyModule_Create(&__pyx_moduledef);
+  #endif
+  if (unlikely(!__pyx_m)) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  __pyx_d = PyModule_GetDict(__pyx_m); if (unlikely(!__pyx_d)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_d);
+  __pyx_b = PyImport_AddModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_b)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_b);
+  __pyx_cython_runtime = PyImport_AddModule((char *) "cython_runtime"); if (unlikely(!__pyx_cython_runtime)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_cython_runtime);
+  if (PyObject_SetAttrString(__pyx_m, "__builtins__", __pyx_b) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Initialize various global constants etc. ---*/
+  if (__Pyx_InitGlobals() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #if PY_MAJOR_VERSION < 3 && (__PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT)
+  if (__Pyx_init_sys_getdefaultencoding_params() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  if (__pyx_module_is_main_breezy__bzr___groupcompress_pyx) {
+    if (PyObject_SetAttr(__pyx_m, __pyx_n_s_name, __pyx_n_s_main) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  }
+  #if PY_MAJOR_VERSION >= 3
+  {
+    PyObject *modules = PyImport_GetModuleDict(); if (unlikely(!modules)) __PYX_ERR(0, 1, __pyx_L1_error)
+    if (!PyDict_GetItemString(modules, "breezy.bzr._groupcompress_pyx")) {
+      if (unlikely(PyDict_SetItemString(modules, "breezy.bzr._groupcompress_pyx", __pyx_m) < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+    }
+  }
+  #endif
+  /*--- Builtin init code ---*/
+  if (__Pyx_InitCachedBuiltins() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Constants init code ---*/
+  if (__Pyx_InitCachedConstants() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Global type/function init code ---*/
+  (void)__Pyx_modinit_global_init_code();
+  (void)__Pyx_modinit_variable_export_code();
+  (void)__Pyx_modinit_function_export_code();
+  if (unlikely(__Pyx_modinit_type_init_code() < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (unlikely(__Pyx_modinit_type_import_code() < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  (void)__Pyx_modinit_variable_import_code();
+  (void)__Pyx_modinit_function_import_code();
+  /*--- Execution code ---*/
+  #if defined(__Pyx_Generator_USED) || defined(__Pyx_Coroutine_USED)
+  if (__Pyx_patch_abc() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":85
+ * 
+ * 
+ * def make_delta_index(source):             # <<<<<<<<<<<<<<
+ *     return DeltaIndex(source)
+ * 
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_6breezy_3bzr_18_groupcompress_pyx_1make_delta_index, NULL, __pyx_n_s_breezy_bzr__groupcompress_pyx); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 85, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_make_delta_index, __pyx_t_1) < 0) __PYX_ERR(0, 85, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":103
+ * 
+ * 
+ * def _rabin_hash(content):             # <<<<<<<<<<<<<<
+ *     if not PyBytes_CheckExact(content):
+ *         raise ValueError('content must be a string')
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_6breezy_3bzr_18_groupcompress_pyx_3_rabin_hash, NULL, __pyx_n_s_breezy_bzr__groupcompress_pyx); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 103, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_rabin_hash, __pyx_t_1) < 0) __PYX_ERR(0, 103, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":338
+ * 
+ * 
+ * def make_delta(source_bytes, target_bytes):             # <<<<<<<<<<<<<<
+ *     """Create a delta, this is a wrapper around DeltaIndex.make_delta."""
+ *     di = DeltaIndex(source_bytes)
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_6breezy_3bzr_18_groupcompress_pyx_5make_delta, NULL, __pyx_n_s_breezy_bzr__groupcompress_pyx); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 338, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_make_delta, __pyx_t_1) < 0) __PYX_ERR(0, 338, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":344
+ * 
+ * 
+ * def apply_delta(source_bytes, delta_bytes):             # <<<<<<<<<<<<<<
+ *     """Apply a delta generated by make_delta to source_bytes."""
+ *     cdef char *source
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_6breezy_3bzr_18_groupcompress_pyx_7apply_delta, NULL, __pyx_n_s_breezy_bzr__groupcompress_pyx); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 344, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_apply_delta, __pyx_t_1) < 0) __PYX_ERR(0, 344, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":491
+ * 
+ * 
+ * def apply_delta_to_source(source, delta_start, delta_end):             # <<<<<<<<<<<<<<
+ *     """Extract a delta from source bytes, and apply it."""
+ *     cdef char *c_source
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_6breezy_3bzr_18_groupcompress_pyx_9apply_delta_to_source, NULL, __pyx_n_s_breezy_bzr__groupcompress_pyx); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 491, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_apply_delta_to_source, __pyx_t_1) < 0) __PYX_ERR(0, 491, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":519
+ * 
+ * 
+ * def encode_base128_int(val):             # <<<<<<<<<<<<<<
+ *     """Convert an integer into a 7-bit lsb encoding."""
+ *     cdef unsigned int c_val
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_6breezy_3bzr_18_groupcompress_pyx_11encode_base128_int, NULL, __pyx_n_s_breezy_bzr__groupcompress_pyx); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 519, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_encode_base128_int, __pyx_t_1) < 0) __PYX_ERR(0, 519, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":539
+ * 
+ * 
+ * def decode_base128_int(data):             # <<<<<<<<<<<<<<
+ *     """Decode an integer from a 7-bit lsb encoding."""
+ *     cdef int offset
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_6breezy_3bzr_18_groupcompress_pyx_13decode_base128_int, NULL, __pyx_n_s_breezy_bzr__groupcompress_pyx); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 539, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_decode_base128_int, __pyx_t_1) < 0) __PYX_ERR(0, 539, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "breezy/bzr/_groupcompress_pyx.pyx":1
+ * # Copyright (C) 2008, 2009, 2010 Canonical Ltd             # <<<<<<<<<<<<<<
+ * #
+ * # This program is free software; you can redistribute it and/or modify
+ */
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_1) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /*--- Wrapped vars code ---*/
+
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  if (__pyx_m) {
+    if (__pyx_d) {
+      __Pyx_AddTraceback("init breezy.bzr._groupcompress_pyx", __pyx_clineno, __pyx_lineno, __pyx_filename);
+    }
+    Py_CLEAR(__pyx_m);
+  } else if (!PyErr_Occurred()) {
+    PyErr_SetString(PyExc_ImportError, "init breezy.bzr._groupcompress_pyx");
+  }
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  return (__pyx_m != NULL) ? 0 : -1;
+  #elif PY_MAJOR_VERSION >= 3
+  return __pyx_m;
+  #else
+  return;
+  #endif
+}
+
+/* --- Runtime support code --- */
+/* Refnanny */
+#if CYTHON_REFNANNY
+static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname) {
+    PyObject *m = NULL, *p = NULL;
+    void *r = NULL;
+    m = PyImport_ImportModule(modname);
+    if (!m) goto end;
+    p = PyObject_GetAttrString(m, "RefNannyAPI");
+    if (!p) goto end;
+    r = PyLong_AsVoidPtr(p);
+end:
+    Py_XDECREF(p);
+    Py_XDECREF(m);
+    return (__Pyx_RefNannyAPIStruct *)r;
+}
+#endif
+
+/* PyObjectGetAttrStr */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name) {
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro))
+        return tp->tp_getattro(obj, attr_name);
+#if PY_MAJOR_VERSION < 3
+    if (likely(tp->tp_getattr))
+        return tp->tp_getattr(obj, PyString_AS_STRING(attr_name));
+#endif
+    return PyObject_GetAttr(obj, attr_name);
+}
+#endif
+
+/* GetBuiltinName */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name) {
+    PyObject* result = __Pyx_PyObject_GetAttrStr(__pyx_b, name);
+    if (unlikely(!result)) {
+        PyErr_Format(PyExc_NameError,
+#if PY_MAJOR_VERSION >= 3
+            "name '%U' is not defined", name);
+#else
+            "name '%.200s' is not defined", PyString_AS_STRING(name));
+#endif
+    }
+    return result;
+}
+
+/* PyCFunctionFastCall */
+#if CYTHON_FAST_PYCCALL
+static CYTHON_INLINE PyObject * __Pyx_PyCFunction_FastCall(PyObject *func_obj, PyObject **args, Py_ssize_t nargs) {
+    PyCFunctionObject *func = (PyCFunctionObject*)func_obj;
+    PyCFunction meth = PyCFunction_GET_FUNCTION(func);
+    PyObject *self = PyCFunction_GET_SELF(func);
+    int flags = PyCFunction_GET_FLAGS(func);
+    assert(PyCFunction_Check(func));
+    assert(METH_FASTCALL == (flags & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS | METH_STACKLESS)));
+    assert(nargs >= 0);
+    assert(nargs == 0 || args != NULL);
+    /* _PyCFunction_FastCallDict() must not be called with an exception set,
+       because it may clear it (directly or indirectly) and so the
+       caller loses its exception */
+    assert(!PyErr_Occurred());
+    if ((PY_VERSION_HEX < 0x030700A0) || unlikely(flags & METH_KEYWORDS)) {
+        return (*((__Pyx_PyCFunctionFastWithKeywords)(void*)meth)) (self, args, nargs, NULL);
+    } else {
+        return (*((__Pyx_PyCFunctionFast)(void*)meth)) (self, args, nargs);
+    }
+}
+#endif
+
+/* PyFunctionFastCall */
+#if CYTHON_FAST_PYCALL
+static PyObject* __Pyx_PyFunction_FastCallNoKw(PyCodeObject *co, PyObject **args, Py_ssize_t na,
+                                               PyObject *globals) {
+    PyFrameObject *f;
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject **fastlocals;
+    Py_ssize_t i;
+    PyObject *result;
+    assert(globals != NULL);
+    /* XXX Perhaps we should create a specialized
+       PyFrame_New() that doesn't take locals, but does
+       take builtins without sanity checking them.
+       */
+    assert(tstate != NULL);
+    f = PyFrame_New(tstate, co, globals, NULL);
+    if (f == NULL) {
+        return NULL;
+    }
+    fastlocals = __Pyx_PyFrame_GetLocalsplus(f);
+    for (i = 0; i < na; i++) {
+        Py_INCREF(*args);
+        fastlocals[i] = *args++;
+    }
+    result = PyEval_EvalFrameEx(f,0);
+    ++tstate->recursion_depth;
+    Py_DECREF(f);
+    --tstate->recursion_depth;
+    return result;
+}
+#if 1 || PY_VERSION_HEX < 0x030600B1
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, Py_ssize_t nargs, PyObject *kwargs) {
+    PyCodeObject *co = (PyCodeObject *)PyFunction_GET_CODE(func);
+    PyObject *globals = PyFunction_GET_GLOBALS(func);
+    PyObject *argdefs = PyFunction_GET_DEFAULTS(func);
+    PyObject *closure;
+#if PY_MAJOR_VERSION >= 3
+    PyObject *kwdefs;
+#endif
+    PyObject *kwtuple, **k;
+    PyObject **d;
+    Py_ssize_t nd;
+    Py_ssize_t nk;
+    PyObject *result;
+    assert(kwargs == NULL || PyDict_Check(kwargs));
+    nk = kwargs ? PyDict_Size(kwargs) : 0;
+    if (Py_EnterRecursiveCall((char*)" while calling a Python object")) {
+        return NULL;
+    }
+    if (
+#if PY_MAJOR_VERSION >= 3
+            co->co_kwonlyargcount == 0 &&
+#endif
+            likely(kwargs == NULL || nk == 0) &&
+            co->co_flags == (CO_OPTIMIZED | CO_NEWLOCALS | CO_NOFREE)) {
+        if (argdefs == NULL && co->co_argcount == nargs) {
+            result = __Pyx_PyFunction_FastCallNoKw(co, args, nargs, globals);
+            goto done;
+        }
+        else if (nargs == 0 && argdefs != NULL
+                 && co->co_argcount == Py_SIZE(argdefs)) {
+            /* function called with no arguments, but all parameters have
+               a default value: use default values as arguments .*/
+            args = &PyTuple_GET_ITEM(argdefs, 0);
+            result =__Pyx_PyFunction_FastCallNoKw(co, args, Py_SIZE(argdefs), globals);
+            goto done;
+        }
+    }
+    if (kwargs != NULL) {
+        Py_ssize_t pos, i;
+        kwtuple = PyTuple_New(2 * nk);
+        if (kwtuple == NULL) {
+            result = NULL;
+            goto done;
+        }
+        k = &PyTuple_GET_ITEM(kwtuple, 0);
+        pos = i = 0;
+        while (PyDict_Next(kwargs, &pos, &k[i], &k[i+1])) {
+            Py_INCREF(k[i]);
+            Py_INCREF(k[i+1]);
+            i += 2;
+        }
+        nk = i / 2;
+    }
+    else {
+        kwtuple = NULL;
+        k = NULL;
+    }
+    closure = PyFunction_GET_CLOSURE(func);
+#if PY_MAJOR_VERSION >= 3
+    kwdefs = PyFunction_GET_KW_DEFAULTS(func);
+#endif
+    if (argdefs != NULL) {
+        d = &PyTuple_GET_ITEM(argdefs, 0);
+        nd = Py_SIZE(argdefs);
+    }
+    else {
+        d = NULL;
+        nd = 0;
+    }
+#if PY_MAJOR_VERSION >= 3
+    result = PyEval_EvalCodeEx((PyObject*)co, globals, (PyObject *)NULL,
+                               args, (int)nargs,
+                               k, (int)nk,
+                               d, (int)nd, kwdefs, closure);
+#else
+    result = PyEval_EvalCodeEx(co, globals, (PyObject *)NULL,
+                               args, (int)nargs,
+                               k, (int)nk,
+                               d, (int)nd, closure);
+#endif
+    Py_XDECREF(kwtuple);
+done:
+    Py_LeaveRecursiveCall();
+    return result;
+}
+#endif
+#endif
+
+/* PyObjectCall */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw) {
+    PyObject *result;
+    ternaryfunc call = Py_TYPE(func)->tp_call;
+    if (unlikely(!call))
+        return PyObject_Call(func, arg, kw);
+    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
+        return NULL;
+    result = (*call)(func, arg, kw);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
+}
+#endif
+
+/* PyObjectCallMethO */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg) {
+    PyObject *self, *result;
+    PyCFunction cfunc;
+    cfunc = PyCFunction_GET_FUNCTION(func);
+    self = PyCFunction_GET_SELF(func);
+    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
+        return NULL;
+    result = cfunc(self, arg);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
+}
+#endif
+
+/* PyObjectCallOneArg */
+#if CYTHON_COMPILING_IN_CPYTHON
+static PyObject* __Pyx__PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+    PyObject *result;
+    PyObject *args = PyTuple_New(1);
+    if (unlikely(!args)) return NULL;
+    Py_INCREF(arg);
+    PyTuple_SET_ITEM(args, 0, arg);
+    result = __Pyx_PyObject_Call(func, args, NULL);
+    Py_DECREF(args);
+    return result;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+#if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(func)) {
+        return __Pyx_PyFunction_FastCall(func, &arg, 1);
+    }
+#endif
+    if (likely(PyCFunction_Check(func))) {
+        if (likely(PyCFunction_GET_FLAGS(func) & METH_O)) {
+            return __Pyx_PyObject_CallMethO(func, arg);
+#if CYTHON_FAST_PYCCALL
+        } else if (__Pyx_PyFastCFunction_Check(func)) {
+            return __Pyx_PyCFunction_FastCall(func, &arg, 1);
+#endif
+        }
+    }
+    return __Pyx__PyObject_CallOneArg(func, arg);
+}
+#else
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+    PyObject *result;
+    PyObject *args = PyTuple_Pack(1, arg);
+    if (unlikely(!args)) return NULL;
+    result = __Pyx_PyObject_Call(func, args, NULL);
+    Py_DECREF(args);
+    return result;
+}
+#endif
+
+/* PyErrFetchRestore */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    tmp_type = tstate->curexc_type;
+    tmp_value = tstate->curexc_value;
+    tmp_tb = tstate->curexc_traceback;
+    tstate->curexc_type = type;
+    tstate->curexc_value = value;
+    tstate->curexc_traceback = tb;
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+}
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+    *type = tstate->curexc_type;
+    *value = tstate->curexc_value;
+    *tb = tstate->curexc_traceback;
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+}
+#endif
+
+/* RaiseException */
+#if PY_MAJOR_VERSION < 3
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb,
+                        CYTHON_UNUSED PyObject *cause) {
+    __Pyx_PyThreadState_declare
+    Py_XINCREF(type);
+    if (!value || value == Py_None)
+        value = NULL;
+    else
+        Py_INCREF(value);
+    if (!tb || tb == Py_None)
+        tb = NULL;
+    else {
+        Py_INCREF(tb);
+        if (!PyTraceBack_Check(tb)) {
+            PyErr_SetString(PyExc_TypeError,
+                "raise: arg 3 must be a traceback or None");
+            goto raise_error;
+        }
+    }
+    if (PyType_Check(type)) {
+#if CYTHON_COMPILING_IN_PYPY
+        if (!value) {
+            Py_INCREF(Py_None);
+            value = Py_None;
+        }
+#endif
+        PyErr_NormalizeException(&type, &value, &tb);
+    } else {
+        if (value) {
+            PyErr_SetString(PyExc_TypeError,
+                "instance exception may not have a separate value");
+            goto raise_error;
+        }
+        value = type;
+        type = (PyObject*) Py_TYPE(type);
+        Py_INCREF(type);
+        if (!PyType_IsSubtype((PyTypeObject *)type, (PyTypeObject *)PyExc_BaseException)) {
+            PyErr_SetString(PyExc_TypeError,
+                "raise: exception class must be a subclass of BaseException");
+            goto raise_error;
+        }
+    }
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrRestore(type, value, tb);
+    return;
+raise_error:
+    Py_XDECREF(value);
+    Py_XDECREF(type);
+    Py_XDECREF(tb);
+    return;
+}
+#else
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause) {
+    PyObject* owned_instance = NULL;
+    if (tb == Py_None) {
+        tb = 0;
+    } else if (tb && !PyTraceBack_Check(tb)) {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: arg 3 must be a traceback or None");
+        goto bad;
+    }
+    if (value == Py_None)
+        value = 0;
+    if (PyExceptionInstance_Check(type)) {
+        if (value) {
+            PyErr_SetString(PyExc_TypeError,
+                "instance exception may not have a separate value");
+            goto bad;
+        }
+        value = type;
+        type = (PyObject*) Py_TYPE(value);
+    } else if (PyExceptionClass_Check(type)) {
+        PyObject *instance_class = NULL;
+        if (value && PyExceptionInstance_Check(value)) {
+            instance_class = (PyObject*) Py_TYPE(value);
+            if (instance_class != type) {
+                int is_subclass = PyObject_IsSubclass(instance_class, type);
+                if (!is_subclass) {
+                    instance_class = NULL;
+                } else if (unlikely(is_subclass == -1)) {
+                    goto bad;
+                } else {
+                    type = instance_class;
+                }
+            }
+        }
+        if (!instance_class) {
+            PyObject *args;
+            if (!value)
+                args = PyTuple_New(0);
+            else if (PyTuple_Check(value)) {
+                Py_INCREF(value);
+                args = value;
+            } else
+                args = PyTuple_Pack(1, value);
+            if (!args)
+                goto bad;
+            owned_instance = PyObject_Call(type, args, NULL);
+            Py_DECREF(args);
+            if (!owned_instance)
+                goto bad;
+            value = owned_instance;
+            if (!PyExceptionInstance_Check(value)) {
+                PyErr_Format(PyExc_TypeError,
+                             "calling %R should have returned an instance of "
+                             "BaseException, not %R",
+                             type, Py_TYPE(value));
+                goto bad;
+            }
+        }
+    } else {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: exception class must be a subclass of BaseException");
+        goto bad;
+    }
+    if (cause) {
+        PyObject *fixed_cause;
+        if (cause == Py_None) {
+            fixed_cause = NULL;
+        } else if (PyExceptionClass_Check(cause)) {
+            fixed_cause = PyObject_CallObject(cause, NULL);
+            if (fixed_cause == NULL)
+                goto bad;
+        } else if (PyExceptionInstance_Check(cause)) {
+            fixed_cause = cause;
+            Py_INCREF(fixed_cause);
+        } else {
+            PyErr_SetString(PyExc_TypeError,
+                            "exception causes must derive from "
+                            "BaseException");
+            goto bad;
+        }
+        PyException_SetCause(value, fixed_cause);
+    }
+    PyErr_SetObject(type, value);
+    if (tb) {
+#if CYTHON_FAST_THREAD_STATE
+        PyThreadState *tstate = __Pyx_PyThreadState_Current;
+        PyObject* tmp_tb = tstate->curexc_traceback;
+        if (tb != tmp_tb) {
+            Py_INCREF(tb);
+            tstate->curexc_traceback = tb;
+            Py_XDECREF(tmp_tb);
+        }
+#else
+        PyObject *tmp_type, *tmp_value, *tmp_tb;
+        PyErr_Fetch(&tmp_type, &tmp_value, &tmp_tb);
+        Py_INCREF(tb);
+        PyErr_Restore(tmp_type, tmp_value, tb);
+        Py_XDECREF(tmp_tb);
+#endif
+    }
+bad:
+    Py_XDECREF(owned_instance);
+    return;
+}
+#endif
+
+/* RaiseDoubleKeywords */
+static void __Pyx_RaiseDoubleKeywordsError(
+    const char* func_name,
+    PyObject* kw_name)
+{
+    PyErr_Format(PyExc_TypeError,
+        #if PY_MAJOR_VERSION >= 3
+        "%s() got multiple values for keyword argument '%U'", func_name, kw_name);
+        #else
+        "%s() got multiple values for keyword argument '%s'", func_name,
+        PyString_AsString(kw_name));
+        #endif
+}
+
+/* ParseKeywords */
+static int __Pyx_ParseOptionalKeywords(
+    PyObject *kwds,
+    PyObject **argnames[],
+    PyObject *kwds2,
+    PyObject *values[],
+    Py_ssize_t num_pos_args,
+    const char* function_name)
+{
+    PyObject *key = 0, *value = 0;
+    Py_ssize_t pos = 0;
+    PyObject*** name;
+    PyObject*** first_kw_arg = argnames + num_pos_args;
+    while (PyDict_Next(kwds, &pos, &key, &value)) {
+        name = first_kw_arg;
+        while (*name && (**name != key)) name++;
+        if (*name) {
+            values[name-argnames] = value;
+            continue;
+        }
+        name = first_kw_arg;
+        #if PY_MAJOR_VERSION < 3
+        if (likely(PyString_Check(key))) {
+            while (*name) {
+                if ((CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**name) == PyString_GET_SIZE(key))
+                        && _PyString_Eq(**name, key)) {
+                    values[name-argnames] = value;
+                    break;
+                }
+                name++;
+            }
+            if (*name) continue;
+            else {
+                PyObject*** argname = argnames;
+                while (argname != first_kw_arg) {
+                    if ((**argname == key) || (
+                            (CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**argname) == PyString_GET_SIZE(key))
+                             && _PyString_Eq(**argname, key))) {
+                        goto arg_passed_twice;
+                    }
+                    argname++;
+                }
+            }
+        } else
+        #endif
+        if (likely(PyUnicode_Check(key))) {
+            while (*name) {
+                int cmp = (**name == key) ? 0 :
+                #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
+                    (__Pyx_PyUnicode_GET_LENGTH(**name) != __Pyx_PyUnicode_GET_LENGTH(key)) ? 1 :
+                #endif
+                    PyUnicode_Compare(**name, key);
+                if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
+                if (cmp == 0) {
+                    values[name-argnames] = value;
+                    break;
+                }
+                name++;
+            }
+            if (*name) continue;
+            else {
+                PyObject*** argname = argnames;
+                while (argname != first_kw_arg) {
+                    int cmp = (**argname == key) ? 0 :
+                    #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
+                        (__Pyx_PyUnicode_GET_LENGTH(**argname) != __Pyx_PyUnicode_GET_LENGTH(key)) ? 1 :
+                    #endif
+                        PyUnicode_Compare(**argname, key);
+                    if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
+                    if (cmp == 0) goto arg_passed_twice;
+                    argname++;
+                }
+            }
+        } else
+            goto invalid_keyword_type;
+        if (kwds2) {
+            if (unlikely(PyDict_SetItem(kwds2, key, value))) goto bad;
+        } else {
+            goto invalid_keyword;
+        }
+    }
+    return 0;
+arg_passed_twice:
+    __Pyx_RaiseDoubleKeywordsError(function_name, key);
+    goto bad;
+invalid_keyword_type:
+    PyErr_Format(PyExc_TypeError,
+        "%.200s() keywords must be strings", function_name);
+    goto bad;
+invalid_keyword:
+    PyErr_Format(PyExc_TypeError,
+    #if PY_MAJOR_VERSION < 3
+        "%.200s() got an unexpected keyword argument '%.200s'",
+        function_name, PyString_AsString(key));
+    #else
+        "%s() got an unexpected keyword argument '%U'",
+        function_name, key);
+    #endif
+bad:
+    return -1;
+}
+
+/* RaiseArgTupleInvalid */
+static void __Pyx_RaiseArgtupleInvalid(
+    const char* func_name,
+    int exact,
+    Py_ssize_t num_min,
+    Py_ssize_t num_max,
+    Py_ssize_t num_found)
+{
+    Py_ssize_t num_expected;
+    const char *more_or_less;
+    if (num_found < num_min) {
+        num_expected = num_min;
+        more_or_less = "at least";
+    } else {
+        num_expected = num_max;
+        more_or_less = "at most";
+    }
+    if (exact) {
+        more_or_less = "exactly";
+    }
+    PyErr_Format(PyExc_TypeError,
+                 "%.200s() takes %.8s %" CYTHON_FORMAT_SSIZE_T "d positional argument%.1s (%" CYTHON_FORMAT_SSIZE_T "d given)",
+                 func_name, more_or_less, num_expected,
+                 (num_expected == 1) ? "" : "s", num_found);
+}
+
+/* PyObjectFormatAndDecref */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_FormatSimpleAndDecref(PyObject* s, PyObject* f) {
+    if (unlikely(!s)) return NULL;
+    if (likely(PyUnicode_CheckExact(s))) return s;
+    #if PY_MAJOR_VERSION < 3
+    if (likely(PyString_CheckExact(s))) {
+        PyObject *result = PyUnicode_FromEncodedObject(s, NULL, "strict");
+        Py_DECREF(s);
+        return result;
+    }
+    #endif
+    return __Pyx_PyObject_FormatAndDecref(s, f);
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_FormatAndDecref(PyObject* s, PyObject* f) {
+    PyObject *result = PyObject_Format(s, f);
+    Py_DECREF(s);
+    return result;
+}
+
+/* CIntToDigits */
+static const char DIGIT_PAIRS_10[2*10*10+1] = {
+    "00010203040506070809"
+    "10111213141516171819"
+    "20212223242526272829"
+    "30313233343536373839"
+    "40414243444546474849"
+    "50515253545556575859"
+    "60616263646566676869"
+    "70717273747576777879"
+    "80818283848586878889"
+    "90919293949596979899"
+};
+static const char DIGIT_PAIRS_8[2*8*8+1] = {
+    "0001020304050607"
+    "1011121314151617"
+    "2021222324252627"
+    "3031323334353637"
+    "4041424344454647"
+    "5051525354555657"
+    "6061626364656667"
+    "7071727374757677"
+};
+static const char DIGITS_HEX[2*16+1] = {
+    "0123456789abcdef"
+    "0123456789ABCDEF"
+};
+
+/* BuildPyUnicode */
+static PyObject* __Pyx_PyUnicode_BuildFromAscii(Py_ssize_t ulength, char* chars, int clength,
+                                                int prepend_sign, char padding_char) {
+    PyObject *uval;
+    Py_ssize_t uoffset = ulength - clength;
+#if CYTHON_USE_UNICODE_INTERNALS
+    Py_ssize_t i;
+#if CYTHON_PEP393_ENABLED
+    void *udata;
+    uval = PyUnicode_New(ulength, 127);
+    if (unlikely(!uval)) return NULL;
+    udata = PyUnicode_DATA(uval);
+#else
+    Py_UNICODE *udata;
+    uval = PyUnicode_FromUnicode(NULL, ulength);
+    if (unlikely(!uval)) return NULL;
+    udata = PyUnicode_AS_UNICODE(uval);
+#endif
+    if (uoffset > 0) {
+        i = 0;
+        if (prepend_sign) {
+            __Pyx_PyUnicode_WRITE(PyUnicode_1BYTE_KIND, udata, 0, '-');
+            i++;
+        }
+        for (; i < uoffset; i++) {
+            __Pyx_PyUnicode_WRITE(PyUnicode_1BYTE_KIND, udata, i, padding_char);
+        }
+    }
+    for (i=0; i < clength; i++) {
+        __Pyx_PyUnicode_WRITE(PyUnicode_1BYTE_KIND, udata, uoffset+i, chars[i]);
+    }
+#else
+    {
+        PyObject *sign = NULL, *padding = NULL;
+        uval = NULL;
+        if (uoffset > 0) {
+            prepend_sign = !!prepend_sign;
+            if (uoffset > prepend_sign) {
+                padding = PyUnicode_FromOrdinal(padding_char);
+                if (likely(padding) && uoffset > prepend_sign + 1) {
+                    PyObject *tmp;
+                    PyObject *repeat = PyInt_FromSsize_t(uoffset - prepend_sign);
+                    if (unlikely(!repeat)) goto done_or_error;
+                    tmp = PyNumber_Multiply(padding, repeat);
+                    Py_DECREF(repeat);
+                    Py_DECREF(padding);
+                    padding = tmp;
+                }
+                if (unlikely(!padding)) goto done_or_error;
+            }
+            if (prepend_sign) {
+                sign = PyUnicode_FromOrdinal('-');
+                if (unlikely(!sign)) goto done_or_error;
+            }
+        }
+        uval = PyUnicode_DecodeASCII(chars, clength, NULL);
+        if (likely(uval) && padding) {
+            PyObject *tmp = PyNumber_Add(padding, uval);
+            Py_DECREF(uval);
+            uval = tmp;
+        }
+        if (likely(uval) && sign) {
+            PyObject *tmp = PyNumber_Add(sign, uval);
+            Py_DECREF(uval);
+            uval = tmp;
+        }
+done_or_error:
+        Py_XDECREF(padding);
+        Py_XDECREF(sign);
+    }
+#endif
+    return uval;
+}
+
+/* CIntToPyUnicode */
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_From_Py_ssize_t(Py_ssize_t value, Py_ssize_t width, char padding_char, char format_char) {
+    char digits[sizeof(Py_ssize_t)*3+2];
+    char *dpos, *end = digits + sizeof(Py_ssize_t)*3+2;
+    const char *hex_digits = DIGITS_HEX;
+    Py_ssize_t length, ulength;
+    int prepend_sign, last_one_off;
+    Py_ssize_t remaining;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const Py_ssize_t neg_one = (Py_ssize_t) -1, const_zero = (Py_ssize_t) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (format_char == 'X') {
+        hex_digits += 16;
+        format_char = 'x';
+    }
+    remaining = value;
+    last_one_off = 0;
+    dpos = end;
+    do {
+        int digit_pos;
+        switch (format_char) {
+        case 'o':
+            digit_pos = abs((int)(remaining % (8*8)));
+            remaining = (Py_ssize_t) (remaining / (8*8));
+            dpos -= 2;
+            memcpy(dpos, DIGIT_PAIRS_8 + digit_pos * 2, 2);
+            last_one_off = (digit_pos < 8);
+            break;
+        case 'd':
+            digit_pos = abs((int)(remaining % (10*10)));
+            remaining = (Py_ssize_t) (remaining / (10*10));
+            dpos -= 2;
+            memcpy(dpos, DIGIT_PAIRS_10 + digit_pos * 2, 2);
+            last_one_off = (digit_pos < 10);
+            break;
+        case 'x':
+            *(--dpos) = hex_digits[abs((int)(remaining % 16))];
+            remaining = (Py_ssize_t) (remaining / 16);
+            break;
+        default:
+            assert(0);
+            break;
+        }
+    } while (unlikely(remaining != 0));
+    if (last_one_off) {
+        assert(*dpos == '0');
+        dpos++;
+    }
+    length = end - dpos;
+    ulength = length;
+    prepend_sign = 0;
+    if (!is_unsigned && value <= neg_one) {
+        if (padding_char == ' ' || width <= length + 1) {
+            *(--dpos) = '-';
+            ++length;
+        } else {
+            prepend_sign = 1;
+        }
+        ++ulength;
+    }
+    if (width > ulength) {
+        ulength = width;
+    }
+    if (ulength == 1) {
+        return PyUnicode_FromOrdinal(*dpos);
+    }
+    return __Pyx_PyUnicode_BuildFromAscii(ulength, dpos, (int) length, prepend_sign, padding_char);
+}
+
+/* CIntToPyUnicode */
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_From_unsigned_long(unsigned long value, Py_ssize_t width, char padding_char, char format_char) {
+    char digits[sizeof(unsigned long)*3+2];
+    char *dpos, *end = digits + sizeof(unsigned long)*3+2;
+    const char *hex_digits = DIGITS_HEX;
+    Py_ssize_t length, ulength;
+    int prepend_sign, last_one_off;
+    unsigned long remaining;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const unsigned long neg_one = (unsigned long) -1, const_zero = (unsigned long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (format_char == 'X') {
+        hex_digits += 16;
+        format_char = 'x';
+    }
+    remaining = value;
+    last_one_off = 0;
+    dpos = end;
+    do {
+        int digit_pos;
+        switch (format_char) {
+        case 'o':
+            digit_pos = abs((int)(remaining % (8*8)));
+            remaining = (unsigned long) (remaining / (8*8));
+            dpos -= 2;
+            memcpy(dpos, DIGIT_PAIRS_8 + digit_pos * 2, 2);
+            last_one_off = (digit_pos < 8);
+            break;
+        case 'd':
+            digit_pos = abs((int)(remaining % (10*10)));
+            remaining = (unsigned long) (remaining / (10*10));
+            dpos -= 2;
+            memcpy(dpos, DIGIT_PAIRS_10 + digit_pos * 2, 2);
+            last_one_off = (digit_pos < 10);
+            break;
+        case 'x':
+            *(--dpos) = hex_digits[abs((int)(remaining % 16))];
+            remaining = (unsigned long) (remaining / 16);
+            break;
+        default:
+            assert(0);
+            break;
+        }
+    } while (unlikely(remaining != 0));
+    if (last_one_off) {
+        assert(*dpos == '0');
+        dpos++;
+    }
+    length = end - dpos;
+    ulength = length;
+    prepend_sign = 0;
+    if (!is_unsigned && value <= neg_one) {
+        if (padding_char == ' ' || width <= length + 1) {
+            *(--dpos) = '-';
+            ++length;
+        } else {
+            prepend_sign = 1;
+        }
+        ++ulength;
+    }
+    if (width > ulength) {
+        ulength = width;
+    }
+    if (ulength == 1) {
+        return PyUnicode_FromOrdinal(*dpos);
+    }
+    return __Pyx_PyUnicode_BuildFromAscii(ulength, dpos, (int) length, prepend_sign, padding_char);
+}
+
+/* JoinPyUnicode */
+static PyObject* __Pyx_PyUnicode_Join(PyObject* value_tuple, Py_ssize_t value_count, Py_ssize_t result_ulength,
+                                      CYTHON_UNUSED Py_UCS4 max_char) {
+#if CYTHON_USE_UNICODE_INTERNALS && CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    PyObject *result_uval;
+    int result_ukind;
+    Py_ssize_t i, char_pos;
+    void *result_udata;
+#if CYTHON_PEP393_ENABLED
+    result_uval = PyUnicode_New(result_ulength, max_char);
+    if (unlikely(!result_uval)) return NULL;
+    result_ukind = (max_char <= 255) ? PyUnicode_1BYTE_KIND : (max_char <= 65535) ? PyUnicode_2BYTE_KIND : PyUnicode_4BYTE_KIND;
+    result_udata = PyUnicode_DATA(result_uval);
+#else
+    result_uval = PyUnicode_FromUnicode(NULL, result_ulength);
+    if (unlikely(!result_uval)) return NULL;
+    result_ukind = sizeof(Py_UNICODE);
+    result_udata = PyUnicode_AS_UNICODE(result_uval);
+#endif
+    char_pos = 0;
+    for (i=0; i < value_count; i++) {
+        int ukind;
+        Py_ssize_t ulength;
+        void *udata;
+        PyObject *uval = PyTuple_GET_ITEM(value_tuple, i);
+        if (unlikely(__Pyx_PyUnicode_READY(uval)))
+            goto bad;
+        ulength = __Pyx_PyUnicode_GET_LENGTH(uval);
+        if (unlikely(!ulength))
+            continue;
+        if (unlikely(char_pos + ulength < 0))
+            goto overflow;
+        ukind = __Pyx_PyUnicode_KIND(uval);
+        udata = __Pyx_PyUnicode_DATA(uval);
+        if (!CYTHON_PEP393_ENABLED || ukind == result_ukind) {
+            memcpy((char *)result_udata + char_pos * result_ukind, udata, (size_t) (ulength * result_ukind));
+        } else {
+            #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030300F0 || defined(_PyUnicode_FastCopyCharacters)
+            _PyUnicode_FastCopyCharacters(result_uval, char_pos, uval, 0, ulength);
+            #else
+            Py_ssize_t j;
+            for (j=0; j < ulength; j++) {
+                Py_UCS4 uchar = __Pyx_PyUnicode_READ(ukind, udata, j);
+                __Pyx_PyUnicode_WRITE(result_ukind, result_udata, char_pos+j, uchar);
+            }
+            #endif
+        }
+        char_pos += ulength;
+    }
+    return result_uval;
+overflow:
+    PyErr_SetString(PyExc_OverflowError, "join() result is too long for a Python string");
+bad:
+    Py_DECREF(result_uval);
+    return NULL;
+#else
+    result_ulength++;
+    value_count++;
+    return PyUnicode_Join(__pyx_empty_unicode, value_tuple);
+#endif
+}
+
+/* PyObjectCall2Args */
+static CYTHON_UNUSED PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2) {
+    PyObject *args, *result = NULL;
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(function)) {
+        PyObject *args[2] = {arg1, arg2};
+        return __Pyx_PyFunction_FastCall(function, args, 2);
+    }
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(function)) {
+        PyObject *args[2] = {arg1, arg2};
+        return __Pyx_PyCFunction_FastCall(function, args, 2);
+    }
+    #endif
+    args = PyTuple_New(2);
+    if (unlikely(!args)) goto done;
+    Py_INCREF(arg1);
+    PyTuple_SET_ITEM(args, 0, arg1);
+    Py_INCREF(arg2);
+    PyTuple_SET_ITEM(args, 1, arg2);
+    Py_INCREF(function);
+    result = __Pyx_PyObject_Call(function, args, NULL);
+    Py_DECREF(args);
+    Py_DECREF(function);
+done:
+    return result;
+}
+
+/* CIntToPyUnicode */
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_From_unsigned_int(unsigned int value, Py_ssize_t width, char padding_char, char format_char) {
+    char digits[sizeof(unsigned int)*3+2];
+    char *dpos, *end = digits + sizeof(unsigned int)*3+2;
+    const char *hex_digits = DIGITS_HEX;
+    Py_ssize_t length, ulength;
+    int prepend_sign, last_one_off;
+    unsigned int remaining;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const unsigned int neg_one = (unsigned int) -1, const_zero = (unsigned int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (format_char == 'X') {
+        hex_digits += 16;
+        format_char = 'x';
+    }
+    remaining = value;
+    last_one_off = 0;
+    dpos = end;
+    do {
+        int digit_pos;
+        switch (format_char) {
+        case 'o':
+            digit_pos = abs((int)(remaining % (8*8)));
+            remaining = (unsigned int) (remaining / (8*8));
+            dpos -= 2;
+            memcpy(dpos, DIGIT_PAIRS_8 + digit_pos * 2, 2);
+            last_one_off = (digit_pos < 8);
+            break;
+        case 'd':
+            digit_pos = abs((int)(remaining % (10*10)));
+            remaining = (unsigned int) (remaining / (10*10));
+            dpos -= 2;
+            memcpy(dpos, DIGIT_PAIRS_10 + digit_pos * 2, 2);
+            last_one_off = (digit_pos < 10);
+            break;
+        case 'x':
+            *(--dpos) = hex_digits[abs((int)(remaining % 16))];
+            remaining = (unsigned int) (remaining / 16);
+            break;
+        default:
+            assert(0);
+            break;
+        }
+    } while (unlikely(remaining != 0));
+    if (last_one_off) {
+        assert(*dpos == '0');
+        dpos++;
+    }
+    length = end - dpos;
+    ulength = length;
+    prepend_sign = 0;
+    if (!is_unsigned && value <= neg_one) {
+        if (padding_char == ' ' || width <= length + 1) {
+            *(--dpos) = '-';
+            ++length;
+        } else {
+            prepend_sign = 1;
+        }
+        ++ulength;
+    }
+    if (width > ulength) {
+        ulength = width;
+    }
+    if (ulength == 1) {
+        return PyUnicode_FromOrdinal(*dpos);
+    }
+    return __Pyx_PyUnicode_BuildFromAscii(ulength, dpos, (int) length, prepend_sign, padding_char);
+}
+
+/* CIntToPyUnicode */
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_From_unsigned_char(unsigned char value, Py_ssize_t width, char padding_char, char format_char) {
+    char digits[sizeof(unsigned char)*3+2];
+    char *dpos, *end = digits + sizeof(unsigned char)*3+2;
+    const char *hex_digits = DIGITS_HEX;
+    Py_ssize_t length, ulength;
+    int prepend_sign, last_one_off;
+    unsigned char remaining;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const unsigned char neg_one = (unsigned char) -1, const_zero = (unsigned char) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (format_char == 'X') {
+        hex_digits += 16;
+        format_char = 'x';
+    }
+    remaining = value;
+    last_one_off = 0;
+    dpos = end;
+    do {
+        int digit_pos;
+        switch (format_char) {
+        case 'o':
+            digit_pos = abs((int)(remaining % (8*8)));
+            remaining = (unsigned char) (remaining / (8*8));
+            dpos -= 2;
+            memcpy(dpos, DIGIT_PAIRS_8 + digit_pos * 2, 2);
+            last_one_off = (digit_pos < 8);
+            break;
+        case 'd':
+            digit_pos = abs((int)(remaining % (10*10)));
+            remaining = (unsigned char) (remaining / (10*10));
+            dpos -= 2;
+            memcpy(dpos, DIGIT_PAIRS_10 + digit_pos * 2, 2);
+            last_one_off = (digit_pos < 10);
+            break;
+        case 'x':
+            *(--dpos) = hex_digits[abs((int)(remaining % 16))];
+            remaining = (unsigned char) (remaining / 16);
+            break;
+        default:
+            assert(0);
+            break;
+        }
+    } while (unlikely(remaining != 0));
+    if (last_one_off) {
+        assert(*dpos == '0');
+        dpos++;
+    }
+    length = end - dpos;
+    ulength = length;
+    prepend_sign = 0;
+    if (!is_unsigned && value <= neg_one) {
+        if (padding_char == ' ' || width <= length + 1) {
+            *(--dpos) = '-';
+            ++length;
+        } else {
+            prepend_sign = 1;
+        }
+        ++ulength;
+    }
+    if (width > ulength) {
+        ulength = width;
+    }
+    if (ulength == 1) {
+        return PyUnicode_FromOrdinal(*dpos);
+    }
+    return __Pyx_PyUnicode_BuildFromAscii(ulength, dpos, (int) length, prepend_sign, padding_char);
+}
+
+/* CIntToPyUnicode */
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_From_int(int value, Py_ssize_t width, char padding_char, char format_char) {
+    char digits[sizeof(int)*3+2];
+    char *dpos, *end = digits + sizeof(int)*3+2;
+    const char *hex_digits = DIGITS_HEX;
+    Py_ssize_t length, ulength;
+    int prepend_sign, last_one_off;
+    int remaining;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (format_char == 'X') {
+        hex_digits += 16;
+        format_char = 'x';
+    }
+    remaining = value;
+    last_one_off = 0;
+    dpos = end;
+    do {
+        int digit_pos;
+        switch (format_char) {
+        case 'o':
+            digit_pos = abs((int)(remaining % (8*8)));
+            remaining = (int) (remaining / (8*8));
+            dpos -= 2;
+            memcpy(dpos, DIGIT_PAIRS_8 + digit_pos * 2, 2);
+            last_one_off = (digit_pos < 8);
+            break;
+        case 'd':
+            digit_pos = abs((int)(remaining % (10*10)));
+            remaining = (int) (remaining / (10*10));
+            dpos -= 2;
+            memcpy(dpos, DIGIT_PAIRS_10 + digit_pos * 2, 2);
+            last_one_off = (digit_pos < 10);
+            break;
+        case 'x':
+            *(--dpos) = hex_digits[abs((int)(remaining % 16))];
+            remaining = (int) (remaining / 16);
+            break;
+        default:
+            assert(0);
+            break;
+        }
+    } while (unlikely(remaining != 0));
+    if (last_one_off) {
+        assert(*dpos == '0');
+        dpos++;
+    }
+    length = end - dpos;
+    ulength = length;
+    prepend_sign = 0;
+    if (!is_unsigned && value <= neg_one) {
+        if (padding_char == ' ' || width <= length + 1) {
+            *(--dpos) = '-';
+            ++length;
+        } else {
+            prepend_sign = 1;
+        }
+        ++ulength;
+    }
+    if (width > ulength) {
+        ulength = width;
+    }
+    if (ulength == 1) {
+        return PyUnicode_FromOrdinal(*dpos);
+    }
+    return __Pyx_PyUnicode_BuildFromAscii(ulength, dpos, (int) length, prepend_sign, padding_char);
+}
+
+/* PyObject_GenericGetAttrNoDict */
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static PyObject *__Pyx_RaiseGenericGetAttributeError(PyTypeObject *tp, PyObject *attr_name) {
+    PyErr_Format(PyExc_AttributeError,
+#if PY_MAJOR_VERSION >= 3
+                 "'%.50s' object has no attribute '%U'",
+                 tp->tp_name, attr_name);
+#else
+                 "'%.50s' object has no attribute '%.400s'",
+                 tp->tp_name, PyString_AS_STRING(attr_name));
+#endif
+    return NULL;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GenericGetAttrNoDict(PyObject* obj, PyObject* attr_name) {
+    PyObject *descr;
+    PyTypeObject *tp = Py_TYPE(obj);
+    if (unlikely(!PyString_Check(attr_name))) {
+        return PyObject_GenericGetAttr(obj, attr_name);
+    }
+    assert(!tp->tp_dictoffset);
+    descr = _PyType_Lookup(tp, attr_name);
+    if (unlikely(!descr)) {
+        return __Pyx_RaiseGenericGetAttributeError(tp, attr_name);
+    }
+    Py_INCREF(descr);
+    #if PY_MAJOR_VERSION < 3
+    if (likely(PyType_HasFeature(Py_TYPE(descr), Py_TPFLAGS_HAVE_CLASS)))
+    #endif
+    {
+        descrgetfunc f = Py_TYPE(descr)->tp_descr_get;
+        if (unlikely(f)) {
+            PyObject *res = f(descr, obj, (PyObject *)tp);
+            Py_DECREF(descr);
+            return res;
+        }
+    }
+    return descr;
+}
+#endif
+
+/* PyObject_GenericGetAttr */
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static PyObject* __Pyx_PyObject_GenericGetAttr(PyObject* obj, PyObject* attr_name) {
+    if (unlikely(Py_TYPE(obj)->tp_dictoffset)) {
+        return PyObject_GenericGetAttr(obj, attr_name);
+    }
+    return __Pyx_PyObject_GenericGetAttrNoDict(obj, attr_name);
+}
+#endif
+
+/* SetVTable */
+static int __Pyx_SetVtable(PyObject *dict, void *vtable) {
+#if PY_VERSION_HEX >= 0x02070000
+    PyObject *ob = PyCapsule_New(vtable, 0, 0);
+#else
+    PyObject *ob = PyCObject_FromVoidPtr(vtable, 0);
+#endif
+    if (!ob)
+        goto bad;
+    if (PyDict_SetItem(dict, __pyx_n_s_pyx_vtable, ob) < 0)
+        goto bad;
+    Py_DECREF(ob);
+    return 0;
+bad:
+    Py_XDECREF(ob);
+    return -1;
+}
+
+/* PyErrExceptionMatches */
+#if CYTHON_FAST_THREAD_STATE
+static int __Pyx_PyErr_ExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    n = PyTuple_GET_SIZE(tuple);
+#if PY_MAJOR_VERSION >= 3
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+#endif
+    for (i=0; i<n; i++) {
+        if (__Pyx_PyErr_GivenExceptionMatches(exc_type, PyTuple_GET_ITEM(tuple, i))) return 1;
+    }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err) {
+    PyObject *exc_type = tstate->curexc_type;
+    if (exc_type == err) return 1;
+    if (unlikely(!exc_type)) return 0;
+    if (unlikely(PyTuple_Check(err)))
+        return __Pyx_PyErr_ExceptionMatchesTuple(exc_type, err);
+    return __Pyx_PyErr_GivenExceptionMatches(exc_type, err);
+}
+#endif
+
+/* PyObjectGetAttrStrNoError */
+static void __Pyx_PyObject_GetAttrStr_ClearAttributeError(void) {
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    if (likely(__Pyx_PyErr_ExceptionMatches(PyExc_AttributeError)))
+        __Pyx_PyErr_Clear();
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name) {
+    PyObject *result;
+#if CYTHON_COMPILING_IN_CPYTHON && CYTHON_USE_TYPE_SLOTS && PY_VERSION_HEX >= 0x030700B1
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro == PyObject_GenericGetAttr)) {
+        return _PyObject_GenericGetAttrWithDict(obj, attr_name, NULL, 1);
+    }
+#endif
+    result = __Pyx_PyObject_GetAttrStr(obj, attr_name);
+    if (unlikely(!result)) {
+        __Pyx_PyObject_GetAttrStr_ClearAttributeError();
+    }
+    return result;
+}
+
+/* SetupReduce */
+static int __Pyx_setup_reduce_is_named(PyObject* meth, PyObject* name) {
+  int ret;
+  PyObject *name_attr;
+  name_attr = __Pyx_PyObject_GetAttrStr(meth, __pyx_n_s_name);
+  if (likely(name_attr)) {
+      ret = PyObject_RichCompareBool(name_attr, name, Py_EQ);
+  } else {
+      ret = -1;
+  }
+  if (unlikely(ret < 0)) {
+      PyErr_Clear();
+      ret = 0;
+  }
+  Py_XDECREF(name_attr);
+  return ret;
+}
+static int __Pyx_setup_reduce(PyObject* type_obj) {
+    int ret = 0;
+    PyObject *object_reduce = NULL;
+    PyObject *object_getstate = NULL;
+    PyObject *object_reduce_ex = NULL;
+    PyObject *reduce = NULL;
+    PyObject *reduce_ex = NULL;
+    PyObject *reduce_cython = NULL;
+    PyObject *setstate = NULL;
+    PyObject *setstate_cython = NULL;
+    PyObject *getstate = NULL;
+#if CYTHON_USE_PYTYPE_LOOKUP
+    getstate = _PyType_Lookup((PyTypeObject*)type_obj, __pyx_n_s_getstate);
+#else
+    getstate = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_getstate);
+    if (!getstate && PyErr_Occurred()) {
+        goto __PYX_BAD;
+    }
+#endif
+    if (getstate) {
+#if CYTHON_USE_PYTYPE_LOOKUP
+        object_getstate = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_getstate);
+#else
+        object_getstate = __Pyx_PyObject_GetAttrStrNoError((PyObject*)&PyBaseObject_Type, __pyx_n_s_getstate);
+        if (!object_getstate && PyErr_Occurred()) {
+            goto __PYX_BAD;
+        }
+#endif
+        if (object_getstate != getstate) {
+            goto __PYX_GOOD;
+        }
+    }
+#if CYTHON_USE_PYTYPE_LOOKUP
+    object_reduce_ex = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_reduce_ex); if (!object_reduce_ex) goto __PYX_BAD;
+#else
+    object_reduce_ex = __Pyx_PyObject_GetAttrStr((PyObject*)&PyBaseObject_Type, __pyx_n_s_reduce_ex); if (!object_reduce_ex) goto __PYX_BAD;
+#endif
+    reduce_ex = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_reduce_ex); if (unlikely(!reduce_ex)) goto __PYX_BAD;
+    if (reduce_ex == object_reduce_ex) {
+#if CYTHON_USE_PYTYPE_LOOKUP
+        object_reduce = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_reduce); if (!object_reduce) goto __PYX_BAD;
+#else
+        object_reduce = __Pyx_PyObject_GetAttrStr((PyObject*)&PyBaseObject_Type, __pyx_n_s_reduce); if (!object_reduce) goto __PYX_BAD;
+#endif
+        reduce = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_reduce); if (unlikely(!reduce)) goto __PYX_BAD;
+        if (reduce == object_reduce || __Pyx_setup_reduce_is_named(reduce, __pyx_n_s_reduce_cython)) {
+            reduce_cython = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_reduce_cython);
+            if (likely(reduce_cython)) {
+                ret = PyDict_SetItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_reduce, reduce_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                ret = PyDict_DelItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_reduce_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+            } else if (reduce == object_reduce || PyErr_Occurred()) {
+                goto __PYX_BAD;
+            }
+            setstate = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_setstate);
+            if (!setstate) PyErr_Clear();
+            if (!setstate || __Pyx_setup_reduce_is_named(setstate, __pyx_n_s_setstate_cython)) {
+                setstate_cython = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_setstate_cython);
+                if (likely(setstate_cython)) {
+                    ret = PyDict_SetItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_setstate, setstate_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                    ret = PyDict_DelItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_setstate_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                } else if (!setstate || PyErr_Occurred()) {
+                    goto __PYX_BAD;
+                }
+            }
+            PyType_Modified((PyTypeObject*)type_obj);
+        }
+    }
+    goto __PYX_GOOD;
+__PYX_BAD:
+    if (!PyErr_Occurred())
+        PyErr_Format(PyExc_RuntimeError, "Unable to initialize pickling for %s", ((PyTypeObject*)type_obj)->tp_name);
+    ret = -1;
+__PYX_GOOD:
+#if !CYTHON_USE_PYTYPE_LOOKUP
+    Py_XDECREF(object_reduce);
+    Py_XDECREF(object_reduce_ex);
+    Py_XDECREF(object_getstate);
+    Py_XDECREF(getstate);
+#endif
+    Py_XDECREF(reduce);
+    Py_XDECREF(reduce_ex);
+    Py_XDECREF(reduce_cython);
+    Py_XDECREF(setstate);
+    Py_XDECREF(setstate_cython);
+    return ret;
+}
+
+/* TypeImport */
+#ifndef __PYX_HAVE_RT_ImportType_0_29_37
+#define __PYX_HAVE_RT_ImportType_0_29_37
+static PyTypeObject *__Pyx_ImportType_0_29_37(PyObject *module, const char *module_name, const char *class_name,
+    size_t size, size_t alignment, enum __Pyx_ImportType_CheckSize_0_29_37 check_size)
+{
+    PyObject *result = 0;
+    char warning[200];
+    Py_ssize_t basicsize;
+    Py_ssize_t itemsize;
+#ifdef Py_LIMITED_API
+    PyObject *py_basicsize;
+    PyObject *py_itemsize;
+#endif
+    result = PyObject_GetAttrString(module, class_name);
+    if (!result)
+        goto bad;
+    if (!PyType_Check(result)) {
+        PyErr_Format(PyExc_TypeError,
+            "%.200s.%.200s is not a type object",
+            module_name, class_name);
+        goto bad;
+    }
+#ifndef Py_LIMITED_API
+    basicsize = ((PyTypeObject *)result)->tp_basicsize;
+    itemsize = ((PyTypeObject *)result)->tp_itemsize;
+#else
+    py_basicsize = PyObject_GetAttrString(result, "__basicsize__");
+    if (!py_basicsize)
+        goto bad;
+    basicsize = PyLong_AsSsize_t(py_basicsize);
+    Py_DECREF(py_basicsize);
+    py_basicsize = 0;
+    if (basicsize == (Py_ssize_t)-1 && PyErr_Occurred())
+        goto bad;
+    py_itemsize = PyObject_GetAttrString(result, "__itemsize__");
+    if (!py_itemsize)
+        goto bad;
+    itemsize = PyLong_AsSsize_t(py_itemsize);
+    Py_DECREF(py_itemsize);
+    py_itemsize = 0;
+    if (itemsize == (Py_ssize_t)-1 && PyErr_Occurred())
+        goto bad;
+#endif
+    if (itemsize) {
+        if (size % alignment) {
+            alignment = size % alignment;
+        }
+        if (itemsize < (Py_ssize_t)alignment)
+            itemsize = (Py_ssize_t)alignment;
+    }
+    if ((size_t)(basicsize + itemsize) < size) {
+        PyErr_Format(PyExc_ValueError,
+            "%.200s.%.200s size changed, may indicate binary incompatibility. "
+            "Expected %zd from C header, got %zd from PyObject",
+            module_name, class_name, size, basicsize);
+        goto bad;
+    }
+    if (check_size == __Pyx_ImportType_CheckSize_Error_0_29_37 && (size_t)basicsize != size) {
+        PyErr_Format(PyExc_ValueError,
+            "%.200s.%.200s size changed, may indicate binary incompatibility. "
+            "Expected %zd from C header, got %zd from PyObject",
+            module_name, class_name, size, basicsize);
+        goto bad;
+    }
+    else if (check_size == __Pyx_ImportType_CheckSize_Warn_0_29_37 && (size_t)basicsize > size) {
+        PyOS_snprintf(warning, sizeof(warning),
+            "%s.%s size changed, may indicate binary incompatibility. "
+            "Expected %zd from C header, got %zd from PyObject",
+            module_name, class_name, size, basicsize);
+        if (PyErr_WarnEx(NULL, warning, 0) < 0) goto bad;
+    }
+    return (PyTypeObject *)result;
+bad:
+    Py_XDECREF(result);
+    return NULL;
+}
+#endif
+
+/* PyDictVersioning */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    return likely(dict) ? __PYX_GET_DICT_VERSION(dict) : 0;
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj) {
+    PyObject **dictptr = NULL;
+    Py_ssize_t offset = Py_TYPE(obj)->tp_dictoffset;
+    if (offset) {
+#if CYTHON_COMPILING_IN_CPYTHON
+        dictptr = (likely(offset > 0)) ? (PyObject **) ((char *)obj + offset) : _PyObject_GetDictPtr(obj);
+#else
+        dictptr = _PyObject_GetDictPtr(obj);
+#endif
+    }
+    return (dictptr && *dictptr) ? __PYX_GET_DICT_VERSION(*dictptr) : 0;
+}
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    if (unlikely(!dict) || unlikely(tp_dict_version != __PYX_GET_DICT_VERSION(dict)))
+        return 0;
+    return obj_dict_version == __Pyx_get_object_dict_version(obj);
+}
+#endif
+
+/* CLineInTraceback */
+#ifndef CYTHON_CLINE_IN_TRACEBACK
+static int __Pyx_CLineForTraceback(CYTHON_UNUSED PyThreadState *tstate, int c_line) {
+    PyObject *use_cline;
+    PyObject *ptype, *pvalue, *ptraceback;
+#if CYTHON_COMPILING_IN_CPYTHON
+    PyObject **cython_runtime_dict;
+#endif
+    if (unlikely(!__pyx_cython_runtime)) {
+        return c_line;
+    }
+    __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
+#if CYTHON_COMPILING_IN_CPYTHON
+    cython_runtime_dict = _PyObject_GetDictPtr(__pyx_cython_runtime);
+    if (likely(cython_runtime_dict)) {
+        __PYX_PY_DICT_LOOKUP_IF_MODIFIED(
+            use_cline, *cython_runtime_dict,
+            __Pyx_PyDict_GetItemStr(*cython_runtime_dict, __pyx_n_s_cline_in_traceback))
+    } else
+#endif
+    {
+      PyObject *use_cline_obj = __Pyx_PyObject_GetAttrStr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback);
+      if (use_cline_obj) {
+        use_cline = PyObject_Not(use_cline_obj) ? Py_False : Py_True;
+        Py_DECREF(use_cline_obj);
+      } else {
+        PyErr_Clear();
+        use_cline = NULL;
+      }
+    }
+    if (!use_cline) {
+        c_line = 0;
+        (void) PyObject_SetAttr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback, Py_False);
+    }
+    else if (use_cline == Py_False || (use_cline != Py_True && PyObject_Not(use_cline) != 0)) {
+        c_line = 0;
+    }
+    __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
+    return c_line;
+}
+#endif
+
+/* CodeObjectCache */
+static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line) {
+    int start = 0, mid = 0, end = count - 1;
+    if (end >= 0 && code_line > entries[end].code_line) {
+        return count;
+    }
+    while (start < end) {
+        mid = start + (end - start) / 2;
+        if (code_line < entries[mid].code_line) {
+            end = mid;
+        } else if (code_line > entries[mid].code_line) {
+             start = mid + 1;
+        } else {
+            return mid;
+        }
+    }
+    if (code_line <= entries[mid].code_line) {
+        return mid;
+    } else {
+        return mid + 1;
+    }
+}
+static PyCodeObject *__pyx_find_code_object(int code_line) {
+    PyCodeObject* code_object;
+    int pos;
+    if (unlikely(!code_line) || unlikely(!__pyx_code_cache.entries)) {
+        return NULL;
+    }
+    pos = __pyx_bisect_code_objects(__pyx_code_cache.entries, __pyx_code_cache.count, code_line);
+    if (unlikely(pos >= __pyx_code_cache.count) || unlikely(__pyx_code_cache.entries[pos].code_line != code_line)) {
+        return NULL;
+    }
+    code_object = __pyx_code_cache.entries[pos].code_object;
+    Py_INCREF(code_object);
+    return code_object;
+}
+static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object) {
+    int pos, i;
+    __Pyx_CodeObjectCacheEntry* entries = __pyx_code_cache.entries;
+    if (unlikely(!code_line)) {
+        return;
+    }
+    if (unlikely(!entries)) {
+        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Malloc(64*sizeof(__Pyx_CodeObjectCacheEntry));
+        if (likely(entries)) {
+            __pyx_code_cache.entries = entries;
+            __pyx_code_cache.max_count = 64;
+            __pyx_code_cache.count = 1;
+            entries[0].code_line = code_line;
+            entries[0].code_object = code_object;
+            Py_INCREF(code_object);
+        }
+        return;
+    }
+    pos = __pyx_bisect_code_objects(__pyx_code_cache.entries, __pyx_code_cache.count, code_line);
+    if ((pos < __pyx_code_cache.count) && unlikely(__pyx_code_cache.entries[pos].code_line == code_line)) {
+        PyCodeObject* tmp = entries[pos].code_object;
+        entries[pos].code_object = code_object;
+        Py_DECREF(tmp);
+        return;
+    }
+    if (__pyx_code_cache.count == __pyx_code_cache.max_count) {
+        int new_max = __pyx_code_cache.max_count + 64;
+        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Realloc(
+            __pyx_code_cache.entries, ((size_t)new_max) * sizeof(__Pyx_CodeObjectCacheEntry));
+        if (unlikely(!entries)) {
+            return;
+        }
+        __pyx_code_cache.entries = entries;
+        __pyx_code_cache.max_count = new_max;
+    }
+    for (i=__pyx_code_cache.count; i>pos; i--) {
+        entries[i] = entries[i-1];
+    }
+    entries[pos].code_line = code_line;
+    entries[pos].code_object = code_object;
+    __pyx_code_cache.count++;
+    Py_INCREF(code_object);
+}
+
+/* AddTraceback */
+#include "compile.h"
+#include "frameobject.h"
+#include "traceback.h"
+#if PY_VERSION_HEX >= 0x030b00a6
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
+static PyCodeObject* __Pyx_CreateCodeObjectForTraceback(
+            const char *funcname, int c_line,
+            int py_line, const char *filename) {
+    PyCodeObject *py_code = NULL;
+    PyObject *py_funcname = NULL;
+    #if PY_MAJOR_VERSION < 3
+    PyObject *py_srcfile = NULL;
+    py_srcfile = PyString_FromString(filename);
+    if (!py_srcfile) goto bad;
+    #endif
+    if (c_line) {
+        #if PY_MAJOR_VERSION < 3
+        py_funcname = PyString_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
+        #else
+        py_funcname = PyUnicode_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
+        funcname = PyUnicode_AsUTF8(py_funcname);
+        if (!funcname) goto bad;
+        #endif
+    }
+    else {
+        #if PY_MAJOR_VERSION < 3
+        py_funcname = PyString_FromString(funcname);
+        if (!py_funcname) goto bad;
+        #endif
+    }
+    #if PY_MAJOR_VERSION < 3
+    py_code = __Pyx_PyCode_New(
+        0,
+        0,
+        0,
+        0,
+        0,
+        __pyx_empty_bytes, /*PyObject *code,*/
+        __pyx_empty_tuple, /*PyObject *consts,*/
+        __pyx_empty_tuple, /*PyObject *names,*/
+        __pyx_empty_tuple, /*PyObject *varnames,*/
+        __pyx_empty_tuple, /*PyObject *freevars,*/
+        __pyx_empty_tuple, /*PyObject *cellvars,*/
+        py_srcfile,   /*PyObject *filename,*/
+        py_funcname,  /*PyObject *name,*/
+        py_line,
+        __pyx_empty_bytes  /*PyObject *lnotab*/
+    );
+    Py_DECREF(py_srcfile);
+    #else
+    py_code = PyCode_NewEmpty(filename, funcname, py_line);
+    #endif
+    Py_XDECREF(py_funcname);  // XDECREF since it's only set on Py3 if cline
+    return py_code;
+bad:
+    Py_XDECREF(py_funcname);
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(py_srcfile);
+    #endif
+    return NULL;
+}
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename) {
+    PyCodeObject *py_code = 0;
+    PyFrameObject *py_frame = 0;
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject *ptype, *pvalue, *ptraceback;
+    if (c_line) {
+        c_line = __Pyx_CLineForTraceback(tstate, c_line);
+    }
+    py_code = __pyx_find_code_object(c_line ? -c_line : py_line);
+    if (!py_code) {
+        __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
+        py_code = __Pyx_CreateCodeObjectForTraceback(
+            funcname, c_line, py_line, filename);
+        if (!py_code) {
+            /* If the code object creation fails, then we should clear the
+               fetched exception references and propagate the new exception */
+            Py_XDECREF(ptype);
+            Py_XDECREF(pvalue);
+            Py_XDECREF(ptraceback);
+            goto bad;
+        }
+        __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
+        __pyx_insert_code_object(c_line ? -c_line : py_line, py_code);
+    }
+    py_frame = PyFrame_New(
+        tstate,            /*PyThreadState *tstate,*/
+        py_code,           /*PyCodeObject *code,*/
+        __pyx_d,    /*PyObject *globals,*/
+        0                  /*PyObject *locals*/
+    );
+    if (!py_frame) goto bad;
+    __Pyx_PyFrame_SetLineNumber(py_frame, py_line);
+    PyTraceBack_Here(py_frame);
+bad:
+    Py_XDECREF(py_code);
+    Py_XDECREF(py_frame);
+}
+
+/* CIntFromPyVerify */
+#define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 0)
+#define __PYX_VERIFY_RETURN_INT_EXC(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 1)
+#define __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, exc)\
+    {\
+        func_type value = func_value;\
+        if (sizeof(target_type) < sizeof(func_type)) {\
+            if (unlikely(value != (func_type) (target_type) value)) {\
+                func_type zero = 0;\
+                if (exc && unlikely(value == (func_type)-1 && PyErr_Occurred()))\
+                    return (target_type) -1;\
+                if (is_unsigned && unlikely(value < zero))\
+                    goto raise_neg_overflow;\
+                else\
+                    goto raise_overflow;\
+            }\
+        }\
+        return (target_type) value;\
+    }
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_delta_result(delta_result value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const delta_result neg_one = (delta_result) -1, const_zero = (delta_result) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(delta_result) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(delta_result) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(delta_result) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(delta_result) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(delta_result) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(delta_result),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_unsigned_int(unsigned int value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const unsigned int neg_one = (unsigned int) -1, const_zero = (unsigned int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(unsigned int) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(unsigned int) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(unsigned int) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(unsigned int) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(unsigned int) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(unsigned int),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntFromPy */
+static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(int) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(int, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (int) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(int, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 2 * PyLong_SHIFT) {
+                            return (int) (((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 3 * PyLong_SHIFT) {
+                            return (int) (((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 4 * PyLong_SHIFT) {
+                            return (int) (((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (int) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(int) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(int, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(int,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(int) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                            return (int) ((((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                            return (int) ((((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
+                            return (int) ((((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(int) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            int val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (int) -1;
+        }
+    } else {
+        int val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (int) -1;
+        val = __Pyx_PyInt_As_int(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to int");
+    return (int) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to int");
+    return (int) -1;
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_unsigned_long(unsigned long value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const unsigned long neg_one = (unsigned long) -1, const_zero = (unsigned long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(unsigned long) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(unsigned long) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(unsigned long) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(unsigned long) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(unsigned long) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(unsigned long),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntFromPy */
+static CYTHON_INLINE unsigned long __Pyx_PyInt_As_unsigned_long(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const unsigned long neg_one = (unsigned long) -1, const_zero = (unsigned long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(unsigned long) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(unsigned long, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (unsigned long) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (unsigned long) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(unsigned long, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(unsigned long) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(unsigned long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(unsigned long) >= 2 * PyLong_SHIFT) {
+                            return (unsigned long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(unsigned long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(unsigned long) >= 3 * PyLong_SHIFT) {
+                            return (unsigned long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(unsigned long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(unsigned long) >= 4 * PyLong_SHIFT) {
+                            return (unsigned long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (unsigned long) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(unsigned long) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(unsigned long, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(unsigned long) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(unsigned long, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (unsigned long) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(unsigned long, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(unsigned long,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(unsigned long) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(unsigned long, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(unsigned long) - 1 > 2 * PyLong_SHIFT) {
+                            return (unsigned long) (((unsigned long)-1)*(((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(unsigned long) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(unsigned long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(unsigned long) - 1 > 2 * PyLong_SHIFT) {
+                            return (unsigned long) ((((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(unsigned long) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(unsigned long, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(unsigned long) - 1 > 3 * PyLong_SHIFT) {
+                            return (unsigned long) (((unsigned long)-1)*(((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(unsigned long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(unsigned long) - 1 > 3 * PyLong_SHIFT) {
+                            return (unsigned long) ((((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(unsigned long) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(unsigned long, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(unsigned long) - 1 > 4 * PyLong_SHIFT) {
+                            return (unsigned long) (((unsigned long)-1)*(((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(unsigned long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(unsigned long) - 1 > 4 * PyLong_SHIFT) {
+                            return (unsigned long) ((((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(unsigned long) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(unsigned long, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(unsigned long) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(unsigned long, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            unsigned long val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (unsigned long) -1;
+        }
+    } else {
+        unsigned long val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (unsigned long) -1;
+        val = __Pyx_PyInt_As_unsigned_long(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to unsigned long");
+    return (unsigned long) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to unsigned long");
+    return (unsigned long) -1;
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(int) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(int) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(int) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(int),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntFromPy */
+static CYTHON_INLINE unsigned int __Pyx_PyInt_As_unsigned_int(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const unsigned int neg_one = (unsigned int) -1, const_zero = (unsigned int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(unsigned int) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(unsigned int, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (unsigned int) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (unsigned int) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(unsigned int, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(unsigned int) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(unsigned int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(unsigned int) >= 2 * PyLong_SHIFT) {
+                            return (unsigned int) (((((unsigned int)digits[1]) << PyLong_SHIFT) | (unsigned int)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(unsigned int) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(unsigned int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(unsigned int) >= 3 * PyLong_SHIFT) {
+                            return (unsigned int) (((((((unsigned int)digits[2]) << PyLong_SHIFT) | (unsigned int)digits[1]) << PyLong_SHIFT) | (unsigned int)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(unsigned int) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(unsigned int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(unsigned int) >= 4 * PyLong_SHIFT) {
+                            return (unsigned int) (((((((((unsigned int)digits[3]) << PyLong_SHIFT) | (unsigned int)digits[2]) << PyLong_SHIFT) | (unsigned int)digits[1]) << PyLong_SHIFT) | (unsigned int)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (unsigned int) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(unsigned int) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(unsigned int, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(unsigned int) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(unsigned int, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (unsigned int) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(unsigned int, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(unsigned int,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(unsigned int) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(unsigned int, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(unsigned int) - 1 > 2 * PyLong_SHIFT) {
+                            return (unsigned int) (((unsigned int)-1)*(((((unsigned int)digits[1]) << PyLong_SHIFT) | (unsigned int)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(unsigned int) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(unsigned int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(unsigned int) - 1 > 2 * PyLong_SHIFT) {
+                            return (unsigned int) ((((((unsigned int)digits[1]) << PyLong_SHIFT) | (unsigned int)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(unsigned int) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(unsigned int, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(unsigned int) - 1 > 3 * PyLong_SHIFT) {
+                            return (unsigned int) (((unsigned int)-1)*(((((((unsigned int)digits[2]) << PyLong_SHIFT) | (unsigned int)digits[1]) << PyLong_SHIFT) | (unsigned int)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(unsigned int) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(unsigned int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(unsigned int) - 1 > 3 * PyLong_SHIFT) {
+                            return (unsigned int) ((((((((unsigned int)digits[2]) << PyLong_SHIFT) | (unsigned int)digits[1]) << PyLong_SHIFT) | (unsigned int)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(unsigned int) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(unsigned int, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(unsigned int) - 1 > 4 * PyLong_SHIFT) {
+                            return (unsigned int) (((unsigned int)-1)*(((((((((unsigned int)digits[3]) << PyLong_SHIFT) | (unsigned int)digits[2]) << PyLong_SHIFT) | (unsigned int)digits[1]) << PyLong_SHIFT) | (unsigned int)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(unsigned int) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(unsigned int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(unsigned int) - 1 > 4 * PyLong_SHIFT) {
+                            return (unsigned int) ((((((((((unsigned int)digits[3]) << PyLong_SHIFT) | (unsigned int)digits[2]) << PyLong_SHIFT) | (unsigned int)digits[1]) << PyLong_SHIFT) | (unsigned int)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(unsigned int) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(unsigned int, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(unsigned int) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(unsigned int, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            unsigned int val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (unsigned int) -1;
+        }
+    } else {
+        unsigned int val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (unsigned int) -1;
+        val = __Pyx_PyInt_As_unsigned_int(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to unsigned int");
+    return (unsigned int) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to unsigned int");
+    return (unsigned int) -1;
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(long) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(long) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(long) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(long),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntFromPy */
+static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(long) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(long, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (long) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (long) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(long, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(long) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 2 * PyLong_SHIFT) {
+                            return (long) (((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(long) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 3 * PyLong_SHIFT) {
+                            return (long) (((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(long) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 4 * PyLong_SHIFT) {
+                            return (long) (((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (long) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(long) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (long) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(long, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(long,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(long) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(long) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                            return (long) ((((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(long) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                            return (long) ((((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(long) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                            return (long) ((((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(long) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            long val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (long) -1;
+        }
+    } else {
+        long val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (long) -1;
+        val = __Pyx_PyInt_As_long(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to long");
+    return (long) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to long");
+    return (long) -1;
+}
+
+/* FastTypeChecks */
+#if CYTHON_COMPILING_IN_CPYTHON
+static int __Pyx_InBases(PyTypeObject *a, PyTypeObject *b) {
+    while (a) {
+        a = a->tp_base;
+        if (a == b)
+            return 1;
+    }
+    return b == &PyBaseObject_Type;
+}
+static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b) {
+    PyObject *mro;
+    if (a == b) return 1;
+    mro = a->tp_mro;
+    if (likely(mro)) {
+        Py_ssize_t i, n;
+        n = PyTuple_GET_SIZE(mro);
+        for (i = 0; i < n; i++) {
+            if (PyTuple_GET_ITEM(mro, i) == (PyObject *)b)
+                return 1;
+        }
+        return 0;
+    }
+    return __Pyx_InBases(a, b);
+}
+#if PY_MAJOR_VERSION == 2
+static int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject* exc_type2) {
+    PyObject *exception, *value, *tb;
+    int res;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&exception, &value, &tb);
+    res = exc_type1 ? PyObject_IsSubclass(err, exc_type1) : 0;
+    if (unlikely(res == -1)) {
+        PyErr_WriteUnraisable(err);
+        res = 0;
+    }
+    if (!res) {
+        res = PyObject_IsSubclass(err, exc_type2);
+        if (unlikely(res == -1)) {
+            PyErr_WriteUnraisable(err);
+            res = 0;
+        }
+    }
+    __Pyx_ErrRestore(exception, value, tb);
+    return res;
+}
+#else
+static CYTHON_INLINE int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject *exc_type2) {
+    int res = exc_type1 ? __Pyx_IsSubtype((PyTypeObject*)err, (PyTypeObject*)exc_type1) : 0;
+    if (!res) {
+        res = __Pyx_IsSubtype((PyTypeObject*)err, (PyTypeObject*)exc_type2);
+    }
+    return res;
+}
+#endif
+static int __Pyx_PyErr_GivenExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    assert(PyExceptionClass_Check(exc_type));
+    n = PyTuple_GET_SIZE(tuple);
+#if PY_MAJOR_VERSION >= 3
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+#endif
+    for (i=0; i<n; i++) {
+        PyObject *t = PyTuple_GET_ITEM(tuple, i);
+        #if PY_MAJOR_VERSION < 3
+        if (likely(exc_type == t)) return 1;
+        #endif
+        if (likely(PyExceptionClass_Check(t))) {
+            if (__Pyx_inner_PyErr_GivenExceptionMatches2(exc_type, NULL, t)) return 1;
+        } else {
+        }
+    }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject* exc_type) {
+    if (likely(err == exc_type)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        if (likely(PyExceptionClass_Check(exc_type))) {
+            return __Pyx_inner_PyErr_GivenExceptionMatches2(err, NULL, exc_type);
+        } else if (likely(PyTuple_Check(exc_type))) {
+            return __Pyx_PyErr_GivenExceptionMatchesTuple(err, exc_type);
+        } else {
+        }
+    }
+    return PyErr_GivenExceptionMatches(err, exc_type);
+}
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *exc_type1, PyObject *exc_type2) {
+    assert(PyExceptionClass_Check(exc_type1));
+    assert(PyExceptionClass_Check(exc_type2));
+    if (likely(err == exc_type1 || err == exc_type2)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        return __Pyx_inner_PyErr_GivenExceptionMatches2(err, exc_type1, exc_type2);
+    }
+    return (PyErr_GivenExceptionMatches(err, exc_type1) || PyErr_GivenExceptionMatches(err, exc_type2));
+}
+#endif
+
+/* CheckBinaryVersion */
+static int __Pyx_check_binary_version(void) {
+    char ctversion[5];
+    int same=1, i, found_dot;
+    const char* rt_from_call = Py_GetVersion();
+    PyOS_snprintf(ctversion, 5, "%d.%d", PY_MAJOR_VERSION, PY_MINOR_VERSION);
+    found_dot = 0;
+    for (i = 0; i < 4; i++) {
+        if (!ctversion[i]) {
+            same = (rt_from_call[i] < '0' || rt_from_call[i] > '9');
+            break;
+        }
+        if (rt_from_call[i] != ctversion[i]) {
+            same = 0;
+            break;
+        }
+    }
+    if (!same) {
+        char rtversion[5] = {'\0'};
+        char message[200];
+        for (i=0; i<4; ++i) {
+            if (rt_from_call[i] == '.') {
+                if (found_dot) break;
+                found_dot = 1;
+            } else if (rt_from_call[i] < '0' || rt_from_call[i] > '9') {
+                break;
+            }
+            rtversion[i] = rt_from_call[i];
+        }
+        PyOS_snprintf(message, sizeof(message),
+                      "compiletime version %s of module '%.100s' "
+                      "does not match runtime version %s",
+                      ctversion, __Pyx_MODULE_NAME, rtversion);
+        return PyErr_WarnEx(NULL, message, 1);
+    }
+    return 0;
+}
+
+/* InitStrings */
+static int __Pyx_InitStrings(__Pyx_StringTabEntry *t) {
+    while (t->p) {
+        #if PY_MAJOR_VERSION < 3
+        if (t->is_unicode) {
+            *t->p = PyUnicode_DecodeUTF8(t->s, t->n - 1, NULL);
+        } else if (t->intern) {
+            *t->p = PyString_InternFromString(t->s);
+        } else {
+            *t->p = PyString_FromStringAndSize(t->s, t->n - 1);
+        }
+        #else
+        if (t->is_unicode | t->is_str) {
+            if (t->intern) {
+                *t->p = PyUnicode_InternFromString(t->s);
+            } else if (t->encoding) {
+                *t->p = PyUnicode_Decode(t->s, t->n - 1, t->encoding, NULL);
+            } else {
+                *t->p = PyUnicode_FromStringAndSize(t->s, t->n - 1);
+            }
+        } else {
+            *t->p = PyBytes_FromStringAndSize(t->s, t->n - 1);
+        }
+        #endif
+        if (!*t->p)
+            return -1;
+        if (PyObject_Hash(*t->p) == -1)
+            return -1;
+        ++t;
+    }
+    return 0;
+}
+
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char* c_str) {
+    return __Pyx_PyUnicode_FromStringAndSize(c_str, (Py_ssize_t)strlen(c_str));
+}
+static CYTHON_INLINE const char* __Pyx_PyObject_AsString(PyObject* o) {
+    Py_ssize_t ignore;
+    return __Pyx_PyObject_AsStringAndSize(o, &ignore);
+}
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+#if !CYTHON_PEP393_ENABLED
+static const char* __Pyx_PyUnicode_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+    char* defenc_c;
+    PyObject* defenc = _PyUnicode_AsDefaultEncodedString(o, NULL);
+    if (!defenc) return NULL;
+    defenc_c = PyBytes_AS_STRING(defenc);
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+    {
+        char* end = defenc_c + PyBytes_GET_SIZE(defenc);
+        char* c;
+        for (c = defenc_c; c < end; c++) {
+            if ((unsigned char) (*c) >= 128) {
+                PyUnicode_AsASCIIString(o);
+                return NULL;
+            }
+        }
+    }
+#endif
+    *length = PyBytes_GET_SIZE(defenc);
+    return defenc_c;
+}
+#else
+static CYTHON_INLINE const char* __Pyx_PyUnicode_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+    if (unlikely(__Pyx_PyUnicode_READY(o) == -1)) return NULL;
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+    if (likely(PyUnicode_IS_ASCII(o))) {
+        *length = PyUnicode_GET_LENGTH(o);
+        return PyUnicode_AsUTF8(o);
+    } else {
+        PyUnicode_AsASCIIString(o);
+        return NULL;
+    }
+#else
+    return PyUnicode_AsUTF8AndSize(o, length);
+#endif
+}
+#endif
+#endif
+static CYTHON_INLINE const char* __Pyx_PyObject_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+    if (
+#if PY_MAJOR_VERSION < 3 && __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+            __Pyx_sys_getdefaultencoding_not_ascii &&
+#endif
+            PyUnicode_Check(o)) {
+        return __Pyx_PyUnicode_AsStringAndSize(o, length);
+    } else
+#endif
+#if (!CYTHON_COMPILING_IN_PYPY) || (defined(PyByteArray_AS_STRING) && defined(PyByteArray_GET_SIZE))
+    if (PyByteArray_Check(o)) {
+        *length = PyByteArray_GET_SIZE(o);
+        return PyByteArray_AS_STRING(o);
+    } else
+#endif
+    {
+        char* result;
+        int r = PyBytes_AsStringAndSize(o, &result, length);
+        if (unlikely(r < 0)) {
+            return NULL;
+        } else {
+            return result;
+        }
+    }
+}
+static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject* x) {
+   int is_true = x == Py_True;
+   if (is_true | (x == Py_False) | (x == Py_None)) return is_true;
+   else return PyObject_IsTrue(x);
+}
+static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject* x) {
+    int retval;
+    if (unlikely(!x)) return -1;
+    retval = __Pyx_PyObject_IsTrue(x);
+    Py_DECREF(x);
+    return retval;
+}
+static PyObject* __Pyx_PyNumber_IntOrLongWrongResultType(PyObject* result, const char* type_name) {
+#if PY_MAJOR_VERSION >= 3
+    if (PyLong_Check(result)) {
+        if (PyErr_WarnFormat(PyExc_DeprecationWarning, 1,
+                "__int__ returned non-int (type %.200s).  "
+                "The ability to return an instance of a strict subclass of int "
+                "is deprecated, and may be removed in a future version of Python.",
+                Py_TYPE(result)->tp_name)) {
+            Py_DECREF(result);
+            return NULL;
+        }
+        return result;
+    }
+#endif
+    PyErr_Format(PyExc_TypeError,
+                 "__%.4s__ returned non-%.4s (type %.200s)",
+                 type_name, type_name, Py_TYPE(result)->tp_name);
+    Py_DECREF(result);
+    return NULL;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_IntOrLong(PyObject* x) {
+#if CYTHON_USE_TYPE_SLOTS
+  PyNumberMethods *m;
+#endif
+  const char *name = NULL;
+  PyObject *res = NULL;
+#if PY_MAJOR_VERSION < 3
+  if (likely(PyInt_Check(x) || PyLong_Check(x)))
+#else
+  if (likely(PyLong_Check(x)))
+#endif
+    return __Pyx_NewRef(x);
+#if CYTHON_USE_TYPE_SLOTS
+  m = Py_TYPE(x)->tp_as_number;
+  #if PY_MAJOR_VERSION < 3
+  if (m && m->nb_int) {
+    name = "int";
+    res = m->nb_int(x);
+  }
+  else if (m && m->nb_long) {
+    name = "long";
+    res = m->nb_long(x);
+  }
+  #else
+  if (likely(m && m->nb_int)) {
+    name = "int";
+    res = m->nb_int(x);
+  }
+  #endif
+#else
+  if (!PyBytes_CheckExact(x) && !PyUnicode_CheckExact(x)) {
+    res = PyNumber_Int(x);
+  }
+#endif
+  if (likely(res)) {
+#if PY_MAJOR_VERSION < 3
+    if (unlikely(!PyInt_Check(res) && !PyLong_Check(res))) {
+#else
+    if (unlikely(!PyLong_CheckExact(res))) {
+#endif
+        return __Pyx_PyNumber_IntOrLongWrongResultType(res, name);
+    }
+  }
+  else if (!PyErr_Occurred()) {
+    PyErr_SetString(PyExc_TypeError,
+                    "an integer is required");
+  }
+  return res;
+}
+static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject* b) {
+  Py_ssize_t ival;
+  PyObject *x;
+#if PY_MAJOR_VERSION < 3
+  if (likely(PyInt_CheckExact(b))) {
+    if (sizeof(Py_ssize_t) >= sizeof(long))
+        return PyInt_AS_LONG(b);
+    else
+        return PyInt_AsSsize_t(b);
+  }
+#endif
+  if (likely(PyLong_CheckExact(b))) {
+    #if CYTHON_USE_PYLONG_INTERNALS
+    const digit* digits = ((PyLongObject*)b)->ob_digit;
+    const Py_ssize_t size = Py_SIZE(b);
+    if (likely(__Pyx_sst_abs(size) <= 1)) {
+        ival = likely(size) ? digits[0] : 0;
+        if (size == -1) ival = -ival;
+        return ival;
+    } else {
+      switch (size) {
+         case 2:
+           if (8 * sizeof(Py_ssize_t) > 2 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -2:
+           if (8 * sizeof(Py_ssize_t) > 2 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case 3:
+           if (8 * sizeof(Py_ssize_t) > 3 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -3:
+           if (8 * sizeof(Py_ssize_t) > 3 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case 4:
+           if (8 * sizeof(Py_ssize_t) > 4 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -4:
+           if (8 * sizeof(Py_ssize_t) > 4 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+      }
+    }
+    #endif
+    return PyLong_AsSsize_t(b);
+  }
+  x = PyNumber_Index(b);
+  if (!x) return -1;
+  ival = PyInt_AsSsize_t(x);
+  Py_DECREF(x);
+  return ival;
+}
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject* o) {
+  if (sizeof(Py_hash_t) == sizeof(Py_ssize_t)) {
+    return (Py_hash_t) __Pyx_PyIndex_AsSsize_t(o);
+#if PY_MAJOR_VERSION < 3
+  } else if (likely(PyInt_CheckExact(o))) {
+    return PyInt_AS_LONG(o);
+#endif
+  } else {
+    Py_ssize_t ival;
+    PyObject *x;
+    x = PyNumber_Index(o);
+    if (!x) return -1;
+    ival = PyInt_AsLong(x);
+    Py_DECREF(x);
+    return ival;
+  }
+}
+static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b) {
+  return b ? __Pyx_NewRef(Py_True) : __Pyx_NewRef(Py_False);
+}
+static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t ival) {
+    return PyInt_FromSize_t(ival);
+}
+
+
+#endif /* Py_PYTHON_H */
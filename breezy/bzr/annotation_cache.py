@@ -0,0 +1,276 @@
+# Copyright (C) 2020 Breezy Developers
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA
+
+"""A persistent cache of the annotations of texts.
+
+The content and the ancestry of a text key never change, and neither do
+its annotations, so they can be shared between all the repositories of a
+user. An Annotator given a cache stops walking the ancestry of a text at
+the texts found in it, and only diffs the texts added since.
+
+Annotations are stored as the list of distinct keys they mention, the
+distinct tuples of indices into that list, and runs of lines with the same
+tuple, bencoded and compressed. Each row records when it was last used,
+and the least recently used annotations are evicted once the cache grows
+beyond its size limit.
+
+Annotations are only cached when none of the parents of the texts walked
+to compute them were ghosts, as filling in a ghost changes them.
+"""
+
+import os
+import threading
+import time
+import zlib
+
+try:
+    import sqlite3
+except ImportError:
+    sqlite3 = None
+
+from .. import (
+    bedding,
+    bencode,
+    config,
+    trace,
+    )
+
+
+def serialize_annotations(annotations):
+    """Serialize the annotations of a text.
+
+    :param annotations: A list with a tuple of keys for each line.
+    :return: A bytestring
+    """
+    keys = []
+    key_index = {}
+    origins = []
+    origin_index = {}
+    runs = []
+    last_annotation = None
+    for annotation in annotations:
+        if annotation == last_annotation:
+            runs[-1] += 1
+            continue
+        last_annotation = annotation
+        try:
+            idx = origin_index[annotation]
+        except KeyError:
+            origin = []
+            for key in annotation:
+                try:
+                    origin.append(key_index[key])
+                except KeyError:
+                    origin.append(len(keys))
+                    key_index[key] = len(keys)
+                    keys.append(list(key))
+            idx = origin_index[annotation] = len(origins)
+            origins.append(origin)
+        runs.extend([idx, 1])
+    return zlib.compress(bencode.bencode([keys, origins, runs]))
+
+
+def deserialize_annotations(data):
+    """Deserialize annotations serialized by serialize_annotations."""
+    keys, origins, runs = bencode.bdecode(zlib.decompress(data))
+    keys = [tuple(key) for key in keys]
+    origins = [tuple([keys[idx] for idx in origin]) for origin in origins]
+    annotations = []
+    for pos in range(0, len(runs), 2):
+        annotations.extend([origins[runs[pos]]] * runs[pos + 1])
+    return annotations
+
+
+class AnnotationCache(object):
+    """Annotations of texts stored in a sqlite database."""
+
+    # When the cache grows beyond its limit, annotations are evicted until it
+    # is back under this fraction of the limit, so that eviction does not
+    # run again for each text added.
+    _evict_to_fraction = 0.75
+
+    def __init__(self, path, max_size=None):
+        """Create an AnnotationCache.
+
+        :param path: The path of the sqlite database.
+        :param max_size: The number of bytes of annotations to keep, or None
+            to keep them all.
+        """
+        self._path = path
+        self._max_size = max_size
+        self._size = None
+        self._db = None
+        self._failed = False
+        # The connection is shared by all the threads of the process
+        self._lock = threading.RLock()
+
+    def _get_db(self):
+        if self._db is None and not self._failed:
+            try:
+                db = sqlite3.connect(self._path, check_same_thread=False)
+                db.execute(
+                    'CREATE TABLE IF NOT EXISTS annotations '
+                    '(key BLOB PRIMARY KEY, data BLOB NOT NULL, '
+                    'used INTEGER NOT NULL)')
+                db.execute(
+                    'CREATE INDEX IF NOT EXISTS annotations_used '
+                    'ON annotations (used)')
+                db.commit()
+            except sqlite3.Error as e:
+                self._disable(e)
+            else:
+                self._db = db
+        return self._db
+
+    def _disable(self, e):
+        trace.mutter('not using annotation cache %s: %s', self._path, e)
+        self._failed = True
+        self.close()
+
+    def close(self):
+        """Close the database, it is opened again when next used."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def get_annotations(self, keys):
+        """Get the cached annotations of texts.
+
+        :param keys: An iterable of text keys
+        :return: A dict mapping the keys found to their annotations
+        """
+        with self._lock:
+            return self._get_annotations(keys)
+
+    def _get_annotations(self, keys):
+        result = {}
+        db = self._get_db()
+        if db is None:
+            return result
+        for key in keys:
+            try:
+                row = db.execute(
+                    'SELECT data FROM annotations WHERE key = ?',
+                    (b'\0'.join(key),)).fetchone()
+            except sqlite3.Error as e:
+                self._disable(e)
+                return result
+            if row is None:
+                continue
+            try:
+                result[key] = deserialize_annotations(bytes(row[0]))
+            except (zlib.error, ValueError, TypeError, IndexError) as e:
+                trace.mutter('ignoring bad cached annotations of %r: %s',
+                             key, e)
+        if result:
+            used = int(time.time())
+            try:
+                with db:
+                    db.executemany(
+                        'UPDATE annotations SET used = ? WHERE key = ?',
+                        [(used, b'\0'.join(key)) for key in result])
+            except sqlite3.Error as e:
+                trace.mutter('could not mark cached annotations used: %s', e)
+        return result
+
+    def add_annotations(self, key, annotations):
+        """Store the annotations of a text."""
+        with self._lock:
+            self._add_annotations(key, annotations)
+
+    def _add_annotations(self, key, annotations):
+        db = self._get_db()
+        if db is None:
+            return
+        data = serialize_annotations(annotations)
+        try:
+            with db:
+                db.execute(
+                    'INSERT OR REPLACE INTO annotations VALUES (?, ?, ?)',
+                    (b'\0'.join(key), data, int(time.time())))
+                if self._max_size is not None:
+                    if self._size is None:
+                        self._size = self._get_size(db)
+                    else:
+                        self._size += len(data)
+                    if self._size > self._max_size:
+                        self._evict(db)
+        except sqlite3.Error as e:
+            # Most likely another process holds the lock; the annotations
+            # can be cached next time.
+            trace.mutter('could not cache annotations of %r: %s', key, e)
+
+    def _get_size(self, db):
+        return db.execute(
+            'SELECT COALESCE(SUM(LENGTH(data)), 0) FROM annotations'
+            ).fetchone()[0]
+
+    def _evict(self, db):
+        """Remove the least recently used annotations.
+
+        The size is counted again first, as other processes may have added
+        or evicted annotations since it was last counted.
+        """
+        size = self._get_size(db)
+        target = int(self._max_size * self._evict_to_fraction)
+        evicted = []
+        if size > self._max_size:
+            for key, length in db.execute(
+                    'SELECT key, LENGTH(data) FROM annotations '
+                    'ORDER BY used'):
+                if size <= target:
+                    break
+                evicted.append((key,))
+                size -= length
+            db.executemany('DELETE FROM annotations WHERE key = ?', evicted)
+            trace.mutter('evicted %d texts from annotation cache %s',
+                         len(evicted), self._path)
+        self._size = size
+
+
+# The AnnotationCache of each path used by this process
+_caches = {}
+_caches_lock = threading.Lock()
+
+
+def get_annotation_cache():
+    """Return the annotation cache of the user.
+
+    The same AnnotationCache is returned for as long as the process uses the
+    same cache directory, so that its database is only opened once.
+
+    :return: An AnnotationCache, or None if annotations should not be cached.
+    """
+    if sqlite3 is None:
+        return None
+    if not config.GlobalStack().get('annotate.cache'):
+        return None
+    try:
+        path = os.path.join(bedding.cache_dir(), 'annotations.db')
+    except OSError as e:
+        trace.mutter('not using annotation cache: %s', e)
+        return None
+    max_size = config.GlobalStack().get('annotate.cache_size')
+    if not max_size:
+        max_size = None
+    with _caches_lock:
+        cache = _caches.get(path)
+        if cache is None:
+            cache = _caches[path] = AnnotationCache(path, max_size)
+        else:
+            cache._max_size = max_size
+    return cache
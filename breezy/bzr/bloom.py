@@ -0,0 +1,155 @@
+# Copyright (C) 2020 Breezy Developers
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA
+
+"""Bloom filters over index keys.
+
+A Bloom filter answers whether a key may be in a set, with no false
+negatives and a small rate of false positives. Each pack can carry one
+filter per index so that lookups of keys absent from the pack do not need
+to read its indices at all.
+
+The filters are blocked: all the bits of a key are set in a single 64 bit
+word, so a key is placed with one 128 bit hash, a few table lookups and one integer
+operation rather than a loop over its bit positions. The hashes of a key do
+not depend on the size of the filter, so they can be computed once and
+tested against the filters of many packs.
+"""
+
+import array
+from hashlib import blake2b
+import sys
+
+from .. import (
+    bencode,
+    errors,
+    )
+
+
+_FORMAT_HEADER = b'Bazaar index key filters v2\n'
+
+# About 1% false positives with 12 bits of filter per key, each key setting
+# up to 8 bits of its word
+_BITS_PER_KEY = 12
+
+# Map 12 bits of a hash to a word with (up to) two of its 64 bits set
+_MASKS = [(1 << (i & 63)) | (1 << (i >> 6)) for i in range(4096)]
+
+
+def key_hashes(key):
+    """Return the hashes used to place key in a filter.
+
+    :return: A tuple of the hash selecting the word of the key and the bits
+        to set in that word, or None if key can not be hashed (and so can not
+        be in any index).
+    """
+    try:
+        data = b'\0'.join(key)
+    except TypeError:
+        return None
+    h = int.from_bytes(blake2b(data, digest_size=16).digest(), 'big')
+    return (h >> 64, _MASKS[h & 0xfff] | _MASKS[(h >> 12) & 0xfff] |
+            _MASKS[(h >> 24) & 0xfff] | _MASKS[(h >> 36) & 0xfff])
+
+
+class BloomFilter(object):
+    """A Bloom filter over a set of keys."""
+
+    def __init__(self, words):
+        """Create a BloomFilter.
+
+        :param words: The filter, as a sequence of 64 bit integers.
+        """
+        self._words = words
+        self._num_words = len(words)
+
+    @classmethod
+    def for_keys(cls, num_keys, bits_per_key=_BITS_PER_KEY):
+        """Create an empty filter sized to hold num_keys keys."""
+        return cls([0] * max(1, (num_keys * bits_per_key + 63) // 64))
+
+    @classmethod
+    def build(cls, keys, bits_per_key=_BITS_PER_KEY):
+        """Build a filter containing keys.
+
+        :param keys: A sequence of keys, tuples of bytestrings.
+        """
+        key_filter = cls.for_keys(len(keys), bits_per_key)
+        for key in keys:
+            key_filter.add(key)
+        return key_filter
+
+    def add(self, key):
+        """Add a key, a tuple of bytestrings, to the filter."""
+        hashes = key_hashes(key)
+        if hashes is None:
+            raise TypeError('key must be a tuple of bytestrings: %r' % (key,))
+        word, mask = hashes
+        self._words[word % self._num_words] |= mask
+
+    def __len__(self):
+        """Return the size of the filter in bytes."""
+        return self._num_words * 8
+
+    def may_contain_hashes(self, hashes):
+        """Check whether a key with the given key_hashes may be present."""
+        word, mask = hashes
+        return self._words[word % self._num_words] & mask == mask
+
+    def __contains__(self, key):
+        hashes = key_hashes(key)
+        if hashes is None:
+            return False
+        return self.may_contain_hashes(hashes)
+
+    def to_bytes(self):
+        """Return the words of the filter as little endian bytes."""
+        words = array.array('Q', self._words)
+        if sys.byteorder != 'little':
+            words.byteswap()
+        return words.tobytes()
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Create a BloomFilter from the output of to_bytes."""
+        if not data or len(data) % 8:
+            raise errors.BzrError('invalid key filters')
+        words = array.array('Q')
+        words.frombytes(data)
+        if sys.byteorder != 'little':
+            words.byteswap()
+        return cls(words)
+
+
+def filters_to_bytes(filters):
+    """Serialise a dict mapping names (native strings) to BloomFilters."""
+    return _FORMAT_HEADER + bencode.bencode(
+        [[name.encode('ascii'), key_filter.to_bytes()]
+         for name, key_filter in sorted(filters.items())])
+
+
+def filters_from_bytes(data):
+    """Parse filters serialised with filters_to_bytes.
+
+    :return: A dict mapping names to BloomFilters.
+    """
+    if not data.startswith(_FORMAT_HEADER):
+        raise errors.BzrError('invalid key filters')
+    try:
+        items = bencode.bdecode(data[len(_FORMAT_HEADER):])
+        return dict((name.decode('ascii'), BloomFilter.from_bytes(words))
+                    for name, words in items)
+    except (ValueError, TypeError):
+        raise errors.BzrError('invalid key filters')
@@ -29,6 +29,7 @@ from breezy import (
     shelf,
     )
 from breezy.bzr import (
+    revno_cache as _mod_revno_cache,
     tag as _mod_tag,
     )
 """)
@@ -255,6 +256,69 @@ class BzrBranch(Branch, _RelockDebugMixin):
         """See Branch.basis_tree."""
         return self.repository.revision_tree(self.last_revision())
 
+    def _iter_merge_sort_ancestry(self):
+        """See Branch._iter_merge_sort_ancestry.
+
+        If the 'revno-cache' file is up to date, it is read as the nodes are
+        consumed rather than loaded in memory.
+        """
+        if self._merge_sorted_revisions_cache is None:
+            revno, last_revision = self.last_revision_info()
+            if not _mod_revision.is_null(last_revision):
+                cache = _mod_revno_cache.RevnoCache(self._transport)
+                nodes = cache.iter_merge_sort(self, revno, last_revision)
+                if nodes is not None:
+                    return nodes
+        return super(BzrBranch, self)._iter_merge_sort_ancestry()
+
+    def _merge_sort_ancestry(self):
+        """See Branch._merge_sort_ancestry.
+
+        The result is kept in the 'revno-cache' file in the branch control
+        directory, and extended incrementally as the tip moves forward.
+        """
+        revno, last_revision = self.last_revision_info()
+        if _mod_revision.is_null(last_revision):
+            return super(BzrBranch, self)._merge_sort_ancestry()
+        cache = _mod_revno_cache.RevnoCache(self._transport)
+        return cache.merge_sort(self, revno, last_revision)
+
+    def _do_dotted_revno_to_revision_id(self, revno):
+        """See Branch._do_dotted_revno_to_revision_id.
+
+        Dotted revnos are looked up by walking the merge sorted history from
+        the tip, rather than building the whole revno map.
+        """
+        if len(revno) == 1 or self._revision_id_to_revno_cache is not None:
+            return super(BzrBranch, self)._do_dotted_revno_to_revision_id(
+                revno)
+        for revision_id, depth, this_revno, end_of_merge in (
+                self.iter_merge_sorted_revisions()):
+            if this_revno == revno:
+                return revision_id
+        raise errors.NoSuchRevision(self, '.'.join(map(str, revno)))
+
+    def _do_revision_id_to_dotted_revno(self, revision_id):
+        """See Branch._do_revision_id_to_dotted_revno.
+
+        Revisions that are not on the mainline are looked up by walking the
+        merge sorted history from the tip, rather than building the whole
+        revno map.
+        """
+        if (self._revision_id_to_revno_cache is not None
+                or revision_id in self._partial_revision_id_to_revno_cache):
+            return super(BzrBranch, self)._do_revision_id_to_dotted_revno(
+                revision_id)
+        try:
+            return (self.revision_id_to_revno(revision_id),)
+        except errors.NoSuchRevision:
+            pass
+        for this_revision_id, depth, revno, end_of_merge in (
+                self.iter_merge_sorted_revisions()):
+            if this_revision_id == revision_id:
+                return revno
+        raise errors.NoSuchRevision(self, revision_id)
+
     def _get_parent_location(self):
         _locs = ['parent', 'pull', 'x-pull']
         for l in _locs:
@@ -30,6 +30,7 @@ import zlib
 from .. import (
     chunk_writer,
     debug,
+    errors,
     fifo_cache,
     lru_cache,
     osutils,
@@ -44,6 +45,7 @@ from .index import _OPTION_NODE_REFS, _OPTION_KEY_ELEMENTS, _OPTION_LEN
 
 
 _BTSIGNATURE = b"B+Tree Graph Index 2\n"
+_BTSIGNATURE_RAW_LEAVES = b"B+Tree Graph Index 2 raw leaves\n"
 _OPTION_ROW_LENGTHS = b"row_lengths="
 _LEAF_FLAG = b"type=leaf\n"
 _INTERNAL_FLAG = b"type=internal\n"
@@ -55,6 +57,11 @@ _PAGE_SIZE = 4096
 # 4K per page: 4MB - 1000 entries
 _NODE_CACHE_SIZE = 1000
 
+# Leaves of indices on local disk are parsed lazily, and cached up to a size
+_LAZY_LOCAL_INDICES = True
+# The estimated size of the parsed leaf nodes to cache for local indices
+_NODE_CACHE_BYTES = 64 * 1024 * 1024
+
 
 class _BuilderRow(object):
     """The stored state accumulated while writing out a row in the index.
@@ -107,6 +114,41 @@ class _LeafBuilderRow(_BuilderRow):
     """The stored state accumulated while writing out a leaf rows."""
 
 
+class _RawLeafWriter(object):
+    """Write uncompressed leaf nodes with a fixed size.
+
+    This provides the interface of ChunkWriter, but pads with newlines rather
+    than null bytes, so that the rows of a node always end with an empty
+    line.
+    """
+
+    def __init__(self, chunk_size, reserved=0, optimize_for_size=False):
+        self.chunk_size = chunk_size
+        self.reserved_size = reserved
+        self.bytes_list = []
+        self.bytes_len = 0
+        self.unused_bytes = None
+
+    def write(self, bytes, reserved=False):
+        """See ChunkWriter.write."""
+        # Always leave room for at least one newline of padding
+        capacity = self.chunk_size - 1
+        if not reserved:
+            capacity -= self.reserved_size
+        if self.bytes_len + len(bytes) > capacity:
+            self.unused_bytes = bytes
+            return True
+        self.bytes_list.append(bytes)
+        self.bytes_len += len(bytes)
+        return False
+
+    def finish(self):
+        """See ChunkWriter.finish."""
+        padding = self.chunk_size - self.bytes_len
+        self.bytes_list.append(b"\n" * padding)
+        return self.bytes_list, self.unused_bytes, padding
+
+
 class BTreeBuilder(index.GraphIndexBuilder):
     """A Builder for B+Tree based Graph indices.
 
@@ -135,6 +177,8 @@ class BTreeBuilder(index.GraphIndexBuilder):
     VALUE          := no-newline-no-null-bytes
     """
 
+    _index_signature = _BTSIGNATURE
+
     def __init__(self, reference_lists=0, key_elements=1, spill_at=100000):
         """See GraphIndexBuilder.__init__.
 
@@ -198,8 +242,7 @@ class BTreeBuilder(index.GraphIndexBuilder):
             new_backing_file, size = self._spill_mem_keys_without_combining()
         # Note: The transport here isn't strictly needed, because we will use
         #       direct access to the new_backing._file object
-        new_backing = BTreeGraphIndex(transport.get_transport_from_path('.'),
-                                      '<temp>', size)
+        new_backing = self._make_backing_index(size)
         # GC will clean up the file
         new_backing._file = new_backing_file
         if self._combine_backing_indices:
@@ -213,6 +256,10 @@ class BTreeBuilder(index.GraphIndexBuilder):
         self._nodes = {}
         self._nodes_by_key = None
 
+    def _make_backing_index(self, size):
+        return BTreeGraphIndex(transport.get_transport_from_path('.'),
+                               '<temp>', size)
+
     def _spill_mem_keys_without_combining(self):
         return self._write_nodes(self._iter_mem_nodes(), allow_optimize=False)
 
@@ -319,15 +366,21 @@ class BTreeBuilder(index.GraphIndexBuilder):
             length = _PAGE_SIZE
             if rows[-1].nodes == 0:
                 length -= _RESERVED_HEADER_BYTES  # padded
-            rows[-1].writer = chunk_writer.ChunkWriter(
-                length, optimize_for_size=self._optimize_for_size)
+            rows[-1].writer = self._new_leaf_writer(length)
             rows[-1].writer.write(_LEAF_FLAG)
         if rows[-1].writer.write(line):
             # if we failed to write, despite having an empty page to write to,
             # then line is too big. raising the error avoids infinite recursion
             # searching for a suitably large page that will not be found.
             if new_leaf:
-                raise index.BadIndexKey(string_key)
+                writer = self._new_oversize_leaf_writer(length)
+                if writer is None:
+                    raise index.BadIndexKey(string_key)
+                writer.write(_LEAF_FLAG)
+                if writer.write(line):
+                    raise index.BadIndexKey(string_key)
+                rows[-1].writer = writer
+                return
             # this key did not fit in the node:
             rows[-1].finish_node()
             key_line = string_key + b"\n"
@@ -363,6 +416,17 @@ class BTreeBuilder(index.GraphIndexBuilder):
             self._add_key(string_key, line, rows,
                           allow_optimize=allow_optimize)
 
+    def _new_leaf_writer(self, length):
+        return chunk_writer.ChunkWriter(
+            length, optimize_for_size=self._optimize_for_size)
+
+    def _new_oversize_leaf_writer(self, length):
+        """Return a writer for a leaf whose first line did not fit.
+
+        :return: A writer, or None if there is no larger leaf to fall back to.
+        """
+        return None
+
     def _write_nodes(self, node_iterator, allow_optimize=True):
         """Write node_iterator out as a B+Tree.
 
@@ -400,7 +464,7 @@ class BTreeBuilder(index.GraphIndexBuilder):
         for row in reversed(rows):
             pad = (not isinstance(row, _LeafBuilderRow))
             row.finish_node(pad=pad)
-        lines = [_BTSIGNATURE]
+        lines = [self._index_signature]
         lines.append(b'%s%d\n' % (_OPTION_NODE_REFS, self.reference_lists))
         lines.append(b'%s%d\n' % (_OPTION_KEY_ELEMENTS, self._key_length))
         lines.append(b'%s%d\n' % (_OPTION_LEN, key_count))
@@ -441,13 +505,24 @@ class BTreeBuilder(index.GraphIndexBuilder):
         result.seek(0)
         return result, size
 
-    def finish(self):
+    def finish(self, add_key=None):
         """Finalise the index.
 
+        :param add_key: An optional callable which is given each key as it
+            is written, e.g. to build a bloom.BloomFilter without another
+            pass over the (possibly spilled) nodes.
         :return: A file handle for a temporary file containing the nodes added
             to the index.
         """
-        return self._write_nodes(self.iter_all_entries())[0]
+        nodes = self.iter_all_entries()
+        if add_key is not None:
+            nodes = self._iter_adding_keys(nodes, add_key)
+        return self._write_nodes(nodes)[0]
+
+    def _iter_adding_keys(self, nodes, add_key):
+        for node in nodes:
+            add_key(node[1])
+            yield node
 
     def iter_all_entries(self):
         """Iterate over all keys within the index
@@ -620,6 +695,140 @@ class _LeafNode(dict):
         return keys
 
 
+class _LazyLeafNode(object):
+    """A leaf node that is only parsed as far as needed.
+
+    Lookups of single keys bisect on the lines of the decompressed node and
+    only parse the matching line. The whole node is parsed the first time
+    all of its items are needed.
+    """
+
+    __slots__ = ('_bytes', '_key_length', '_ref_list_length', '_node')
+
+    def __init__(self, bytes, key_length, ref_list_length):
+        self._bytes = bytes
+        self._key_length = key_length
+        self._ref_list_length = ref_list_length
+        self._node = None
+
+    @property
+    def size(self):
+        """The approximate memory used by this node once parsed, in bytes.
+
+        LRUSizeCache only measures nodes when they are added, so nodes are
+        charged for the space they take after being parsed, which is about
+        four times that of their lines.
+        """
+        return 4 * len(self._bytes)
+
+    def _get_node(self):
+        if self._node is None:
+            self._node = _LeafNode(self._bytes, self._key_length,
+                                   self._ref_list_length)
+        return self._node
+
+    def _parse_line(self, start, end):
+        return _btree_serializer._parse_leaf_lines(
+            _LEAF_FLAG + self._bytes[start:end + 1], self._key_length,
+            self._ref_list_length)[0]
+
+    def _line_key(self, start, end):
+        return tuple(self._bytes[start:end].split(
+            b'\0', self._key_length)[:self._key_length])
+
+    def _find_line(self, key):
+        """Find the line for key.
+
+        :return: The start and end offsets of the line, or None if key is not
+            in this node.
+        """
+        data = self._bytes
+        key = tuple(key)
+        if (len(key) != self._key_length
+                or not all(isinstance(element, bytes) for element in key)):
+            # Can never match, as for a lookup in a parsed node
+            return None
+        lo = len(_LEAF_FLAG)
+        hi = len(data)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = data.rfind(b'\n', lo, mid)
+            if start == -1:
+                start = lo
+            else:
+                start += 1
+            end = data.find(b'\n', start, hi)
+            if end == -1:
+                end = hi
+            if start == end:
+                # Trailing empty line
+                hi = start
+                continue
+            line_key = self._line_key(start, end)
+            if line_key == key:
+                return start, end
+            elif line_key < key:
+                lo = end + 1
+            else:
+                hi = start
+        return None
+
+    def __contains__(self, key):
+        if self._node is not None:
+            return key in self._node
+        return self._find_line(key) is not None
+
+    def __getitem__(self, key):
+        if self._node is not None:
+            return self._node[key]
+        line = self._find_line(key)
+        if line is None:
+            raise KeyError(key)
+        return self._parse_line(*line)[1]
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __len__(self):
+        return len(self._get_node())
+
+    def __iter__(self):
+        return iter(self._get_node())
+
+    def keys(self):
+        return self._get_node().keys()
+
+    def items(self):
+        return self._get_node().items()
+
+    @property
+    def min_key(self):
+        return self._get_node().min_key
+
+    @property
+    def max_key(self):
+        return self._get_node().max_key
+
+    def all_items(self):
+        """Return a sorted list of (key, (value, refs)) items"""
+        return self._get_node().all_items()
+
+    def all_keys(self):
+        """Return a sorted list of all keys."""
+        return self._get_node().all_keys()
+
+
+def _leaf_node_size(node):
+    """Estimate the memory used by a leaf node, for LRUSizeCache."""
+    try:
+        return node.size
+    except AttributeError:
+        return 4 * _PAGE_SIZE
+
+
 class _InternalNode(object):
     """An internal node for a serialised B+Tree index."""
 
@@ -648,6 +857,9 @@ class BTreeGraphIndex(object):
 
     Individual nodes are held in a LRU cache. This holds the root node in
     memory except when very large walks are done.
+
+    The leaf nodes of indices on a local disk are parsed lazily, and their
+    cache is bounded by size rather than by the number of nodes.
     """
 
     def __init__(self, transport, name, size, unlimited_cache=False,
@@ -671,6 +883,12 @@ class BTreeGraphIndex(object):
         self._name = name
         self._size = size
         self._file = None
+        self._local_path = None
+        if _LAZY_LOCAL_INDICES:
+            try:
+                self._local_path = transport.local_abspath(name)
+            except errors.NotLocalUrl:
+                pass
         self._recommended_pages = self._compute_recommended_pages()
         self._root_node = None
         self._base_offset = offset
@@ -681,7 +899,11 @@ class BTreeGraphIndex(object):
             self._leaf_node_cache = {}
             self._internal_node_cache = {}
         else:
-            self._leaf_node_cache = lru_cache.LRUCache(_NODE_CACHE_SIZE)
+            if self._local_path is not None:
+                self._leaf_node_cache = lru_cache.LRUSizeCache(
+                    _NODE_CACHE_BYTES, compute_size=_leaf_node_size)
+            else:
+                self._leaf_node_cache = lru_cache.LRUCache(_NODE_CACHE_SIZE)
             # We use a FIFO here just to prevent possible blowout. However, a
             # 300k record btree has only 3k leaf nodes, and only 20 internal
             # nodes. A value of 100 scales to ~100*100*100 = 1M records.
@@ -1329,10 +1551,9 @@ class BTreeGraphIndex(object):
         'bar'), ('foobar', 'gam') and do a prefix search for ('foo', None) then
         only the former key is returned.
 
-        WARNING: Note that this method currently causes a full index parse
-        unconditionally (which is reasonably appropriate as it is a means for
-        thunking many small indices into one larger one and still supplies
-        iter_all_entries at the thunk layer).
+        Only the nodes whose key range can hold keys with one of the prefixes
+        are read, so e.g. all the texts of a single file can be found without
+        reading the whole text index.
 
         :param keys: An iterable providing the key prefixes to be retrieved.
             Each key prefix takes the form of a tuple the length of a key, but
@@ -1343,58 +1564,67 @@ class BTreeGraphIndex(object):
             will be returned, and every match that is in the index will be
             returned.
         """
-        keys = sorted(set(keys))
+        keys = set(keys)
         if not keys:
             return
         # Load if needed to check key lengths
         if self._key_count is None:
             self._get_root_node()
-        # TODO: only access nodes that can satisfy the prefixes we are looking
-        # for. For now, to meet API usage (as this function is not used by
-        # current breezy) just suck the entire index and iterate in memory.
-        nodes = {}
-        if self.node_ref_lists:
-            if self._key_length == 1:
-                for _1, key, value, refs in self.iter_all_entries():
-                    nodes[key] = value, refs
-            else:
-                nodes_by_key = {}
-                for _1, key, value, refs in self.iter_all_entries():
-                    key_value = key, value, refs
-                    # For a key of (foo, bar, baz) create
-                    # _nodes_by_key[foo][bar][baz] = key_value
-                    key_dict = nodes_by_key
-                    for subkey in key[:-1]:
-                        key_dict = key_dict.setdefault(subkey, {})
-                    key_dict[key[-1]] = key_value
-        else:
-            if self._key_length == 1:
-                for _1, key, value in self.iter_all_entries():
-                    nodes[key] = value
-            else:
-                nodes_by_key = {}
-                for _1, key, value in self.iter_all_entries():
-                    key_value = key, value
-                    # For a key of (foo, bar, baz) create
-                    # _nodes_by_key[foo][bar][baz] = key_value
-                    key_dict = nodes_by_key
-                    for subkey in key[:-1]:
-                        key_dict = key_dict.setdefault(subkey, {})
-                    key_dict[key[-1]] = key_value
-        if self._key_length == 1:
-            for key in keys:
-                index._sanity_check_key(self, key)
-                try:
-                    if self.node_ref_lists:
-                        value, node_refs = nodes[key]
-                        yield self, key, value, node_refs
-                    else:
-                        yield self, key, nodes[key]
-                except KeyError:
-                    pass
+        prefixes = set()
+        for key in keys:
+            index._sanity_check_key(self, key)
+            prefix = []
+            for element in key:
+                if element is None:
+                    break
+                prefix.append(element)
+            prefixes.add(tuple(prefix))
+        if not self.key_count():
             return
-        for entry in index._iter_entries_prefix(self, nodes_by_key, keys):
-            yield entry
+        prefixes = sorted(prefixes)
+        prefix_lengths = sorted(set(len(prefix) for prefix in prefixes))
+        node_indexes = [0]
+        for next_row_start in self._row_offsets[1:-1]:
+            nodes = self._get_internal_nodes(node_indexes)
+            next_node_indexes = set()
+            for node_index in node_indexes:
+                node = nodes[node_index]
+                node_offset = next_row_start + node.offset
+                for prefix in prefixes:
+                    next_node_indexes.update(
+                        node_offset + pos for pos in
+                        self._prefix_positions(prefix, node.keys))
+            node_indexes = sorted(next_node_indexes)
+        nodes = self._get_leaf_nodes(node_indexes)
+        prefixes = set(prefixes)
+        for node_index in node_indexes:
+            for key, (value, refs) in nodes[node_index].all_items():
+                for length in prefix_lengths:
+                    if key[:length] in prefixes:
+                        break
+                else:
+                    continue
+                if self.node_ref_lists:
+                    yield (self, key, value, refs)
+                else:
+                    yield (self, key, value)
+
+    @staticmethod
+    def _prefix_positions(prefix, fixed_keys):
+        """Find the children of an internal node that can hold prefix.
+
+        :param prefix: A key prefix, without trailing None elements
+        :param fixed_keys: The keys of an internal node
+        :return: A list of child positions
+        """
+        # A prefix sorts before all the keys starting with it
+        pos = bisect.bisect_right(fixed_keys, prefix)
+        positions = [pos]
+        length = len(prefix)
+        while pos < len(fixed_keys) and fixed_keys[pos][:length] == prefix:
+            pos += 1
+            positions.append(pos)
+        return positions
 
     def key_count(self):
         """Return an estimate of the number of keys in this index.
@@ -1423,10 +1653,12 @@ class BTreeGraphIndex(object):
         :return: An offset, data tuple such as readv yields, for the unparsed
             data. (which may be of length 0).
         """
-        signature = bytes[0:len(self._signature())]
-        if not signature == self._signature():
+        for signature in self._signatures():
+            if bytes.startswith(signature):
+                break
+        else:
             raise index.BadIndexFormatSignature(self._name, BTreeGraphIndex)
-        lines = bytes[len(self._signature()):].splitlines()
+        lines = bytes[len(signature):].splitlines()
         options_line = lines[0]
         if not options_line.startswith(_OPTION_NODE_REFS):
             raise index.BadIndexOptions(self)
@@ -1506,9 +1738,12 @@ class BTreeGraphIndex(object):
                                          % (offset, self._size))
                 size = min(size, self._size - offset)
             ranges.append((base_offset + offset, size))
+        leaf_factory = self._leaf_factory
+        if self._local_path is not None and leaf_factory is _LeafNode:
+            leaf_factory = _LazyLeafNode
         if not ranges:
             return
-        elif bytes is not None:
+        if bytes is not None:
             # already have the whole file
             data_ranges = [(start, bytes[start:start + size])
                            for start, size in ranges]
@@ -1519,6 +1754,12 @@ class BTreeGraphIndex(object):
             for offset, size in ranges:
                 self._file.seek(offset)
                 data_ranges.append((offset, self._file.read(size)))
+        for result in self._parse_nodes(data_ranges, leaf_factory):
+            yield result
+
+    def _parse_nodes(self, data_ranges, leaf_factory):
+        """Parse the pages of the index read by _read_nodes."""
+        base_offset = self._base_offset
         for offset, data in data_ranges:
             offset -= base_offset
             if offset == 0:
@@ -1526,10 +1767,17 @@ class BTreeGraphIndex(object):
                 offset, data = self._parse_header_from_bytes(data)
                 if len(data) == 0:
                     continue
-            bytes = zlib.decompress(data)
+            if data[:len(_LEAF_FLAG)] == _LEAF_FLAG:
+                # An uncompressed leaf, padded with newlines
+                bytes = data
+                end = bytes.find(b'\n\n')
+                if end != -1:
+                    bytes = bytes[:end + 1]
+            else:
+                bytes = zlib.decompress(data)
             if bytes.startswith(_LEAF_FLAG):
-                node = self._leaf_factory(bytes, self._key_length,
-                                          self.node_ref_lists)
+                node = leaf_factory(bytes, self._key_length,
+                                    self.node_ref_lists)
             elif bytes.startswith(_INTERNAL_FLAG):
                 node = _InternalNode(bytes)
             else:
@@ -1540,6 +1788,10 @@ class BTreeGraphIndex(object):
         """The file signature for this index type."""
         return _BTSIGNATURE
 
+    def _signatures(self):
+        """The file signatures this index can read."""
+        return (self._signature(),)
+
     def validate(self):
         """Validate that everything in the index can be accessed."""
         # just read and parse every node.
@@ -1554,6 +1806,46 @@ class BTreeGraphIndex(object):
             pass
 
 
+class BTreeRawLeafGraphIndex(BTreeGraphIndex):
+    """A B+Tree index whose leaf nodes may be stored uncompressed.
+
+    Indices written by BTreeBuilder can be read as well, so both can be used
+    in the same repository.
+    """
+
+    def _signature(self):
+        """The file signature for this index type."""
+        return _BTSIGNATURE_RAW_LEAVES
+
+    def _signatures(self):
+        """The file signatures this index can read."""
+        return (_BTSIGNATURE_RAW_LEAVES, _BTSIGNATURE)
+
+
+class BTreeRawLeafBuilder(BTreeBuilder):
+    """A Builder for B+Tree indices with uncompressed leaf nodes.
+
+    Leaves can then be used without being decompressed, which makes lookups
+    considerably cheaper at the cost of larger indices. Internal nodes are
+    still compressed.
+    """
+
+    _index_signature = _BTSIGNATURE_RAW_LEAVES
+
+    def _make_backing_index(self, size):
+        return BTreeRawLeafGraphIndex(transport.get_transport_from_path('.'),
+                                      '<temp>', size)
+
+    def _new_leaf_writer(self, length):
+        return _RawLeafWriter(length)
+
+    def _new_oversize_leaf_writer(self, length):
+        # Lines longer than a page, e.g. of very long file ids, are stored in
+        # a compressed leaf instead, as readers accept both kinds of leaf.
+        return chunk_writer.ChunkWriter(
+            length, optimize_for_size=self._optimize_for_size)
+
+
 _gcchk_factory = _LeafNode
 
 try:
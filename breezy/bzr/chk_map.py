@@ -261,9 +261,14 @@ class CHKMap(object):
         node = LeafNode(search_key_func=search_key_func)
         node.set_maximum_size(maximum_size)
         node._key_width = key_width
-        as_st = StaticTuple.from_sequence
-        node._items = dict((as_st(key), val)
-                           for key, val in initial_value.items())
+        if all(key.__class__ is StaticTuple for key in initial_value):
+            # The node is only read from, so there is no need to copy what
+            # may be the contents of a whole inventory.
+            node._items = initial_value
+        else:
+            as_st = StaticTuple.from_sequence
+            node._items = dict((as_st(key), val)
+                               for key, val in initial_value.items())
         node._raw_size = sum(node._key_value_len(key, value)
                              for key, value in node._items.items())
         node._len = len(node._items)
@@ -1719,6 +1724,81 @@ def iter_interesting_nodes(store, interesting_root_keys,
     return iterator.process()
 
 
+def _changed_child_keys(data, basis_data):
+    """Find the children that differ between two serialised internal nodes.
+
+    This compares the lines of the pages rather than deserialising them.
+
+    :return: A list of (child_key, basis_child_key) pairs for the prefixes
+        whose pages differ.
+    """
+    lines = data.split(b'\n')
+    basis_lines = basis_data.split(b'\n')
+    common_prefix = lines[4]
+    basis_common_prefix = basis_lines[4]
+    # Skip the header and the empty string after the trailing newline
+    new_lines = set(lines[5:-1])
+    old_lines = set(basis_lines[5:-1])
+    basis_children = {}
+    for line in old_lines.difference(new_lines):
+        prefix, flat_key = (basis_common_prefix + line).rsplit(b'\x00', 1)
+        basis_children[prefix] = flat_key
+    changed = []
+    for line in new_lines.difference(old_lines):
+        prefix, flat_key = (common_prefix + line).rsplit(b'\x00', 1)
+        basis_flat_key = basis_children.get(prefix)
+        if basis_flat_key is not None:
+            changed.append(
+                (StaticTuple(flat_key,), StaticTuple(basis_flat_key,)))
+    return changed
+
+
+def read_ahead_changes(store, root_key_pairs, max_bytes=None):
+    """Read the pages needed to compare pairs of maps into the page cache.
+
+    CHKMap.iter_changes reads each page it needs with a separate request.
+    When comparing many pairs of maps, this reads the pages that differ
+    between the maps of every pair level by level instead, with one request
+    per level.
+
+    :param root_key_pairs: An iterable of (root_key, basis_root_key) pairs
+        for the maps that are going to be compared.
+    :param max_bytes: If not None, stop after a level once this many bytes
+        have been read, so pages are not evicted before they are used.
+    :return: The number of bytes read.
+    """
+    page_cache = _get_cache()
+    pending = set(root_key_pairs)
+    total_bytes = 0
+    while pending:
+        keys = set()
+        for key_pair in pending:
+            keys.update(key_pair)
+        missing = [key for key in keys if key not in page_cache]
+        if missing:
+            stream = store.get_record_stream(missing, 'unordered', True)
+            for record in stream:
+                if record.storage_kind == 'absent':
+                    continue
+                data = record.get_bytes_as('fulltext')
+                page_cache[record.key] = data
+                total_bytes += len(data)
+        if max_bytes is not None and total_bytes >= max_bytes:
+            break
+        next_pending = set()
+        for key, basis_key in pending:
+            try:
+                data = page_cache[key]
+                basis_data = page_cache[basis_key]
+            except KeyError:
+                continue
+            if (data.startswith(b"chknode:\n") and
+                    basis_data.startswith(b"chknode:\n")):
+                next_pending.update(_changed_child_keys(data, basis_data))
+        pending = next_pending
+    return total_bytes
+
+
 try:
     from ._chk_map_pyx import (
         _bytes_to_text_key,
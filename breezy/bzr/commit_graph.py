@@ -0,0 +1,301 @@
+# Copyright (C) 2020 Breezy Developers
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA
+
+"""A compact, fixed width file describing the revision graph.
+
+The commit graph stores the parents of every revision as positions in the
+file, along with the generation number of the revision: one more than the
+highest generation of its parents, with NULL_REVISION at generation 0. A
+revision can only be an ancestor of revisions with a higher generation, which
+lets searches such as Graph.heads() stop early.
+
+Only revisions with no ghosts in their ancestry are stored, so a generation
+number never changes once written and all ancestors of a stored revision are
+stored as well.
+
+The file layout is::
+
+    Bazaar commit graph v1
+    <number of revisions> <number of extra parents>    (2 x uint32)
+    <generation> <parent 1> <parent 2>                 (3 x uint32 per revision)
+    <extra parent>                                     (uint32 each)
+    <revision id offset>                               (uint32, one more than
+                                                        the number of revisions)
+    <revision ids>
+
+All integers are big endian. Revisions are sorted by revision id, so they can
+be looked up by bisection without reading the whole file. A missing parent is
+stored as _NO_PARENT. Revisions with more than two parents store the offset of
+their remaining parents in the extra parent list with _EXTRA_PARENTS set as
+the second parent; the last of those parents has _EXTRA_PARENTS set.
+"""
+
+import mmap
+import struct
+
+from .. import (
+    errors,
+    graph as _mod_graph,
+    revision as _mod_revision,
+    )
+
+
+_FORMAT_HEADER = b'Bazaar commit graph v1\n'
+
+_COUNTS = struct.Struct('>II')
+_RECORD = struct.Struct('>III')
+_UINT32 = struct.Struct('>I')
+
+_NO_PARENT = 0xffffffff
+_EXTRA_PARENTS = 0x80000000
+
+
+def build_commit_graph(parent_map):
+    """Serialise the commit graph for the revisions in parent_map.
+
+    :param parent_map: Dict mapping every revision id to its parents.
+        Parents that are not keys of parent_map are ghosts; revisions with a
+        ghost in their ancestry are left out.
+    :return: The contents of the commit graph file, as bytes.
+    """
+    known_graph = _mod_graph.KnownGraph(parent_map)
+    generations = {_mod_revision.NULL_REVISION: 0}
+    for revision_id in known_graph.topo_sort():
+        parent_ids = parent_map.get(revision_id)
+        if parent_ids is None:
+            continue
+        generation = 0
+        for parent_id in parent_ids:
+            parent_generation = generations.get(parent_id)
+            if parent_generation is None:
+                # A ghost, or a descendant of one
+                break
+            generation = max(generation, parent_generation)
+        else:
+            generations[revision_id] = generation + 1
+    del generations[_mod_revision.NULL_REVISION]
+    revision_ids = sorted(generations)
+    positions = dict(
+        (revision_id, pos) for pos, revision_id in enumerate(revision_ids))
+    records = []
+    extra_parents = []
+    id_offsets = []
+    offset = 0
+    for revision_id in revision_ids:
+        parents = [positions[parent_id]
+                   for parent_id in parent_map[revision_id]
+                   if parent_id != _mod_revision.NULL_REVISION]
+        if len(parents) > 2:
+            extra_start = len(extra_parents)
+            extra_parents.extend(parents[1:])
+            extra_parents[-1] |= _EXTRA_PARENTS
+            parents[1] = _EXTRA_PARENTS | extra_start
+        parents.extend([_NO_PARENT, _NO_PARENT])
+        records.append(_RECORD.pack(
+            generations[revision_id], parents[0], parents[1]))
+        id_offsets.append(_UINT32.pack(offset))
+        offset += len(revision_id)
+    id_offsets.append(_UINT32.pack(offset))
+    return b''.join(
+        [_FORMAT_HEADER, _COUNTS.pack(len(revision_ids), len(extra_parents))]
+        + records
+        + [_UINT32.pack(parent) for parent in extra_parents]
+        + id_offsets + revision_ids)
+
+
+class CommitGraph(object):
+    """Read access to a commit graph file."""
+
+    def __init__(self, data):
+        """Create a CommitGraph.
+
+        :param data: The contents of the file, as bytes or a read-only mmap.
+        """
+        if data[:len(_FORMAT_HEADER)] != _FORMAT_HEADER:
+            raise errors.BzrError('invalid commit graph')
+        self._data = data
+        start = len(_FORMAT_HEADER)
+        try:
+            self._count, num_extra = _COUNTS.unpack_from(data, start)
+        except struct.error:
+            raise errors.BzrError('invalid commit graph')
+        self._records_start = start + _COUNTS.size
+        self._extra_start = self._records_start + self._count * _RECORD.size
+        self._offsets_start = self._extra_start + num_extra * _UINT32.size
+        self._ids_start = (
+            self._offsets_start + (self._count + 1) * _UINT32.size)
+        if (len(data) < self._ids_start
+                or len(data) != self._ids_start + self._id_offset(self._count)):
+            raise errors.BzrError('invalid commit graph')
+        # Positions of revisions looked up so far
+        self._positions = {}
+
+    @classmethod
+    def from_file(cls, path):
+        """Map the commit graph at path into memory."""
+        with open(path, 'rb') as f:
+            try:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files can not be mapped
+                data = b''
+        return cls(data)
+
+    def __len__(self):
+        return self._count
+
+    def _id_offset(self, pos):
+        return _UINT32.unpack_from(
+            self._data, self._offsets_start + pos * _UINT32.size)[0]
+
+    def _revision_id(self, pos):
+        return self._data[self._ids_start + self._id_offset(pos):
+                          self._ids_start + self._id_offset(pos + 1)]
+
+    def _position(self, revision_id):
+        """Return the position of revision_id, or None if not present."""
+        try:
+            return self._positions[revision_id]
+        except KeyError:
+            pass
+        lo = 0
+        hi = self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._revision_id(mid) < revision_id:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo == self._count or self._revision_id(lo) != revision_id:
+            return None
+        self._positions[revision_id] = lo
+        return lo
+
+    def _generation(self, pos):
+        return _UINT32.unpack_from(
+            self._data, self._records_start + pos * _RECORD.size)[0]
+
+    def _parent_positions(self, pos):
+        generation, first, second = _RECORD.unpack_from(
+            self._data, self._records_start + pos * _RECORD.size)
+        if first == _NO_PARENT:
+            return []
+        if second == _NO_PARENT:
+            return [first]
+        if not second & _EXTRA_PARENTS:
+            return [first, second]
+        parents = [first]
+        offset = self._extra_start + (second & ~_EXTRA_PARENTS) * _UINT32.size
+        while True:
+            parent = _UINT32.unpack_from(self._data, offset)[0]
+            parents.append(parent & ~_EXTRA_PARENTS)
+            if parent & _EXTRA_PARENTS:
+                return parents
+            offset += _UINT32.size
+
+    def _parent_ids(self, pos):
+        parent_ids = tuple(self._revision_id(parent)
+                           for parent in self._parent_positions(pos))
+        return parent_ids or (_mod_revision.NULL_REVISION,)
+
+    def get_parent_map(self, keys):
+        """See graph.StackedParentsProvider.get_parent_map."""
+        result = {}
+        for revision_id in keys:
+            if revision_id == _mod_revision.NULL_REVISION:
+                result[revision_id] = ()
+                continue
+            pos = self._position(revision_id)
+            if pos is not None:
+                result[revision_id] = self._parent_ids(pos)
+        return result
+
+    def get_generations(self, keys):
+        """Get the generation numbers of keys.
+
+        :return: A dict mapping the keys present in the commit graph to their
+            generation number.
+        """
+        result = {}
+        for revision_id in keys:
+            if revision_id == _mod_revision.NULL_REVISION:
+                result[revision_id] = 0
+                continue
+            pos = self._position(revision_id)
+            if pos is not None:
+                result[revision_id] = self._generation(pos)
+        return result
+
+    def get_ancestry(self, revision_ids):
+        """Get the parent map for the whole ancestry of revision_ids.
+
+        :return: A dict mapping revision ids to tuples of parent ids, with
+            an empty tuple for root revisions, or None if any of revision_ids
+            is not in the commit graph.
+        """
+        pending = []
+        for revision_id in revision_ids:
+            pos = self._position(revision_id)
+            if pos is None:
+                return None
+            pending.append(pos)
+        seen = set(pending)
+        result = {}
+        while pending:
+            pos = pending.pop()
+            parents = self._parent_positions(pos)
+            result[self._revision_id(pos)] = tuple(
+                self._revision_id(parent) for parent in parents)
+            for parent in parents:
+                if parent not in seen:
+                    seen.add(parent)
+                    pending.append(parent)
+        return result
+
+
+class CommitGraphParentsProvider(object):
+    """A parents provider answering from a commit graph, if there is one.
+
+    All answers come from memory, so this also provides
+    get_cached_parent_map.
+    """
+
+    def __init__(self, get_commit_graph):
+        """Create a CommitGraphParentsProvider.
+
+        :param get_commit_graph: A callable returning the current CommitGraph
+            or None.
+        """
+        self._get_commit_graph = get_commit_graph
+
+    def __repr__(self):
+        return "%s(%r)" % (self.__class__.__name__, self._get_commit_graph)
+
+    def get_parent_map(self, keys):
+        """See graph.StackedParentsProvider.get_parent_map."""
+        commit_graph = self._get_commit_graph()
+        if commit_graph is None:
+            return {}
+        return commit_graph.get_parent_map(keys)
+
+    get_cached_parent_map = get_parent_map
+
+    def get_generations(self, keys):
+        """See CommitGraph.get_generations."""
+        commit_graph = self._get_commit_graph()
+        if commit_graph is None:
+            return {}
+        return commit_graph.get_generations(keys)
@@ -219,13 +219,17 @@ desired.
 """
 
 import bisect
+import concurrent.futures
 import contextlib
 import errno
+import mmap
 import operator
 import os
+import re
 from stat import S_IEXEC
 import stat
 import sys
+import threading
 import time
 import zlib
 
@@ -233,6 +237,7 @@ from . import (
     inventory,
     )
 from .. import (
+    bencode,
     cache_utf8,
     config,
     debug,
@@ -253,6 +258,18 @@ ERROR_PATH_NOT_FOUND = 3
 ERROR_DIRECTORY = 267
 
 
+def _record_re(entry_size):
+    """Return a regex matching a whole record and capturing its dirname.
+
+    Records are matched from the '\0' before their first field to their
+    final '\n' field, stepping over exactly entry_size fields. Fields can
+    themselves end in '\n', e.g. symlink targets, so records can not be
+    told apart by their line ends alone.
+    """
+    return re.compile(b'\x00([^\x00]*)(?:\x00[^\x00]*){%d}\x00\n'
+                      % (entry_size - 2,))
+
+
 class DirstateCorrupt(errors.BzrError):
 
     _fmt = "The dirstate file (%(state)s) appears to be corrupt: %(msg)s"
@@ -285,6 +302,26 @@ class SHA1Provider(object):
         """
         raise NotImplementedError(self.stat_and_sha1)
 
+    def threadsafe_stat_and_sha1(self):
+        """Return a function like stat_and_sha1 that other threads may call.
+
+        :return: A function taking the absolute path of a file, or None if
+            files must be hashed with stat_and_sha1 on the calling thread.
+        """
+        return None
+
+    def fingerprint(self):
+        """Return a fingerprint of how the sha1s of files are computed.
+
+        Cached sha1s are discarded when the fingerprint differs from the one
+        they were computed with, e.g. after the rules selecting content
+        filters changed.
+
+        :return: None if the sha1s are those of the file contents, otherwise
+            a bytestring.
+        """
+        return None
+
 
 class DefaultSHA1Provider(SHA1Provider):
     """A SHA1Provider that reads directly from the filesystem."""
@@ -300,6 +337,10 @@ class DefaultSHA1Provider(SHA1Provider):
             sha1 = osutils.sha_file(file_obj)
         return statvalue, sha1
 
+    def threadsafe_stat_and_sha1(self):
+        """See SHA1Provider.threadsafe_stat_and_sha1."""
+        return self.stat_and_sha1
+
 
 class DirState(object):
     """Record directory and metadata state for fast access.
@@ -342,11 +383,6 @@ class DirState(object):
     # of using int conversion rather than a dict here. AND BLAME ANDREW IF
     # it is faster.
 
-    # TODO: jam 20070221 Figure out what to do if we have a record that exceeds
-    #       the BISECT_PAGE_SIZE. For now, we just have to make it large enough
-    #       that we are sure a single record will always fit.
-    BISECT_PAGE_SIZE = 4096
-
     NOT_IN_MEMORY = 0
     IN_MEMORY_UNMODIFIED = 1
     IN_MEMORY_MODIFIED = 2
@@ -359,6 +395,12 @@ class DirState(object):
 
     HEADER_FORMAT_2 = b'#bazaar dirstate flat format 2\n'
     HEADER_FORMAT_3 = b'#bazaar dirstate flat format 3\n'
+    JOURNAL_HEADER = b'#bazaar dirstate journal 1\n'
+    SHA1_FINGERPRINT_HEADER = b'#bazaar dirstate sha1 fingerprint 1\n'
+    # Rewrite the whole file rather than journal once the journal would grow
+    # past a fraction of it.
+    JOURNAL_COMPACT_RATIO = 8
+    JOURNAL_MIN_COMPACT_SIZE = 64 * 1024
 
     def __init__(self, path, sha1_provider, worth_saving_limit=0,
                  use_filesystem_for_exec=True):
@@ -402,8 +444,13 @@ class DirState(object):
         self._end_of_header = None
         self._cutoff_time = None
         self._split_path_cache = {}
-        self._bisect_page_size = DirState.BISECT_PAGE_SIZE
+        # The file mapped into memory, and the byte ranges of the records of
+        # each directory in it, while bisecting.
+        self._state_map = None
+        self._dirblock_offsets = None
         self._sha1_provider = sha1_provider
+        # Set while iter_changes hashes files ahead on other threads.
+        self._sha1_prefetcher = None
         if 'hashcache' in debug.debug_flags:
             self._sha1_file = self._sha1_file_and_mutter
         else:
@@ -418,6 +465,8 @@ class DirState(object):
         self._known_hash_changes = set()
         # How many hash changed entries can we have without saving
         self._worth_saving_limit = worth_saving_limit
+        # The number of valid bytes in the journal, once it has been read.
+        self._journal_size = None
         self._config_stack = config.LocationStack(urlutils.local_path_to_url(
             path))
         self._use_filesystem_for_exec = use_filesystem_for_exec
@@ -597,7 +646,7 @@ class DirState(object):
             self._add_to_id_index(self._id_index, entry_key)
 
     def _bisect(self, paths):
-        """Bisect through the disk structure for specific rows.
+        """Find specific rows on disk, without reading all of them.
 
         :param paths: A list of paths to find
         :return: A dict mapping path => entries for found entries. Missing
@@ -605,202 +654,66 @@ class DirState(object):
                  The list is not sorted, and entries will be populated
                  based on when they were read.
         """
-        self._requires_lock()
-        # We need the file pointer to be right after the initial header block
-        self._read_header_if_needed()
-        # If _dirblock_state was in memory, we should just return info from
-        # there, this function is only meant to handle when we want to read
-        # part of the disk.
-        if self._dirblock_state != DirState.NOT_IN_MEMORY:
-            raise AssertionError("bad dirblock state %r" %
-                                 self._dirblock_state)
-
-        # The disk representation is generally info + '\0\n\0' at the end. But
-        # for bisecting, it is easier to treat this as '\0' + info + '\0\n'
-        # Because it means we can sync on the '\n'
-        state_file = self._state_file
-        file_size = os.fstat(state_file.fileno()).st_size
-        # We end up with 2 extra fields, we should have a trailing '\n' to
-        # ensure that we read the whole record, and we should have a precursur
-        # b'' which ensures that we start after the previous '\n'
-        entry_field_count = self._fields_per_entry() + 1
-
-        low = self._end_of_header
-        high = file_size - 1  # Ignore the final '\0'
-        # Map from (dir, name) => entry
+        paths_by_dir = {}
+        for path in paths:
+            dirname, basename = osutils.split(path)
+            paths_by_dir.setdefault(dirname, {})[basename] = path
         found = {}
-
-        # Avoid infinite seeking
-        max_count = 30 * len(paths)
-        count = 0
-        # pending is a list of places to look.
-        # each entry is a tuple of low, high, dir_names
-        #   low -> the first byte offset to read (inclusive)
-        #   high -> the last byte offset (inclusive)
-        #   dir_names -> The list of (dir, name) pairs that should be found in
-        #                the [low, high] range
-        pending = [(low, high, paths)]
-
-        page_size = self._bisect_page_size
-
-        fields_to_entry = self._get_fields_to_entry()
-
-        while pending:
-            low, high, cur_files = pending.pop()
-
-            if not cur_files or low >= high:
-                # Nothing to find
-                continue
-
-            count += 1
-            if count > max_count:
-                raise errors.BzrError('Too many seeks, most likely a bug.')
-
-            mid = max(low, (low + high - page_size) // 2)
-
-            state_file.seek(mid)
-            # limit the read size, so we don't end up reading data that we have
-            # already read.
-            read_size = min(page_size, (high - mid) + 1)
-            block = state_file.read(read_size)
-
-            start = mid
-            entries = block.split(b'\n')
-
-            if len(entries) < 2:
-                # We didn't find a '\n', so we cannot have found any records.
-                # So put this range back and try again. But we know we have to
-                # increase the page size, because a single read did not contain
-                # a record break (so records must be larger than page_size)
-                page_size *= 2
-                pending.append((low, high, cur_files))
-                continue
-
-            # Check the first and last entries, in case they are partial, or if
-            # we don't care about the rest of this page
-            first_entry_num = 0
-            first_fields = entries[0].split(b'\0')
-            if len(first_fields) < entry_field_count:
-                # We didn't get the complete first entry
-                # so move start, and grab the next, which
-                # should be a full entry
-                start += len(entries[0]) + 1
-                first_fields = entries[1].split(b'\0')
-                first_entry_num = 1
-
-            if len(first_fields) <= 2:
-                # We didn't even get a filename here... what do we do?
-                # Try a large page size and repeat this query
-                page_size *= 2
-                pending.append((low, high, cur_files))
-                continue
-            else:
-                # Find what entries we are looking for, which occur before and
-                # after this first record.
-                after = start
-                if first_fields[1]:
-                    first_path = first_fields[1] + b'/' + first_fields[2]
-                else:
-                    first_path = first_fields[2]
-                first_loc = _bisect_path_left(cur_files, first_path)
-
-                # These exist before the current location
-                pre = cur_files[:first_loc]
-                # These occur after the current location, which may be in the
-                # data we read, or might be after the last entry
-                post = cur_files[first_loc:]
-
-            if post and len(first_fields) >= entry_field_count:
-                # We have files after the first entry
-
-                # Parse the last entry
-                last_entry_num = len(entries) - 1
-                last_fields = entries[last_entry_num].split(b'\0')
-                if len(last_fields) < entry_field_count:
-                    # The very last hunk was not complete,
-                    # read the previous hunk
-                    after = mid + len(block) - len(entries[-1])
-                    last_entry_num -= 1
-                    last_fields = entries[last_entry_num].split(b'\0')
-                else:
-                    after = mid + len(block)
-
-                if last_fields[1]:
-                    last_path = last_fields[1] + b'/' + last_fields[2]
-                else:
-                    last_path = last_fields[2]
-                last_loc = _bisect_path_right(post, last_path)
-
-                middle_files = post[:last_loc]
-                post = post[last_loc:]
-
-                if middle_files:
-                    # We have files that should occur in this block
-                    # (>= first, <= last)
-                    # Either we will find them here, or we can mark them as
-                    # missing.
-
-                    if middle_files[0] == first_path:
-                        # We might need to go before this location
-                        pre.append(first_path)
-                    if middle_files[-1] == last_path:
-                        post.insert(0, last_path)
-
-                    # Find out what paths we have
-                    paths = {first_path: [first_fields]}
-                    # last_path might == first_path so we need to be
-                    # careful if we should append rather than overwrite
-                    if last_entry_num != first_entry_num:
-                        paths.setdefault(last_path, []).append(last_fields)
-                    for num in range(first_entry_num + 1, last_entry_num):
-                        # TODO: jam 20070223 We are already splitting here, so
-                        #       shouldn't we just split the whole thing rather
-                        #       than doing the split again in add_one_record?
-                        fields = entries[num].split(b'\0')
-                        if fields[1]:
-                            path = fields[1] + b'/' + fields[2]
-                        else:
-                            path = fields[2]
-                        paths.setdefault(path, []).append(fields)
-
-                    for path in middle_files:
-                        for fields in paths.get(path, []):
-                            # offset by 1 because of the opening '\0'
-                            # consider changing fields_to_entry to avoid the
-                            # extra list slice
-                            entry = fields_to_entry(fields[1:])
-                            found.setdefault(path, []).append(entry)
-
-            # Now we have split up everything into pre, middle, and post, and
-            # we have handled everything that fell in 'middle'.
-            # We add 'post' first, so that we prefer to seek towards the
-            # beginning, so that we will tend to go as early as we need, and
-            # then only seek forward after that.
-            if post:
-                pending.append((after, high, post))
-            if pre:
-                pending.append((low, start - 1, pre))
-
-        # Consider that we may want to return the directory entries in sorted
-        # order. For now, we just return them in whatever order we found them,
-        # and leave it up to the caller if they care if it is ordered or not.
+        for dirname, paths_by_name in paths_by_dir.items():
+            for entry in self._read_dirblock_from_disk(dirname):
+                path = paths_by_name.get(entry[0][1])
+                if path is not None:
+                    found.setdefault(path, []).append(entry)
         return found
 
     def _bisect_dirblocks(self, dir_list):
-        """Bisect through the disk structure to find entries in given dirs.
+        """Find the entries in given dirs on disk, without reading the others.
 
         _bisect_dirblocks is meant to find the contents of directories, which
         differs from _bisect, which only finds individual entries.
 
-        :param dir_list: A sorted list of directory names ['', 'dir', 'foo'].
+        :param dir_list: A list of directory names ['', 'dir', 'foo'].
         :return: A map from dir => entries_for_dir
         """
-        # TODO: jam 20070223 A lot of the bisecting logic could be shared
-        #       between this and _bisect. It would require parameterizing the
-        #       inner loop with a function, though. We should evaluate the
-        #       performance difference.
+        found = {}
+        for dirname in dir_list:
+            entries = self._read_dirblock_from_disk(dirname)
+            if entries:
+                found[dirname] = entries
+        return found
+
+    def _read_dirblock_from_disk(self, dirname):
+        """Parse the records of a single directory from the file on disk.
+
+        Unlike the blocks in _dirblocks, the root entry and the contents of
+        the root share the dirname b''.
+
+        :return: A list of entries, in the order they are in the file.
+        """
+        offsets = self._get_dirblock_offsets()
+        block_index = bisect_dirblock(offsets, dirname)
+        if block_index == len(offsets) or offsets[block_index][0] != dirname:
+            return []
+        _, start, end = offsets[block_index]
+        fields_to_entry = self._get_fields_to_entry()
+        entry_size = self._fields_per_entry()
+        # The records are '\0' + fields, the last of them '\n'.
+        fields = self._state_map[start:end].split(b'\0')
+        return [fields_to_entry(fields[pos:pos + entry_size])
+                for pos in range(1, len(fields), entry_size)]
+
+    def _get_dirblock_offsets(self):
+        """Get the byte ranges of the records of each directory on disk.
+
+        The file is mapped into memory and scanned once for the starts of
+        records, which are not parsed; the records of a directory are only
+        parsed when they are looked up. This keeps looking up a few paths
+        cheap, as long as the dirblocks have not been read.
+
+        :return: A list of (dirname, start, end) tuples, in the order of the
+            directories in the file.
+        """
         self._requires_lock()
-        # We need the file pointer to be right after the initial header block
         self._read_header_if_needed()
         # If _dirblock_state was in memory, we should just return info from
         # there, this function is only meant to handle when we want to read
@@ -808,163 +721,42 @@ class DirState(object):
         if self._dirblock_state != DirState.NOT_IN_MEMORY:
             raise AssertionError("bad dirblock state %r" %
                                  self._dirblock_state)
-        # The disk representation is generally info + '\0\n\0' at the end. But
-        # for bisecting, it is easier to treat this as '\0' + info + '\0\n'
-        # Because it means we can sync on the '\n'
-        state_file = self._state_file
-        file_size = os.fstat(state_file.fileno()).st_size
-        # We end up with 2 extra fields, we should have a trailing '\n' to
-        # ensure that we read the whole record, and we should have a precursur
-        # b'' which ensures that we start after the previous '\n'
-        entry_field_count = self._fields_per_entry() + 1
-
-        low = self._end_of_header
-        high = file_size - 1  # Ignore the final '\0'
-        # Map from dir => entry
-        found = {}
-
-        # Avoid infinite seeking
-        max_count = 30 * len(dir_list)
-        count = 0
-        # pending is a list of places to look.
-        # each entry is a tuple of low, high, dir_names
-        #   low -> the first byte offset to read (inclusive)
-        #   high -> the last byte offset (inclusive)
-        #   dirs -> The list of directories that should be found in
-        #                the [low, high] range
-        pending = [(low, high, dir_list)]
-
-        page_size = self._bisect_page_size
-
-        fields_to_entry = self._get_fields_to_entry()
-
-        while pending:
-            low, high, cur_dirs = pending.pop()
-
-            if not cur_dirs or low >= high:
-                # Nothing to find
-                continue
-
-            count += 1
-            if count > max_count:
-                raise errors.BzrError('Too many seeks, most likely a bug.')
-
-            mid = max(low, (low + high - page_size) // 2)
-
-            state_file.seek(mid)
-            # limit the read size, so we don't end up reading data that we have
-            # already read.
-            read_size = min(page_size, (high - mid) + 1)
-            block = state_file.read(read_size)
-
-            start = mid
-            entries = block.split(b'\n')
-
-            if len(entries) < 2:
-                # We didn't find a '\n', so we cannot have found any records.
-                # So put this range back and try again. But we know we have to
-                # increase the page size, because a single read did not contain
-                # a record break (so records must be larger than page_size)
-                page_size *= 2
-                pending.append((low, high, cur_dirs))
-                continue
-
-            # Check the first and last entries, in case they are partial, or if
-            # we don't care about the rest of this page
-            first_entry_num = 0
-            first_fields = entries[0].split(b'\0')
-            if len(first_fields) < entry_field_count:
-                # We didn't get the complete first entry
-                # so move start, and grab the next, which
-                # should be a full entry
-                start += len(entries[0]) + 1
-                first_fields = entries[1].split(b'\0')
-                first_entry_num = 1
-
-            if len(first_fields) <= 1:
-                # We didn't even get a dirname here... what do we do?
-                # Try a large page size and repeat this query
-                page_size *= 2
-                pending.append((low, high, cur_dirs))
-                continue
-            else:
-                # Find what entries we are looking for, which occur before and
-                # after this first record.
-                after = start
-                first_dir = first_fields[1]
-                first_loc = bisect.bisect_left(cur_dirs, first_dir)
-
-                # These exist before the current location
-                pre = cur_dirs[:first_loc]
-                # These occur after the current location, which may be in the
-                # data we read, or might be after the last entry
-                post = cur_dirs[first_loc:]
-
-            if post and len(first_fields) >= entry_field_count:
-                # We have records to look at after the first entry
-
-                # Parse the last entry
-                last_entry_num = len(entries) - 1
-                last_fields = entries[last_entry_num].split(b'\0')
-                if len(last_fields) < entry_field_count:
-                    # The very last hunk was not complete,
-                    # read the previous hunk
-                    after = mid + len(block) - len(entries[-1])
-                    last_entry_num -= 1
-                    last_fields = entries[last_entry_num].split(b'\0')
-                else:
-                    after = mid + len(block)
-
-                last_dir = last_fields[1]
-                last_loc = bisect.bisect_right(post, last_dir)
-
-                middle_files = post[:last_loc]
-                post = post[last_loc:]
-
-                if middle_files:
-                    # We have files that should occur in this block
-                    # (>= first, <= last)
-                    # Either we will find them here, or we can mark them as
-                    # missing.
-
-                    if middle_files[0] == first_dir:
-                        # We might need to go before this location
-                        pre.append(first_dir)
-                    if middle_files[-1] == last_dir:
-                        post.insert(0, last_dir)
-
-                    # Find out what paths we have
-                    paths = {first_dir: [first_fields]}
-                    # last_dir might == first_dir so we need to be
-                    # careful if we should append rather than overwrite
-                    if last_entry_num != first_entry_num:
-                        paths.setdefault(last_dir, []).append(last_fields)
-                    for num in range(first_entry_num + 1, last_entry_num):
-                        # TODO: jam 20070223 We are already splitting here, so
-                        #       shouldn't we just split the whole thing rather
-                        #       than doing the split again in add_one_record?
-                        fields = entries[num].split(b'\0')
-                        paths.setdefault(fields[1], []).append(fields)
-
-                    for cur_dir in middle_files:
-                        for fields in paths.get(cur_dir, []):
-                            # offset by 1 because of the opening '\0'
-                            # consider changing fields_to_entry to avoid the
-                            # extra list slice
-                            entry = fields_to_entry(fields[1:])
-                            found.setdefault(cur_dir, []).append(entry)
-
-            # Now we have split up everything into pre, middle, and post, and
-            # we have handled everything that fell in 'middle'.
-            # We add 'post' first, so that we prefer to seek towards the
-            # beginning, so that we will tend to go as early as we need, and
-            # then only seek forward after that.
-            if post:
-                pending.append((after, high, post))
-            if pre:
-                pending.append((low, start - 1, pre))
-
-        return found
+        if self._dirblock_offsets is not None:
+            return self._dirblock_offsets
+        try:
+            data = mmap.mmap(self._state_file.fileno(), 0,
+                             access=mmap.ACCESS_READ)
+        except (ValueError, EnvironmentError):
+            self._state_file.seek(0)
+            data = self._state_file.read()
+        self._state_map = data
+        offsets = []
+        dirname = start = None
+        # The first record starts at the '\0' ending the header.
+        pos = self._end_of_header
+        for match in _record_re(self._fields_per_entry()).finditer(data, pos):
+            if match.start() != pos:
+                raise DirstateCorrupt(self, 'bad record at %d' % (pos,))
+            if match.group(1) != dirname:
+                if dirname is not None:
+                    offsets.append((dirname, start, pos))
+                dirname = match.group(1)
+                start = pos
+            pos = match.end()
+        # Ignore the final '\0'
+        if pos != len(data) - 1:
+            raise DirstateCorrupt(self, 'bad record at %d' % (pos,))
+        if dirname is not None:
+            offsets.append((dirname, start, pos))
+        self._dirblock_offsets = offsets
+        return offsets
+
+    def _unmap_state_file(self):
+        """Drop the mapping of the file made while bisecting."""
+        if isinstance(self._state_map, mmap.mmap):
+            self._state_map.close()
+        self._state_map = None
+        self._dirblock_offsets = None
 
     def _bisect_recursive(self, paths):
         """Bisect for entries for all paths and their children.
@@ -2424,7 +2216,10 @@ class DirState(object):
         """
         self._read_header_if_needed()
         if self._dirblock_state == DirState.NOT_IN_MEMORY:
+            self._unmap_state_file()
             _read_dirblocks(self)
+            self._read_journal()
+            self._check_sha1_fingerprint()
 
     def _read_header(self):
         """This reads in the metadata header, and the parent ids.
@@ -2530,12 +2325,17 @@ class DirState(object):
                 # We couldn't grab a write lock, so we switch back to a read one
                 return
         try:
-            lines = self.get_lines()
-            self._state_file.seek(0)
-            self._state_file.writelines(lines)
-            self._state_file.truncate()
-            self._state_file.flush()
-            self._maybe_fdatasync()
+            # The file can not be truncated while mapped on some platforms.
+            self._unmap_state_file()
+            if not self._append_to_journal():
+                lines = self.get_lines()
+                self._state_file.seek(0)
+                self._state_file.writelines(lines)
+                self._state_file.truncate()
+                self._state_file.flush()
+                self._maybe_fdatasync()
+                self._remove_journal(lines)
+                self._write_sha1_fingerprint()
             self._mark_unmodified()
         finally:
             if grabbed_write_lock:
@@ -2545,6 +2345,202 @@ class DirState(object):
                 #       not changed contents. Since restore_read_lock may
                 #       not be an atomic operation.
 
+    def _journal_filename(self):
+        return self._filename + '-journal'
+
+    def _journal_header(self):
+        """Return the header of a journal that applies to the file on disk."""
+        return b'%scrc32: %d\nnum_entries: %d\n' % (
+            DirState.JOURNAL_HEADER, self.crc_expected, self._num_entries)
+
+    def _read_journal(self):
+        """Apply the hash cache updates saved in the journal.
+
+        Records are only applied when the journal was written against the
+        file that was just read, and stop at the first record that is not
+        complete. The journal only ever holds what update_entry learnt about
+        the working tree, so ignoring it is always safe.
+        """
+        self._journal_size = 0
+        if not self._config_stack.get('dirstate.journal'):
+            return
+        try:
+            with open(self._journal_filename(), 'rb') as f:
+                data = f.read()
+        except (IOError, OSError) as e:
+            if e.errno != errno.ENOENT:
+                raise
+            return
+        header = self._journal_header()
+        if not data.startswith(header):
+            return
+        pos = len(header)
+        records = []
+        while True:
+            end_of_line = data.find(b'\n', pos)
+            if end_of_line == -1:
+                break
+            try:
+                length, crc = [int(v) for v in data[pos:end_of_line].split()]
+            except ValueError:
+                break
+            start = end_of_line + 1
+            record = data[start:start + length]
+            if len(record) != length or zlib.crc32(record) != crc:
+                break
+            try:
+                (dirname, basename, file_id, minikind, fingerprint, size,
+                 executable, packed_stat) = bencode.bdecode(record)
+            except ValueError:
+                break
+            records.append(((dirname, basename, file_id),
+                            (minikind, fingerprint, size, bool(executable),
+                             packed_stat)))
+            pos = start + length
+        self._journal_size = pos
+        for key, details in records:
+            entry = self._find_entry(key)
+            # The kind may have changed since the journal was written, and
+            # only the cached values of an entry can be replaced.
+            if entry is not None and entry[1][0][0] == details[0]:
+                entry[1][0] = details
+
+    def _sha1_fingerprint_filename(self):
+        return self._filename + '-sha1-fingerprint'
+
+    def _sha1_fingerprint_bytes(self, fingerprint):
+        """Return the content of the sha1 fingerprint file.
+
+        It names the crc and entry count of the file on disk, so that a
+        dirstate written by a client hashing files differently does not
+        inherit the fingerprint.
+        """
+        return b'%scrc32: %d\nnum_entries: %d\n%s\n' % (
+            DirState.SHA1_FINGERPRINT_HEADER, self.crc_expected,
+            self._num_entries, fingerprint)
+
+    def _check_sha1_fingerprint(self):
+        """Discard the cached sha1s if files are now hashed differently.
+
+        With content filters the cached sha1s are those of the filtered
+        content, which depends on the rules in effect when they were
+        computed. Those are recorded in the sha1 fingerprint file; when they
+        do not match the sha1 provider, files are hashed again.
+        """
+        fingerprint = self._sha1_provider.fingerprint()
+        try:
+            with open(self._sha1_fingerprint_filename(), 'rb') as f:
+                data = f.read()
+        except (IOError, OSError) as e:
+            if e.errno != errno.ENOENT:
+                raise
+            data = None
+        if fingerprint is None:
+            if data is None:
+                return
+        elif data == self._sha1_fingerprint_bytes(fingerprint):
+            return
+        for entry in self._iter_entries():
+            details = entry[1][0]
+            if details[0] == b'f' and details[4] != DirState.NULLSTAT:
+                entry[1][0] = (b'f', b'', details[2], details[3],
+                               DirState.NULLSTAT)
+        self._packed_stat_index = None
+        # Save the whole file so that the fingerprint is updated.
+        self._mark_modified()
+
+    def _write_sha1_fingerprint(self):
+        """Record how the sha1s in the file just written were computed."""
+        fingerprint = self._sha1_provider.fingerprint()
+        filename = self._sha1_fingerprint_filename()
+        if fingerprint is None:
+            try:
+                os.unlink(filename)
+            except (IOError, OSError) as e:
+                if e.errno != errno.ENOENT:
+                    raise
+            return
+        with open(filename, 'wb') as f:
+            f.write(self._sha1_fingerprint_bytes(fingerprint))
+
+    def _find_entry(self, key):
+        """Return the entry with key, or None if it is not in memory."""
+        block_index, present = self._find_block_index_from_key(key)
+        if not present:
+            return None
+        block = self._dirblocks[block_index][1]
+        entry_index, present = self._find_entry_index(key, block)
+        if not present:
+            return None
+        return block[entry_index]
+
+    def _append_to_journal(self):
+        """Save pending hash cache updates by appending them to the journal.
+
+        Only hash cache updates are journalled. Readers that do not know
+        about the journal, or have it disabled, read the dirstate file
+        alone; for them a lost hash cache update only means hashing a file
+        again, but a lost change of parents or basis entries (as made by
+        update_basis_by_delta or set_parent_trees) would give them the wrong
+        basis tree. Such changes therefore always rewrite the whole file.
+
+        :return: False if the changes can not be journalled and the whole
+            file has to be written instead.
+        """
+        if (self._header_state == DirState.IN_MEMORY_MODIFIED
+                or self._dirblock_state != DirState.IN_MEMORY_HASH_MODIFIED
+                or not self._config_stack.get('dirstate.journal')):
+            return False
+        data = []
+        for key in sorted(self._known_hash_changes):
+            entry = self._find_entry(key)
+            if entry is None:
+                continue
+            minikind, fingerprint, size, executable, packed_stat = entry[1][0]
+            record = bencode.bencode(
+                list(key) + [minikind, fingerprint, size, int(executable),
+                             packed_stat])
+            data.append(b'%d %d\n' % (len(record), zlib.crc32(record)))
+            data.append(record)
+        data = b''.join(data)
+        size = self._journal_size or 0
+        base_size = os.fstat(self._state_file.fileno()).st_size
+        if size + len(data) > max(self.JOURNAL_MIN_COMPACT_SIZE,
+                                  base_size // self.JOURNAL_COMPACT_RATIO):
+            # Cheaper to read the whole file than the journal: compact.
+            return False
+        try:
+            f = open(self._journal_filename(), 'r+b')
+        except (IOError, OSError) as e:
+            if e.errno != errno.ENOENT:
+                raise
+            f = open(self._journal_filename(), 'w+b')
+        with f:
+            if size == 0:
+                header = self._journal_header()
+                data = header + data
+            else:
+                # Drop any record that was only partially written.
+                f.seek(size)
+            f.truncate()
+            f.write(data)
+            f.flush()
+            if self._config_stack.get('dirstate.fdatasync'):
+                osutils.fdatasync(f.fileno())
+        self._journal_size = size + len(data)
+        return True
+
+    def _remove_journal(self, lines):
+        """Remove the journal after lines were written as the whole file."""
+        self.crc_expected = int(lines[1][len(b'crc32: '):-1])
+        self._num_entries = int(lines[2][len(b'num_entries: '):-1])
+        self._journal_size = 0
+        try:
+            os.unlink(self._journal_filename())
+        except (IOError, OSError) as e:
+            if e.errno != errno.ENOENT:
+                raise
+
     def _maybe_fdatasync(self):
         """Flush to disk if possible and if not configured off."""
         if self._config_stack.get('dirstate.fdatasync'):
@@ -3378,6 +3374,8 @@ class DirState(object):
         self._end_of_header = None
         self._cutoff_time = None
         self._split_path_cache = {}
+        self._journal_size = None
+        self._unmap_state_file()
 
     def lock_read(self):
         """Acquire a read lock on the dirstate."""
@@ -3415,6 +3413,7 @@ class DirState(object):
         #       already in memory, we could read just the header and check for
         #       any modification. If not modified, we can just leave things
         #       alone
+        self._unmap_state_file()
         self._state_file = None
         self._lock_state = None
         self._lock_token.unlock()
@@ -3485,7 +3484,12 @@ def py_update_entry(state, entry, abspath, stat_value,
             # Besides, if content filtering happens, size and sha
             # are calculated at the same time, so checking just the size
             # gains nothing w.r.t. performance.
-            link_or_sha1 = state._sha1_file(abspath)
+            link_or_sha1 = None
+            if state._sha1_prefetcher is not None:
+                link_or_sha1 = state._sha1_prefetcher.sha1(
+                    entry[0], packed_stat)
+            if link_or_sha1 is None:
+                link_or_sha1 = state._sha1_file(abspath)
             entry[1][0] = (b'f', link_or_sha1, stat_value.st_size,
                            executable, packed_stat)
         else:
@@ -3523,6 +3527,163 @@ def py_update_entry(state, entry, abspath, stat_value,
     return link_or_sha1
 
 
+def _make_sha1_prefetcher(state, tree, source_index, search_paths):
+    """Make a _SHA1Prefetcher for iter_changes on state, if enabled.
+
+    Files are only hashed ahead when dirstate.sha1_threads is set and the
+    SHA1Provider of state can hash them on other threads.
+
+    :return: A _SHA1Prefetcher to be started and stopped by the caller, or
+        None.
+    """
+    threads = state._config_stack.get('dirstate.sha1_threads')
+    if not threads:
+        return None
+    stat_and_sha1 = state._sha1_provider.threadsafe_stat_and_sha1()
+    if stat_and_sha1 is None:
+        return None
+    return _SHA1Prefetcher(
+        state, tree, source_index, set(search_paths), threads, stat_and_sha1)
+
+
+class _SHA1Prefetcher(object):
+    """Hash the files of a dirstate ahead of iter_changes, on other threads.
+
+    A thread walks the dirblocks in the order iter_changes compares them,
+    and for each versioned file that may need hashing, has a pool of
+    threads stat it and, if the stat no longer matches the dirstate, hash
+    it. Only a bounded number of files are queued at once. The hashes are
+    then taken by update_entry and ProcessEntryPython when they reach the
+    entry, as long as the file was not modified in between; anything not
+    prefetched is hashed as usual.
+    """
+
+    # The number of files queued or being hashed per thread.
+    WINDOW_PER_THREAD = 16
+
+    def __init__(self, state, tree, source_index, search_paths, threads,
+                 stat_and_sha1):
+        self._state = state
+        self._stat_and_sha1 = stat_and_sha1
+        self._tree = tree
+        self._source_index = source_index
+        if b'' in search_paths:
+            self._search_paths = None
+        else:
+            self._search_paths = search_paths
+        self._executor = concurrent.futures.ThreadPoolExecutor(threads)
+        self._slots = threading.Semaphore(threads * self.WINDOW_PER_THREAD)
+        self._lock = threading.Lock()
+        # Maps entry keys to the futures of their hashes.
+        self._pending = {}
+        # The keys of entries that no longer need prefetching.
+        self._taken = set()
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run)
+        self._thread.daemon = True
+
+    def start(self):
+        self._state._sha1_prefetcher = self
+        self._thread.start()
+
+    def stop(self):
+        if self._state._sha1_prefetcher is self:
+            self._state._sha1_prefetcher = None
+        self._stopped = True
+        with self._lock:
+            for future in self._pending.values():
+                future.cancel()
+        self._executor.shutdown(wait=True)
+        self._thread.join()
+
+    def _wants_hash(self, details):
+        if details[0][0] != b'f':
+            return False
+        # See update_entry and ProcessEntryPython._process_entry for when a
+        # file is hashed.
+        return ((len(details) > 1 and details[1][0] != b'a')
+                or (self._source_index is not None
+                    and details[self._source_index][0] == b'f'))
+
+    def _run(self):
+        dirblocks = self._state._dirblocks
+        # The blocks may be added to while we run, in which case some are
+        # seen twice or skipped. Neither matters as we only prefetch.
+        block_index = 0
+        while block_index < len(dirblocks) and not self._stopped:
+            dirname, entries = dirblocks[block_index]
+            block_index += 1
+            for entry in entries:
+                if self._stopped:
+                    return
+                if not self._wants_hash(entry[1]):
+                    continue
+                path = osutils.pathjoin(*entry[0][:2])
+                if (self._search_paths is not None
+                        and not osutils.is_inside_any(
+                            self._search_paths, path)):
+                    continue
+                while not self._slots.acquire(timeout=0.1):
+                    if self._stopped:
+                        return
+                with self._lock:
+                    if entry[0] in self._taken or entry[0] in self._pending:
+                        self._slots.release()
+                        continue
+                    try:
+                        future = self._executor.submit(
+                            self._hash, path, entry[1][0])
+                    except RuntimeError:
+                        # Shut down.
+                        return
+                    self._pending[entry[0]] = future
+                future.add_done_callback(self._release_slot)
+
+    def _release_slot(self, future):
+        self._slots.release()
+
+    def _hash(self, path, details):
+        abspath = self._tree.abspath(path.decode('utf8'))
+        try:
+            stat_value = os.lstat(abspath)
+            if not stat.S_ISREG(stat_value.st_mode):
+                return None
+            packed_stat = pack_stat(stat_value)
+            if packed_stat == details[4] and stat_value.st_size == details[2]:
+                # The cached hash is still valid.
+                return None
+            statvalue, sha1 = self._stat_and_sha1(abspath)
+        except EnvironmentError:
+            # Let the caller report this when it hashes the file itself.
+            return None
+        return packed_stat, statvalue, sha1
+
+    def stat_and_sha1(self, key, packed_stat):
+        """Return the stat and sha1 of an entry's file, if prefetched.
+
+        :param key: The key of the entry.
+        :param packed_stat: The packed stat of the file to be hashed.
+        :return: A tuple of (stat value, sha1), or None if the file was not
+            hashed or was modified since.
+        """
+        with self._lock:
+            self._taken.add(key)
+            future = self._pending.pop(key, None)
+        if future is None:
+            return None
+        result = future.result()
+        if result is None or result[0] != packed_stat:
+            return None
+        return result[1:]
+
+    def sha1(self, key, packed_stat):
+        """Return the sha1 of an entry's file, if prefetched."""
+        result = self.stat_and_sha1(key, packed_stat)
+        if result is None:
+            return None
+        return result[1]
+
+
 class ProcessEntryPython(object):
 
     __slots__ = ["old_dirname_to_file_id", "new_dirname_to_file_id",
@@ -3667,9 +3828,17 @@ class ProcessEntryPython(object):
                         # map to the same content
                         if link_or_sha1 is None:
                             # Stat cache miss:
-                            statvalue, link_or_sha1 = \
-                                self.state._sha1_provider.stat_and_sha1(
-                                    path_info[4])
+                            prefetched = None
+                            if self.state._sha1_prefetcher is not None:
+                                prefetched = (
+                                    self.state._sha1_prefetcher.stat_and_sha1(
+                                        entry[0], pack_stat(path_info[3])))
+                            if prefetched is not None:
+                                statvalue, link_or_sha1 = prefetched
+                            else:
+                                statvalue, link_or_sha1 = \
+                                    self.state._sha1_provider.stat_and_sha1(
+                                        path_info[4])
                             self.state._observed_sha1(entry, link_or_sha1,
                                                       statvalue)
                         content_change = (link_or_sha1 != source_details[1])
@@ -3773,11 +3942,17 @@ class ProcessEntryPython(object):
             # looks like a new file
             path = pathjoin(entry[0][0], entry[0][1])
             # parent id is the entry for the path in the target tree
-            # TODO: these are the same for an entire directory: cache em.
-            parent_id = self.state._get_entry(self.target_index,
-                                              path_utf8=entry[0][0])[0][2]
-            if parent_id == entry[0][2]:
-                parent_id = None
+            if entry[0][1] and entry[0][0] == self.last_target_parent[0]:
+                # use a cached hit for non-root target entries.
+                parent_id = self.last_target_parent[1]
+            else:
+                parent_id = self.state._get_entry(
+                    self.target_index, path_utf8=entry[0][0])[0][2]
+                if parent_id == entry[0][2]:
+                    parent_id = None
+                else:
+                    self.last_target_parent[0] = entry[0][0]
+                    self.last_target_parent[1] = parent_id
             if path_info is not None:
                 # Present on disk:
                 if self.use_filesystem_for_exec:
@@ -3871,6 +4046,23 @@ class ProcessEntryPython(object):
 
     def iter_changes(self):
         """Iterate over the changes."""
+        prefetcher = _make_sha1_prefetcher(
+            self.state, self.tree, self.source_index,
+            self.search_specific_files)
+        if prefetcher is None:
+            return self._iter_changes()
+        return self._iter_changes_with_prefetcher(prefetcher)
+
+    def _iter_changes_with_prefetcher(self, prefetcher):
+        prefetcher.start()
+        try:
+            for result in self._iter_changes():
+                yield result
+        finally:
+            prefetcher.stop()
+
+    def _iter_changes(self):
+        walkdirs_threads = self.state._config_stack.get('walkdirs.threads')
         utf8_decode = cache_utf8._utf8_decode
         _lt_by_dirs = lt_by_dirs
         _process_entry = self._process_entry
@@ -3981,7 +4173,8 @@ class ProcessEntryPython(object):
                 current_dir_info = None
             else:
                 dir_iterator = osutils._walkdirs_utf8(
-                    root_abspath, prefix=current_root)
+                    root_abspath, prefix=current_root,
+                    threads=walkdirs_threads)
                 try:
                     current_dir_info = next(dir_iterator)
                 except OSError as e:
@@ -16,6 +16,7 @@
 
 """Core compression logic for compressing streams of related files."""
 
+from collections import deque
 import time
 import zlib
 
@@ -1121,6 +1122,73 @@ def cleanup_pack_group(versioned_files):
     versioned_files.stream.close()
 
 
+class _GroupCompressionPool(object):
+    """Compress finished groups on worker threads.
+
+    Building a group is inherently serial (where one group ends depends on
+    how well the texts in it compressed), but the final zlib pass over a
+    finished group only depends on that group. zlib releases the GIL while
+    deflating, so those passes can run concurrently with building the next
+    group.
+
+    Groups are written out strictly in the order they were submitted, so the
+    resulting pack is byte-for-byte identical to the serial output.
+
+    :ivar pending_bytes: The number of uncompressed bytes held by groups that
+        have been submitted but not yet written.
+    """
+
+    def __init__(self, write_block, num_threads, max_pending_bytes):
+        """Create a _GroupCompressionPool.
+
+        :param write_block: A callable taking (bytes_len, chunks, nodes) for
+            each finished group, called in submission order.
+        :param num_threads: The number of worker threads to use.
+        :param max_pending_bytes: Once the groups waiting to be written hold
+            more than this many uncompressed bytes, submit() waits for the
+            oldest ones to be written before returning.
+        """
+        import concurrent.futures
+        self._write_block = write_block
+        self._executor = concurrent.futures.ThreadPoolExecutor(num_threads)
+        self._max_pending_groups = 2 * num_threads
+        self._max_pending_bytes = max_pending_bytes
+        self._pending = deque()
+        self.pending_bytes = 0
+
+    def submit(self, block, nodes):
+        """Queue a finished block for compression and writing.
+
+        :param block: A GroupCompressBlock that will not be modified further.
+        :param nodes: The index entries for the texts in block, as
+            (key, 'start end', refs) tuples.
+        """
+        future = self._executor.submit(block.to_chunks)
+        self._pending.append((future, block._content_length, nodes))
+        self.pending_bytes += block._content_length
+        while self._pending and (
+                self.pending_bytes > self._max_pending_bytes
+                or len(self._pending) > self._max_pending_groups):
+            self._write_oldest()
+
+    def _write_oldest(self):
+        future, content_length, nodes = self._pending.popleft()
+        self.pending_bytes -= content_length
+        bytes_len, chunks = future.result()
+        self._write_block(bytes_len, chunks, nodes)
+
+    def flush(self):
+        """Write out all pending groups."""
+        while self._pending:
+            self._write_oldest()
+
+    def close(self):
+        """Stop the worker threads, discarding any unwritten groups."""
+        self._pending.clear()
+        self.pending_bytes = 0
+        self._executor.shutdown(wait=True)
+
+
 class _BatchingBlockFetcher(object):
     """Fetch group compress blocks in batches.
 
@@ -1245,6 +1313,11 @@ class GroupCompressVersionedFiles(VersionedFilesWithFallbacks):
     _DEFAULT_MAX_BYTES_TO_INDEX = 1024 * 1024
     _DEFAULT_COMPRESSOR_SETTINGS = {'max_bytes_to_index':
                                     _DEFAULT_MAX_BYTES_TO_INDEX}
+    # When inserting large streams, finished groups can be zlib compressed on
+    # this many worker threads. 0 or 1 keeps everything in the calling thread.
+    _DEFAULT_COMPRESSION_THREADS = 0
+    # Upper bound on the uncompressed size of groups waiting for a worker.
+    _DEFAULT_MAX_PENDING_BYTES = 64 * 1024 * 1024
 
     def __init__(self, index, access, delta=True, _unadded_refs=None,
                  _group_cache=None):
@@ -1267,6 +1340,8 @@ class GroupCompressVersionedFiles(VersionedFilesWithFallbacks):
         self._group_cache = _group_cache
         self._immediate_fallback_vfs = []
         self._max_bytes_to_index = None
+        self._compression_threads = None
+        self._max_pending_bytes = None
 
     def without_fallbacks(self):
         """Return a clone of this object without any fallbacks configured."""
@@ -1371,8 +1446,8 @@ class GroupCompressVersionedFiles(VersionedFilesWithFallbacks):
         ann = annotate.Annotator(self)
         return ann.annotate_flat(key)
 
-    def get_annotator(self):
-        return annotate.Annotator(self)
+    def get_annotator(self, cache=None):
+        return annotate.Annotator(self, cache=cache)
 
     def check(self, progress_bar=None, keys=None):
         """See VersionedFiles.check()."""
@@ -1696,7 +1771,8 @@ class GroupCompressVersionedFiles(VersionedFilesWithFallbacks):
         # test_insert_record_stream_existing_keys fail for groupcompress and
         # groupcompress-nograph, this needs to be revisited while addressing
         # 'bzr branch' performance issues.
-        for _, _ in self._insert_record_stream(stream, random_id=False):
+        for _, _ in self._insert_record_stream(stream, random_id=False,
+                                               parallel=True):
             pass
 
     def _get_compressor_settings(self):
@@ -1720,11 +1796,40 @@ class GroupCompressVersionedFiles(VersionedFilesWithFallbacks):
             self._max_bytes_to_index = val
         return {'max_bytes_to_index': self._max_bytes_to_index}
 
+    def _get_parallel_compression_settings(self):
+        """Return (compression_threads, max_pending_bytes) from the config."""
+        if self._compression_threads is None:
+            c = config.GlobalConfig()
+            val = c.get_user_option('bzr.groupcompress.compression_threads')
+            if val is not None:
+                try:
+                    val = int(val)
+                except ValueError as e:
+                    trace.warning('Value for '
+                                  '"bzr.groupcompress.compression_threads"'
+                                  ' %r is not an integer'
+                                  % (val,))
+                    val = None
+            if val is None:
+                val = self._DEFAULT_COMPRESSION_THREADS
+            self._compression_threads = val
+            val = c.get_user_option('bzr.groupcompress.max_pending_bytes')
+            if val is not None:
+                val = config.int_SI_from_store(val)
+                if val is None:
+                    trace.warning('Value for '
+                                  '"bzr.groupcompress.max_pending_bytes"'
+                                  ' is not a valid size')
+            if val is None:
+                val = self._DEFAULT_MAX_PENDING_BYTES
+            self._max_pending_bytes = val
+        return self._compression_threads, self._max_pending_bytes
+
     def _make_group_compressor(self):
         return GroupCompressor(self._get_compressor_settings())
 
     def _insert_record_stream(self, stream, random_id=False, nostore_sha=None,
-                              reuse_blocks=True):
+                              reuse_blocks=True, parallel=False):
         """Internal core to insert a record stream into this container.
 
         This helper function has a different interface than insert_record_stream
@@ -1736,10 +1841,49 @@ class GroupCompressVersionedFiles(VersionedFilesWithFallbacks):
         :param reuse_blocks: If the source is streaming from
             groupcompress-blocks, just insert the blocks as-is, rather than
             expanding the texts and inserting again.
+        :param parallel: If True and bzr.groupcompress.compression_threads is
+            set, finished groups are compressed on worker threads. Records are
+            then only guaranteed to be readable once the returned iterator has
+            been exhausted, so only bulk inserts should set this.
         :return: An iterator over (sha1, length) of the inserted records.
         :seealso insert_record_stream:
         :seealso add_lines:
         """
+        pool = None
+        if parallel:
+            num_threads, max_pending_bytes = (
+                self._get_parallel_compression_settings())
+            if num_threads > 1:
+                def write_block(bytes_len, chunks, block_keys):
+                    self._write_block(bytes_len, chunks, block_keys, random_id)
+                pool = _GroupCompressionPool(write_block, num_threads,
+                                             max_pending_bytes)
+        try:
+            for result in self._insert_records(stream, random_id, nostore_sha,
+                                               reuse_blocks, pool):
+                yield result
+            if pool is not None:
+                pool.flush()
+        finally:
+            if pool is not None:
+                pool.close()
+
+    def _write_block(self, bytes_len, chunks, block_keys, random_id):
+        """Write a finished group and add index entries for its texts."""
+        index, start, length = self._access.add_raw_record(
+            None, bytes_len, chunks)
+        nodes = []
+        for key, reads, refs in block_keys:
+            nodes.append((key, b"%d %d %s" % (start, length, reads), refs))
+        self._index.add_records(nodes, random_id=random_id)
+
+    def _insert_records(self, stream, random_id, nostore_sha, reuse_blocks,
+                        pool):
+        """Insert the records of stream, see _insert_record_stream.
+
+        :param pool: A _GroupCompressionPool to compress finished groups
+            with, or None to compress them in this thread.
+        """
         adapters = {}
 
         def get_adapter(adapter_key):
@@ -1757,21 +1901,21 @@ class GroupCompressVersionedFiles(VersionedFilesWithFallbacks):
         keys_to_add = []
 
         def flush():
-            bytes_len, chunks = self._compressor.flush().to_chunks()
+            block = self._compressor.flush()
             self._compressor = self._make_group_compressor()
-            # Note: At this point we still have 1 copy of the fulltext (in
-            #       record and the var 'bytes'), and this generates 2 copies of
-            #       the compressed text (one for bytes, one in chunks)
-            # TODO: Figure out how to indicate that we would be happy to free
-            #       the fulltext content at this point. Note that sometimes we
-            #       will want it later (streaming CHK pages), but most of the
-            #       time we won't (everything else)
-            index, start, length = self._access.add_raw_record(
-                None, bytes_len, chunks)
-            nodes = []
-            for key, reads, refs in keys_to_add:
-                nodes.append((key, b"%d %d %s" % (start, length, reads), refs))
-            self._index.add_records(nodes, random_id=random_id)
+            if pool is not None:
+                pool.submit(block, list(keys_to_add))
+            else:
+                # Note: At this point we still have 1 copy of the fulltext (in
+                #       record and the var 'bytes'), and this generates 2
+                #       copies of the compressed text (one for bytes, one in
+                #       chunks)
+                # TODO: Figure out how to indicate that we would be happy to
+                #       free the fulltext content at this point. Note that
+                #       sometimes we will want it later (streaming CHK pages),
+                #       but most of the time we won't (everything else)
+                bytes_len, chunks = block.to_chunks()
+                self._write_block(bytes_len, chunks, keys_to_add, random_id)
             self._unadded_refs = {}
             del keys_to_add[:]
 
@@ -1810,6 +1954,9 @@ class GroupCompressVersionedFiles(VersionedFilesWithFallbacks):
                 # We still want to reuse this block
                 if record.storage_kind == 'groupcompress-block':
                     # Insert the raw block into the target repo
+                    if pool is not None:
+                        # Keep the pack in stream order.
+                        pool.flush()
                     insert_manager = record._manager
                     bytes_len, chunks = record._manager._block.to_chunks()
                     _, start, length = self._access.add_raw_record(
@@ -1944,6 +2091,24 @@ class GroupCompressVersionedFiles(VersionedFilesWithFallbacks):
             result.update(source.keys())
         return result
 
+    def keys_with_prefixes(self, prefixes):
+        """Get the keys that start with one of prefixes.
+
+        As the index is sorted by key, this only reads the parts of it that
+        hold matching keys, e.g. the texts of a single file.
+
+        :param prefixes: An iterable of key prefixes, in the form accepted by
+            GraphIndex.iter_entries_prefix: e.g. (file_id, None) for all the
+            texts of a file.
+        :return: A set of keys.
+        """
+        prefixes = list(prefixes)
+        sources = [self._index] + self._immediate_fallback_vfs
+        result = set()
+        for source in sources:
+            result.update(source.keys_with_prefixes(prefixes))
+        return result
+
 
 class _GCBuildDetails(object):
     """A blob of data about the build details.
@@ -2203,6 +2368,15 @@ class _GCGraphIndex(object):
         self._check_read()
         return [node[1] for node in self._graph_index.iter_all_entries()]
 
+    def keys_with_prefixes(self, prefixes):
+        """Get the keys that start with one of prefixes.
+
+        The keys are not ordered.
+        """
+        self._check_read()
+        return [node[1] for node in
+                self._graph_index.iter_entries_prefix(prefixes)]
+
     def _node_to_position(self, node):
         """Convert an index value to position details."""
         bits = node[2].split(b' ')
@@ -38,6 +38,8 @@ from ..bzr import (
 from ..bzr.btree_index import (
     BTreeGraphIndex,
     BTreeBuilder,
+    BTreeRawLeafBuilder,
+    BTreeRawLeafGraphIndex,
     )
 from ..bzr.groupcompress import (
     _GCGraphIndex,
@@ -60,6 +62,11 @@ from ..bzr.vf_repository import (
 from ..static_tuple import StaticTuple
 
 
+# How many text keys referenced by new inventories are checked at once when
+# committing a write group.
+_TEXT_KEYS_CHECK_BATCH = 10000
+
+
 class GCPack(NewPack):
 
     def __init__(self, pack_collection, upload_suffix='', file_mode=None):
@@ -162,6 +169,8 @@ class GCPack(NewPack):
         self._state = 'open'
         # no name until we finish writing the content
         self.name = None
+        # The bloom.BloomFilter over the keys of each index, once written
+        self.key_filters = None
 
     def _check_references(self):
         """Make sure our external references are present.
@@ -407,7 +416,8 @@ class GCCHKPacker(Packer):
         with ui.ui_factory.nested_progress_bar() as child_pb:
             stream = vf_to_stream(source_vf, keys, message, child_pb)
             for _, _ in target_vf._insert_record_stream(
-                    stream, random_id=True, reuse_blocks=False):
+                    stream, random_id=True, reuse_blocks=False,
+                    parallel=True):
                 pass
 
     def _copy_revision_texts(self):
@@ -461,7 +471,8 @@ class GCCHKPacker(Packer):
             for stream in self._get_chk_streams(source_vf, total_keys,
                                                 pb=child_pb):
                 for _, _ in target_vf._insert_record_stream(
-                        stream, random_id=True, reuse_blocks=False):
+                        stream, random_id=True, reuse_blocks=False,
+                        parallel=True):
                     pass
 
     def _copy_text_texts(self):
@@ -774,11 +785,21 @@ class GCRepositoryPackCollection(RepositoryPackCollection):
         chk_diff = chk_map.iter_interesting_nodes(
             chk_bytes_no_fallbacks, root_key_info.interesting_root_keys,
             root_key_info.uninteresting_root_keys)
+        # The text keys are checked a batch at a time, so that committing a
+        # huge tree does not need a set of all of its text keys.
         text_keys = set()
+        missing_text_keys = set()
+
+        def check_text_keys():
+            present_text_keys = no_fallback_texts_index.get_parent_map(
+                text_keys)
+            missing_text_keys.update(text_keys.difference(present_text_keys))
+            text_keys.clear()
         try:
             for record in _filter_text_keys(chk_diff, text_keys,
                                             chk_map._bytes_to_text_key):
-                pass
+                if len(text_keys) >= _TEXT_KEYS_CHECK_BATCH:
+                    check_text_keys()
         except errors.NoSuchRevision as e:
             # XXX: It would be nice if we could give a more precise error here.
             problems.append("missing chk node(s) for id_to_entry maps")
@@ -791,8 +812,7 @@ class GCRepositoryPackCollection(RepositoryPackCollection):
         except errors.NoSuchRevision as e:
             problems.append(
                 "missing chk node(s) for parent_id_basename_to_file_id maps")
-        present_text_keys = no_fallback_texts_index.get_parent_map(text_keys)
-        missing_text_keys = text_keys.difference(present_text_keys)
+        check_text_keys()
         if missing_text_keys:
             problems.append("missing text keys: %r"
                             % (sorted(missing_text_keys),))
@@ -995,6 +1015,34 @@ class CHKInventoryRepository(PackRepository):
                 yield (inventory.CHKInventory.deserialise(
                     self.chk_bytes, lines, key), key[-1])
 
+    # How many revisions to read the differing inventory pages of at once
+    # when computing revision deltas.
+    _delta_read_ahead = 100
+
+    def _iter_revision_delta_trees(self, revisions):
+        """See Repository._iter_revision_delta_trees.
+
+        Before the trees of a run of revisions are compared, the pages of
+        their inventories that differ are read into the CHK page cache in a
+        few requests, rather than one request per page during comparison.
+        """
+        tree_pairs = list(
+            super(CHKInventoryRepository, self)._iter_revision_delta_trees(
+                revisions))
+        for start in range(0, len(tree_pairs), self._delta_read_ahead):
+            batch = tree_pairs[start:start + self._delta_read_ahead]
+            root_key_pairs = []
+            for old_tree, new_tree in batch:
+                old_map = getattr(old_tree.root_inventory, 'id_to_entry', None)
+                new_map = getattr(new_tree.root_inventory, 'id_to_entry', None)
+                if old_map is not None and new_map is not None:
+                    root_key_pairs.append((new_map.key(), old_map.key()))
+            chk_map.read_ahead_changes(
+                self.chk_bytes, root_key_pairs,
+                max_bytes=chk_map._PAGE_CACHE_SIZE // 2)
+            for tree_pair in batch:
+                yield tree_pair
+
     def _get_inventory_xml(self, revision_id):
         """Get serialized inventory as a string."""
         # Without a native 'xml' inventory, this method doesn't make sense.
@@ -1429,3 +1477,36 @@ class RepositoryFormat2aSubtree(RepositoryFormat2a):
 
     experimental = True
     supports_tree_reference = True
+
+
+class RepositoryFormat2aRawIndex(RepositoryFormat2a):
+    """A 2a repository format with uncompressed index leaves.
+
+    Lookups in the indices do not have to decompress index pages, at the cost
+    of indices being several times larger. Indices written by 2a can still
+    be read, so packs with either kind of index can be combined.
+    """
+
+    index_builder_class = BTreeRawLeafBuilder
+    index_class = BTreeRawLeafGraphIndex
+
+    def _get_matching_bzrdir(self):
+        return controldir.format_registry.make_controldir(
+            'development-raw-index')
+
+    def _ignore_setting_bzrdir(self, format):
+        pass
+
+    _matchingcontroldir = property(
+        _get_matching_bzrdir, _ignore_setting_bzrdir)
+
+    @classmethod
+    def get_format_string(cls):
+        return b'Bazaar development format 9 (2a with raw index leaves)\n'
+
+    def get_format_description(self):
+        """See RepositoryFormat.get_format_description()."""
+        return ("Development repository format 9 - 2a with uncompressed "
+                "index leaves")
+
+    experimental = True
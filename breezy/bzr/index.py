@@ -30,11 +30,15 @@ import re
 
 from ..lazy_import import lazy_import
 lazy_import(globals(), """
+import breezy
 from breezy import (
     bisect_multi,
     revision as _mod_revision,
     trace,
     )
+from breezy.bzr import (
+    bloom,
+    )
 """)
 from .. import (
     debug,
@@ -1279,6 +1283,28 @@ class GraphIndex(object):
             pass
 
 
+class _KeyFilterCounter(object):
+    """Counts the index probes avoided by key filters, for -Dindex.
+
+    The totals are reported via trace.mutter when breezy.global_state exits.
+    """
+
+    def __init__(self):
+        self.probes = 0
+        self.avoided = 0
+        state = breezy.get_global_state()
+        if state is not None:
+            state.exit_stack.callback(self.report)
+
+    def report(self):
+        if self.probes:
+            trace.mutter('CombinedGraphIndex key filters avoided %d of %d '
+                         'index probes', self.avoided, self.probes)
+
+
+_key_filter_counter = None
+
+
 class CombinedGraphIndex(object):
     """A GraphIndex made up from smaller GraphIndices.
 
@@ -1295,6 +1321,10 @@ class CombinedGraphIndex(object):
     queries.  So the indices will be reordered after every query to put the
     indices that had the result(s) of that query first (while otherwise
     preserving the relative ordering).
+
+    Indices can be given a key filter, such as a bloom.BloomFilter, that
+    rules out keys which are definitely not present. Those indices are then
+    only queried for the keys that pass the filter.
     """
 
     def __init__(self, indices, reload_func=None):
@@ -1314,6 +1344,8 @@ class CombinedGraphIndex(object):
         # so _index_names[0] is always the name for _indices[0], etc.  Sibling
         # indices must all use the same set of names as each other.
         self._index_names = [None] * len(self._indices)
+        # Map from index to a callable returning its key filter, or None
+        self._key_filters = {}
 
     def __repr__(self):
         return "%s(%s)" % (
@@ -1342,7 +1374,7 @@ class CombinedGraphIndex(object):
 
     __contains__ = _has_key_from_parent_map
 
-    def insert_index(self, pos, index, name=None):
+    def insert_index(self, pos, index, name=None, get_key_filter=None):
         """Insert a new index in the list of indices to query.
 
         :param pos: The position to insert the index.
@@ -1350,9 +1382,21 @@ class CombinedGraphIndex(object):
         :param name: a name for this index, e.g. a pack name.  These names can
             be used to reflect index reorderings to related CombinedGraphIndex
             instances that use the same names.  (see set_sibling_indices)
+        :param get_key_filter: An optional callable returning a
+            bloom.BloomFilter for the keys of index, or None if there is none.
+            It is called when the index is first searched.
         """
         self._indices.insert(pos, index)
         self._index_names.insert(pos, name)
+        if get_key_filter is not None:
+            self._key_filters[index] = get_key_filter
+
+    def remove_index(self, index):
+        """Remove index from the list of indices to query."""
+        pos = self._indices.index(index)
+        del self._indices[pos]
+        del self._index_names[pos]
+        self._key_filters.pop(index, None)
 
     def iter_all_entries(self):
         """Iterate over all keys within the index
@@ -1390,13 +1434,25 @@ class CombinedGraphIndex(object):
         """
         keys = set(keys)
         hit_indices = []
+        key_hashes = None
         while True:
             try:
                 for index in self._indices:
                     if not keys:
                         break
+                    search_keys = keys
+                    get_key_filter = self._key_filters.get(index)
+                    if get_key_filter is not None:
+                        key_filter = get_key_filter()
+                        if key_filter is not None:
+                            if key_hashes is None:
+                                key_hashes = {}
+                            search_keys = self._filter_keys(
+                                key_filter, keys, key_hashes)
+                            if not search_keys:
+                                continue
                     index_hit = False
-                    for node in index.iter_entries(keys):
+                    for node in index.iter_entries(search_keys):
                         keys.remove(node[1])
                         yield node
                         index_hit = True
@@ -1408,6 +1464,31 @@ class CombinedGraphIndex(object):
                     raise
         self._move_to_front(hit_indices)
 
+    def _filter_keys(self, key_filter, keys, key_hashes):
+        """Return the keys that may be present according to key_filter.
+
+        :param key_hashes: A dict caching the bloom.key_hashes of keys, shared
+            between the filters of all indices.
+        """
+        result = []
+        for key in keys:
+            try:
+                hashes = key_hashes[key]
+            except KeyError:
+                hashes = key_hashes[key] = bloom.key_hashes(key)
+            if hashes is None:
+                # Let the index decide what to do with malformed keys
+                result.append(key)
+            elif key_filter.may_contain_hashes(hashes):
+                result.append(key)
+        if 'index' in debug.debug_flags:
+            global _key_filter_counter
+            if _key_filter_counter is None:
+                _key_filter_counter = _KeyFilterCounter()
+            _key_filter_counter.probes += len(keys)
+            _key_filter_counter.avoided += len(keys) - len(result)
+        return result
+
     def iter_entries_prefix(self, keys):
         """Iterate over keys within the index using prefix matching.
 
@@ -54,6 +54,7 @@ from breezy import (
     transport as _mod_transport,
     )
 from breezy.bzr import (
+    annotation_cache,
     inventory as _mod_inventory,
     )
 """)
@@ -1041,7 +1042,8 @@ class InventoryRevisionTree(RevisionTree, InventoryTree):
         """See Tree.annotate_iter"""
         file_id = self.path2id(path)
         text_key = (file_id, self.get_file_revision(path))
-        annotator = self._repository.texts.get_annotator()
+        annotator = self._repository.texts.get_annotator(
+            cache=annotation_cache.get_annotation_cache())
         annotations = annotator.annotate_flat(text_key)
         return [(key[-1], line) for key, line in annotations]
 
@@ -1155,7 +1155,8 @@ class KnitVersionedFiles(VersionedFilesWithFallbacks):
         """See VersionedFiles.annotate."""
         return self._factory.annotate(self, key)
 
-    def get_annotator(self):
+    def get_annotator(self, cache=None):
+        # Annotated knits already store annotations, so no cache is used.
         return _KnitAnnotator(self)
 
     def check(self, progress_bar=None, keys=None):
@@ -3358,6 +3359,9 @@ class _KnitAnnotator(annotate.Annotator):
 
     def __init__(self, vf):
         annotate.Annotator.__init__(self, vf)
+        # Most matching blocks are taken from the knit deltas, so there is
+        # little to diff ahead of the annotation.
+        self._diff_processes = 0
 
         # TODO: handle Nodes which cannot be extracted
         # self._ghosts = set()
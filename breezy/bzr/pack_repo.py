@@ -14,6 +14,7 @@
 # along with this program; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA
 
+import errno
 import re
 import sys
 
@@ -27,11 +28,15 @@ from breezy import (
     debug,
     graph,
     osutils,
+    static_tuple,
     transactions,
     ui,
     )
 from breezy.bzr import (
+    bloom,
+    commit_graph as _mod_commit_graph,
     pack,
+    revision_bitmap,
     )
 from breezy.bzr.index import (
     CombinedGraphIndex,
@@ -416,6 +421,8 @@ class NewPack(Pack):
         self._state = 'open'
         # no name until we finish writing the content
         self.name = None
+        # The bloom.BloomFilter over the keys of each index, once written
+        self.key_filters = None
 
     def abort(self):
         """Cancel creating this pack."""
@@ -470,6 +477,8 @@ class NewPack(Pack):
         # visible is smaller.  On the other hand none will be seen until
         # they're in the names list.
         self.index_sizes = [None, None, None, None]
+        if not suspend and self._pack_collection._use_key_filters():
+            self.key_filters = {}
         self._write_index('revision', self.revision_index, 'revision',
                           suspend)
         self._write_index('inventory', self.inventory_index, 'inventory',
@@ -499,6 +508,13 @@ class NewPack(Pack):
             new_name = '../packs/' + new_name
         self.upload_transport.move(self.random_name, new_name)
         self._state = 'finished'
+        if self.key_filters is not None:
+            # Written last so that no filters are left behind if finishing
+            # the pack fails
+            self.index_transport.put_bytes(
+                self.name + self._pack_collection._key_filters_suffix,
+                bloom.filters_to_bytes(self.key_filters),
+                mode=self._file_mode)
         if 'pack' in debug.debug_flags:
             # XXX: size might be interesting?
             mutter('%s: create_pack: pack finished: %s%s->%s t+%6.3fs',
@@ -531,7 +547,12 @@ class NewPack(Pack):
             transport = self.upload_transport
         else:
             transport = self.index_transport
-        index_tempfile = index.finish()
+        if self.key_filters is not None:
+            key_filter = bloom.BloomFilter.for_keys(index.key_count())
+            self.key_filters[index_type] = key_filter
+            index_tempfile = index.finish(add_key=key_filter.add)
+        else:
+            index_tempfile = index.finish()
         index_bytes = index_tempfile.read()
         write_stream = transport.open_write_stream(index_name,
                                                    mode=self._file_mode)
@@ -581,7 +602,7 @@ class AggregateIndex(object):
                                              flush_func=flush_func)
         self.add_callback = None
 
-    def add_index(self, index, pack):
+    def add_index(self, index, pack, get_key_filter=None):
         """Add index to the aggregate, which is an index for Pack pack.
 
         Future searches on the aggregate index will seach this new index
@@ -589,11 +610,13 @@ class AggregateIndex(object):
 
         :param index: An Index for the pack.
         :param pack: A Pack instance.
+        :param get_key_filter: An optional callable returning a key filter
+            for index, see CombinedGraphIndex.insert_index.
         """
         # expose it to the index map
         self.index_to_pack[index] = pack.access_tuple()
         # put it at the front of the linear index list
-        self.combined_index.insert_index(0, index, pack.name)
+        self.combined_index.insert_index(0, index, pack.name, get_key_filter)
 
     def add_writable_index(self, index, pack):
         """Add an index which is able to have data added to it.
@@ -620,6 +643,7 @@ class AggregateIndex(object):
         self.index_to_pack.clear()
         del self.combined_index._indices[:]
         del self.combined_index._index_names[:]
+        self.combined_index._key_filters.clear()
         self.add_callback = None
 
     def remove_index(self, index):
@@ -628,9 +652,7 @@ class AggregateIndex(object):
         :param index: An index from the pack parameter.
         """
         del self.index_to_pack[index]
-        pos = self.combined_index._indices.index(index)
-        del self.combined_index._indices[pos]
-        del self.combined_index._index_names[pos]
+        self.combined_index.remove_index(index)
         if (self.add_callback is not None and
                 getattr(index, 'add_nodes', None) == self.add_callback):
             self.add_callback = None
@@ -762,6 +784,12 @@ class RepositoryPackCollection(object):
     :ivar _names: map of {pack_name: (index_size,)}
     """
 
+    # The name of the revision bitmap index in the indices directory
+    _revision_bitmap_name = 'revision-bitmaps'
+    # The name of the commit graph in the indices directory
+    _commit_graph_name = 'commit-graph'
+    _key_filters_suffix = '.bix'
+
     pack_factory = None
     resumed_pack_factory = None
     normal_packer_class = None
@@ -823,6 +851,16 @@ class RepositoryPackCollection(object):
         # resumed packs
         self._resumed_packs = []
         self.config_stack = config.LocationStack(self.transport.base)
+        # The RevisionBitmapIndex, False if there is none, and the pack names
+        # it was read with. It is kept across reset() until they change.
+        self._revision_bitmap_index = None
+        self._revision_bitmap_names = None
+        # The CommitGraph, False if there is none
+        self._commit_graph = None
+        # pack name:dict of index type to BloomFilter
+        self._key_filters = {}
+        # Whether the index transport is local, see _use_key_filters
+        self._key_filters_local = None
 
     def __repr__(self):
         return '%s(%r)' % (self.__class__.__name__, self.repo)
@@ -837,12 +875,71 @@ class RepositoryPackCollection(object):
                 'pack %s already in _packs_by_name' % (pack.name,))
         self.packs.append(pack)
         self._packs_by_name[pack.name] = pack
-        self.revision_index.add_index(pack.revision_index, pack)
-        self.inventory_index.add_index(pack.inventory_index, pack)
-        self.text_index.add_index(pack.text_index, pack)
-        self.signature_index.add_index(pack.signature_index, pack)
+        if getattr(pack, 'key_filters', None) is not None:
+            self._key_filters[pack.name] = pack.key_filters
+        self.revision_index.add_index(
+            pack.revision_index, pack,
+            self._key_filter_getter(pack.name, 'revision'))
+        self.inventory_index.add_index(
+            pack.inventory_index, pack,
+            self._key_filter_getter(pack.name, 'inventory'))
+        self.text_index.add_index(
+            pack.text_index, pack,
+            self._key_filter_getter(pack.name, 'text'))
+        self.signature_index.add_index(
+            pack.signature_index, pack,
+            self._key_filter_getter(pack.name, 'signature'))
         if self.chk_index is not None:
-            self.chk_index.add_index(pack.chk_index, pack)
+            self.chk_index.add_index(
+                pack.chk_index, pack,
+                self._key_filter_getter(pack.name, 'chk'))
+
+    def _use_key_filters(self):
+        """Should packs carry bloom filters over the keys of their indices?
+
+        Like the commit graph, they are only written for formats that
+        support chks. They are only written, read and retired on local
+        transports: over the network the extra round trips for each pack
+        cost more than the index probes they save.
+        """
+        if self._key_filters_local is None:
+            self._key_filters_local = False
+            if self.repo._format.supports_chks:
+                try:
+                    self._index_transport.local_abspath('.')
+                except errors.NotLocalUrl:
+                    pass
+                else:
+                    self._key_filters_local = True
+        return self._key_filters_local
+
+    def _key_filter_getter(self, name, index_type):
+        """Return a callable giving the key filter for an index of a pack."""
+        if not self._use_key_filters():
+            return None
+        return lambda: self._get_key_filter(name, index_type)
+
+    def _get_key_filter(self, name, index_type):
+        """Get the bloom.BloomFilter over the keys of an index of a pack.
+
+        The filters of a pack are read when one of them is first needed.
+
+        :return: A BloomFilter, or None if the pack has no filters.
+        """
+        key_filters = self._key_filters.get(name)
+        if key_filters is None:
+            try:
+                key_filters = bloom.filters_from_bytes(
+                    self._index_transport.get_bytes(
+                        name + self._key_filters_suffix))
+            except errors.NoSuchFile:
+                # Written before key filters were introduced
+                key_filters = {}
+            except errors.BzrError as e:
+                mutter('ignoring key filters for %s: %s', name, e)
+                key_filters = {}
+            self._key_filters[name] = key_filters
+        return key_filters.get(index_type)
 
     def all_packs(self):
         """Return a list of all the Pack objects this repository has.
@@ -990,10 +1087,105 @@ class RepositoryPackCollection(object):
             except RetryPackOperations:
                 continue
             break
+        if hint is None and self.repo._format.supports_chks:
+            parent_map = self._get_revision_parent_map()
+            self._build_revision_bitmap_index(parent_map)
+            self._build_commit_graph(parent_map)
 
         if clean_obsolete_packs:
             self._clear_obsolete_packs()
 
+    def _get_revision_parent_map(self):
+        """Return the parents of all revisions in the collection."""
+        parent_map = {}
+        for node in self.revision_index.combined_index.iter_all_entries():
+            parent_map[node[1][0]] = tuple(
+                parent[0] for parent in node[3][0])
+        return parent_map
+
+    def _build_revision_bitmap_index(self, parent_map):
+        """Write a new revision bitmap index for all revisions."""
+        bitmap_index = revision_bitmap.RevisionBitmapIndex.build(parent_map)
+        self._index_transport.put_bytes(
+            self._revision_bitmap_name, bitmap_index.to_bytes(),
+            mode=self.repo.controldir._get_file_mode())
+        self._revision_bitmap_index = bitmap_index
+        self._revision_bitmap_names = frozenset(self._names)
+
+    def get_revision_bitmap_index(self):
+        """Return the RevisionBitmapIndex for this repository.
+
+        The index is only read again once the pack names change, as it is
+        only ever written along with new packs.
+
+        :return: A RevisionBitmapIndex, or None if the repository has none.
+        """
+        self.ensure_loaded()
+        names = frozenset(self._names)
+        if (self._revision_bitmap_index is None
+                or self._revision_bitmap_names != names):
+            self._revision_bitmap_index = False
+            self._revision_bitmap_names = names
+            if not self.repo._format.supports_chks:
+                # Only written for formats that support chks
+                return None
+            try:
+                data = self._index_transport.get_bytes(
+                    self._revision_bitmap_name)
+            except errors.NoSuchFile:
+                pass
+            else:
+                try:
+                    self._revision_bitmap_index = (
+                        revision_bitmap.RevisionBitmapIndex.from_bytes(data))
+                except errors.BzrError as e:
+                    mutter('ignoring revision bitmap index: %s', e)
+        return self._revision_bitmap_index or None
+
+    def _build_commit_graph(self, parent_map):
+        """Write a new commit graph for all revisions."""
+        # Drop any mapping of the old file before replacing it
+        self._commit_graph = None
+        data = _mod_commit_graph.build_commit_graph(parent_map)
+        self._index_transport.put_bytes(
+            self._commit_graph_name, data,
+            mode=self.repo.controldir._get_file_mode())
+        self._commit_graph = _mod_commit_graph.CommitGraph(data)
+
+    def get_commit_graph(self):
+        """Return the CommitGraph for this repository.
+
+        Local commit graphs are mapped into memory rather than read.
+
+        :return: A CommitGraph, or None if the repository has none.
+        """
+        if self._commit_graph is None:
+            self._commit_graph = False
+            if not self.repo._format.supports_chks:
+                # Only written for formats that support chks
+                return None
+            try:
+                try:
+                    path = self._index_transport.local_abspath(
+                        self._commit_graph_name)
+                except errors.NotLocalUrl:
+                    commit_graph = _mod_commit_graph.CommitGraph(
+                        self._index_transport.get_bytes(
+                            self._commit_graph_name))
+                else:
+                    commit_graph = _mod_commit_graph.CommitGraph.from_file(
+                        path)
+            except errors.NoSuchFile:
+                pass
+            except (IOError, OSError) as e:
+                if e.errno != errno.ENOENT:
+                    raise
+            except errors.BzrError as e:
+                mutter('ignoring commit graph: %s', e)
+            else:
+                self._commit_graph = commit_graph
+        return self._commit_graph or None
+
     def _try_pack_operations(self, hint):
         """Calculate the pack operations based on the hint (if any), and
         execute them.
@@ -1242,6 +1434,18 @@ class RepositoryPackCollection(object):
                 except (errors.PathError, errors.TransportError) as e:
                     mutter("couldn't rename obsolete index, skipping it:\n%s"
                            % (e,))
+            # Key filters are only written by local clients, but packs can be
+            # obsoleted by any client, so move them whenever they exist.
+            self._key_filters.pop(pack.name, None)
+            try:
+                self._index_transport.move(
+                    pack.name + self._key_filters_suffix,
+                    '../obsolete_packs/' + pack.name + self._key_filters_suffix)
+            except errors.NoSuchFile:
+                pass
+            except (errors.PathError, errors.TransportError) as e:
+                mutter("couldn't rename obsolete key filters, skipping them:"
+                       "\n%s" % (e,))
 
     def pack_distribution(self, total_revisions):
         """Generate a list of the number of revisions to put in each pack.
@@ -1310,6 +1514,8 @@ class RepositoryPackCollection(object):
         self.packs = []
         self._packs_by_name = {}
         self._packs_at_load = None
+        self._commit_graph = None
+        self._key_filters = {}
 
     def _unlock_names(self):
         """Release the mutex around the pack-names index."""
@@ -1682,12 +1888,38 @@ class PackRepository(MetaDirVersionedFileRepository):
         self._serializer = _serializer
         self._reconcile_fixes_text_parents = True
         if self._format.supports_external_lookups:
-            self._unstacked_provider = graph.CachingParentsProvider(
-                self._make_parents_provider_unstacked())
+            parents_provider = self._make_parents_provider_unstacked()
         else:
-            self._unstacked_provider = graph.CachingParentsProvider(self)
+            parents_provider = self
+        # The commit graph answers from memory, so is consulted first
+        self._unstacked_provider = graph.CachingParentsProvider(
+            graph.StackedParentsProvider([
+                _mod_commit_graph.CommitGraphParentsProvider(
+                    self._get_commit_graph),
+                parents_provider]))
         self._unstacked_provider.disable_cache()
 
+    def _get_commit_graph(self):
+        if not self.is_locked():
+            return None
+        return self._pack_collection.get_commit_graph()
+
+    def get_known_graph_ancestry(self, revision_ids):
+        """See Repository.get_known_graph_ancestry."""
+        with self.lock_read():
+            commit_graph = self._pack_collection.get_commit_graph()
+            if commit_graph is not None:
+                parent_map = commit_graph.get_ancestry(revision_ids)
+                if parent_map is not None:
+                    st = static_tuple.StaticTuple
+                    known_graph = graph.KnownGraph(dict(
+                        (st(revision_id).intern(),
+                         tuple(st(parent_id) for parent_id in parent_ids))
+                        for revision_id, parent_ids in parent_map.items()))
+                    return graph.GraphThunkIdsToKeys(known_graph)
+            return super(PackRepository, self).get_known_graph_ancestry(
+                revision_ids)
+
     def _all_revision_ids(self):
         """See Repository.all_revision_ids()."""
         with self.lock_read():
@@ -68,6 +68,16 @@ from .versionedfile import FulltextContentFactory
 
 _DEFAULT_SEARCH_DEPTH = 100
 
+# Later parent map requests in a walk ask for twice as much data as the
+# previous one, up to this size.
+_MAX_PARENT_MAP_RESPONSE_SIZE = 4 * 1024 * 1024
+# Parent map requests for at least this many revisions are split over up to
+# _PIPELINE_DEPTH pipelined requests, for _PIPELINED_GENERATIONS generations
+# of ancestry each.
+_PIPELINE_MIN_KEYS = 8
+_PIPELINE_DEPTH = 4
+_PIPELINED_GENERATIONS = 16
+
 
 class _RpcHelper(object):
     """Mixin class that helps with issuing RPCs."""
@@ -1250,6 +1260,8 @@ class RemoteRepository(_mod_repository.Repository, _RpcHelper,
         self._unstacked_provider = graph.CachingParentsProvider(
             get_parent_map=self._get_parent_map_rpc)
         self._unstacked_provider.disable_cache()
+        # The number of parent map requests made since the cache was empty.
+        self._parent_map_rpcs = 0
         # For tests:
         # These depend on the actual remote format, so force them off for
         # maximum compatibility. XXX: In future these should depend on the
@@ -2424,6 +2436,15 @@ class RemoteRepository(_mod_repository.Repository, _RpcHelper,
             if not isinstance(key, bytes):
                 raise ValueError(
                     "key %r not a bytes string" % (key,))
+        if parents_map and not medium._is_remote_before((3, 2)):
+            # The client already has some of the graph, so this is probably
+            # a walk towards older history: ask for more at a time.
+            try:
+                found_parents.update(
+                    self._get_parent_map_generations_rpc(path, keys, body))
+                return found_parents
+            except errors.UnknownSmartMethod:
+                medium._remember_remote_is_before((3, 2))
         verb = b'Repository.get_parent_map'
         args = (path, b'include-missing:') + tuple(keys)
         try:
@@ -2443,31 +2464,77 @@ class RemoteRepository(_mod_repository.Repository, _RpcHelper,
             medium._remember_remote_is_before((1, 2))
             # Recurse just once and we should use the fallback code.
             return self._get_parent_map_rpc(keys)
+        self._parent_map_rpcs = 1
         response_tuple, response_handler = response
         if response_tuple[0] not in [b'ok']:
             response_handler.cancel_read_body()
             raise errors.UnexpectedSmartServerResponse(response_tuple)
-        if response_tuple[0] == b'ok':
-            coded = bz2.decompress(response_handler.read_body_bytes())
-            if coded == b'':
-                # no revisions found
-                return {}
-            lines = coded.split(b'\n')
-            revision_graph = {}
-            for line in lines:
-                d = tuple(line.split())
-                if len(d) > 1:
-                    revision_graph[d[0]] = d[1:]
+        return self._parse_parent_map_response(response_handler)
+
+    def _get_parent_map_generations_rpc(self, path, keys, body):
+        """Ask for the ancestry of keys with Repository.get_parent_map_generations.
+
+        The response size asked for doubles with every request, so a long
+        walk through history takes a logarithmic number of round trips. Wide
+        requests are split into several requests for a bounded number of
+        generations each, which are pipelined when the medium supports it.
+        """
+        max_size = min(_MAX_PARENT_MAP_RESPONSE_SIZE,
+                       65536 << self._parent_map_rpcs)
+        self._parent_map_rpcs += 1
+        verb = b'Repository.get_parent_map_generations'
+        keys = sorted(keys)
+        if (len(keys) >= _PIPELINE_MIN_KEYS and
+                self._client._medium.can_pipeline()):
+            chunk_count = min(_PIPELINE_DEPTH, len(keys) // 2)
+            generations = _PIPELINED_GENERATIONS
+        else:
+            chunk_count = 1
+            generations = 0
+        chunk_size = -(-len(keys) // chunk_count)
+        limits = (b'%d' % generations, b'%d' % (max_size // chunk_count))
+        calls = [(verb, (path,) + limits + (b'include-missing:',) +
+                  tuple(keys[i:i + chunk_size]), body)
+                 for i in range(0, len(keys), chunk_size)]
+        try:
+            responses = self._client.call_many_with_body_bytes_expecting_body(
+                calls)
+        except errors.ErrorFromSmartServer as err:
+            self._translate_error(err)
+        revision_graph = {}
+        for response_tuple, response_handler in responses:
+            if response_tuple[0] != b'ok':
+                response_handler.cancel_read_body()
+                raise errors.UnexpectedSmartServerResponse(response_tuple)
+            revision_graph.update(
+                self._parse_parent_map_response(response_handler))
+        return revision_graph
+
+    def _parse_parent_map_response(self, response_handler):
+        """Parse the body of a Repository.get_parent_map response.
+
+        Missing revisions are noted in the parents provider.
+        """
+        coded = bz2.decompress(response_handler.read_body_bytes())
+        if coded == b'':
+            # no revisions found
+            return {}
+        lines = coded.split(b'\n')
+        revision_graph = {}
+        for line in lines:
+            d = tuple(line.split())
+            if len(d) > 1:
+                revision_graph[d[0]] = d[1:]
+            else:
+                # No parents:
+                if d[0].startswith(b'missing:'):
+                    revid = d[0][8:]
+                    self._unstacked_provider.note_missing_key(revid)
                 else:
-                    # No parents:
-                    if d[0].startswith(b'missing:'):
-                        revid = d[0][8:]
-                        self._unstacked_provider.note_missing_key(revid)
-                    else:
-                        # no parents - so give the Graph result
-                        # (NULL_REVISION,).
-                        revision_graph[d[0]] = (NULL_REVISION,)
-            return revision_graph
+                    # no parents - so give the Graph result
+                    # (NULL_REVISION,).
+                    revision_graph[d[0]] = (NULL_REVISION,)
+        return revision_graph
 
     def get_signature_text(self, revision_id):
         with self.lock_read():
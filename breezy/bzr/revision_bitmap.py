@@ -0,0 +1,245 @@
+# Copyright (C) 2020 Breezy Developers
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA
+
+"""Reachability bitmaps for the revisions in a repository.
+
+Every revision known to the index is given a bit, in topological order. For a
+selection of revisions (all heads, plus one revision in every
+``interval``), the index stores the set of revisions reachable from it as a
+bitmap. The ancestry of any revision can then be computed by walking back
+only until selected revisions are reached, and differences between
+ancestries are simple integer operations.
+
+Revisions are never removed from a repository, so a bitmap stays correct
+after more revisions are added. The only exception is the ancestry of a
+ghost, which grows when the ghost is filled in. The ghosts reachable from
+each bitmap are therefore stored with it, and are walked when the bitmap is
+used, in case they have been filled in since.
+"""
+
+import zlib
+
+from .. import (
+    bencode,
+    errors,
+    graph as _mod_graph,
+    revision as _mod_revision,
+    )
+
+
+_FORMAT_HEADER = b'Bazaar revision bitmap index v2\n'
+
+_MIN_INTERVAL = 100
+_MAX_SELECTED = 1000
+
+
+class RevisionBitmapIndex(object):
+    """Precomputed ancestry bitmaps for a set of revisions."""
+
+    def __init__(self, revision_ids, bitmaps, ghosts=None):
+        """Create a RevisionBitmapIndex.
+
+        :param revision_ids: List of revision ids, in topological order. The
+            position of a revision is the bit used to represent it.
+        :param bitmaps: Dict mapping the position of selected revisions to an
+            integer with the bits of all revisions reachable from it set.
+        :param ghosts: Dict mapping the position of selected revisions to
+            the set of ghosts reachable from it, if any.
+        """
+        self._revision_ids = revision_ids
+        self._positions = dict(
+            (revision_id, pos) for pos, revision_id in enumerate(revision_ids))
+        self._bitmaps = bitmaps
+        if ghosts is None:
+            ghosts = {}
+        self._ghosts = ghosts
+
+    def __len__(self):
+        return len(self._revision_ids)
+
+    @classmethod
+    def build(cls, parent_map, interval=None):
+        """Build an index for the revisions in parent_map.
+
+        :param parent_map: Dict mapping every revision id to its parents.
+            Parents that are not keys of parent_map are ghosts.
+        :param interval: A bitmap is stored for every interval'th revision in
+            topological order, as well as for all heads. Each bitmap takes
+            one bit per revision in memory, so by default the interval is
+            chosen to keep about _MAX_SELECTED bitmaps.
+        """
+        known_graph = _mod_graph.KnownGraph(parent_map)
+        revision_ids = [revision_id for revision_id in known_graph.topo_sort()
+                        if revision_id in parent_map]
+        if interval is None:
+            interval = max(_MIN_INTERVAL, len(revision_ids) // _MAX_SELECTED)
+        positions = dict(
+            (revision_id, pos) for pos, revision_id in enumerate(revision_ids))
+        has_children = set()
+        for parents in parent_map.values():
+            has_children.update(parents)
+        bitmaps = {}
+        all_ghosts = {}
+        for pos, revision_id in enumerate(revision_ids):
+            if pos % interval and revision_id in has_children:
+                continue
+            bits = 0
+            ghosts = set()
+            seen = set([revision_id])
+            pending = [revision_id]
+            while pending:
+                next_id = pending.pop()
+                next_pos = positions.get(next_id)
+                if next_pos is None:
+                    if next_id != _mod_revision.NULL_REVISION:
+                        ghosts.add(next_id)
+                    continue
+                if next_pos != pos and next_pos in bitmaps:
+                    bits |= bitmaps[next_pos]
+                    ghosts.update(all_ghosts.get(next_pos, ()))
+                    continue
+                bits |= 1 << next_pos
+                for parent_id in parent_map[next_id]:
+                    if parent_id not in seen:
+                        seen.add(parent_id)
+                        pending.append(parent_id)
+            bitmaps[pos] = bits
+            if ghosts:
+                all_ghosts[pos] = ghosts
+        return cls(revision_ids, bitmaps, all_ghosts)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Parse an index serialised with to_bytes."""
+        if not data.startswith(_FORMAT_HEADER):
+            raise errors.BzrError('invalid revision bitmap index')
+        try:
+            revision_ids, bitmaps, ghosts = bencode.bdecode(
+                zlib.decompress(data[len(_FORMAT_HEADER):]))
+        except (ValueError, zlib.error):
+            raise errors.BzrError('invalid revision bitmap index')
+        return cls(
+            revision_ids,
+            dict((pos, int.from_bytes(bits, 'little'))
+                 for pos, bits in bitmaps),
+            dict((pos, set(ghost_ids)) for pos, ghost_ids in ghosts))
+
+    def to_bytes(self):
+        """Serialise the index."""
+        bitmaps = [[pos, bits.to_bytes((bits.bit_length() + 7) // 8, 'little')]
+                   for pos, bits in sorted(self._bitmaps.items())]
+        ghosts = [[pos, sorted(ghost_ids)]
+                  for pos, ghost_ids in sorted(self._ghosts.items())]
+        return _FORMAT_HEADER + zlib.compress(
+            bencode.bencode([self._revision_ids, bitmaps, ghosts]))
+
+    def get_selected_revision_ids(self):
+        """Return the revisions that have a bitmap stored."""
+        return set(self._revision_ids[pos] for pos in self._bitmaps)
+
+    def get_ancestry(self, revision_ids, get_parent_map):
+        """Find the ancestry of revision_ids.
+
+        Revisions are walked back using get_parent_map until a revision with
+        a stored bitmap is reached. The ghosts reachable from the bitmaps used
+        are looked up as well, and walked if they are no longer ghosts.
+
+        :param revision_ids: The revisions to find the ancestry of.
+        :param get_parent_map: A callable mapping revision ids to their
+            parents, used for revisions without a bitmap.
+        :return: A tuple of (bits, others), where bits is an integer with the
+            bits of all indexed revisions in the ancestry set, and others is
+            the set of ancestors not known to this index.
+        """
+        positions = self._positions
+        bitmaps = self._bitmaps
+        ghosts = self._ghosts
+        bits = 0
+        others = set()
+        seen = set()
+        pending = set(revision_ids)
+        while pending:
+            seen.update(pending)
+            to_query = []
+            ghost_ids = set()
+            for revision_id in pending:
+                pos = positions.get(revision_id)
+                if pos is None:
+                    to_query.append(revision_id)
+                elif pos in bitmaps:
+                    bits |= bitmaps[pos]
+                    ghost_ids.update(ghosts.get(pos, ()))
+                else:
+                    bits |= 1 << pos
+                    to_query.append(revision_id)
+            ghost_ids.difference_update(seen)
+            seen.update(ghost_ids)
+            to_query.extend(ghost_ids)
+            pending = set()
+            parent_map = get_parent_map(to_query)
+            for revision_id in to_query:
+                parents = parent_map.get(revision_id)
+                if parents is None:
+                    # A ghost
+                    continue
+                if revision_id not in positions:
+                    others.add(revision_id)
+                pending.update(parents)
+            pending.difference_update(seen)
+            pending.discard(_mod_revision.NULL_REVISION)
+        return bits, others
+
+    def iter_revision_ids(self, bits):
+        """Iterate over the revision ids of the set bits in bits."""
+        revision_ids = self._revision_ids
+        data = bits.to_bytes((bits.bit_length() + 7) // 8, 'little')
+        for byte_pos, byte in enumerate(data):
+            pos = byte_pos * 8
+            while byte:
+                if byte & 1:
+                    yield revision_ids[pos]
+                byte >>= 1
+                pos += 1
+
+
+def find_missing_revisions(source_index, source_get_parent_map,
+                           target_index, target_get_parent_map,
+                           revision_ids):
+    """Find the ancestors of revision_ids in the source not in the target.
+
+    The ancestry of the revisions the target has bitmaps for is known to be
+    present in the target, so it can be subtracted from the ancestry of
+    revision_ids in a single operation. The remaining candidates are checked
+    against the target directly.
+
+    :param source_index: The RevisionBitmapIndex of the source repository.
+    :param source_get_parent_map: get_parent_map of the source repository.
+    :param target_index: The RevisionBitmapIndex of the target repository.
+    :param target_get_parent_map: get_parent_map of the target repository.
+    :param revision_ids: The revisions (present in the source) to find
+        missing ancestors of.
+    :return: A set of revision ids.
+    """
+    want_bits, want_others = source_index.get_ancestry(
+        revision_ids, source_get_parent_map)
+    haves = target_index.get_selected_revision_ids()
+    haves = set(source_get_parent_map(haves))
+    have_bits, have_others = source_index.get_ancestry(
+        haves, source_get_parent_map)
+    candidates = set(source_index.iter_revision_ids(want_bits & ~have_bits))
+    candidates.update(want_others.difference(have_others))
+    candidates.difference_update(target_get_parent_map(candidates))
+    return candidates
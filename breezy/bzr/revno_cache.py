@@ -0,0 +1,304 @@
+# Copyright (C) 2020 Breezy Developers
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA
+
+"""Persistent cache of the merge sorted history of a branch.
+
+Computing dotted revnos requires a merge_sort over the whole ancestry of the
+branch tip, which on large branches takes seconds. The result only depends on
+the tip, so it is kept in a file in the branch control directory. When the
+tip moves forward the cache is extended by sorting just the new revisions;
+when history is rewritten it is rebuilt from scratch.
+
+Filling in a ghost in the ancestry changes the merge sort without moving the
+tip, so the ghosts are recorded as well, and the cache is not used once any
+of them is present in the repository.
+
+The file format is::
+
+    Bazaar revno cache v2
+    <tip revision id>
+    <ghost revision id> ...
+    <revision id> <merge depth> <dotted revno> <end of merge> <first child>
+    ...
+
+with one line per revision in merge sorted order (tip first). ``first child``
+is 1 if no revision in the cache has that revision as its left-hand parent,
+which is needed to number revisions that are added later.
+"""
+
+from .. import (
+    errors,
+    revision as _mod_revision,
+    tsort,
+    )
+from ..trace import mutter
+
+
+_FORMAT_HEADER = b'Bazaar revno cache v2\n'
+
+
+class MergeSortNode(object):
+    """A single entry of a merge sorted history."""
+
+    __slots__ = ('key', 'merge_depth', 'revno', 'end_of_merge')
+
+    def __init__(self, key, merge_depth, revno, end_of_merge):
+        self.key = key
+        self.merge_depth = merge_depth
+        self.revno = revno
+        self.end_of_merge = end_of_merge
+
+    def __repr__(self):
+        return '%s(%r, %d, %r, %r)' % (
+            self.__class__.__name__, self.key, self.merge_depth, self.revno,
+            self.end_of_merge)
+
+
+def _parse_line(line):
+    """Parse a line of the cache file.
+
+    :return: A tuple of (node, is_first_child)
+    :raises ValueError: If the line is malformed
+    """
+    (revision_id, merge_depth, revno, end_of_merge,
+     is_first_child) = line.split(b' ')
+    node = MergeSortNode(
+        revision_id, int(merge_depth), tuple(map(int, revno.split(b'.'))),
+        end_of_merge == b'1')
+    return node, is_first_child == b'1'
+
+
+def _parse_ghosts(line):
+    if not line:
+        return set()
+    return set(line.split(b' '))
+
+
+def _ghosts_filled_in(repository, ghosts):
+    """Check whether any of the ghosts is now present in repository."""
+    return bool(ghosts) and bool(repository.get_parent_map(ghosts))
+
+
+class RevnoCache(object):
+    """A cache of the merge sorted ancestry of a branch tip.
+
+    :ivar min_revisions: Histories shorter than this are cheap to sort, so
+        they are not written to disk.
+    """
+
+    def __init__(self, transport, filename='revno-cache', min_revisions=1000):
+        self._transport = transport
+        self._filename = filename
+        self.min_revisions = min_revisions
+
+    def read(self):
+        """Read the cache.
+
+        :return: A tuple of (tip, nodes, first_child, ghosts) where nodes is a
+            list of MergeSortNode, first_child the set of revision ids that
+            are not the left-hand parent of any revision in nodes and ghosts
+            the set of ghosts in the ancestry of tip, or None if there is no
+            usable cache.
+        """
+        try:
+            data = self._transport.get_bytes(self._filename)
+        except errors.NoSuchFile:
+            return None
+        lines = data.split(b'\n')
+        if (len(lines) < 4 or lines[0] + b'\n' != _FORMAT_HEADER
+                or lines[-1] != b''):
+            mutter('ignoring invalid revno cache %s', self._filename)
+            return None
+        tip = lines[1]
+        ghosts = _parse_ghosts(lines[2])
+        nodes = []
+        first_child = set()
+        try:
+            for line in lines[3:-1]:
+                node, is_first_child = _parse_line(line)
+                nodes.append(node)
+                if is_first_child:
+                    first_child.add(node.key)
+        except ValueError:
+            mutter('ignoring invalid revno cache %s', self._filename)
+            return None
+        return tip, nodes, first_child, ghosts
+
+    def write(self, tip, nodes, first_child, ghosts):
+        """Write out the merge sorted history for tip.
+
+        Errors writing the file are ignored, as this is only a cache.
+        """
+        if len(nodes) < self.min_revisions:
+            return
+        chunks = [_FORMAT_HEADER, tip + b'\n',
+                  b' '.join(sorted(ghosts)) + b'\n']
+        for node in nodes:
+            chunks.append(b'%s %d %s %d %d\n' % (
+                node.key, node.merge_depth,
+                b'.'.join(b'%d' % n for n in node.revno),
+                node.end_of_merge, node.key in first_child))
+        try:
+            self._transport.put_bytes(self._filename, b''.join(chunks))
+        except (errors.TransportNotPossible, errors.PermissionDenied) as e:
+            mutter('unable to write revno cache: %s', e)
+
+    def invalidate(self):
+        """Remove the cache file, if present."""
+        try:
+            self._transport.delete(self._filename)
+        except (errors.NoSuchFile, errors.TransportNotPossible,
+                errors.PermissionDenied):
+            pass
+
+    def iter_merge_sort(self, branch, tip_revno, tip):
+        """Iterate over the cached merge sorted ancestry of tip.
+
+        Nodes are parsed from the file as they are consumed, so the newest
+        revisions are available without reading or keeping the whole
+        history in memory.
+
+        :return: An iterator over MergeSortNode, tip first, or None if the
+            cache is not up to date for tip.
+        """
+        try:
+            f = self._transport.get(self._filename)
+        except errors.NoSuchFile:
+            return None
+        try:
+            if (f.readline() != _FORMAT_HEADER
+                    or f.readline() != tip + b'\n'):
+                f.close()
+                return None
+            line = f.readline()
+            if (not line.endswith(b'\n') or _ghosts_filled_in(
+                    branch.repository, _parse_ghosts(line[:-1]))):
+                f.close()
+                return None
+        except BaseException:
+            f.close()
+            raise
+        return self._iter_file(f, branch, tip_revno, tip)
+
+    def _iter_file(self, f, branch, tip_revno, tip):
+        count = 0
+        try:
+            for line in f:
+                if not line.endswith(b'\n'):
+                    raise ValueError('truncated line %r' % line)
+                node, is_first_child = _parse_line(line[:-1])
+                yield node
+                count += 1
+        except ValueError:
+            mutter('ignoring invalid revno cache %s', self._filename)
+        else:
+            return
+        finally:
+            f.close()
+        # Carry on from the same place in a sorted ancestry
+        for node in self.merge_sort(branch, tip_revno, tip)[count:]:
+            yield node
+
+    def merge_sort(self, branch, tip_revno, tip):
+        """Return the merge sorted ancestry of tip.
+
+        :param branch: The branch tip belongs to, used to check whether the
+            cached tip is still on its mainline.
+        :param tip_revno: The revno of tip in branch.
+        :param tip: The revision id to sort the ancestry of.
+        :return: A list of MergeSortNode, tip first.
+        """
+        cached = self.read()
+        if cached is not None:
+            cached_tip, nodes, first_child, ghosts = cached
+            if _ghosts_filled_in(branch.repository, ghosts):
+                mutter('ghosts filled in, rebuilding revno cache %s',
+                       self._filename)
+            elif cached_tip == tip:
+                return nodes
+            elif nodes and nodes[0].key == cached_tip:
+                cached_revno = nodes[0].revno[0]
+                if (cached_revno < tip_revno and
+                        self._is_mainline_revision(branch, cached_revno,
+                                                   cached_tip)):
+                    nodes, first_child, ghosts = self._extend(
+                        branch.repository.get_graph(), tip, nodes,
+                        first_child, ghosts)
+                    self.write(tip, nodes, first_child, ghosts)
+                    return nodes
+        nodes, first_child, ghosts = self._sort(branch.repository, tip)
+        self.write(tip, nodes, first_child, ghosts)
+        return nodes
+
+    def _is_mainline_revision(self, branch, revno, revision_id):
+        try:
+            return branch.get_rev_id(revno) == revision_id
+        except (errors.NoSuchRevision, errors.RevisionNotPresent):
+            return False
+
+    def _sort(self, repository, tip):
+        """Merge sort the whole ancestry of tip."""
+        known_graph = repository.get_known_graph_ancestry([tip])
+        nodes = [
+            MergeSortNode(node.key, node.merge_depth, node.revno,
+                          node.end_of_merge)
+            for node in known_graph.merge_sort(tip)]
+        keys = set(node.key for node in nodes)
+        has_lh_child = set()
+        ghosts = set()
+        for node in nodes:
+            parent_keys = known_graph.get_parent_keys(node.key)
+            if parent_keys:
+                has_lh_child.add(parent_keys[0])
+                ghosts.update(parent_keys)
+        ghosts.difference_update(keys)
+        ghosts.discard(_mod_revision.NULL_REVISION)
+        first_child = keys.difference(has_lh_child)
+        return nodes, first_child, ghosts
+
+    def _extend(self, graph, tip, old_nodes, first_child, ghosts):
+        """Merge sort the revisions between the cached tip and tip.
+
+        Only the revisions that are not in the ancestry of the cached tip are
+        sorted; the cached nodes keep their merge depths and revnos.
+        """
+        old_tip = old_nodes[0].key
+        new_keys = graph.find_unique_ancestors(tip, [old_tip])
+        parent_map = graph.get_parent_map(new_keys)
+        known_revnos = dict(
+            (node.key, (node.revno, node.key in first_child))
+            for node in old_nodes)
+        sorter = tsort.MergeSorter(parent_map, tip, generate_revno=True,
+                                   known_revnos=known_revnos)
+        new_nodes = [
+            MergeSortNode(key, merge_depth, revno, end_of_merge)
+            for _, key, merge_depth, revno, end_of_merge
+            in sorter.iter_topo_order()]
+        # The last new node was followed by the old tip in a full sort
+        last = new_nodes[-1]
+        last.end_of_merge = (last.merge_depth > 0
+                             or old_tip not in parent_map[last.key])
+        first_child = set(first_child)
+        first_child.update(parent_map)
+        ghosts = set(ghosts)
+        for parents in parent_map.values():
+            if parents and parents[0] != _mod_revision.NULL_REVISION:
+                first_child.discard(parents[0])
+            ghosts.update(parent for parent in parents
+                          if parent not in parent_map
+                          and parent not in known_revnos)
+        ghosts.discard(_mod_revision.NULL_REVISION)
+        return new_nodes + old_nodes, first_child, ghosts
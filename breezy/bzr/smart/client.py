@@ -96,6 +96,63 @@ class _SmartClient(object):
             method, args, body=body, expect_response_body=True)
         return (response, response_handler)
 
+    def call_many_with_body_bytes_expecting_body(self, calls):
+        """Make several calls with body bytes, pipelining them if possible.
+
+        When the medium can pipeline requests, all the requests are sent
+        before any response is read, so the calls take a single round trip.
+        Otherwise the calls are made one after the other.
+
+        :param calls: A list of (method, args, body) tuples.
+        :return: A list with a (response_tuple, response_handler) tuple for
+            each call, in the same order. If any call fails, the error of the
+            first failing call is raised; pipelined calls raise it once all
+            the responses have been read.
+        """
+        for method, args, body in calls:
+            if not isinstance(method, bytes):
+                raise TypeError(
+                    'method must be a byte string, not %r' % (method,))
+            for arg in args:
+                if not isinstance(arg, bytes):
+                    raise TypeError(
+                        'args must be byte strings, not %r' % (args,))
+            if not isinstance(body, bytes):
+                raise TypeError(
+                    'body must be byte string, not %r' % (body,))
+        if len(calls) < 2 or not self._medium.can_pipeline():
+            return [self.call_with_body_bytes_expecting_body(method, args, body)
+                    for method, args, body in calls]
+        requests = [_SmartClientRequest(self, method, args, body=body)
+                    for method, args, body in calls]
+        try:
+            response_handlers = [request.send_pipelined()
+                                 for request in requests]
+        except errors.ConnectionReset:
+            self._medium.reset()
+            raise
+        results = []
+        error = None
+        for response_handler in response_handlers:
+            try:
+                response_tuple = response_handler.read_response_tuple(
+                    expect_body=True)
+                response_handler._wait_for_response_end()
+            except errors.ConnectionReset:
+                self._medium.reset()
+                raise
+            except (errors.ErrorFromSmartServer,
+                    errors.UnknownSmartMethod) as e:
+                # Keep reading, so the responses to the remaining requests
+                # are taken off the stream.
+                if error is None:
+                    error = e
+                continue
+            results.append((response_tuple, response_handler))
+        if error is not None:
+            raise error
+        return results
+
     def call_with_body_readv_array(self, args, body):
         response, response_handler = self._call_and_read_response(
             args[0], args[1:], readv_body=body, expect_response_body=True)
@@ -237,9 +294,27 @@ class _SmartClientRequest(object):
         raise errors.SmartProtocolError(
             'Server is not a Bazaar server: ' + str(last_err))
 
-    def _construct_protocol(self, version):
+    def send_pipelined(self):
+        """Send the request without waiting for the responses to earlier ones.
+
+        This is only possible with protocol version 3 on a medium that
+        supports pipelining; see _SmartClient.call_many_with_body_bytes_expecting_body.
+        Requests are not retried if the connection is reset.
+
+        :return: The response handler for the request.
+        """
+        self._run_call_hooks()
+        encoder, response_handler = self._construct_protocol(
+            3, pipelined=True)
+        self._send_no_retry(encoder)
+        return response_handler
+
+    def _construct_protocol(self, version, pipelined=False):
         """Build the encoding stack for a given protocol version."""
-        request = self.client._medium.get_request()
+        if pipelined:
+            request = self.client._medium.get_request(pipelined=True)
+        else:
+            request = self.client._medium.get_request()
         if version == 3:
             request_encoder = protocol.ProtocolThreeRequester(request)
             response_handler = message.ConventionalResponseHandler()
@@ -24,6 +24,7 @@ over SSH), and pass them to and from the protocol logic.  See the overview in
 breezy/transport/smart/__init__.py.
 """
 
+import collections
 import errno
 import io
 import os
@@ -294,7 +295,9 @@ class SmartServerStreamMedium(SmartMedium):
 
         :returns: a SmartServerRequestProtocol.
         """
-        self._wait_for_bytes_with_timeout(self._client_timeout)
+        if self._push_back_buffer is None:
+            # Pipelining clients may already have sent the next request.
+            self._wait_for_bytes_with_timeout(self._client_timeout)
         if self.finished:
             # We're stopping, so don't try to do any more work
             return None
@@ -835,6 +838,13 @@ class SmartClientMedium(SmartMedium):
                 raise
         return '2'
 
+    def can_pipeline(self):
+        """Can several requests be sent before their responses are read?
+
+        See get_request. The default implementation returns False.
+        """
+        return False
+
     def should_probe(self):
         """Should RemoteBzrDirFormat.probe_transport send a smart request on
         this medium?
@@ -881,6 +891,9 @@ class SmartClientStreamMedium(SmartClientMedium):
     def __init__(self, base):
         SmartClientMedium.__init__(self, base)
         self._current_request = None
+        # Requests that have been sent but whose responses have not been read
+        # yet, oldest first, ahead of _current_request.
+        self._pipelined_requests = collections.deque()
 
     def accept_bytes(self, bytes):
         self._accept_bytes(bytes)
@@ -899,13 +912,27 @@ class SmartClientStreamMedium(SmartClientMedium):
         """
         raise NotImplementedError(self._flush)
 
-    def get_request(self):
+    def can_pipeline(self):
+        """See SmartClientMedium.can_pipeline().
+
+        The server reads requests from the stream one at a time, so requests
+        can be pipelined once protocol version 3, which frames every message,
+        is known to be in use.
+        """
+        return self._protocol_version == 3
+
+    def get_request(self, pipelined=False):
         """See SmartClientMedium.get_request().
 
         SmartClientStreamMedium always returns a SmartClientStreamMediumRequest
         for get_request.
+
+        :param pipelined: If True, the request may be started while the
+            responses to previous requests have not been read yet, as long as
+            those requests have been completely written. Responses must then
+            be read in the order the requests were made.
         """
-        return SmartClientStreamMediumRequest(self)
+        return SmartClientStreamMediumRequest(self, pipelined=pipelined)
 
     def reset(self):
         """We have been disconnected, reset current state.
@@ -914,6 +941,7 @@ class SmartClientStreamMedium(SmartClientMedium):
         """
         self.disconnect()
         self._current_request = None
+        self._pipelined_requests.clear()
 
 
 class SmartSimplePipesClientMedium(SmartClientStreamMedium):
@@ -1182,15 +1210,20 @@ class SmartClientAlreadyConnectedSocketMedium(SmartClientSocketMedium):
 class SmartClientStreamMediumRequest(SmartClientMediumRequest):
     """A SmartClientMediumRequest that works with an SmartClientStreamMedium."""
 
-    def __init__(self, medium):
+    def __init__(self, medium, pipelined=False):
         SmartClientMediumRequest.__init__(self, medium)
         # check that we are safe concurrency wise. If some streams start
         # allowing concurrent requests - i.e. via multiplexing - then this
         # assert should be moved to SmartClientStreamMedium.get_request,
         # and the setting/unsetting of _current_request likewise moved into
         # that class : but its unneeded overhead for now. RBC 20060922
-        if self._medium._current_request is not None:
-            raise errors.TooManyConcurrentRequests(self._medium)
+        current_request = self._medium._current_request
+        if current_request is not None:
+            if not pipelined or current_request._state != "reading":
+                raise errors.TooManyConcurrentRequests(self._medium)
+            # The previous request has been sent, so this one can follow it
+            # on the stream before its response is read.
+            self._medium._pipelined_requests.append(current_request)
         self._medium._current_request = self
 
     def _accept_bytes(self, bytes):
@@ -1201,12 +1234,35 @@ class SmartClientStreamMediumRequest(SmartClientMediumRequest):
         """
         self._medium._accept_bytes(bytes)
 
+    def _read_bytes(self, count):
+        """See SmartClientMediumRequest._read_bytes.
+
+        Responses to pipelined requests arrive in the order the requests were
+        sent, so only the oldest outstanding request may read.
+        """
+        pipelined_requests = self._medium._pipelined_requests
+        if pipelined_requests and pipelined_requests[0] is not self:
+            raise errors.TooManyConcurrentRequests(self._medium)
+        return SmartClientMediumRequest._read_bytes(self, count)
+
+    def _read_line(self):
+        pipelined_requests = self._medium._pipelined_requests
+        if pipelined_requests and pipelined_requests[0] is not self:
+            raise errors.TooManyConcurrentRequests(self._medium)
+        return SmartClientMediumRequest._read_line(self)
+
     def _finished_reading(self):
         """See SmartClientMediumRequest._finished_reading.
 
         This clears the _current_request on self._medium to allow a new
         request to be created.
         """
+        pipelined_requests = self._medium._pipelined_requests
+        if pipelined_requests:
+            if pipelined_requests[0] is not self:
+                raise AssertionError()
+            pipelined_requests.popleft()
+            return
         if self._medium._current_request is not self:
             raise AssertionError()
         self._medium._current_request = None
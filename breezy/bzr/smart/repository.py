@@ -29,6 +29,7 @@ from ... import (
     bencode,
     errors,
     estimate_compressed_size,
+    lru_cache,
     osutils,
     trace,
     ui,
@@ -57,6 +58,187 @@ from ..versionedfile import (
     )
 
 
+def _response_size(value):
+    return sum(map(len, value[1]))
+
+
+class _DiskResponseCache(lru_cache.LRUSizeCache):
+    """The disk tier of a ResponseCache.
+
+    Each response is kept in a file named after its key, and the values in
+    the cache are the sizes of those files.
+    """
+
+    def __init__(self, directory, max_size):
+        super(_DiskResponseCache, self).__init__(
+            max_size=max_size, compute_size=int)
+        self.directory = directory
+
+    def _path(self, key):
+        return osutils.pathjoin(self.directory, key.decode('ascii'))
+
+    def read(self, key):
+        if self.get(key) is None:
+            return None
+        with open(self._path(key), 'rb') as f:
+            args, chunks, is_stream = bencode.bdecode(f.read())
+        return tuple(args), chunks, bool(is_stream)
+
+    def write(self, key, value):
+        args, chunks, is_stream = value
+        data = bencode.bencode([list(args), chunks, is_stream])
+        if len(data) >= self._after_cleanup_size:
+            return
+        path = self._path(key)
+        with open(path + '.tmp', 'wb') as f:
+            f.write(data)
+        os.rename(path + '.tmp', path)
+        self[key] = len(data)
+
+    def _remove_node(self, node):
+        super(_DiskResponseCache, self)._remove_node(node)
+        try:
+            os.unlink(self._path(node.key))
+        except OSError:
+            pass
+
+    def close(self):
+        self.clear()
+        osutils.rmtree(self.directory)
+
+
+class ResponseCache(object):
+    """A size bounded LRU cache of responses to read only requests.
+
+    Only responses made up of data that never changes once it is in a
+    repository are cached, and only when none of the data asked for was
+    absent. Such data can only go away when packs are removed (e.g. by
+    'brz pack'), so the responses for a repository are dropped whenever one
+    of the packs it had before is no longer listed. Repositories that do
+    not use packs are never cached.
+
+    Responses can also be written to files in a private directory, created
+    in disk_dir and removed by close().
+
+    :ivar hits: The number of requests answered from the cache.
+    :ivar misses: The number of cacheable requests that were not.
+    :ivar invalidations: The number of times a repository lost packs.
+    """
+
+    # How many repositories to remember the packs of. The responses of a
+    # repository that is forgotten become unreachable, as if it lost packs.
+    _max_repositories = 1000
+
+    def __init__(self, max_size, disk_dir=None, max_disk_size=0):
+        self._lock = threading.Lock()
+        self._memory = lru_cache.LRUSizeCache(
+            max_size=max_size, compute_size=_response_size)
+        if disk_dir is not None and max_disk_size:
+            self._disk = _DiskResponseCache(
+                tempfile.mkdtemp(prefix='response-cache-', dir=disk_dir),
+                max_disk_size)
+        else:
+            self._disk = None
+        # Maps repository urls to the names of their packs and the
+        # generation of their responses.
+        self._repositories = lru_cache.LRUCache(self._max_repositories)
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def max_entry_size(self):
+        """Return the size of the largest response worth collecting."""
+        size = self._memory._after_cleanup_size
+        if self._disk is not None:
+            size = max(size, self._disk._after_cleanup_size)
+        return size
+
+    def key(self, repository, verb, args, body_bytes):
+        """Return the key for a request, or None if it can not be cached."""
+        pack_collection = getattr(repository, '_pack_collection', None)
+        if pack_collection is None:
+            return None
+        with repository.lock_read():
+            pack_collection.ensure_loaded()
+            names = frozenset(pack_collection.names())
+        url = repository.control_url
+        with self._lock:
+            old_names, generation = self._repositories.get(url, (None, None))
+            if old_names is None or not old_names.issubset(names):
+                # Responses from before are now unreachable and will age out
+                # of the cache.
+                if old_names is not None:
+                    self.invalidations += 1
+                self._generation += 1
+                generation = self._generation
+            self._repositories[url] = (names, generation)
+        return osutils.sha_string(bencode.bencode(
+            [url.encode('utf-8'), generation, verb.encode('ascii'),
+             list(args), body_bytes]))
+
+    def get(self, key):
+        """Look up a response.
+
+        :return: A tuple of (response args, body chunks, is_stream), or None.
+        """
+        with self._lock:
+            value = self._memory.get(key)
+            if value is None and self._disk is not None:
+                value = self._disk.read(key)
+                if value is not None:
+                    self._memory[key] = value
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return value
+
+    def add(self, key, args, chunks, is_stream):
+        """Add a successful response to the cache."""
+        value = (tuple(args), list(chunks), is_stream)
+        size = _response_size(value)
+        with self._lock:
+            if size < self._memory._after_cleanup_size:
+                self._memory[key] = value
+            if self._disk is not None:
+                self._disk.write(key, value)
+
+    def stats(self):
+        """Return a dict with the hit and miss counts, and the cache sizes."""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'invalidations': self.invalidations,
+                'size': self._memory._value_size,
+                'disk_size': (self._disk._value_size
+                              if self._disk is not None else 0),
+                }
+
+    def close(self):
+        """Remove the files of the disk tier."""
+        with self._lock:
+            self._memory.clear()
+            if self._disk is not None:
+                self._disk.close()
+                self._disk = None
+
+
+_response_cache = None
+
+
+def set_response_cache(cache):
+    """Set the ResponseCache used by requests, or None to not cache.
+
+    :return: The previous cache.
+    """
+    global _response_cache
+    old = _response_cache
+    _response_cache = cache
+    return old
+
+
 class SmartServerRepositoryRequest(SmartServerRequest):
     """Common base class for Repository requests."""
 
@@ -75,10 +257,65 @@ class SmartServerRepositoryRequest(SmartServerRequest):
         """
         transport = self.transport_from_client_path(path)
         bzrdir = BzrDir.open_from_transport(transport)
-        # Save the repository for use with do_body.
+        # Save the repository and arguments for use with do_body.
         self._repository = bzrdir.open_repository()
+        self._args = args
         return self.do_repository_request(self._repository, *args)
 
+    def cached_response(self, body_bytes, make_response):
+        """Return make_response(), answering from the response cache if set.
+
+        This may only be used by requests for data that does not change once
+        it is in the repository. make_response, or the body stream of its
+        response, must set self._cacheable to False when any of the data
+        asked for is absent.
+        """
+        cache = _response_cache
+        key = None
+        if cache is not None:
+            key = cache.key(
+                self._repository, self.__class__.__name__, self._args,
+                body_bytes)
+        if key is None:
+            return make_response()
+        value = cache.get(key)
+        if value is not None:
+            args, chunks, is_stream = value
+            if is_stream:
+                return SuccessfulSmartServerResponse(
+                    args, body_stream=iter(chunks))
+            return SuccessfulSmartServerResponse(args, b''.join(chunks))
+        self._cacheable = True
+        response = make_response()
+        if not response.is_successful():
+            return response
+        if response.body_stream is not None:
+            response.body_stream = self._cache_body_stream(
+                cache, key, response.args, response.body_stream)
+        elif self._cacheable and response.body is not None:
+            cache.add(key, response.args, [response.body], False)
+        return response
+
+    def _cache_body_stream(self, cache, key, args, body_stream):
+        max_size = cache.max_entry_size()
+        chunks = []
+        size = 0
+        for chunk in body_stream:
+            if chunks is not None:
+                if not isinstance(chunk, bytes):
+                    # An error part way through the stream.
+                    chunks = None
+                    yield chunk
+                    continue
+                size += len(chunk)
+                if size < max_size:
+                    chunks.append(chunk)
+                else:
+                    chunks = None
+            yield chunk
+        if chunks is not None and self._cacheable:
+            cache.add(key, args, chunks, True)
+
     def do_repository_request(self, repository, *args):
         """Override to provide an implementation for a verb."""
         # No-op for verbs that take bodies (None as a result indicates a body
@@ -193,15 +430,18 @@ class SmartServerRepositoryGetParentMap(SmartServerRepositoryRequest):
         """
         repository = self._repository
         with repository.lock_read():
-            return self._do_repository_request(body_bytes)
+            return self.cached_response(
+                body_bytes, lambda: self._do_repository_request(body_bytes))
 
     def _expand_requested_revs(self, repo_graph, revision_ids, client_seen_revs,
-                               include_missing, max_size=65536):
+                               include_missing, max_size=65536,
+                               max_generations=None):
         result = {}
         queried_revs = set()
         estimator = estimate_compressed_size.ZLibEstimator(max_size)
         next_revs = revision_ids
         first_loop_done = False
+        generations = 0
         while next_revs:
             queried_revs.update(next_revs)
             parent_map = repo_graph.get_parent_map(next_revs)
@@ -219,6 +459,8 @@ class SmartServerRepositoryGetParentMap(SmartServerRepositoryRequest):
                     encoded_id = revision_id
                 else:
                     missing_rev = True
+                    # A ghost may be filled in later.
+                    self._cacheable = False
                     encoded_id = b"missing:" + revision_id
                     parents = []
                 if (revision_id not in client_seen_revs
@@ -239,12 +481,16 @@ class SmartServerRepositoryGetParentMap(SmartServerRepositoryRequest):
                                 estimator._compressed_size_added))
                 next_revs = set()
                 break
+            generations += 1
+            if max_generations is not None and generations > max_generations:
+                break
             # don't query things we've already queried
             next_revs = next_revs.difference(queried_revs)
             first_loop_done = True
         return result
 
-    def _do_repository_request(self, body_bytes):
+    def _do_repository_request(self, body_bytes, max_size=65536,
+                               max_generations=None):
         repository = self._repository
         revision_ids = set(self._revision_ids)
         include_missing = b'include-missing:' in revision_ids
@@ -263,7 +509,8 @@ class SmartServerRepositoryGetParentMap(SmartServerRepositoryRequest):
 
         repo_graph = repository.get_graph()
         result = self._expand_requested_revs(repo_graph, revision_ids,
-                                             client_seen_revs, include_missing)
+                                             client_seen_revs, include_missing,
+                                             max_size, max_generations)
 
         # sorting trivially puts lexographically similar revision ids together.
         # Compression FTW.
@@ -275,6 +522,53 @@ class SmartServerRepositoryGetParentMap(SmartServerRepositoryRequest):
             (b'ok', ), bz2.compress(b'\n'.join(lines)))
 
 
+class SmartServerRepositoryGetParentMapGenerations(
+        SmartServerRepositoryGetParentMap):
+    """Get parent data for a number of generations of ancestry.
+
+    New in 3.2.
+    """
+
+    # The largest response a client may ask for, before compression
+    max_response_size = 4 * 1024 * 1024
+
+    def do_repository_request(self, repository, max_generations, max_size,
+                              *revision_ids):
+        """Get parent details for some revisions and their ancestry.
+
+        This is like Repository.get_parent_map, except that the client
+        chooses how far the search goes: additional parent data is returned
+        for at most max_generations generations beyond revision_ids, and
+        until about max_size bytes of compressed data have been gathered.
+        Revisions in the search described by the body are excluded.
+
+        :param max_generations: The number of generations of ancestry to
+            return, or 0 for no limit.
+        :param max_size: The approximate maximum (compressed) size of the
+            response, capped at max_response_size.
+        :param revision_ids: The revisions to answer for, optionally with
+            'include-missing:' as for Repository.get_parent_map.
+        """
+        try:
+            self._max_generations = int(max_generations)
+            self._max_size = int(max_size)
+        except ValueError:
+            raise errors.SmartProtocolError(
+                'invalid limits %r %r' % (max_generations, max_size))
+        self._revision_ids = revision_ids
+        return None  # Signal that we want a body.
+
+    def do_body(self, body_bytes):
+        repository = self._repository
+        with repository.lock_read():
+            return self.cached_response(
+                body_bytes, lambda: self._do_repository_request(
+                    body_bytes,
+                    max_size=max(1, min(self._max_size,
+                                        self.max_response_size)),
+                    max_generations=self._max_generations or None))
+
+
 class SmartServerRepositoryGetRevisionGraph(SmartServerRepositoryReadLocked):
 
     def do_readlocked_repository_request(self, repository, revision_id):
@@ -455,6 +749,10 @@ class SmartServerRepositoryGetRevisionSignatureText(
         :return: A smart server response of with the signature text as
             body.
         """
+        return self.cached_response(
+            b'', lambda: self._get_signature_text(repository, revision_id))
+
+    def _get_signature_text(self, repository, revision_id):
         try:
             text = repository.get_signature_text(revision_id)
         except errors.NoSuchRevision as err:
@@ -1178,6 +1476,7 @@ class SmartServerRepositoryIterFilesBytes(SmartServerRepositoryRequest):
                                                              'unordered', True):
                 identifier = text_keys[record.key]
                 if record.storage_kind == 'absent':
+                    self._cacheable = False
                     yield b"absent\0%s\0%s\0%d\n" % (record.key[0],
                                                      record.key[1], identifier)
                     # FIXME: Way to abort early?
@@ -1195,8 +1494,10 @@ class SmartServerRepositoryIterFilesBytes(SmartServerRepositoryRequest):
     def do_body(self, body_bytes):
         desired_files = [
             tuple(l.split(b"\0")) for l in body_bytes.splitlines()]
-        return SuccessfulSmartServerResponse((b'ok', ),
-                                             body_stream=self.body_stream(self._repository, desired_files))
+        return self.cached_response(
+            body_bytes, lambda: SuccessfulSmartServerResponse(
+                (b'ok', ),
+                body_stream=self.body_stream(self._repository, desired_files)))
 
     def do_repository_request(self, repository):
         # Signal that we want a body
@@ -1223,15 +1524,17 @@ class SmartServerRepositoryIterRevisions(SmartServerRepositoryRequest):
 
     def do_body(self, body_bytes):
         revision_ids = body_bytes.split(b"\n")
-        return SuccessfulSmartServerResponse(
-            (b'ok', self._repository.get_serializer_format()),
-            body_stream=self.body_stream(self._repository, revision_ids))
+        return self.cached_response(
+            body_bytes, lambda: SuccessfulSmartServerResponse(
+                (b'ok', self._repository.get_serializer_format()),
+                body_stream=self.body_stream(self._repository, revision_ids)))
 
     def body_stream(self, repository, revision_ids):
         with self._repository.lock_read():
             for record in repository.revisions.get_record_stream(
                     [(revid,) for revid in revision_ids], 'unordered', True):
                 if record.storage_kind == 'absent':
+                    self._cacheable = False
                     continue
                 yield zlib.compress(record.get_bytes_as('fulltext'))
 
@@ -1259,6 +1562,7 @@ class SmartServerRepositoryGetInventories(SmartServerRepositoryRequest):
         with repository.lock_read():
             for inv, revid in repository._iter_inventories(revids, ordering):
                 if inv is None:
+                    self._cacheable = False
                     continue
                 inv_delta = inv._make_delta(prev_inv)
                 lines = serializer.delta_to_lines(
@@ -1275,9 +1579,11 @@ class SmartServerRepositoryGetInventories(SmartServerRepositoryRequest):
                                       repository._format)
 
     def do_body(self, body_bytes):
-        return SuccessfulSmartServerResponse((b'ok', ),
-                                             body_stream=self.body_stream(self._repository, self._ordering,
-                                                                          body_bytes.splitlines()))
+        return self.cached_response(
+            body_bytes, lambda: SuccessfulSmartServerResponse(
+                (b'ok', ),
+                body_stream=self.body_stream(self._repository, self._ordering,
+                                             body_bytes.splitlines())))
 
     def do_repository_request(self, repository, ordering):
         ordering = ordering.decode('ascii')
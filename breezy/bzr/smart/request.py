@@ -712,6 +712,9 @@ request_handlers.register_lazy(
 request_handlers.register_lazy(
     b'Repository.get_parent_map', 'breezy.bzr.smart.repository',
     'SmartServerRepositoryGetParentMap', info='read')
+request_handlers.register_lazy(
+    b'Repository.get_parent_map_generations', 'breezy.bzr.smart.repository',
+    'SmartServerRepositoryGetParentMapGenerations', info='read')
 request_handlers.register_lazy(
     b'Repository.get_revision_graph', 'breezy.bzr.smart.repository',
     'SmartServerRepositoryGetRevisionGraph', info='read')
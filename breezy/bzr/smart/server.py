@@ -16,8 +16,11 @@
 
 """Server for smart-server protocol."""
 
+import collections
+import concurrent.futures
 import errno
 import os.path
+import selectors
 import socket
 import sys
 import time
@@ -26,6 +29,7 @@ import threading
 from ...hooks import Hooks
 from ... import (
     errors,
+    osutils,
     trace,
     transport as _mod_transport,
 )
@@ -34,6 +38,7 @@ from ...lazy_import import lazy_import
 lazy_import(globals(), """
 from breezy.bzr.smart import (
     medium,
+    repository as smart_repo,
     signals,
     )
 from breezy.transport import (
@@ -62,6 +67,8 @@ class SmartTCPServer(object):
     _ACCEPT_TIMEOUT = 1.0
     _SHUTDOWN_POLL_TIMEOUT = 1.0
     _LOG_WAITING_TIMEOUT = 10.0
+    # The number of connections that may be waiting to be accepted.
+    _LISTEN_BACKLOG = 1
 
     _timer = time.time
 
@@ -115,7 +122,7 @@ class SmartTCPServer(object):
             raise errors.CannotBindAddress(host, port, message)
         self._sockname = self._server_socket.getsockname()
         self.port = self._sockname[1]
-        self._server_socket.listen(1)
+        self._server_socket.listen(self._LISTEN_BACKLOG)
         self._server_socket.settimeout(self._ACCEPT_TIMEOUT)
         # Once we start accept()ing connections, we set started.
         self._started = threading.Event()
@@ -202,27 +209,7 @@ class SmartTCPServer(object):
         self._started.set()
         try:
             try:
-                while not self._should_terminate:
-                    try:
-                        conn, client_addr = self._server_socket.accept()
-                    except self._socket_timeout:
-                        # just check if we're asked to stop
-                        pass
-                    except self._socket_error as e:
-                        # if the socket is closed by stop_background_thread
-                        # we might get a EBADF here, or if we get a signal we
-                        # can get EINTR, any other socket errors should get
-                        # logged.
-                        if e.args[0] not in (errno.EBADF, errno.EINTR):
-                            trace.warning(gettext("listening socket error: %s")
-                                          % (e,))
-                    else:
-                        if self._should_terminate:
-                            conn.close()
-                            break
-                        self.serve_conn(conn, thread_name_suffix)
-                    # Cleanout any threads that have finished processing.
-                    self._poll_active_connections()
+                self._serve_connections(thread_name_suffix)
             except KeyboardInterrupt:
                 # dont log when CTRL-C'd.
                 raise
@@ -243,6 +230,30 @@ class SmartTCPServer(object):
             self._wait_for_clients_to_disconnect()
         self._fully_stopped.set()
 
+    def _serve_connections(self, thread_name_suffix):
+        """Accept and serve connections until asked to terminate."""
+        while not self._should_terminate:
+            try:
+                conn, client_addr = self._server_socket.accept()
+            except self._socket_timeout:
+                # just check if we're asked to stop
+                pass
+            except self._socket_error as e:
+                # if the socket is closed by stop_background_thread
+                # we might get a EBADF here, or if we get a signal we
+                # can get EINTR, any other socket errors should get
+                # logged.
+                if e.args[0] not in (errno.EBADF, errno.EINTR):
+                    trace.warning(gettext("listening socket error: %s")
+                                  % (e,))
+            else:
+                if self._should_terminate:
+                    conn.close()
+                    break
+                self.serve_conn(conn, thread_name_suffix)
+            # Cleanout any threads that have finished processing.
+            self._poll_active_connections()
+
     def get_url(self):
         """Return the url of the server"""
         return "bzr://%s:%s/" % (self._sockname[0], self._sockname[1])
@@ -319,6 +330,423 @@ class SmartTCPServer(object):
         self._server_thread.join()
 
 
+class SmartServerMetrics(object):
+    """Statistics about the load on a SmartSelectorTCPServer.
+
+    :ivar connections: The number of open client connections.
+    :ivar queue_depth: The number of connections with received bytes that
+        are waiting for a worker.
+    :ivar max_queue_depth: The largest queue_depth seen.
+    :ivar active_workers: The number of workers serving a connection.
+    :ivar requests: The number of requests served.
+    :ivar total_latency: The total time in seconds taken by those requests,
+        from the first bytes of the request being received to the response
+        having been sent.
+    :ivar max_latency: The longest time taken by a single request.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.connections = 0
+        self.queue_depth = 0
+        self.max_queue_depth = 0
+        self.active_workers = 0
+        self.requests = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+
+    def _connection_opened(self):
+        with self._lock:
+            self.connections += 1
+
+    def _connection_closed(self):
+        with self._lock:
+            self.connections -= 1
+
+    def _queued(self):
+        with self._lock:
+            self.queue_depth += 1
+            self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+
+    def _worker_started(self):
+        with self._lock:
+            self.queue_depth -= 1
+            self.active_workers += 1
+
+    def _worker_stopped(self):
+        with self._lock:
+            self.active_workers -= 1
+
+    def _request_served(self, latency):
+        with self._lock:
+            self.requests += 1
+            self.total_latency += latency
+            self.max_latency = max(self.max_latency, latency)
+
+    def as_dict(self):
+        """Return a consistent snapshot of the metrics.
+
+        :return: A dict with the instance variables documented above, and
+            'mean_latency'.
+        """
+        with self._lock:
+            if self.requests:
+                mean_latency = self.total_latency / self.requests
+            else:
+                mean_latency = 0.0
+            return {
+                'connections': self.connections,
+                'queue_depth': self.queue_depth,
+                'max_queue_depth': self.max_queue_depth,
+                'active_workers': self.active_workers,
+                'requests': self.requests,
+                'total_latency': self.total_latency,
+                'mean_latency': mean_latency,
+                'max_latency': self.max_latency,
+                }
+
+
+class _SelectorConnection(object):
+    """A client connection of a SmartSelectorTCPServer.
+
+    Bytes are received by the thread running the server's selector loop, and
+    decoded and served by one worker at a time. The attributes shared by
+    those threads are protected by lock.
+    """
+
+    def __init__(self, server, sock):
+        self.server = server
+        self.socket = sock
+        try:
+            self.client_info = sock.getpeername()
+        except socket.error:
+            self.client_info = '<unknown>'
+        self.lock = threading.Lock()
+        # Bytes received that have not been given to a worker yet.
+        self.in_buffer = []
+        self.in_buffer_len = 0
+        # When the first of those bytes was received.
+        self.received_at = None
+        self.last_activity = server._timer()
+        # Is a worker serving (or queued to serve) this connection?
+        self.busy = False
+        # Is the socket registered with the server's selector?
+        self.reading = True
+        # Has the client hung up?
+        self.eof = False
+        # Should the connection be closed once it is no longer busy?
+        self.finished = False
+        # Should the connection be closed after the current request?
+        self.stopping = False
+        # Only used by the worker serving the connection.
+        self._protocol = None
+        self._line = b''
+        self._request_started = None
+
+    def __repr__(self):
+        return '%s(client=%s)' % (self.__class__.__name__, self.client_info)
+
+    def _write_out(self, bytes):
+        try:
+            osutils.send_all(self.socket, bytes)
+        except socket.timeout:
+            raise errors.ConnectionTimeout(
+                'client not reading for %.1f seconds'
+                % (self.server._SEND_TIMEOUT,))
+
+    def serve_received_bytes(self):
+        """Decode the bytes received so far and serve their requests.
+
+        This runs in a worker thread.
+        """
+        metrics = self.server.metrics
+        metrics._worker_started()
+        try:
+            while True:
+                with self.lock:
+                    if not self.in_buffer or self.finished:
+                        self.busy = False
+                        break
+                    data = b''.join(self.in_buffer)
+                    received_at = self.received_at
+                    self.in_buffer = []
+                    self.in_buffer_len = 0
+                self._accept_bytes(data, received_at)
+        except Exception:
+            # Like SmartServerStreamMedium, give up on the connection.
+            trace.log_exception_quietly()
+            with self.lock:
+                self.finished = True
+                self.busy = False
+        finally:
+            metrics._worker_stopped()
+            self.server._wake_up(self)
+
+    def _accept_bytes(self, data, received_at):
+        while data:
+            if self._protocol is None:
+                if self._request_started is None:
+                    self._request_started = received_at
+                # The protocol version is identified by the first line.
+                data = self._line + data
+                if b'\n' not in data:
+                    self._line = data
+                    return
+                self._line = b''
+                protocol_factory, data = medium._get_protocol_factory_for_bytes(
+                    data)
+                self._protocol = protocol_factory(
+                    self.server.backing_transport, self._write_out,
+                    self.server.root_client_path)
+            self._protocol.accept_bytes(data)
+            if self._protocol.next_read_size():
+                return
+            data = self._protocol.unused_data
+            self._protocol = None
+            self.server.metrics._request_served(
+                self.server._timer() - self._request_started)
+            self._request_started = None
+            with self.lock:
+                if self.stopping:
+                    self.finished = True
+                    return
+
+
+class SmartSelectorTCPServer(SmartTCPServer):
+    """A SmartTCPServer that serves connections with a pool of workers.
+
+    Rather than running a thread per connection, a single thread waits for
+    bytes from all the clients with a selector. Connections that have
+    received bytes are queued for a fixed size pool of worker threads, which
+    decode and serve the requests. Requests from a single connection are
+    served one at a time and in order.
+
+    A connection stops being read from while more than _MAX_CLIENT_BUFFER
+    received bytes are waiting for a worker, so clients streaming large
+    bodies can not make the server buffer them. Responses are written by the
+    workers, and connections are dropped when a client stops accepting them
+    for _SEND_TIMEOUT seconds.
+
+    metrics: A SmartServerMetrics instance.
+    """
+
+    _DEFAULT_WORKERS = 8
+    _LISTEN_BACKLOG = socket.SOMAXCONN
+    _MAX_CLIENT_BUFFER = 16 * osutils.MAX_SOCKET_CHUNK
+    # How long a worker waits for a client to accept more of a response.
+    _SEND_TIMEOUT = 60.0
+
+    def __init__(self, backing_transport, root_client_path='/',
+                 client_timeout=None, workers=None):
+        """Construct a new server.
+
+        :param workers: The number of threads serving requests.
+        See SmartTCPServer.__init__ for the other parameters.
+        """
+        super(SmartSelectorTCPServer, self).__init__(
+            backing_transport, root_client_path=root_client_path,
+            client_timeout=client_timeout)
+        if workers is None:
+            workers = self._DEFAULT_WORKERS
+        self._workers = workers
+        self._executor = None
+        self.metrics = SmartServerMetrics()
+        self._selector = selectors.DefaultSelector()
+        # Workers wake up the selector loop by writing to _wakeup_sender, so
+        # it can resume reading from or close their connections.
+        self._wakeup_receiver, self._wakeup_sender = socket.socketpair()
+        self._wakeup_receiver.setblocking(False)
+        self._wakeup_sender.setblocking(False)
+        self._selector.register(self._wakeup_receiver, selectors.EVENT_READ,
+                                self._drain_wakeups)
+        self._woken_connections = collections.deque()
+        # Set by _stop_gracefully until the connections have been told.
+        self._stop_requested = False
+
+    def serve(self, thread_name_suffix=''):
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            self._workers,
+            thread_name_prefix='smart-server-worker' + thread_name_suffix)
+        try:
+            super(SmartSelectorTCPServer, self).serve(thread_name_suffix)
+        finally:
+            for conn in list(self._active_connections):
+                self._close_connection(conn)
+            # Workers still writing to a connection fail now it is closed.
+            self._executor.shutdown(wait=True)
+            self._selector.close()
+            self._wakeup_receiver.close()
+            self._wakeup_sender.close()
+            trace.mutter('smart server metrics: %r', self.metrics.as_dict())
+
+    def _serve_connections(self, thread_name_suffix):
+        self._selector.register(self._server_socket, selectors.EVENT_READ,
+                                self._accept_connection)
+        try:
+            while not self._should_terminate:
+                self._poll_active_connections(self._ACCEPT_TIMEOUT)
+        finally:
+            self._selector.unregister(self._server_socket)
+
+    def _accept_connection(self):
+        try:
+            conn, client_addr = self._server_socket.accept()
+        except self._socket_timeout:
+            return
+        except self._socket_error as e:
+            if e.args[0] not in (errno.EBADF, errno.EINTR, errno.EAGAIN):
+                trace.warning(gettext("listening socket error: %s") % (e,))
+            return
+        if self._should_terminate:
+            conn.close()
+            return
+        self.serve_conn(conn)
+
+    def serve_conn(self, conn, thread_name_suffix=''):
+        # Only writes ever wait for the socket, as it is read from once the
+        # selector says it is readable. The timeout stops clients that do not
+        # read their responses from holding on to workers.
+        conn.settimeout(self._SEND_TIMEOUT)
+        conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        connection = _SelectorConnection(self, conn)
+        self._selector.register(conn, selectors.EVENT_READ, connection)
+        self._active_connections.append(connection)
+        self.metrics._connection_opened()
+        return connection
+
+    def _stop_gracefully(self):
+        # This is run as a signal handler by the thread running the selector
+        # loop, which may be holding a connection lock, so the connections
+        # are told to stop by _poll_active_connections instead.
+        self._should_terminate = True
+        self._gracefully_stopping = True
+        self._stop_requested = True
+        try:
+            self._wakeup_sender.send(b'\0')
+        except socket.error:
+            pass
+
+    def _stop_connections(self):
+        trace.note(gettext('Requested to stop gracefully'))
+        for conn in list(self._active_connections):
+            with conn.lock:
+                conn.stopping = True
+                if not conn.busy and conn._protocol is None:
+                    conn.finished = True
+            self._update_connection(conn)
+
+    def _poll_active_connections(self, timeout=0.0):
+        """Serve events on the active connections.
+
+        Bytes received from clients are queued for the workers, new
+        connections are accepted while the server socket is open, and
+        connections that have finished are closed.
+
+        :param timeout: How long to wait for an event, in seconds.
+        """
+        for key, mask in self._selector.select(timeout):
+            if isinstance(key.data, _SelectorConnection):
+                self._read_from(key.data)
+            else:
+                key.data()
+        if self._stop_requested:
+            self._stop_requested = False
+            self._stop_connections()
+        while self._woken_connections:
+            conn = self._woken_connections.popleft()
+            if conn in self._active_connections:
+                self._update_connection(conn)
+        self._disconnect_idle_clients()
+
+    def _read_from(self, conn):
+        try:
+            data = conn.socket.recv(osutils.MAX_SOCKET_CHUNK)
+        except socket.error as e:
+            if e.args[0] in (errno.EINTR, errno.EAGAIN):
+                return
+            data = b''
+        now = self._timer()
+        with conn.lock:
+            conn.last_activity = now
+            if not data:
+                conn.eof = True
+            else:
+                if not conn.in_buffer:
+                    conn.received_at = now
+                conn.in_buffer.append(data)
+                conn.in_buffer_len += len(data)
+            submit = bool(data) and not conn.busy and not conn.finished
+            if submit:
+                conn.busy = True
+        if submit:
+            self.metrics._queued()
+            self._executor.submit(conn.serve_received_bytes)
+        self._update_connection(conn)
+
+    def _update_connection(self, conn):
+        """Close conn or change whether it is read from, as appropriate."""
+        with conn.lock:
+            close = (conn.eof or conn.finished) and not conn.busy
+            want_read = (not conn.eof and not conn.finished and
+                         conn.in_buffer_len < self._MAX_CLIENT_BUFFER)
+        if close:
+            self._close_connection(conn)
+        elif want_read != conn.reading:
+            if want_read:
+                self._selector.register(
+                    conn.socket, selectors.EVENT_READ, conn)
+            else:
+                self._selector.unregister(conn.socket)
+            conn.reading = want_read
+
+    def _disconnect_idle_clients(self):
+        if self._client_timeout is None:
+            return
+        now = self._timer()
+        for conn in list(self._active_connections):
+            with conn.lock:
+                idle = (not conn.busy and conn._protocol is None and
+                        not conn._line and
+                        now - conn.last_activity > self._client_timeout)
+                if idle:
+                    conn.finished = True
+            if idle:
+                trace.note('%s' % errors.ConnectionTimeout(
+                    'disconnecting client after %.1f seconds'
+                    % (self._client_timeout,)))
+                self._close_connection(conn)
+
+    def _close_connection(self, conn):
+        if conn.reading:
+            self._selector.unregister(conn.socket)
+            conn.reading = False
+        try:
+            conn.socket.close()
+        except socket.error:
+            pass
+        self._active_connections.remove(conn)
+        self.metrics._connection_closed()
+
+    def _drain_wakeups(self):
+        try:
+            self._wakeup_receiver.recv(4096)
+        except socket.error:
+            pass
+
+    def _wake_up(self, conn):
+        """Ask the selector loop to look at conn again.
+
+        This may be called from any thread.
+        """
+        self._woken_connections.append(conn)
+        try:
+            self._wakeup_sender.send(b'\0')
+        except socket.error:
+            # The loop will be woken by the bytes already sent, or it has
+            # stopped.
+            pass
+
+
 class SmartServerHooks(Hooks):
     """Hooks for the smart server."""
 
@@ -448,13 +876,34 @@ class BzrServerFactory(object):
                 host = medium.BZR_DEFAULT_INTERFACE
             if port is None:
                 port = medium.BZR_DEFAULT_PORT
-            smart_server = SmartTCPServer(self.transport,
-                                          client_timeout=timeout)
+            workers = config.GlobalStack().get('serve.workers')
+            if workers:
+                smart_server = SmartSelectorTCPServer(
+                    self.transport, client_timeout=timeout, workers=workers)
+            else:
+                smart_server = SmartTCPServer(self.transport,
+                                              client_timeout=timeout)
             smart_server.start_server(host, port)
             trace.note(gettext('listening on port: %s'),
                        str(smart_server.port))
         self.smart_server = smart_server
 
+    def _make_response_cache(self):
+        c = config.GlobalStack()
+        size = c.get('serve.response_cache_size')
+        if not size:
+            return
+        cache = smart_repo.ResponseCache(
+            size, disk_dir=c.get('serve.response_cache_dir'),
+            max_disk_size=c.get('serve.response_cache_dir_size'))
+        old_cache = smart_repo.set_response_cache(cache)
+
+        def restore_response_cache():
+            smart_repo.set_response_cache(old_cache)
+            trace.mutter('response cache: %r', cache.stats())
+            cache.close()
+        self.cleanups.append(restore_response_cache)
+
     def _change_globals(self):
         from breezy import lockdir, ui
         # For the duration of this server, no UI output is permitted. note
@@ -479,6 +928,7 @@ class BzrServerFactory(object):
     def set_up(self, transport, host, port, inet, timeout):
         self._make_backing_transport(transport)
         self._make_smart_server(host, port, inet, timeout)
+        self._make_response_cache()
         self._change_globals()
 
     def tear_down(self):
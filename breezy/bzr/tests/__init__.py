@@ -58,11 +58,14 @@ def load_tests(loader, basic_tests, pattern):
         'test__chk_map',
         'test__dirstate_helpers',
         'test__groupcompress',
+        'test_annotation_cache',
+        'test_bloom',
         'test_btree_index',
         'test_bundle',
         'test_bzrdir',
         'test_chk_map',
         'test_chk_serializer',
+        'test_commit_graph',
         'test_conflicts',
         'test_generate_ids',
         'test_groupcompress',
@@ -74,6 +77,8 @@ def load_tests(loader, basic_tests, pattern):
         'test_pack',
         'test_read_bundle',
         'test_remote',
+        'test_revision_bitmap',
+        'test_revno_cache',
         'test_repository',
         'test_smart',
         'test_smart_request',
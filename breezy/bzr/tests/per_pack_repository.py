@@ -218,7 +218,7 @@ class TestPackRepository(TestCaseWithTransport):
             [tree.branch.last_revision()])
         nb_files = 5  # .pack, .rix, .iix, .tix, .six
         if tree.branch.repository._format.supports_chks:
-            nb_files += 1  # .cix
+            nb_files += 2  # .cix, .bix
         # We should have 10 x nb_files files in the obsolete_packs directory.
         obsolete_files = list(trans.list_dir('obsolete_packs'))
         self.assertFalse('foo' in obsolete_files)
@@ -983,7 +983,7 @@ class TestPackRepositoryStacking(TestCaseWithTransport):
             [tree.branch.last_revision()])
         nb_files = 5  # .pack, .rix, .iix, .tix, .six
         if tree.branch.repository._format.supports_chks:
-            nb_files += 1  # .cix
+            nb_files += 2  # .cix, .bix
         # We should have 10 x nb_files files in the obsolete_packs directory.
         obsolete_files = list(trans.list_dir('obsolete_packs'))
         self.assertFalse('foo' in obsolete_files)
@@ -19,6 +19,7 @@
 from breezy import (
     errors,
     gpg,
+    osutils,
     repository as _mod_repository,
     revision as _mod_revision,
     tests,
@@ -213,6 +214,58 @@ class TestRepository(TestCaseWithRepository):
             self.assertEqual(rev_id, inv.revision_id)
             self.assertIsInstance(inv, inventory.CommonInventory)
 
+    def test_record_iter_changes_streams_changes(self):
+        # Texts are recorded a batch of changes at a time, rather than after
+        # all the changes have been collected.
+        self.overrideAttr(vf_repository, '_RECORD_CHANGES_BATCH', 2)
+        tree = self.make_branch_and_tree('tree')
+        self.build_tree(['tree/a', 'tree/b'])
+        tree.add(['a', 'b'])
+        tree.lock_write()
+        self.addCleanup(tree.unlock)
+        consumed = []
+
+        def iter_changes():
+            for change in tree.iter_changes(tree.basis_tree()):
+                consumed.append(change.path[1])
+                yield change
+        builder = tree.branch.get_commit_builder([])
+        try:
+            recorded = builder.record_iter_changes(
+                tree, tree.last_revision(), iter_changes())
+            path, fs_hash = next(recorded)
+            self.assertEqual('a', path)
+            self.assertEqual(['', 'a'], consumed)
+            self.assertEqual(['b'], [p for p, h in recorded])
+            self.assertEqual(['', 'a', 'b'], consumed)
+        finally:
+            builder.abort()
+
+    def test_commit_with_text_threads(self):
+        tree = self.make_branch_and_tree('tree')
+        tree.branch.get_config_stack().set('commit.text_threads', 2)
+        self.build_tree(['tree/dir/', 'tree/a', 'tree/b', 'tree/c'])
+        tree.add(['dir', 'a', 'b', 'c'], [b'dir-id', b'a-id', b'b-id', b'c-id'])
+        rev1 = tree.commit('one')
+        self.build_tree_contents([('tree/b', b'new content\n')])
+        rev2 = tree.commit('two')
+        repo = tree.branch.repository
+        repo.lock_read()
+        self.addCleanup(repo.unlock)
+        rev_tree = repo.revision_tree(rev2)
+        self.assertEqual(b'new content\n', rev_tree.get_file_text('b'))
+        self.assertEqual(b'contents of tree/a\n', rev_tree.get_file_text('a'))
+        self.assertEqual(rev1, rev_tree.get_file_revision('a'))
+        self.assertEqual(rev2, rev_tree.get_file_revision('b'))
+        self.assertEqual(osutils.sha_string(b'new content\n'),
+                         rev_tree.get_file_sha1('b'))
+        self.assertEqual(12, rev_tree.get_file_size('b'))
+        self.assertEqual(
+            set([(b'dir-id', rev1), (b'a-id', rev1), (b'b-id', rev1),
+                 (b'c-id', rev1), (b'b-id', rev2)]),
+            set(k for k in repo.texts.keys() if k[0] != tree.path2id('')))
+        repo.check([rev1, rev2])
+
     def test_item_keys_introduced_by(self):
         # Make a repo with one revision and one versioned file.
         tree = self.make_branch_and_tree('t')
@@ -21,6 +21,7 @@ import os
 import time
 
 from ... import (
+    config,
     osutils,
     tests,
     )
@@ -62,6 +63,14 @@ if compiled_dirstate_helpers_feature.available():
     process_entry = compiled_dirstate_helpers_feature.module.ProcessEntryC
     pe_scenarios.append(('dirstate_Pyrex', {'_process_entry': process_entry}))
 
+prefetch_scenarios = [('dirstate_Python',
+                       {'_process_entry': dirstate.ProcessEntryPython,
+                        'update_entry': dirstate.py_update_entry})]
+if compiled_dirstate_helpers_feature.available():
+    prefetch_scenarios.append(('dirstate_Pyrex',
+                               {'_process_entry': process_entry,
+                                'update_entry': update_entry}))
+
 helper_scenarios = [('dirstate_Python', {'helpers': _dirstate_helpers_py})]
 if compiled_dirstate_helpers_feature.available():
     helper_scenarios.append(('dirstate_Pyrex',
@@ -1342,6 +1351,125 @@ class TestProcessEntry(test_dirstate.TestCaseWithDirState):
         self.assertChangedFileIds([b'file-id'], tree)
 
 
+class TestProcessEntryPrefetching(test_dirstate.TestCaseWithDirState):
+
+    scenarios = multiply_scenarios(dir_reader_scenarios(), prefetch_scenarios)
+
+    # Set by load_tests
+    _process_entry = None
+    update_entry = None
+
+    def setUp(self):
+        super(TestProcessEntryPrefetching, self).setUp()
+        self.overrideAttr(dirstate, '_process_entry', self._process_entry)
+        self.overrideAttr(dirstate, 'update_entry', self.update_entry)
+        self.prefetched = []
+        orig = dirstate._SHA1Prefetcher.stat_and_sha1
+
+        def stat_and_sha1(prefetcher, key, packed_stat):
+            result = orig(prefetcher, key, packed_stat)
+            if result is not None:
+                self.prefetched.append(key[1])
+            return result
+        self.overrideAttr(dirstate._SHA1Prefetcher, 'stat_and_sha1',
+                          stat_and_sha1)
+        orig_start = dirstate._SHA1Prefetcher.start
+
+        def start(prefetcher):
+            # Let all the files be queued before they are compared, so that
+            # none are hashed by iter_changes itself.
+            orig_start(prefetcher)
+            prefetcher._thread.join()
+        self.overrideAttr(dirstate._SHA1Prefetcher, 'start', start)
+        self.tree = self.make_branch_and_tree('tree')
+        self.build_tree(['tree/dir/'] + ['tree/dir/f%d' % i
+                                         for i in range(20)])
+        self.tree.add(['dir'] + ['dir/f%d' % i for i in range(20)])
+        self.tree.commit('one')
+
+    def changed_paths(self):
+        with self.tree.lock_read():
+            return sorted(c.path[1] for c in
+                          self.tree.iter_changes(self.tree.basis_tree()))
+
+    def test_prefetched(self):
+        self.build_tree_contents(
+            [('tree/dir/f%d' % i, b'new content') for i in range(0, 20, 2)])
+        serial = self.changed_paths()
+        self.assertEqual([], self.prefetched)
+        config.GlobalStack().set('dirstate.sha1_threads', 4)
+        self.assertEqual(serial, self.changed_paths())
+        # The files are too new for their hashes to have been cached, so
+        # they are all hashed again.
+        self.assertEqual(
+            sorted(b'f%d' % i for i in range(20)), sorted(self.prefetched))
+
+    def test_cached_hash_not_recomputed(self):
+        self.tree.lock_read()
+        self.addCleanup(self.tree.unlock)
+        state = self.tree.current_dirstate()
+        prefetcher = dirstate._SHA1Prefetcher(
+            state, self.tree, 1, {b''}, 1,
+            dirstate.DefaultSHA1Provider().stat_and_sha1)
+        stat_value = os.lstat('tree/dir/f1')
+        packed_stat = dirstate.pack_stat(stat_value)
+        self.assertIs(None, prefetcher._hash(
+            b'dir/f1', (b'f', b'', stat_value.st_size, False, packed_stat)))
+        self.assertEqual(
+            (packed_stat, osutils.sha_file_by_name('tree/dir/f1')),
+            prefetcher._hash(
+                b'dir/f1',
+                (b'f', b'', stat_value.st_size, False,
+                 dirstate.DirState.NULLSTAT))[::2])
+
+    def test_sha1_provider_used(self):
+        config.GlobalStack().set('dirstate.sha1_threads', 2)
+        self.tree.lock_write()
+        self.addCleanup(self.tree.unlock)
+        state = self.tree._current_dirstate()
+        state._sha1_provider = UppercaseSHA1Provider()
+        self.assertEqual(
+            sorted('dir/f%d' % i for i in range(20)),
+            sorted(c.path[1] for c in
+                   self.tree.iter_changes(self.tree.basis_tree())
+                   if c.path[1] != 'dir'))
+        # Other providers need not be thread safe
+        self.assertEqual([], self.prefetched)
+
+    def test_not_prefetched_with_content_filters(self):
+        self.build_tree_contents(
+            [('tree/dir/f%d' % i, b'new content') for i in range(0, 20, 2)])
+        serial = self.changed_paths()
+        config.GlobalStack().set('dirstate.sha1_threads', 4)
+        # Content filters and their rules are only used on the main thread
+        self.overrideAttr(self.tree, '_content_filter_fingerprint',
+                          lambda: b'fingerprint')
+        self.assertEqual(serial, self.changed_paths())
+        self.assertEqual([], self.prefetched)
+
+    def test_modified_after_prefetch(self):
+        self.build_tree_contents([('tree/dir/f1', b'new content')])
+        self.tree.lock_read()
+        self.addCleanup(self.tree.unlock)
+        state = self.tree.current_dirstate()
+        state._read_dirblocks_if_needed()
+        entry = state._get_entry(0, path_utf8=b'dir/f1')
+        prefetcher = dirstate._SHA1Prefetcher(
+            state, self.tree, 1, {b''}, 1,
+            dirstate.DefaultSHA1Provider().stat_and_sha1)
+        prefetcher.start()
+        self.addCleanup(prefetcher.stop)
+        stat_value = os.lstat('tree/dir/f1')
+        # Wait for the prefetcher to get to the entry.
+        while entry[0] not in prefetcher._pending:
+            time.sleep(0.01)
+        self.assertIs(None, prefetcher.stat_and_sha1(
+            entry[0], b'x' * len(dirstate.pack_stat(stat_value))))
+        # Taken entries are not hashed again.
+        self.assertIs(None, prefetcher.sha1(
+            entry[0], dirstate.pack_stat(stat_value)))
+
+
 class TestPackStat(tests.TestCase):
     """Check packed representaton of stat values is robust on all inputs"""
 
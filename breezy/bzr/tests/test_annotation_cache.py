@@ -0,0 +1,158 @@
+# Copyright (C) 2020 Breezy Developers
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA
+
+"""Tests for breezy/bzr/annotation_cache.py"""
+
+import os
+
+from ... import (
+    config,
+    tests,
+    )
+from .. import (
+    annotation_cache,
+    )
+
+
+fa_key = (b'f-id', b'a-id')
+fb_key = (b'f-id', b'b-id')
+fc_key = (b'f-id', b'c-id')
+
+
+class TestSerializeAnnotations(tests.TestCase):
+
+    def test_roundtrip(self):
+        annotations = [(fa_key,), (fa_key,), (fb_key, fc_key), (fa_key,),
+                       (fc_key,)]
+        self.assertEqual(annotations, annotation_cache.deserialize_annotations(
+            annotation_cache.serialize_annotations(annotations)))
+
+    def test_empty(self):
+        self.assertEqual([], annotation_cache.deserialize_annotations(
+            annotation_cache.serialize_annotations([])))
+
+    def test_shares_tuples(self):
+        annotations = annotation_cache.deserialize_annotations(
+            annotation_cache.serialize_annotations(
+                [(fa_key,), (fb_key,), (fa_key,)]))
+        self.assertIs(annotations[0], annotations[2])
+
+    def test_runs_are_compact(self):
+        data = annotation_cache.serialize_annotations(
+            [(fa_key,)] * 5000 + [(fb_key,)] * 5000)
+        self.assertTrue(len(data) < 100)
+
+
+class TestAnnotationCache(tests.TestCaseInTempDir):
+
+    def test_add_and_get(self):
+        cache = annotation_cache.AnnotationCache('annotations.db')
+        self.assertEqual({}, cache.get_annotations([fa_key]))
+        cache.add_annotations(fa_key, [(fa_key,), (fa_key,)])
+        cache.add_annotations(fb_key, [(fa_key,), (fb_key,)])
+        # Stored on disk
+        cache = annotation_cache.AnnotationCache('annotations.db')
+        self.assertEqual(
+            {fa_key: [(fa_key,), (fa_key,)], fb_key: [(fa_key,), (fb_key,)]},
+            cache.get_annotations([fa_key, fb_key, fc_key]))
+
+    def test_ignores_bad_data(self):
+        cache = annotation_cache.AnnotationCache('annotations.db')
+        cache.add_annotations(fa_key, [(fa_key,)])
+        cache._get_db().execute(
+            'UPDATE annotations SET data = ?', (b'not zlib',))
+        self.assertEqual({}, cache.get_annotations([fa_key]))
+
+    def test_unusable_file(self):
+        os.mkdir('annotations.db')
+        cache = annotation_cache.AnnotationCache('annotations.db')
+        cache.add_annotations(fa_key, [(fa_key,)])
+        self.assertEqual({}, cache.get_annotations([fa_key]))
+
+    def test_evicts_least_recently_used(self):
+        size = len(annotation_cache.serialize_annotations([(fa_key,)]))
+        cache = annotation_cache.AnnotationCache(
+            'annotations.db', max_size=3 * size)
+        cache.add_annotations(fa_key, [(fa_key,)])
+        cache.add_annotations(fb_key, [(fb_key,)])
+        cache.add_annotations(fc_key, [(fc_key,)])
+        db = cache._get_db()
+        for used, key in enumerate([fa_key, fb_key, fc_key]):
+            db.execute('UPDATE annotations SET used = ? WHERE key = ?',
+                       (used, b'\0'.join(key)))
+        # Using fa_key makes fb_key and then fc_key the least recently used
+        self.assertEqual({fa_key: [(fa_key,)]},
+                         cache.get_annotations([fa_key]))
+        fd_key = (b'f-id', b'd-id')
+        # Going over the limit evicts down to three quarters of it
+        cache.add_annotations(fd_key, [(fd_key,)])
+        self.assertEqual(
+            [fa_key, fd_key],
+            sorted(cache.get_annotations([fa_key, fb_key, fc_key, fd_key])))
+        self.assertEqual(2 * size, cache._size)
+
+    def test_close(self):
+        cache = annotation_cache.AnnotationCache('annotations.db')
+        cache.add_annotations(fa_key, [(fa_key,)])
+        cache.close()
+        self.assertIs(None, cache._db)
+        # It is opened again when used
+        self.assertEqual({fa_key: [(fa_key,)]}, cache.get_annotations([fa_key]))
+
+    def test_unbounded(self):
+        cache = annotation_cache.AnnotationCache('annotations.db')
+        for rev in range(10):
+            cache.add_annotations((b'f-id', b'%d' % rev), [(fa_key,)])
+        self.assertEqual(
+            10, len(cache.get_annotations(
+                [(b'f-id', b'%d' % rev) for rev in range(10)])))
+
+    def test_get_annotation_cache(self):
+        cache = annotation_cache.get_annotation_cache()
+        self.assertIsInstance(cache, annotation_cache.AnnotationCache)
+        self.assertEqual(50000000, cache._max_size)
+        # The database is only opened once by each process
+        self.assertIs(cache, annotation_cache.get_annotation_cache())
+        config.GlobalStack().set('annotate.cache_size', '0')
+        self.assertIs(None, annotation_cache.get_annotation_cache()._max_size)
+        config.GlobalStack().set('annotate.cache', False)
+        self.assertIs(None, annotation_cache.get_annotation_cache())
+
+
+class TestTreeAnnotations(tests.TestCaseWithTransport):
+
+    def test_annotate_iter_uses_cache(self):
+        tree = self.make_branch_and_tree('.')
+        self.build_tree_contents([('a', b'first\n')])
+        tree.add(['a'], [b'a-id'])
+        tree.commit('one', rev_id=b'rev-1')
+        self.build_tree_contents([('a', b'first\nsecond\n')])
+        tree.commit('two', rev_id=b'rev-2')
+        basis = tree.basis_tree()
+        with basis.lock_read():
+            self.assertEqual([(b'rev-1', b'first\n'), (b'rev-2', b'second\n')],
+                             basis.annotate_iter('a'))
+        cache = annotation_cache.get_annotation_cache()
+        self.assertEqual(
+            {(b'a-id', b'rev-2'): [((b'a-id', b'rev-1'),),
+                                   ((b'a-id', b'rev-2'),)]},
+            cache.get_annotations([(b'a-id', b'rev-1'), (b'a-id', b'rev-2')]))
+        # The working tree annotates its basis through the cache
+        self.build_tree_contents([('a', b'first\nsecond\nthird\n')])
+        with tree.lock_read():
+            self.assertEqual([(b'rev-1', b'first\n'), (b'rev-2', b'second\n'),
+                              (b'current:', b'third\n')],
+                             tree.annotate_iter('a'))
@@ -0,0 +1,93 @@
+# Copyright (C) 2020 Breezy Developers
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA
+
+"""Tests for breezy/bzr/bloom.py"""
+
+from ... import (
+    errors,
+    tests,
+    )
+from .. import (
+    bloom,
+    )
+
+
+class TestBloomFilter(tests.TestCase):
+
+    def make_keys(self, count, prefix=b'key'):
+        return [(prefix, b'%d' % i) for i in range(count)]
+
+    def test_no_false_negatives(self):
+        keys = self.make_keys(1000)
+        key_filter = bloom.BloomFilter.build(keys)
+        for key in keys:
+            self.assertTrue(key in key_filter)
+
+    def test_false_positive_rate(self):
+        key_filter = bloom.BloomFilter.build(self.make_keys(1000))
+        false_positives = [key for key in self.make_keys(1000, b'other')
+                           if key in key_filter]
+        # About 1% are expected
+        self.assertTrue(len(false_positives) < 50, len(false_positives))
+
+    def test_size(self):
+        self.assertEqual(
+            1504, len(bloom.BloomFilter.build(self.make_keys(1000))))
+        # Tiny filters are given a minimum size
+        self.assertEqual(8, len(bloom.BloomFilter.build([])))
+
+    def test_empty(self):
+        key_filter = bloom.BloomFilter.build([])
+        self.assertFalse((b'key',) in key_filter)
+
+    def test_may_contain_hashes(self):
+        key_filter = bloom.BloomFilter.build([(b'file-id', b'rev-id')])
+        self.assertTrue(key_filter.may_contain_hashes(
+            bloom.key_hashes((b'file-id', b'rev-id'))))
+        self.assertFalse(key_filter.may_contain_hashes(
+            bloom.key_hashes((b'file-id', b'other-id'))))
+
+    def test_key_hashes_malformed_key(self):
+        self.assertIs(None, bloom.key_hashes(((b'null:',),)))
+        self.assertFalse(((b'null:',),) in bloom.BloomFilter.build([]))
+
+    def test_add_malformed_key(self):
+        key_filter = bloom.BloomFilter.build([])
+        self.assertRaises(TypeError, key_filter.add, ((b'null:',),))
+
+
+class TestSerialisation(tests.TestCase):
+
+    def test_round_trip(self):
+        filters = {
+            'revision': bloom.BloomFilter.build([(b'rev-1',), (b'rev-2',)]),
+            'text': bloom.BloomFilter.build([(b'file-id', b'rev-1')]),
+            }
+        data = bloom.filters_to_bytes(filters)
+        self.assertStartsWith(data, b'Bazaar index key filters v2\n')
+        parsed = bloom.filters_from_bytes(data)
+        self.assertEqual(['revision', 'text'], sorted(parsed))
+        self.assertTrue((b'rev-2',) in parsed['revision'])
+        self.assertTrue((b'file-id', b'rev-1') in parsed['text'])
+        self.assertFalse((b'rev-1',) in parsed['text'])
+
+    def test_invalid(self):
+        self.assertRaises(errors.BzrError, bloom.filters_from_bytes,
+                          b'not key filters')
+        self.assertRaises(errors.BzrError, bloom.filters_from_bytes,
+                          b'Bazaar index key filters v2\nl1:')
+        self.assertRaises(errors.BzrError, bloom.filters_from_bytes,
+                          b'Bazaar index key filters v2\nll8:revision3:abcee')
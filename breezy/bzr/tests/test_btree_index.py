@@ -434,6 +434,16 @@ class TestBTreeBuilder(BTreeTestCase):
         self.assertEqual(sorted(nodes), nodes)
         self.assertEqual(16, len(nodes))
 
+    def test_finish_add_key_includes_spilled_keys(self):
+        builder = btree_index.BTreeBuilder(key_elements=1, spill_at=2)
+        nodes = [node[0:2] for node in self.make_nodes(5, 1, 0)]
+        for node in nodes:
+            builder.add_node(*node)
+        self.assertEqual(1, len(builder._nodes))
+        keys = []
+        builder.finish(add_key=keys.append)
+        self.assertEqual(sorted(node[0] for node in nodes), keys)
+
     def test_spill_index_stress_1_1_no_combine(self):
         builder = btree_index.BTreeBuilder(key_elements=1, spill_at=2)
         builder.set_optimize(for_size=False, combine_backing_indices=False)
@@ -1002,6 +1012,40 @@ class TestBTreeIndex(BTreeTestCase):
                 (index, (b'name', b'fin2'), b'beta', ((), ))},
             set(index.iter_entries_prefix([(b'name', None)])))
 
+    def test_iter_key_prefix_reads_matching_pages(self):
+        builder = btree_index.BTreeBuilder(key_elements=2, reference_lists=1)
+        nodes = []
+        file_ids = []
+        for file_pos in range(500):
+            file_id = b'file-%03d-%s' % (
+                file_pos, osutils.sha_string(b'%d' % file_pos))
+            file_ids.append(file_id)
+            for rev_pos in range(20):
+                # Poorly compressible keys, to get a three level index
+                key = (file_id, osutils.sha_string(
+                    b'%d-%d' % (file_pos, rev_pos)))
+                nodes.append((key, b'value:%d' % rev_pos, ((key,),)))
+        for node in nodes:
+            builder.add_node(*node)
+        t = transport.get_transport_from_url('trace+' + self.get_url(''))
+        size = t.put_file('index', builder.finish())
+        index = btree_index.BTreeGraphIndex(t, 'index', size)
+        self.assertEqual(len(nodes), index.key_count())
+        self.assertEqual(3, len(index._row_lengths))
+        prefixes = [(file_ids[0], None), (file_ids[250], None),
+                    (file_ids[499], None), (b'missing', None)]
+        del t._activity[:]
+        self.assertEqual(
+            set((index,) + node for node in nodes
+                if (node[0][0], None) in prefixes),
+            set(index.iter_entries_prefix(prefixes)))
+        read_pages = sum(len(activity[2]) for activity in t._activity)
+        self.assertTrue(read_pages < 10, "read %d pages" % read_pages)
+        # Prefixes of whole keys match those keys only
+        self.assertEqual(
+            set((index,) + node for node in nodes[19:21]),
+            set(index.iter_entries_prefix([node[0] for node in nodes[19:21]])))
+
     # XXX: external_references tests are duplicated in test_index.  We
     # probably should have per_graph_index tests...
     def test_external_references_no_refs(self):
@@ -1178,6 +1222,8 @@ class TestBTreeIndex(BTreeTestCase):
         stream = builder.finish()
         trans = self.get_transport()
         size = trans.put_file('index', stream)
+        # The leaf node cache of local indices is bounded by size instead
+        self.overrideAttr(btree_index, '_LAZY_LOCAL_INDICES', False)
         index = btree_index.BTreeGraphIndex(trans, 'index', size)
         self.assertEqual(500, index.key_count())
         # We have an internal node
@@ -1206,6 +1252,184 @@ class TestBTreeIndex(BTreeTestCase):
         self.assertEqual(500, len(entries))
 
 
+    def test_local_index_leaves_are_lazy(self):
+        builder = btree_index.BTreeBuilder(key_elements=1, reference_lists=1)
+        nodes = self.make_nodes(500, 1, 1)
+        for node in nodes:
+            builder.add_node(*node)
+        trans = self.get_transport()
+        size = trans.put_file('index', builder.finish())
+        self.overrideAttr(btree_index, '_LAZY_LOCAL_INDICES', True)
+        index = btree_index.BTreeGraphIndex(trans, 'index', size)
+        self.assertIsInstance(index._leaf_node_cache, lru_cache.LRUSizeCache)
+        self.assertEqual(
+            sorted((index,) + node for node in nodes[::7]),
+            sorted(index.iter_entries(
+                [node[0] for node in nodes[::7]] + [(b'missing',)])))
+        for key in index._leaf_node_cache.keys():
+            self.assertIsInstance(index._leaf_node_cache[key],
+                                  btree_index._LazyLeafNode)
+        self.assertEqual(sorted((index,) + node for node in nodes),
+                         sorted(index.iter_all_entries()))
+
+    def test_remote_index_leaves_are_not_lazy(self):
+        builder = btree_index.BTreeBuilder(key_elements=1, reference_lists=0)
+        trans = transport.get_transport_from_url('trace+' + self.get_url())
+        size = trans.put_file('index', builder.finish())
+        index = btree_index.BTreeGraphIndex(trans, 'index', size)
+        self.assertIs(None, index._local_path)
+        self.assertEqual(0, index.key_count())
+        self.assertIsInstance(index._leaf_node_cache, lru_cache.LRUCache)
+        self.assertNotIsInstance(index._leaf_node_cache, lru_cache.LRUSizeCache)
+
+    def test_leaves_charged_parsed_size(self):
+        builder = btree_index.BTreeBuilder(key_elements=1, reference_lists=1)
+        nodes = self.make_nodes(2000, 1, 1)
+        for node in nodes:
+            builder.add_node(*node)
+        trans = self.get_transport()
+        size = trans.put_file('index', builder.finish())
+        self.overrideAttr(btree_index, '_LAZY_LOCAL_INDICES', True)
+        index = btree_index.BTreeGraphIndex(trans, 'index', size)
+        self.assertEqual(1, len(list(index.iter_entries([nodes[0][0]]))))
+        [key] = index._leaf_node_cache.keys()
+        node = index._leaf_node_cache[key]
+        self.assertIs(None, node._node)
+        node_size = node.size
+        self.assertEqual(4 * len(node._bytes), node_size)
+        node.all_items()
+        self.assertEqual(node_size, node.size)
+        # The cache stays within its bound as nodes get parsed
+        index = btree_index.BTreeGraphIndex(trans, 'index', size)
+        cache = index._leaf_node_cache = lru_cache.LRUSizeCache(
+            3 * node_size, compute_size=btree_index._leaf_node_size)
+        self.assertEqual(len(nodes), len(list(index.iter_all_entries())))
+        self.assertEqual(
+            cache._value_size,
+            sum(cache[key].size for key in cache.keys()))
+        self.assertTrue(cache._value_size <= cache._max_size)
+
+
+class TestBTreeRawLeafIndex(BTreeTestCase):
+
+    def make_raw_index(self, nodes, name='index', key_elements=1,
+                       reference_lists=1, spill_at=100000):
+        builder = btree_index.BTreeRawLeafBuilder(
+            key_elements=key_elements, reference_lists=reference_lists,
+            spill_at=spill_at)
+        for node in nodes:
+            builder.add_node(*node)
+        trans = self.get_transport()
+        size = trans.put_file(name, builder.finish())
+        return btree_index.BTreeRawLeafGraphIndex(trans, name, size)
+
+    def test_empty(self):
+        builder = btree_index.BTreeRawLeafBuilder(
+            key_elements=1, reference_lists=0)
+        self.assertEqual(
+            b"B+Tree Graph Index 2 raw leaves\nnode_ref_lists=0\n"
+            b"key_elements=1\nlen=0\nrow_lengths=\n",
+            builder.finish().read())
+
+    def test_leaves_are_not_compressed(self):
+        nodes = self.make_nodes(1200, 2, 2)
+        index = self.make_raw_index(nodes, key_elements=2, reference_lists=2)
+        index.key_count()
+        self.assertEqual(3, len(index._row_lengths))
+        content = index._transport.get_bytes('index')
+        leaf = content[index._row_offsets[-2] * btree_index._PAGE_SIZE:
+                       (index._row_offsets[-2] + 1) * btree_index._PAGE_SIZE]
+        self.assertStartsWith(leaf, btree_index._LEAF_FLAG)
+        self.assertContainsRe(leaf, b"\n\n")
+        # Internal nodes are still compressed
+        self.assertFalse(content[btree_index._PAGE_SIZE:].startswith(b"type="))
+
+    def test_round_trip(self):
+        nodes = self.make_nodes(1200, 2, 2)
+        index = self.make_raw_index(nodes, key_elements=2, reference_lists=2)
+        self.assertEqual(sorted((index,) + node for node in nodes),
+                         sorted(index.iter_all_entries()))
+        self.assertEqual(
+            sorted((index,) + node for node in nodes[::11]),
+            sorted(index.iter_entries(
+                [node[0] for node in nodes[::11]] + [(b'missing', b'key')])))
+        self.assertEqual(len(nodes), index.key_count())
+
+    def test_round_trip_unmapped(self):
+        self.overrideAttr(btree_index, '_LAZY_LOCAL_INDICES', False)
+        nodes = self.make_nodes(800, 1, 1)
+        index = self.make_raw_index(nodes)
+        self.assertEqual(
+            sorted((index,) + node for node in nodes[::13]),
+            sorted(index.iter_entries([node[0] for node in nodes[::13]])))
+
+    def test_spill(self):
+        nodes = self.make_nodes(600, 1, 1)
+        index = self.make_raw_index(nodes, spill_at=100)
+        self.assertEqual(sorted((index,) + node for node in nodes),
+                         sorted(index.iter_all_entries()))
+
+    def test_reads_compressed_index(self):
+        nodes = self.make_nodes(800, 1, 1)
+        builder = btree_index.BTreeBuilder(key_elements=1, reference_lists=1)
+        for node in nodes:
+            builder.add_node(*node)
+        trans = self.get_transport()
+        size = trans.put_file('index', builder.finish())
+        index = btree_index.BTreeRawLeafGraphIndex(trans, 'index', size)
+        self.assertEqual(sorted((index,) + node for node in nodes),
+                         sorted(index.iter_all_entries()))
+
+    def test_oversize_lines_use_compressed_leaves(self):
+        nodes = self.make_nodes(400, 1, 1)
+        # Compresses well, but does not fit in an uncompressed page
+        big_key = (b'big-' + b'x' * btree_index._PAGE_SIZE,)
+        nodes.append((big_key, b'big value', ((),)))
+        index = self.make_raw_index(nodes)
+        self.assertEqual(sorted((index,) + node for node in nodes),
+                         sorted(index.iter_all_entries()))
+        self.assertEqual(
+            [(index, big_key, b'big value', ((),))],
+            list(index.iter_entries([big_key])))
+        content = index._transport.get_bytes('index')
+        pages = [content[offset:offset + btree_index._PAGE_SIZE]
+                 for offset in range(btree_index._PAGE_SIZE, len(content),
+                                     btree_index._PAGE_SIZE)]
+        compressed_leaves = [
+            page for page in pages if not page.startswith(b'type=') and
+            zlib.decompress(page).startswith(btree_index._LEAF_FLAG)]
+        self.assertEqual(1, len(compressed_leaves))
+
+    def test_key_too_big(self):
+        big_key = b''.join(b'%d' % n for n in range(btree_index._PAGE_SIZE))
+        self.assertRaises(_mod_index.BadIndexKey,
+                          self.make_raw_index, [((big_key,), b'value', ([],))])
+
+    def test_compressed_index_rejects_raw_leaves(self):
+        index = self.make_raw_index(self.make_nodes(10, 1, 1))
+        index = btree_index.BTreeGraphIndex(
+            index._transport, 'index', index._size)
+        self.assertRaises(_mod_index.BadIndexFormatSignature,
+                          index.key_count)
+
+    def test_combined_with_compressed_index(self):
+        nodes = self.make_nodes(400, 1, 1)
+        raw_index = self.make_raw_index(nodes[::2], name='raw')
+        builder = btree_index.BTreeBuilder(key_elements=1, reference_lists=1)
+        for node in nodes[1::2]:
+            builder.add_node(*node)
+        trans = self.get_transport()
+        size = trans.put_file('compressed', builder.finish())
+        compressed_index = btree_index.BTreeRawLeafGraphIndex(
+            trans, 'compressed', size)
+        combined = _mod_index.CombinedGraphIndex(
+            [raw_index, compressed_index])
+        self.assertEqual(
+            sorted(node[0] for node in nodes[::5]),
+            sorted(entry[1] for entry in combined.iter_entries(
+                [node[0] for node in nodes[::5]])))
+
+
 class TestBTreeNodes(BTreeTestCase):
 
     scenarios = btreeparser_scenarios()
@@ -1214,6 +1438,37 @@ class TestBTreeNodes(BTreeTestCase):
         super(TestBTreeNodes, self).setUp()
         self.overrideAttr(btree_index, '_btree_serializer', self.parse_btree)
 
+    def test_LazyLeafNode(self):
+        node_bytes = (b"type=leaf\n"
+                      b"00\x0000\x00\t00\x00ref00\x00value:0\n"
+                      b"00\x0011\x0000\x00ref00\t00\x00ref00\r01\x00ref01\x00value:1\n"
+                      b"11\x0033\x0011\x00ref22\t11\x00ref22\r11\x00ref22\x00value:3\n"
+                      b"11\x0044\x00\t11\x00ref00\x00value:4\n"
+                      )
+        node = btree_index._LazyLeafNode(node_bytes, 2, 2)
+        for key in [(b'00', b'00'), (b'00', b'11'), (b'11', b'33'),
+                    (b'11', b'44')]:
+            self.assertTrue(key in node)
+        for key in [(b'00',  b'0'), (b'00', b'22'), (b'11', b'55'),
+                    (b'0', b'00'), (b'22', b'00'), (b'00',),
+                    ((b'00', b'00'), b'00')]:
+            self.assertFalse(key in node)
+            self.assertRaises(KeyError, node.__getitem__, key)
+        self.assertEqual(
+            (b'value:1', (((b'00', b'ref00'),),
+                          ((b'00', b'ref00'), (b'01', b'ref01')))),
+            node[(b'00', b'11')])
+        self.assertEqual(
+            (b'value:4', ((), ((b'11', b'ref00'),))), node[(b'11', b'44')])
+        # Single lookups do not parse the whole node
+        self.assertIs(None, node._node)
+        self.assertEqual(
+            btree_index._LeafNode(node_bytes, 2, 2).all_items(),
+            node.all_items())
+        self.assertEqual((b'00', b'00'), node.min_key)
+        self.assertEqual((b'11', b'44'), node.max_key)
+        self.assertTrue((b'11', b'33') in node)
+
     def test_LeafNode_1_0(self):
         node_bytes = (b"type=leaf\n"
                       b"0000000000000000000000000000000000000000\x00\x00value:0\n"
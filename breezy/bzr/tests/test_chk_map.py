@@ -2834,3 +2834,74 @@ class TestIterInterestingNodes(TestCaseWithExampleMaps):
             [right, left, l_a_key, r_c_key],
             [((b'abb',), b'changed left'), ((b'cbb',), b'changed right')],
             [left, right], [basis])
+
+
+class TestReadAheadChanges(TestCaseWithExampleMaps):
+
+    def get_store(self):
+        store = self.get_chk_bytes()
+        self.requests = []
+        get_record_stream = store.get_record_stream
+
+        def logging_get_record_stream(keys, ordering, include_delta_closure):
+            self.requests.append(sorted(keys))
+            return get_record_stream(keys, ordering, include_delta_closure)
+        store.get_record_stream = logging_get_record_stream
+        return store
+
+    def test_reads_differing_pages(self):
+        store = self.get_store()
+        basis = self.get_map({(b'aaa',): b'unchanged',
+                              (b'abb',): b'will change',
+                              (b'caa',): b'unchanged'}, maximum_size=10)
+        target = self.get_map({(b'aaa',): b'unchanged',
+                               (b'abb',): b'changed',
+                               (b'caa',): b'unchanged'}, maximum_size=10)
+        basis._dump_tree()
+        target._dump_tree()
+        basis_a = basis._root_node._items[b'a']
+        target_a = target._root_node._items[b'a']
+        target_c_key = target._root_node._items[b'c'].key()
+        chk_map.clear_cache()
+        del self.requests[:]
+        chk_map.read_ahead_changes(store, [(target.key(), basis.key())])
+        # One request per level, for the pages that differ
+        self.assertEqual(
+            [sorted([target.key(), basis.key()]),
+             sorted([target_a.key(), basis_a.key()]),
+             sorted([target_a._items[b'ab'].key(),
+                     basis_a._items[b'ab'].key()])],
+            self.requests)
+        self.assertFalse(target_c_key in chk_map._get_cache())
+        del self.requests[:]
+        target = CHKMap(store, target.key())
+        basis = CHKMap(store, basis.key())
+        self.assertEqual([((b'abb',), b'will change', b'changed')],
+                         list(target.iter_changes(basis)))
+        self.assertEqual([], self.requests)
+
+    def test_batches_pairs(self):
+        store = self.get_store()
+        maps = [self.get_map({(b'a%d' % i,): b'content %d' % j
+                              for i in range(5)}, maximum_size=10)
+                for j in range(4)]
+        chk_map.clear_cache()
+        del self.requests[:]
+        chk_map.read_ahead_changes(
+            store, [(maps[j].key(), maps[j - 1].key()) for j in range(1, 4)])
+        self.assertEqual(2, len(self.requests))
+        self.assertEqual(4, len(self.requests[0]))
+
+    def test_max_bytes(self):
+        store = self.get_store()
+        basis = self.get_map({(b'aaa',): b'old', (b'bbb',): b'old'},
+                             maximum_size=10)
+        target = self.get_map({(b'aaa',): b'new', (b'bbb',): b'new'},
+                              maximum_size=10)
+        chk_map.clear_cache()
+        del self.requests[:]
+        read = chk_map.read_ahead_changes(
+            store, [(target.key(), basis.key())], max_bytes=1)
+        self.assertEqual([sorted([target.key(), basis.key()])], self.requests)
+        self.assertEqual(sum(len(chk_map._get_cache()[key])
+                             for key in self.requests[0]), read)
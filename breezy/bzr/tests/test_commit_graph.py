@@ -0,0 +1,131 @@
+# Copyright (C) 2020 Breezy Developers
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA
+
+"""Tests for breezy/bzr/commit_graph.py"""
+
+from ... import (
+    errors,
+    graph as _mod_graph,
+    tests,
+    )
+from ...revision import NULL_REVISION
+from .. import (
+    commit_graph,
+    )
+
+
+# A - B - D - E - H
+#  \     /       /
+#   - C ----- G -
+#      \     /
+#       - F -
+# I (ghost parent J) - K
+ancestry = {
+    b'A': (),
+    b'B': (b'A',),
+    b'C': (b'A',),
+    b'D': (b'B', b'C'),
+    b'E': (b'D',),
+    b'F': (b'C',),
+    b'G': (b'C', b'F', b'D'),
+    b'H': (b'E', b'G'),
+    b'I': (b'J',),
+    b'K': (b'I',),
+    }
+
+
+class TestCommitGraph(tests.TestCase):
+
+    def make_commit_graph(self, parent_map=ancestry):
+        return commit_graph.CommitGraph(
+            commit_graph.build_commit_graph(parent_map))
+
+    def test_ghost_descendants_are_omitted(self):
+        graph = self.make_commit_graph()
+        self.assertEqual(8, len(graph))
+        self.assertEqual({}, graph.get_parent_map([b'I', b'J', b'K']))
+
+    def test_get_parent_map(self):
+        graph = self.make_commit_graph()
+        self.assertEqual(
+            {b'A': (NULL_REVISION,),
+             b'D': (b'B', b'C'),
+             b'G': (b'C', b'F', b'D'),
+             NULL_REVISION: ()},
+            graph.get_parent_map([b'A', b'D', b'G', b'X', NULL_REVISION]))
+
+    def test_get_generations(self):
+        graph = self.make_commit_graph()
+        self.assertEqual(
+            {NULL_REVISION: 0, b'A': 1, b'C': 2, b'D': 3, b'G': 4, b'H': 5},
+            graph.get_generations(
+                [NULL_REVISION, b'A', b'C', b'D', b'G', b'H', b'K']))
+
+    def test_get_ancestry(self):
+        graph = self.make_commit_graph()
+        self.assertEqual(
+            {b'A': (), b'C': (b'A',), b'F': (b'C',)},
+            graph.get_ancestry([b'F']))
+        self.assertEqual(
+            dict((k, v) for k, v in ancestry.items() if k < b'I'),
+            graph.get_ancestry([b'H']))
+        self.assertIs(None, graph.get_ancestry([b'H', b'K']))
+
+    def test_empty(self):
+        graph = self.make_commit_graph({})
+        self.assertEqual(0, len(graph))
+        self.assertEqual({}, graph.get_parent_map([b'A']))
+
+    def test_invalid(self):
+        data = commit_graph.build_commit_graph(ancestry)
+        self.assertRaises(errors.BzrError, commit_graph.CommitGraph,
+                          b'not a commit graph')
+        self.assertRaises(errors.BzrError, commit_graph.CommitGraph,
+                          data[:-1])
+
+
+class TestCommitGraphFromFile(tests.TestCaseInTempDir):
+
+    def test_from_file(self):
+        self.build_tree_contents(
+            [('commit-graph', commit_graph.build_commit_graph(ancestry))])
+        graph = commit_graph.CommitGraph.from_file('commit-graph')
+        self.assertEqual({b'H': (b'E', b'G')}, graph.get_parent_map([b'H']))
+
+    def test_empty_file(self):
+        self.build_tree_contents([('commit-graph', b'')])
+        self.assertRaises(errors.BzrError,
+                          commit_graph.CommitGraph.from_file, 'commit-graph')
+
+
+class TestCommitGraphParentsProvider(tests.TestCase):
+
+    def test_no_commit_graph(self):
+        provider = commit_graph.CommitGraphParentsProvider(lambda: None)
+        self.assertEqual({}, provider.get_parent_map([b'A']))
+        self.assertEqual({}, provider.get_cached_parent_map([b'A']))
+        self.assertEqual({}, provider.get_generations([b'A']))
+
+    def test_heads(self):
+        graph = commit_graph.CommitGraph(
+            commit_graph.build_commit_graph(ancestry))
+        provider = commit_graph.CommitGraphParentsProvider(lambda: graph)
+        self.assertEqual({b'A': 1}, provider.get_generations([b'A']))
+        g = _mod_graph.Graph(provider)
+        self.assertEqual({b'E', b'G'}, g.heads([b'E', b'F', b'G', b'A']))
+        self.assertEqual({b'H'}, g.heads([b'H', b'F']))
+        self.assertTrue(g.is_ancestor(b'F', b'H'))
+        self.assertFalse(g.is_ancestor(b'E', b'G'))
@@ -20,6 +20,7 @@ import os
 import tempfile
 
 from ... import (
+    config,
     controldir,
     errors,
     memorytree,
@@ -300,11 +301,6 @@ class TestCaseWithDirState(tests.TestCaseWithTransport):
         self.addCleanup(state.unlock)
         self.assertEqual(dirstate.DirState.NOT_IN_MEMORY,
                          state._dirblock_state)
-        # This is code is only really tested if we actually have to make more
-        # than one read, so set the page size to something smaller.
-        # We want it to contain about 2.2 records, so that we have a couple
-        # records that we can read per attempt
-        state._bisect_page_size = 200
         return tree, state, expected
 
     def create_duplicated_dirstate(self):
@@ -1415,6 +1411,262 @@ class TestDirStateHashUpdates(TestCaseWithDirState):
         self.assertEqual(0, len(state._known_hash_changes))
 
 
+class TestDirStateJournal(TestCaseWithDirState):
+
+    def setUp(self):
+        super(TestDirStateJournal, self).setUp()
+        config.GlobalStack().set('dirstate.journal', True)
+        tree = self.make_branch_and_tree('.')
+        self.build_tree(['c', 'd'])
+        tree.add(['c', 'd'], [b'c-id', b'd-id'])
+        tree.commit('add c and d')
+        self.tree = tree
+        self.filename = tree.controldir.get_workingtree_transport(
+            None).local_abspath('dirstate')
+
+    def open_state(self):
+        state = InstrumentedDirState.on_file(self.filename)
+        state.lock_write()
+
+        def unlock():
+            if state._lock_token is not None:
+                state.unlock()
+        self.addCleanup(unlock)
+        state._read_dirblocks_if_needed()
+        state.adjust_time(+20)  # Allow things to be cached
+        return state
+
+    def update_entry(self, state, path):
+        entry = state._get_entry(0, path_utf8=path)
+        dirstate.update_entry(state, entry, os.path.abspath(path),
+                              os.lstat(path))
+        return entry
+
+    def read_content(self, state):
+        state._state_file.seek(0)
+        return state._state_file.read()
+
+    def test_hash_changes_are_journalled(self):
+        state = self.open_state()
+        content = self.read_content(state)
+        entry = self.update_entry(state, b'c')
+        self.assertEqual(b'f', entry[1][0][0])
+        self.assertNotEqual(b'', entry[1][0][1])
+        state.save()
+        self.assertEqual(dirstate.DirState.IN_MEMORY_UNMODIFIED,
+                         state._dirblock_state)
+        self.assertEqual(content, self.read_content(state))
+        self.assertPathExists(self.filename + '-journal')
+        state.unlock()
+        state = self.open_state()
+        self.assertEqual(entry[1][0], state._get_entry(0, path_utf8=b'c')[1][0])
+
+    def test_journal_grows(self):
+        state = self.open_state()
+        self.update_entry(state, b'c')
+        state.save()
+        size = os.path.getsize(self.filename + '-journal')
+        self.update_entry(state, b'd')
+        state.save()
+        self.assertTrue(size < os.path.getsize(self.filename + '-journal'))
+        state.unlock()
+        state = self.open_state()
+        for path in [b'c', b'd']:
+            self.assertEqual(40, len(state._get_entry(0, path_utf8=path)[1][0][1]))
+
+    def test_full_save_removes_journal(self):
+        state = self.open_state()
+        entry = self.update_entry(state, b'c')
+        state.save()
+        content = self.read_content(state)
+        state._mark_modified()
+        state.save()
+        self.assertPathDoesNotExist(self.filename + '-journal')
+        self.assertNotEqual(content, self.read_content(state))
+        state.unlock()
+        state = self.open_state()
+        self.assertEqual(entry[1][0], state._get_entry(0, path_utf8=b'c')[1][0])
+
+    def test_basis_change_rewrites_file(self):
+        state = self.open_state()
+        self.update_entry(state, b'c')
+        state.save()
+        state.unlock()
+        self.assertPathExists(self.filename + '-journal')
+        self.build_tree_contents([('c', b'new content of c')])
+        revid = self.tree.commit('change c')
+        self.assertPathDoesNotExist(self.filename + '-journal')
+        # Readers that ignore the journal see the new basis.
+        config.GlobalStack().set('dirstate.journal', False)
+        state = self.open_state()
+        self.assertEqual([revid], state.get_parent_ids())
+        self.assertEqual(
+            osutils.sha_string(b'new content of c'),
+            state._get_entry(1, path_utf8=b'c')[1][1][1])
+
+    def test_compacts_large_journal(self):
+        state = self.open_state()
+        state.JOURNAL_MIN_COMPACT_SIZE = 0
+        state.JOURNAL_COMPACT_RATIO = 1000
+        content = self.read_content(state)
+        self.update_entry(state, b'c')
+        state.save()
+        self.assertPathDoesNotExist(self.filename + '-journal')
+        self.assertNotEqual(content, self.read_content(state))
+
+    def test_disabled(self):
+        config.GlobalStack().set('dirstate.journal', False)
+        state = self.open_state()
+        content = self.read_content(state)
+        self.update_entry(state, b'c')
+        state.save()
+        self.assertPathDoesNotExist(self.filename + '-journal')
+        self.assertNotEqual(content, self.read_content(state))
+
+    def test_ignores_partial_record(self):
+        state = self.open_state()
+        entry = self.update_entry(state, b'c')
+        state.save()
+        state.unlock()
+        with open(self.filename + '-journal', 'ab') as f:
+            f.write(b'100 1234\nd4:')
+        state = self.open_state()
+        self.assertEqual(entry[1][0], state._get_entry(0, path_utf8=b'c')[1][0])
+        # The partial record is dropped by the next append.
+        self.update_entry(state, b'd')
+        state.save()
+        state.unlock()
+        state = self.open_state()
+        self.assertEqual(entry[1][0], state._get_entry(0, path_utf8=b'c')[1][0])
+        self.assertEqual(40, len(state._get_entry(0, path_utf8=b'd')[1][0][1]))
+
+    def test_ignores_journal_for_other_file(self):
+        state = self.open_state()
+        self.update_entry(state, b'c')
+        state.save()
+        state.unlock()
+        with open(self.filename + '-journal', 'rb') as f:
+            journal = f.read()
+        state = self.open_state()
+        state._mark_modified()
+        state.save()
+        state.unlock()
+        # A journal written against the old file is not applied.
+        with open(self.filename + '-journal', 'wb') as f:
+            f.write(journal)
+        state = self.open_state()
+        state._get_entry(0, path_utf8=b'c')[1][0] = (
+            b'f', b'', 0, False, dirstate.DirState.NULLSTAT)
+        state._mark_modified()
+        state.save()
+        state.unlock()
+        with open(self.filename + '-journal', 'wb') as f:
+            f.write(journal)
+        state = self.open_state()
+        self.assertEqual(b'', state._get_entry(0, path_utf8=b'c')[1][0][1])
+
+
+class _FingerprintSHA1Provider(dirstate.DefaultSHA1Provider):
+
+    def __init__(self, fingerprint):
+        self._fingerprint = fingerprint
+
+    def fingerprint(self):
+        return self._fingerprint
+
+
+class TestDirStateSHA1Fingerprint(TestCaseWithDirState):
+
+    def setUp(self):
+        super(TestDirStateSHA1Fingerprint, self).setUp()
+        tree = self.make_branch_and_tree('.')
+        self.build_tree(['c', 'd'])
+        tree.add(['c', 'd'], [b'c-id', b'd-id'])
+        tree.commit('add c and d')
+        self.tree = tree
+        self.filename = tree.controldir.get_workingtree_transport(
+            None).local_abspath('dirstate')
+
+    def open_state(self, fingerprint):
+        state = InstrumentedDirState.on_file(
+            self.filename, _FingerprintSHA1Provider(fingerprint))
+        state.lock_write()
+
+        def unlock():
+            if state._lock_token is not None:
+                state.unlock()
+        self.addCleanup(unlock)
+        state._read_dirblocks_if_needed()
+        state.adjust_time(+20)  # Allow things to be cached
+        return state
+
+    def hash_and_save(self, fingerprint):
+        state = self.open_state(fingerprint)
+        entry = state._get_entry(0, path_utf8=b'c')
+        dirstate.update_entry(state, entry, os.path.abspath('c'),
+                              os.lstat('c'))
+        self.assertEqual(40, len(entry[1][0][1]))
+        state._mark_modified()
+        state.save()
+        state.unlock()
+        return entry[1][0]
+
+    def get_details(self, state):
+        return state._get_entry(0, path_utf8=b'c')[1][0]
+
+    def test_same_fingerprint_keeps_hashes(self):
+        details = self.hash_and_save(b'rules-1')
+        self.assertPathExists(self.filename + '-sha1-fingerprint')
+        state = self.open_state(b'rules-1')
+        self.assertEqual(details, self.get_details(state))
+        self.assertEqual(dirstate.DirState.IN_MEMORY_UNMODIFIED,
+                         state._dirblock_state)
+
+    def test_changed_fingerprint_drops_hashes(self):
+        details = self.hash_and_save(b'rules-1')
+        state = self.open_state(b'rules-2')
+        self.assertEqual(
+            (b'f', b'', details[2], details[3], dirstate.DirState.NULLSTAT),
+            self.get_details(state))
+        self.assertEqual(dirstate.DirState.IN_MEMORY_MODIFIED,
+                         state._dirblock_state)
+        state.save()
+        with open(self.filename + '-sha1-fingerprint', 'rb') as f:
+            self.assertEndsWith(f.read(), b'\nrules-2\n')
+
+    def test_no_fingerprint_drops_filtered_hashes(self):
+        self.hash_and_save(b'rules-1')
+        state = self.open_state(None)
+        self.assertEqual(b'', self.get_details(state)[1])
+        state.save()
+        self.assertPathDoesNotExist(self.filename + '-sha1-fingerprint')
+
+    def test_no_fingerprint_keeps_hashes(self):
+        details = self.hash_and_save(None)
+        self.assertPathDoesNotExist(self.filename + '-sha1-fingerprint')
+        state = self.open_state(None)
+        self.assertEqual(details, self.get_details(state))
+
+    def test_ignores_fingerprint_for_other_file(self):
+        self.hash_and_save(b'rules-1')
+        with open(self.filename + '-sha1-fingerprint', 'rb') as f:
+            fingerprint = f.read()
+        # A client that does not know about fingerprints caches the sha1 of
+        # the unfiltered content, leaving the fingerprint file in place.
+        state = self.open_state(b'rules-1')
+        entry = state._get_entry(0, path_utf8=b'c')
+        details = entry[1][0]
+        entry[1][0] = (b'f', b'1' * 40, details[2], details[3], details[4])
+        state._mark_modified()
+        state._write_sha1_fingerprint = lambda: None
+        state.save()
+        state.unlock()
+        with open(self.filename + '-sha1-fingerprint', 'rb') as f:
+            self.assertEqual(fingerprint, f.read())
+        state = self.open_state(b'rules-1')
+        self.assertEqual(b'', self.get_details(state)[1])
+
+
 class TestGetLines(TestCaseWithDirState):
 
     def test_get_line_with_2_rows(self):
@@ -2036,25 +2288,6 @@ class TestBisect(TestCaseWithDirState):
         self.assertBisect(expected, [[b'b'], [b'b-c'], [b'b/c']],
                           state, [b'b', b'b-c', b'b/c'])
 
-    def test_bisect_one_page(self):
-        """Test bisect when there is only 1 page to read"""
-        tree, state, expected = self.create_basic_dirstate()
-        state._bisect_page_size = 5000
-        self.assertBisect(expected, [[b'']], state, [b''])
-        self.assertBisect(expected, [[b'a']], state, [b'a'])
-        self.assertBisect(expected, [[b'b']], state, [b'b'])
-        self.assertBisect(expected, [[b'b/c']], state, [b'b/c'])
-        self.assertBisect(expected, [[b'b/d']], state, [b'b/d'])
-        self.assertBisect(expected, [[b'b/d/e']], state, [b'b/d/e'])
-        self.assertBisect(expected, [[b'b-c']], state, [b'b-c'])
-        self.assertBisect(expected, [[b'f']], state, [b'f'])
-        self.assertBisect(expected, [[b'a'], [b'b'], [b'f']],
-                          state, [b'a', b'b', b'f'])
-        self.assertBisect(expected, [[b'b/d'], [b'b/d/e'], [b'f']],
-                          state, [b'b/d', b'b/d/e', b'f'])
-        self.assertBisect(expected, [[b'b'], [b'b/c'], [b'b-c']],
-                          state, [b'b', b'b/c', b'b-c'])
-
     def test_bisect_duplicate_paths(self):
         """When bisecting for a path, handle multiple entries."""
         tree, state, expected = self.create_duplicated_dirstate()
@@ -2070,19 +2303,6 @@ class TestBisect(TestCaseWithDirState):
         self.assertBisect(expected, [[b'b-c', b'b-c2']], state, [b'b-c'])
         self.assertBisect(expected, [[b'f', b'f2']], state, [b'f'])
 
-    def test_bisect_page_size_too_small(self):
-        """If the page size is too small, we will auto increase it."""
-        tree, state, expected = self.create_basic_dirstate()
-        state._bisect_page_size = 50
-        self.assertBisect(expected, [None], state, [b'b/e'])
-        self.assertBisect(expected, [[b'a']], state, [b'a'])
-        self.assertBisect(expected, [[b'b']], state, [b'b'])
-        self.assertBisect(expected, [[b'b/c']], state, [b'b/c'])
-        self.assertBisect(expected, [[b'b/d']], state, [b'b/d'])
-        self.assertBisect(expected, [[b'b/d/e']], state, [b'b/d/e'])
-        self.assertBisect(expected, [[b'b-c']], state, [b'b-c'])
-        self.assertBisect(expected, [[b'f']], state, [b'f'])
-
     def test_bisect_missing(self):
         """Test that bisect return None if it cannot find a path."""
         tree, state, expected = self.create_basic_dirstate()
@@ -2135,6 +2355,49 @@ class TestBisect(TestCaseWithDirState):
         self.assertBisectDirBlocks(expected, [None], state, [b'b/d/e'])
         self.assertBisectDirBlocks(expected, [None], state, [b'f'])
 
+    def test_dirblock_offsets(self):
+        tree, state, expected = self.create_basic_dirstate()
+        offsets = state._get_dirblock_offsets()
+        self.assertEqual([b'', b'b', b'b/d'], [o[0] for o in offsets])
+        self.assertEqual(
+            sorted([expected[b''], expected[b'a'], expected[b'b'],
+                    expected[b'b-c'], expected[b'f']]),
+            sorted(state._read_dirblock_from_disk(b'')))
+        self.assertEqual([], state._read_dirblock_from_disk(b'a'))
+        # Nothing was read into the dirblocks.
+        self.assertEqual(dirstate.DirState.NOT_IN_MEMORY,
+                         state._dirblock_state)
+        state._read_dirblocks_if_needed()
+        self.assertIs(None, state._state_map)
+
+    def test_dirblock_offsets_field_ending_in_newline(self):
+        # A symlink target ending in a newline looks like the end of a record
+        state = dirstate.DirState.initialize('dirstate')
+        try:
+            state.add('a', b'a-id', 'symlink', None, b'target\n')
+            state.add('b', b'b-id', 'directory', None, b'')
+            state.add('b/c', b'c-id', 'file', None, b'')
+            expected = list(state._iter_entries())
+            state.save()
+        finally:
+            state.unlock()
+        state = dirstate.DirState.on_file('dirstate')
+        state.lock_read()
+        self.addCleanup(state.unlock)
+        offsets = state._get_dirblock_offsets()
+        self.assertEqual([b'', b'b'], [o[0] for o in offsets])
+        self.assertEqual(expected[:3], state._read_dirblock_from_disk(b''))
+        self.assertEqual(expected[3:], state._read_dirblock_from_disk(b'b'))
+
+    def test_dirblock_offsets_dropped_on_unlock(self):
+        tree, state, expected = self.create_basic_dirstate()
+        self.assertBisect(expected, [[b'b/c']], state, [b'b/c'])
+        self.assertIsNot(None, state._state_map)
+        state.unlock()
+        self.assertIs(None, state._state_map)
+        self.assertIs(None, state._dirblock_offsets)
+        state.lock_read()
+
     def test_bisect_recursive_each(self):
         tree, state, expected = self.create_basic_dirstate()
         self.assertBisectRecursive(expected, [b'a'], state, [b'a'])
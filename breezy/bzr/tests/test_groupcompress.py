@@ -572,6 +572,20 @@ class TestGroupCompressVersionedFiles(TestCaseWithGroupCompressVersionedFiles):
             'as-requested', False)]
         self.assertEqual([(b'b',), (b'a',), (b'd',), (b'c',)], keys)
 
+    def test_keys_with_prefixes(self):
+        vf = self.make_test_vf(True, keylength=2, dir='source')
+        vf.add_lines((b'f1', b'a'), (), [b'lines\n'])
+        vf.add_lines((b'f2', b'a'), (), [b'lines\n'])
+        fallback = self.make_test_vf(True, keylength=2, dir='fallback')
+        fallback.add_lines((b'f1', b'b'), (), [b'lines\n'])
+        fallback.add_lines((b'f3', b'b'), (), [b'lines\n'])
+        vf.add_fallback_versioned_files(fallback)
+        self.assertEqual({(b'f1', b'a'), (b'f1', b'b')},
+                         vf.keys_with_prefixes([(b'f1', None)]))
+        self.assertEqual({(b'f2', b'a'), (b'f3', b'b')},
+                         vf.keys_with_prefixes([(b'f2', None), (b'f3', None)]))
+        self.assertEqual(set(), vf.keys_with_prefixes([(b'f4', None)]))
+
     def test_get_record_stream_max_bytes_to_index_default(self):
         vf = self.make_test_vf(True, dir='source')
         vf.add_lines((b'a',), (), [b'lines\n'])
@@ -710,6 +724,28 @@ class TestGroupCompressVersionedFiles(TestCaseWithGroupCompressVersionedFiles):
             else:
                 self.assertIs(block, record._manager._block)
 
+    def test_insert_record_stream_parallel_matches_serial(self):
+        config.GlobalConfig().set_user_option(
+            'bzr.groupcompress.compression_threads', '4')
+        packs = []
+        for parallel in [False, True]:
+            vf = self.make_test_vf(True, dir='target-%s' % (parallel,),
+                                   do_cleanup=False)
+            list(vf._insert_record_stream(
+                self.grouped_stream([b'a', b'b', b'c', b'd']),
+                parallel=parallel))
+            list(vf._insert_record_stream(
+                self.grouped_stream([b'e', b'f'], first_parents=((b'd',),)),
+                parallel=parallel))
+            groupcompress.cleanup_pack_group(vf)
+            packs.append((
+                self.get_transport(
+                    'target-%s' % (parallel,)).get_bytes('newpack'),
+                sorted(node[1:] for node in
+                       vf._index._graph_index.iter_all_entries())))
+        self.assertEqual(4, vf._compression_threads)
+        self.assertEqual(packs[0], packs[1])
+
     def test_add_missing_noncompression_parent_unvalidated_index(self):
         unvalidated = self.make_g_index_missing_parent()
         combined = _mod_index.CombinedGraphIndex([unvalidated])
@@ -832,6 +868,68 @@ class TestGroupCompressConfig(tests.TestCaseWithTransport):
                              gc._delta_index._max_bytes_to_index)
 
 
+    def test_compression_threads_default(self):
+        vf = self.make_test_vf()
+        self.assertEqual(
+            (vf._DEFAULT_COMPRESSION_THREADS, vf._DEFAULT_MAX_PENDING_BYTES),
+            vf._get_parallel_compression_settings())
+
+    def test_compression_threads_in_config(self):
+        c = config.GlobalConfig()
+        c.set_user_option('bzr.groupcompress.compression_threads', '8')
+        c.set_user_option('bzr.groupcompress.max_pending_bytes', '10M')
+        vf = self.make_test_vf()
+        self.assertEqual((8, 10000000),
+                         vf._get_parallel_compression_settings())
+
+    def test_compression_threads_bad_config(self):
+        c = config.GlobalConfig()
+        c.set_user_option('bzr.groupcompress.compression_threads', 'boogah')
+        c.set_user_option('bzr.groupcompress.max_pending_bytes', 'lots')
+        vf = self.make_test_vf()
+        self.assertEqual(
+            (vf._DEFAULT_COMPRESSION_THREADS, vf._DEFAULT_MAX_PENDING_BYTES),
+            vf._get_parallel_compression_settings())
+
+
+class TestGroupCompressionPool(tests.TestCase):
+
+    def make_block(self, content):
+        block = groupcompress.GroupCompressBlock()
+        block.set_chunked_content([content], len(content))
+        return block
+
+    def make_pool(self, max_pending_bytes):
+        written = []
+
+        def write_block(bytes_len, chunks, nodes):
+            written.append((b''.join(chunks), nodes))
+        pool = groupcompress._GroupCompressionPool(
+            write_block, 2, max_pending_bytes)
+        self.addCleanup(pool.close)
+        return pool, written
+
+    def test_writes_in_submission_order(self):
+        pool, written = self.make_pool(1024 * 1024)
+        contents = [b'%d content\n' % (i,) * 100 for i in range(10)]
+        for i, content in enumerate(contents):
+            pool.submit(self.make_block(content), i)
+        pool.flush()
+        self.assertEqual(list(range(10)), [nodes for _, nodes in written])
+        self.assertEqual([self.make_block(c).to_bytes() for c in contents],
+                         [data for data, _ in written])
+        self.assertEqual(0, pool.pending_bytes)
+
+    def test_bounded_pending_bytes(self):
+        pool, written = self.make_pool(150)
+        pool.submit(self.make_block(b'a' * 100), 0)
+        self.assertEqual([], written)
+        self.assertEqual(100, pool.pending_bytes)
+        pool.submit(self.make_block(b'b' * 100), 1)
+        self.assertEqual([0], [nodes for _, nodes in written])
+        self.assertEqual(100, pool.pending_bytes)
+
+
 class StubGCVF(object):
     def __init__(self, canned_get_blocks=None):
         self._group_cache = {}
@@ -17,11 +17,13 @@
 """Tests for indices."""
 
 from ... import (
+    debug,
     errors,
     tests,
     transport,
     )
 from .. import (
+    bloom,
     index as _mod_index,
     )
 
@@ -1218,6 +1220,58 @@ class TestCombinedGraphIndex(tests.TestCaseWithMemoryTransport):
         self.assertEqual([(idx1, (b'name', ), b'data')],
                          list(idx.iter_entries([(b'name', )])))
 
+    def test_iter_entries_key_filter(self):
+        idx1 = self.make_index('name1', nodes=[((b'name', ), b'data', ())])
+        idx2 = self.make_index('name2', nodes=[((b'2', ), b'', ())])
+        idx = _mod_index.CombinedGraphIndex([])
+        idx.insert_index(0, idx1, 'name1')
+        idx.insert_index(
+            0, idx2, 'name2', lambda: bloom.BloomFilter.build([(b'2',)]))
+        searched = []
+        orig_iter_entries = idx2.iter_entries
+
+        def iter_entries(keys):
+            searched.append(sorted(keys))
+            return orig_iter_entries(keys)
+        idx2.iter_entries = iter_entries
+        self.assertEqual(
+            {(idx1, (b'name', ), b'data'), (idx2, (b'2', ), b'')},
+            set(idx.iter_entries([(b'name', ), (b'2', )])))
+        self.assertEqual(
+            [(idx1, (b'name', ), b'data')],
+            list(idx.iter_entries([(b'name', ), (b'missing', )])))
+        # The second lookup does not search idx2 at all
+        self.assertEqual([[(b'2', )]], searched)
+
+    def test_iter_entries_key_filter_counts_avoided_probes(self):
+        self.overrideAttr(_mod_index, '_key_filter_counter', None)
+        self.overrideAttr(debug, 'debug_flags', {'index'})
+        idx1 = self.make_index('name1', nodes=[((b'name', ), b'data', ())])
+        idx = _mod_index.CombinedGraphIndex([])
+        idx.insert_index(
+            0, idx1, 'name1', lambda: bloom.BloomFilter.build([(b'name',)]))
+        self.assertEqual([], list(idx.iter_entries([(b'missing', )])))
+        self.assertEqual(1, _mod_index._key_filter_counter.probes)
+        self.assertEqual(1, _mod_index._key_filter_counter.avoided)
+
+    def test_iter_entries_without_key_filter(self):
+        idx1 = self.make_index('name1', nodes=[((b'name', ), b'data', ())])
+        idx = _mod_index.CombinedGraphIndex([])
+        idx.insert_index(0, idx1, 'name1', lambda: None)
+        self.assertEqual([(idx1, (b'name', ), b'data')],
+                         list(idx.iter_entries([(b'name', )])))
+
+    def test_remove_index(self):
+        idx1 = self.make_index('name1', nodes=[((b'name', ), b'data', ())])
+        idx2 = self.make_index('name2', nodes=[((b'2', ), b'', ())])
+        idx = _mod_index.CombinedGraphIndex([])
+        idx.insert_index(0, idx1, 'name1')
+        idx.insert_index(0, idx2, 'name2', lambda: None)
+        idx.remove_index(idx2)
+        self.assertEqual([idx1], idx._indices)
+        self.assertEqual(['name1'], idx._index_names)
+        self.assertEqual({}, idx._key_filters)
+
     def test_iter_all_entries_two_indices_dup_key(self):
         idx1 = self.make_index('name1', nodes=[((b'name', ), b'data', ())])
         idx2 = self.make_index('name2', nodes=[((b'name', ), b'data', ())])
@@ -2782,6 +2782,85 @@ class TestRepositoryGetParentMap(TestRemoteRepository):
         self.assertEqual({}, repo.get_parent_map([b'non-existant']))
         self.assertLength(0, self.hpss_calls)
 
+    def test_get_parent_map_later_calls_ask_for_generations(self):
+        # Once some of the graph is cached, requests ask for ancestry with
+        # a response size that doubles every time.
+        transport_path = 'quack'
+        repo, client = self.setup_fake_client_and_repository(transport_path)
+        client.add_success_response_with_body(
+            bz2.compress(b'r3 r2'), b'ok')
+        client.add_success_response_with_body(
+            bz2.compress(b'r2 r1'), b'ok')
+        client.add_success_response_with_body(
+            bz2.compress(b'r1'), b'ok')
+        repo.lock_read()
+        self.addCleanup(repo.unlock)
+        graph = repo.get_graph()
+        self.assertEqual({b'r3': (b'r2',)}, graph.get_parent_map([b'r3']))
+        self.assertEqual({b'r2': (b'r1',)}, graph.get_parent_map([b'r2']))
+        self.assertEqual({b'r1': (b'null:',)}, graph.get_parent_map([b'r1']))
+        self.assertEqual(
+            [('call_with_body_bytes_expecting_body',
+              b'Repository.get_parent_map',
+              (b'quack/', b'include-missing:', b'r3')),
+             ('call_with_body_bytes_expecting_body',
+              b'Repository.get_parent_map_generations',
+              (b'quack/', b'0', b'131072', b'include-missing:', b'r2')),
+             ('call_with_body_bytes_expecting_body',
+              b'Repository.get_parent_map_generations',
+              (b'quack/', b'0', b'262144', b'include-missing:', b'r1')),
+             ],
+            [call[:3] for call in client._calls])
+
+    def test_get_parent_map_generations_unknown_method(self):
+        transport_path = 'quack'
+        repo, client = self.setup_fake_client_and_repository(transport_path)
+        client.add_success_response_with_body(
+            bz2.compress(b'r3 r2'), b'ok')
+        client.add_unknown_method_response(
+            b'Repository.get_parent_map_generations')
+        client.add_success_response_with_body(
+            bz2.compress(b'r2 r1'), b'ok')
+        repo.lock_read()
+        self.addCleanup(repo.unlock)
+        graph = repo.get_graph()
+        graph.get_parent_map([b'r3'])
+        self.assertEqual({b'r2': (b'r1',)}, graph.get_parent_map([b'r2']))
+        self.assertEqual(
+            [b'Repository.get_parent_map',
+             b'Repository.get_parent_map_generations',
+             b'Repository.get_parent_map'],
+            [call[1] for call in client._calls])
+        # Protocol 3 servers skip the body of unknown requests, so there is
+        # no need to reconnect.
+        self.assertTrue(client._medium._is_remote_before((3, 2)))
+        self.assertFalse(client._medium._is_remote_before((1, 2)))
+
+    def test_get_parent_map_pipelines_wide_requests(self):
+        self.setup_smart_server_with_call_log()
+        builder = self.make_branch_builder('foo')
+        builder.start_series()
+        builder.build_snapshot(None, [
+            ('add', ('', b'root-id', 'directory', ''))],
+            revision_id=b'rev-0')
+        for i in range(1, 9):
+            builder.build_snapshot(None, [], revision_id=b'rev-%d' % i)
+        builder.finish_series()
+        repo = builder.get_branch().repository
+        self.assertIsInstance(repo, RemoteRepository)
+        repo.lock_read()
+        self.addCleanup(repo.unlock)
+        graph = repo.get_graph()
+        graph.get_parent_map([b'rev-0'])
+        self.reset_smart_call_log()
+        keys = [b'rev-%d' % i for i in range(1, 9)]
+        self.assertEqual(
+            dict((b'rev-%d' % i, (b'rev-%d' % (i - 1),)) for i in range(1, 9)),
+            graph.get_parent_map(keys))
+        self.assertEqual(
+            [b'Repository.get_parent_map_generations'] * 4,
+            [call.call.method for call in self.hpss_calls])
+
     def test_exposes_get_cached_parent_map(self):
         """RemoteRepository exposes get_cached_parent_map from
         _unstacked_provider
@@ -35,6 +35,7 @@ from breezy import (
 from breezy.bzr import (
     bzrdir,
     btree_index,
+    chk_map,
     inventory,
     repository as bzrrepository,
     versionedfile,
@@ -47,6 +48,7 @@ from breezy.repository import RepositoryFormat
 from breezy.tests import (
     TestCase,
     TestCaseWithTransport,
+    test_server,
     )
 from breezy import (
     controldir,
@@ -62,6 +64,7 @@ from breezy.bzr import (
     knitrepo,
     knitpack_repo,
     pack_repo,
+    remote,
     )
 
 
@@ -683,6 +686,133 @@ class Test2a(tests.TestCaseWithMemoryTransport):
         self.assertFalse(combine[1] in final)
         self.assertSubset(to_keep, final)
 
+    def test_pack_writes_revision_bitmap_index(self):
+        tree = self.make_branch_and_memory_tree('tree', format='2a')
+        tree.lock_write()
+        self.addCleanup(tree.unlock)
+        tree.add([''], [b'TREE_ROOT'])
+        revs = [tree.commit(str(i)) for i in range(3)]
+        repo = tree.branch.repository
+        self.assertIs(None, repo._pack_collection.get_revision_bitmap_index())
+        repo.pack()
+        bitmap_index = repo._pack_collection.get_revision_bitmap_index()
+        self.assertEqual(3, len(bitmap_index))
+        self.assertSubset([revs[-1]],
+                          bitmap_index.get_selected_revision_ids())
+
+    def test_pack_writes_commit_graph(self):
+        tree = self.make_branch_and_memory_tree('tree', format='2a')
+        tree.lock_write()
+        self.addCleanup(tree.unlock)
+        tree.add([''], [b'TREE_ROOT'])
+        revs = [tree.commit(str(i)) for i in range(3)]
+        repo = tree.branch.repository
+        self.assertIs(None, repo._pack_collection.get_commit_graph())
+        repo.pack()
+        commit_graph = repo._pack_collection.get_commit_graph()
+        self.assertEqual(3, len(commit_graph))
+        self.assertEqual({revs[0]: 1, revs[2]: 3},
+                         commit_graph.get_generations([revs[0], revs[2]]))
+        # The commit graph answers without touching the revision index
+        repo.revisions._index.get_parent_map = None
+        graph = repo.get_graph()
+        self.assertEqual({revs[2]: (revs[1],)},
+                         graph.get_parent_map([revs[2]]))
+        self.assertEqual({revs[2]}, graph.heads(revs))
+        known_graph = repo.get_known_graph_ancestry([revs[2]])
+        self.assertEqual(revs, known_graph.topo_sort())
+
+    def test_search_missing_revision_ids_uses_bitmaps(self):
+        tree = self.make_branch_and_memory_tree('tree', format='2a')
+        tree.lock_write()
+        self.addCleanup(tree.unlock)
+        tree.add([''], [b'TREE_ROOT'])
+        revs = [tree.commit(str(i)) for i in range(3)]
+        source = tree.branch.repository
+        target = self.make_repository('target', format='2a')
+        target.fetch(source, revs[1])
+        target.pack()
+        source.pack()
+        revs.append(tree.commit('3'))
+        target.lock_read()
+        self.addCleanup(target.unlock)
+        inter = vf_repository.InterVersionedFileRepository(source, target)
+        self.assertEqual(set(revs[2:]),
+                         inter._find_missing_with_bitmaps([revs[-1]]))
+        self.assertEqual(
+            set(revs[2:]),
+            target.search_missing_revision_ids(
+                source, revision_ids=[revs[-1]],
+                find_ghosts=False).get_keys())
+
+    def test_find_missing_with_bitmaps_not_used_remotely(self):
+        self.transport_server = test_server.SmartTCPServer_for_testing
+        tree = self.make_branch_and_memory_tree('tree', format='2a')
+        tree.lock_write()
+        self.addCleanup(tree.unlock)
+        tree.add([''], [b'TREE_ROOT'])
+        revs = [tree.commit(str(i)) for i in range(3)]
+        source = tree.branch.repository
+        target = self.make_repository('target', format='2a')
+        target.fetch(source, revs[1])
+        target.pack()
+        source.pack()
+        remote_target = repository.Repository.open(self.get_url('target'))
+        self.assertIsInstance(remote_target, remote.RemoteRepository)
+        remote_target.lock_read()
+        self.addCleanup(remote_target.unlock)
+        inter = vf_repository.InterVersionedFileRepository(
+            source, remote_target)
+        self.assertIs(None, inter._find_missing_with_bitmaps([revs[-1]]))
+
+    def test_revision_bitmap_index_kept_until_packs_change(self):
+        tree = self.make_branch_and_memory_tree('tree', format='2a')
+        tree.lock_write()
+        self.addCleanup(tree.unlock)
+        tree.add([''], [b'TREE_ROOT'])
+        tree.commit('1')
+        repo = tree.branch.repository
+        repo.pack()
+        packs = repo._pack_collection
+        bitmap_index = packs.get_revision_bitmap_index()
+        packs.reset()
+        self.assertIs(bitmap_index, packs.get_revision_bitmap_index())
+        tree.commit('2')
+        self.assertIsNot(bitmap_index, packs.get_revision_bitmap_index())
+
+    def test_no_key_filters_on_non_local_transports(self):
+        tree = self.make_branch_and_memory_tree('tree', format='2a')
+        tree.lock_write()
+        self.addCleanup(tree.unlock)
+        tree.add([''], [b'TREE_ROOT'])
+        tree.commit('1')
+        packs = tree.branch.repository._pack_collection
+        self.assertFalse(packs._use_key_filters())
+        name = packs.names()[0]
+        self.assertFalse(packs._index_transport.has(name + '.bix'))
+        combined_index = packs.revision_index.combined_index
+        self.assertEqual({}, combined_index._key_filters)
+
+    def test_raw_index_format_writes_raw_leaves(self):
+        tree = self.make_branch_and_memory_tree(
+            'tree', format='development-raw-index')
+        tree.lock_write()
+        self.addCleanup(tree.unlock)
+        tree.add([''], [b'TREE_ROOT'])
+        revs = [tree.commit(str(i)) for i in range(3)]
+        repo = tree.branch.repository
+        repo.pack()
+        pack = repo._pack_collection.get_pack_by_name(
+            repo._pack_collection.names()[0])
+        self.assertIsInstance(pack.revision_index,
+                              btree_index.BTreeRawLeafGraphIndex)
+        self.assertStartsWith(
+            repo._pack_collection._index_transport.get_bytes(
+                pack.name + '.rix'),
+            btree_index._BTSIGNATURE_RAW_LEAVES)
+        self.assertEqual({(revs[2],): ((revs[1],),)},
+                         repo.revisions.get_parent_map([(revs[2],)]))
+
     def test_stream_source_to_gc(self):
         source = self.make_repository('source', format='2a')
         target = self.make_repository('target', format='2a')
@@ -761,6 +891,34 @@ class Test2a(tests.TestCaseWithMemoryTransport):
         self.assertEqual(257, len(full_chk_records))
         self.assertSubset(simple_chk_records, full_chk_records)
 
+    def commit_with_text_threads(self, path, num_threads):
+        mt = self.make_branch_and_memory_tree(path, format='2a')
+        mt.branch.get_config_stack().set('commit.text_threads', num_threads)
+        mt.branch.nick = 'test'
+        mt.lock_write()
+        self.addCleanup(mt.unlock)
+        mt.add([''], [b'root-id'])
+        mt.mkdir('dir', b'dir-id')
+        for i in range(20):
+            mt.add(['dir/f%d' % i], [b'f%d-id' % i], ['file'])
+            mt.put_file_bytes_non_atomic('dir/f%d' % i, b'text %d\n' % i * i)
+        mt.commit('first', rev_id=b'rev-1', timestamp=0, timezone=0,
+                  committer='Joe Foo <joe@foo.com>')
+        return mt.branch.repository
+
+    def test_commit_text_threads_shares_groups(self):
+        repo = self.commit_with_text_threads('repo', 2)
+        details = repo.texts._index.get_build_details(
+            [(b'f%d-id' % i, b'rev-1') for i in range(20)])
+        self.assertEqual(
+            1, len(set(detail[0][:3] for detail in details.values())))
+
+    def test_commit_text_threads_deterministic(self):
+        repo1 = self.commit_with_text_threads('repo1', 1)
+        repo3 = self.commit_with_text_threads('repo3', 3)
+        self.assertEqual(repo1._pack_collection.names(),
+                         repo3._pack_collection.names())
+
     def test_inconsistency_fatal(self):
         repo = self.make_repository('repo', format='2a')
         self.assertTrue(repo.revisions._index._inconsistency_fatal)
@@ -769,6 +927,38 @@ class Test2a(tests.TestCaseWithMemoryTransport):
         self.assertFalse(repo.signatures._index._inconsistency_fatal)
         self.assertFalse(repo.chk_bytes._index._inconsistency_fatal)
 
+    def test_get_revision_deltas_reads_ahead(self):
+        builder = self.make_branch_builder('source', format='2a')
+        builder.start_series()
+        builder.build_snapshot(None, [
+            ('add', ('', b'root-id', 'directory', '')),
+            ('add', ('file', b'file-id', 'file', b'content\n'))],
+            revision_id=b'1')
+        for revno in range(2, 5):
+            builder.build_snapshot([b'%d' % (revno - 1)], [
+                ('modify', ('file', b'content-%d\n' % revno))],
+                revision_id=b'%d' % revno)
+        builder.finish_series()
+        repo = builder.get_branch().repository
+        repo.lock_read()
+        self.addCleanup(repo.unlock)
+        revisions = repo.get_revisions([b'4', b'3', b'2'])
+        chk_map.clear_cache()
+        requests = []
+        get_record_stream = repo.chk_bytes.get_record_stream
+
+        def logging_get_record_stream(keys, ordering, include_delta_closure):
+            keys = list(keys)
+            requests.append(keys)
+            return get_record_stream(keys, ordering, include_delta_closure)
+        repo.chk_bytes.get_record_stream = logging_get_record_stream
+        deltas = list(repo.get_revision_deltas(revisions))
+        self.assertEqual([[('file', 'file')]] * 3,
+                         [[c.path for c in d.modified] for d in deltas])
+        # The id_to_entry roots of all inventories are read in one go
+        self.assertEqual(1, len(requests))
+        self.assertEqual(4, len(requests[0]))
+
 
 class TestKnitPackStreamSource(tests.TestCaseWithMemoryTransport):
 
@@ -1407,6 +1597,80 @@ class TestRepositoryPackCollection(TestCaseWithTransport):
         r.control_transport.rmdir('obsolete_packs')
         packs._clear_obsolete_packs()
 
+    def test_packs_have_key_filters(self):
+        # Key filters are only used on local transports
+        tree = self.make_branch_and_tree('tree', format='2a')
+        tree.lock_write()
+        self.addCleanup(tree.unlock)
+        for i in range(2):
+            tree.commit(str(i), rev_id=b'rev-%d' % i)
+        repo = tree.branch.repository
+        packs = repo._pack_collection
+        self.assertEqual(2, len(packs.names()))
+        for name in packs.names():
+            self.assertTrue(packs._index_transport.has(name + '.bix'))
+        # Filters are read back from disk once the pack is reloaded
+        packs.reset()
+        packs.ensure_loaded()
+        pack = packs.get_pack_by_name(packs.names()[0])
+        key_filter = packs._get_key_filter(pack.name, 'revision')
+        for node in pack.revision_index.iter_all_entries():
+            self.assertTrue(node[1] in key_filter)
+        # Keys ruled out by the filters do not touch the indices
+        for pack in packs.all_packs():
+            pack.revision_index.iter_entries = None
+        self.assertEqual({}, repo.get_parent_map([b'missing']))
+
+    def test_obsolete_packs_moves_key_filters_of_any_client(self):
+        tree = self.make_branch_and_tree('tree', format='2a')
+        tree.lock_write()
+        self.addCleanup(tree.unlock)
+        tree.commit('1')
+        packs = tree.branch.repository._pack_collection
+        pack = packs.get_pack_by_name(packs.names()[0])
+        self.assertTrue(packs._index_transport.has(pack.name + '.bix'))
+        # A client that does not use key filters still moves them.
+        packs._use_key_filters = lambda: False
+        packs._remove_pack_from_memory(pack)
+        packs._obsolete_packs([pack])
+        self.assertFalse(packs._index_transport.has(pack.name + '.bix'))
+        self.assertTrue(
+            packs.transport.has('obsolete_packs/' + pack.name + '.bix'))
+
+    def test_obsolete_packs_without_key_filters(self):
+        tree = self.make_branch_and_tree('tree', format='2a')
+        tree.lock_write()
+        self.addCleanup(tree.unlock)
+        tree.commit('1')
+        packs = tree.branch.repository._pack_collection
+        pack = packs.get_pack_by_name(packs.names()[0])
+        # As written by a client that does not use key filters
+        packs._index_transport.delete(pack.name + '.bix')
+        packs._remove_pack_from_memory(pack)
+        packs._obsolete_packs([pack])
+        self.assertEqual(
+            [pack.name + suffix for suffix in
+             ['.cix', '.iix', '.pack', '.rix', '.six', '.tix']],
+            sorted(packs.transport.list_dir('obsolete_packs')))
+
+    def test_key_filters_not_left_behind_by_failed_finish(self):
+        repo = self.make_repository('repo', format='2a')
+        repo.lock_write()
+        self.addCleanup(repo.unlock)
+        packs = repo._pack_collection
+        new_pack = packs.pack_factory(packs, upload_suffix='.pack')
+        new_pack.text_index.add_node((b'file-id', b'rev-id'), b'1 2 3 4',
+                                     ([], ))
+
+        def fail_move(source, target):
+            raise errors.TransportNotPossible('failed move')
+        new_pack.upload_transport.move = fail_move
+        self.addCleanup(delattr, new_pack.upload_transport, 'move')
+        self.assertRaises(errors.TransportNotPossible, new_pack.finish)
+        self.assertEqual(
+            [], [name for name in packs._index_transport.list_dir('.')
+                 if name.endswith('.bix')])
+
 
 class TestPack(TestCaseWithTransport):
     """Tests for the Pack object."""
@@ -0,0 +1,127 @@
+# Copyright (C) 2020 Breezy Developers
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA
+
+"""Tests for breezy/bzr/revision_bitmap.py"""
+
+from ... import (
+    errors,
+    tests,
+    )
+from .. import (
+    revision_bitmap,
+    )
+
+
+# A - B - D - E
+#  \     /
+#   - C -      F (ghost parent G)
+ancestry = {
+    b'A': (),
+    b'B': (b'A',),
+    b'C': (b'A',),
+    b'D': (b'B', b'C'),
+    b'E': (b'D',),
+    b'F': (b'G',),
+    }
+
+
+class TestRevisionBitmapIndex(tests.TestCase):
+
+    def make_index(self, parent_map=ancestry, interval=2):
+        return revision_bitmap.RevisionBitmapIndex.build(
+            parent_map, interval=interval)
+
+    def get_ancestry(self, index, revision_ids, parent_map=ancestry):
+        bits, others = index.get_ancestry(
+            revision_ids,
+            lambda keys: dict((k, parent_map[k]) for k in keys
+                              if k in parent_map))
+        return set(index.iter_revision_ids(bits)), others
+
+    def test_build(self):
+        index = self.make_index()
+        self.assertEqual(6, len(index))
+        # Heads are always selected, even with a ghost in their ancestry
+        self.assertSubset([b'E', b'F'], index.get_selected_revision_ids())
+
+    def test_get_ancestry(self):
+        index = self.make_index()
+        self.assertEqual((set([b'A', b'B', b'C', b'D', b'E']), set()),
+                         self.get_ancestry(index, [b'E']))
+        self.assertEqual((set([b'A', b'C']), set()),
+                         self.get_ancestry(index, [b'C']))
+        self.assertEqual((set([b'F']), set()),
+                         self.get_ancestry(index, [b'F']))
+
+    def test_get_ancestry_ghost_filled_in(self):
+        index = self.make_index()
+        parent_map = dict(ancestry)
+        parent_map[b'G'] = (b'A',)
+        self.assertEqual((set([b'A', b'F']), set([b'G'])),
+                         self.get_ancestry(index, [b'F'], parent_map))
+
+    def test_get_ancestry_descendant_of_ghost_uses_bitmap(self):
+        parent_map = dict(ancestry)
+        parent_map[b'H'] = (b'E', b'F')
+        index = self.make_index(parent_map, interval=100)
+        queried = []
+
+        def get_parent_map(keys):
+            queried.extend(keys)
+            return dict((k, parent_map[k]) for k in keys if k in parent_map)
+        bits, others = index.get_ancestry([b'H'], get_parent_map)
+        self.assertEqual(set(parent_map), set(index.iter_revision_ids(bits)))
+        # Only the ghost is looked up, in case it was filled in
+        self.assertEqual([b'G'], queried)
+
+    def test_get_ancestry_unindexed(self):
+        index = self.make_index()
+        parent_map = dict(ancestry)
+        parent_map[b'H'] = (b'E', b'F')
+        self.assertEqual(
+            (set([b'A', b'B', b'C', b'D', b'E', b'F']), set([b'H'])),
+            self.get_ancestry(index, [b'H'], parent_map))
+
+    def test_bytes_roundtrip(self):
+        index = self.make_index()
+        index2 = revision_bitmap.RevisionBitmapIndex.from_bytes(
+            index.to_bytes())
+        self.assertEqual(index.get_selected_revision_ids(),
+                         index2.get_selected_revision_ids())
+        self.assertEqual(self.get_ancestry(index, [b'E', b'F']),
+                         self.get_ancestry(index2, [b'E', b'F']))
+
+    def test_from_bytes_invalid(self):
+        self.assertRaises(errors.BzrError,
+                          revision_bitmap.RevisionBitmapIndex.from_bytes,
+                          b'not a bitmap index')
+
+    def test_find_missing_revisions(self):
+        source_map = dict(ancestry)
+        source_map[b'H'] = (b'E',)
+        target_map = dict((k, ancestry[k]) for k in [b'A', b'B', b'C'])
+        target_map[b'D'] = ancestry[b'D']
+        source_index = self.make_index(source_map)
+        target_index = self.make_index(target_map)
+
+        def get_parent_map(parent_map):
+            return lambda keys: dict((k, parent_map[k]) for k in keys
+                                     if k in parent_map)
+        self.assertEqual(
+            set([b'E', b'H']),
+            revision_bitmap.find_missing_revisions(
+                source_index, get_parent_map(source_map), target_index,
+                get_parent_map(target_map), [b'H']))
@@ -0,0 +1,254 @@
+# Copyright (C) 2020 Breezy Developers
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA
+
+"""Tests for breezy/bzr/revno_cache.py"""
+
+from ... import (
+    tests,
+    )
+from .. import (
+    revno_cache,
+    )
+
+
+class TestRevnoCache(tests.TestCaseWithMemoryTransport):
+
+    def make_branch_with_merges(self):
+        builder = self.make_branch_builder('branch')
+        builder.start_series()
+        self.addCleanup(builder.finish_series)
+        builder.build_snapshot(None, [
+            ('add', ('', b'root-id', 'directory', None))],
+            revision_id=b'A')
+        builder.build_snapshot([b'A'], [], revision_id=b'B')
+        builder.build_snapshot([b'A'], [], revision_id=b'C')
+        builder.build_snapshot([b'B', b'C'], [], revision_id=b'D')
+        return builder
+
+    def make_cache(self, branch):
+        return revno_cache.RevnoCache(branch._transport, min_revisions=0)
+
+    def get_merge_sort(self, cache, branch):
+        revno, tip = branch.last_revision_info()
+        return [(n.key, n.merge_depth, n.revno, n.end_of_merge)
+                for n in cache.merge_sort(branch, revno, tip)]
+
+    def get_full_merge_sort(self, branch):
+        tip = branch.last_revision()
+        graph = branch.repository.get_known_graph_ancestry([tip])
+        return [(n.key, n.merge_depth, n.revno, n.end_of_merge)
+                for n in graph.merge_sort(tip)]
+
+    def test_no_cache(self):
+        builder = self.make_branch_with_merges()
+        branch = builder.get_branch()
+        cache = self.make_cache(branch)
+        self.assertIs(None, cache.read())
+        self.assertEqual(self.get_full_merge_sort(branch),
+                         self.get_merge_sort(cache, branch))
+        tip, nodes, first_child, ghosts = cache.read()
+        self.assertEqual(b'D', tip)
+        self.assertEqual([b'D', b'C', b'B', b'A'], [n.key for n in nodes])
+        self.assertEqual(set([b'D', b'C']), first_child)
+        self.assertEqual(set(), ghosts)
+
+    def test_short_history_not_written(self):
+        builder = self.make_branch_with_merges()
+        branch = builder.get_branch()
+        cache = revno_cache.RevnoCache(branch._transport)
+        self.get_merge_sort(cache, branch)
+        self.assertIs(None, cache.read())
+
+    def test_uses_cache_for_same_tip(self):
+        builder = self.make_branch_with_merges()
+        branch = builder.get_branch()
+        cache = self.make_cache(branch)
+        cache.write(b'D', [revno_cache.MergeSortNode(b'D', 0, (42,), True)],
+                    set(), set())
+        self.assertEqual([(b'D', 0, (42,), True)],
+                         self.get_merge_sort(cache, branch))
+
+    def test_extends_when_tip_moves_forward(self):
+        builder = self.make_branch_with_merges()
+        branch = builder.get_branch()
+        cache = self.make_cache(branch)
+        self.get_merge_sort(cache, branch)
+        builder.build_snapshot([b'C'], [], revision_id=b'E')
+        builder.build_snapshot([b'D', b'E'], [], revision_id=b'F')
+        branch = builder.get_branch()
+        self.assertEqual(self.get_full_merge_sort(branch),
+                         self.get_merge_sort(cache, branch))
+        self.assertEqual(b'F', cache.read()[0])
+        self.assertEqual(set([b'F', b'E']), cache.read()[2])
+
+    def test_rebuilds_when_history_rewritten(self):
+        builder = self.make_branch_with_merges()
+        branch = builder.get_branch()
+        cache = self.make_cache(branch)
+        self.get_merge_sort(cache, branch)
+        builder.build_snapshot([b'C', b'B'], [], revision_id=b'E')
+        branch = builder.get_branch()
+        self.assertEqual(self.get_full_merge_sort(branch),
+                         self.get_merge_sort(cache, branch))
+        self.assertEqual(b'E', cache.read()[0])
+
+    def make_branch_with_ghost(self):
+        builder = self.make_branch_with_merges()
+        builder.build_snapshot([b'D', b'G'], [], revision_id=b'E')
+        return builder
+
+    def fill_in_ghost(self, builder):
+        branch = builder.get_branch()
+        builder.build_snapshot([b'C'], [], revision_id=b'G')
+        branch.set_last_revision_info(4, b'E')
+        return builder.get_branch()
+
+    def test_records_ghosts(self):
+        builder = self.make_branch_with_ghost()
+        branch = builder.get_branch()
+        cache = self.make_cache(branch)
+        self.get_merge_sort(cache, branch)
+        self.assertEqual(set([b'G']), cache.read()[3])
+
+    def test_extend_records_ghosts(self):
+        builder = self.make_branch_with_merges()
+        branch = builder.get_branch()
+        cache = self.make_cache(branch)
+        self.get_merge_sort(cache, branch)
+        builder.build_snapshot([b'D', b'G'], [], revision_id=b'E')
+        branch = builder.get_branch()
+        self.assertEqual(self.get_full_merge_sort(branch),
+                         self.get_merge_sort(cache, branch))
+        self.assertEqual(set([b'G']), cache.read()[3])
+
+    def test_rebuilds_when_ghost_filled_in(self):
+        builder = self.make_branch_with_ghost()
+        branch = builder.get_branch()
+        cache = self.make_cache(branch)
+        self.get_merge_sort(cache, branch)
+        branch = self.fill_in_ghost(builder)
+        self.assertIs(None, self.get_iter_merge_sort(cache, branch))
+        full_merge_sort = self.get_full_merge_sort(branch)
+        self.assertIn(b'G', [key for key, _, _, _ in full_merge_sort])
+        self.assertEqual(full_merge_sort, self.get_merge_sort(cache, branch))
+        self.assertEqual(set(), cache.read()[3])
+        self.assertEqual(full_merge_sort,
+                         self.get_iter_merge_sort(cache, branch))
+
+    def test_invalid_cache_ignored(self):
+        builder = self.make_branch_with_merges()
+        branch = builder.get_branch()
+        branch._transport.put_bytes('revno-cache', b'garbage\n')
+        cache = self.make_cache(branch)
+        self.assertIs(None, cache.read())
+        self.assertEqual(self.get_full_merge_sort(branch),
+                         self.get_merge_sort(cache, branch))
+
+    def test_invalidate(self):
+        builder = self.make_branch_with_merges()
+        branch = builder.get_branch()
+        cache = self.make_cache(branch)
+        self.get_merge_sort(cache, branch)
+        cache.invalidate()
+        self.assertIs(None, cache.read())
+        cache.invalidate()
+
+    def get_iter_merge_sort(self, cache, branch):
+        revno, tip = branch.last_revision_info()
+        nodes = cache.iter_merge_sort(branch, revno, tip)
+        if nodes is None:
+            return None
+        return [(n.key, n.merge_depth, n.revno, n.end_of_merge)
+                for n in nodes]
+
+    def test_iter_merge_sort(self):
+        builder = self.make_branch_with_merges()
+        branch = builder.get_branch()
+        cache = self.make_cache(branch)
+        self.assertIs(None, self.get_iter_merge_sort(cache, branch))
+        self.get_merge_sort(cache, branch)
+        self.assertEqual(self.get_full_merge_sort(branch),
+                         self.get_iter_merge_sort(cache, branch))
+        # Not used once the tip moves
+        builder.build_snapshot([b'D'], [], revision_id=b'E')
+        branch = builder.get_branch()
+        self.assertIs(None, self.get_iter_merge_sort(cache, branch))
+
+    def test_iter_merge_sort_is_lazy(self):
+        builder = self.make_branch_with_merges()
+        branch = builder.get_branch()
+        cache = self.make_cache(branch)
+        cache.write(b'D', [revno_cache.MergeSortNode(b'D', 0, (42,), True)],
+                    set(), set())
+        branch._transport.append_bytes('revno-cache', b'garbage\n')
+        nodes = cache.iter_merge_sort(branch, 3, b'D')
+        self.assertEqual(b'D', next(nodes).key)
+        # The cache is only found to be invalid when the bad line is read,
+        # carrying on with a fresh merge sort
+        self.assertEqual(self.get_full_merge_sort(branch)[1:],
+                         [(n.key, n.merge_depth, n.revno, n.end_of_merge)
+                          for n in nodes])
+        self.assertEqual(self.get_full_merge_sort(branch),
+                         self.get_iter_merge_sort(cache, branch))
+
+
+class TestBranchUsesRevnoCache(tests.TestCaseWithTransport):
+
+    def test_iter_merge_sorted_revisions_streams_cache(self):
+        builder = self.make_branch_builder('branch')
+        builder.start_series()
+        builder.build_snapshot(None, [
+            ('add', ('', b'root-id', 'directory', None))],
+            revision_id=b'A')
+        builder.build_snapshot([b'A'], [], revision_id=b'B')
+        builder.finish_series()
+        branch = builder.get_branch()
+        revno_cache.RevnoCache(branch._transport, min_revisions=0).write(
+            b'B', [revno_cache.MergeSortNode(b'B', 0, (42,), False),
+                   revno_cache.MergeSortNode(b'A', 0, (41,), True)],
+            set([b'B']), set())
+        with branch.lock_read():
+            self.assertEqual(
+                [(b'B', 0, (42,), False), (b'A', 0, (41,), True)],
+                list(branch.iter_merge_sorted_revisions()))
+            self.assertIs(None, branch._merge_sorted_revisions_cache)
+
+    def test_revision_id_to_dotted_revno_streams_cache(self):
+        builder = self.make_branch_builder('branch')
+        builder.start_series()
+        builder.build_snapshot(None, [
+            ('add', ('', b'root-id', 'directory', None))],
+            revision_id=b'A')
+        builder.build_snapshot([b'A'], [], revision_id=b'B')
+        builder.build_snapshot([b'A'], [], revision_id=b'C')
+        builder.build_snapshot([b'B', b'C'], [], revision_id=b'D')
+        builder.finish_series()
+        branch = builder.get_branch()
+        revno_cache.RevnoCache(branch._transport, min_revisions=0).write(
+            b'D', [revno_cache.MergeSortNode(b'D', 0, (42,), False),
+                   revno_cache.MergeSortNode(b'C', 1, (41, 1, 1), True),
+                   revno_cache.MergeSortNode(b'B', 0, (41,), False)],
+            set([b'D', b'C']), set())
+        # A is past the lines of the cache, so finding it would need a merge
+        # sort
+        branch._transport.append_bytes('revno-cache', b'garbage\n')
+        with branch.lock_read():
+            self.assertEqual((41, 1, 1),
+                             branch.revision_id_to_dotted_revno(b'C'))
+            self.assertEqual(
+                b'C', branch.dotted_revno_to_revision_id((41, 1, 1)))
+            self.assertIs(None, branch._revision_id_to_revno_cache)
+            self.assertIs(None, branch._merge_sorted_revisions_cache)
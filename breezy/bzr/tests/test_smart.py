@@ -26,6 +26,7 @@ Tests for low-level protocol encoding are found in test_smart_transport.
 
 import bz2
 from io import BytesIO
+import os
 import tarfile
 import zlib
 
@@ -1736,6 +1737,58 @@ class TestSmartServerRepositoryGetParentMap(tests.TestCaseWithMemoryTransport):
             request.do_body(b'\n\n0\n'))
 
 
+class TestSmartServerRepositoryGetParentMapGenerations(
+        tests.TestCaseWithMemoryTransport):
+
+    def make_chain(self):
+        tree = self.make_branch_and_memory_tree('.')
+        tree.lock_write()
+        tree.add('')
+        for i in range(5):
+            tree.commit('commit %d' % i, rev_id=b'rev-%d' % i)
+        tree.unlock()
+
+    def get_parent_lines(self, max_generations, max_size, *revision_ids):
+        backing = self.get_transport()
+        request = smart_repo.SmartServerRepositoryGetParentMapGenerations(
+            backing)
+        self.assertEqual(
+            None,
+            request.execute(b'', max_generations, max_size, *revision_ids))
+        response = request.do_body(b'\n\n0\n')
+        self.assertEqual((b'ok', ), response.args)
+        return sorted(bz2.decompress(response.body).split(b'\n'))
+
+    def test_unlimited_generations(self):
+        self.make_chain()
+        self.assertEqual(
+            [b'rev-0', b'rev-1 rev-0', b'rev-2 rev-1', b'rev-3 rev-2',
+             b'rev-4 rev-3'],
+            self.get_parent_lines(b'0', b'65536', b'rev-4'))
+
+    def test_limited_generations(self):
+        self.make_chain()
+        self.assertEqual(
+            [b'rev-3 rev-2', b'rev-4 rev-3'],
+            self.get_parent_lines(b'1', b'65536', b'rev-4'))
+
+    def test_include_missing(self):
+        self.make_chain()
+        self.assertEqual(
+            [b'missing:missing-id', b'rev-0', b'rev-1 rev-0'],
+            self.get_parent_lines(
+                b'0', b'65536', b'rev-1', b'missing-id', b'include-missing:'))
+
+    def test_invalid_limits(self):
+        backing = self.get_transport()
+        request = smart_repo.SmartServerRepositoryGetParentMapGenerations(
+            backing)
+        self.make_branch_and_memory_tree('.')
+        self.assertRaises(
+            errors.SmartProtocolError,
+            request.execute, b'', b'many', b'65536', b'rev-1')
+
+
 class TestSmartServerRepositoryGetRevisionGraph(
         tests.TestCaseWithMemoryTransport):
 
@@ -1987,6 +2040,154 @@ class TestSmartServerRepositoryIterFilesBytes(tests.TestCaseWithTransport):
                          b"absent\x00thefileid\x00revision\x000\n")
 
 
+class TestResponseCache(tests.TestCaseWithTransport):
+
+    def setUp(self):
+        super(TestResponseCache, self).setUp()
+        self.tree = self.make_branch_and_tree('.', format='2a')
+        self.tree.commit('1st commit', rev_id=b'rev1')
+        self.tree.commit('2nd commit', rev_id=b'rev2')
+
+    def make_cache(self, *args, **kwargs):
+        cache = smart_repo.ResponseCache(*args, **kwargs)
+        self.addCleanup(cache.close)
+        self.overrideAttr(smart_repo, '_response_cache', cache)
+        return cache
+
+    def iter_revisions(self, body):
+        request = smart_repo.SmartServerRepositoryIterRevisions(
+            self.get_transport())
+        self.assertIs(None, request.execute(b''))
+        response = request.do_body(body)
+        self.assertTrue(response.is_successful())
+        return b''.join(response.body_stream)
+
+    def test_not_cached_by_default(self):
+        self.assertIs(None, smart_repo._response_cache)
+
+    def test_hit(self):
+        cache = self.make_cache(1024 * 1024)
+        contents = self.iter_revisions(b'rev1\nrev2')
+        self.assertEqual((0, 1), (cache.hits, cache.misses))
+        self.assertEqual(contents, self.iter_revisions(b'rev1\nrev2'))
+        self.assertEqual((1, 1), (cache.hits, cache.misses))
+        self.iter_revisions(b'rev1')
+        self.assertEqual((1, 2), (cache.hits, cache.misses))
+
+    def test_absent_not_cached(self):
+        cache = self.make_cache(1024 * 1024)
+        contents = self.iter_revisions(b'rev1\nrev3')
+        self.assertEqual(contents, self.iter_revisions(b'rev1\nrev3'))
+        self.assertEqual((0, 2), (cache.hits, cache.misses))
+
+    def test_unfinished_stream_not_cached(self):
+        cache = self.make_cache(1024 * 1024)
+        request = smart_repo.SmartServerRepositoryIterRevisions(
+            self.get_transport())
+        request.execute(b'')
+        response = request.do_body(b'rev1\nrev2')
+        next(response.body_stream)
+        self.iter_revisions(b'rev1\nrev2')
+        self.assertEqual((0, 2), (cache.hits, cache.misses))
+
+    def test_get_parent_map(self):
+        cache = self.make_cache(1024 * 1024)
+        request = smart_repo.SmartServerRepositoryGetParentMap(
+            self.get_transport())
+        self.assertIs(None, request.execute(b'', b'rev2'))
+        response = request.do_body(b'\n\n0\n')
+        request = smart_repo.SmartServerRepositoryGetParentMap(
+            self.get_transport())
+        self.assertIs(None, request.execute(b'', b'rev2'))
+        self.assertEqual(response, request.do_body(b'\n\n0\n'))
+        self.assertEqual((1, 1), (cache.hits, cache.misses))
+
+    def test_get_parent_map_with_ghost_not_cached(self):
+        cache = self.make_cache(1024 * 1024)
+        self.tree.set_parent_ids([b'rev2', b'ghost'],
+                                 allow_leftmost_as_ghost=True)
+        self.tree.commit('merge a ghost', rev_id=b'rev3')
+        for i in range(2):
+            request = smart_repo.SmartServerRepositoryGetParentMap(
+                self.get_transport())
+            self.assertIs(None, request.execute(b'', b'rev3'))
+            self.assertTrue(request.do_body(b'\n\n0\n').is_successful())
+        self.assertEqual((0, 2), (cache.hits, cache.misses))
+
+    def test_get_revision_signature_text(self):
+        cache = self.make_cache(1024 * 1024)
+        repo = self.tree.branch.repository
+        with repo.lock_write():
+            repo.start_write_group()
+            repo.sign_revision(b'rev1', gpg.LoopbackGPGStrategy(None))
+            repo.commit_write_group()
+        responses = []
+        for i in range(2):
+            request = smart_repo.SmartServerRepositoryGetRevisionSignatureText(
+                self.get_transport())
+            responses.append(request.execute(b'', b'rev1'))
+        self.assertTrue(responses[0].is_successful())
+        self.assertEqual(responses[0], responses[1])
+        self.assertEqual((1, 1), (cache.hits, cache.misses))
+
+    def test_get_revision_signature_text_missing_not_cached(self):
+        cache = self.make_cache(1024 * 1024)
+        for i in range(2):
+            request = smart_repo.SmartServerRepositoryGetRevisionSignatureText(
+                self.get_transport())
+            self.assertEqual(
+                smart_req.FailedSmartServerResponse(
+                    (b'nosuchrevision', b'rev1')),
+                request.execute(b'', b'rev1'))
+        self.assertEqual((0, 2), (cache.hits, cache.misses))
+
+    def test_forgotten_repositories(self):
+        self.overrideAttr(smart_repo.ResponseCache, '_max_repositories', 2)
+        cache = self.make_cache(1024 * 1024)
+        for path in ['other1', 'other2']:
+            self.make_branch_and_tree(path, format='2a')
+            other = smart_repo.SmartServerRepositoryIterRevisions(
+                self.get_transport())
+            other.execute(path.encode('ascii'))
+            other.do_body(b'rev1')
+        self.assertLength(2, cache._repositories)
+        self.iter_revisions(b'rev1')
+        self.assertEqual([self.tree.branch.repository.control_url],
+                         list(cache._repositories.keys()))
+
+    def test_new_packs_keep_cache(self):
+        cache = self.make_cache(1024 * 1024)
+        self.iter_revisions(b'rev1')
+        self.tree.commit('3rd commit', rev_id=b'rev3')
+        self.iter_revisions(b'rev1')
+        self.assertEqual((1, 1, 0),
+                         (cache.hits, cache.misses, cache.invalidations))
+
+    def test_removed_packs_invalidate(self):
+        cache = self.make_cache(1024 * 1024)
+        contents = self.iter_revisions(b'rev1')
+        self.tree.branch.repository.pack()
+        self.assertEqual(contents, self.iter_revisions(b'rev1'))
+        self.assertEqual((0, 2, 1),
+                         (cache.hits, cache.misses, cache.invalidations))
+        self.iter_revisions(b'rev1')
+        self.assertEqual((1, 2), (cache.hits, cache.misses))
+
+    def test_disk(self):
+        self.build_tree(['cache/'])
+        # Too small to hold anything in memory
+        cache = self.make_cache(10, disk_dir='cache',
+                                max_disk_size=1024 * 1024)
+        contents = self.iter_revisions(b'rev1\nrev2')
+        [cache_dir] = os.listdir('cache')
+        self.assertLength(1, os.listdir(os.path.join('cache', cache_dir)))
+        self.assertEqual(contents, self.iter_revisions(b'rev1\nrev2'))
+        self.assertEqual((1, 1), (cache.hits, cache.misses))
+        self.assertEqual(0, cache.stats()['size'])
+        cache.close()
+        self.assertEqual([], os.listdir('cache'))
+
+
 class TestSmartServerRequestHasSignatureForRevisionId(
         tests.TestCaseWithMemoryTransport):
 
@@ -2609,6 +2810,9 @@ class TestHandlers(tests.TestCase):
                                 smart_repo.SmartServerRepositoryGatherStats)
         self.assertHandlerEqual(b'Repository.get_parent_map',
                                 smart_repo.SmartServerRepositoryGetParentMap)
+        self.assertHandlerEqual(
+            b'Repository.get_parent_map_generations',
+            smart_repo.SmartServerRepositoryGetParentMapGenerations)
         self.assertHandlerEqual(b'Repository.get_physical_lock_status',
                                 smart_repo.SmartServerRepositoryGetPhysicalLockStatus)
         self.assertHandlerEqual(b'Repository.get_rev_id_for_revno',
@@ -698,6 +698,54 @@ class TestSmartClientStreamMediumRequest(tests.TestCase):
         self.assertRaises(errors.TooManyConcurrentRequests,
                           medium.SmartClientStreamMediumRequest, client_medium)
 
+    def test_pipelined_request_while_another_request_writing_throws(self):
+        # A pipelined request can not be started until the current request
+        # has been completely written.
+        output = BytesIO()
+        client_medium = medium.SmartSimplePipesClientMedium(
+            None, output, 'base')
+        medium.SmartClientStreamMediumRequest(client_medium)
+        self.assertRaises(errors.TooManyConcurrentRequests,
+                          medium.SmartClientStreamMediumRequest, client_medium,
+                          pipelined=True)
+
+    def test_pipelined_request_after_sent_request(self):
+        output = BytesIO()
+        client_medium = medium.SmartSimplePipesClientMedium(
+            None, output, 'base')
+        first = medium.SmartClientStreamMediumRequest(client_medium)
+        first.finished_writing()
+        self.assertRaises(errors.TooManyConcurrentRequests,
+                          medium.SmartClientStreamMediumRequest, client_medium)
+        second = medium.SmartClientStreamMediumRequest(
+            client_medium, pipelined=True)
+        self.assertIs(second, client_medium._current_request)
+        self.assertEqual([first], list(client_medium._pipelined_requests))
+
+    def test_pipelined_responses_read_in_order(self):
+        input = BytesIO(b'first\nsecond\n')
+        output = BytesIO()
+        client_medium = medium.SmartSimplePipesClientMedium(
+            input, output, 'base')
+        first = medium.SmartClientStreamMediumRequest(client_medium)
+        first.accept_bytes(b'1')
+        first.finished_writing()
+        second = medium.SmartClientStreamMediumRequest(
+            client_medium, pipelined=True)
+        second.accept_bytes(b'2')
+        second.finished_writing()
+        self.assertEqual(b'12', output.getvalue())
+        # The second response can not be read before the first.
+        self.assertRaises(errors.TooManyConcurrentRequests,
+                          second.read_line)
+        self.assertEqual(b'first\n', first.read_line())
+        first.finished_reading()
+        self.assertIs(second, client_medium._current_request)
+        self.assertEqual(b'second\n', second.read_line())
+        second.finished_reading()
+        self.assertIs(None, client_medium._current_request)
+        self.assertEqual(0, len(client_medium._pipelined_requests))
+
     def test_finished_read_clears_current_request(self):
         # calling finished_reading clears the current request from the requests
         # medium
@@ -1041,6 +1089,20 @@ class TestSmartServerStreamMedium(tests.TestCase):
         server._disconnect_client()
         self.assertEqual(b'', client_sock.recv(1))
 
+    def test_socket_stream_with_pipelined_requests(self):
+        # A request that has already been read along with the previous one is
+        # served without waiting for more bytes from the client.
+        hello_request = (
+            protocol.MESSAGE_VERSION_THREE + b'\x00\x00\x00\x02de' +
+            b's\x00\x00\x00\x09l5:helloe' + b'e')
+        server, client_sock = self.create_socket_context(None, timeout=0.1)
+        client_sock.sendall(hello_request * 2)
+        server._serve_one_request(server._build_protocol())
+        server._serve_one_request(server._build_protocol())
+        self.assertFalse(server.finished)
+        self.assertRaises(errors.ConnectionTimeout, server._build_protocol)
+        server._disconnect_client()
+
     def test_pipe_like_stream_error_handling(self):
         # Use plain python BytesIO so we can monkey-patch the close method to
         # not discard the contents.
@@ -1490,6 +1552,186 @@ class TestSmartTCPServer(tests.TestCase):
         server_thread.join()
 
 
+class TestSmartSelectorTCPServer(tests.TestCase):
+
+    def make_server(self, workers=2, client_timeout=4.0):
+        """Create a SmartSelectorTCPServer, and start it in a thread.
+
+        :return: (server, server_thread)
+        """
+        t = _mod_transport.get_transport_from_url('memory:///')
+        server = _mod_server.SmartSelectorTCPServer(
+            t, client_timeout=client_timeout, workers=workers)
+        server._ACCEPT_TIMEOUT = 0.1
+        server.start_server('127.0.0.1', 0)
+        server_thread = threading.Thread(target=server.serve,
+                                         args=(self.id(),))
+        server_thread.start()
+        self.addCleanup(self.shutdown_server_cleanly, server, server_thread)
+        server._started.wait()
+        return server, server_thread
+
+    def shutdown_server_cleanly(self, server, server_thread):
+        server._stop_gracefully()
+        server._stopped.wait()
+        server._fully_stopped.wait()
+        server_thread.join()
+
+    def connect_to_server(self, server):
+        client_sock = socket.socket()
+        client_sock.connect(server._server_socket.getsockname())
+        self.addCleanup(client_sock.close)
+        return client_sock
+
+    def say_hello(self, client_sock):
+        client_sock.send(b'hello\n')
+        self.assertEqual(b'ok\x012\n', client_sock.recv(5))
+
+    def wait_for(self, condition):
+        for i in range(500):
+            if condition():
+                return
+            time.sleep(0.01)
+        self.fail('timed out waiting for %r' % (condition,))
+
+    def test_serves_requests(self):
+        server, server_thread = self.make_server()
+        client_sock = self.connect_to_server(server)
+        self.say_hello(client_sock)
+        self.say_hello(client_sock)
+        self.assertEqual(1, len(server._active_connections))
+        self.wait_for(lambda: server.metrics.requests == 2)
+
+    def test_more_clients_than_workers(self):
+        server, server_thread = self.make_server(workers=2)
+        client_socks = [self.connect_to_server(server) for i in range(10)]
+        for client_sock in client_socks:
+            client_sock.send(b'hello\n')
+        for client_sock in client_socks:
+            self.assertEqual(b'ok\x012\n', client_sock.recv(5))
+        metrics = server.metrics.as_dict()
+        self.assertEqual(10, metrics['connections'])
+        self.assertLessEqual(metrics['active_workers'], 2)
+        self.wait_for(lambda: server.metrics.requests == 10)
+
+    def test_serves_pipelined_requests_in_order(self):
+        server, server_thread = self.make_server()
+        client_sock = self.connect_to_server(server)
+        client_sock.sendall(b'hello\nget\x01nonexistent\nhello\n')
+        expected = b'ok\x012\nNoSuchFile\x01./nonexistent\nok\x012\n'
+        received = b''
+        while len(received) < len(expected):
+            data = client_sock.recv(1024)
+            if not data:
+                break
+            received += data
+        self.assertEqual(expected, received)
+
+    def test_client_hangup_closes_connection(self):
+        server, server_thread = self.make_server()
+        client_sock = self.connect_to_server(server)
+        self.say_hello(client_sock)
+        client_sock.close()
+        self.wait_for(lambda: not server._active_connections)
+        self.assertEqual(0, server.metrics.connections)
+
+    def test_idle_clients_are_disconnected(self):
+        server, server_thread = self.make_server(client_timeout=0.1)
+        client_sock = self.connect_to_server(server)
+        self.say_hello(client_sock)
+        self.assertEqual(b'', client_sock.recv(1))
+        self.assertContainsRe(
+            self.get_log(), 'disconnecting client after 0.1 seconds')
+
+    def test_stop_gracefully_closes_idle_connections(self):
+        server, server_thread = self.make_server()
+        client_sock = self.connect_to_server(server)
+        self.say_hello(client_sock)
+        self.shutdown_server_cleanly(server, server_thread)
+        self.assertEqual([], server._active_connections)
+        self.assertEqual(b'', client_sock.recv(1))
+
+    def test_stops_reading_when_buffer_is_full(self):
+        # A client sending faster than its requests are served is not read
+        # from until the workers have caught up.
+        self.overrideAttr(_mod_server.SmartSelectorTCPServer,
+                          '_MAX_CLIENT_BUFFER', 10)
+        server = _mod_server.SmartSelectorTCPServer(None, client_timeout=4.0)
+        submitted = []
+
+        class Executor(object):
+            def submit(self, fn):
+                submitted.append(fn)
+
+        server._executor = Executor()
+        server_sock, client_sock = portable_socket_pair()
+        self.addCleanup(client_sock.close)
+        conn = server.serve_conn(server_sock)
+        client_sock.sendall(b'x' * 20)
+        self.wait_for(lambda: (server._poll_active_connections(0.01) or
+                               conn.in_buffer_len == 20))
+        self.assertEqual([conn.serve_received_bytes], submitted)
+        self.assertTrue(conn.busy)
+        self.assertFalse(conn.reading)
+        # Once the worker has taken the bytes, reading resumes.
+        with conn.lock:
+            conn.in_buffer = []
+            conn.in_buffer_len = 0
+        server._wake_up(conn)
+        server._poll_active_connections(0.01)
+        self.assertTrue(conn.reading)
+        server._close_connection(conn)
+
+    def test_stop_gracefully_while_holding_connection_lock(self):
+        # The signal handler may interrupt the selector loop while it holds
+        # a connection lock, so it must not take it.
+        server = _mod_server.SmartSelectorTCPServer(None, client_timeout=4.0)
+        server_sock, client_sock = portable_socket_pair()
+        self.addCleanup(client_sock.close)
+        conn = server.serve_conn(server_sock)
+        with conn.lock:
+            server._stop_gracefully()
+            self.assertFalse(conn.stopping)
+        server._poll_active_connections(0.01)
+        self.assertTrue(conn.stopping)
+        self.assertTrue(conn.finished)
+        self.assertEqual([], server._active_connections)
+        self.assertEqual(b'', client_sock.recv(1))
+
+    def test_write_to_client_not_reading_times_out(self):
+        self.overrideAttr(_mod_server.SmartSelectorTCPServer,
+                          '_SEND_TIMEOUT', 0.1)
+        server = _mod_server.SmartSelectorTCPServer(None, client_timeout=4.0)
+        server_sock, client_sock = portable_socket_pair()
+        self.addCleanup(client_sock.close)
+        conn = server.serve_conn(server_sock)
+        self.addCleanup(server._close_connection, conn)
+        self.assertRaises(errors.ConnectionTimeout,
+                          conn._write_out, b'x' * (64 * 1024 * 1024))
+
+
+class TestSmartServerMetrics(tests.TestCase):
+
+    def test_as_dict(self):
+        metrics = _mod_server.SmartServerMetrics()
+        metrics._connection_opened()
+        metrics._queued()
+        metrics._queued()
+        metrics._worker_started()
+        metrics._request_served(1.0)
+        metrics._request_served(3.0)
+        self.assertEqual({
+            'connections': 1,
+            'queue_depth': 1,
+            'max_queue_depth': 2,
+            'active_workers': 1,
+            'requests': 2,
+            'total_latency': 4.0,
+            'mean_latency': 2.0,
+            'max_latency': 3.0,
+            }, metrics.as_dict())
+
+
 class SmartTCPTests(tests.TestCase):
     """Tests for connection/end to end behaviour using the TCP server.
 
@@ -3779,6 +4021,58 @@ class Test_SmartClient(tests.TestCase):
         # XXX: need a test that smart_client._headers is passed to the request
         # encoder.
 
+    def make_pipes_client(self, response):
+        input = BytesIO(response)
+        output = BytesIO()
+        client_medium = medium.SmartSimplePipesClientMedium(
+            input, output, 'base')
+        client_medium._protocol_version = 3
+        return output, client._SmartClient(client_medium, headers={})
+
+    def make_response(self, response):
+        response_io = BytesIO()
+        responder = protocol.ProtocolThreeResponder(response_io.write)
+        responder.send_response(response)
+        return response_io.getvalue()
+
+    def test_call_many_pipelines_requests(self):
+        response = (
+            self.make_response(_mod_request.SuccessfulSmartServerResponse(
+                (b'ok',), body=b'one')) +
+            self.make_response(_mod_request.SuccessfulSmartServerResponse(
+                (b'ok',), body=b'two')))
+        output, smart_client = self.make_pipes_client(response)
+        self.assertTrue(smart_client._medium.can_pipeline())
+        results = smart_client.call_many_with_body_bytes_expecting_body(
+            [(b'foo', (b'1',), b'a'), (b'foo', (b'2',), b'b')])
+        self.assertEqual([(b'ok',), (b'ok',)], [r[0] for r in results])
+        self.assertEqual([b'one', b'two'],
+                         [r[1].read_body_bytes() for r in results])
+        self.assertEqual(2, output.getvalue().count(b'l3:foo'))
+        self.assertIs(None, smart_client._medium._current_request)
+
+    def test_call_many_reads_all_responses_before_raising(self):
+        response = (
+            self.make_response(_mod_request.FailedSmartServerResponse(
+                (b'error', b'one'))) +
+            self.make_response(_mod_request.SuccessfulSmartServerResponse(
+                (b'ok',), body=b'two')))
+        output, smart_client = self.make_pipes_client(response)
+        e = self.assertRaises(
+            errors.ErrorFromSmartServer,
+            smart_client.call_many_with_body_bytes_expecting_body,
+            [(b'foo', (b'1',), b'a'), (b'foo', (b'2',), b'b')])
+        self.assertEqual((b'error', b'one'), e.error_tuple)
+        # The medium is ready for the next request.
+        self.assertIs(None, smart_client._medium._current_request)
+        self.assertEqual(0, len(smart_client._medium._pipelined_requests))
+
+    def test_call_many_unicode_method(self):
+        smart_client = client._SmartClient('dummy medium')
+        self.assertRaises(
+            TypeError, smart_client.call_many_with_body_bytes_expecting_body,
+            [(u'method', (b'a',), b'b')])
+
 
 class Test_SmartClientRequest(tests.TestCase):
 
@@ -43,7 +43,9 @@ class TestSmartServerCommit(TestCaseWithTransport):
         # being too low. If rpc_count increases, more network roundtrips have
         # become necessary for this use case. Please do not adjust this number
         # upwards without agreement from bzr's network support maintainers.
-        self.assertLength(211, self.hpss_calls)
+        # 10 of these calls retire the key filters (.bix) of the autopacked
+        # packs, which were written by a local client.
+        self.assertLength(221, self.hpss_calls)
         self.assertLength(2, self.hpss_connections)
         self.expectFailure("commit still uses VFS calls",
                            self.assertThat, self.hpss_calls, ContainsNoVfsCalls)
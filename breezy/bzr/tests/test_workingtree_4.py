@@ -22,7 +22,9 @@ import time
 
 from ... import (
     errors,
+    filters,
     osutils,
+    revision as _mod_revision,
     )
 from .. import (
     bzrdir,
@@ -720,6 +722,42 @@ class TestWorkingTreeFormat4(TestCaseWithTransport):
         self.assertEqual(expected_sha1, entry[1][0][1])
         self.assertEqual(len('a bit of content for foo\n'), entry[1][0][2])
 
+    def test_commit_updates_hash_cache_with_content_filters(self):
+        tree = self.get_tree_with_cachable_file_foo()
+
+        def append_line(chunks, context=None):
+            return chunks + [b'appended\n']
+        tree._content_filter_stack = lambda path: [
+            filters.ContentFilter(append_line, None)]
+        tree.commit('a commit')
+        # The canonical sha1 is cached along with the stat of the file on
+        # disk, so that it is found again by the next status.
+        entry = tree._get_entry(path='foo')
+        self.assertEqual(
+            osutils.sha_string(b'a bit of content for foo\nappended\n'),
+            entry[1][0][1])
+        self.assertEqual(os.lstat('foo').st_size, entry[1][0][2])
+        self.assertEqual(dirstate.pack_stat(os.lstat('foo')), entry[1][0][4])
+
+    def test_content_filter_stacks_looked_up_per_directory(self):
+        tree = self.make_branch_and_tree('.')
+        self.build_tree(['a', 'b', 'dir/', 'dir/c', 'dir/d'])
+        tree.add(['a', 'b', 'dir', 'dir/c', 'dir/d'])
+        batches = []
+        real_iter_stacks = tree._iter_content_filter_stacks
+
+        def iter_stacks(paths):
+            batches.append(sorted(paths))
+            return real_iter_stacks(paths)
+        tree._iter_content_filter_stacks = iter_stacks
+        with tree.lock_read():
+            tree.current_dirstate()._read_dirblocks_if_needed()
+            self.assertEqual([], tree._content_filter_stack('dir/c'))
+            self.assertEqual([], tree._content_filter_stack('dir/d'))
+            self.assertEqual([], tree._content_filter_stack('a'))
+            self.assertEqual([], tree._content_filter_stack('b'))
+        self.assertEqual([['dir/c', 'dir/d'], ['a', 'b']], batches)
+
     def test_observed_sha1_cachable(self):
         tree = self.get_tree_with_cachable_file_foo()
         expected_sha1 = osutils.sha_file_by_name('foo')
@@ -765,6 +803,210 @@ class TestWorkingTreeFormat4(TestCaseWithTransport):
         self.assertEqual([b"contents of foo\n"], file_obj.readlines())
 
 
+    def test_paths2ids_reads_only_needed_dirblocks(self):
+        tree = self.make_branch_and_tree('.')
+        self.build_tree(['a/', 'a/f', 'b/', 'b/g', 'c'])
+        tree.add(['a', 'a/f', 'b', 'b/g', 'c'],
+                 [b'a-id', b'f-id', b'b-id', b'g-id', b'c-id'])
+        tree.commit('one')
+        tree.rename_one('a/f', 'b/f')
+        tree.lock_read()
+        self.addCleanup(tree.unlock)
+        basis = tree.basis_tree()
+        basis.lock_read()
+        self.addCleanup(basis.unlock)
+        state = tree.current_dirstate()
+        self.assertEqual(dirstate.DirState.NOT_IN_MEMORY,
+                         state._dirblock_state)
+        self.assertEqual({b'b-id', b'f-id', b'g-id'}, tree.paths2ids(['b']))
+        # The basis entry of f is found through the rename.
+        self.assertEqual({b'b-id', b'f-id', b'g-id'},
+                         tree.paths2ids(['b'], [basis]))
+        self.assertEqual({b'c-id'}, tree.paths2ids(['c']))
+        self.assertRaises(errors.PathsNotVersionedError,
+                          tree.paths2ids, ['d'])
+        self.assertEqual(dirstate.DirState.NOT_IN_MEMORY,
+                         state._dirblock_state)
+        state._read_dirblocks_if_needed()
+        self.assertEqual({b'b-id', b'f-id', b'g-id'},
+                         tree.paths2ids(['b'], [basis]))
+
+
+class FakeDirtyTracker(object):
+
+    def __init__(self):
+        self.generation = 0
+        self.num_events = 0
+        self.touched = {}
+        self.lost_events = None
+
+    def touch(self, *paths):
+        for path in paths:
+            self.num_events += 1
+            self.touched[path] = self.num_events
+
+    def lose_events(self):
+        self.num_events += 1
+        self.lost_events = self.num_events
+
+    def mark_clean(self):
+        self.touched.clear()
+        self.lost_events = None
+        self.generation += 1
+
+    def checkpoint(self):
+        return (self.generation, self.num_events)
+
+    def relpaths_since(self, checkpoint):
+        generation, num_events = checkpoint
+        if generation != self.generation:
+            return None
+        if self.lost_events is not None and self.lost_events > num_events:
+            return None
+        return set(path for path, touched in self.touched.items()
+                   if touched > num_events)
+
+
+class TestDirtyTracker(TestCaseWithTransport):
+
+    def setUp(self):
+        super(TestDirtyTracker, self).setUp()
+        self.tree = self.make_branch_and_tree('.', format='dirstate')
+        self.build_tree(['a', 'b', 'dir/', 'dir/c'])
+        self.tree.add(['a', 'b', 'dir', 'dir/c'])
+        self.tree.commit('initial')
+        self.tracker = FakeDirtyTracker()
+        self.tree.set_dirty_tracker(self.tracker)
+
+    def changed_paths(self, want_unversioned=False):
+        with self.tree.lock_read():
+            return sorted(
+                c.path[1] for c in self.tree.iter_changes(
+                    self.tree.basis_tree(),
+                    want_unversioned=want_unversioned))
+
+    def test_untouched_paths_not_compared(self):
+        self.assertEqual([], self.changed_paths())
+        self.build_tree_contents([('a', b'new a'), ('dir/c', b'new c')])
+        self.assertEqual([], self.changed_paths())
+        self.tracker.touch('dir/c')
+        self.assertEqual(['dir/c'], self.changed_paths())
+
+    def test_changes_found_before_are_compared(self):
+        self.build_tree_contents([('a', b'new a')])
+        self.assertEqual(['a'], self.changed_paths())
+        self.assertEqual(['a'], self.changed_paths())
+        self.build_tree_contents([('a', b'contents of a\n')])
+        self.assertEqual([], self.changed_paths())
+
+    def test_overflow_compares_everything(self):
+        self.assertEqual([], self.changed_paths())
+        self.build_tree_contents([('a', b'new a')])
+        self.tracker.lose_events()
+        self.assertEqual(['a'], self.changed_paths())
+        # The tracker belongs to its owner, who decides when it is clean.
+        self.assertIsNot(None, self.tracker.lost_events)
+
+    def test_tracker_not_marked_clean(self):
+        self.tracker.touch('b')
+        self.assertEqual([], self.changed_paths())
+        self.assertEqual(['b'], list(self.tracker.touched))
+        self.build_tree_contents([('b', b'new b')])
+        self.tracker.touch('b')
+        self.assertEqual(['b'], self.changed_paths())
+
+    def test_touched_before_last_comparison_not_compared(self):
+        self.assertEqual([], self.changed_paths())
+        self.tracker.touch('a')
+        self.assertEqual([], self.changed_paths())
+        # a was unchanged in the last comparison and has not been touched
+        # since, so it is not compared again.
+        self.build_tree_contents([('a', b'new a')])
+        self.assertEqual([], self.changed_paths())
+
+    def test_marked_clean_compares_everything(self):
+        self.assertEqual([], self.changed_paths())
+        self.build_tree_contents([('a', b'new a')])
+        self.tracker.mark_clean()
+        self.assertEqual(['a'], self.changed_paths())
+
+    def test_unversioned_directory(self):
+        self.assertEqual([], self.changed_paths(want_unversioned=True))
+        self.build_tree(['new/', 'new/file'])
+        self.tracker.touch('new', 'new/file')
+        self.assertEqual(['new'], self.changed_paths(want_unversioned=True))
+
+    def test_unversioned_after_versioned_only(self):
+        self.assertEqual([], self.changed_paths())
+        self.build_tree(['unknown'])
+        self.assertEqual(
+            ['unknown'], self.changed_paths(want_unversioned=True))
+
+    def test_unversioned_removed(self):
+        self.build_tree(['unknown'])
+        self.assertEqual(
+            ['unknown'], self.changed_paths(want_unversioned=True))
+        self.assertEqual(
+            ['unknown'], self.changed_paths(want_unversioned=True))
+        os.unlink('unknown')
+        self.tracker.touch('unknown')
+        self.assertEqual([], self.changed_paths(want_unversioned=True))
+
+    def test_dirstate_changes_compare_everything(self):
+        self.assertEqual([], self.changed_paths())
+        self.build_tree_contents([('a', b'new a')])
+        self.tree.rename_one('b', 'renamed')
+        self.assertEqual(['a', 'renamed'], self.changed_paths())
+
+    def test_dirstate_changed_elsewhere(self):
+        self.assertEqual([], self.changed_paths())
+        self.build_tree_contents([('a', b'new a')])
+        other = self.tree.controldir.open_workingtree()
+        other.rename_one('b', 'renamed')
+        self.assertEqual(['a', 'renamed'], self.changed_paths())
+
+    def test_hash_updates_keep_baseline(self):
+        self.build_tree_contents([('a', b'new a')])
+        self.assertEqual(['a'], self.changed_paths())
+        # Comparing saved the new hash of a to the dirstate.
+        self.assertIsNot(None, self.tree._changes_baseline)
+        self.build_tree_contents([('b', b'new b')])
+        self.assertEqual(['a'], self.changed_paths())
+
+    def test_different_basis(self):
+        self.assertEqual([], self.changed_paths())
+        self.build_tree_contents([('a', b'new a')])
+        with self.tree.lock_read():
+            changes = list(self.tree.iter_changes(
+                self.tree.branch.repository.revision_tree(
+                    _mod_revision.NULL_REVISION)))
+        self.assertEqual(
+            ['', 'a', 'b', 'dir', 'dir/c'], sorted(c.path[1] for c in changes))
+
+
+class TestInotifyDirtyTracker(TestCaseWithTransport):
+
+    _test_needs_features = [features.pyinotify]
+
+    def test_written_while_open(self):
+        from ...dirty_tracker import DirtyTracker
+        tree = self.make_branch_and_tree('.', format='dirstate')
+        self.build_tree_contents([('a', b'contents of a\n')])
+        tree.add(['a'])
+        tree.commit('initial')
+        tree.set_dirty_tracker(DirtyTracker(tree))
+        basis = tree.basis_tree()
+        with tree.lock_read():
+            self.assertEqual([], list(tree.iter_changes(basis)))
+        with open('a', 'ab') as f:
+            f.write(b'more\n')
+            f.flush()
+            with tree.lock_read():
+                self.assertEqual(
+                    [('a', 'a')],
+                    [c.path for c in tree.iter_changes(basis)])
+
+
 class TestCorruptDirstate(TestCaseWithTransport):
     """Tests for how we handle when the dirstate has been corrupted."""
 
@@ -1279,8 +1279,12 @@ class VersionedFiles(object):
         generator = _MPDiffGenerator(self, keys)
         return generator.compute_diffs()
 
-    def get_annotator(self):
-        return annotate.Annotator(self)
+    def get_annotator(self, cache=None):
+        """Return an Annotator for texts of this object.
+
+        :param cache: An optional AnnotationCache to use.
+        """
+        return annotate.Annotator(self, cache=cache)
 
     missing_keys = index._missing_keys_from_parent_map
 
@@ -16,6 +16,7 @@
 
 """Repository formats built around versioned files."""
 
+from collections import deque
 from io import BytesIO
 
 from ..lazy_import import lazy_import
@@ -39,8 +40,10 @@ from breezy.bzr import (
     fetch as _mod_fetch,
     check,
     generate_ids,
+    groupcompress,
     inventory_delta,
     inventorytree,
+    revision_bitmap,
     versionedfile,
     vf_search,
     )
@@ -83,6 +86,11 @@ from ..trace import (
 from .inventorytree import InventoryTreeChange
 
 
+# How many changes from iter_changes are read at a time when committing,
+# before their texts are stored.
+_RECORD_CHANGES_BATCH = 1000
+
+
 class VersionedFileRepositoryFormat(RepositoryFormat):
     """Base class for all repository formats that are VersionedFiles-based."""
 
@@ -103,10 +111,125 @@ class VersionedFileRepositoryFormat(RepositoryFormat):
     _fetch_uses_deltas = False
 
 
+class _CommitTextInserter(object):
+    """Read and hash new file texts on worker threads, then insert in batches.
+
+    Inserting each text on its own writes one group per text. Instead the
+    texts are buffered and inserted together in groupcompress order once
+    max_buffered_bytes have been collected, which lets the texts of a commit
+    share groups and compress them with the texts' own worker pool.
+
+    Texts are resolved in the order they were submitted, and batch
+    boundaries only depend on the sizes of the texts, so the resulting pack
+    does not depend on the number of threads.
+    """
+
+    def __init__(self, texts, num_threads, max_buffered_bytes):
+        """Create a _CommitTextInserter.
+
+        :param texts: The VersionedFiles to insert texts into.
+        :param num_threads: The number of threads reading and hashing files.
+        :param max_buffered_bytes: Insert the buffered texts once they hold
+            more than this many bytes.
+        """
+        import concurrent.futures
+        self._texts = texts
+        self._executor = concurrent.futures.ThreadPoolExecutor(num_threads)
+        self._max_in_flight = 4 * num_threads
+        self._max_buffered_bytes = max_buffered_bytes
+        self._in_flight = deque()
+        self._records = []
+        self._buffered_bytes = 0
+
+    @staticmethod
+    def _read_and_hash(file_obj):
+        try:
+            text = file_obj.read()
+        finally:
+            file_obj.close()
+        return text, osutils.sha_string(text)
+
+    def add_file(self, key, parents, file_obj, nostore_sha, data):
+        """Queue the text of a file to be read, hashed and inserted.
+
+        The text is not inserted if its sha1 matches nostore_sha.
+
+        :param file_obj: The file to read the text from; it is closed once
+            read.
+        :param data: Passed back to the caller once the text has been hashed.
+        :return: A list of (data, sha1, size, stored) tuples for the texts
+            that have been hashed since, in submission order.
+        """
+        future = self._executor.submit(self._read_and_hash, file_obj)
+        self._in_flight.append(
+            (future, file_obj, key, parents, nostore_sha, data))
+        hashed = []
+        while len(self._in_flight) > self._max_in_flight:
+            hashed.append(self._resolve_oldest())
+        return hashed
+
+    def add_empty(self, key, parents):
+        """Queue an empty text, such as that of a directory, for insertion."""
+        self._add_record(versionedfile.ChunkedContentFactory(
+            key, parents, osutils.sha_string(b''), []))
+
+    def _resolve_oldest(self):
+        future, file_obj, key, parents, nostore_sha, data = (
+            self._in_flight.popleft())
+        text, sha1 = future.result()
+        if sha1 == nostore_sha:
+            return data, sha1, len(text), False
+        self._add_record(versionedfile.ChunkedContentFactory(
+            key, parents, sha1, [text]))
+        return data, sha1, len(text), True
+
+    def _add_record(self, record):
+        self._records.append(record)
+        self._buffered_bytes += record.size
+        if self._buffered_bytes > self._max_buffered_bytes:
+            self._insert_buffered()
+
+    def _insert_buffered(self):
+        records = dict((record.key, record) for record in self._records)
+        parent_map = dict((key, record.parents)
+                          for key, record in records.items())
+        self._records = []
+        self._buffered_bytes = 0
+        self._texts.insert_record_stream(
+            [records[key] for key in groupcompress.sort_gc_optimal(parent_map)])
+
+    def finish(self):
+        """Hash and insert all the queued texts.
+
+        :return: A list of (data, sha1, size, stored) tuples for the texts
+            that had not been returned by add_file yet.
+        """
+        hashed = []
+        while self._in_flight:
+            hashed.append(self._resolve_oldest())
+        if self._records:
+            self._insert_buffered()
+        return hashed
+
+    def close(self):
+        """Stop the worker threads, discarding any uninserted texts."""
+        for future, file_obj, key, parents, nostore_sha, data in (
+                self._in_flight):
+            if future.cancel():
+                file_obj.close()
+        self._in_flight.clear()
+        self._records = []
+        self._executor.shutdown(wait=True)
+
+
 class VersionedFileCommitBuilder(CommitBuilder):
     """Commit builder implementation for versioned files based repositories.
     """
 
+    # Insert the texts buffered by a _CommitTextInserter once they reach this
+    # many bytes.
+    _max_buffered_text_bytes = 64 * 1024 * 1024
+
     def __init__(self, repository, parents, config_stack, timestamp=None,
                  timezone=None, committer=None, revprops=None,
                  revision_id=None, lossy=False):
@@ -123,6 +246,7 @@ class VersionedFileCommitBuilder(CommitBuilder):
         self.__heads = graph.HeadsCache(repository.get_graph()).heads
         # memo'd check for no-op commits.
         self._any_changes = False
+        self._text_inserter = None
 
     def any_changes(self):
         """Return True if any entries were changed.
@@ -197,6 +321,9 @@ class VersionedFileCommitBuilder(CommitBuilder):
     def abort(self):
         """Abort the commit that is being built.
         """
+        if self._text_inserter is not None:
+            self._text_inserter.close()
+            self._text_inserter = None
         self.repository.abort_write_group()
 
     def revision_tree(self):
@@ -365,49 +492,12 @@ class VersionedFileCommitBuilder(CommitBuilder):
                                        ][change[3].revision] = change[3]
         else:
             merged_ids = {}
-        # Setup the changes from the tree:
-        # changes maps file_id -> (change, [parent revision_ids])
-        changes = {}
-        for change in iter_changes:
-            # This probably looks up in basis_inv way to much.
-            if change.path[0] is not None:
-                head_candidate = [basis_inv.get_entry(change.file_id).revision]
-            else:
-                head_candidate = []
-            changes[change.file_id] = change, merged_ids.get(
-                change.file_id, head_candidate)
-        unchanged_merged = set(merged_ids) - set(changes)
-        # Extend the changes dict with synthetic changes to record merges of
-        # texts.
-        for file_id in unchanged_merged:
-            # Record a merged version of these items that did not change vs the
-            # basis. This can be either identical parallel changes, or a revert
-            # of a specific file after a merge. The recorded content will be
-            # that of the current tree (which is the same as the basis), but
-            # the per-file graph will reflect a merge.
-            # NB:XXX: We are reconstructing path information we had, this
-            # should be preserved instead.
-            # inv delta  change: (file_id, (path_in_source, path_in_target),
-            #   changed_content, versioned, parent, name, kind,
-            #   executable)
-            try:
-                basis_entry = basis_inv.get_entry(file_id)
-            except errors.NoSuchId:
-                # a change from basis->some_parents but file_id isn't in basis
-                # so was new in the merge, which means it must have changed
-                # from basis -> current, and as it hasn't the add was reverted
-                # by the user. So we discard this change.
-                pass
-            else:
-                change = InventoryTreeChange(
-                    file_id,
-                    (basis_inv.id2path(file_id), tree.id2path(file_id)),
-                    False, (True, True),
-                    (basis_entry.parent_id, basis_entry.parent_id),
-                    (basis_entry.name, basis_entry.name),
-                    (basis_entry.kind, basis_entry.kind),
-                    (basis_entry.executable, basis_entry.executable))
-                changes[file_id] = (change, merged_ids[file_id])
+        # Pair the changes from the tree with their per-file head candidates.
+        # They are processed a batch at a time rather than collected first,
+        # so that the changes of huge commits are not all held in memory at
+        # once.
+        changes = self._iter_changes_with_heads(
+            tree, basis_inv, merged_ids, iter_changes)
         # changes contains tuples with the change and a set of inventory
         # candidates for the file.
         # inv delta is:
@@ -415,7 +505,9 @@ class VersionedFileCommitBuilder(CommitBuilder):
         seen_root = False  # Is the root in the basis delta?
         inv_delta = self._basis_delta
         modified_rev = self._new_revision_id
-        for change, head_candidates in changes.values():
+        text_inserter = self._start_text_inserter()
+        for change, head_candidates in changes:
+            hashed = ()
             if change.versioned[1]:  # versioned in target.
                 # Several things may be happening here:
                 # We may have a fork in the per-file graph
@@ -487,19 +579,30 @@ class VersionedFileCommitBuilder(CommitBuilder):
                     else:
                         nostore_sha = None
                     file_obj, stat_value = tree.get_file_with_stat(change.path[1])
-                    try:
-                        entry.text_sha1, entry.text_size = self._add_file_to_weave(
-                            file_id, file_obj, heads, nostore_sha,
-                            size=(stat_value.st_size if stat_value else None))
-                        yield change.path[1], (entry.text_sha1, stat_value)
-                    except versionedfile.ExistingContent:
-                        # No content change against a carry_over parent
-                        # Perhaps this should also yield a fs hash update?
-                        carried_over = True
-                        entry.text_size = parent_entry.text_size
-                        entry.text_sha1 = parent_entry.text_sha1
-                    finally:
-                        file_obj.close()
+                    if text_inserter is not None:
+                        # The sha1 and size are set once the text has been
+                        # hashed, see _record_hashed_texts.
+                        hashed = text_inserter.add_file(
+                            (file_id, modified_rev),
+                            tuple([(file_id, head) for head in heads]),
+                            file_obj, nostore_sha,
+                            (change.path[1], entry, stat_value,
+                             parent_entry if nostore_sha is not None
+                             else None))
+                    else:
+                        try:
+                            entry.text_sha1, entry.text_size = self._add_file_to_weave(
+                                file_id, file_obj, heads, nostore_sha,
+                                size=(stat_value.st_size if stat_value else None))
+                            yield change.path[1], (entry.text_sha1, stat_value)
+                        except versionedfile.ExistingContent:
+                            # No content change against a carry_over parent
+                            # Perhaps this should also yield a fs hash update?
+                            carried_over = True
+                            entry.text_size = parent_entry.text_size
+                            entry.text_sha1 = parent_entry.text_sha1
+                        finally:
+                            file_obj.close()
                 elif kind == 'symlink':
                     # Wants a path hint?
                     entry.symlink_target = tree.get_symlink_target(
@@ -509,8 +612,7 @@ class VersionedFileCommitBuilder(CommitBuilder):
                             entry.symlink_target):
                         carried_over = True
                     else:
-                        self._add_file_to_weave(
-                            change.file_id, BytesIO(), heads, None, size=0)
+                        self._add_empty_text(change.file_id, heads)
                 elif kind == 'directory':
                     if carry_over_possible:
                         carried_over = True
@@ -518,8 +620,7 @@ class VersionedFileCommitBuilder(CommitBuilder):
                         # Nothing to set on the entry.
                         # XXX: split into the Root and nonRoot versions.
                         if change.path[1] != '' or self.repository.supports_rich_root():
-                            self._add_file_to_weave(
-                                change.file_id, BytesIO(), heads, None, size=0)
+                            self._add_empty_text(change.file_id, heads)
                 elif kind == 'tree-reference':
                     if not self.repository._format.supports_tree_reference:
                         # This isn't quite sane as an error, but we shouldn't
@@ -536,8 +637,7 @@ class VersionedFileCommitBuilder(CommitBuilder):
                             reference_revision):
                         carried_over = True
                     else:
-                        self._add_file_to_weave(
-                            change.file_id, BytesIO(), heads, None, size=0)
+                        self._add_empty_text(change.file_id, heads)
                 else:
                     raise AssertionError('unknown kind %r' % kind)
                 if not carried_over:
@@ -550,6 +650,13 @@ class VersionedFileCommitBuilder(CommitBuilder):
             inv_delta.append((change.path[0], new_path, change.file_id, entry))
             if new_path == '':
                 seen_root = True
+            for item in self._record_hashed_texts(hashed):
+                yield item
+        if text_inserter is not None:
+            for item in self._record_hashed_texts(text_inserter.finish()):
+                yield item
+            text_inserter.close()
+            self._text_inserter = None
         # The initial commit adds a root directory, but this in itself is not
         # a worthwhile commit.
         if ((len(inv_delta) > 0 and basis_revision_id != _mod_revision.NULL_REVISION)
@@ -563,6 +670,105 @@ class VersionedFileCommitBuilder(CommitBuilder):
             self._require_root_change(tree)
         self.basis_delta_revision = basis_revision_id
 
+    def _iter_changes_with_heads(self, tree, basis_inv, merged_ids,
+                                 iter_changes):
+        """Pair the changes to record with their per-file head candidates.
+
+        :param merged_ids: file_id -> [revision_ids] for the entries that
+            differ between the basis and the other parents.
+        :return: An iterator over (change, [parent revision_ids]) tuples: the
+            changes from iter_changes, followed by synthetic changes for
+            merged entries that did not change against the basis.
+        """
+        changed_ids = set()
+        iter_changes = iter(iter_changes)
+        while True:
+            # Walking the tree and storing texts in turn for each file is
+            # noticeably slower than doing each for a batch of files.
+            batch = list(itertools.islice(iter_changes, _RECORD_CHANGES_BATCH))
+            if not batch:
+                break
+            for change in batch:
+                # This probably looks up in basis_inv way to much.
+                if change.path[0] is not None:
+                    head_candidate = [
+                        basis_inv.get_entry(change.file_id).revision]
+                else:
+                    head_candidate = []
+                if merged_ids:
+                    changed_ids.add(change.file_id)
+                yield change, merged_ids.get(change.file_id, head_candidate)
+        unchanged_merged = set(merged_ids) - changed_ids
+        # Extend the changes with synthetic changes to record merges of
+        # texts.
+        for file_id in unchanged_merged:
+            # Record a merged version of these items that did not change vs the
+            # basis. This can be either identical parallel changes, or a revert
+            # of a specific file after a merge. The recorded content will be
+            # that of the current tree (which is the same as the basis), but
+            # the per-file graph will reflect a merge.
+            # NB:XXX: We are reconstructing path information we had, this
+            # should be preserved instead.
+            # inv delta  change: (file_id, (path_in_source, path_in_target),
+            #   changed_content, versioned, parent, name, kind,
+            #   executable)
+            try:
+                basis_entry = basis_inv.get_entry(file_id)
+            except errors.NoSuchId:
+                # a change from basis->some_parents but file_id isn't in basis
+                # so was new in the merge, which means it must have changed
+                # from basis -> current, and as it hasn't the add was reverted
+                # by the user. So we discard this change.
+                pass
+            else:
+                change = InventoryTreeChange(
+                    file_id,
+                    (basis_inv.id2path(file_id), tree.id2path(file_id)),
+                    False, (True, True),
+                    (basis_entry.parent_id, basis_entry.parent_id),
+                    (basis_entry.name, basis_entry.name),
+                    (basis_entry.kind, basis_entry.kind),
+                    (basis_entry.executable, basis_entry.executable))
+                yield change, merged_ids[file_id]
+
+    def _start_text_inserter(self):
+        """Start a _CommitTextInserter if commit.text_threads is set."""
+        if self._config_stack is None:
+            return None
+        num_threads = self._config_stack.get('commit.text_threads')
+        if not num_threads or num_threads < 1:
+            return None
+        self._text_inserter = _CommitTextInserter(
+            self.repository.texts, num_threads,
+            self._max_buffered_text_bytes)
+        return self._text_inserter
+
+    def _record_hashed_texts(self, hashed):
+        """Fill in the entries of texts hashed by a _CommitTextInserter.
+
+        :return: An iterator over (relpath, fs_hash) tuples for the texts that
+            were stored.
+        """
+        for (path, entry, stat_value, parent_entry), sha1, size, stored in (
+                hashed):
+            if stored:
+                entry.text_sha1 = sha1
+                entry.text_size = size
+                yield path, (sha1, stat_value)
+            else:
+                # No content change against a carry_over parent
+                entry.text_sha1 = parent_entry.text_sha1
+                entry.text_size = parent_entry.text_size
+                entry.revision = parent_entry.revision
+
+    def _add_empty_text(self, file_id, parents):
+        if self._text_inserter is not None:
+            self._text_inserter.add_empty(
+                (file_id, self._new_revision_id),
+                tuple([(file_id, parent) for parent in parents]))
+        else:
+            self._add_file_to_weave(file_id, BytesIO(), parents, None, size=0)
+
     def _add_file_to_weave(self, file_id, fileobj, parents, nostore_sha, size):
         parent_keys = tuple([(file_id, parent) for parent in parents])
         return self.repository.texts.add_content(
@@ -2350,6 +2556,46 @@ class InterVersionedFileRepository(InterRepository):
         return vf_search.SearchResult(started_keys, excludes,
                                       len(included_keys), included_keys)
 
+    @staticmethod
+    def _get_revision_bitmap_index(repository):
+        pack_collection = getattr(repository, '_pack_collection', None)
+        if pack_collection is None:
+            return None
+        return pack_collection.get_revision_bitmap_index()
+
+    def _find_missing_with_bitmaps(self, revision_ids, if_present_ids=None):
+        """Find the revisions target lacks using revision bitmap indices.
+
+        This only works if both repositories have a revision bitmap index,
+        as written by 'brz pack'. There is no smart server verb to get the
+        index of a remote repository, so this is only used when both
+        repositories are accessed directly; fetches from or pushes to a
+        RemoteRepository walk the graph instead.
+
+        :return: A set of revision ids, or None if the bitmap indices could
+            not be used.
+        """
+        source_index = self._get_revision_bitmap_index(self.source)
+        if source_index is None:
+            return None
+        target_index = self._get_revision_bitmap_index(self.target)
+        if target_index is None:
+            return None
+        source_graph = self.source.get_graph()
+        all_wanted_revs = set(revision_ids or ())
+        all_wanted_revs.update(if_present_ids or ())
+        present_revs = set(source_graph.get_parent_map(all_wanted_revs))
+        if revision_ids is not None and not present_revs.issuperset(
+                revision_ids):
+            # Let the graph walk deal with ghosts
+            return None
+        result_set = revision_bitmap.find_missing_revisions(
+            source_index, source_graph.get_parent_map, target_index,
+            self.target.get_graph().get_parent_map, present_revs)
+        mutter('found %d missing revisions using revision bitmaps',
+               len(result_set))
+        return result_set
+
     def search_missing_revision_ids(self,
                                     find_ghosts=True, revision_ids=None, if_present_ids=None,
                                     limit=None):
@@ -2370,11 +2616,14 @@ class InterVersionedFileRepository(InterRepository):
             # stop searching at found target revisions.
             if not find_ghosts and (revision_ids is not None or if_present_ids is
                                     not None):
-                result = self._walk_to_common_revisions(revision_ids,
-                                                        if_present_ids=if_present_ids)
-                if limit is None:
-                    return result
-                result_set = result.get_keys()
+                result_set = self._find_missing_with_bitmaps(
+                    revision_ids, if_present_ids=if_present_ids)
+                if result_set is None:
+                    result = self._walk_to_common_revisions(
+                        revision_ids, if_present_ids=if_present_ids)
+                    if limit is None:
+                        return result
+                    result_set = result.get_keys()
             else:
                 # generic, possibly worst case, slow code path.
                 target_ids = set(self.target.all_revision_ids())
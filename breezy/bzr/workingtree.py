@@ -60,6 +60,7 @@ from breezy import (
     rio as _mod_rio,
     )
 from breezy.bzr import (
+    annotation_cache,
     conflicts as _mod_bzr_conflicts,
     inventory,
     serializer,
@@ -872,7 +873,8 @@ class InventoryWorkingTree(WorkingTree, MutableInventoryTree):
                     file_parent_keys.append(key)
 
             # Now we have the parents of this content
-            annotator = self.branch.repository.texts.get_annotator()
+            annotator = self.branch.repository.texts.get_annotator(
+                cache=annotation_cache.get_annotation_cache())
             text = self.get_file_text(path)
             this_key = (file_id, default_revision)
             annotator.add_special_text(this_key, file_parent_keys, text)
@@ -1579,7 +1581,9 @@ class InventoryWorkingTree(WorkingTree, MutableInventoryTree):
             disk_top = disk_top[:-1]
         top_strip_len = len(disk_top) + 1
         inventory_iterator = self._walkdirs(prefix)
-        disk_iterator = osutils.walkdirs(disk_top, prefix)
+        disk_iterator = osutils.walkdirs(
+            disk_top, prefix,
+            threads=self.get_config_stack().get('walkdirs.threads'))
         try:
             current_disk = next(disk_iterator)
             disk_finished = False
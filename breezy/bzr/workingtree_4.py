@@ -23,6 +23,7 @@ WorkingTree.open(dir).
 """
 
 from io import BytesIO
+import itertools
 import os
 
 from ..lazy_import import lazy_import
@@ -45,6 +46,7 @@ from breezy import (
     views,
     )
 from breezy.bzr import (
+    annotation_cache,
     dirstate,
     generate_ids,
     )
@@ -59,6 +61,7 @@ from ..lockable_files import LockableFiles
 from ..lockdir import LockDir
 from .inventorytree import (
     InventoryTree,
+    InventoryTreeChange,
     InterInventoryTree,
     InventoryRevisionTree,
     )
@@ -122,10 +125,12 @@ class DirStateWorkingTree(InventoryWorkingTree):
         # -------------
         self._setup_directory_is_tree_reference()
         self._detect_case_handling()
-        self._rules_searcher = None
         self.views = self._make_views()
         # --- allow tests to select the dirstate iter_changes implementation
         self._iter_changes = dirstate._process_entry
+        # See set_dirty_tracker
+        self._dirty_tracker = None
+        self._changes_baseline = None
         self._repo_supports_tree_reference = getattr(
             self._branch.repository._format, "supports_tree_reference",
             False)
@@ -160,6 +165,7 @@ class DirStateWorkingTree(InventoryWorkingTree):
             (presuming there is one).
         """
         self._dirty = True
+        self._changes_baseline = None
         if reset_inventory and self._inventory is not None:
             self._inventory = None
 
@@ -268,6 +274,23 @@ class DirStateWorkingTree(InventoryWorkingTree):
             self._supports_executable())
         return self._dirstate
 
+    def _file_paths_next_to(self, path):
+        """See WorkingTree._file_paths_next_to."""
+        if not self.is_locked():
+            return None
+        state = self.current_dirstate()
+        if state._dirblock_state == dirstate.DirState.NOT_IN_MEMORY:
+            return None
+        dirname, basename = osutils.split(path.encode('utf-8'))
+        block_index, present = state._find_block_index_from_key(
+            (dirname, basename, b''))
+        if not present:
+            return None
+        prefix = dirname + b'/' if dirname else b''
+        return [(prefix + entry[0][1]).decode('utf-8')
+                for entry in state._dirblocks[block_index][1]
+                if entry[1][0][0] == b'f']
+
     def _sha1_provider(self):
         """A function that returns a SHA1Provider suitable for this tree.
 
@@ -576,7 +599,12 @@ class DirStateWorkingTree(InventoryWorkingTree):
         """See MutableTree._observed_sha1."""
         state = self.current_dirstate()
         entry = self._get_entry(path=path)
-        state._observed_sha1(entry, *sha_and_stat)
+        sha1, stat_value = sha_and_stat
+        if isinstance(stat_value, _mod_filters.FilteredStat):
+            # The dirstate caches the stat of the file on disk, not that of
+            # its canonical form.
+            stat_value = stat_value.base
+        state._observed_sha1(entry, sha1, stat_value)
 
     def kind(self, relpath):
         abspath = self.abspath(relpath)
@@ -929,8 +957,8 @@ class DirStateWorkingTree(InventoryWorkingTree):
             paths_utf8.add(path.encode('utf8'))
         # -- get the state object and prepare it.
         state = self.current_dirstate()
-        if False and (state._dirblock_state == dirstate.DirState.NOT_IN_MEMORY
-                      and b'' not in paths):
+        if (state._dirblock_state == dirstate.DirState.NOT_IN_MEMORY
+                and b'' not in paths):
             paths2ids = self._paths2ids_using_bisect
         else:
             paths2ids = self._paths2ids_in_memory
@@ -961,11 +989,61 @@ class DirStateWorkingTree(InventoryWorkingTree):
                 result.append(block[entry_index])
                 entry_index += 1
             return result
+
+        def _entries_inside(path):
+            """Iterate the entries of all the directories at or under path."""
+            initial_key = (path, b'', b'')
+            block_index, _ = state._find_block_index_from_key(initial_key)
+            while (block_index < len(state._dirblocks) and
+                   osutils.is_inside(path, state._dirblocks[block_index][0])):
+                for entry in state._dirblocks[block_index][1]:
+                    yield entry
+                block_index += 1
+        return self._paths2ids_from_entries(
+            paths, search_indexes, require_versioned, _entries_for_path,
+            _entries_inside)
+
+    def _paths2ids_using_bisect(self, paths, search_indexes,
+                                require_versioned=True):
+        """Find the ids for paths by reading only their directories.
+
+        Only the dirblocks that can contain the paths and their children are
+        parsed from the file on disk.
+        """
+        state = self.current_dirstate()
+        offsets = state._get_dirblock_offsets()
+
+        def _entries_for_path(path):
+            dirname, basename = os.path.split(path)
+            return [entry for entry in state._read_dirblock_from_disk(dirname)
+                    if entry[0][1] == basename]
+
+        def _entries_inside(path):
+            block_index = dirstate.bisect_dirblock(offsets, path)
+            while (block_index < len(offsets) and
+                   osutils.is_inside(path, offsets[block_index][0])):
+                for entry in state._read_dirblock_from_disk(
+                        offsets[block_index][0]):
+                    yield entry
+                block_index += 1
+        return self._paths2ids_from_entries(
+            paths, search_indexes, require_versioned, _entries_for_path,
+            _entries_inside)
+
+    def _paths2ids_from_entries(self, paths, search_indexes,
+                                require_versioned, entries_for_path,
+                                entries_inside):
+        """Find the ids for paths in the dirstate.
+
+        :param entries_for_path: A callable returning the entries at a path.
+        :param entries_inside: A callable returning an iterator over the
+            entries in the directories at or under a path.
+        """
         if require_versioned:
             # -- check all supplied paths are versioned in a search tree. --
             all_versioned = True
             for path in paths:
-                path_entries = _entries_for_path(path)
+                path_entries = entries_for_path(path)
                 if not path_entries:
                     # this specified path is not present at all: error
                     all_versioned = False
@@ -1016,40 +1094,14 @@ class DirStateWorkingTree(InventoryWorkingTree):
             searched_paths.add(current_root)
             # process the entries for this containing directory: the rest will
             # be found by their parents recursively.
-            root_entries = _entries_for_path(current_root)
+            root_entries = entries_for_path(current_root)
             if not root_entries:
                 # this specified path is not present at all, skip it.
                 continue
             for entry in root_entries:
                 _process_entry(entry)
-            initial_key = (current_root, b'', b'')
-            block_index, _ = state._find_block_index_from_key(initial_key)
-            while (block_index < len(state._dirblocks) and
-                   osutils.is_inside(current_root, state._dirblocks[block_index][0])):
-                for entry in state._dirblocks[block_index][1]:
-                    _process_entry(entry)
-                block_index += 1
-        return found_ids
-
-    def _paths2ids_using_bisect(self, paths, search_indexes,
-                                require_versioned=True):
-        state = self.current_dirstate()
-        found_ids = set()
-
-        split_paths = sorted(osutils.split(p) for p in paths)
-        found = state._bisect_recursive(split_paths)
-
-        if require_versioned:
-            found_dir_names = set(dir_name_id[:2] for dir_name_id in found)
-            for dir_name in split_paths:
-                if dir_name not in found_dir_names:
-                    raise errors.PathsNotVersionedError(
-                        [p.decode('utf-8') for p in paths])
-
-        for dir_name_id, trees_info in found.items():
-            for index in search_indexes:
-                if trees_info[index][0] not in (b'r', b'a'):
-                    found_ids.add(dir_name_id[2])
+            for entry in entries_inside(current_root):
+                _process_entry(entry)
         return found_ids
 
     def read_working_inventory(self):
@@ -1197,6 +1249,25 @@ class DirStateWorkingTree(InventoryWorkingTree):
         """
         return self.current_dirstate().sha1_from_stat(path, stat_result)
 
+    def set_dirty_tracker(self, tracker):
+        """Use a monitor of the filesystem to speed up iter_changes.
+
+        Once iter_changes has compared the whole tree against a basis, later
+        calls only look at the paths that changed then and the paths the
+        tracker reports as touched since. The whole tree is scanned again
+        when the dirstate or basis change, or when the tracker lost events.
+
+        The tracker is never marked clean by the tree, so it can be shared
+        with its owner (e.g. a breezy.workspace.Workspace). The tree keeps a
+        checkpoint of the tracker instead, and scans the whole tree again if
+        the tracker was marked clean since.
+
+        :param tracker: A breezy.dirty_tracker.DirtyTracker watching the
+            whole tree. None to always scan the whole tree.
+        """
+        self._dirty_tracker = tracker
+        self._changes_baseline = None
+
     def supports_tree_reference(self):
         return self._repo_supports_tree_reference
 
@@ -1212,8 +1283,20 @@ class DirStateWorkingTree(InventoryWorkingTree):
                 if self._dirty:
                     self.flush()
             if self._dirstate is not None:
+                baseline = self._changes_baseline
+                if (baseline is not None
+                        and _dirstate_shape_modified(self._dirstate)):
+                    baseline = self._changes_baseline = None
+                if (baseline is not None and baseline.dirstate_fingerprint
+                        != _dirstate_fingerprint(self._dirstate)):
+                    baseline = self._changes_baseline = None
                 # This is a no-op if there are no modifications.
                 self._dirstate.save()
+                if baseline is not None:
+                    # Only cached hashes changed, which do not affect the
+                    # changes found.
+                    baseline.dirstate_fingerprint = _dirstate_fingerprint(
+                        self._dirstate)
                 self._dirstate.unlock()
             # TODO: jam 20070301 We shouldn't have to wipe the dirstate at this
             #       point. Instead, it could check if the header has been
@@ -1406,10 +1489,21 @@ class ContentFilterAwareSHA1Provider(dirstate.SHA1Provider):
             statvalue = os.fstat(file_obj.fileno())
             if filters:
                 file_obj, size = _mod_filters.filtered_input_file(file_obj, filters)
-                statvalue = _mod_filters.FilteredStat(statvalue, size)
             sha1 = osutils.size_sha_file(file_obj)[1]
         return statvalue, sha1
 
+    def threadsafe_stat_and_sha1(self):
+        """See dirstate.SHA1Provider.threadsafe_stat_and_sha1()"""
+        if self.tree._content_filter_fingerprint() is not None:
+            # Looking up rules and running filters need not be thread safe.
+            return None
+        # No filters apply, so files are hashed as they are.
+        return dirstate.DefaultSHA1Provider().stat_and_sha1
+
+    def fingerprint(self):
+        """See dirstate.SHA1Provider.fingerprint()"""
+        return self.tree._content_filter_fingerprint()
+
 
 class ContentFilteringDirStateWorkingTree(DirStateWorkingTree):
     """Dirstate working tree that supports content filtering.
@@ -1739,7 +1833,9 @@ class DirStateRevisionTree(InventoryTree):
         """See Tree.annotate_iter"""
         file_id = self.path2id(path)
         text_key = (file_id, self.get_file_revision(path))
-        annotations = self._repository.texts.annotate(text_key)
+        annotator = self._repository.texts.get_annotator(
+            cache=annotation_cache.get_annotation_cache())
+        annotations = annotator.annotate_flat(text_key)
         return [(key[-1], line) for (key, line) in annotations]
 
     def _comparison_data(self, entry, path):
@@ -2174,6 +2270,45 @@ class DirStateRevisionTree(InventoryTree):
             pending.extend(reversed(subdirs))
 
 
+def _dirstate_fingerprint(state):
+    """Return a value that changes whenever the dirstate file is written."""
+    st = os.stat(state._filename)
+    return (st.st_size, st.st_mtime_ns, st.st_ctime_ns, st.st_ino)
+
+
+def _dirstate_shape_modified(state):
+    """Check whether the dirstate changed in memory beyond cached hashes."""
+    return (state._header_state == dirstate.DirState.IN_MEMORY_MODIFIED
+            or state._dirblock_state == dirstate.DirState.IN_MEMORY_MODIFIED)
+
+
+class _ChangesBaseline(object):
+    """The result of the last whole tree iter_changes with a dirty tracker.
+
+    :ivar revision_id: The revision the tree was compared to.
+    :ivar want_unversioned: Whether unversioned paths were included.
+    :ivar paths: The paths of all the changes found, in either tree.
+    :ivar dirstate_fingerprint: The fingerprint of the dirstate file the
+        changes were found with.
+    :ivar checkpoint: The checkpoint of the dirty tracker taken before the
+        changes were looked for.
+    """
+
+    def __init__(self, revision_id, want_unversioned, paths,
+                 dirstate_fingerprint, checkpoint):
+        self.revision_id = revision_id
+        self.want_unversioned = want_unversioned
+        self.paths = paths
+        self.dirstate_fingerprint = dirstate_fingerprint
+        self.checkpoint = checkpoint
+
+    def matches(self, revision_id, want_unversioned, state):
+        return (self.revision_id == revision_id
+                and (self.want_unversioned or not want_unversioned)
+                and not _dirstate_shape_modified(state)
+                and self.dirstate_fingerprint == _dirstate_fingerprint(state))
+
+
 class InterDirStateTree(InterInventoryTree):
     """Fast path optimiser for changes_from with dirstate trees.
 
@@ -2271,6 +2406,115 @@ class InterDirStateTree(InterInventoryTree):
             source_index = 1 + parent_ids.index(self.source._revision_id)
             indices = (source_index, target_index)
 
+        if (specific_files is None and not include_unchanged
+                and self.target._dirty_tracker is not None):
+            return self._iter_changes_from_baseline(
+                want_unversioned, source_index, target_index, indices)
+        return self._iter_dirstate_changes(
+            include_unchanged, specific_files, require_versioned,
+            want_unversioned, source_index, target_index, indices)
+
+    def _iter_changes_from_baseline(self, want_unversioned, source_index,
+                                    target_index, indices):
+        """Find the changes in the whole tree, using its dirty tracker.
+
+        Paths that were unchanged in the last comparison and that the
+        tracker has not seen touched since must still be unchanged, so only
+        the others are compared. Each comparison becomes the baseline of the
+        next one, so paths touched before it are not compared again.
+        """
+        target = self.target
+        tracker = target._dirty_tracker
+        state = target.current_dirstate()
+        state._read_dirblocks_if_needed()
+        baseline = target._changes_baseline
+        # Taken before comparing, so that paths touched while comparing are
+        # compared again next time.
+        checkpoint = tracker.checkpoint()
+        specific_files = None
+        if (baseline is not None and baseline.matches(
+                self.source._revision_id, want_unversioned, state)):
+            touched = tracker.relpaths_since(baseline.checkpoint)
+            if touched is not None:
+                specific_files, unversioned = self._paths_to_compare(
+                    state, baseline.paths.union(touched))
+        if specific_files is None:
+            target._changes_baseline = None
+            changes = self._iter_dirstate_changes(
+                False, None, False, want_unversioned, source_index,
+                target_index, indices)
+        else:
+            changes = iter(())
+            if specific_files:
+                changes = self._iter_dirstate_changes(
+                    False, specific_files, False, want_unversioned,
+                    source_index, target_index, indices)
+            if want_unversioned:
+                changes = itertools.chain(
+                    changes, self._iter_unversioned(unversioned))
+        paths = set()
+        for change in changes:
+            paths.update(p for p in change.path if p is not None)
+            yield change
+        if not _dirstate_shape_modified(state):
+            target._changes_baseline = _ChangesBaseline(
+                self.source._revision_id, want_unversioned, paths,
+                _dirstate_fingerprint(state), checkpoint)
+
+    def _paths_to_compare(self, state, paths):
+        """Work out how to compare paths against the dirstate.
+
+        The contents of unversioned directories are not compared, so a
+        change inside one is a change of the topmost unversioned directory.
+
+        :return: A tuple of the paths to compare with the dirstate and the
+            unversioned paths that are not in the dirstate at all, or
+            (None, None) if the whole tree has to be compared.
+        """
+        specific_files = set()
+        unversioned = set()
+        for path in paths:
+            topmost = path
+            parent = path
+            while parent:
+                parent = osutils.dirname(parent)
+                if state._get_entry(
+                        0, path_utf8=parent.encode('utf-8')) == (None, None):
+                    topmost = parent
+            path_utf8 = topmost.encode('utf-8')
+            if state._get_entry(0, path_utf8=path_utf8) != (None, None):
+                specific_files.add(topmost)
+            elif not state._entries_for_path(path_utf8):
+                unversioned.add(topmost)
+            elif osutils.isdir(self.target.abspath(topmost)):
+                # A directory that is only versioned in the basis: comparing
+                # it would descend into its unversioned contents.
+                return None, None
+            else:
+                specific_files.add(topmost)
+        return specific_files, unversioned
+
+    def _iter_unversioned(self, paths):
+        """Report the unversioned paths that exist."""
+        for path in sorted(paths):
+            try:
+                st = os.lstat(self.target.abspath(path))
+            except FileNotFoundError:
+                continue
+            kind = osutils.file_kind_from_stat_mode(st.st_mode)
+            if (kind == 'directory'
+                    and self.target._directory_is_tree_reference(path)):
+                kind = 'tree-reference'
+            executable = bool(stat.S_ISREG(st.st_mode)
+                              and stat.S_IEXEC & st.st_mode)
+            yield InventoryTreeChange(
+                None, (None, path), True, (False, False), (None, None),
+                (None, osutils.basename(path)), (None, kind),
+                (None, executable))
+
+    def _iter_dirstate_changes(self, include_unchanged, specific_files,
+                               require_versioned, want_unversioned,
+                               source_index, target_index, indices):
         if specific_files is None:
             specific_files = {''}
 
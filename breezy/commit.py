@@ -71,6 +71,10 @@ from .urlutils import unescape_for_display
 from .i18n import gettext
 
 
+# How often, in files recorded, a commit reports its progress
+_REPORT_FILES_INTERVAL = 10000
+
+
 class PointlessCommit(BzrError):
 
     _fmt = "No changes to commit"
@@ -131,6 +135,10 @@ class NullCommitReporter(object):
     def renamed(self, change, old_path, new_path):
         pass
 
+    def files_recorded(self, count):
+        """Report that count files have been recorded so far."""
+        pass
+
     def is_verbose(self):
         return False
 
@@ -175,6 +183,9 @@ class ReportCommitToLog(NullCommitReporter):
     def renamed(self, change, old_path, new_path):
         self._note('%s %s => %s', change, old_path, new_path)
 
+    def files_recorded(self, count):
+        self._note(gettext('Recorded %d files'), count)
+
     def is_verbose(self):
         return True
 
@@ -663,9 +674,13 @@ class Commit(object):
         if self.exclude:
             iter_changes = filter_excluded(iter_changes, self.exclude)
         iter_changes = self._filter_iter_changes(iter_changes)
+        num_files = 0
         for path, fs_hash in self.builder.record_iter_changes(
                 self.work_tree, self.basis_revid, iter_changes):
             self.work_tree._observed_sha1(path, fs_hash)
+            num_files += 1
+            if num_files % _REPORT_FILES_INTERVAL == 0:
+                self.reporter.files_recorded(num_files)
 
     def _filter_iter_changes(self, iter_changes):
         """Process iter_changes.
@@ -2406,6 +2406,39 @@ arguments.
 
 A negative value means disable the size check.
 """))
+option_registry.register(
+    Option('annotate.cache',
+           default=True, from_unicode=bool_from_store, invalid='warning',
+           help="""\
+Whether to keep the annotations of files in a cache.
+
+If true, ``brz annotate`` stores the annotations it computes in the user
+cache directory, and later only annotates the changes made since a cached
+revision of the file.
+"""))
+option_registry.register(
+    Option('annotate.cache_size',
+           default=u'50MB', from_unicode=int_SI_from_store,
+           help="""\
+Size of the annotations kept in the annotation cache.
+
+Once the annotations stored by ``brz annotate`` grow beyond this size, the
+least recently used ones are removed from the cache.
+
+A value of 0 means no limit.
+"""))
+option_registry.register(
+    Option('annotate.diff_processes', default=0,
+           from_unicode=int_from_store, invalid='warning',
+           help="""\
+Number of processes diffing texts during annotate.
+
+If set, ``brz annotate`` extracts all the revisions of a file it needs
+first, and diffs them against their parents in this many worker processes
+ahead of annotating them. This needs memory for all those revisions at
+once, and only helps for files with long histories on machines with
+several cores.
+"""))
 option_registry.register(
     Option('bound',
            default=None, from_unicode=bool_from_store,
@@ -2483,6 +2516,18 @@ option_registry.register(
 option_registry.register(
     Option('child_submit_to',
            help='''Where submissions to this branch are mailed to.'''))
+option_registry.register(
+    Option('commit.text_threads', default=0,
+           from_unicode=int_from_store, invalid='warning',
+           help='''\
+Number of threads reading and hashing new file texts during commit.
+
+If set, the texts of changed files are read and hashed by this many
+threads, and stored together in batches rather than one at a time. The
+batches are compressed on the bzr.groupcompress.compression_threads
+threads, if any. The resulting repository does not depend on the number
+of threads.
+'''))
 option_registry.register(
     Option('create_signatures', default=SIGN_WHEN_REQUIRED,
            from_unicode=signing_policy_from_unicode,
@@ -2504,6 +2549,30 @@ If true (default), working tree metadata changes are flushed through the
 OS buffers to physical disk.  This is somewhat slower, but means data
 should not be lost if the machine crashes.  See also repository.fdatasync.
 '''))
+option_registry.register(
+    Option('dirstate.journal', default=False,
+           from_unicode=bool_from_store,
+           help='''\
+Append hash cache updates to a journal next to the dirstate?
+
+If true, saving a working tree whose only changes are refreshed file
+hashes appends them to ``dirstate-journal`` rather than rewriting the
+whole dirstate. The journal is folded back into the dirstate once it
+grows past an eighth of its size, or when the tree itself changes.
+Changes to the tree, including the new basis after a commit, are always
+written to the dirstate itself, as older versions ignore the journal.
+'''))
+option_registry.register(
+    Option('dirstate.sha1_threads', default=0,
+           from_unicode=int_from_store, invalid='warning',
+           help='''\
+Number of threads hashing files when comparing working trees.
+
+If set, files whose size or timestamps changed are hashed by this many
+threads ahead of the comparison, e.g. by "brz status", instead of one at
+a time. Files are only hashed ahead when no content filters apply to
+the working tree.
+'''))
 option_registry.register(
     ListOption('debug_flags', default=[],
                help='Debug flags to activate.'))
@@ -2637,6 +2706,43 @@ option_registry.register(
            default=300.0, from_unicode=float_from_store,
            help="If we wait for a new request from a client for more than"
                 " X seconds, consider the client idle, and hangup."))
+option_registry.register(
+    Option('serve.response_cache_size',
+           default=None, from_unicode=int_SI_from_store, invalid='warning',
+           help='''\
+Size of the cache of responses in "brz serve".
+
+If set, responses to requests for revisions, inventories, file texts and
+parent data are kept in memory, up to this size (K, M and G suffixes are
+accepted), and answered from there when a client asks again. The cache of a
+repository is dropped when packs are removed from it.
+'''))
+option_registry.register(
+    Option('serve.response_cache_dir',
+           default=None,
+           help='''\
+Directory in which "brz serve" keeps a larger cache of responses on disk.
+
+The files are removed when the server stops. Only used when
+serve.response_cache_size is set.
+'''))
+option_registry.register(
+    Option('serve.response_cache_dir_size',
+           default=u'1G', from_unicode=int_SI_from_store, invalid='warning',
+           help='''\
+Size of the cache of responses in serve.response_cache_dir.
+'''))
+option_registry.register(
+    Option('serve.workers',
+           default=None, from_unicode=int_from_store, invalid='warning',
+           help='''\
+Number of threads serving requests in "brz serve".
+
+By default every client connection is served by its own thread. If this is
+set, connections are multiplexed by a single thread instead, and their
+requests are run by a pool of this many threads. This bounds the memory and
+threads used by a server with many concurrent clients.
+'''))
 option_registry.register(
     Option('ssh',
            default=None, override_from_env=['BRZ_SSH'],
@@ -2665,6 +2771,17 @@ option_registry.register(
     Option('validate_signatures_in_log', default=False,
            from_unicode=bool_from_store, invalid='warning',
            help='''Whether to validate signatures in brz log.'''))
+option_registry.register(
+    Option('walkdirs.threads', default=0,
+           from_unicode=int_from_store, invalid='warning',
+           help='''\
+Number of threads reading directories ahead while walking a working tree.
+
+Directories are still processed in the same order, but the next ones are
+listed and statted concurrently, which helps on network file systems
+where each directory read is slow. 0 (the default) reads one directory at
+a time.
+'''))
 option_registry.register_lazy('ssl.ca_certs',
                               'breezy.transport.http', 'opt_ssl_ca_certs')
 
@@ -28,6 +28,7 @@ try:
         WatchManager,
         IN_CREATE,
         IN_CLOSE_WRITE,
+        IN_MODIFY,
         IN_Q_OVERFLOW,
         IN_DELETE,
         IN_MOVED_TO,
@@ -42,9 +43,11 @@ except ImportError as e:
     raise DependencyNotPresent(library='pyinotify', error=e)
 
 
+# IN_MODIFY is needed as well as IN_CLOSE_WRITE, as files can be written to
+# and read back while they are still open.
 MASK = (
-    IN_CLOSE_WRITE | IN_DELETE | IN_Q_OVERFLOW | IN_MOVED_TO | IN_MOVED_FROM |
-    IN_ATTRIB)
+    IN_CREATE | IN_MODIFY | IN_CLOSE_WRITE | IN_DELETE | IN_Q_OVERFLOW |
+    IN_MOVED_TO | IN_MOVED_FROM | IN_ATTRIB)
 
 
 class _Process(ProcessEvent):
@@ -52,12 +55,23 @@ class _Process(ProcessEvent):
     def my_init(self):
         self.paths = set()
         self.created = set()
+        self.overflowed = False
+        # The number of events seen, the number at which each path was last
+        # touched and at which events were last lost.
+        self.num_events = 0
+        self.last_touched = {}
+        self.last_overflow = None
 
     def process_default(self, event):
+        self.num_events += 1
+        if event.mask & IN_Q_OVERFLOW:
+            self.overflowed = True
+            self.last_overflow = self.num_events
         path = os.path.join(event.path, event.name)
-        if event.mask & IN_CREATE:
+        if event.mask & IN_CREATE and path not in self.paths:
             self.created.add(path)
         self.paths.add(path)
+        self.last_touched[path] = self.num_events
         if event.mask & IN_DELETE and path in self.created:
             self.paths.remove(path)
             self.created.remove(path)
@@ -78,6 +92,8 @@ class DirtyTracker(object):
         self._wdd = self._wm.add_watch(
             tree.abspath(subpath), MASK, rec=True, auto_add=True,
             exclude_filter=check_excluded)
+        # The number of times the tracker was marked clean
+        self._generation = 0
 
     def _process_pending(self):
         if self._notifier.check_events(timeout=0):
@@ -92,12 +108,21 @@ class DirtyTracker(object):
         self._process_pending()
         self._process.paths.clear()
         self._process.created.clear()
+        self._process.overflowed = False
+        self._process.last_touched.clear()
+        self._process.last_overflow = None
+        self._generation += 1
 
     def is_dirty(self):
         """Check whether there are any changes."""
         self._process_pending()
         return bool(self._process.paths)
 
+    def overflowed(self):
+        """Check whether events were lost, so that changes may be missing."""
+        self._process_pending()
+        return self._process.overflowed
+
     def paths(self):
         """Return the paths that have changed."""
         self._process_pending()
@@ -106,3 +131,31 @@ class DirtyTracker(object):
     def relpaths(self):
         """Return the paths relative to the tree root that changed."""
         return set(self._tree.relpath(p) for p in self.paths())
+
+    def checkpoint(self):
+        """Return a token for the changes seen so far.
+
+        This lets several users of the tracker each find the paths touched
+        since they last looked, without marking the tracker clean.
+        """
+        self._process_pending()
+        return (self._generation, self._process.num_events)
+
+    def relpaths_since(self, checkpoint):
+        """Return the paths relative to the tree root touched since checkpoint.
+
+        :param checkpoint: A token returned by checkpoint().
+        :return: A set of paths, or None if the tracker was marked clean or
+            lost events since, so that it can not tell.
+        """
+        self._process_pending()
+        generation, num_events = checkpoint
+        if generation != self._generation:
+            return None
+        process = self._process
+        if (process.last_overflow is not None
+                and process.last_overflow > num_events):
+            return None
+        return set(self._tree.relpath(p)
+                   for p, touched in process.last_touched.items()
+                   if touched > num_events)
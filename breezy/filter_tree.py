@@ -20,6 +20,7 @@
 from io import BytesIO
 
 from . import (
+    osutils,
     tree,
     )
 from .filters import (
@@ -34,22 +35,43 @@ class ContentFilterTree(tree.Tree):
     Not every operation is supported yet.
     """
 
-    def __init__(self, backing_tree, filter_stack_callback):
+    def __init__(self, backing_tree, filter_stack_callback,
+                 filter_stacks_callback=None):
         """Construct a new filtered tree view.
 
         :param filter_stack_callback: A callable taking a path that returns
             the filter stack that should be used for that path.
         :param backing_tree: An underlying tree to wrap.
+        :param filter_stacks_callback: Optional callable taking a list of
+            paths that returns an iterator with the filter stack of each,
+            used to look up the stacks of many files at once.
         """
         self.backing_tree = backing_tree
         self.filter_stack_callback = filter_stack_callback
+        self.filter_stacks_callback = filter_stacks_callback
+        # The filter stacks of the files in the directory whose entries
+        # were returned last by iter_entries_by_dir.
+        self._directory_filter_stacks = {}
+
+    def _iter_filter_stacks(self, paths):
+        if self.filter_stacks_callback is not None:
+            return self.filter_stacks_callback(paths)
+        return (self.filter_stack_callback(path) for path in paths)
+
+    def _get_filter_stack(self, path):
+        try:
+            return self._directory_filter_stacks[path]
+        except KeyError:
+            return self.filter_stack_callback(path)
+
+    def _filter_chunks(self, path, chunks, filters):
+        context = ContentFilterContext(path, self)
+        return filtered_output_bytes(chunks, filters, context)
 
     def get_file_text(self, path):
         chunks = self.backing_tree.get_file_lines(path)
-        filters = self.filter_stack_callback(path)
-        context = ContentFilterContext(path, self)
-        contents = filtered_output_bytes(chunks, filters, context)
-        content = b''.join(contents)
+        filters = self._get_filter_stack(path)
+        content = b''.join(self._filter_chunks(path, chunks, filters))
         return content
 
     def get_file(self, path):
@@ -67,8 +89,44 @@ class ContentFilterTree(tree.Tree):
         # text.  Currently all callers cope with this; perhaps they should be
         # updated to a narrower interface that only provides things guaranteed
         # cheaply available across all trees. -- mbp 20110705
-        return self.backing_tree.iter_entries_by_dir(
+        entries = self.backing_tree.iter_entries_by_dir(
             specific_files=specific_files, recurse_nested=recurse_nested)
+        if self.filter_stacks_callback is None:
+            return entries
+        return self._iter_entries_finding_filter_stacks(entries)
+
+    def _iter_entries_finding_filter_stacks(self, entries):
+        """Look up the filter stacks of each directory's files at once.
+
+        Entries come a directory at a time, and callers such as exporters
+        read the text of the files as they go.
+        """
+        pending = []
+        for path, entry in entries:
+            if pending and osutils.dirname(path) != osutils.dirname(
+                    pending[0][0]):
+                for item in self._entries_with_filter_stacks(pending):
+                    yield item
+                pending = []
+            pending.append((path, entry))
+        for item in self._entries_with_filter_stacks(pending):
+            yield item
+
+    def _entries_with_filter_stacks(self, entries):
+        paths = [path for path, entry in entries if entry.kind == 'file']
+        self._directory_filter_stacks = dict(
+            zip(paths, self._iter_filter_stacks(paths)))
+        return entries
+
+    def iter_files_bytes(self, desired_files):
+        desired_files = list(desired_files)
+        paths = [path for path, identifier in desired_files]
+        filter_stacks = dict(zip(paths, self._iter_filter_stacks(paths)))
+        for (path, identifier), chunks in self.backing_tree.iter_files_bytes(
+                [(path, (path, identifier))
+                 for path, identifier in desired_files]):
+            yield identifier, self._filter_chunks(
+                path, chunks, filter_stacks[path])
 
     def lock_read(self):
         return self.backing_tree.lock_read()
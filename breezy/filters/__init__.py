@@ -161,8 +161,10 @@ def internal_size_sha_file_byname(name, filters):
 
 
 class FilteredStat(object):
+    """The stat of a file, with the size of its canonical form."""
 
     def __init__(self, base, st_size=None):
+        self.base = base
         self.st_mode = base.st_mode
         self.st_size = st_size or base.st_size
         self.st_mtime = base.st_mtime
@@ -197,7 +197,6 @@ class GitWorkingTree(MutableGitIndexTree, workingtree.WorkingTree):
         self.index = None
         self._index_file = None
         self.views = self._make_views()
-        self._rules_searcher = None
         self._detect_case_handling()
         self._reset_data()
 
@@ -1020,7 +1019,9 @@ class GitWorkingTree(MutableGitIndexTree, workingtree.WorkingTree):
             disk_top = disk_top[:-1]
         top_strip_len = len(disk_top) + 1
         inventory_iterator = self._walkdirs(prefix)
-        disk_iterator = osutils.walkdirs(disk_top, prefix)
+        disk_iterator = osutils.walkdirs(
+            disk_top, prefix,
+            threads=self.get_config_stack().get('walkdirs.threads'))
         try:
             current_disk = next(disk_iterator)
             disk_finished = False
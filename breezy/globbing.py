@@ -158,6 +158,15 @@ def _sub_extension(pattern):
     return _sub_basename(pattern[2:])
 
 
+# Characters that make a glob more than a literal string
+_glob_chars = lazy_regex.lazy_compile(r'[*?[\\]')
+# The canonicalization _sub_fullpath applies to path patterns
+_canonical_path = lazy_regex.lazy_compile(r'(?:(?<=/)|^)(?:\.?/)+')
+
+# The number of directories for which the applicable path patterns are kept
+_DIR_CACHE_SIZE = 10000
+
+
 class Globster(object):
     """A simple wrapper for a set of glob patterns.
 
@@ -182,6 +191,14 @@ class Globster(object):
     Also, the extension patterns are more likely to find a match and
     so are matched first, then the basename patterns, then the fullpath
     patterns.
+
+    Patterns without any wildcards are not matched with regular expressions
+    at all: literal extensions, basenames and paths are looked up in
+    dictionaries. Path patterns with wildcards are indexed by the directory
+    they start with, so only the patterns that can apply to a directory are
+    tried on the files in it; the patterns applicable to each directory are
+    cached. The super-regexes are only used for filenames containing
+    newlines, where the lookups would not behave the same.
     """
     # We want to _add_patterns in a specific order (as per type_list below)
     # starting with the shortest and going to the longest.
@@ -211,13 +228,16 @@ class Globster(object):
             "basename": [],
             "fullpath": [],
         }
+        normalized = []
         for pat in patterns:
             pat = normalize_pattern(pat)
             pattern_lists[Globster.identify(pat)].append(pat)
+            normalized.append(pat)
         pi = Globster.pattern_info
         for t in Globster.pattern_types:
             self._add_patterns(pattern_lists[t], pi[t]["translator"],
                                pi[t]["prefix"])
+        self._compile_lookups(normalized)
 
     def _add_patterns(self, patterns, translator, prefix=''):
         while patterns:
@@ -231,16 +251,96 @@ class Globster(object):
                 patterns[:99]))
             patterns = patterns[99:]
 
+    def _compile_lookups(self, patterns, ordered=False):
+        """Build the lookup tables used by match.
+
+        Patterns are recorded as (chunk, index, pattern) entries, where index
+        is the position in patterns. A super-regex of extension patterns
+        prefers the match with the shortest extension over the first
+        pattern, so the 99 pattern chunk an extension pattern would be
+        in is kept as well, to find the same pattern as the super-regexes.
+
+        :param patterns: Normalized patterns.
+        :param ordered: If True, the first matching pattern is wanted
+            regardless of its type.
+        """
+        self._literals = {"extension": {}, "basename": {}, "fullpath": {}}
+        residue = {"extension": [], "basename": []}
+        prefixed = {}
+        extensions = 0
+        for index, pat in enumerate(patterns):
+            t = Globster.identify(pat)
+            if t == "extension":
+                if ordered:
+                    entry = (index, index, pat)
+                else:
+                    entry = (extensions // 99, index, pat)
+                    extensions += 1
+                if _glob_chars.search(pat, 2) is None:
+                    self._literals[t].setdefault(pat[2:], entry)
+                else:
+                    residue[t].append(entry)
+                continue
+            entry = (index, index, pat)
+            if t == "basename":
+                if _glob_chars.search(pat) is None:
+                    self._literals[t].setdefault(pat, entry)
+                else:
+                    residue[t].append(entry)
+            elif pat.startswith(u'RE:'):
+                prefixed.setdefault(u'', []).append(entry)
+            else:
+                m = _glob_chars.search(pat)
+                if m is None:
+                    self._literals[t].setdefault(
+                        _canonical_path.sub(u'', pat), entry)
+                else:
+                    # Only files below the directory leading up to the first
+                    # wildcard can match.
+                    prefix = _canonical_path.sub(
+                        u'', pat[:pat.rfind(u'/', 0, m.start()) + 1])
+                    prefixed.setdefault(prefix, []).append(entry)
+        self._residue = dict(
+            (t, self._compile_entries(t, entries))
+            for t, entries in residue.items())
+        self._prefixed = dict(
+            (prefix, self._compile_entries("fullpath", entries))
+            for prefix, entries in prefixed.items())
+        self._dir_cache = {}
+
+    def _compile_entries(self, pattern_type, entries):
+        """Aggregate entries into super-regexes of a single chunk each.
+
+        :return: A list of (regex, entries) tuples, in pattern order.
+        """
+        translator = Globster.pattern_info[pattern_type]["translator"]
+        prefix = Globster.pattern_info[pattern_type]["prefix"]
+        chunks = []
+        for entry in entries:
+            if (chunks and len(chunks[-1]) < 99 and (
+                    pattern_type != "extension" or
+                    chunks[-1][0][0] == entry[0])):
+                chunks[-1].append(entry)
+            else:
+                chunks.append([entry])
+        result = []
+        for chunk in chunks:
+            joined_rule = '%s(?:%s)$' % (
+                prefix, '|'.join(['(%s)' % translator(entry[2])
+                                  for entry in chunk]))
+            result.append(
+                (lazy_regex.lazy_compile(joined_rule, re.UNICODE), chunk))
+        return result
+
     def match(self, filename):
         """Searches for a pattern that matches the given filename.
 
         :return A matching pattern or None if there is no matching pattern.
         """
         try:
-            for regex, patterns in self._regex_patterns:
-                match = regex.match(filename)
-                if match:
-                    return patterns[match.lastindex - 1]
+            if u'\n' in filename:
+                return self._match_regexes(filename)
+            return self._match(filename)
         except lazy_regex.InvalidPattern as e:
             # We can't show the default e.msg to the user as thats for
             # the combined pattern we sent to regex. Instead we indicate to
@@ -256,8 +356,105 @@ class Globster(object):
                         bad_patterns += ('\n  %s' % p)
             e.msg += bad_patterns
             raise e
+
+    def _match(self, filename):
+        for t in Globster.pattern_types:
+            found = self._match_type(t, filename)
+            if found is not None:
+                return found[3]
+        return None
+
+    def _match_regexes(self, filename):
+        for regex, patterns in self._regex_patterns:
+            match = regex.match(filename)
+            if match:
+                return patterns[match.lastindex - 1]
         return None
 
+    def _match_type(self, pattern_type, filename):
+        """Find the pattern of a type that matches filename.
+
+        :return: A (chunk, -offset, index, pattern) tuple, where offset is
+            where the text matched by the pattern starts in filename, or
+            None if no pattern matches.
+        """
+        literals = self._literals[pattern_type]
+        if pattern_type == "fullpath":
+            best = self._found(literals.get(filename), 0)
+            for regexes in self._prefixed_regexes(
+                    filename[:filename.rfind(u'/') + 1]):
+                best = self._search(regexes, filename, best)
+            return best
+        start = filename.rfind(u'/') + 1
+        if pattern_type == "basename":
+            best = self._found(literals.get(filename[start:]), start)
+        else:
+            best = None
+            if literals:
+                # *.tar.gz matches any basename ending in .tar.gz, so every
+                # suffix following a dot is a candidate.
+                dot = filename.find(u'.', start)
+                while dot != -1:
+                    found = self._found(
+                        literals.get(filename[dot + 1:]), dot + 1)
+                    if found is not None and (best is None or found < best):
+                        best = found
+                    dot = filename.find(u'.', dot + 1)
+        return self._search(self._residue[pattern_type], filename, best)
+
+    @staticmethod
+    def _found(entry, offset):
+        if entry is None:
+            return None
+        return (entry[0], -offset, entry[1], entry[2])
+
+    def _search(self, regexes, filename, best):
+        """Search super-regexes for a pattern that precedes best.
+
+        :return: The matching pattern as returned by _match_type, or best if
+            no pattern before it matches.
+        """
+        for regex, entries in regexes:
+            if best is not None and entries[0][0] > best[0]:
+                break
+            match = regex.match(filename)
+            if match:
+                found = self._found(
+                    entries[match.lastindex - 1],
+                    match.start(match.lastindex))
+                if best is None or found < best:
+                    best = found
+                break
+        return best
+
+    def _prefixed_regexes(self, dirname):
+        """Return the path pattern regexes that can match files in dirname.
+
+        :param dirname: The directory part of a filename, ending in a slash
+            unless it is empty.
+        :return: A list of lists as returned by _compile_entries.
+        """
+        prefixed = self._prefixed
+        if not prefixed or (len(prefixed) == 1 and u'' in prefixed):
+            return list(prefixed.values())
+        try:
+            return self._dir_cache[dirname]
+        except KeyError:
+            pass
+        result = []
+        if u'' in prefixed:
+            result.append(prefixed[u''])
+        slash = dirname.find(u'/')
+        while slash != -1:
+            regexes = prefixed.get(dirname[:slash + 1])
+            if regexes is not None:
+                result.append(regexes)
+            slash = dirname.find(u'/', slash + 1)
+        if len(self._dir_cache) >= _DIR_CACHE_SIZE:
+            self._dir_cache.clear()
+        self._dir_cache[dirname] = result
+        return result
+
     @staticmethod
     def identify(pattern):
         """Returns pattern category.
@@ -339,11 +536,24 @@ class _OrderedGlobster(Globster):
         """
         # Note: This could be smarter by running like sequences together
         self._regex_patterns = []
+        normalized = []
         for pat in patterns:
             pat = normalize_pattern(pat)
             t = Globster.identify(pat)
             self._add_patterns([pat], Globster.pattern_info[t]["translator"],
                                Globster.pattern_info[t]["prefix"])
+            normalized.append(pat)
+        self._compile_lookups(normalized, ordered=True)
+
+    def _match(self, filename):
+        best = None
+        for t in Globster.pattern_types:
+            found = self._match_type(t, filename)
+            if found is not None and (best is None or found < best):
+                best = found
+        if best is None:
+            return None
+        return best[3]
 
 
 _slashes = lazy_regex.lazy_compile(r'[\\/]+')
@@ -123,6 +123,31 @@ class StackedParentsProvider(object):
                 break
         return found
 
+    def get_generations(self, keys):
+        """Get the generation numbers of keys, where known.
+
+        The generation of a revision is one more than the highest generation
+        of its parents, with NULL_REVISION at generation 0. Providers only
+        know the generation of revisions whose full ancestry they have, so
+        the answers of different providers are always consistent.
+
+        :param keys: An iterable of keys.
+        :return: A dictionary mapping the keys with a known generation to it.
+        """
+        found = {}
+        remaining = set(keys)
+        for parents_provider in self._parent_providers:
+            get_generations = getattr(parents_provider, 'get_generations',
+                                      None)
+            if get_generations is None:
+                continue
+            new_found = get_generations(remaining)
+            found.update(new_found)
+            remaining.difference_update(new_found)
+            if not remaining:
+                break
+        return found
+
 
 class CachingParentsProvider(object):
     """A parents provider which will cache the revision => parents as a dict.
@@ -214,6 +239,14 @@ class CachingParentsProvider(object):
         if self._cache_misses:
             self.missing_keys.add(key)
 
+    def get_generations(self, keys):
+        """See StackedParentsProvider.get_generations."""
+        get_generations = getattr(self._real_provider, 'get_generations',
+                                  None)
+        if get_generations is None:
+            return {}
+        return get_generations(keys)
+
 
 class CallableToParentsProviderAdapter(object):
     """A parents provider that adapts any callable to the parents provider API.
@@ -254,6 +287,8 @@ class Graph(object):
             self.get_parents = parents_provider.get_parents
         if getattr(parents_provider, 'get_parent_map', None) is not None:
             self.get_parent_map = parents_provider.get_parent_map
+        self._get_generations = getattr(parents_provider, 'get_generations',
+                                        None)
         self._parents_provider = parents_provider
 
     def __repr__(self):
@@ -833,6 +868,11 @@ class Graph(object):
                 return {revision.NULL_REVISION}
         if len(candidate_heads) < 2:
             return candidate_heads
+        if self._get_generations is not None:
+            generations = self._get_generations(candidate_heads)
+            if len(generations) == len(candidate_heads):
+                return self._heads_from_generations(candidate_heads,
+                                                    generations)
         searchers = dict((c, self._make_breadth_first_searcher([c]))
                          for c in candidate_heads)
         active_searchers = dict(searchers)
@@ -899,6 +939,33 @@ class Graph(object):
             common_walker.start_searching(new_common)
         return candidate_heads
 
+    def _heads_from_generations(self, candidate_heads, generations):
+        """Return the heads from amongst keys with known generations.
+
+        A key can only be an ancestor of keys with a higher generation, so
+        the ancestry of the candidates only has to be searched down to the
+        lowest generation amongst them.
+        """
+        min_generation = min(generations.values())
+        heads = set(candidate_heads)
+        seen = set(candidate_heads)
+        pending = [key for key in candidate_heads
+                   if generations[key] > min_generation]
+        while pending:
+            parents = set()
+            for parent_keys in self.get_parent_map(pending).values():
+                parents.update(parent_keys)
+            heads.difference_update(parents)
+            parents.difference_update(seen)
+            seen.update(parents)
+            generations = self._get_generations(parents)
+            # Keys without a generation should not occur, but would have to
+            # be searched.
+            pending = [key for key in parents
+                       if generations.get(key, min_generation + 1)
+                       > min_generation]
+        return heads
+
     def find_merge_order(self, tip_revision_id, lca_revision_ids):
         """Find the order that each revision was merged into tip.
 
@@ -1700,6 +1767,13 @@ class GraphThunkIdsToKeys(object):
     def add_node(self, revision, parents):
         self._graph.add_node((revision,), [(p,) for p in parents])
 
+    def get_parent_keys(self, revision):
+        """See KnownGraph.get_parent_keys()"""
+        parent_keys = self._graph.get_parent_keys((revision,))
+        if parent_keys is None:
+            return None
+        return [p for (p,) in parent_keys]
+
 
 _counters = [0, 0, 0, 0, 0, 0, 0]
 try:
@@ -1243,6 +1243,29 @@ def _get_mainline_revs(branch, start_revision, end_revision):
     return mainline_revs, rev_nos, start_rev_id, end_rev_id
 
 
+def _find_modified_text_revisions(repository, file_id, view_revisions):
+    """Find the revisions in view_revisions with a text of file_id."""
+    # Lookup all possible text keys to determine which ones actually modified
+    # the file.
+    get_parent_map = repository.get_file_graph().get_parent_map
+    text_keys = [(file_id, rev_id) for rev_id, revno, depth in view_revisions]
+    # Looking up keys in batches of 1000 can cut the time in half, as well as
+    # memory consumption. GraphIndex *does* like to look for a few keys in
+    # parallel, it just doesn't like looking for *lots* of keys in parallel.
+    # TODO: This code needs to be re-evaluated periodically as we tune the
+    #       indexing layer. We might consider passing in hints as to the known
+    #       access pattern (sparse/clustered, high success rate/low success
+    #       rate). This particular access is clustered with a low success rate.
+    modified_text_revisions = set()
+    chunk_size = 1000
+    for start in range(0, len(text_keys), chunk_size):
+        next_keys = text_keys[start:start + chunk_size]
+        # Only keep the revision_id portion of the key
+        modified_text_revisions.update(
+            [k[1] for k in get_parent_map(next_keys)])
+    return modified_text_revisions
+
+
 def _filter_revisions_touching_path(branch, path, view_revisions,
                                     include_merges=True):
     r"""Return the list of revision ids which touch a given path.
@@ -1282,29 +1305,20 @@ def _filter_revisions_touching_path(branch, path, view_revisions,
 
     :return: A list of (revision_id, dotted_revno, merge_depth) tuples.
     """
-    # Lookup all possible text keys to determine which ones actually modified
-    # the file.
-    graph = branch.repository.get_file_graph()
     start_tree = branch.repository.revision_tree(view_revisions[0][0])
     file_id = start_tree.path2id(path)
-    get_parent_map = graph.get_parent_map
-    text_keys = [(file_id, rev_id) for rev_id, revno, depth in view_revisions]
-    next_keys = None
-    # Looking up keys in batches of 1000 can cut the time in half, as well as
-    # memory consumption. GraphIndex *does* like to look for a few keys in
-    # parallel, it just doesn't like looking for *lots* of keys in parallel.
-    # TODO: This code needs to be re-evaluated periodically as we tune the
-    #       indexing layer. We might consider passing in hints as to the known
-    #       access pattern (sparse/clustered, high success rate/low success
-    #       rate). This particular access is clustered with a low success rate.
-    modified_text_revisions = set()
-    chunk_size = 1000
-    for start in range(0, len(text_keys), chunk_size):
-        next_keys = text_keys[start:start + chunk_size]
-        # Only keep the revision_id portion of the key
-        modified_text_revisions.update(
-            [k[1] for k in get_parent_map(next_keys)])
-    del text_keys, next_keys
+    keys_with_prefixes = getattr(
+        branch.repository.texts, 'keys_with_prefixes', None)
+    if file_id is None:
+        modified_text_revisions = set()
+    elif keys_with_prefixes is not None:
+        # The text index is sorted by file id, so the texts of the file can
+        # be read directly
+        modified_text_revisions = set(
+            key[1] for key in keys_with_prefixes([(file_id, None)]))
+    else:
+        modified_text_revisions = _find_modified_text_revisions(
+            branch.repository, file_id, view_revisions)
 
     result = []
     # Track what revisions will merge the current revision, replace entries
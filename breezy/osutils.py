@@ -1697,7 +1697,7 @@ def _is_error_enotdir(e):
     return False
 
 
-def walkdirs(top, prefix=""):
+def walkdirs(top, prefix="", threads=0):
     """Yield data about all the directories in a tree.
 
     This yields all the data about the contents of a directory at a time.
@@ -1723,6 +1723,8 @@ def walkdirs(top, prefix=""):
     :param prefix: Prefix the relpaths that are yielded with 'prefix'. This
         allows one to walk a subtree but get paths that are relative to a tree
         rooted higher up.
+    :param threads: If non-zero, read the directories that will be yielded
+        next on this many threads. The results are the same.
     :return: an iterator over the dirs.
     """
     # TODO there is a bit of a smell where the results of the directory-
@@ -1731,35 +1733,103 @@ def walkdirs(top, prefix=""):
     # potentially confusing output. We should make this more robust - but
     # not at a speed cost. RBC 20060731
     _directory = _directory_kind
-    pending = [(safe_unicode(prefix), "", _directory, None, safe_unicode(top))]
+    start = (safe_unicode(prefix), "", _directory, None, safe_unicode(top))
+    if threads:
+        for result in _walkdirs_prefetching(_read_dir_unicode, start, threads):
+            yield result
+        return
+    pending = [start]
     while pending:
         # 0 - relpath, 1- basename, 2- kind, 3- stat, 4-toppath
         relroot, _, _, _, top = pending.pop()
-        if relroot:
-            relprefix = relroot + u'/'
-        else:
-            relprefix = ''
-        top_slash = top + u'/'
-
-        dirblock = []
-        try:
-            for entry in scandir(top):
-                name = decode_filename(entry.name)
-                statvalue = entry.stat(follow_symlinks=False)
-                kind = file_kind_from_stat_mode(statvalue.st_mode)
-                dirblock.append((relprefix + name, name, kind, statvalue, entry.path))
-        except OSError as e:
-            if not _is_error_enotdir(e):
-                raise
-        except UnicodeDecodeError as e:
-            raise errors.BadFilenameEncoding(e.object, _fs_enc)
-        dirblock.sort()
+        dirblock = _read_dir_unicode(relroot, top)
         yield (relroot, top), dirblock
 
         # push the user specified dirs from dirblock
         pending.extend(d for d in reversed(dirblock) if d[2] == _directory)
 
 
+def _read_dir_unicode(relroot, top):
+    """Read a directory for walkdirs.
+
+    :return: The sorted dirblock for the directory.
+    """
+    if relroot:
+        relprefix = relroot + u'/'
+    else:
+        relprefix = ''
+    dirblock = []
+    try:
+        for entry in scandir(top):
+            name = decode_filename(entry.name)
+            statvalue = entry.stat(follow_symlinks=False)
+            kind = file_kind_from_stat_mode(statvalue.st_mode)
+            dirblock.append((relprefix + name, name, kind, statvalue, entry.path))
+    except OSError as e:
+        if not _is_error_enotdir(e):
+            raise
+    except UnicodeDecodeError as e:
+        raise errors.BadFilenameEncoding(e.object, _fs_enc)
+    dirblock.sort()
+    return dirblock
+
+
+# How many directories to read ahead for each thread.
+_WALKDIRS_WINDOW_PER_THREAD = 4
+
+
+def _walkdirs_prefetching(read_dir, start, threads):
+    """Walk directories like walkdirs, reading ahead on a pool of threads.
+
+    The directories that will be yielded next are read while the caller
+    looks at the current one, but they are still yielded in the same order.
+    The subdirectories of a directory are only queued once the caller is
+    done with it, so directories the caller removes from a dirblock are never
+    read. Errors reading a directory are raised when it would have been read.
+
+    :param read_dir: A callable taking the relpath and path-from-top of a
+        directory and returning its sorted dirblock.
+    :param start: The entry for the directory to start at.
+    :param threads: The number of threads to read directories on.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    _directory = _directory_kind
+    window = threads * _WALKDIRS_WINDOW_PER_THREAD
+    executor = ThreadPoolExecutor(threads)
+    # A stack of lists of [entry, future] items, the next directory to
+    # yield last.
+    pending = [[[start, None]]]
+
+    def read_ahead():
+        count = 0
+        for items in reversed(pending):
+            for item in reversed(items):
+                if item[1] is None:
+                    item[1] = executor.submit(read_dir, item[0][0], item[0][4])
+                count += 1
+                if count >= window:
+                    return
+
+    try:
+        while pending:
+            read_ahead()
+            entry, future = pending[-1].pop()
+            if not pending[-1]:
+                pending.pop()
+            dirblock = future.result()
+            yield (entry[0], entry[4]), dirblock
+            # push the user specified dirs from dirblock
+            next = [[d, None] for d in reversed(dirblock) if d[2] == _directory]
+            if next:
+                pending.append(next)
+    finally:
+        for items in pending:
+            for item in items:
+                if item[1] is not None:
+                    item[1].cancel()
+        executor.shutdown(wait=False)
+
+
 class DirReader(object):
     """An interface for reading directories."""
 
@@ -1788,13 +1858,16 @@ class DirReader(object):
 _selected_dir_reader = None
 
 
-def _walkdirs_utf8(top, prefix=""):
+def _walkdirs_utf8(top, prefix="", threads=0):
     """Yield data about all the directories in a tree.
 
     This yields the same information as walkdirs() only each entry is yielded
     in utf-8. On platforms which have a filesystem encoding of utf8 the paths
     are returned as exact byte-strings.
 
+    :param threads: If non-zero, read the directories that will be yielded
+        next on this many threads. The results are the same.
+
     :return: yields a tuple of (dir_info, [file_info])
         dir_info is (utf8_relpath, path-from-top)
         file_info is (utf8_relpath, utf8_name, kind, lstat, path-from-top)
@@ -1824,8 +1897,15 @@ def _walkdirs_utf8(top, prefix=""):
 
     # 0 - relpath, 1- basename, 2- kind, 3- stat, 4-toppath
     # But we don't actually uses 1-3 in pending, so set them to None
-    pending = [[_selected_dir_reader.top_prefix_to_starting_dir(top, prefix)]]
+    start = _selected_dir_reader.top_prefix_to_starting_dir(top, prefix)
     read_dir = _selected_dir_reader.read_dir
+    if threads:
+        def read_sorted_dir(prefix, top):
+            return sorted(read_dir(prefix, top))
+        for result in _walkdirs_prefetching(read_sorted_dir, start, threads):
+            yield result
+        return
+    pending = [[start]]
     _directory = _directory_kind
     while pending:
         relroot, _, _, _, top = pending[-1].pop()
@@ -18,6 +18,7 @@
 from io import BytesIO
 
 from ... import (
+    config as _mod_config,
     errors,
     graph as _mod_graph,
     osutils,
@@ -240,9 +241,10 @@ class RevisionStore(object):
         self._rev_parent_invs = parent_invs
         # We don't know what the branch will be so there's no real BranchConfig.
         # That means we won't be triggering any hooks and that's a good thing.
-        # Without a config though, we must pass in the committer below so that
-        # the commit builder doesn't try to look up the config.
-        config = None
+        # The global config still tells the commit builder how to store
+        # texts, but we must pass in the committer below so that it doesn't
+        # try to look up an email address.
+        config = _mod_config.GlobalStack()
         # We can't use self.repo.get_commit_builder() here because it starts a
         # new write group. We want one write group around a batch of imports
         # where the default batch size is currently 10000. IGC 20090312
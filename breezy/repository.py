@@ -908,6 +908,25 @@ class Repository(controldir.ControlComponent, _RelockDebugMixin):
           children are included.
         """
         from .tree import InterTree
+        # Calculate the deltas
+        for old_tree, new_tree in self._iter_revision_delta_trees(revisions):
+            intertree = InterTree.get(old_tree, new_tree)
+            yield intertree.compare(specific_files=specific_files)
+            if specific_files is not None:
+                specific_files = [
+                    p for p in intertree.find_source_paths(
+                        specific_files).values()
+                    if p is not None]
+
+    def _iter_revision_delta_trees(self, revisions):
+        """Iterate over the pairs of trees to compare for revisions.
+
+        This is the worker for get_revision_deltas. Subclasses may override
+        it to prepare the trees for comparison in bulk.
+
+        :return: An iterator over (old_tree, new_tree) tuples, one for each
+            revision in revisions.
+        """
         # Get the revision-ids of interest
         required_trees = set()
         for revision in revisions:
@@ -918,19 +937,12 @@ class Repository(controldir.ControlComponent, _RelockDebugMixin):
             t.get_revision_id(): t
             for t in self.revision_trees(required_trees)}
 
-        # Calculate the deltas
         for revision in revisions:
             if not revision.parent_ids:
                 old_tree = self.revision_tree(_mod_revision.NULL_REVISION)
             else:
                 old_tree = trees[revision.parent_ids[0]]
-            intertree = InterTree.get(old_tree, trees[revision.revision_id])
-            yield intertree.compare(specific_files=specific_files)
-            if specific_files is not None:
-                specific_files = [
-                    p for p in intertree.find_source_paths(
-                        specific_files).values()
-                    if p is not None]
+            yield old_tree, trees[revision.revision_id]
 
     def store_revision_signature(self, gpg_strategy, plaintext, revision_id):
         raise NotImplementedError(self.store_revision_signature)
@@ -1499,6 +1511,11 @@ format_registry.register_lazy(
     'breezy.bzr.groupcompress_repo',
     'RepositoryFormat2aSubtree',
     )
+format_registry.register_lazy(
+    b'Bazaar development format 9 (2a with raw index leaves)\n',
+    'breezy.bzr.groupcompress_repo',
+    'RepositoryFormat2aRawIndex',
+    )
 
 
 class InterRepository(InterObject):
@@ -33,7 +33,6 @@ class RevisionTree(tree.Tree):
     def __init__(self, repository, revision_id):
         self._repository = repository
         self._revision_id = revision_id
-        self._rules_searcher = None
 
     def has_versioned_directories(self):
         """See `Tree.has_versioned_directories`."""
@@ -84,10 +83,3 @@ class RevisionTree(tree.Tree):
 
     def unlock(self):
         self._repository.unlock()
-
-    def _get_rules_searcher(self, default_searcher):
-        """See Tree._get_rules_searcher."""
-        if self._rules_searcher is None:
-            self._rules_searcher = super(RevisionTree,
-                                         self)._get_rules_searcher(default_searcher)
-        return self._rules_searcher
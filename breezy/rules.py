@@ -73,6 +73,21 @@ class _RulesSearcher(object):
         """
         raise NotImplementedError(self.get_selected_items)
 
+    def iter_selected_items(self, paths, names):
+        """Return selected preferences for many paths.
+
+        Searchers can answer this faster than get_selected_items called for
+        each path, for example when paths are given a directory at a time,
+        as iter_entries_by_dir does.
+
+        :param paths: an iterable of tree relative paths
+        :param names: the list of preferences to lookup
+        :return: an iterator with a sequence of name,value tuples per path,
+          as returned by get_selected_items.
+        """
+        for path in paths:
+            yield self.get_selected_items(path, names)
+
     def get_single_value(self, path, preference_name):
         """Get a single preference for a single file.
 
@@ -82,6 +97,18 @@ class _RulesSearcher(object):
             return value
         return None
 
+    def fingerprint(self, names):
+        """Return a fingerprint of the rules for selected preferences.
+
+        The fingerprint changes whenever the value of one of the preferences
+        may have changed for some path.
+
+        :param names: the list of preferences
+        :return: a sha1 as a hex bytestring, or None if there are no rules
+          or the searcher can not tell.
+        """
+        return None
+
 
 class _IniBasedRulesSearcher(_RulesSearcher):
 
@@ -110,6 +137,9 @@ class _IniBasedRulesSearcher(_RulesSearcher):
             self._globster = globbing._OrderedGlobster(patterns)
         else:
             self._globster = None
+        # (section, names) -> selected items; files matching the same rule
+        # share a tuple, so their filter stacks are only built once.
+        self._selected_items = {}
 
     def get_items(self, path):
         """See _RulesSearcher.get_items."""
@@ -130,8 +160,44 @@ class _IniBasedRulesSearcher(_RulesSearcher):
         if pat is None:
             return ()
         else:
-            all = self._cfg[self.pattern_to_section[pat]]
-            return tuple((k, all.get(k)) for k in names)
+            return self._get_section_items(
+                self.pattern_to_section[pat], tuple(names))
+
+    def iter_selected_items(self, paths, names):
+        """See _RulesSearcher.iter_selected_items."""
+        if self._globster is None:
+            for path in paths:
+                yield ()
+            return
+        names = tuple(names)
+        match = self._globster.match
+        pattern_to_section = self.pattern_to_section
+        for path in paths:
+            pat = match(path)
+            if pat is None:
+                yield ()
+            else:
+                yield self._get_section_items(pattern_to_section[pat], names)
+
+    def fingerprint(self, names):
+        """See _RulesSearcher.fingerprint."""
+        if self._globster is None:
+            return None
+        names = tuple(names)
+        # Sections without any of the preferences still matter, since the
+        # first section matching a path wins.
+        return osutils.sha_strings(
+            [('%r %r\n' % (section, self._get_section_items(section, names))
+              ).encode('utf-8') for section in self._cfg.keys()])
+
+    def _get_section_items(self, section, names):
+        try:
+            return self._selected_items[section, names]
+        except KeyError:
+            all = self._cfg[section]
+            items = tuple((k, all.get(k)) for k in names)
+            self._selected_items[section, names] = items
+            return items
 
 
 class _StackedRulesSearcher(_RulesSearcher):
@@ -159,6 +225,35 @@ class _StackedRulesSearcher(_RulesSearcher):
                 return result
         return ()
 
+    def iter_selected_items(self, paths, names):
+        """See _RulesSearcher.iter_selected_items."""
+        paths = list(paths)
+        results = [()] * len(paths)
+        # Only ask the later searchers about the paths that the earlier ones
+        # have no preferences for.
+        pending = list(range(len(paths)))
+        for searcher in self.searchers:
+            if not pending:
+                break
+            unmatched = []
+            for i, result in zip(pending, searcher.iter_selected_items(
+                    [paths[i] for i in pending], names)):
+                if result:
+                    results[i] = result
+                else:
+                    unmatched.append(i)
+            pending = unmatched
+        return iter(results)
+
+    def fingerprint(self, names):
+        """See _RulesSearcher.fingerprint."""
+        fingerprints = [searcher.fingerprint(names)
+                        for searcher in self.searchers]
+        if all(fingerprint is None for fingerprint in fingerprints):
+            return None
+        return osutils.sha_strings(
+            [(fingerprint or b'') + b'\n' for fingerprint in fingerprints])
+
 
 def rules_path():
     """Return the default rules file path."""
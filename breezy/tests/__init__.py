@@ -85,6 +85,7 @@ from .. import (
     workingtree,
     )
 from breezy.bzr import (
+    annotation_cache,
     chk_map,
     )
 try:
@@ -138,6 +139,7 @@ isolated_environ = {
     'HOME': None,
     'GNUPGHOME': None,
     'XDG_CONFIG_HOME': None,
+    'XDG_CACHE_HOME': None,
     # brz now uses the Win32 API and doesn't rely on APPDATA, but the
     # tests do check our impls match APPDATA
     'BRZ_EDITOR': None,  # test_msgeditor manipulates this variable
@@ -2499,6 +2501,14 @@ class TestCaseWithMemoryTransport(TestCase):
         # don't actually exist. They'll rightly fail if they try to create them
         # though.
         self.overrideAttr(config, '_shared_stores', {})
+        # Likewise for the annotation caches, whose databases are closed once
+        # the test is done.
+        self.overrideAttr(annotation_cache, '_caches', {})
+        self.addCleanup(self._close_annotation_caches)
+
+    def _close_annotation_caches(self):
+        for cache in annotation_cache._caches.values():
+            cache.close()
 
     def get_transport(self, relpath=None):
         """Return a writeable transport.
@@ -37,6 +37,7 @@ from ... import (
 from ...branch import Branch
 from ...controldir import ControlDir
 from ...bzr.smart import client, medium
+from ...bzr.smart import repository as smart_repo
 from ...bzr.smart.server import (
     BzrServerFactory,
     SmartTCPServer,
@@ -312,6 +313,24 @@ class TestBzrServe(TestBzrServeBase):
             err)
         self.assertServerFinishesCleanly(process)
 
+    def test_bzr_serve_with_workers(self):
+        gs = config.GlobalStack()
+        gs.set('serve.workers', 2)
+        gs.set('serve.client_timeout', 0.2)
+        gs.store.save()
+        self.make_branch('.')
+        process, url = self.start_server_port(['--allow-writes'])
+        branch = Branch.open(url)
+        self.make_read_requests(branch)
+        # Idle clients are disconnected as by the default server.
+        m = branch.repository._client._medium
+        m.read_bytes(1)
+        err = process.stderr.readline()
+        self.assertEqual(
+            b'Connection Timeout: disconnecting client after 0.2 seconds\n',
+            err)
+        self.assertServerFinishesCleanly(process)
+
     def test_bzr_serve_graceful_shutdown(self):
         big_contents = b'a' * 64 * 1024
         self.build_tree_contents([('bigfile', big_contents)])
@@ -415,6 +434,18 @@ class TestUserdirExpansion(TestCaseWithMemoryTransport):
         self.assertFalse(
             bzr_server.smart_server.backing_transport.has('~user'))
 
+    def test_bzr_serve_response_cache(self):
+        self.assertIs(None, smart_repo._response_cache)
+        config.GlobalStack().set('serve.response_cache_size', '1M')
+        bzr_server = BzrServerFactory()
+        bzr_server.set_up(self.get_transport(), None, None, inet=True,
+                          timeout=4.0)
+        cache = smart_repo._response_cache
+        self.assertIsInstance(cache, smart_repo.ResponseCache)
+        self.assertEqual(1000000, cache._memory._max_size)
+        bzr_server.tear_down()
+        self.assertIs(None, smart_repo._response_cache)
+
     def test_get_base_path(self):
         """cmd_serve will turn the --directory option into a LocalTransport
         (optionally decorated with 'readonly+').  BzrServerFactory can
@@ -142,6 +142,16 @@ class TestEolConversion(TestCaseWithWorkingTree):
 
     # Test binary files. These always roundtrip.
 
+    def test_fingerprint_follows_rules_searcher(self):
+        t, basis = self.prepare_tree(_sample_text, eol='lf')
+        lf_fingerprint = t._content_filter_fingerprint()
+        self.assertNotEqual(None, lf_fingerprint)
+        self.patch_rules_searcher('crlf')
+        self.assertNotIn(
+            t._content_filter_fingerprint(), (None, lf_fingerprint))
+        self.patch_rules_searcher('lf')
+        self.assertEqual(lf_fingerprint, t._content_filter_fingerprint())
+
     def test_eol_no_rules_binary(self):
         wt, basis = self.prepare_tree(_sample_binary)
         self.assertContent(wt, basis, _sample_binary, _sample_binary,
@@ -35,6 +35,21 @@ def load_tests(loader, standard_tests, pattern):
     return suite
 
 
+class _MemoryAnnotationCache(object):
+
+    def __init__(self):
+        self.annotations = {}
+        self.added = []
+
+    def get_annotations(self, keys):
+        return dict((key, self.annotations[key]) for key in keys
+                    if key in self.annotations)
+
+    def add_annotations(self, key, annotations):
+        self.added.append(key)
+        self.annotations[key] = annotations
+
+
 class TestAnnotator(tests.TestCaseWithMemoryTransport):
 
     module = None  # Set by load_tests
@@ -373,3 +388,121 @@ class TestAnnotator(tests.TestCaseWithMemoryTransport):
         self.assertAnnotateEqual([(self.fb_key,),
                                   (self.fb_key,),
                                   ], self.fb_key)
+
+    def test_annotate_adds_to_cache(self):
+        self.make_merge_text()
+        cache = _MemoryAnnotationCache()
+        ann = self.module.Annotator(self.vf, cache=cache)
+        annotations, lines = ann.annotate(self.fd_key)
+        self.assertEqual([self.fd_key], cache.added)
+        self.assertEqual(annotations, cache.annotations[self.fd_key])
+
+    def test_annotate_uses_cache(self):
+        self.make_merge_text()
+        cache = _MemoryAnnotationCache()
+        cache.annotations[self.fb_key] = [(self.fa_key,), (self.fb_key,)]
+        ann = self.module.Annotator(self.vf, cache=cache)
+        keys, ann_keys = ann._get_needed_keys(self.fd_key)
+        # The ancestry of B is not needed, A is only needed for C
+        self.assertEqual([self.fa_key, self.fb_key, self.fc_key, self.fd_key],
+                         sorted(keys))
+        self.assertEqual({self.fa_key: 1, self.fc_key: 1, self.fb_key: 1,
+                          self.fd_key: 1}, ann._num_needed_children)
+        ann = self.module.Annotator(self.vf, cache=cache)
+        self.ann = ann
+        self.assertAnnotateEqual([(self.fa_key,), (self.fc_key,),
+                                  (self.fb_key,), (self.fd_key,)],
+                                 self.fd_key)
+
+    def test_annotate_with_ghost_not_cached(self):
+        self.make_simple_text()
+        ghost_key = (b'f-id', b'ghost-id')
+        self.vf.add_lines(self.fc_key, [self.fb_key, ghost_key],
+                          [b'simple\n', b'ghost content\n'])
+        cache = _MemoryAnnotationCache()
+        ann = self.module.Annotator(self.vf, cache=cache)
+        self.assertRaises(errors.RevisionNotPresent, ann.annotate, self.fc_key)
+        self.assertTrue(ann._found_ghosts)
+        self.assertEqual([], cache.added)
+
+    def test_annotate_cached_key(self):
+        self.make_simple_text()
+        cache = _MemoryAnnotationCache()
+        # Annotations that could not be computed from the texts
+        cache.annotations[self.fb_key] = [(self.fb_key,), (self.fb_key,)]
+        self.ann = self.module.Annotator(self.vf, cache=cache)
+        self.assertAnnotateEqual([(self.fb_key,), (self.fb_key,)],
+                                 self.fb_key)
+        self.assertEqual([], cache.added)
+
+    def test_annotate_flat_with_cache_reads_graph(self):
+        self.make_many_way_common_merge_text()
+        cache = _MemoryAnnotationCache()
+        cache.annotations[self.fd_key] = [
+            (self.fa_key,), (self.fb_key, self.fc_key)]
+        ann = self.module.Annotator(self.vf, cache=cache)
+        # Resolving the heads of B, C and E needs the ancestry of D
+        self.assertEqual([(self.fa_key, b'simple\n'),
+                          (self.fb_key, b'new content\n')],
+                         ann.annotate_flat(self.ff_key))
+
+    def test_annotate_special_text_caches_parents(self):
+        self.make_many_way_common_merge_text()
+        cache = _MemoryAnnotationCache()
+        spec_key = (b'f-id', revision.CURRENT_REVISION)
+        spec_text = b'simple\nnew content\nlocally modified\n'
+        ann = self.module.Annotator(self.vf, cache=cache)
+        ann.add_special_text(spec_key, [self.fd_key, self.fe_key], spec_text)
+        ann.annotate(spec_key)
+        self.assertEqual([self.fd_key, self.fe_key], sorted(cache.added))
+        self.assertEqual([(self.fa_key,), (self.fb_key, self.fc_key)],
+                         cache.annotations[self.fd_key])
+
+    def assertDiffsAhead(self, num_processes, batch_size, read_ahead=32):
+        self.make_many_way_common_merge_text()
+        self.overrideAttr(self.module.Annotator,
+                          '_min_lines_to_diff_ahead', 0)
+        self.overrideAttr(self.module.Annotator,
+                          '_diff_ahead_batch_size', batch_size)
+        self.overrideAttr(self.module.Annotator,
+                          '_texts_read_ahead_per_process', read_ahead)
+        self.ann._diff_processes = num_processes
+        submitted = {}
+        diff_ahead = self.ann._diff_ahead
+
+        def recording_diff_ahead(texts, num_processes):
+            for text in diff_ahead(texts, num_processes):
+                submitted.update(self.ann._pending_matches)
+                yield text
+        self.ann._diff_ahead = recording_diff_ahead
+        used = []
+        get_matches = self.ann._get_parent_annotations_and_matches
+
+        def recording_get_matches(key, text, parent_key):
+            if (key, parent_key) in self.ann._pending_matches:
+                used.append((key, parent_key))
+            return get_matches(key, text, parent_key)
+        self.ann._get_parent_annotations_and_matches = recording_get_matches
+        self.assertAnnotateEqual([(self.fa_key,),
+                                  (self.fb_key, self.fc_key, self.fe_key)],
+                                 self.ff_key)
+        expected = {
+            (self.fb_key, self.fa_key), (self.fc_key, self.fa_key),
+            (self.fd_key, self.fb_key), (self.fd_key, self.fc_key),
+            (self.fe_key, self.fa_key), (self.ff_key, self.fd_key),
+            (self.ff_key, self.fe_key)}
+        self.assertEqual(expected, set(submitted))
+        self.assertEqual(expected, set(used))
+        self.assertEqual({}, self.ann._pending_matches)
+        return submitted
+
+    def test_annotate_diff_ahead(self):
+        submitted = self.assertDiffsAhead(2, 3)
+        # The pairs of fd and ff complete a batch
+        self.assertEqual(
+            2, len(set(future for future, index in submitted.values())))
+
+    def test_annotate_diff_ahead_reads_ahead_a_few_texts(self):
+        # A single text is read ahead of the annotation, so batches are sent
+        # before they are full when a text in them is to be annotated.
+        self.assertDiffsAhead(1, 3, read_ahead=1)
@@ -20,6 +20,7 @@ from io import BytesIO
 
 import breezy
 from .. import (
+    commit,
     config,
     controldir,
     errors,
@@ -79,6 +80,9 @@ class CapturingReporter(NullCommitReporter):
     def renamed(self, change, old_path, new_path):
         self.calls.append(('renamed', change, old_path, new_path))
 
+    def files_recorded(self, count):
+        self.calls.append(('files_recorded', count))
+
     def is_verbose(self):
         return True
 
@@ -175,6 +179,17 @@ class TestCommit(TestCaseWithTransport):
         tree = b.repository.revision_tree(b'rev2')
         self.assertFalse(tree.has_filename('hello'))
 
+    def test_commit_reports_files_recorded(self):
+        self.overrideAttr(commit, '_REPORT_FILES_INTERVAL', 2)
+        wt = self.make_branch_and_tree('.')
+        self.build_tree(['a', 'b', 'c', 'd', 'e'])
+        wt.add(['a', 'b', 'c', 'd', 'e'])
+        reporter = CapturingReporter()
+        wt.commit('add files', reporter=reporter)
+        self.assertEqual(
+            [('files_recorded', 2), ('files_recorded', 4)],
+            [call for call in reporter.calls if call[0] == 'files_recorded'])
+
     def test_partial_commit_move(self):
         """Test a partial commit where a file was renamed but not committed.
 
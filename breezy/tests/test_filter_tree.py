@@ -16,6 +16,7 @@
 
 """Tests for ContentFilterTree"""
 
+import os
 import tarfile
 import zipfile
 
@@ -42,6 +43,24 @@ class TestFilterTree(tests.TestCaseWithTransport):
             self.underlying_tree, stack_callback)
         return self.filter_tree
 
+    def make_tree_with_stacks_callback(self):
+        """Make a filter tree that only looks up stacks in batches."""
+        self.underlying_tree = fixtures.make_branch_and_populated_tree(
+            self)
+        self.build_tree_contents([('t/dir/',), ('t/dir/file', b'file')])
+        self.underlying_tree.add(['dir', 'dir/file'])
+        self.batches = []
+
+        def stack_callback(path):
+            self.fail('stack of %s looked up on its own' % path)
+
+        def stacks_callback(paths):
+            self.batches.append(sorted(paths))
+            return iter([_stack_1] * len(paths))
+        self.filter_tree = filter_tree.ContentFilterTree(
+            self.underlying_tree, stack_callback, stacks_callback)
+        return self.filter_tree
+
     def test_get_file_text(self):
         self.make_tree()
         self.assertEqual(
@@ -67,3 +86,22 @@ class TestFilterTree(tests.TestCaseWithTransport):
         self.assertEqual(
             b'HELLO WORLD',
             zipf.read('out/hello'))
+
+    def test_tar_export_looks_up_stacks_per_directory(self):
+        self.make_tree_with_stacks_callback()
+        with self.underlying_tree.lock_read():
+            export.export(self.filter_tree, "out.tgz")
+        ball = tarfile.open("out.tgz", "r:gz")
+        self.assertEqual(b'HELLO WORLD', ball.extractfile('out/hello').read())
+        self.assertEqual(b'FILE', ball.extractfile('out/dir/file').read())
+        self.assertEqual([['hello'], ['dir/file']], self.batches)
+
+    def test_dir_export_looks_up_stacks_at_once(self):
+        self.make_tree_with_stacks_callback()
+        with self.underlying_tree.lock_read():
+            export.export(self.filter_tree, "out", format='dir')
+        with open(os.path.join('out', 'dir', 'file'), 'rb') as f:
+            self.assertEqual(b'FILE', f.read())
+        with open(os.path.join('out', 'hello'), 'rb') as f:
+            self.assertEqual(b'HELLO WORLD', f.read())
+        self.assertEqual(['dir/file', 'hello'], self.batches[-1])
@@ -320,6 +320,78 @@ class TestGlobster(TestCase):
         self.assertContainsRe(e.msg,
                               r"File.*ignore.*contains error.*RE:\[.*RE:\*\.cpp", flags=re.DOTALL)
 
+    def test_literal_patterns(self):
+        """Patterns without wildcards are matched without regexes."""
+        patterns = [u'*.o', u'Makefile.in', u'./gen/out.c', u'*.tar.gz']
+        globster = Globster(patterns)
+        self.assertEqual(
+            {u'o': (0, 0, u'*.o'), u'tar.gz': (0, 3, u'*.tar.gz')},
+            globster._literals['extension'])
+        self.assertEqual({u'gen/out.c': (2, 2, u'./gen/out.c')},
+                         globster._literals['fullpath'])
+        self.assertEqual([], globster._residue['extension'])
+        self.assertEqual(u'*.o', globster.match('foo/bar.o'))
+        self.assertEqual(u'*.tar.gz', globster.match('foo.tar.gz'))
+        self.assertEqual(None, globster.match('foo.gz'))
+        self.assertEqual(u'Makefile.in', globster.match('foo/Makefile.in'))
+        self.assertEqual(None, globster.match('Makefile.in.old'))
+        self.assertEqual(u'./gen/out.c', globster.match('gen/out.c'))
+        self.assertEqual(None, globster.match('foo/gen/out.c'))
+
+    def test_shortest_extension_matches(self):
+        """The match with the shortest extension wins, as in a super-regex."""
+        globster = Globster([u'*.tar.gz', u'*.[g]z', u'*.gz'])
+        self.assertEqual(u'*.[g]z', globster.match('foo.tar.gz'))
+        globster = Globster([u'*.tar.gz', u'*.gz', u'*.[g]z'])
+        self.assertEqual(u'*.gz', globster.match('foo.tar.gz'))
+        globster = Globster([u'*.tar.gz', u'*.t*'])
+        self.assertEqual(u'*.tar.gz', globster.match('foo.tar.gz'))
+
+    def test_path_prefixes(self):
+        """Path patterns only apply below the directory they start with."""
+        patterns = [u'build/*/obj/*.o', u'./build/x*', u'gen/**/*.c',
+                    u'RE:.*\\.bak']
+        globster = Globster(patterns)
+        self.assertEqual([u'', u'build/', u'gen/'],
+                         sorted(globster._prefixed))
+        self.assertEqual(u'build/*/obj/*.o',
+                         globster.match('build/a/obj/foo.o'))
+        self.assertEqual(u'./build/x*', globster.match('build/xyz'))
+        self.assertEqual(u'gen/**/*.c', globster.match('gen/a/b/foo.c'))
+        self.assertEqual(u'RE:.*\\.bak', globster.match('gen/a/foo.bak'))
+        self.assertEqual(None, globster.match('src/build/xyz'))
+        self.assertEqual(None, globster.match('src/gen/foo.c'))
+        self.assertEqual(None, globster.match('gen/a/foo.h'))
+        self.assertEqual(
+            [u'build/', u'build/a/obj/', u'gen/a/', u'gen/a/b/',
+             u'src/build/', u'src/gen/'],
+            sorted(globster._dir_cache))
+        self.assertEqual(
+            [globster._prefixed[u''], globster._prefixed[u'gen/']],
+            globster._dir_cache[u'gen/a/'])
+
+    def test_matches_super_regexes(self):
+        """The lookups find the same patterns as the super-regexes."""
+        patterns = [u'*.%d' % i for i in range(150)]
+        patterns += [u'*.o', u'*.[oa]', u'*.b.o', u'foo', u'f?o', u'a/b',
+                     u'a/*', u'**/b', u'a/**/c', u'RE:a/.*']
+        filenames = [u'x.1', u'x.149', u'x.b.o', u'x.a', u'a/foo', u'foo',
+                     u'a/b', u'a/b/c', u'a/x/b', u'b/foo.o', u'x.1.o']
+        for globster in (Globster(patterns), Globster(reversed(patterns)),
+                         _OrderedGlobster(patterns),
+                         _OrderedGlobster(reversed(patterns))):
+            for filename in filenames:
+                self.assertEqual(globster._match_regexes(filename),
+                                 globster.match(filename), filename)
+
+    def test_newline_in_filename(self):
+        """Filenames with newlines are matched like with the super-regexes."""
+        globster = Globster([u'foo', u'*.o', u'a/b'])
+        self.assertEqual(u'foo', globster.match('foo\n'))
+        self.assertEqual(u'*.o', globster.match('x.o\n'))
+        self.assertEqual(None, globster.match('x\ny/foo'))
+        self.assertEqual(None, globster.match('a/b/\n'))
+
 
 class TestExceptionGlobster(TestCase):
 
@@ -362,6 +434,16 @@ class TestOrderedGlobster(TestCase):
         self.assertEqual(u'bar.*', globster.match('bar.foo'))
         self.assertEqual(None, globster.match('foo.bar'))
 
+    def test_ordered_across_types(self):
+        """test that the first match is found whatever the pattern type"""
+        patterns = [u'./foo/*', u'*.tar.gz', u'*.gz', u'bar.tar.gz']
+        globster = _OrderedGlobster(patterns)
+        self.assertEqual(u'./foo/*', globster.match('foo/bar.tar.gz'))
+        self.assertEqual(u'*.tar.gz', globster.match('bar.tar.gz'))
+        globster = _OrderedGlobster(reversed(patterns))
+        self.assertEqual(u'bar.tar.gz', globster.match('foo/bar.tar.gz'))
+        self.assertEqual(u'*.gz', globster.match('baz.tar.gz'))
+
 
 class TestNormalizePattern(TestCase):
 
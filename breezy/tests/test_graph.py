@@ -931,6 +931,37 @@ class TestGraph(TestCaseWithMemoryTransport):
         self.assertEqual({b'h1', b'h2'},
                          self._run_heads_break_deeper(graph_dict, [b'h1', b'h2']))
 
+    def test_heads_uses_generations(self):
+        # With generation numbers, the search stops at the generation of the
+        # lowest candidate, even before finding a common ancestor
+        graph_dict = {
+            b'left': [b'midleft'],
+            b'midleft': [b'common'],
+            b'right': [b'common'],
+            b'common': [b'deeper'],
+        }
+        generations = {b'left': 4, b'midleft': 3, b'right': 3, b'common': 2}
+
+        class stub(object):
+            pass
+
+        def get_parent_map(keys):
+            result = {}
+            for key in keys:
+                if key in (b'common', b'deeper'):
+                    self.fail('key %s was accessed' % key)
+                result[key] = graph_dict[key]
+            return result
+        an_obj = stub()
+        an_obj.get_parent_map = get_parent_map
+        an_obj.get_generations = lambda keys: dict(
+            (key, generations[key]) for key in keys if key in generations)
+        graph = _mod_graph.Graph(an_obj)
+        self.assertEqual({b'left', b'right'},
+                         graph.heads([b'left', b'right']))
+        self.assertEqual({b'left'}, graph.heads([b'left', b'midleft']))
+        self.assertFalse(graph.is_ancestor(b'right', b'left'))
+
     def test_breadth_first_search_start_ghosts(self):
         graph = self.make_graph({})
         # with_ghosts reports the ghosts
@@ -1541,6 +1572,11 @@ class TestCachingParentsProvider(tests.TestCase):
         self.assertEqual({b'a': (b'b',)},
                          self.caching_pp.get_cached_parent_map([b'a']))
 
+    def test_get_generations(self):
+        self.assertEqual({}, self.caching_pp.get_generations([b'a']))
+        self.inst_pp.get_generations = lambda keys: {b'a': 2}
+        self.assertEqual({b'a': 2}, self.caching_pp.get_generations([b'a']))
+
 
 class TestCachingParentsProviderExtras(tests.TestCaseWithTransport):
     """Test the behaviour when parents are provided that were not requested."""
@@ -1686,6 +1722,13 @@ class TestGraphThunkIdsToKeys(tests.TestCase):
                          [(n.key, n.merge_depth, n.revno, n.end_of_merge)
                           for n in graph_thunk.merge_sort(b'C')])
 
+    def test_get_parent_keys(self):
+        d = {(b'C',): [(b'A',)], (b'B',): [(b'A',)], (b'A',): []}
+        g = _mod_graph.KnownGraph(d)
+        graph_thunk = _mod_graph.GraphThunkIdsToKeys(g)
+        self.assertEqual([b'A'], graph_thunk.get_parent_keys(b'C'))
+        self.assertEqual([], graph_thunk.get_parent_keys(b'A'))
+
 
 class TestStackedParentsProvider(tests.TestCase):
 
@@ -1755,3 +1798,15 @@ class TestStackedParentsProvider(tests.TestCase):
                           (b'pp2', [b'c', b'd']),
                           (b'pp3', [b'd']),
                           ], self.calls)
+
+    def test_get_generations(self):
+        pp1 = _mod_graph.DictParentsProvider({b'rev2': (b'rev1',)})
+        pp1.get_generations = lambda keys: dict(
+            (key, 2) for key in keys if key == b'rev2')
+        pp2 = _mod_graph.DictParentsProvider({b'rev1': ()})
+        pp3 = _mod_graph.DictParentsProvider({b'rev1': ()})
+        pp3.get_generations = lambda keys: dict(
+            (key, 1) for key in keys if key in (b'rev1', b'rev2'))
+        stacked = _mod_graph.StackedParentsProvider([pp1, pp2, pp3])
+        self.assertEqual({b'rev1': 1, b'rev2': 2},
+                         stacked.get_generations([b'rev1', b'rev2', b'rev3']))
@@ -1705,6 +1705,58 @@ class TestLogExcludeAncestry(tests.TestCaseWithTransport):
                              generate_merge_revisions=True)
 
 
+class TestFilterRevisionsTouchingPath(tests.TestCaseWithTransport):
+
+    def make_branch_with_merge(self):
+        builder = self.make_branch_builder('.')
+        builder.start_series()
+        builder.build_snapshot(None, [
+            ('add', ('', b'TREE_ROOT', 'directory', '')),
+            ('add', ('f', b'f-id', 'file', b'f\n')),
+            ('add', ('g', b'g-id', 'file', b'g\n'))],
+            revision_id=b'1')
+        builder.build_snapshot([b'1'], [('modify', ('g', b'g2\n'))],
+                               revision_id=b'2')
+        builder.build_snapshot([b'1'], [('modify', ('f', b'f1.1.1\n'))],
+                               revision_id=b'1.1.1')
+        builder.build_snapshot([b'1.1.1'], [('modify', ('g', b'g1.1.2\n'))],
+                               revision_id=b'1.1.2')
+        builder.build_snapshot([b'2', b'1.1.2'], [
+            ('modify', ('g', b'g3\n'))], revision_id=b'3')
+        builder.build_snapshot([b'3'], [('modify', ('g', b'g4\n'))],
+                               revision_id=b'4')
+        builder.finish_series()
+        b = builder.get_branch()
+        b.lock_read()
+        self.addCleanup(b.unlock)
+        return b
+
+    def assertTouchingRevisions(self, expected, b, path, include_merges):
+        view_revisions = list(log._calc_view_revisions(
+            b, None, None, 'reverse', generate_merge_revisions=True))
+        self.assertEqual(expected, [
+            revid for revid, revno, depth in
+            log._filter_revisions_touching_path(
+                b, path, view_revisions, include_merges)])
+
+    def test_uses_texts_of_file(self):
+        b = self.make_branch_with_merge()
+        self.assertTrue(hasattr(b.repository.texts, 'keys_with_prefixes'))
+        self.assertTouchingRevisions([b'3', b'1.1.1', b'1'], b, 'f', True)
+        self.assertTouchingRevisions([b'3', b'1'], b, 'f', False)
+        self.assertTouchingRevisions([b'4', b'3', b'1.1.2', b'2', b'1'],
+                                     b, 'g', True)
+        self.assertTouchingRevisions([], b, 'unknown', True)
+
+    def test_probes_texts_of_file(self):
+        b = self.make_branch_with_merge()
+        self.overrideAttr(b.repository.texts, 'keys_with_prefixes', None)
+        self.assertTouchingRevisions([b'3', b'1.1.1', b'1'], b, 'f', True)
+        self.assertTouchingRevisions([b'3', b'1'], b, 'f', False)
+        self.assertTouchingRevisions([b'4', b'3', b'1.1.2', b'2', b'1'],
+                                     b, 'g', True)
+
+
 class TestLogDefaults(TestCaseForLogFormatter):
     def test_default_log_level(self):
         """
@@ -1225,6 +1225,55 @@ class TestWalkDirs(tests.TestCaseInTempDir):
             result.append(dirblock)
         self.assertExpectedBlocks(expected_dirblocks[1:], result)
 
+    def build_wide_tree(self):
+        self.build_tree(['%d/' % i for i in range(5)]
+                        + ['%d/%d/' % (i, j) for i in range(5) for j in range(3)]
+                        + ['%d/%d/f' % (i, j) for i in range(5) for j in range(3)]
+                        + ['f'])
+
+    def test_walkdirs_threads(self):
+        self.build_wide_tree()
+        self.assertExpectedBlocks(
+            [(dirinfo, [line[0:3] for line in block])
+             for dirinfo, block in osutils.walkdirs('.')],
+            osutils.walkdirs('.', threads=3))
+
+    def test__walkdirs_utf8_threads(self):
+        self.build_wide_tree()
+        self.assertExpectedBlocks(
+            [(dirinfo, [line[0:3] for line in block])
+             for dirinfo, block in osutils._walkdirs_utf8(b'.')],
+            osutils._walkdirs_utf8(b'.', threads=3))
+
+    def test_walkdirs_threads_skips_removed_dirs(self):
+        read = []
+
+        def read_dir(relroot, top):
+            read.append(relroot)
+            return [(name, name, 'directory', None, name)
+                    for name in ['a', 'b', 'c'] if relroot == '']
+        result = []
+        for dirinfo, block in osutils._walkdirs_prefetching(
+                read_dir, ('', None, 'directory', None, ''), 2):
+            result.append(dirinfo)
+            if dirinfo[0] == '':
+                del block[1]
+        self.assertEqual([('', ''), ('a', 'a'), ('c', 'c')], result)
+        self.assertEqual(['', 'a', 'c'], sorted(read))
+
+    def test_walkdirs_threads_os_error(self):
+        if sys.platform == 'win32':
+            raise tests.TestNotApplicable(
+                "readdir IOError not tested on win32")
+        self.requireFeature(features.not_running_as_root)
+        os.mkdir("test-unreadable")
+        os.chmod("test-unreadable", 0000)
+        # must chmod it back so that it can be removed
+        self.addCleanup(os.chmod, "test-unreadable", 0o700)
+        e = self.assertRaises(
+            OSError, list, osutils._walkdirs_utf8(".", threads=2))
+        self.assertEqual(errno.EACCES, e.errno)
+
     def _filter_out_stat(self, result):
         """Filter out the stat value from the walkdirs result"""
         for dirdetail, dirblock in result:
@@ -101,6 +101,52 @@ class TestIniBasedRulesSearcher(tests.TestCase):
                          rs.get_items('dir/a.txt'))
         self.assertEqual('bar', rs.get_single_value('dir/a.txt', 'foo'))
 
+    def test_iter_selected_items(self):
+        rs = self.make_searcher(
+            "[name ./a.txt]\nfoo=baz\n"
+            "[name *.txt]\nfoo=bar\na=True\n")
+        result = list(rs.iter_selected_items(
+            ['a.txt', 'dir/a.txt', 'a.py', 'dir/b.txt'], ['foo', 'b']))
+        self.assertEqual([(('foo', 'baz'), ('b', None)),
+                          (('foo', 'bar'), ('b', None)),
+                          (),
+                          (('foo', 'bar'), ('b', None))], result)
+        # Paths matching the same rule share their preferences
+        self.assertIs(result[1], result[3])
+        self.assertIs(result[1], rs.get_selected_items('c.txt', ['foo', 'b']))
+
+    def test_iter_selected_items_file_missing(self):
+        rs = self.make_searcher(None)
+        self.assertEqual([(), ()], list(rs.iter_selected_items(
+            ['a.txt', 'dir/a.txt'], ['foo'])))
+
+    def test_fingerprint_file_missing(self):
+        rs = self.make_searcher(None)
+        self.assertEqual(None, rs.fingerprint(['eol']))
+
+    def test_fingerprint(self):
+        rs = self.make_searcher("[name *.txt]\neol=crlf\n")
+        fingerprint = rs.fingerprint(['eol'])
+        self.assertEqual(40, len(fingerprint))
+        self.assertEqual(fingerprint, self.make_searcher(
+            "[name *.txt]\neol=crlf\nfoo=bar\n").fingerprint(['eol']))
+        self.assertNotEqual(fingerprint, self.make_searcher(
+            "[name *.txt]\neol=lf\n").fingerprint(['eol']))
+        self.assertNotEqual(fingerprint, self.make_searcher(
+            "[name *.txt]\neol=crlf\n[name *.py]\neol=crlf\n"
+            ).fingerprint(['eol']))
+
+    def test_fingerprint_section_order(self):
+        # The first matching section wins, so its position matters even
+        # when it does not set the preference.
+        self.assertNotEqual(
+            self.make_searcher(
+                "[name a.txt]\nfoo=bar\n[name *.txt]\neol=crlf\n"
+                ).fingerprint(['eol']),
+            self.make_searcher(
+                "[name *.txt]\neol=crlf\n[name a.txt]\nfoo=bar\n"
+                ).fingerprint(['eol']))
+
 
 class TestStackedRulesSearcher(tests.TestCase):
 
@@ -128,6 +174,33 @@ class TestStackedRulesSearcher(tests.TestCase):
         self.assertEqual('bar', rs.get_single_value('dir/a.txt', 'foo'))
         self.assertEqual('True', rs.get_single_value('dir/a.txt', 'a'))
 
+    def test_stack_iter_selected_items(self):
+        rs = self.make_searcher(
+            "[name ./a.txt]\nfoo=baz\n",
+            "[name *.txt]\nfoo=bar\na=True\n")
+        self.assertEqual(
+            [(('foo', 'baz'), ('a', None)),
+             (),
+             (('foo', 'bar'), ('a', 'True')),
+             (('foo', 'bar'), ('a', 'True'))],
+            list(rs.iter_selected_items(
+                iter(['a.txt', 'a.py', 'dir/a.txt', 'b.txt']), ['foo', 'a'])))
+
+    def test_stack_iter_selected_items_empty(self):
+        rs = self.make_searcher()
+        self.assertEqual([(), ()], list(rs.iter_selected_items(
+            ['a.txt', 'b.txt'], ['foo'])))
+
+    def test_stack_fingerprint(self):
+        self.assertEqual(None, self.make_searcher().fingerprint(['eol']))
+        fingerprint = self.make_searcher(
+            "[name *.txt]\neol=crlf\n",
+            "[name *.txt]\neol=lf\n").fingerprint(['eol'])
+        self.assertEqual(40, len(fingerprint))
+        self.assertNotEqual(fingerprint, self.make_searcher(
+            "[name *.txt]\neol=lf\n",
+            "[name *.txt]\neol=crlf\n").fingerprint(['eol']))
+
 
 class TestRulesPath(tests.TestCase):
 
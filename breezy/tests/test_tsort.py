@@ -693,3 +693,38 @@ class MergeSortTests(TestCase):
              ],
             True
             )
+
+    def test_merge_sort_known_revnos(self):
+        # Sorting only the descendants of an earlier tip, seeded with the
+        # earlier result, gives the same depths and revnos as a full sort.
+        graph = {'A': [],
+                 'B': ['A'],
+                 'C': ['A'],
+                 'D': ['B', 'C'],
+                 'E': ['C'],
+                 'F': ['D', 'E'],
+                 'G': ['F', 'C'],
+                 }
+        known_revnos = {'A': ((1,), False),
+                        'B': ((2,), False),
+                        'C': ((1, 1, 1), True),
+                        'D': ((3,), True),
+                        }
+        new_graph = dict((k, graph[k]) for k in 'EFG')
+        self.assertEqual(
+            [(0, 'G', 0, (5,), False),
+             (1, 'F', 0, (4,), False),
+             (2, 'E', 1, (1, 1, 2), True),
+             ],
+            MergeSorter(new_graph.items(), 'G', generate_revno=True,
+                        known_revnos=known_revnos).sorted())
+        self.assertEqual(
+            [(0, 'G', 0, (5,), False),
+             (1, 'F', 0, (4,), False),
+             (2, 'E', 1, (1, 1, 2), True),
+             (3, 'D', 0, (3,), False),
+             (4, 'C', 1, (1, 1, 1), True),
+             (5, 'B', 0, (2,), False),
+             (6, 'A', 0, (1,), True),
+             ],
+            merge_sort(graph.items(), 'G', generate_revno=True))
@@ -177,6 +177,32 @@ class WorkspaceTests(TestCaseWithTransport):
             ws.reset()
             self.assertPathDoesNotExist('blah')
 
+    def test_tree_dirty_tracker(self):
+        tree = self.make_branch_and_tree('.', format=self._format)
+        if getattr(tree, 'set_dirty_tracker', None) is None:
+            return
+        with Workspace(tree, use_inotify=self._use_inotify) as ws:
+            self.assertIs(ws._dirty_tracker, tree._dirty_tracker)
+            self.build_tree_contents([('afile', 'somecontents')])
+            with tree.lock_read():
+                self.assertEqual(
+                    ['afile'],
+                    [c.path[1] for c in tree.iter_changes(
+                        tree.basis_tree(), want_unversioned=True)
+                     if c.path[1] != ''])
+            ws.commit(message='Commit message')
+            self.assertFalse(tree.has_changes())
+        self.assertIs(None, tree._dirty_tracker)
+
+    def test_subpath_no_tree_dirty_tracker(self):
+        tree = self.make_branch_and_tree('.', format=self._format)
+        self.build_tree(['subpath/'])
+        tree.add('subpath')
+        tree.commit('add subpath')
+        with Workspace(
+                tree, subpath='subpath', use_inotify=self._use_inotify):
+            self.assertIs(None, getattr(tree, '_dirty_tracker', None))
+
     def test_tree_path(self):
         tree = self.make_branch_and_tree('.', format=self._format)
         tree.mkdir('subdir')
@@ -798,8 +798,11 @@ def _create_files(tt, tree, desired_files, pb, offset, accelerator_tree,
             change.path for change in iter
             if not (change.changed_content or change.executable[0] != change.executable[1])]
         if accelerator_tree.supports_content_filtering():
-            unchanged = [(tp, ap) for (tp, ap) in unchanged
-                         if not next(accelerator_tree.iter_search_rules([ap]))]
+            unchanged = [
+                paths for paths, items in zip(
+                    unchanged, accelerator_tree.iter_search_rules(
+                        [ap for (tp, ap) in unchanged]))
+                if not items]
         unchanged = dict(unchanged)
         new_desired_files = []
         count = 0
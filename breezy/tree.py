@@ -670,15 +670,51 @@ class Tree(object):
             or None if unknown
         :return: the list of filters - [] if there are none
         """
+        return next(self._iter_content_filter_stacks([path]))
+
+    def _iter_content_filter_stacks(self, paths):
+        """The stacks of content filters for many paths.
+
+        This is cheaper than calling _content_filter_stack for each path.
+
+        :param paths: an iterable of paths relative to the root of the tree
+        :return: an iterator with the list of filters for each path
+        """
         from . import debug, filters
         filter_pref_names = filters._get_registered_names()
         if len(filter_pref_names) == 0:
-            return []
-        prefs = next(self.iter_search_rules([path], filter_pref_names))
-        stk = filters._get_filter_stack_for(prefs)
-        if 'filters' in debug.debug_flags:
-            trace.note("*** {0} content-filter: {1} => {2!r}").format(path, prefs, stk)
-        return stk
+            for path in paths:
+                yield []
+            return
+        paths = list(paths)
+        for path, prefs in zip(
+                paths, self.iter_search_rules(paths, filter_pref_names)):
+            stk = filters._get_filter_stack_for(prefs)
+            if 'filters' in debug.debug_flags:
+                trace.note("*** {0} content-filter: {1} => {2!r}".format(
+                    path, prefs, stk))
+            yield stk
+
+    def _content_filter_fingerprint(self):
+        """A fingerprint of the rules selecting content filters in this tree.
+
+        :return: None if no rules can select content filters, otherwise a
+            sha1 that changes whenever the stack of content filters for some
+            path may have changed.
+        """
+        from . import filters, rules
+        filter_pref_names = filters._get_registered_names()
+        if len(filter_pref_names) == 0:
+            return None
+        searcher = self._get_rules_searcher(rules._per_user_searcher)
+        if searcher is None:
+            return None
+        fingerprint = searcher.fingerprint(filter_pref_names)
+        if fingerprint is None:
+            return None
+        return osutils.sha_strings(
+            [name.encode('utf-8') + b'\n' for name in filter_pref_names]
+            + [fingerprint])
 
     def _content_filter_stack_provider(self):
         """A function that returns a stack of ContentFilters.
@@ -710,8 +746,9 @@ class Tree(object):
         searcher = self._get_rules_searcher(_default_searcher)
         if searcher is not None:
             if pref_names is not None:
-                for path in path_names:
-                    yield searcher.get_selected_items(path, pref_names)
+                for items in searcher.iter_selected_items(
+                        path_names, pref_names):
+                    yield items
             else:
                 for path in path_names:
                     yield searcher.get_items(path)
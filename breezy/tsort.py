@@ -202,7 +202,7 @@ class MergeSorter(object):
                  ]
 
     def __init__(self, graph, branch_tip, mainline_revisions=None,
-                 generate_revno=False):
+                 generate_revno=False, known_revnos=None):
         """Merge-aware topological sorting of a graph.
 
         :param graph: sequence of pairs of node_name->parent_names_list.
@@ -224,6 +224,14 @@ class MergeSorter(object):
         :param generate_revno: Optional parameter controlling the generation of
             revision number sequences in the output. See the output description
             for more details.
+        :param known_revnos: Optional dict of nodes which were already sorted
+            by an earlier merge_sort of a left-hand ancestor of branch_tip,
+            mapping each node to (revno, first_child). first_child is True if
+            no node in that earlier sort had it as its left-most parent. These
+            nodes are treated as already emitted, so only the nodes in graph
+            are sorted, and they get the same merge depths and revnos as a
+            full sort would give them. The end_of_merge value of the last
+            node may differ, as its successor is not part of the output.
 
         The result is a list sorted so that all parents come before
         their children. Each element of the list is a tuple containing:
@@ -373,6 +381,21 @@ class MergeSorter(object):
                             for revision in self._graph)
         # Each mainline revision counts how many child branches have spawned from it.
         self._revno_to_branch_count = {}
+        # this is a set of the nodes who have been completely analysed for fast
+        # membership checking
+        self._completed_node_names = set()
+        if known_revnos:
+            revno_to_branch_count = self._revno_to_branch_count
+            for node_name, (revno, first_child) in known_revnos.items():
+                self._revnos[node_name] = [revno, first_child]
+                if len(revno) == 3:
+                    base_revno = revno[0]
+                    if revno[1] > revno_to_branch_count.get(base_revno, 0):
+                        revno_to_branch_count[base_revno] = revno[1]
+                elif revno == (1,):
+                    # The first root; later roots continue from (0, 1, 1)
+                    revno_to_branch_count.setdefault(0, 0)
+            self._completed_node_names.update(known_revnos)
 
         # this is a stack storing the depth first search into the graph.
         self._node_name_stack = []
@@ -385,9 +408,6 @@ class MergeSorter(object):
         # When we first look at a node we assign it a seqence number from its
         # leftmost parent.
         self._first_child_stack = []
-        # this is a set of the nodes who have been completely analysed for fast
-        # membership checking
-        self._completed_node_names = set()
         # this is the scheduling of nodes list.
         # Nodes are scheduled
         # from the bottom left of the tree: in the tree
@@ -89,6 +89,10 @@ class WorkingTree(mutabletree.MutableTree, ControlComponent):
         (as opposed to a URL).
     """
 
+    # The key and the filter stacks of the files in the directory that
+    # _content_filter_stack was last asked about.
+    _directory_filter_stacks = (None, {})
+
     # override this to set the strategy for storing views
     def _make_views(self):
         return views.DisabledViews(self)
@@ -116,7 +120,6 @@ class WorkingTree(mutabletree.MutableTree, ControlComponent):
             self._branch = self.controldir.open_branch()
         self.basedir = osutils.realpath(basedir)
         self._transport = _transport
-        self._rules_searcher = None
         self.views = self._make_views()
 
     @property
@@ -1283,12 +1286,38 @@ class WorkingTree(mutabletree.MutableTree, ControlComponent):
         """
         raise NotImplementedError(self.reset_state)
 
-    def _get_rules_searcher(self, default_searcher):
-        """See Tree._get_rules_searcher."""
-        if self._rules_searcher is None:
-            self._rules_searcher = super(WorkingTree,
-                                         self)._get_rules_searcher(default_searcher)
-        return self._rules_searcher
+    def _content_filter_stack(self, path=None):
+        """See Tree._content_filter_stack.
+
+        Files are hashed, read and written a directory at a time, so the
+        stacks of the files next to path are looked up at once and kept
+        until another directory is asked about.
+        """
+        from . import rules
+        filter_pref_names = tuple(_mod_filters._get_registered_names())
+        if filter_pref_names and path:
+            key = (osutils.dirname(path),
+                   self._get_rules_searcher(rules._per_user_searcher),
+                   filter_pref_names)
+            cached_key, stacks = self._directory_filter_stacks
+            if cached_key != key:
+                paths = self._file_paths_next_to(path) or []
+                stacks = dict(
+                    zip(paths, self._iter_content_filter_stacks(paths)))
+                self._directory_filter_stacks = (key, stacks)
+            try:
+                return stacks[path]
+            except KeyError:
+                pass
+        return super(WorkingTree, self)._content_filter_stack(path)
+
+    def _file_paths_next_to(self, path):
+        """The paths of the versioned files in the same directory as path.
+
+        :return: A list of paths whose filter stacks are looked up along with
+            that of path, or None to only look up path.
+        """
+        return None
 
     def get_shelf_manager(self):
         """Return the ShelfManager for this WorkingTree."""
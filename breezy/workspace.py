@@ -136,14 +136,24 @@ class Workspace(object):
         check_clean_tree(self.tree)
         self._dirty_tracker = get_dirty_tracker(
             self.tree, subpath=self.subpath, use_inotify=self.use_inotify)
+        self._set_tree_dirty_tracker(self._dirty_tracker)
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         if self._dirty_tracker:
+            self._set_tree_dirty_tracker(None)
             del self._dirty_tracker
             self._dirty_tracker = None
         return False
 
+    def _set_tree_dirty_tracker(self, tracker):
+        # Let the tree skip untouched paths in whole tree comparisons too,
+        # which it can only do if the tracker watches the whole tree.
+        set_dirty_tracker = getattr(self.tree, 'set_dirty_tracker', None)
+        if set_dirty_tracker is None or self.subpath not in ('.', ''):
+            return
+        set_dirty_tracker(tracker)
+
     def tree_path(self, path=''):
         """Return a path relative to the tree subpath used by this workspace.
         """